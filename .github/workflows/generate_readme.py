@@ -6,13 +6,13 @@ import os
 import sys
 from datetime import datetime
 
-def generate_readme(pub_repo_name, source_repo, commit_sha, sync_time):
+def generate_readme(pub_repo_name, source_repo, commit_sha, sync_time, readme_path="README.md"):
     """Generate README content for public repository"""
     
     # Check if there's an existing README to preserve
     readme_content = ""
-    if os.path.exists("README.md"):
-        with open("README.md", "r", encoding="utf-8") as f:
+    if os.path.exists(readme_path):
+        with open(readme_path, "r", encoding="utf-8") as f:
             content = f.read()
             # Remove any existing public repo info
             if "---\n\n## 📢 Public Repository Information" in content:
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Incremental sync of the public repository.
+
+Selects the files of the source tree described by make-pub.conf and makes the
+public repository work tree match them:
+
+    folder/             entire folder            !pattern        exclude (anywhere)
+    file, sub/file      specific file            !**/name/       exclude directories called name
+    *.md                top level glob           !**/*.tmp       exclude by name glob
+    **/*.cpp            recursive glob
+
+The rules are compiled by pathmatcher (the repository's shared matcher) into
+two regular expressions; the source tree is walked with os.scandir and
+directories no rule can select (or excluded ones) are pruned. Only files whose
+content hash differs are copied, files that are no longer selected are
+deleted, and README.md (generate_readme.py) is written only when something
+other than its sync timestamp changed. Content hashes are cached by
+size/mtime in a manifest inside the target's .git directory.
+
+Offline use against a bare repository standing in for the public remote:
+
+    python .github/workflows/pubsync.py --dest /tmp/pub --remote /tmp/pub.git --commit --push
+
+(--remote is cloned into --dest when --dest does not exist; a missing bare
+repository is created.)
+"""
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import hashlib
+import subprocess
+from datetime import datetime, timezone
+
+import generate_readme
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+import pathmatcher
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+CONFIG_FILE = os.path.join(".github", "workflows", "make-pub.conf")
+MANIFEST_FILE = "pubsync-manifest.json"
+README = "README.md"
+# README lines that change on every sync and alone do not justify a rewrite
+_VOLATILE_README = re.compile(r"^- \*\*(Last synchronization|Source commit):\*\*.*$", re.MULTILINE)
+
+
+# ----------------------------------------------------------------------------
+# Rules
+# ----------------------------------------------------------------------------
+
+def load_config(path):
+    """(enabled, include patterns, exclude patterns) of a make-pub.conf"""
+    enabled = False
+    includes = []
+    excludes = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = re.sub(r"\s*#.*$", "", line).strip()
+            if not line:
+                continue
+            if line.startswith("ENABLE_SYNC"):
+                enabled = line.partition("=")[2].strip() == "true"
+            elif line.startswith("!"):
+                excludes.append(line[1:])
+            else:
+                includes.append(line)
+    return enabled, includes, excludes
+
+
+# ----------------------------------------------------------------------------
+# Sync
+# ----------------------------------------------------------------------------
+
+def file_sha256(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _cached_hash(cache, relative, path, st):
+    entry = cache.get(relative)
+    if entry and entry[1] == st.st_size and entry[2] == st.st_mtime_ns:
+        return entry[0]
+    return file_sha256(path)
+
+
+def _manifest_path(dest):
+    git_dir = os.path.join(dest, ".git")
+    return os.path.join(git_dir if os.path.isdir(git_dir) else dest, MANIFEST_FILE)
+
+
+def _load_manifest(dest):
+    try:
+        with open(_manifest_path(dest), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"source": {}, "dest": {}}
+
+
+def _copy(source, destination):
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    temporary = destination + ".pubsync-tmp"
+    shutil.copy2(source, temporary)
+    os.replace(temporary, destination)
+
+
+def _stable_readme(text):
+    return _VOLATILE_README.sub("", text)
+
+
+def sync(source, dest, rules, readme_info=None, dry_run=False):
+    """
+    Make dest (minus .git) contain exactly the selected files of source.
+
+    readme_info: (pub repo name, source repo, commit sha, sync time) for
+    generate_readme.py, None to copy README.md as is.
+
+    Returns:
+        dict: {"selected": n, "copied": [...], "deleted": [...], "unchanged": n, "readme": bool,
+               "timings": {...}}
+    """
+    timings = {}
+    start = time.perf_counter()
+    skip = {os.path.relpath(dest, source).replace(os.sep, "/")} if os.path.abspath(dest).startswith(
+        os.path.abspath(source) + os.sep) else set()
+    selected = rules.scan(source, skip)
+    timings["scan"] = time.perf_counter() - start
+    if not selected:
+        # Never empty the public repository because of a broken rule set
+        return {"selected": 0, "copied": [], "deleted": [], "unchanged": 0, "readme": False, "timings": timings}
+
+    start = time.perf_counter()
+    manifest = _load_manifest(dest)
+    source_hashes = {relative: _cached_hash(manifest["source"], relative, os.path.join(source, relative), st)
+                     for relative, st in selected.items()}
+    # Everything in the target except git data (and the manifest when there is no .git)
+    dest_rules = pathmatcher.PathMatcher(None, ["/.git/", "/" + MANIFEST_FILE])
+    existing = dest_rules.scan(dest) if os.path.isdir(dest) else {}
+    dest_hashes = {relative: _cached_hash(manifest["dest"], relative, os.path.join(dest, relative), st)
+                   for relative, st in existing.items()}
+    timings["hash"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    copied = []
+    managed_readme = readme_info is not None and README in selected
+    for relative in sorted(selected):
+        if managed_readme and relative == README:
+            continue
+        if dest_hashes.get(relative) != source_hashes[relative]:
+            copied.append(relative)
+            if not dry_run:
+                _copy(os.path.join(source, relative), os.path.join(dest, relative))
+    deleted = sorted(relative for relative in existing if relative not in selected)
+    if not dry_run:
+        for relative in deleted:
+            os.remove(os.path.join(dest, relative))
+            parent = os.path.dirname(os.path.join(dest, relative))
+            while parent != dest and os.path.isdir(parent) and not os.listdir(parent):
+                os.rmdir(parent)
+                parent = os.path.dirname(parent)
+
+    readme_written = False
+    if managed_readme:
+        content = generate_readme.generate_readme(*readme_info, readme_path=os.path.join(source, README))
+        target = os.path.join(dest, README)
+        current = None
+        if os.path.exists(target):
+            with open(target, "r", encoding="utf-8") as f:
+                current = f.read()
+        if current is None or copied or deleted or _stable_readme(current) != _stable_readme(content):
+            readme_written = True
+            if not dry_run:
+                with open(target, "w", encoding="utf-8") as f:
+                    f.write(content)
+    timings["apply"] = time.perf_counter() - start
+
+    if not dry_run:
+        os.makedirs(dest, exist_ok=True)
+        final = dest_rules.scan(dest)
+        dest_cache = {}
+        for relative, st in final.items():
+            previous = dest_hashes.get(relative)
+            unchanged = relative in existing and relative not in copied and relative != README
+            digest = previous if unchanged else file_sha256(os.path.join(dest, relative))
+            dest_cache[relative] = [digest, st.st_size, st.st_mtime_ns]
+        with open(_manifest_path(dest), "w", encoding="utf-8") as f:
+            json.dump({"source": {relative: [source_hashes[relative], st.st_size, st.st_mtime_ns]
+                                  for relative, st in selected.items()},
+                       "dest": dest_cache}, f)
+
+    return {"selected": len(selected), "copied": copied, "deleted": deleted,
+            "unchanged": len(selected) - len(copied) - managed_readme,
+            "readme": readme_written, "timings": timings}
+
+
+# ----------------------------------------------------------------------------
+# Git (GitHub remote or a local bare repository)
+# ----------------------------------------------------------------------------
+
+def git(dest, *args, check=True):
+    result = subprocess.run(["git", "-C", dest, *args], capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return result
+
+
+def prepare_dest(dest, remote):
+    """Clone remote into dest when dest does not exist; create a missing local bare repository"""
+    if os.path.isdir(dest):
+        return
+    if not re.match(r"^[\w+.-]+://|^[\w.-]+@", remote) and not os.path.isdir(remote):
+        subprocess.run(["git", "init", "--bare", "--initial-branch=main", remote], check=True, capture_output=True)
+    subprocess.run(["git", "clone", remote, dest], check=True, capture_output=True)
+
+
+def commit_and_push(dest, message, push=False, branch="main"):
+    """Commit all changes of dest; returns False when there was nothing to commit"""
+    git(dest, "add", "-A")
+    if git(dest, "diff", "--staged", "--quiet", check=False).returncode == 0:
+        return False
+    git(dest, "commit", "-m", message)
+    if push:
+        git(dest, "push", "origin", f"HEAD:{branch}")
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Incrementally sync the public repository")
+    parser.add_argument("--source", default=".")
+    parser.add_argument("--config", default=CONFIG_FILE)
+    parser.add_argument("--dest", required=True, help="public repository work tree")
+    parser.add_argument("--remote", help="clone this repository (URL or bare repository path) when --dest is missing")
+    parser.add_argument("--pub-repo-name", default=None)
+    parser.add_argument("--source-repo", default="local/source")
+    parser.add_argument("--commit-sha", default=None)
+    parser.add_argument("--commit", action="store_true", help="commit the changes in --dest")
+    parser.add_argument("--push", action="store_true", help="push the commit to origin")
+    parser.add_argument("--server-url", default="https://github.com")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    enabled, includes, excludes = load_config(os.path.join(args.source, args.config))
+    if not enabled:
+        print(f"❌ Public repository sync is disabled. Set ENABLE_SYNC=true in {args.config} to enable.")
+        sys.exit(1)
+    if args.remote:
+        prepare_dest(args.dest, args.remote)
+
+    commit_sha = args.commit_sha or subprocess.run(["git", "-C", args.source, "rev-parse", "HEAD"],
+                                                   capture_output=True, text=True).stdout.strip() or "0000000"
+    pub_repo_name = args.pub_repo_name or os.path.basename(os.path.abspath(args.dest))
+    sync_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    result = sync(args.source, args.dest, pathmatcher.PathMatcher(includes, excludes),
+                  (pub_repo_name, args.source_repo, commit_sha, sync_time), args.dry_run)
+
+    if not result["selected"]:
+        print("⚠️  No files to sync")
+        sys.exit(0)
+    for relative in result["copied"]:
+        print(f"✅ Copied: {relative}")
+    for relative in result["deleted"]:
+        print(f"🗑️ Deleted: {relative}")
+    if result["readme"]:
+        print(f"✅ {README} generated")
+    timings = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in result["timings"].items())
+    print(f"📊 {len(result['copied'])} copied, {len(result['deleted'])} deleted, "
+          f"{result['unchanged']} unchanged ({timings})")
+
+    if args.commit and not args.dry_run:
+        changed = len(result["copied"]) + len(result["deleted"]) + result["readme"]
+        message = (f"🔄 Auto-sync from private repository\n\n"
+                   f"Source Commit: {args.server_url}/{args.source_repo}/commit/{commit_sha}\n"
+                   f"Files Changed: {changed}")
+        try:
+            committed = commit_and_push(args.dest, message, args.push)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print("🚀 Changes committed" + (" and pushed" if args.push else "") if committed else "📝 No changes to commit")
@@ -7,6 +7,18 @@ import re
 import tarfile
 import uuid
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import emojiassets
+import emojibench
+import ctestrunner
+import gcovreport
+import processrunner
+import cpubudget
+import artifactcache
+import pathmatcher
+import controllerprofiler
 
 # MIT License Copyright (c) 2024-2025 Tomáš Mark
 
@@ -16,6 +28,9 @@ pythonVersion = sys.version.split()[0]
 baseName = os.path.basename(__file__)
 workSpaceDir = os.path.dirname(os.path.abspath(__file__))
 
+# Opt-in profiling: "--profile" anywhere on the command line (removed from argv here)
+profiler = controllerprofiler.from_argv(sys.argv, workSpaceDir)
+
 # CMake user presets file name just for [read only] here
 user_presets_file = "CMakeUserPresets.json"
 
@@ -32,9 +47,44 @@ cmake_files = [
     os.path.join(workSpaceDir, "cmake", "project-library.cmake"),
     os.path.join(workSpaceDir, "cmake", "project-standalone.cmake"),
     os.path.join(workSpaceDir, "cmake", "project-common.cmake"),
-    os.path.join(workSpaceDir, "standalone", "tests", "CMakeLists.txt")
+    os.path.join(workSpaceDir, "cmake", "project-benchmarks.cmake"),
+    os.path.join(workSpaceDir, "standalone", "tests", "CMakeLists.txt"),
+    os.path.join(workSpaceDir, "standalone", "benchmarks", "CMakeLists.txt")
 ]
 
+# C/C++ sources for clang-format and clang-tidy (build trees and .git are pruned, not walked)
+source_matcher = pathmatcher.PathMatcher(["**/*.c", "**/*.cpp", "**/*.h", "**/*.hpp"],
+                                         [f"{buildFolderName}/", ".git/"])
+
+# Conan package matrix for "⚔️ Create Conan Recipe Matrix"
+# (override with DOTNAME_CONAN_PROFILES / DOTNAME_CONAN_BUILD_TYPES, comma separated)
+conan_matrix_profiles = os.environ.get("DOTNAME_CONAN_PROFILES", "default").split(",")
+conan_matrix_build_types = os.environ.get("DOTNAME_CONAN_BUILD_TYPES", "Debug,Release").split(",")
+conanMatrixDir = os.path.join(workSpaceDir, buildFolderName, "conan-matrix")
+
+# Benchmarks for "⏱️ Run Benchmarks" (median slowdown above the threshold fails the task,
+# DOTNAME_BENCH_UPDATE_BASELINE=1 stores the run as the new baseline)
+benchOutputDir = os.path.join(workSpaceDir, buildFolderName, "bench")
+bench_regression_threshold = float(os.environ.get("DOTNAME_BENCH_THRESHOLD", emojibench.DEFAULT_THRESHOLD))
+bench_update_baseline = os.environ.get("DOTNAME_BENCH_UPDATE_BASELINE", "0") == "1"
+# Refs compared by "📈 Benchmark Regression Report"
+bench_report_base = os.environ.get("DOTNAME_BENCH_BASE", "HEAD~1")
+bench_report_head = os.environ.get("DOTNAME_BENCH_HEAD", "HEAD")
+
+# Parallel jobs for builds, tests, coverage and linting: affinity mask, cgroup cpu.max and
+# memory per job (DOTNAME_JOBS forces a value, DOTNAME_MEM_PER_JOB_MB tunes the memory limit)
+build_jobs, build_jobs_limits = cpubudget.budget()
+
+# Content-addressed cache of install trees and tarballs (DOTNAME_ARTIFACT_CACHE=<dir> or "off",
+# DOTNAME_ARTIFACT_CACHE_MAX_MB limits its size)
+artifact_cache = None if os.environ.get("DOTNAME_ARTIFACT_CACHE") == "off" else artifactcache.ArtifactCache()
+
+# Per-command timeout in seconds for execute_command/execute_subprocess (0 = none)
+command_timeout = float(os.environ.get("DOTNAME_COMMAND_TIMEOUT", "0")) or None
+
+# "🧪 Run Tests": run only shard i/n of the tests (e.g. DOTNAME_CTEST_SHARD=2/4 on CI)
+ctest_shard = os.environ.get("DOTNAME_CTEST_SHARD", "")
+
 GREEN = "\033[0;32m"
 YELLOW = "\033[0;33m"
 RED = "\033[0;31m"
@@ -136,6 +186,8 @@ def print_header():
     print(f"Install Artef.\t: {installationOutputDir}{NC}")
     print(f"Release Tarballs: {tarrballsOutputDir}{NC}")
     print(f"{GREEN}Cross\t\t: {isCrossCompilation}{NC}")
+    limits = ", ".join(f"{name} {value}" for name, value in build_jobs_limits.items())
+    print(f"{GREY}Parallel Jobs\t: {build_jobs} ({limits}){NC}")
 
 print_header()
 
@@ -161,24 +213,28 @@ def log2file(message):
     with open(os.path.join(workSpaceDir, "SolutionController.log"), "a") as f:
         f.write(message + "\n")
 
+def run_process(cmd, shell=None, env=None):
+    """Run a command on the console through processrunner; fail the task on error"""
+    result = processrunner.run_one(processrunner.Command(cmd, env=env, shell=shell, timeout=command_timeout,
+                                                         passthrough=True))
+    usage = f"{result.duration:.1f}s"
+    if result.user_time is not None:
+        usage += f", cpu {result.user_time + result.system_time:.1f}s, max rss {result.max_rss_kb / 1024:.0f} MB"
+    log2file(f"{result.status()} ({usage}): {cmd}")
+    if result.timed_out:
+        exit_with_error(f"Command timed out after {command_timeout:.0f}s: {cmd}")
+    if not result.ok:
+        exit_with_error(f"Command failed: {cmd}")
+
 def execute_command(cmd):
     print(f"{LIGHTBLUE}> Executed: {cmd}{NC}")
     log2file(cmd)
-    if platform.system().lower() == "windows":
-        result = subprocess.run(cmd, shell=True)
-    else:
-        result = subprocess.run(cmd, shell=True, executable="/bin/bash")
-    if result.returncode != 0:
-        exit_with_error(f"Command failed: {cmd}")
+    run_process(cmd)
 
-def execute_subprocess(cmd, executable):
+def execute_subprocess(cmd, executable, env=None):
     print(f"{LIGHTBLUE}> Executed: {cmd}{NC}")
-    if platform.system().lower() == "windows":
-        executable = "C:\\Windows\\System32\\cmd.exe"
     log2file(cmd)
-    result = subprocess.run(cmd, shell=True, executable=executable)
-    if result.returncode != 0:
-        exit_with_error(f"Command failed: {cmd}")
+    run_process(cmd, shell=True if platform.system().lower() == "windows" else executable, env=env)
 
 def get_build_dir(kind):
     return os.path.join(buildFolderName, kind, buildArch, buildType.lower())
@@ -343,20 +399,25 @@ def cmake_configure(src, bdir, isCMakeDebugger=False, enable_coverage=False):
         )
         execute_command(cmd)
 
-def cmake_build(bdir, target=None):
+def cmake_build(bdir, target=None, config=None):
 
     # --target is optional
     if target is None:
         target = ""
     else:
         target = f"--target {target}"
+    # --config selects the configuration of multi-config generators (ignored by single-config ones)
+    if config is not None:
+        target += f" --config {config}"
 
+    # Jobserver-aware tools share the controller's token pool, others get -j <budget>
+    env, jobs = cpubudget.build_parallelism(os.path.abspath(bdir), build_jobs)
     conan_build_sh_file = os.path.join(workSpaceDir, bdir, 'conanbuild.sh')
     if os.path.exists(conan_build_sh_file):
-        bashCmd = f'source "{conan_build_sh_file}" && cmake --build "{os.path.abspath(bdir)}" {target} -j {os.cpu_count()}'
+        bashCmd = f'source "{conan_build_sh_file}" && cmake --build "{os.path.abspath(bdir)}" {target} {jobs}'
     else:
-        bashCmd = f'cmake --build "{os.path.abspath(bdir)}" {target} -j {os.cpu_count()}'
-    execute_subprocess(bashCmd, "/bin/bash")
+        bashCmd = f'cmake --build "{os.path.abspath(bdir)}" {target} {jobs}'
+    execute_subprocess(bashCmd, "/bin/bash", env)
 
 
 def cmake_build_presets():
@@ -404,12 +465,14 @@ def clean_build_folder(bdir):
     shutil.rmtree(bdir, ignore_errors=True)
 
 def build_spltr():
+    generate_asset_sources()
     if lib_flag:
         cmake_build(get_build_dir("library"))
     if st_flag:
         cmake_build(get_build_dir("standalone"))
 
 def configure_spltr(enable_coverage=False):
+    generate_asset_sources()
     if lib_flag:
         cmake_configure(".", get_build_dir("library"), False, enable_coverage)
     if st_flag:
@@ -436,11 +499,74 @@ def clean_spltr():
     if st_flag:
         clean_build_folder(get_build_dir("standalone"))
 
+def artifact_key(kind, bdir):
+    """
+    Cache key of a build's artifacts: sources, conan lock, settings, CMake options, preset and build type.
+    None when Conan could not read the settings (no settings_hash) - such a build is not cached.
+    """
+    snapshot = os.path.join(workSpaceDir, bdir, emojibench.SETTINGS_SNAPSHOT_FILE)
+    if os.path.isfile(snapshot):
+        with open(snapshot, "r", encoding="utf-8") as f:
+            if json.load(f).get("settings_hash") is None:
+                return None
+    return artifactcache.make_key(
+        kind=kind, arch=buildArch, build_type=buildType, preset=configure_preset_name(bdir),
+        sources=artifactcache.tree_digest(workSpaceDir, artifactcache.SOURCE_INPUTS),
+        settings=artifactcache.file_sha256(snapshot) if os.path.isfile(snapshot) else None,
+        cmake_options=artifactcache.cmake_options(os.path.join(workSpaceDir, bdir)))
+
+def cached_install(kind, bdir):
+    """cmake install, or restore the install files of an identical earlier build from the cache"""
+    prefix = os.path.join(installationOutputDir, buildArch, buildType.lower())
+    if artifact_cache is None:
+        cmake_install(bdir)
+        return
+    key = artifact_key(kind, bdir)
+    if key is None:
+        print(f"{YELLOW}Artifact cache skipped ({kind}): Conan settings unavailable in the settings snapshot{NC}")
+        cmake_install(bdir)
+        return
+    restored = artifact_cache.restore(key, prefix)
+    if restored is not None:
+        print(f"{GREEN}Artifact cache hit ({kind}): restored {len(restored)} files into {prefix}{NC}")
+        log2file(f"Artifact cache hit: {kind} {key[:12]}")
+        return
+
+    # Files restored earlier are hardlinks into the cache - never let the install overwrite them in place
+    artifactcache.detach(prefix)
+    cmake_install(bdir)
+    manifest = os.path.join(workSpaceDir, bdir, "install_manifest.txt")
+    if os.path.isfile(manifest):
+        with open(manifest, "r", encoding="utf-8") as f:
+            files = [os.path.relpath(line.strip(), prefix) for line in f if line.strip()]
+        files = [file for file in files if not file.startswith("..")]
+        added = artifact_cache.store(key, prefix, files, {"kind": kind, "arch": buildArch, "build_type": buildType})
+        print(f"{GREY}Artifact cache: stored {len(files)} files ({added / 1024 / 1024:.1f} MB new) "
+              f"in {artifact_cache.root}{NC}")
+
+def cached_tarball(kind, source_dir, out_path, tar_filter=None):
+    """Create a tarball of source_dir, or restore an identical one from the cache"""
+    key = None
+    if artifact_cache is not None:
+        key = artifactcache.make_key(kind=f"tarball-{kind}", name=os.path.basename(out_path),
+                                     tree=artifactcache.tree_digest(source_dir), filtered=tar_filter is not None)
+        if artifact_cache.restore(key, os.path.dirname(out_path)) is not None:
+            print(f"{GREEN}Artifact cache hit: {out_path}{NC}")
+            return
+    # A previous hit left a hardlink into the cache here - replace, do not truncate it
+    if os.path.lexists(out_path):
+        os.remove(out_path)
+    with tarfile.open(out_path, "w:gz") as tar:
+        tar.add(source_dir, arcname=".", filter=tar_filter)
+    print(f"Created tarball: {out_path}")
+    if key is not None:
+        artifact_cache.store(key, os.path.dirname(out_path), [os.path.basename(out_path)], {"kind": kind})
+
 def installation_spltr():
     if lib_flag:
-        cmake_install(get_build_dir("library"))
+        cached_install("library", get_build_dir("library"))
     if st_flag:
-        cmake_install(get_build_dir("standalone"))
+        cached_install("standalone", get_build_dir("standalone"))
 
 def license_spltr():
     lib_ver, lib_name, st_name = get_version_and_names_from_cmake_lists()
@@ -462,6 +588,27 @@ def reorder_build_type_to_end(preset_name, build_type):
         # If build type is not at the beginning, return as is
         return preset_name
 
+def select_configure_preset_name(presets_data, build_type):
+    """
+    Pick the configure preset matching the build type.
+    CMakePresets.json may hold merged presets of several build types.
+    """
+    names = [p["name"] for p in presets_data.get("configurePresets", []) if "name" in p]
+    for name in names:
+        if name.endswith(f"-{build_type.lower()}"):
+            return name
+    return names[0] if names else None
+
+def configure_preset_name(bdir):
+    """Configure preset of a build folder for the current build type, None without CMakePresets.json"""
+    preset_file = os.path.join(workSpaceDir, bdir, "CMakePresets.json")
+    if os.path.isfile(preset_file):
+        try:
+            with open(preset_file, "r", encoding="utf-8") as pf:
+                return select_configure_preset_name(json.load(pf), buildType)
+        except Exception:
+            pass
+    return None
 
 def release_tarballs_spltr():
     os.makedirs(tarrballsOutputDir, exist_ok=True)
@@ -471,70 +618,128 @@ def release_tarballs_spltr():
         if lib_flag:
             # Determine the suffix for the library tarball
             bdir = get_build_dir("library")
-            preset_file = os.path.join(workSpaceDir, bdir, "CMakePresets.json")
             # fallback suffix - buildType at the end
             suffix = f"{buildArch}-{buildType.lower()}"
-            if os.path.isfile(preset_file):
-                try:
-                    with open(preset_file, "r", encoding="utf-8") as pf:
-                        pd = json.load(pf)
-                    cp = pd.get("configurePresets", [])
-                    if cp and "name" in cp[0]:
-                        preset_name = cp[0]["name"]
-                        suffix = reorder_build_type_to_end(preset_name, buildType)
-                except Exception:
-                    pass
+            preset_name = configure_preset_name(bdir)
+            if preset_name:
+                suffix = reorder_build_type_to_end(preset_name, buildType)
             archive_name = f"{lib_name}-{lib_ver}-{suffix}.tar.gz"
             # Create the source directory path
             source_dir = os.path.join(installationOutputDir, buildArch, buildType.lower())
             if os.listdir(source_dir):
                 print(f"Creating library tarball from: {source_dir}")
                 out_path = os.path.join(tarrballsOutputDir, archive_name)
-                with tarfile.open(out_path, "w:gz") as tar:
-                    # exclude bin folder from library tarball
-                    tar.add(source_dir, arcname=".", filter=lambda x: None if "bin" in x.name else x)
-                print(f"Created tarball: {out_path}")
+                # exclude bin folder from library tarball
+                cached_tarball("library", source_dir, out_path, lambda x: None if "bin" in x.name else x)
             else:
                 print(f"No content found in {source_dir} for library.")
 
         if st_flag:
             # Determine the suffix for the standalone tarball
             bdir = get_build_dir("standalone")
-            preset_file = os.path.join(workSpaceDir, bdir, "CMakePresets.json")
             # fallback suffix - buildType at the end
             suffix = f"{buildArch}-{buildType.lower()}"
-            if os.path.isfile(preset_file):
-                try:
-                    with open(preset_file, "r", encoding="utf-8") as pf:
-                        pd = json.load(pf)
-                    cp = pd.get("configurePresets", [])
-                    if cp and "name" in cp[0]:
-                        preset_name = cp[0]["name"]
-                        suffix = reorder_build_type_to_end(preset_name, buildType)
-                except Exception:
-                    pass
+            preset_name = configure_preset_name(bdir)
+            if preset_name:
+                suffix = reorder_build_type_to_end(preset_name, buildType)
             st_archive_name = f"{st_name}-{lib_ver}-{suffix}.tar.gz"
             source_dir = os.path.join(installationOutputDir, buildArch, buildType.lower())
 
             if os.listdir(source_dir):
                 print(f"Creating standalone tarball from: {source_dir}")
                 out_path = os.path.join(tarrballsOutputDir, st_archive_name)
-                with tarfile.open(out_path, "w:gz") as tar:
-                    tar.add(source_dir, arcname=".")
-                print(f"Created tarball: {out_path}")
+                cached_tarball("standalone", source_dir, out_path)
 
             else:
                 print(f"No content found in {source_dir} for standalone.")
 
 def run_ctest():
-    st_build_dir = get_build_dir("standalone") + "/tests"
-    if os.path.exists(st_build_dir):
-        os.chdir(st_build_dir)
-        print(f"Running CTest in {st_build_dir}")
-        execute_command("ctest --verbose")
-        # execute_command("ctest --output-on-failure")
-    else:
+    st_build_dir = os.path.join(workSpaceDir, get_build_dir("standalone"), "tests")
+    if not os.path.exists(st_build_dir):
         print(f"Build directory {st_build_dir} does not exist. Skipping CTest.")
+        return
+    try:
+        shard = ctestrunner.parse_shard(ctest_shard) if ctest_shard else None
+    except ValueError as e:
+        exit_with_error(str(e))
+    shard_info = f" (shard {shard[0]}/{shard[1]})" if shard else ""
+    print(f"{LIGHTBLUE}> Running CTest in {st_build_dir}{shard_info}{NC}")
+    log2file(f"CTest: {st_build_dir}{shard_info}")
+    try:
+        results, wall, returncode = ctestrunner.run_tests(st_build_dir, shard, build_jobs)
+    except (RuntimeError, OSError, ValueError) as e:
+        exit_with_error(f"CTest failed: {e}")
+
+    for line in ctestrunner.summary_lines(results, wall):
+        color = RED if line.endswith("failed") or line.startswith("  ") else NC
+        print(f"{color}{line}{NC}")
+    print(f"{GREY}JUnit: {os.path.join(st_build_dir, ctestrunner.JUNIT_FILE)}{NC}")
+    if returncode != 0 or any(r.status == "failed" for r in results):
+        exit_with_error("Tests failed.")
+
+def run_benchmarks():
+    lib_ver, lib_name, st_name = get_version_and_names_from_cmake_lists()
+    bench_name = f"{lib_name}Bench"
+    bdir = get_build_dir("standalone")
+    if not os.path.exists(bdir):
+        exit_with_error(f"Build directory {bdir} does not exist. Configure the standalone build first.")
+    cmake_build(bdir, target=bench_name, config=buildType)
+
+    executable = emojibench.benchmark_executable(os.path.join(workSpaceDir, bdir), bench_name, buildType)
+    if not os.path.isfile(executable):
+        exit_with_error(f"Benchmark executable not found: {executable}")
+
+    print(f"{LIGHTBLUE}> Running benchmarks: {executable}{NC}")
+    log2file(f"Benchmarks: {executable}")
+    try:
+        rows, baseline_written = emojibench.run_and_compare(
+            executable, os.path.join(workSpaceDir, "assets"), benchOutputDir,
+            bench_regression_threshold, bench_update_baseline,
+            emojibench.build_config(os.path.join(workSpaceDir, bdir), buildType), workSpaceDir)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        exit_with_error(f"Benchmark run failed: {e}")
+
+    colors = {"regression": RED, "improvement": GREEN, "ok": NC, "new": GREY}
+    lines = emojibench.format_comparison(rows)
+    print(lines[0])
+    for line, row in zip(lines[1:], rows):
+        print(f"{colors[row[4]]}{line}{NC}")
+    print(f"{GREY}Results: {os.path.join(benchOutputDir, emojibench.LATEST_FILE)}{NC}")
+    if baseline_written:
+        print(f"{LIGHTBLUE}Baseline written: {os.path.join(benchOutputDir, emojibench.BASELINE_FILE)}{NC}")
+
+    regressions = [row[0] for row in rows if row[4] == "regression"]
+    if regressions:
+        exit_with_error(f"Performance regression (>{bench_regression_threshold * 100:.0f}%): {', '.join(regressions)}")
+
+def benchmark_report():
+    results = os.path.join(benchOutputDir, emojibench.RESULTS_FILE)
+    rows = emojibench.load_results(results)
+    if not rows:
+        exit_with_error(f"No benchmark results in {results}. Run \"⏱️ Run Benchmarks\" first.")
+
+    print(f"{LIGHTBLUE}Benchmark trend (median per commit){NC}")
+    print("\n".join(emojibench.trend_table(rows)))
+
+    try:
+        base_sha = emojibench.resolve_ref(bench_report_base, workSpaceDir)
+        head_sha = emojibench.resolve_ref(bench_report_head, workSpaceDir)
+    except ValueError as e:
+        exit_with_error(str(e))
+    report = emojibench.regression_report(rows, base_sha, head_sha, bench_regression_threshold)
+    if not report:
+        exit_ok(f"No stored results for both {bench_report_base} and {bench_report_head} - nothing to compare.")
+
+    print(f"\n{LIGHTBLUE}{bench_report_base} ({base_sha[:10]}) -> {bench_report_head} ({head_sha[:10]}){NC}")
+    colors = {"regression": RED, "improvement": GREEN, "ok": NC, "noise": GREY}
+    lines = emojibench.format_report(report)
+    print(lines[0])
+    for line, entry in zip(lines[1:], report):
+        print(f"{colors[entry['status']]}{line}  {GREY}{entry['config']['arch']}/{entry['config']['build_type']}{NC}")
+
+    regressions = sorted({entry["benchmark"] for entry in report if entry["status"] == "regression"})
+    if regressions:
+        exit_with_error(f"Significant performance regression: {', '.join(regressions)}")
 
 def run_cpack():
     if lib_flag:
@@ -614,16 +819,16 @@ def clang_tidy_spltr():
     clang_tidy_cmd = find_clang_tidy()
 
     def run_clang_tidy(bdir):
-        for root, _, files in os.walk(workSpaceDir):
-            if buildFolderName in root:
-                continue
-            for file in files:
-                if file.endswith((".c", ".cpp", ".h", ".hpp")):
-                    full_path = os.path.join(root, file)
-                    cmd = f'{clang_tidy_cmd} -p "{bdir}" "{full_path}"'
-                    print(f"Analyzing: {full_path}")
-                    execute_command(cmd)
-                    print(f"Done: {full_path}")
+        commands = [processrunner.Command([clang_tidy_cmd, "-p", bdir, full_path], name=os.path.basename(full_path),
+                                          timeout=command_timeout)
+                    for full_path in source_matcher.files(workSpaceDir)]
+        print(f"{LIGHTBLUE}> Analyzing {len(commands)} files with {clang_tidy_cmd} ({build_jobs} jobs){NC}")
+        log2file(f"{clang_tidy_cmd} -p {bdir} ({len(commands)} files)")
+        # One jobserver token per clang-tidy process - shared with a parent make or concurrent builds
+        results = processrunner.run(commands, build_jobs, jobserver=cpubudget.jobserver(build_jobs))
+        failed = [r.cmd for r in results if not r.ok]
+        if failed:
+            exit_with_error("Command failed: " + "\n".join(failed))
 
     if lib_flag:
         bdir = get_build_dir("library")
@@ -642,16 +847,11 @@ def find_clang_format():
 def clang_format():
     clang_format_cmd = find_clang_format()
 
-    for root, _, files in os.walk(workSpaceDir):
-        if buildFolderName in root:
-            continue
-        for file in files:
-            if file.endswith((".c", ".cpp", ".h", ".hpp")):
-                full_path = os.path.join(root, file)
-                cmd = f'{clang_format_cmd} -i "{full_path}"'
-                print(f"Processing: {full_path}")
-                execute_command(cmd)
-                print(f"Done: {full_path}")
+    for full_path in source_matcher.files(workSpaceDir):
+        cmd = f'{clang_format_cmd} -i "{full_path}"'
+        print(f"Processing: {full_path}")
+        execute_command(cmd)
+        print(f"Done: {full_path}")
 
 def cmake_format():
     for cmake_file in cmake_files:
@@ -665,6 +865,140 @@ def conan_create():
     cmd = f'conan create "{workSpaceDir}"'
     execute_command(cmd)
 
+def get_conan_home():
+    if os.environ.get("CONAN_HOME"):
+        return os.environ["CONAN_HOME"]
+    result = subprocess.run("conan config home", shell=True, capture_output=True, text=True)
+    if result.returncode != 0:
+        exit_with_error(f"Cannot determine Conan home: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+def prepare_conan_home_overlay(base_home, overlay_home, download_cache):
+    """
+    Create an isolated CONAN_HOME for one matrix shard.
+    Profiles and configuration are taken from the user's Conan home, package storage
+    is private to the shard (and persists between runs), downloads go to one shared cache.
+    """
+    os.makedirs(overlay_home, exist_ok=True)
+    for name in ["profiles", "extensions"]:
+        src = os.path.join(base_home, name)
+        if os.path.isdir(src):
+            shutil.copytree(src, os.path.join(overlay_home, name), dirs_exist_ok=True)
+    for name in ["remotes.json", "settings.yml", "settings_user.yml"]:
+        src = os.path.join(base_home, name)
+        if os.path.isfile(src):
+            shutil.copy2(src, os.path.join(overlay_home, name))
+
+    global_conf = ""
+    base_conf = os.path.join(base_home, "global.conf")
+    if os.path.isfile(base_conf):
+        with open(base_conf, "r", encoding="utf-8") as f:
+            global_conf = "".join(line for line in f if not line.startswith("core.download:download_cache"))
+    global_conf = global_conf.rstrip("\n") + f"\ncore.download:download_cache={download_cache}\n"
+    overlay_conf = os.path.join(overlay_home, "global.conf")
+    if os.path.isfile(overlay_conf):
+        with open(overlay_conf, "r", encoding="utf-8") as f:
+            if f.read() == global_conf:
+                return
+    with open(overlay_conf, "w", encoding="utf-8") as f:
+        f.write(global_conf)
+
+def run_conan_shard(ref, profile, build_type, env, log_file):
+    """Export the recipe and create its package for one profile/build type, unless cached"""
+    def run(cmd):
+        with open(log_file, "a", encoding="utf-8") as log:
+            log.write(f"> {cmd}\n")
+            log.flush()
+            result = subprocess.run(cmd, shell=True, env=env, stdout=subprocess.PIPE,
+                                    stderr=log, text=True)
+            log.write(result.stdout)
+        return result
+
+    settings = f'--profile:host={profile} --profile:build=default --settings build_type={build_type}'
+
+    # Export first so the recipe revision of the current sources is known to the shard cache
+    if run(f'conan export "{workSpaceDir}"').returncode != 0:
+        return "failed"
+
+    # The binary status of the package node tells whether this rrev + package ID is cached
+    result = run(f'conan graph info --requires={ref} {settings} --format=json')
+    if result.returncode == 0:
+        try:
+            nodes = json.loads(result.stdout).get("graph", {}).get("nodes", {})
+            for node in nodes.values():
+                if str(node.get("ref", "")).startswith(ref) and node.get("binary") == "Cache":
+                    return "cached"
+        except json.JSONDecodeError:
+            pass
+
+    if run(f'conan create "{workSpaceDir}" {settings} --build=missing').returncode != 0:
+        return "failed"
+    return "built"
+
+def conan_create_matrix():
+    result = subprocess.run(f'conan inspect "{workSpaceDir}" --format=json', shell=True,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        exit_with_error(f"Command failed: conan inspect: {result.stderr.strip()}")
+    recipe = json.loads(result.stdout)
+    ref = f'{recipe["name"]}/{recipe["version"]}'
+
+    base_home = get_conan_home()
+    download_cache = os.path.join(conanMatrixDir, "download-cache")
+    os.makedirs(download_cache, exist_ok=True)
+
+    shards = []
+    for profile in filter(None, (p.strip() for p in conan_matrix_profiles)):
+        for build_type in filter(None, (b.strip() for b in conan_matrix_build_types)):
+            shard_dir = os.path.join(conanMatrixDir, f"{profile}-{build_type.lower()}")
+            overlay_home = os.path.join(shard_dir, "home")
+            prepare_conan_home_overlay(base_home, overlay_home, download_cache)
+            env = dict(os.environ, CONAN_HOME=overlay_home)
+            log_file = os.path.join(shard_dir, "create.log")
+            open(log_file, "w").close()
+            shards.append((profile, build_type, env, log_file))
+
+    print(f"{LIGHTBLUE}> Creating {ref} for {len(shards)} configurations in {conanMatrixDir}{NC}")
+    log2file(f"conan create matrix: {ref} x {len(shards)}")
+
+    def run_timed(shard):
+        profile, build_type, env, log_file = shard
+        start = time.monotonic()
+        status = run_conan_shard(ref, profile, build_type, env, log_file)
+        return status, time.monotonic() - start
+
+    matrix_start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=len(shards) or 1) as executor:
+        results = list(executor.map(run_timed, shards))
+    matrix_time = time.monotonic() - matrix_start
+
+    colors = {"built": GREEN, "cached": GREY, "failed": RED}
+    print(f"\n{'Profile':<28}{'Build type':<16}{'Status':<10}{'Time':>10}")
+    for (profile, build_type, _, log_file), (status, duration) in zip(shards, results):
+        print(f"{profile:<28}{build_type:<16}{colors[status]}{status:<10}{NC}{duration:>9.1f}s")
+        if status == "failed":
+            print(f"{GREY}  log: {log_file}{NC}")
+    print(f"{LIGHTBLUE}Total package matrix time: {matrix_time:.1f}s{NC}")
+
+    if any(status == "failed" for status, _ in results):
+        exit_with_error("Some Conan package configurations failed.")
+
+def generate_asset_sources(force=False):
+    """Regenerate sources derived from assets/ (only when an input hash changed)"""
+    try:
+        results = emojiassets.generate_asset_sources(workSpaceDir, force=force)
+    except (IOError, OSError, ValueError) as e:
+        exit_with_error(f"Failed to generate asset sources: {e}")
+    for output, status in results:
+        if status == "written":
+            print(f"{LIGHTBLUE}> Generated: {output}{NC}")
+            log2file(f"Generate: {output}")
+        else:
+            print(f"{GREY}Asset source {status}: {output}{NC}")
+
+def generate_asset_sources_forced():
+    generate_asset_sources(force=True)
+
 def open_in_browser(file_path):
     """Open a file in the default web browser across different platforms."""
     if not os.path.isfile(file_path):
@@ -722,78 +1056,62 @@ def doxygen_documentation():
 
 # ------ coverage functions -----------------------------------
 
+def coverage_report(html_report=False, xml_report=False):
+    """Aggregate gcov data of the standalone build (parallel, cached per TU) and print the summary"""
+    build_dir = os.path.join(workSpaceDir, get_build_dir("standalone"))
+    if not os.path.exists(build_dir):
+        print(f"Build directory {build_dir} does not exist. Run build with -DENABLE_COVERAGE=ON first.")
+        return None
+    print(f"{LIGHTBLUE}> Aggregating coverage data in {build_dir}{NC}")
+    try:
+        model, processed, total, errors = gcovreport.generate(build_dir, workSpaceDir, html_report, xml_report,
+                                                              build_jobs)
+    except (RuntimeError, OSError, ValueError) as e:
+        exit_with_error(f"Coverage aggregation failed: {e}")
+    if total == 0:
+        print(f"{YELLOW}No .gcda files found. Build with coverage enabled and run the tests first.{NC}")
+        return None
+    for gcda, error in errors:
+        print(f"{YELLOW}Skipped {os.path.relpath(gcda, build_dir)}: {error}{NC}")
+    if errors:
+        print(f"{YELLOW}{len(errors)} translation units skipped - rebuild or run \"📊 Coverage Reset\" to clear stale data{NC}")
+    print("\n".join(gcovreport.summary_lines(model)))
+    print(f"{GREY}{processed} of {total} translation units processed by gcov, the rest from cache{NC}")
+    return build_dir
+
 def run_coverage_html():
     """Generate HTML coverage report"""
-    build_dir = get_build_dir("standalone")
-    if os.path.exists(build_dir):
-        os.chdir(build_dir)
-        print(f"Generating HTML coverage report in {build_dir}")
-        execute_command("cmake --build . --target coverage-html")
-        
-        # Try to open coverage report in browser
-        coverage_file = os.path.join(os.getcwd(), "coverage.html")
-        if os.path.exists(coverage_file):
-            open_in_browser(coverage_file)
-            print(f"Coverage HTML report opened in browser: {coverage_file}")
-        else:
-            print(f"Coverage report not found at {coverage_file}")
-    else:
-        print(f"Build directory {build_dir} does not exist. Run build with -DENABLE_COVERAGE=ON first.")
+    build_dir = coverage_report(html_report=True)
+    if build_dir:
+        coverage_file = os.path.join(build_dir, gcovreport.HTML_FILE)
+        open_in_browser(coverage_file)
+        print(f"Coverage HTML report opened in browser: {coverage_file}")
 
 def run_coverage_xml():
     """Generate XML coverage report (for CI/CD)"""
-    build_dir = get_build_dir("standalone")
-    if os.path.exists(build_dir):
-        os.chdir(build_dir)
-        print(f"Generating XML coverage report in {build_dir}")
-        execute_command("cmake --build . --target coverage-xml")
-        
-        coverage_file = os.path.join(os.getcwd(), "coverage.xml")
-        if os.path.exists(coverage_file):
-            print(f"Coverage XML report generated: {coverage_file}")
-        else:
-            print(f"Coverage XML report not found at {coverage_file}")
-    else:
-        print(f"Build directory {build_dir} does not exist. Run build with -DENABLE_COVERAGE=ON first.")
+    build_dir = coverage_report(xml_report=True)
+    if build_dir:
+        print(f"Coverage XML report generated: {os.path.join(build_dir, gcovreport.XML_FILE)}")
 
 def run_coverage_summary():
     """Display coverage summary in console"""
-    build_dir = get_build_dir("standalone")
-    if os.path.exists(build_dir):
-        os.chdir(build_dir)
-        print(f"Displaying coverage summary from {build_dir}")
-        execute_command("cmake --build . --target coverage-summary")
-    else:
-        print(f"Build directory {build_dir} does not exist. Run build with -DENABLE_COVERAGE=ON first.")
+    coverage_report()
 
 def run_coverage_full():
     """Generate both HTML and XML coverage reports"""
-    build_dir = get_build_dir("standalone")
-    if os.path.exists(build_dir):
-        os.chdir(build_dir)
-        print(f"Generating full coverage report in {build_dir}")
-        execute_command("cmake --build . --target coverage")
-        
-        # Try to open HTML coverage report in browser
-        coverage_file = os.path.join(os.getcwd(), "coverage.html")
-        if os.path.exists(coverage_file):
-            open_in_browser(coverage_file)
-            print(f"Coverage HTML report opened in browser: {coverage_file}")
-        
-        # Check XML report
-        xml_file = os.path.join(os.getcwd(), "coverage.xml")
-        if os.path.exists(xml_file):
-            print(f"Coverage XML report generated: {xml_file}")
-    else:
-        print(f"Build directory {build_dir} does not exist. Run build with -DENABLE_COVERAGE=ON first.")
+    build_dir = coverage_report(html_report=True, xml_report=True)
+    if build_dir:
+        coverage_file = os.path.join(build_dir, gcovreport.HTML_FILE)
+        open_in_browser(coverage_file)
+        print(f"Coverage HTML report opened in browser: {coverage_file}")
+        print(f"Coverage XML report generated: {os.path.join(build_dir, gcovreport.XML_FILE)}")
 
 def run_coverage_reset():
     """Reset coverage counters"""
-    build_dir = get_build_dir("standalone")
+    build_dir = os.path.join(workSpaceDir, get_build_dir("standalone"))
     if os.path.exists(build_dir):
-        os.chdir(build_dir)
-        print(f"Resetting coverage counters in {build_dir}")
-        execute_command("cmake --build . --target coverage-reset")
+        removed = gcovreport.reset(build_dir)
+        print(f"Resetting coverage counters in {build_dir}: {removed} .gcda files removed")
     else:
         print(f"Build directory {build_dir} does not exist.")
 
@@ -828,6 +1146,11 @@ def zero_to_hero():
 
 # ------ task map ---------------------------------------------
 
+# Wrap every task and helper above in a named span
+if profiler:
+    profiler.instrument(globals(), __name__)
+
+
 task_map = {
     "🚀 Zero to Build": zero_to_build,
     "🦸 Zero to Hero": zero_to_hero,
@@ -838,6 +1161,8 @@ task_map = {
     "🪲 CMake Configure with CMake-debugger": configure_spltr_cmake_debugger,
     "🔨 Build": build_spltr,
     "🧪 Run Tests": run_ctest,
+    "⏱️ Run Benchmarks": run_benchmarks,
+    "📈 Benchmark Regression Report": benchmark_report,
     "📜 Gather dependency licenses": license_spltr,
     "📌 Install built components": installation_spltr,
     "🗜️ Create Tarballs for distribution": release_tarballs_spltr,
@@ -847,6 +1172,8 @@ task_map = {
     "📏 Format CMake": cmake_format,
     "🔨 Build All CMakeUserPresets.json": cmake_build_presets,
     "⚔️ Create Conan Recipe" : conan_create,
+    "⚔️ Create Conan Recipe Matrix": conan_create_matrix,
+    "🧬 Generate Asset Sources": generate_asset_sources_forced,
     "📊 Dependency Graph": conan_graph,
     "📖 Generate Documentation": doxygen_documentation,
     "🚀 Launch Emscripten Server": launch_emrun_server,
@@ -859,7 +1186,10 @@ task_map = {
 }
 
 if taskName in task_map:
-    task_map[taskName]()
+    if profiler:
+        profiler.span(f"task: {taskName}", "task")(task_map[taskName])()
+    else:
+        task_map[taskName]()
 else:
     print(f"Received unknown task: {taskName}")
     exit_with_error("Task name is missing. Exiting.")
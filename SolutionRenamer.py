@@ -4,7 +4,11 @@
 import os
 import sys
 import codecs # For reading and writing files with utf-8 specific encoding (required for Windows)
-import re 
+import re
+import json
+import shutil
+
+import pathmatcher
 
 # Implicitly usable:
 # python SolutionRenamer.py DotNameLib DotNameLib DotNameStandalone DotNameStandalone
@@ -38,6 +42,149 @@ def check_forbidden_words(name):
             return False
     return True
 
+class RenameJournal:
+    """
+    Staged, journaled rename of the project tree.
+
+    New file contents are written to temp files next to their targets and every
+    pending write and os.rename is recorded in a journal file. commit() then applies
+    all operations in one fast phase; rollback() undoes whatever was applied. The
+    journal is persisted before the commit starts, so an interrupted run can be
+    recovered by the next invocation.
+    """
+
+    JOURNAL_FILE = ".SolutionRenamer.journal.json"
+    TEMP_SUFFIX = ".renametmp"
+    BACKUP_SUFFIX = ".renamebak"
+
+    def __init__(self):
+        self.operations = []
+
+    def stage_write(self, file, content):
+        temp_file = file + self.TEMP_SUFFIX
+        with codecs.open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        shutil.copymode(file, temp_file)
+        self.operations.append({"op": "write", "target": file, "temp": temp_file,
+                                "backup": file + self.BACKUP_SUFFIX})
+
+    def stage_rename(self, src, dst):
+        if os.path.exists(dst):
+            raise FileExistsError(f"Rename target already exists: {dst}")
+        self.operations.append({"op": "rename", "src": src, "dst": dst})
+
+    def _save(self):
+        temp_journal = self.JOURNAL_FILE + self.TEMP_SUFFIX
+        with open(temp_journal, 'w', encoding='utf-8') as f:
+            json.dump({"operations": self.operations}, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_journal, self.JOURNAL_FILE)
+
+    def commit(self):
+        if not self.operations:
+            print("Nothing to do - project already uses the requested names")
+            return
+        self._save()
+        for operation in self.operations:
+            if operation["op"] == "write":
+                # Keep the original until the whole commit succeeds
+                os.replace(operation["target"], operation["backup"])
+                os.replace(operation["temp"], operation["target"])
+                print(f"✓ Updated content in: {operation['target']}")
+            else:
+                os.rename(operation["src"], operation["dst"])
+                print(f"✓ Renamed: {operation['src']} → {operation['dst']}")
+        self._finish()
+
+    @staticmethod
+    def _moved(path, renames):
+        """Where path is after the given renames (a backup moves with its renamed file or directory)"""
+        path = os.path.normpath(path)
+        for operation in renames:
+            src = os.path.normpath(operation["src"])
+            if path == src or path.startswith(src + os.sep):
+                path = os.path.normpath(operation["dst"]) + path[len(src):]
+        return path
+
+    def _finish(self):
+        # Dropping the journal is the commit point - leftover backups must not trigger a rollback later
+        os.remove(self.JOURNAL_FILE)
+        renames = [operation for operation in self.operations if operation["op"] == "rename"]
+        failures = []
+        for operation in self.operations:
+            if operation["op"] != "write":
+                continue
+            backup = self._moved(operation["backup"], renames)
+            if os.path.exists(backup):
+                try:
+                    os.remove(backup)
+                except OSError as e:
+                    failures.append(f"{backup}: {e}")
+        for failure in failures:
+            print(f"\033[93m⚠ Could not remove backup {failure}\033[0m")
+
+    def rollback(self):
+        """
+        Undo applied operations in reverse order; safe to call on a partial commit.
+        Failing operations are skipped and reported, and the journal is kept so the
+        next run retries them. Returns True if everything was restored.
+        """
+        failures = []
+        # Renames that are still applied - files staged for writing moved with them
+        still_renamed = []
+        for operation in reversed(self.operations):
+            try:
+                if operation["op"] == "write":
+                    # Restore in place, wherever a rename that could not be undone left the file
+                    target = self._moved(operation["target"], still_renamed)
+                    backup = self._moved(operation["backup"], still_renamed)
+                    temp = self._moved(operation["temp"], still_renamed)
+                    if os.path.exists(backup):
+                        os.replace(backup, target)
+                    if os.path.exists(temp):
+                        os.remove(temp)
+                elif os.path.exists(operation["dst"]) and not os.path.exists(operation["src"]):
+                    try:
+                        os.rename(operation["dst"], operation["src"])
+                    except OSError:
+                        still_renamed.insert(0, operation)
+                        raise
+                    print(f"↺ Restored: {operation['dst']} → {operation['src']}")
+            except OSError as e:
+                failures.append(f"{operation.get('target', operation.get('dst'))}: {e}")
+        if failures:
+            for failure in failures:
+                print(f"\033[91m✗ Could not roll back {failure}\033[0m")
+            print(f"\033[93m⚠ Journal kept in {self.JOURNAL_FILE}, run the renamer again to retry\033[0m")
+            return False
+        if os.path.exists(self.JOURNAL_FILE):
+            os.remove(self.JOURNAL_FILE)
+        return True
+
+    @classmethod
+    def remove_orphaned_temps(cls):
+        """Remove temp files of a run that crashed while staging (before a journal existed)."""
+        matcher = pathmatcher.PathMatcher([f"**/*{cls.TEMP_SUFFIX}"], ["build/", ".git/"])
+        for temp_file in matcher.files("."):
+            os.remove(temp_file)
+            print(f"\033[93m⚠ Removed leftover temp file: {os.path.normpath(temp_file)}\033[0m")
+
+    @classmethod
+    def recover(cls):
+        """Roll back a rename that was interrupted during a previous run and clean up its temp files."""
+        recovered = True
+        if os.path.exists(cls.JOURNAL_FILE):
+            with open(cls.JOURNAL_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            journal = cls()
+            journal.operations = data.get("operations", [])
+            print("\033[93m⚠ Found journal of an interrupted rename, rolling back\033[0m")
+            recovered = journal.rollback()
+        if recovered:
+            cls.remove_orphaned_temps()
+        return recovered
+
 def rename_project(old_lib_name, new_lib_name, old_standalone_name, new_standalone_name):
     # Add validation at the start of the function
     if not check_forbidden_words(new_lib_name):
@@ -71,6 +218,7 @@ def rename_project(old_lib_name, new_lib_name, old_standalone_name, new_standalo
         f"{standalone_dir}/{source_dir}/AppCore.hpp",
         f"{standalone_dir}/{test_dir}/CMakeLists.txt",
         f"{standalone_dir}/{test_dir}/LibTester.cpp",
+        f"{standalone_dir}/benchmarks/LibBench.cpp",
         f"{include_dir}/{old_lib_name}/{old_lib_name}.hpp",
         f"{source_dir}/{old_lib_name}.cpp",
         f"{source_dir}/Logger/Logger.hpp",
@@ -85,51 +233,68 @@ def rename_project(old_lib_name, new_lib_name, old_standalone_name, new_standalo
     ]
         # f"{source_dir}/Logger/Logger.hpp", will soon replaced by dynamic name in Logger.hpp
 
-    # 1. FIRST: Update content in files (before renaming paths)
-    print("=== Updating file contents ===")
-    for file in files:
-        if os.path.isfile(file):
-            with codecs.open(file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Replace all variants using regex with word boundaries for safer replacement
-            # Order matters - do longer strings first to avoid partial matches
-            patterns = [
-                (r'\b' + re.escape(old_standalone_name_upper) + r'\b', new_standalone_name_upper),
-                (r'\b' + re.escape(old_standalone_name_lower) + r'\b', new_standalone_name_lower),
-                (r'\b' + re.escape(old_standalone_name) + r'\b', new_standalone_name),
-                # Special pattern for constants with underscores (must come before general lib name patterns)
-                (re.escape(old_lib_name_upper) + r'_(\w+)', new_lib_name_upper + r'_\1'),
-                (r'\b' + re.escape(old_lib_name_upper) + r'\b', new_lib_name_upper),
-                (r'\b' + re.escape(old_lib_name_lower) + r'\b', new_lib_name_lower),
-                (r'\b' + re.escape(old_lib_name) + r'\b', new_lib_name),
-            ]
-            
-            for pattern, replacement in patterns:
-                content = re.sub(pattern, replacement, content)
-            
-            with codecs.open(file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✓ Updated content in: {file}")
-        else:
-            print(f"\033[93m⚠ Skipping (not found): {file}\033[0m")
-
-    # 2. SECOND: Rename individual files (but NOT directories yet)
-    print("\n=== Renaming files ===")
-    if os.path.isfile(f"{source_dir}/{old_lib_name}.cpp"):
-        os.rename(f"{source_dir}/{old_lib_name}.cpp", f"{source_dir}/{new_lib_name}.cpp")
-        print(f"✓ Renamed: {source_dir}/{old_lib_name}.cpp → {source_dir}/{new_lib_name}.cpp")
-
-    if os.path.isfile(f"{include_dir}/{old_lib_name}/{old_lib_name}.hpp"):
-        os.rename(f"{include_dir}/{old_lib_name}/{old_lib_name}.hpp", 
-                  f"{include_dir}/{old_lib_name}/{new_lib_name}.hpp")
-        print(f"✓ Renamed: {include_dir}/{old_lib_name}/{old_lib_name}.hpp → {include_dir}/{old_lib_name}/{new_lib_name}.hpp")
-
-    # 3. LAST: Rename directories
-    print("\n=== Renaming directories ===")
-    if os.path.isdir(f"{include_dir}/{old_lib_name}"):
-        os.rename(f"{include_dir}/{old_lib_name}", f"{include_dir}/{new_lib_name}")
-        print(f"✓ Renamed: {include_dir}/{old_lib_name} → {include_dir}/{new_lib_name}")
+    # Replace all variants using regex with word boundaries for safer replacement
+    # Order matters - do longer strings first to avoid partial matches
+    patterns = [
+        (r'\b' + re.escape(old_standalone_name_upper) + r'\b', new_standalone_name_upper),
+        (r'\b' + re.escape(old_standalone_name_lower) + r'\b', new_standalone_name_lower),
+        (r'\b' + re.escape(old_standalone_name) + r'\b', new_standalone_name),
+        # Special pattern for constants with underscores (must come before general lib name patterns)
+        (re.escape(old_lib_name_upper) + r'_(\w+)', new_lib_name_upper + r'_\1'),
+        (r'\b' + re.escape(old_lib_name_upper) + r'\b', new_lib_name_upper),
+        (r'\b' + re.escape(old_lib_name_lower) + r'\b', new_lib_name_lower),
+        (r'\b' + re.escape(old_lib_name) + r'\b', new_lib_name),
+    ]
+    patterns = [(re.compile(pattern), replacement) for pattern, replacement in patterns]
+
+    # Roll back leftovers of an interrupted run before touching the tree again
+    if not RenameJournal.recover():
+        sys.exit(1)
+
+    journal = RenameJournal()
+    try:
+        # 1. FIRST: Stage new file contents into temp files (nothing in the tree is touched yet)
+        print("=== Staging file contents ===")
+        for file in files:
+            if os.path.isfile(file):
+                with codecs.open(file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+                new_content = content
+                for pattern, replacement in patterns:
+                    new_content = pattern.sub(replacement, new_content)
+
+                if new_content == content:
+                    # Do not rewrite unchanged files - mtime bumps trigger full CMake rebuilds
+                    print(f"= Unchanged: {file}")
+                    continue
+
+                journal.stage_write(file, new_content)
+                print(f"✓ Staged content for: {file}")
+            else:
+                print(f"\033[93m⚠ Skipping (not found): {file}\033[0m")
+
+        # 2. SECOND: Plan file renames (but NOT directories yet)
+        if old_lib_name != new_lib_name:
+            if os.path.isfile(f"{source_dir}/{old_lib_name}.cpp"):
+                journal.stage_rename(f"{source_dir}/{old_lib_name}.cpp", f"{source_dir}/{new_lib_name}.cpp")
+
+            if os.path.isfile(f"{include_dir}/{old_lib_name}/{old_lib_name}.hpp"):
+                journal.stage_rename(f"{include_dir}/{old_lib_name}/{old_lib_name}.hpp",
+                                     f"{include_dir}/{old_lib_name}/{new_lib_name}.hpp")
+
+            # 3. LAST: Plan directory renames
+            if os.path.isdir(f"{include_dir}/{old_lib_name}"):
+                journal.stage_rename(f"{include_dir}/{old_lib_name}", f"{include_dir}/{new_lib_name}")
+
+        # 4. Commit everything in one fast phase
+        print("\n=== Committing changes ===")
+        journal.commit()
+    except (IOError, OSError) as e:
+        print(f"\033[91m✗ Rename failed: {e}\033[0m")
+        if journal.rollback():
+            print("\033[93m↺ All changes have been rolled back\033[0m")
+        sys.exit(1)
 
     print("\n\033[92m🎉 Project renaming completed successfully!\033[0m")
 
@@ -9,6 +9,8 @@ import logging
 import hashlib
 from dateutil import parser as date_parser
 
+import pathmatcher
+
 # MIT License
 # Copyright (c) 2024-2025 Tomáš Mark
 
@@ -22,6 +24,19 @@ logging.basicConfig(
 repo_url = "https://raw.githubusercontent.com/tomasmark79/DotNameCpp/main/"
 token = os.environ.get("GITHUB_TOKEN", "")  # Set this environment variable with your token
 
+# Template paths that are never upgraded, compiled once (gitignore-style, see pathmatcher.py)
+upgrade_excludes = pathmatcher.PathMatcher(excludes=[
+    '.git/',
+    'build/',
+    'dotnamebackup/',
+    '__pycache__/',
+    '.pytest_cache/',
+    'doc/html/',
+    'doc/latex/',
+    '.vscode/ipch/',
+    'build_*/build/'
+])
+
 def check_write_permissions(path):
     """Check if we have write permissions for the file path or its parent directory."""
     dir_path = os.path.dirname(path) or '.'
@@ -192,31 +207,9 @@ def get_all_files_from_repo():
         files = []
         
         # Filter only files (not directories) and exclude certain patterns
-        exclude_patterns = [
-            '.git/',
-            'build/',
-            'dotnamebackup/',
-            '__pycache__/',
-            '.pytest_cache/',
-            'doc/html/',
-            'doc/latex/',
-            '.vscode/ipch/',
-            'build_*/build'
-        ]
-        
         for item in data.get('tree', []):
-            if item['type'] == 'blob':  # blob = file, tree = directory
-                file_path = item['path']
-                
-                # Skip files matching exclude patterns
-                should_exclude = False
-                for pattern in exclude_patterns:
-                    if pattern in file_path:
-                        should_exclude = True
-                        break
-                
-                if not should_exclude:
-                    files.append(file_path)
+            if item['type'] == 'blob' and not upgrade_excludes.excluded(item['path']):  # blob = file
+                files.append(item['path'])
         
         logging.info(f"Found {len(files)} files in repository")
         return files
@@ -0,0 +1,316 @@
+"""
+Content-addressed cache of build artifacts (install trees, release tarballs).
+
+An entry is stored under a key that hashes everything its artifact depends on
+(source tree digest, conan lock, preset, build type, ...). Files are stored
+once by content hash, so identical files of different entries share storage:
+
+    <root>/objects/ab/abcdef...[.x]     file contents (.x = executable)
+    <root>/entries/<key>.json           manifest: relative path -> object, size, last use
+
+A hit restores the files by hardlink (copy across filesystems) instead of
+rebuilding. Entries are evicted least recently used first once the objects
+exceed the size limit; unreferenced objects are only deleted after a grace
+period, so concurrent store() calls of processes sharing the cache are safe. The root defaults to ~/.cache/dotname-artifacts
+(DOTNAME_ARTIFACT_CACHE); pointing it at a shared directory shares the cache
+between checkouts, branches and machines.
+
+Restored files are hardlinks into the cache - call detach() on a directory
+before a tool rewrites files in place, so the cached objects stay intact.
+
+Usage:
+    python artifactcache.py [stats|evict|clear]
+"""
+import os
+import sys
+import json
+import re
+import stat
+import time
+import shutil
+import hashlib
+import tempfile
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+DEFAULT_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "dotname-artifacts")
+DEFAULT_MAX_SIZE_MB = 2048
+CACHE_FORMAT_VERSION = 1
+
+# Workspace inputs of a build (directories are walked, missing entries skipped)
+SOURCE_INPUTS = ("CMakeLists.txt", "cmake", "include", "src", "standalone", "assets", "conanfile.py",
+                 "conan.lock")
+
+# CMakeCache.txt entries that change the build outputs (project options, flags); paths are left
+# out so checkouts in different directories still share entries
+CMAKE_OPTION_PATTERN = re.compile(r"^(?:(?:ENABLE|SANITIZE|USE|BUILD)_\w+|CMAKE_(?:C|CXX)_FLAGS(?:_\w+)?"
+                                  r"|CMAKE_(?:EXE|SHARED|MODULE|STATIC)_LINKER_FLAGS(?:_\w+)?"
+                                  r"|CMAKE_(?:C|CXX)_STANDARD|CMAKE_INTERPROCEDURAL_OPTIMIZATION)$")
+
+# Unreferenced objects younger than this may belong to a store() still in progress in
+# another process sharing the cache directory, so evict() keeps them
+OBJECT_GRACE_SECONDS = 3600
+
+
+def file_sha256(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _walk_files(directory):
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for name in sorted(filenames):
+            yield os.path.join(dirpath, name)
+
+
+def tree_digest(base, paths=None):
+    """sha256 over the relative paths, executable bits and contents of files under base"""
+    hasher = hashlib.sha256()
+    for path in (paths if paths is not None else ["."]):
+        full = os.path.normpath(os.path.join(base, path))
+        files = [full] if os.path.isfile(full) else list(_walk_files(full)) if os.path.isdir(full) else []
+        for file in files:
+            relative = os.path.relpath(file, base).replace(os.sep, "/")
+            executable = os.stat(file).st_mode & stat.S_IXUSR
+            hasher.update(f"{relative}\0{'x' if executable else '-'}\0{file_sha256(file)}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def cmake_options(build_dir):
+    """{name: value} of the CMakeCache.txt entries matching CMAKE_OPTION_PATTERN"""
+    options = {}
+    try:
+        with open(os.path.join(build_dir, "CMakeCache.txt"), "r", encoding="utf-8") as f:
+            for line in f:
+                name, separator, value = line.rstrip("\n").partition("=")
+                name, _, kind = name.partition(":")
+                if separator and kind != "INTERNAL" and CMAKE_OPTION_PATTERN.match(name):
+                    options[name] = value
+    except OSError:
+        pass
+    return options
+
+
+def make_key(**fields):
+    """Cache key of an artifact: sha256 of its sorted input fields"""
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _touch_ctime(path):
+    """Bump the inode change time (the eviction grace clock) without changing the file times"""
+    try:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        pass
+
+
+def _link_or_copy(source, destination):
+    if os.path.lexists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def detach(directory):
+    """Remove files under directory that are hardlinked elsewhere (e.g. into the cache)"""
+    removed = 0
+    if os.path.isdir(directory):
+        for file in _walk_files(directory):
+            if not os.path.islink(file) and os.stat(file).st_nlink > 1:
+                os.remove(file)
+                removed += 1
+    return removed
+
+
+class ArtifactCache:
+    def __init__(self, root=None, max_size_mb=None):
+        self.root = root or os.environ.get("DOTNAME_ARTIFACT_CACHE") or DEFAULT_ROOT
+        if max_size_mb is None:
+            max_size_mb = float(os.environ.get("DOTNAME_ARTIFACT_CACHE_MAX_MB", DEFAULT_MAX_SIZE_MB))
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.entries_dir = os.path.join(self.root, "entries")
+
+    def _object_path(self, digest, executable):
+        return os.path.join(self.objects_dir, digest[:2], digest + (".x" if executable else ""))
+
+    def _entry_path(self, key):
+        return os.path.join(self.entries_dir, f"{key}.json")
+
+    def _load_entry(self, key):
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry if entry.get("version") == CACHE_FORMAT_VERSION else None
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _save_entry(self, entry):
+        _write_atomic(self._entry_path(entry["key"]), json.dumps(entry, indent=1).encode("utf-8"))
+
+    # ------------------------------------------------------------------------
+    # Store / restore
+    # ------------------------------------------------------------------------
+
+    def store(self, key, base, files, meta=None):
+        """
+        Store files (paths relative to base) under key.
+
+        Returns:
+            int: bytes added to the object store (already stored contents are shared)
+        """
+        added = 0
+        manifest = []
+        for relative in sorted(set(files)):
+            source = os.path.join(base, relative)
+            if not os.path.isfile(source):
+                continue
+            digest = file_sha256(source)
+            executable = bool(os.stat(source).st_mode & stat.S_IXUSR)
+            target = self._object_path(digest, executable)
+            if not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                temporary = f"{target}.tmp-{os.getpid()}"
+                shutil.copy2(source, temporary)
+                os.replace(temporary, target)
+                added += os.path.getsize(target)
+            else:
+                _touch_ctime(target)
+            manifest.append([relative.replace(os.sep, "/"), digest, executable, os.path.getsize(target)])
+        now = time.time()
+        self._save_entry({"version": CACHE_FORMAT_VERSION, "key": key, "meta": meta or {}, "files": manifest,
+                          "created": now, "last_used": now})
+        self.evict()
+        return added
+
+    def restore(self, key, base):
+        """
+        Hardlink the files of key into base.
+
+        Returns:
+            list: restored relative paths, None on a miss (or an incomplete entry)
+        """
+        entry = self._load_entry(key)
+        if entry is None:
+            return None
+        objects = [(relative, self._object_path(digest, executable))
+                   for relative, digest, executable, _ in entry["files"]]
+        if not all(os.path.exists(path) for _, path in objects):
+            os.remove(self._entry_path(key))
+            return None
+        for relative, path in objects:
+            destination = os.path.join(base, relative)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            _link_or_copy(path, destination)
+        entry["last_used"] = time.time()
+        self._save_entry(entry)
+        return [relative for relative, _ in objects]
+
+    # ------------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------------
+
+    def entries(self):
+        if not os.path.isdir(self.entries_dir):
+            return []
+        loaded = (self._load_entry(name[:-len(".json")]) for name in os.listdir(self.entries_dir)
+                  if name.endswith(".json"))
+        return [entry for entry in loaded if entry is not None]
+
+    def _objects(self, temporary=False):
+        """{object path: os.stat_result} (partially written .tmp- files with temporary=True)"""
+        found = {}
+        if os.path.isdir(self.objects_dir):
+            for path in _walk_files(self.objects_dir):
+                if (".tmp-" in os.path.basename(path)) == temporary:
+                    found[path] = os.stat(path)
+        return found
+
+    def evict(self, max_size=None):
+        """
+        Drop least recently used entries until the referenced objects fit in
+        max_size, then delete unreferenced objects that were not written or
+        reused within OBJECT_GRACE_SECONDS (inode change time) - another process
+        may be storing an entry that references them.
+
+        Returns:
+            tuple: (entries evicted, bytes freed)
+        """
+        max_size = self.max_size if max_size is None else max_size
+        entries = sorted(self.entries(), key=lambda e: e["last_used"])
+        references = {}
+        total = 0
+        for entry in entries:
+            for _, digest, executable, size in entry["files"]:
+                path = self._object_path(digest, executable)
+                if path not in references:
+                    references[path] = 0
+                    total += size
+                references[path] += 1
+
+        evicted = 0
+        for entry in entries:
+            if total <= max_size:
+                break
+            for _, digest, executable, size in entry["files"]:
+                path = self._object_path(digest, executable)
+                references[path] -= 1
+                if references[path] == 0:
+                    total -= size
+            os.remove(self._entry_path(entry["key"]))
+            evicted += 1
+
+        freed = 0
+        cutoff = time.time() - OBJECT_GRACE_SECONDS
+        objects = self._objects()
+        objects.update(self._objects(temporary=True))
+        for path, st in objects.items():
+            if references.get(path, 0) == 0 and st.st_ctime < cutoff:
+                try:
+                    os.remove(path)
+                    freed += st.st_size
+                except FileNotFoundError:
+                    pass  # removed by a concurrent evict()
+        return evicted, freed
+
+    def stats(self):
+        entries = self.entries()
+        objects = self._objects()
+        return {"root": self.root, "entries": len(entries), "objects": len(objects),
+                "size": sum(st.st_size for st in objects.values()), "max_size": self.max_size}
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    cache = ArtifactCache()
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    if command == "evict":
+        evicted, freed = cache.evict()
+        print(f"Evicted {evicted} entries, freed {freed / 1024 / 1024:.1f} MB")
+    elif command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.root}")
+    elif command == "stats":
+        info = cache.stats()
+        print(f"{info['root']}: {info['entries']} entries, {info['objects']} objects, "
+              f"{info['size'] / 1024 / 1024:.1f} / {info['max_size'] / 1024 / 1024:.0f} MB")
+    else:
+        print("Usage: python artifactcache.py [stats|evict|clear]")
+        sys.exit(1)
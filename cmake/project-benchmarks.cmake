@@ -0,0 +1,22 @@
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+cmake_minimum_required(VERSION 3.31 FATAL_ERROR)
+
+# ==============================================================================
+# BENCHMARK-SPECIFIC CONFIGURATION
+# Run through SolutionController.py "⏱️ Run Benchmarks" (emojibench.py)
+# ==============================================================================
+include(${CMAKE_CURRENT_LIST_DIR}/project-common.cmake)
+
+project(${BENCH_NAME} LANGUAGES CXX)
+
+# configure the benchmark executable
+add_executable(${BENCH_NAME} ${CMAKE_CURRENT_SOURCE_DIR}/LibBench.cpp)
+target_link_libraries(${BENCH_NAME} PRIVATE ${LIBRARY_NAME})
+set_target_properties(${BENCH_NAME} PROPERTIES OUTPUT_NAME "${BENCH_NAME}")
+
+# ==============================================================================
+# Set target properties
+# ==============================================================================
+include(${CMAKE_CURRENT_LIST_DIR}/tmplt-debug.cmake)
+apply_debug_info_control(${BENCH_NAME})
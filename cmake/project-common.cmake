@@ -34,11 +34,15 @@ set(TEST_NAME ${LIBRARY_NAME}Tester)
 string(TOLOWER "${TEST_NAME}" TEST_NAME_LOWER)
 set(TEST_NAMESPACE dotname)
 
+# Benchmark names and attributes
+set(BENCH_NAME ${LIBRARY_NAME}Bench)
+
 # ==============================================================================
 # Common build options
 # ==============================================================================
 
 option(ENABLE_GTESTS "Build and run unit tests" ON)
+option(ENABLE_BENCHMARKS "Build benchmark executables" ON)
 option(ENABLE_CCACHE "Use ccache compiler cache" ON)
 option(BUILD_SHARED_LIBS "Build shared (.so) libraries" OFF)
 option(USE_STATIC_RUNTIME "Link C++ runtime statically" OFF)
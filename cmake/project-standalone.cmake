@@ -75,6 +75,14 @@ if(ENABLE_GTESTS)
     add_subdirectory(${CMAKE_CURRENT_SOURCE_DIR}/standalone/tests tests)
 endif()
 
+# ==============================================================================
+# Benchmarks configuration
+# ==============================================================================
+if(ENABLE_BENCHMARKS AND NOT DOTNAME_CROSSCOMPILING)
+    message(STATUS "Benchmarks enabled")
+    add_subdirectory(${CMAKE_CURRENT_SOURCE_DIR}/standalone/benchmarks benchmarks)
+endif()
+
 # ==============================================================================
 # Installation
 # ==============================================================================
@@ -5,10 +5,119 @@ This module combines all conan_tools functionality into a single file.
 import os
 import json
 import re
+import hashlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from conan.errors import ConanException
 from conan.tools.cmake import CMakeToolchain
 
 
+# Compile regex pattern once for better performance
+# This pattern matches SYSTEM_LIBS variables and removes stdc++ from them
+SYSTEM_LIBS_PATTERN = re.compile(
+    r'(set\([^_]*_SYSTEM_LIBS(?:_[A-Z]+)?\s+[^)]*?)'
+    r'stdc\+\+([^)]*\))',
+    re.MULTILINE
+)
+STDCPP_MARKER = b"stdc++"
+
+
+def _detect_build_target(working_dir_path):
+    """Detect build target (lib/app) from working directory path"""
+    if "library" in working_dir_path:
+        return "lib"
+    if "standalone" in working_dir_path:
+        return "app"
+    return "generic"
+
+
+class SettingsSnapshot:
+    """
+    Immutable snapshot of the recipe settings and options.
+    
+    Computed once per recipe invocation (see SettingsSnapshot.of()) and shared
+    by all ConanTools operations, so preset names and hashes are derived from
+    a single, consistent view of the configuration.
+    """
+    
+    SNAPSHOT_FILE = "conan_settings_snapshot.json"
+    
+    def __init__(self, conan_instance, working_dir=None):
+        settings = conan_instance.settings
+        self.build_target = _detect_build_target(working_dir or os.getcwd())
+        self.os = str(settings.os)
+        self.arch = str(settings.arch)
+        self.compiler = str(settings.compiler)
+        self.compiler_version = str(settings.compiler.version)
+        self.build_type = str(settings.build_type)
+        self.settings = self._collect(settings)
+        self.options = self._collect(getattr(conan_instance, "options", None))
+        
+        # Create descriptive name: target-os-arch-compiler-version-buildtype
+        self.preset_name = (f"{self.build_target}-"
+                            f"{self.os.lower()}-"
+                            f"{self.arch}-"
+                            f"{self.compiler}-"
+                            f"{self.compiler_version}-"
+                            f"{self.build_type.lower()}")
+        
+        # Hash of the full settings/options set - stable across runs and machines.
+        # None when they could not be read: caches must not key off an incomplete view
+        self.settings_hash = None
+        if self.settings is not None and self.options is not None:
+            canonical = json.dumps({"settings": self.settings, "options": self.options},
+                                   sort_keys=True, separators=(",", ":"))
+            self.settings_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _collect(values):
+        """Flatten Conan settings/options into a plain {name: value} dict, None if unreadable"""
+        if values is None or not hasattr(values, "items"):
+            return {}
+        try:
+            return {str(name): str(value) for name, value in values.items()
+                    if value is not None}
+        except ConanException:
+            return None
+    
+    @classmethod
+    def of(cls, conan_instance):
+        """Return the snapshot for this recipe invocation, computing it on first use"""
+        snapshot = getattr(conan_instance, "_dotname_settings_snapshot", None)
+        if snapshot is None:
+            snapshot = cls(conan_instance)
+            conan_instance._dotname_settings_snapshot = snapshot
+        return snapshot
+    
+    @property
+    def short_hash(self):
+        return self.settings_hash[:12] if self.settings_hash else "unavailable"
+    
+    def to_dict(self):
+        return {
+            "preset_name": self.preset_name,
+            "settings_hash": self.settings_hash,
+            "settings": self.settings,
+            "options": self.options,
+        }
+    
+    def write(self, folder):
+        """Persist the snapshot next to the toolchain (only when it changed)"""
+        path = os.path.join(folder, self.SNAPSHOT_FILE)
+        content = json.dumps(self.to_dict(), indent=4, sort_keys=True) + "\n"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    return path
+        except (IOError, OSError):
+            pass
+        ConanTools._write_atomic(path, content)
+        return path
+
+
+
 class ConanTools:
     """
     Unified class containing all Conan utilities for the DotName project.
@@ -17,6 +126,16 @@ class ConanTools:
     def __init__(self, conan_instance):
         """Initialize with Conan instance for access to settings and output"""
         self.conan = conan_instance
+        self.snapshot = SettingsSnapshot.of(conan_instance)
+    
+    @classmethod
+    def of(cls, conan_instance):
+        """Return the ConanTools shared by all helpers of this recipe invocation"""
+        tools = getattr(conan_instance, "_dotname_conan_tools", None)
+        if tools is None:
+            tools = cls(conan_instance)
+            conan_instance._dotname_conan_tools = tools
+        return tools
     
     # ========================================================================
     # Main generator functions
@@ -33,16 +152,20 @@ class ConanTools:
         tc.variables["CMAKE_BUILD_TYPE"] = str(self.conan.settings.build_type)
         
         # Customize preset name to avoid conflicts
-        preset_name = self._generate_unique_preset_name()
+        preset_name = self.snapshot.preset_name
         tc.presets_prefix = ""
         tc.presets_build_type_suffix = ""
         tc.preset_name = preset_name
         tc.user_presets_path = "CMakeUserPresets.json"
         self.conan.output.info(f"Setting custom preset name: {preset_name}")
+        self.conan.output.info(f"Settings hash: {self.snapshot.short_hash}")
         
         # Generate the toolchain
         tc.generate()
         
+        # Expose the snapshot so build dirs and caches can key off the settings hash
+        self.snapshot.write(getattr(self.conan, 'generators_folder', None) or ".")
+        
         return preset_name
     
     def apply_cmake_post_processing(self):
@@ -76,7 +199,9 @@ class ConanTools:
         Dynamic change of names in CMakePresets.json to avoid name conflicts
         
         This method generates unique preset names based on current Conan settings
-        to prevent conflicts when using multiple build configurations.
+        to prevent conflicts when using multiple build configurations. Presets of
+        other build types already present in the file are kept (merged), and the
+        file is only rewritten - atomically - when its content actually changes.
         
         Args:
             working_dir: Working directory path to detect build type
@@ -90,21 +215,24 @@ class ConanTools:
             self.conan.output.info(f"Reading preset file: {os.path.abspath(preset_file)}")
             # Read existing presets
             with open(preset_file, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                if not content:
-                    self.conan.output.warn(f"Preset file {preset_file} is empty, skipping preset updates")
-                    return
-                data = json.loads(content)
+                original = f.read()
+            if not original.strip():
+                self.conan.output.warn(f"Preset file {preset_file} is empty, skipping preset updates")
+                return
+            data = json.loads(original)
                 
             # Generate unique preset name based on current settings and build type
             preset_name = self._generate_preset_name(working_dir or "")
             
             # Update all preset types with the new name
             self._update_all_presets(data, preset_name)
-                        
-            # Write updated presets back to file
-            with open(preset_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            
+            # Write updated presets back to file only when something changed
+            content = json.dumps(data, indent=4) + "\n"
+            if content == original:
+                self.conan.output.info(f"CMake presets already up to date: {preset_name}")
+                return
+            self._write_atomic(preset_file, content)
                 
             self.conan.output.info(f"Updated CMake presets with name: {preset_name}")
                 
@@ -113,33 +241,70 @@ class ConanTools:
     
     def _generate_preset_name(self, working_dir_path=""):
         """Generate preset name based on Conan settings and build type"""
-        # Detect build type from working directory path
-        build_target = "generic"
-        if "library" in working_dir_path:
-            build_target = "lib"
-        elif "standalone" in working_dir_path:
-            build_target = "app"
-        
-        # Create descriptive name: target-os-arch-compiler-version-buildtype
-        return (f"{build_target}-"
-               f"{str(self.conan.settings.os).lower()}-"
-               f"{self.conan.settings.arch}-"
-               f"{str(self.conan.settings.compiler)}-"
-               f"{self.conan.settings.compiler.version}-"
-               f"{str(self.conan.settings.build_type).lower()}")
+        if _detect_build_target(working_dir_path) == self.snapshot.build_target:
+            return self.snapshot.preset_name
+        return SettingsSnapshot(self.conan, working_dir_path).preset_name
     
     def _update_all_presets(self, data, preset_name):
-        """Update all preset types with the new name"""
-        # Process each preset type (configure, build, test)
+        """
+        Rename presets generated by Conan and merge them with presets of other
+        build types that are already in the file.
+        
+        Presets already following our naming scheme are left untouched; a preset
+        regenerated for the same build type replaces the previous one in place.
+        """
+        build_type_suffix = f"-{self.snapshot.build_type.lower()}"
+        prefix = preset_name[:-len(build_type_suffix)] if preset_name.endswith(build_type_suffix) else preset_name
+        
+        def name_for(preset):
+            build_type = (preset.get("configuration")
+                          or preset.get("cacheVariables", {}).get("CMAKE_BUILD_TYPE"))
+            if isinstance(build_type, dict):
+                build_type = build_type.get("value")
+            if not build_type or prefix == preset_name:
+                return preset_name
+            return f"{prefix}-{str(build_type).lower()}"
+        
+        def is_ours(name):
+            return name == preset_name or name.startswith(f"{prefix}-")
+        
+        # Configure presets first, so build/test presets can follow their renames
+        renamed_configure = {}
         for preset_type in ["configurePresets", "buildPresets", "testPresets"]:
+            merged = {}
             for preset in data.get(preset_type, []):
-                # Update name and display name
-                preset["name"] = preset_name
-                if "displayName" in preset:
-                    preset["displayName"] = preset_name
+                old_name = preset.get("name", "")
+                if not is_ours(old_name):
+                    # Update name and display name
+                    new_name = name_for(preset)
+                    preset["name"] = new_name
+                    if "displayName" in preset:
+                        preset["displayName"] = new_name
+                    if preset_type == "configurePresets":
+                        renamed_configure[old_name] = new_name
                 # Update reference to configure preset for build/test presets
-                if "configurePreset" in preset:
-                    preset["configurePreset"] = preset_name
+                if "configurePreset" in preset and not is_ours(preset["configurePreset"]):
+                    preset["configurePreset"] = renamed_configure.get(preset["configurePreset"], preset_name)
+                # Later (freshly generated) presets win, first position is kept
+                merged[preset["name"]] = preset
+            if preset_type in data:
+                data[preset_type] = list(merged.values())
+    
+    @staticmethod
+    def _write_atomic(path, content):
+        """Write file via temp file + rename so readers never see a partial file"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(path), dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            if os.path.exists(path):
+                shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
     
     # ========================================================================
     # CMake file patching utilities
@@ -166,60 +331,65 @@ class ConanTools:
             self.conan.output.info(f"Successfully patched {patched_count} CMake files")
     
     def _find_cmake_data_files(self, generators_path):
-        """Find all *-data.cmake files"""
-        cmake_files = list(generators_path.glob("*-data.cmake"))
-        cmake_files.extend(generators_path.glob("*-*-*-data.cmake"))
-        return list(set(cmake_files))  # Remove duplicates
+        """Find all *-data.cmake files with a single directory scan"""
+        try:
+            with os.scandir(generators_path) as entries:
+                return [Path(entry.path) for entry in entries
+                        if entry.name.endswith("-data.cmake") and entry.is_file()]
+        except OSError:
+            return []
     
     def _patch_files(self, cmake_files):
-        """Patch the found CMake files to remove stdc++"""
-        # Compile regex pattern once for better performance
-        # This pattern matches SYSTEM_LIBS variables and removes stdc++ from them
-        system_libs_pattern = re.compile(
-            r'(set\([^_]*_SYSTEM_LIBS(?:_[A-Z]+)?\s+[^)]*?)'
-            r'stdc\+\+([^)]*\))', 
-            re.MULTILINE
-        )
+        """Patch the found CMake files to remove stdc++ (in parallel)"""
+        # Large dependency graphs produce hundreds of data files; the work is IO bound
+        max_workers = min(32, (os.cpu_count() or 1) + 4, len(cmake_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._patch_file, cmake_files))
         
+        # Report from the calling thread to keep Conan output ordered
         patched_count = 0
-        for cmake_file in cmake_files:
-            try:
-                content = cmake_file.read_text(encoding='utf-8')
-                
-                # Replace all occurrences of stdc++ in SYSTEM_LIBS
-                modified_content = system_libs_pattern.sub(r'\1\2', content)
-                
-                if modified_content != content:
-                    cmake_file.write_text(modified_content, encoding='utf-8')
-                    self.conan.output.info(f"Patched {cmake_file.name} - removed stdc++ from SYSTEM_LIBS")
-                    patched_count += 1
-                    
-            except (IOError, OSError) as e:
-                self.conan.output.warn(f"Could not patch {cmake_file}: {e}")
+        for cmake_file, (patched, error) in zip(cmake_files, results):
+            if error is not None:
+                self.conan.output.warn(f"Could not patch {cmake_file}: {error}")
+            elif patched:
+                self.conan.output.info(f"Patched {cmake_file.name} - removed stdc++ from SYSTEM_LIBS")
+                patched_count += 1
         
         return patched_count
     
+    def _patch_file(self, cmake_file):
+        """
+        Patch a single CMake file.
+        
+        Returns:
+            tuple: (patched, error) - error is None on success
+        """
+        try:
+            raw = cmake_file.read_bytes()
+            # Cheap pre-filter: most data files never mention stdc++
+            if STDCPP_MARKER not in raw:
+                return False, None
+            
+            content = raw.decode('utf-8')
+            # Replace all occurrences of stdc++ in SYSTEM_LIBS
+            modified_content = SYSTEM_LIBS_PATTERN.sub(r'\1\2', content)
+            
+            if modified_content == content:
+                return False, None
+            
+            cmake_file.write_bytes(modified_content.encode('utf-8'))
+            return True, None
+            
+        except (IOError, OSError, UnicodeDecodeError) as e:
+            return False, e
+    
     # ========================================================================
     # Helper methods
     # ========================================================================
     
     def _generate_unique_preset_name(self):
         """Generate unique preset name based on settings and build type"""
-        # Detect build type from working directory path
-        cwd = os.getcwd()
-        build_target = "generic"
-        if "library" in cwd:
-            build_target = "lib"
-        elif "standalone" in cwd:
-            build_target = "app"
-        
-        # Create descriptive name: target-os-arch-compiler-version-buildtype
-        return (f"{build_target}-"
-               f"{str(self.conan.settings.os).lower()}-"
-               f"{self.conan.settings.arch}-"
-               f"{str(self.conan.settings.compiler)}-"
-               f"{self.conan.settings.compiler.version}-"
-               f"{str(self.conan.settings.build_type).lower()}")
+        return self.snapshot.preset_name
 
 
 # ============================================================================
@@ -236,19 +406,19 @@ def generate_cmake_with_custom_presets(conan_instance):
     Returns:
         str: Generated preset name
     """
-    tools = ConanTools(conan_instance)
+    tools = ConanTools.of(conan_instance)
     return tools.generate_cmake_with_custom_presets()
 
 
 def apply_cmake_post_processing(conan_instance):
     """Apply post-processing to generated CMake files"""
-    tools = ConanTools(conan_instance)
+    tools = ConanTools.of(conan_instance)
     tools.apply_cmake_post_processing()
 
 
 def copy_additional_files(conan_instance):
     """Copy additional files from dependencies (customize as needed)"""
-    tools = ConanTools(conan_instance)
+    tools = ConanTools.of(conan_instance)
     tools.copy_additional_files()
 
 
@@ -256,7 +426,7 @@ def copy_additional_files(conan_instance):
 class CMakePresetsManager:
     """Legacy class - use ConanTools instead"""
     def __init__(self, conan_instance):
-        self._tools = ConanTools(conan_instance)
+        self._tools = ConanTools.of(conan_instance)
     
     def update_presets(self, working_dir=None):
         return self._tools.update_presets(working_dir)
@@ -265,7 +435,7 @@ class CMakePresetsManager:
 class CMakePatches:
     """Legacy class - use ConanTools instead"""
     def __init__(self, conan_instance):
-        self._tools = ConanTools(conan_instance)
+        self._tools = ConanTools.of(conan_instance)
     
     def remove_stdcpp_from_system_libs(self):
         return self._tools.remove_stdcpp_from_system_libs()
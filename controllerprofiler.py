@@ -0,0 +1,234 @@
+"""
+Opt-in profiling of SolutionController.py.
+
+Enabled by `--profile` anywhere on the controller command line (or
+DOTNAME_PROFILE=1). Every module level function of the controller is wrapped
+in a named span, every subprocess.run() call and every processrunner command
+is recorded as a child process lifetime, and the whole run is profiled with
+cProfile. On exit it writes to build/profile:
+
+    controller.pstats       cProfile data (python -m pstats, snakeviz, ...)
+    controller.trace.json   Chrome trace-event timeline (chrome://tracing, Perfetto)
+
+and prints a top-N summary of span self times, child processes and cProfile
+cumulative times. On Python 3.12+ the perf trampoline is activated as well, so
+`perf record` shows Python function names.
+"""
+import os
+import sys
+import json
+import time
+import types
+import atexit
+import cProfile
+import pstats
+import functools
+import threading
+import subprocess
+
+import processrunner
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+PROFILE_FLAG = "--profile"
+PROFILE_DIR = os.path.join("build", "profile")
+TOP_N = 15
+
+
+class Span:
+    __slots__ = ("name", "category", "start", "end", "tid", "args")
+
+    def __init__(self, name, category, start, end, tid, args=None):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end = end
+        self.tid = tid
+        self.args = args
+
+
+class ControllerProfiler:
+    """Span recorder + cProfile session of one controller run"""
+
+    def __init__(self, output_dir, top_n=TOP_N):
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.spans = []
+        self.children = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self._profile = cProfile.Profile()
+
+    # ------------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------------
+
+    def _record(self, spans, span):
+        with self._lock:
+            spans.append(span)
+
+    def span(self, name, category="controller"):
+        """Decorator recording every call of the function as a span"""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._record(self.spans, Span(name, category, start, time.perf_counter_ns(),
+                                                  threading.get_ident()))
+            return wrapper
+        return decorate
+
+    def instrument(self, namespace, module_name):
+        """Wrap the functions defined in module_name's namespace (in place)"""
+        for name, value in list(namespace.items()):
+            if isinstance(value, types.FunctionType) and value.__module__ == module_name:
+                namespace[name] = self.span(name)(value)
+
+    def patch_subprocess(self):
+        """Record the lifetime of every subprocess.run() and processrunner child"""
+        original = subprocess.run
+        profiler = self
+
+        @functools.wraps(original)
+        def run(*args, **kwargs):
+            start = time.perf_counter_ns()
+            result = None
+            try:
+                result = original(*args, **kwargs)
+                return result
+            finally:
+                cmd = args[0] if args else kwargs.get("args", "")
+                if not isinstance(cmd, str):
+                    cmd = " ".join(map(str, cmd))
+                returncode = getattr(result, "returncode", None)
+                profiler._record(profiler.children, Span(
+                    cmd.split()[0] if cmd.split() else "process", "child", start, time.perf_counter_ns(),
+                    threading.get_ident(), {"cmd": cmd, "returncode": returncode}))
+
+        subprocess.run = run
+
+        def started(command):
+            start = time.perf_counter_ns()
+            tid = threading.get_ident()
+
+            def finished(result):
+                profiler._record(profiler.children, Span(
+                    command.name, "child", start, time.perf_counter_ns(), tid,
+                    {"cmd": command.display(), "returncode": result.returncode, "status": result.status()}))
+            return finished
+
+        processrunner.add_hook(started)
+
+    def start(self):
+        if hasattr(sys, "activate_stack_trampoline"):
+            try:
+                sys.activate_stack_trampoline("perf")
+            except (ValueError, OSError):
+                pass  # not supported on this platform/build
+        self._profile.enable()
+        atexit.register(self.finish)
+
+    # ------------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------------
+
+    def _us(self, ns):
+        return (ns - self._origin) / 1000.0
+
+    def chrome_trace(self):
+        """Trace-event JSON: controller spans per thread, children on their own track"""
+        pid = os.getpid()
+        tids = {}
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "SolutionController"}}]
+        for span in self.spans:
+            tid = tids.setdefault(span.tid, len(tids) + 1)
+            events.append({"name": span.name, "cat": span.category, "ph": "X", "pid": pid, "tid": tid,
+                           "ts": self._us(span.start), "dur": (span.end - span.start) / 1000.0})
+        for i, child in enumerate(sorted(self.children, key=lambda c: c.start)):
+            # One track per child keeps concurrent processes (conan matrix) readable
+            tid = 1000 + i
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": f"child: {child.name}"}})
+            events.append({"name": child.name, "cat": "child", "ph": "X", "pid": pid, "tid": tid,
+                           "ts": self._us(child.start), "dur": (child.end - child.start) / 1000.0,
+                           "args": child.args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def span_self_times(self):
+        """{span name: (calls, total ms, self ms)} - self time excludes nested spans and children"""
+        stats = {}
+        per_thread = {}
+        for span in self.spans:
+            per_thread.setdefault(span.tid, []).append(span)
+        for tid, spans in per_thread.items():
+            intervals = sorted(spans + [c for c in self.children if c.tid == tid],
+                               key=lambda s: (s.start, -s.end))
+            for i, span in enumerate(intervals):
+                if span.category == "child":
+                    continue
+                nested = 0
+                covered_until = span.start
+                for inner in intervals[i + 1:]:
+                    if inner.start >= span.end:
+                        break
+                    if inner.start >= covered_until:
+                        nested += min(inner.end, span.end) - inner.start
+                        covered_until = inner.end
+                calls, total, own = stats.get(span.name, (0, 0.0, 0.0))
+                duration = (span.end - span.start) / 1e6
+                stats[span.name] = (calls + 1, total + duration, own + duration - nested / 1e6)
+        return stats
+
+    def summary_lines(self):
+        lines = [f"{'Span':<40}{'Calls':>7}{'Total ms':>12}{'Self ms':>12}"]
+        stats = sorted(self.span_self_times().items(), key=lambda item: -item[1][2])
+        for name, (calls, total, own) in stats[:self.top_n]:
+            lines.append(f"{name:<40}{calls:>7}{total:>12.1f}{own:>12.1f}")
+
+        children = sorted(self.children, key=lambda c: c.start - c.end)
+        if children:
+            child_total = sum(c.end - c.start for c in children) / 1e6
+            lines.append("")
+            lines.append(f"{'Child process':<72}{'ms':>10}")
+            for child in children[:self.top_n]:
+                cmd = child.args["cmd"]
+                cmd = cmd if len(cmd) <= 70 else cmd[:67] + "..."
+                lines.append(f"{cmd:<72}{(child.end - child.start) / 1e6:>10.1f}")
+            lines.append(f"{'(all child processes)':<72}{child_total:>10.1f}")
+        return lines
+
+    def finish(self):
+        self._profile.disable()
+        os.makedirs(self.output_dir, exist_ok=True)
+        pstats_file = os.path.join(self.output_dir, "controller.pstats")
+        trace_file = os.path.join(self.output_dir, "controller.trace.json")
+        self._profile.dump_stats(pstats_file)
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+        print("\n=== Controller profile ===")
+        print("\n".join(self.summary_lines()))
+        print(f"\nTop {self.top_n} functions by cumulative time (cProfile, main thread):")
+        pstats.Stats(pstats_file, stream=sys.stdout).strip_dirs().sort_stats("cumulative").print_stats(self.top_n)
+        print(f"Profile: {pstats_file}")
+        print(f"Trace:   {trace_file} (open in chrome://tracing or ui.perfetto.dev)")
+
+
+def from_argv(argv, workspace):
+    """
+    Remove --profile from argv (in place) and start a profiler when it was
+    given or DOTNAME_PROFILE=1 is set. Returns the profiler or None.
+    """
+    enabled = os.environ.get("DOTNAME_PROFILE", "0") == "1"
+    while PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+        enabled = True
+    if not enabled:
+        return None
+    profiler = ControllerProfiler(os.path.join(workspace, PROFILE_DIR))
+    profiler.patch_subprocess()
+    profiler.start()
+    return profiler
@@ -0,0 +1,288 @@
+"""
+CPU budget and GNU make jobserver for the controller.
+
+os.cpu_count() reports the host's CPUs, not what a container may use. The
+effective number of parallel jobs is the minimum of
+
+    - the CPUs in the scheduler affinity mask (os.sched_getaffinity)
+    - the cgroup v2 CPU quota (cpu.max of this cgroup and its parents, rounded up)
+    - available memory / memory per compile job (MemAvailable, cgroup memory.max)
+
+and can be forced with DOTNAME_JOBS (a positive integer; "auto" or an invalid
+value keeps the computed budget). MEMORY_PER_JOB_MB (DOTNAME_MEM_PER_JOB_MB) is
+a conservative figure for a C++ compile job. Reclaimable page cache
+(inactive_file in memory.stat) does not count as used cgroup memory.
+
+Nested parallelism shares one token pool through a GNU make jobserver: when
+the controller runs under a make that uses a FIFO jobserver it joins that pool;
+otherwise it creates a FIFO jobserver (make 4.4 style
+`--jobserver-auth=fifo:PATH`) holding jobs - 1 tokens. Builds whose tool is a
+FIFO jobserver client (make >= 4.4, ninja >= 1.13) get it through MAKEFLAGS
+and take their tokens from the pool; older tools get a plain -j <budget>
+(an older make would reject the fifo: auth string). Commands the controller
+runs concurrently itself (clang-tidy through processrunner) take a token per
+command as well. ctest and gcov never run nested in a build and use the plain
+budget. A parent make with a
+pipe-fd jobserver only caps the budget with its -j, as its descriptors are not
+passed on.
+
+Usage:
+    python cpubudget.py        prints the budget and where each limit came from
+"""
+import os
+import re
+import sys
+import math
+import atexit
+import shutil
+import tempfile
+import subprocess
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+MEMORY_PER_JOB_MB = 1536
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+_JOBSERVER_AUTH = re.compile(r"--jobserver-(?:auth|fds)=(\S+)")
+_JOBS_FLAG = re.compile(r"(?:^|\s)-j\s*(\d+)")
+
+
+def affinity_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _cgroup_dir():
+    """Directory of this process' cgroup v2, None without cgroup v2"""
+    try:
+        with open("/proc/self/cgroup", "r", encoding="utf-8") as f:
+            for line in f:
+                hierarchy, _, path = line.rstrip("\n").split(":", 2)
+                if hierarchy == "0":
+                    return os.path.join(CGROUP_ROOT, path.lstrip("/"))
+    except OSError:
+        pass
+    return None
+
+
+def _cgroup_chain():
+    """This cgroup and its parents up to the cgroup root"""
+    directory = _cgroup_dir()
+    chain = []
+    while directory and directory.startswith(CGROUP_ROOT):
+        chain.append(directory)
+        if directory.rstrip("/") == CGROUP_ROOT:
+            break
+        directory = os.path.dirname(directory.rstrip("/"))
+    return chain
+
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit():
+    """CPUs allowed by cpu.max ('quota period'), rounded up; None when unlimited"""
+    limits = []
+    for directory in _cgroup_chain():
+        value = _read(os.path.join(directory, "cpu.max"))
+        if value:
+            quota, _, period = value.partition(" ")
+            if quota != "max":
+                limits.append(max(1, math.ceil(int(quota) / int(period or 100000))))
+    return min(limits) if limits else None
+
+
+def available_memory_mb():
+    """MemAvailable, further limited by the cgroup memory.max headroom; None if unknown"""
+    available = None
+    meminfo = _read("/proc/meminfo")
+    if meminfo:
+        match = re.search(r"^MemAvailable:\s+(\d+) kB", meminfo, re.MULTILINE)
+        if match:
+            available = int(match.group(1)) // 1024
+    for directory in _cgroup_chain():
+        limit = _read(os.path.join(directory, "memory.max"))
+        current = _read(os.path.join(directory, "memory.current"))
+        if limit and limit != "max" and current:
+            # memory.current includes page cache; inactive file pages are reclaimed under pressure
+            stat = re.search(r"^inactive_file (\d+)$", _read(os.path.join(directory, "memory.stat")) or "",
+                             re.MULTILINE)
+            used = max(0, int(current) - (int(stat.group(1)) if stat else 0))
+            headroom = max(0, int(limit) - used) // (1024 * 1024)
+            available = headroom if available is None else min(available, headroom)
+    return available
+
+
+def _env_int(name, default=None, minimum=1):
+    """Integer >= minimum from the environment; invalid values are ignored with a warning"""
+    value = os.environ.get(name, "").strip()
+    if not value or value.lower() == "auto":
+        return default
+    try:
+        number = int(value)
+        if number >= minimum:
+            return number
+    except ValueError:
+        pass
+    print(f"Warning: ignoring {name}={value!r} (expected an integer >= {minimum} or 'auto')", file=sys.stderr)
+    return default
+
+
+def budget():
+    """
+    Effective parallelism.
+
+    Returns:
+        tuple: (jobs, {limit name: value}) - the limits that were considered
+    """
+    limits = {"affinity": affinity_cpus()}
+    cpu_limit = cgroup_cpu_limit()
+    if cpu_limit is not None:
+        limits["cgroup cpu.max"] = cpu_limit
+    memory = available_memory_mb()
+    per_job = _env_int("DOTNAME_MEM_PER_JOB_MB", MEMORY_PER_JOB_MB, minimum=0)
+    if memory is not None and per_job > 0:
+        limits["memory"] = max(1, memory // per_job)
+    parent = _JOBS_FLAG.search(os.environ.get("MAKEFLAGS", ""))
+    if parent:
+        limits["parent make -j"] = int(parent.group(1))
+    forced = _env_int("DOTNAME_JOBS")
+    if forced:
+        limits = {"DOTNAME_JOBS": forced}
+    return max(1, min(limits.values())), limits
+
+
+class Jobserver:
+    """A joined (inherited MAKEFLAGS) or owned FIFO jobserver"""
+
+    def __init__(self, jobs, makeflags, owned_dir=None):
+        self.jobs = jobs
+        self.makeflags = makeflags
+        self.fifo = _JOBSERVER_AUTH.search(makeflags).group(1)[len("fifo:"):]
+        self._owned_dir = owned_dir
+        self._holder = None
+
+    @classmethod
+    def join(cls, environ=None):
+        """The FIFO jobserver of a parent make, None if there is none"""
+        makeflags = (environ if environ is not None else os.environ).get("MAKEFLAGS", "")
+        auth = _JOBSERVER_AUTH.search(makeflags)
+        if not auth or not auth.group(1).startswith("fifo:") or not os.path.exists(auth.group(1)[len("fifo:"):]):
+            return None
+        jobs = _JOBS_FLAG.search(makeflags)
+        return cls(int(jobs.group(1)) if jobs else affinity_cpus(), makeflags)
+
+    @classmethod
+    def create(cls, jobs):
+        """FIFO jobserver with jobs - 1 tokens (every child holds one implicit token)"""
+        directory = tempfile.mkdtemp(prefix="dotname-jobserver-")
+        fifo = os.path.join(directory, "fifo")
+        os.mkfifo(fifo, 0o600)
+        server = cls(jobs, f"-j{jobs} --jobserver-auth=fifo:{fifo}", directory)
+        # Keep the FIFO open read-write so the tokens survive while no child has it open
+        os.write(server.fileno(), b"+" * (jobs - 1))
+        atexit.register(server.close)
+        return server
+
+    def fileno(self):
+        """Non-blocking read-write descriptor of the FIFO (readable while tokens are free)"""
+        if self._holder is None:
+            self._holder = os.open(self.fifo, os.O_RDWR | os.O_NONBLOCK)
+        return self._holder
+
+    def try_acquire(self):
+        """Take a token from the pool: the token byte, None when none is free"""
+        try:
+            token = os.read(self.fileno(), 1)
+        except BlockingIOError:
+            return None
+        return token or None
+
+    def release(self, token):
+        """Return a token taken with try_acquire()"""
+        os.write(self.fileno(), token)
+
+    def env(self, environ=None):
+        """Environment for children with the jobserver in MAKEFLAGS"""
+        env = dict(environ if environ is not None else os.environ)
+        env["MAKEFLAGS"] = self.makeflags
+        return env
+
+    def close(self):
+        if self._holder is not None:
+            os.close(self._holder)
+            self._holder = None
+        if self._owned_dir:
+            shutil.rmtree(self._owned_dir, ignore_errors=True)
+            self._owned_dir = None
+
+
+_jobserver = None
+
+
+def jobserver(jobs=None):
+    """The controller's jobserver (joined or created once), None where FIFOs are unsupported"""
+    global _jobserver
+    if _jobserver is None:
+        _jobserver = Jobserver.join()
+        if _jobserver is None and hasattr(os, "mkfifo"):
+            _jobserver = Jobserver.create(jobs or budget()[0])
+    return _jobserver
+
+
+def _tool_version(tool):
+    try:
+        output = subprocess.run([tool, "--version"], capture_output=True, text=True).stdout
+    except OSError:
+        return None
+    match = re.search(r"(\d+)\.(\d+)", output)
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def cmake_generator(build_dir):
+    cache = _read(os.path.join(build_dir, "CMakeCache.txt")) or ""
+    match = re.search(r"^CMAKE_GENERATOR:INTERNAL=(.*)$", cache, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def fifo_jobserver_client(build_dir):
+    """True if the build tool of a CMake build tree takes tokens from a FIFO jobserver"""
+    generator = cmake_generator(build_dir) or ""
+    if "Ninja" in generator:
+        version = _tool_version("ninja")
+        return version is not None and version >= (1, 13)
+    if "Makefiles" in generator:
+        version = _tool_version("make")
+        return version is not None and version >= (4, 4)
+    return False
+
+
+def build_parallelism(build_dir, jobs):
+    """
+    (environment or None, parallel arguments) for `cmake --build`. With a
+    jobserver client no -j is passed - an explicit -j would bypass the pool.
+    """
+    if fifo_jobserver_client(build_dir):
+        server = jobserver(jobs)
+        if server is not None:
+            return server.env(), ""
+    return None, f"-j {jobs}"
+
+
+if __name__ == "__main__":
+    jobs, limits = budget()
+    print(f"Effective jobs: {jobs}  (os.cpu_count() = {os.cpu_count()})")
+    for name, value in limits.items():
+        print(f"  {name:<16}{value}")
+    inherited = Jobserver.join()
+    print(f"Jobserver: {'joined ' + inherited.makeflags if inherited else 'none inherited'}")
+    for tool in ("make", "ninja"):
+        version = _tool_version(tool)
+        print(f"  {tool:<16}{'.'.join(map(str, version)) if version else 'not found'}")
+    sys.exit(0)
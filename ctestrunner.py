@@ -0,0 +1,185 @@
+"""
+Parallel ctest runner with history based ordering and sharding.
+
+Lists the tests of a build tree (ctest --show-only=json-v1), keeps the tests of
+the requested shard and runs them with `ctest -j N --output-junit`. Per-test
+durations and results are read back from the JUnit file and kept in a history
+file. Before each run the history is written into ctest's own scheduling data
+(Testing/Temporary/CTestCostData.txt), so the parallel scheduler starts the
+previously failing tests first and then the slowest ones.
+
+Sharding is deterministic: tests are sorted by name and dealt round-robin, so
+every machine running `--shard i/n` of the same tree gets the same subset.
+
+Usage:
+    python ctestrunner.py <test build dir> [--shard i/n] [-j N] [--top 10]
+"""
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+import xml.etree.ElementTree as ET
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+JUNIT_FILE = "ctest-junit.xml"
+HISTORY_FILE = "ctest-history.json"
+COST_DATA_FILE = os.path.join("Testing", "Temporary", "CTestCostData.txt")
+TOP_SLOWEST = 10
+
+
+class TestResult:
+    __slots__ = ("name", "status", "duration", "output")
+
+    def __init__(self, name, status, duration, output=""):
+        self.name = name
+        self.status = status        # 'passed', 'failed' or 'skipped'
+        self.duration = duration    # seconds
+        self.output = output
+
+
+def parse_shard(text):
+    """'i/n' (1-based) -> (i, n)"""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{text}', expected i/n (e.g. 1/4)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{text}', index must be within 1..{count}")
+    return index, count
+
+
+def list_tests(test_dir):
+    result = subprocess.run(["ctest", "--test-dir", test_dir, "--show-only=json-v1"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ctest cannot list tests in {test_dir}: {result.stderr.strip()}")
+    return [test["name"] for test in json.loads(result.stdout).get("tests", [])]
+
+
+def select_shard(names, index, count):
+    return [name for i, name in enumerate(sorted(names)) if i % count == index - 1]
+
+
+def load_history(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def order_tests(names, history):
+    """Previously failing tests first, then by last duration (slowest first), then by name"""
+    def key(name):
+        entry = history.get(name, {})
+        return (entry.get("status") != "failed", -entry.get("duration", 0.0), name)
+    return sorted(names, key=key)
+
+
+def write_cost_data(test_dir, history):
+    """
+    Seed ctest's scheduler: '<name> <runs> <cost>' lines, then '---' and the
+    failed tests. ctest -j runs failed tests first, then by descending cost.
+    """
+    path = os.path.join(test_dir, COST_DATA_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = [f"{name} 1 {entry.get('duration', 0.0):.6f}" for name, entry in sorted(history.items())
+             if " " not in name]
+    lines.append("---")
+    lines.extend(name for name, entry in sorted(history.items()) if entry.get("status") == "failed")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def parse_junit(path):
+    results = []
+    root = ET.parse(path).getroot()
+    for case in root.iter("testcase"):
+        if case.find("failure") is not None or case.find("error") is not None or case.get("status") == "fail":
+            status = "failed"
+        elif case.find("skipped") is not None or case.get("status") in ("notrun", "disabled"):
+            status = "skipped"
+        else:
+            status = "passed"
+        output = case.findtext("system-out") or ""
+        results.append(TestResult(case.get("name"), status, float(case.get("time") or 0.0), output))
+    return results
+
+
+def run_tests(test_dir, shard=None, jobs=None, extra_args=()):
+    """
+    Run the (sharded, ordered) tests of a build tree.
+
+    Returns:
+        tuple: (list of TestResult in execution order, wall time in seconds, ctest return code)
+    """
+    test_dir = os.path.abspath(test_dir)
+    names = list_tests(test_dir)
+    selection = []
+    if shard:
+        names = select_shard(names, *shard)
+        # Exact-name regex; ctest's regex syntax understands these escapes
+        selection = ["-R", "^(" + "|".join(re.escape(name) for name in names) + ")$"]
+    history_path = os.path.join(test_dir, HISTORY_FILE)
+    history = load_history(history_path)
+    ordered = order_tests(names, history)
+    if not ordered:
+        return [], 0.0, 0
+
+    write_cost_data(test_dir, history)
+    junit_file = os.path.join(test_dir, JUNIT_FILE)
+    if os.path.exists(junit_file):
+        os.remove(junit_file)
+
+    cmd = ["ctest", "--test-dir", test_dir, "-j", str(jobs or os.cpu_count() or 1),
+           "--output-junit", junit_file, "--output-on-failure", *selection, *extra_args]
+    start = time.monotonic()
+    returncode = subprocess.run(cmd).returncode
+    wall = time.monotonic() - start
+
+    results = parse_junit(junit_file) if os.path.exists(junit_file) else []
+    position = {name: i for i, name in enumerate(ordered)}
+    results.sort(key=lambda r: position.get(r.name, len(position)))
+    for result in results:
+        history[result.name] = {"status": result.status, "duration": result.duration}
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=4, sort_keys=True)
+        f.write("\n")
+    return results, wall, returncode
+
+
+def summary_lines(results, wall, top=TOP_SLOWEST):
+    counts = {status: sum(1 for r in results if r.status == status) for status in ("passed", "failed", "skipped")}
+    serial = sum(r.duration for r in results)
+    lines = [f"{len(results)} tests: {counts['passed']} passed, {counts['failed']} failed, "
+             f"{counts['skipped']} skipped in {wall:.2f}s (serial {serial:.2f}s)"]
+    slowest = sorted(results, key=lambda r: -r.duration)[:top]
+    if slowest:
+        lines.append("")
+        lines.append(f"{'Slowest tests':<60}{'Time':>10}  Status")
+        for result in slowest:
+            lines.append(f"{result.name[:58]:<60}{result.duration:>9.2f}s  {result.status}")
+    failed = [r.name for r in results if r.status == "failed"]
+    if failed:
+        lines.append("")
+        lines.append("Failed tests:")
+        lines.extend(f"  {name}" for name in failed)
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run ctest in parallel with sharding")
+    parser.add_argument("test_dir")
+    parser.add_argument("--shard", type=parse_shard)
+    parser.add_argument("-j", "--jobs", type=int)
+    parser.add_argument("--top", type=int, default=TOP_SLOWEST)
+    args = parser.parse_args()
+
+    results, wall, returncode = run_tests(args.test_dir, args.shard, args.jobs)
+    print("\n".join(summary_lines(results, wall, args.top)))
+    sys.exit(1 if returncode != 0 or any(r.status == "failed" for r in results) else 0)
@@ -0,0 +1,561 @@
+"""
+Emoji asset compiler for the EmojiesLib library.
+
+Parses assets/emoji-test.txt once at build time (streaming, see iter_emoji_test)
+and emits src/EmojiTables.hpp, a compact header with pre-encoded UTF-8 data,
+offset arrays, interned string tables and per-group/subgroup index ranges. The
+library builds its emoji map straight from these tables; emoji-test.txt is only
+parsed at runtime when a caller opts in (EmojiesLib(assetsPath, true)).
+
+Every asset-derived source is registered in ASSET_GENERATORS. generate_asset_sources()
+records a content hash of each input in a manifest and regenerates an output only when
+an input (or the generator itself) changed. Outputs are written atomically and only when
+their bytes differ, so unchanged assets never trigger a rebuild.
+
+Usage:
+    python emojiassets.py                               # regenerate changed asset sources
+    python emojiassets.py --force                       # regenerate all asset sources
+    python emojiassets.py <emoji-test.txt> <EmojiTables.hpp>
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import tempfile
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+EMOJI_TEST_FILE = os.path.join("assets", "emoji-test.txt")
+EMOJI_TABLES_HEADER = os.path.join("src", "EmojiTables.hpp")
+ASSET_MANIFEST = os.path.join("build", "assetgen", "manifest.json")
+
+# Qualification statuses in the order used by the generated tables
+STATUSES = ("component", "fully-qualified", "minimally-qualified", "unqualified")
+
+READ_CHUNK_SIZE = 64 * 1024
+
+_GROUP_RE = re.compile(r"^# group:\s*(\S.*?)\s*$")
+_SUBGROUP_RE = re.compile(r"^# subgroup:\s*(\S.*?)\s*$")
+_EMOJI_RE = re.compile(
+    r"^(?P<code_points>[0-9A-Fa-f ]+?)\s*;\s*(?P<status>[a-z-]+)\s*"
+    r"#\s*\S+\s+(?P<version>E\d+\.\d+)\s+(?P<description>.+?)\s*$"
+)
+
+
+class EmojiRecord:
+    """One emoji line of emoji-test.txt"""
+    __slots__ = ("code_points", "status", "group", "subgroup", "version", "description")
+
+    def __init__(self, code_points, status, group, subgroup, version, description):
+        self.code_points = code_points
+        self.status = status
+        self.group = group
+        self.subgroup = subgroup
+        self.version = version
+        self.description = description
+
+    @property
+    def utf8(self):
+        return encode_utf8(self.code_points)
+
+
+def encode_utf8(code_points):
+    """Encode a code point sequence into UTF-8 bytes"""
+    return "".join(map(chr, code_points)).encode("utf-8")
+
+
+_SCALAR_VALUE_ERROR = "Code points must be Unicode scalar values (0..0x10FFFF, no surrogates)"
+
+
+def _encode_utf8_batch_numpy(code_points, lengths):
+    values = np.asarray(code_points, dtype=np.int64)
+    if ((values < 0) | (values > 0x10FFFF) | ((values >= 0xD800) & (values <= 0xDFFF))).any():
+        raise ValueError(_SCALAR_VALUE_ERROR)
+    cps = values.astype(np.uint32)
+    widths = 1 + (cps >= 0x80).astype(np.intp) + (cps >= 0x800) + (cps >= 0x10000)
+    byte_ends = np.zeros(len(cps) + 1, dtype=np.intp)
+    np.cumsum(widths, out=byte_ends[1:])
+    starts = byte_ends[:-1]
+
+    out = np.empty(int(byte_ends[-1]), dtype=np.uint8)
+    # Lead bytes: marker | payload bits above the continuation bytes
+    shift = 6 * (widths - 1)
+    marker = np.array([0, 0x00, 0xC0, 0xE0, 0xF0], dtype=np.uint32)[widths]
+    out[starts] = marker | (cps >> shift.astype(np.uint32))
+    # Continuation bytes k = 1..3 of every code point that is long enough
+    for k in range(1, 4):
+        mask = widths > k
+        if not mask.any():
+            break
+        cont_shift = (6 * (widths[mask] - 1 - k)).astype(np.uint32)
+        out[starts[mask] + k] = 0x80 | ((cps[mask] >> cont_shift) & 0x3F)
+
+    cp_offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+    np.cumsum(np.asarray(lengths, dtype=np.intp), out=cp_offsets[1:])
+    return out.tobytes(), byte_ends[cp_offsets].tolist()
+
+
+def encode_utf8_batch(code_points, lengths):
+    """
+    Encode many code point sequences at once.
+
+    code_points holds all sequences back to back (uint32), lengths the number of
+    code points of each sequence. Returns (utf8_blob, offsets) where sequence i
+    is utf8_blob[offsets[i]:offsets[i + 1]]. Vectorized with NumPy when it is
+    installed, pure Python otherwise - both raise ValueError for lengths that do
+    not add up to len(code_points) and for code points that are not Unicode
+    scalar values.
+    """
+    if any(length < 0 for length in lengths) or sum(lengths) != len(code_points):
+        raise ValueError(f"Sequence lengths must be non-negative and add up to {len(code_points)} code points")
+    if NUMPY_AVAILABLE:
+        return _encode_utf8_batch_numpy(code_points, lengths)
+    if any(not 0 <= cp <= 0x10FFFF or 0xD800 <= cp <= 0xDFFF for cp in code_points):
+        raise ValueError(_SCALAR_VALUE_ERROR)
+    blob = bytearray()
+    offsets = [0]
+    position = 0
+    for length in lengths:
+        blob += encode_utf8(code_points[position:position + length])
+        offsets.append(len(blob))
+        position += length
+    return bytes(blob), offsets
+
+
+class GroupStart:
+    """Boundary event - the following emoji lines belong to group name"""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class SubgroupStart:
+    """Boundary event - the following emoji lines belong to subgroup name of group"""
+    __slots__ = ("group", "name")
+
+    def __init__(self, group, name):
+        self.group = group
+        self.name = name
+
+
+def iter_lines(stream, chunk_size=READ_CHUNK_SIZE):
+    """Yield decoded lines of a binary stream read in fixed-size chunks"""
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split(b"\n")
+        # The last piece may be cut in the middle of a line (or UTF-8 sequence)
+        tail = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8")
+    if tail:
+        yield tail.decode("utf-8")
+
+
+def _header_name(regex, line, number):
+    match = regex.match(line)
+    if not match:
+        header = line.split(":")[0][2:]
+        raise ValueError(f"Line {number}: {header} header without a name: {line.rstrip()!r}")
+    return match.group(1)
+
+
+def iter_emoji_test_events(lines):
+    """
+    Turn emoji-test.txt lines into a stream of GroupStart, SubgroupStart and
+    EmojiRecord items (file order). Lines that are neither are skipped; a group
+    or subgroup header without a name raises ValueError.
+    """
+    group = ""
+    subgroup = ""
+    for number, line in enumerate(lines, 1):
+        if not line or line[0] in "\r\n":
+            continue
+        if line[0] == "#":
+            if line.startswith("# subgroup:"):
+                subgroup = _header_name(_SUBGROUP_RE, line, number)
+                yield SubgroupStart(group, subgroup)
+            elif line.startswith("# group:"):
+                group = _header_name(_GROUP_RE, line, number)
+                subgroup = ""
+                yield GroupStart(group)
+            continue
+        match = _EMOJI_RE.match(line)
+        if match:
+            code_points = tuple(int(cp, 16) for cp in match.group("code_points").split())
+            yield EmojiRecord(code_points, match.group("status"), group, subgroup,
+                              match.group("version"), match.group("description"))
+
+
+def iter_emoji_test(source=EMOJI_TEST_FILE, chunk_size=READ_CHUNK_SIZE):
+    """
+    Stream the events of emoji-test.txt in constant memory.
+
+    source is a path or a binary file object; this is the shared front end of
+    every emoji tool in the repository.
+    """
+    if hasattr(source, "read"):
+        yield from iter_emoji_test_events(iter_lines(source, chunk_size))
+        return
+    with open(source, "rb") as f:
+        yield from iter_emoji_test_events(iter_lines(f, chunk_size))
+
+
+def parse_emoji_test(path=EMOJI_TEST_FILE):
+    """Parse emoji-test.txt into a list of EmojiRecord (file order)"""
+    return [event for event in iter_emoji_test(path) if isinstance(event, EmojiRecord)]
+
+
+class StringTable:
+    """Interned string table - every distinct string is stored once"""
+
+    def __init__(self):
+        self.strings = []
+        self._index = {}
+
+    def intern(self, value):
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self._index[value] = index
+            self.strings.append(value)
+        return index
+
+
+def _ranges(records, key):
+    """Return [(name, first, last)] for contiguous runs of key(record)"""
+    ranges = []
+    for i, record in enumerate(records):
+        name = key(record)
+        if ranges and ranges[-1][0] == name:
+            ranges[-1][2] = i + 1
+        else:
+            if any(r[0] == name for r in ranges):
+                raise ValueError(f"Emoji records of '{name}' are not contiguous")
+            ranges.append([name, i, i + 1])
+    return [tuple(r) for r in ranges]
+
+
+def compile_emoji_tables(records):
+    """Compile records into the column-oriented tables emitted to the header"""
+    strings = StringTable()
+    group_ranges = _ranges(records, lambda r: r.group)
+    subgroup_ranges = _ranges(records, lambda r: r.subgroup)
+    group_index = {name: i for i, (name, _, _) in enumerate(group_ranges)}
+    subgroup_index = {name: i for i, (name, _, _) in enumerate(subgroup_ranges)}
+
+    code_points = [cp for record in records for cp in record.code_points]
+    lengths = [len(record.code_points) for record in records]
+    utf8_blob, utf8_offsets = encode_utf8_batch(code_points, lengths)
+
+    tables = {
+        "groups": [(strings.intern(name), first, last) for name, first, last in group_ranges],
+        "subgroups": [(strings.intern(name), first, last) for name, first, last in subgroup_ranges],
+        "utf8_blob": utf8_blob,
+        "utf8_offsets": utf8_offsets,
+        "code_points": code_points,
+        "code_point_offsets": [0],
+        "group_ids": [],
+        "subgroup_ids": [],
+        "version_ids": [],
+        "description_ids": [],
+        "status_ids": [],
+    }
+    for length in lengths:
+        tables["code_point_offsets"].append(tables["code_point_offsets"][-1] + length)
+    for record in records:
+        tables["group_ids"].append(group_index[record.group])
+        tables["subgroup_ids"].append(subgroup_index[record.subgroup])
+        tables["version_ids"].append(strings.intern(record.version))
+        tables["description_ids"].append(strings.intern(record.description))
+        tables["status_ids"].append(STATUSES.index(record.status))
+    tables["strings"] = strings.strings
+    return tables
+
+
+def _cpp_string(value):
+    """C++ string literal; non-ASCII bytes as 3-digit octal escapes"""
+    out = []
+    for byte in value.encode("utf-8"):
+        if byte in (0x22, 0x5C):
+            out.append("\\" + chr(byte))
+        elif 0x20 <= byte < 0x7F:
+            out.append(chr(byte))
+        else:
+            out.append(f"\\{byte:03o}")
+    return '"' + "".join(out) + '"'
+
+
+def _cpp_array(values, fmt="{}", indent=6, width=100):
+    """Wrap array initializer values into lines of at most width columns"""
+    lines = []
+    line = " " * indent
+    for value in values:
+        item = fmt.format(value) + ","
+        if len(line) + len(item) + 1 > width and line.strip():
+            lines.append(line.rstrip())
+            line = " " * indent
+        line += item + " "
+    if line.strip():
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def render_emoji_tables_header(tables, source_name="emoji-test.txt"):
+    """Render compiled tables as a C++17 header"""
+    strings = "\n".join(f"      {_cpp_string(s)}," for s in tables["strings"])
+    groups = "\n".join(f"      {{ {n}, {f}, {l} }}," for n, f, l in tables["groups"])
+    subgroups = "\n".join(f"      {{ {n}, {f}, {l} }}," for n, f, l in tables["subgroups"])
+    statuses = ", ".join(_cpp_string(s) for s in STATUSES)
+    return f"""// Generated by emojiassets.py from {source_name} - DO NOT EDIT
+// MIT License
+// Copyright (c) 2024-2025 Tomáš Mark
+
+#ifndef __EMOJITABLES_HPP
+#define __EMOJITABLES_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <string_view>
+
+namespace dotname {{
+
+  namespace EmojiTables {{
+
+    struct Range {{
+      std::uint32_t name;  // index into strings[]
+      std::uint32_t first; // first emoji index
+      std::uint32_t last;  // one past the last emoji index
+    }};
+
+    inline constexpr std::size_t emojiCount = {len(tables["group_ids"])};
+    inline constexpr std::size_t groupCount = {len(tables["groups"])};
+    inline constexpr std::size_t subGroupCount = {len(tables["subgroups"])};
+
+    inline constexpr std::string_view statuses[] = {{
+      {statuses}
+    }};
+
+    // Interned group, subgroup, Unicode version and description strings
+    inline constexpr std::string_view strings[] = {{
+{strings}
+    }};
+
+    // Groups and subgroups with their contiguous emoji index ranges
+    inline constexpr Range groups[] = {{
+{groups}
+    }};
+
+    inline constexpr Range subGroups[] = {{
+{subgroups}
+    }};
+
+    // Emoji i is utf8Blob[utf8Offsets[i] .. utf8Offsets[i + 1])
+    inline constexpr unsigned char utf8Blob[] = {{
+{_cpp_array(tables["utf8_blob"])}
+    }};
+
+    inline constexpr std::uint32_t utf8Offsets[] = {{
+{_cpp_array(tables["utf8_offsets"])}
+    }};
+
+    // Emoji i is codePoints[codePointOffsets[i] .. codePointOffsets[i + 1])
+    inline constexpr char32_t codePoints[] = {{
+{_cpp_array(tables["code_points"], "0x{:X}")}
+    }};
+
+    inline constexpr std::uint32_t codePointOffsets[] = {{
+{_cpp_array(tables["code_point_offsets"])}
+    }};
+
+    // Per-emoji columns: groups[] / subGroups[] / strings[] / statuses[] indices
+    inline constexpr std::uint8_t groupIds[] = {{
+{_cpp_array(tables["group_ids"])}
+    }};
+
+    inline constexpr std::uint16_t subGroupIds[] = {{
+{_cpp_array(tables["subgroup_ids"])}
+    }};
+
+    inline constexpr std::uint32_t versionIds[] = {{
+{_cpp_array(tables["version_ids"])}
+    }};
+
+    inline constexpr std::uint32_t descriptionIds[] = {{
+{_cpp_array(tables["description_ids"])}
+    }};
+
+    inline constexpr std::uint8_t statusIds[] = {{
+{_cpp_array(tables["status_ids"])}
+    }};
+
+  }} // namespace EmojiTables
+
+}} // namespace dotname
+
+#endif // __EMOJITABLES_HPP
+"""
+
+
+def build_emoji_tables_header(source=EMOJI_TEST_FILE):
+    """Compile emoji-test.txt into the EmojiTables.hpp header content (bytes)"""
+    records = parse_emoji_test(source)
+    if not records:
+        raise ValueError(f"No emoji records found in {source}")
+    tables = compile_emoji_tables(records)
+    return render_emoji_tables_header(tables, os.path.basename(source)).encode("utf-8")
+
+
+def generate_emoji_tables_header(source=EMOJI_TEST_FILE, output=EMOJI_TABLES_HEADER):
+    """Compile emoji-test.txt into the EmojiTables.hpp header; returns True when written"""
+    return write_if_changed(output, build_emoji_tables_header(source))
+
+
+# ============================================================================
+# Incremental generation of asset-derived sources
+# ============================================================================
+
+class AssetGenerator:
+    """An output derived from one or more asset files"""
+
+    def __init__(self, name, inputs, output, build, sources=()):
+        self.name = name
+        self.inputs = inputs    # paths relative to the workspace
+        self.output = output    # path relative to the workspace
+        self.build = build      # callable(*input_paths) -> bytes
+        self.sources = sources  # generator modules besides this one (next to this file)
+
+
+# Generators living in other modules are imported lazily - they depend on this module
+def _build_emoji_db(source):
+    import emojidb
+    return emojidb.build_emoji_db(source)
+
+
+def _build_search_index(source):
+    import emojisearch
+    return emojisearch.build_search_index(source)
+
+
+# Register every source generated from assets/ here
+ASSET_GENERATORS = [
+    AssetGenerator("emoji-tables", [EMOJI_TEST_FILE], EMOJI_TABLES_HEADER, build_emoji_tables_header),
+    AssetGenerator("emoji-db", [EMOJI_TEST_FILE], os.path.join("build", "assetgen", "emoji.db"),
+                   _build_emoji_db, ["emojidb.py"]),
+    AssetGenerator("emoji-search", [EMOJI_TEST_FILE], os.path.join("build", "assetgen", "emoji-search.pickle"),
+                   _build_search_index, ["emojisearch.py"]),
+]
+
+
+def file_sha256(path):
+    """SHA-256 of a file's content, None when the file does not exist"""
+    try:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _file_mode(path):
+    """Mode of an existing file, or the default mode for new files (0o666 & ~umask)"""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_if_changed(path, data):
+    """Atomically write bytes to path unless it already holds exactly these bytes"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(temp_path, _file_mode(path))
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return True
+
+
+def _load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def generate_asset_sources(workspace=".", manifest=None, force=False, generators=None):
+    """
+    Regenerate asset-derived sources whose inputs changed.
+
+    Returns:
+        list: (output, status) with status 'up-to-date', 'unchanged' or 'written'
+    """
+    manifest_path = manifest or os.path.join(workspace, ASSET_MANIFEST)
+    entries = _load_manifest(manifest_path)
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    results = []
+
+    for generator in generators or ASSET_GENERATORS:
+        generator_hash = "".join(file_sha256(os.path.join(module_dir, module)) or ""
+                                 for module in ["emojiassets.py", *generator.sources])
+        input_paths = [os.path.join(workspace, p) for p in generator.inputs]
+        output_path = os.path.join(workspace, generator.output)
+        input_hashes = {p: file_sha256(path) for p, path in zip(generator.inputs, input_paths)}
+        missing = [p for p, digest in input_hashes.items() if digest is None]
+        if missing:
+            raise FileNotFoundError(f"Missing asset input(s) for {generator.name}: {', '.join(missing)}")
+
+        previous = entries.get(generator.output, {})
+        if (not force
+                and previous.get("inputs") == input_hashes
+                and previous.get("generator") == generator_hash
+                and previous.get("output") == file_sha256(output_path)):
+            results.append((generator.output, "up-to-date"))
+            continue
+
+        written = write_if_changed(output_path, generator.build(*input_paths))
+        entries[generator.output] = {
+            "inputs": input_hashes,
+            "generator": generator_hash,
+            "output": file_sha256(output_path),
+        }
+        results.append((generator.output, "written" if written else "unchanged"))
+
+    write_if_changed(manifest_path, (json.dumps(entries, indent=4, sort_keys=True) + "\n").encode("utf-8"))
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        written = generate_emoji_tables_header(sys.argv[1], sys.argv[2])
+        print(f"{'Generated' if written else 'Unchanged'}: {sys.argv[2]}")
+    else:
+        for output, status in generate_asset_sources(force="--force" in sys.argv):
+            print(f"{status:<12} {output}")
@@ -0,0 +1,434 @@
+"""
+Benchmark harness for the EmojiesLib C++ library.
+
+Runs the LibBench executable (standalone/benchmarks) with warmups and
+repetitions, summarizes the per-repetition ns/op samples and compares the
+medians against a stored baseline. Results are written to build/bench:
+
+    latest.json     the last run
+    baseline.json   reference run (created by the first run or --update-baseline)
+    results.jsonl   append-only store - one row per benchmark and run, tagged with
+                    commit SHA, os, arch, build type and compiler
+
+report compares two git refs from the store: bootstrap confidence intervals of
+the median change decide whether a difference is significant, so single noisy
+runs are not reported as regressions.
+
+Usage:
+    python emojibench.py run <LibBench executable> [--assets assets] [--filter name]
+                             [--build-dir dir] [--build-type Release]
+                             [--threshold 0.10] [--update-baseline]
+    python emojibench.py report [--base HEAD~1] [--head HEAD] [--arch x86_64] [--build-type Release]
+    python emojibench.py trend [--benchmark name] [--limit 20]
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import statistics
+import subprocess
+import tempfile
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+BENCH_DIR = os.path.join("build", "bench")
+LATEST_FILE = "latest.json"
+BASELINE_FILE = "baseline.json"
+RESULTS_FILE = "results.jsonl"
+
+# Written into the build folder by conantools.SettingsSnapshot
+SETTINGS_SNAPSHOT_FILE = "conan_settings_snapshot.json"
+
+# Fields identifying comparable rows of the results store
+CONFIG_FIELDS = ("os", "arch", "build_type", "compiler", "compiler_version")
+
+# Relative slowdown of the median that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_WARMUP = 2
+DEFAULT_REPETITIONS = 10
+DEFAULT_MIN_TIME_MS = 50
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+
+def summarize(samples):
+    """Statistics of ns/op samples"""
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "count": len(samples),
+    }
+
+
+def run_benchmarks(executable, assets, warmup=DEFAULT_WARMUP, repetitions=DEFAULT_REPETITIONS,
+                   min_time_ms=DEFAULT_MIN_TIME_MS, name_filter=None):
+    """Run the benchmark executable and return the result document"""
+    fd, output = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    cmd = [executable, "--assets", assets, "--output", output, "--warmup", str(warmup),
+           "--repetitions", str(repetitions), "--min-time-ms", str(min_time_ms)]
+    if name_filter:
+        cmd += ["--filter", name_filter]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+        with open(output, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    finally:
+        os.remove(output)
+
+    benchmarks = {}
+    for entry in raw.get("benchmarks", []):
+        benchmarks[entry["name"]] = {
+            "iterations": entry["iterations"],
+            "samples_ns": entry["samples_ns"],
+            **summarize(entry["samples_ns"]),
+        }
+    return {
+        "context": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "executable": os.path.abspath(executable),
+            "host": platform.node(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "warmup": warmup,
+            "repetitions": repetitions,
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare medians of two result documents.
+
+    Returns:
+        list: (name, baseline_ns, current_ns, change, status) with status
+        'regression', 'improvement', 'ok' or 'new'
+    """
+    rows = []
+    base = (baseline or {}).get("benchmarks", {})
+    for name, result in current["benchmarks"].items():
+        if name not in base:
+            rows.append((name, None, result["median"], None, "new"))
+            continue
+        before = base[name]["median"]
+        change = (result["median"] - before) / before if before else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, before, result["median"], change, status))
+    return rows
+
+
+def format_ns(value):
+    if value is None:
+        return "-"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+    return f"{value:.1f} ns"
+
+
+def format_comparison(rows):
+    lines = [f"{'Benchmark':<34}{'Baseline':>12}{'Current':>12}{'Change':>10}  Status"]
+    for name, before, after, change, status in rows:
+        change_text = "-" if change is None else f"{change * 100:+.1f}%"
+        lines.append(f"{name:<34}{format_ns(before):>12}{format_ns(after):>12}{change_text:>10}  {status}")
+    return lines
+
+
+def _load(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _save(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+        f.write("\n")
+
+
+def run_and_compare(executable, assets, bench_dir=BENCH_DIR, threshold=DEFAULT_THRESHOLD,
+                    update_baseline=False, config=None, workspace=".", **options):
+    """
+    Run the benchmarks, store latest.json and compare against baseline.json.
+    With a config (see build_config()) the run is also appended to results.jsonl.
+
+    Returns:
+        tuple: (rows from compare(), baseline_written)
+    """
+    current = run_benchmarks(executable, assets, **options)
+    _save(os.path.join(bench_dir, LATEST_FILE), current)
+    if config is not None:
+        append_results(current, config, workspace, os.path.join(bench_dir, RESULTS_FILE))
+
+    baseline_path = os.path.join(bench_dir, BASELINE_FILE)
+    baseline = _load(baseline_path)
+    rows = compare(current, baseline, threshold)
+    if update_baseline or baseline is None:
+        _save(baseline_path, current)
+        return rows, True
+    return rows, False
+
+
+# ----------------------------------------------------------------------------
+# Results store
+# ----------------------------------------------------------------------------
+
+def git_commit(workspace="."):
+    """(sha, dirty) of the workspace checkout, (None, False) outside git"""
+    def git(*args):
+        result = subprocess.run(["git", *args], cwd=workspace, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else None
+    sha = git("rev-parse", "HEAD")
+    return sha, bool(sha and git("status", "--porcelain", "--untracked-files=no"))
+
+
+def resolve_ref(ref, workspace="."):
+    result = subprocess.run(["git", "rev-parse", "--verify", f"{ref}^{{commit}}"], cwd=workspace,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ValueError(f"Unknown git ref: {ref}")
+    return result.stdout.strip()
+
+
+def build_config(build_dir=None, build_type=None):
+    """
+    Configuration of a build folder, the same fields that ConanTools uses for
+    preset names. Read from the Conan settings snapshot when it exists.
+    """
+    config = {"os": platform.system(), "arch": platform.machine(), "build_type": build_type or "unknown",
+              "compiler": "unknown", "compiler_version": "unknown"}
+    if build_dir:
+        snapshot = _load(os.path.join(build_dir, SETTINGS_SNAPSHOT_FILE)) or {}
+        settings = snapshot.get("settings") or {}
+        for field, key in (("os", "os"), ("arch", "arch"), ("build_type", "build_type"),
+                           ("compiler", "compiler"), ("compiler_version", "compiler.version")):
+            if key in settings:
+                config[field] = settings[key]
+        if "preset_name" in snapshot:
+            config["preset"] = snapshot["preset_name"]
+    return config
+
+
+def cmake_configuration_types(build_dir):
+    """CMAKE_CONFIGURATION_TYPES of a CMake build tree (multi-config generators), [] otherwise"""
+    try:
+        with open(os.path.join(build_dir, "CMakeCache.txt"), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("CMAKE_CONFIGURATION_TYPES:"):
+                    return [config for config in line.partition("=")[2].strip().split(";") if config]
+    except OSError:
+        pass
+    return []
+
+
+def benchmark_executable(build_dir, name, build_type):
+    """
+    Path of the LibBench executable: <build>/benchmarks/<name>, or
+    <build>/benchmarks/<Config>/<name> for Visual Studio / Ninja Multi-Config.
+    """
+    directory = os.path.join(build_dir, "benchmarks")
+    configurations = cmake_configuration_types(build_dir)
+    if configurations:
+        config = next((c for c in configurations if c.lower() == (build_type or "").lower()), configurations[0])
+        directory = os.path.join(directory, config)
+    return os.path.join(directory, name + (".exe" if platform.system() == "Windows" else ""))
+
+
+def append_results(document, config, workspace=".", path=None):
+    """Append one row per benchmark of a run to the JSONL store"""
+    path = path or os.path.join(workspace, BENCH_DIR, RESULTS_FILE)
+    sha, dirty = git_commit(workspace)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for name, result in document["benchmarks"].items():
+            row = {
+                "commit": sha,
+                "dirty": dirty,
+                "timestamp": document["context"]["timestamp"],
+                "host": document["context"]["host"],
+                **config,
+                "benchmark": name,
+                "iterations": result["iterations"],
+                "samples_ns": result["samples_ns"],
+                "median": result["median"],
+            }
+            f.write(json.dumps(row, sort_keys=True) + "\n")
+    return path
+
+
+def load_results(path, **filters):
+    """Rows of the store matching every given field (None values are ignored)"""
+    rows = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn line of an interrupted append
+                if all(value is None or row.get(field) == value for field, value in filters.items()):
+                    rows.append(row)
+    except FileNotFoundError:
+        pass
+    return rows
+
+
+def bootstrap_ci(base, head, resamples=BOOTSTRAP_RESAMPLES, confidence=CONFIDENCE, seed=0):
+    """
+    Confidence interval of the relative median change head vs base.
+
+    Both sample sets are resampled with replacement; returns
+    (change, low, high) with change = median(head) / median(base) - 1.
+    """
+    rng = random.Random(seed)
+    change = statistics.median(head) / statistics.median(base) - 1.0
+    estimates = sorted(
+        statistics.median(rng.choices(head, k=len(head))) / statistics.median(rng.choices(base, k=len(base))) - 1.0
+        for _ in range(resamples))
+    tail = (1.0 - confidence) / 2.0
+    return change, estimates[int(tail * (resamples - 1))], estimates[int((1.0 - tail) * (resamples - 1))]
+
+
+def regression_report(rows, base_sha, head_sha, threshold=DEFAULT_THRESHOLD, **options):
+    """
+    Compare the pooled samples of two commits per benchmark and configuration.
+
+    Returns:
+        list: dicts with benchmark, config, change, ci_low, ci_high and status
+        'regression' / 'improvement' (significant and beyond threshold),
+        'noise' (not significant) or 'ok' (significant but within threshold)
+    """
+    pooled = {}
+    for row in rows:
+        if row.get("commit") not in (base_sha, head_sha):
+            continue
+        key = (row["benchmark"], tuple(row.get(field) for field in CONFIG_FIELDS))
+        side = "base" if row["commit"] == base_sha else "head"
+        pooled.setdefault(key, {"base": [], "head": []})[side].extend(row["samples_ns"])
+
+    report = []
+    for (benchmark, config), samples in sorted(pooled.items()):
+        if not samples["base"] or not samples["head"]:
+            continue
+        change, low, high = bootstrap_ci(samples["base"], samples["head"], **options)
+        if low > 0 or high < 0:
+            if change > threshold:
+                status = "regression"
+            elif change < -threshold:
+                status = "improvement"
+            else:
+                status = "ok"
+        else:
+            status = "noise"
+        report.append({"benchmark": benchmark, "config": dict(zip(CONFIG_FIELDS, config)),
+                       "base": statistics.median(samples["base"]), "head": statistics.median(samples["head"]),
+                       "change": change, "ci_low": low, "ci_high": high, "status": status})
+    return report
+
+
+def format_report(report):
+    lines = [f"{'Benchmark':<34}{'Base':>12}{'Head':>12}{'Change':>10}  {'95% CI':<20}Status"]
+    for entry in report:
+        ci = f"[{entry['ci_low'] * 100:+.1f}%, {entry['ci_high'] * 100:+.1f}%]"
+        lines.append(f"{entry['benchmark']:<34}{format_ns(entry['base']):>12}{format_ns(entry['head']):>12}"
+                     f"{entry['change'] * 100:>+9.1f}%  {ci:<20}{entry['status']}")
+    return lines
+
+
+def trend_table(rows, benchmark=None, limit=20):
+    """Median per commit (oldest first) and benchmark, as printable lines"""
+    commits = []
+    medians = {}
+    for row in sorted(rows, key=lambda r: r["timestamp"]):
+        if benchmark and row["benchmark"] != benchmark:
+            continue
+        commit = (row.get("commit") or "unknown")[:10] + ("+" if row.get("dirty") else "")
+        if commit not in commits:
+            commits.append(commit)
+        medians.setdefault(row["benchmark"], {}).setdefault(commit, []).append(row["median"])
+    commits = commits[-limit:]
+
+    lines = [f"{'Benchmark':<34}" + "".join(f"{commit:>13}" for commit in commits)]
+    for name, per_commit in medians.items():
+        cells = [format_ns(statistics.median(per_commit[c])) if c in per_commit else "-" for c in commits]
+        lines.append(f"{name:<34}" + "".join(f"{cell:>13}" for cell in cells))
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EmojiesLib benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks and store the results")
+    run.add_argument("executable")
+    run.add_argument("--assets", default="assets")
+    run.add_argument("--filter", dest="name_filter")
+    run.add_argument("--bench-dir", default=BENCH_DIR)
+    run.add_argument("--build-dir", help="build folder (for the Conan settings snapshot)")
+    run.add_argument("--build-type")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    run.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    run.add_argument("--min-time-ms", type=float, default=DEFAULT_MIN_TIME_MS)
+    run.add_argument("--update-baseline", action="store_true")
+
+    report = commands.add_parser("report", help="significant changes between two git refs")
+    report.add_argument("--base", default="HEAD~1")
+    report.add_argument("--head", default="HEAD")
+    report.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    trend = commands.add_parser("trend", help="median per commit")
+    trend.add_argument("--benchmark")
+    trend.add_argument("--limit", type=int, default=20)
+
+    for command in (report, trend):
+        command.add_argument("--results", default=os.path.join(BENCH_DIR, RESULTS_FILE))
+        for field in CONFIG_FIELDS:
+            command.add_argument(f"--{field.replace('_', '-')}")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        rows, baseline_written = run_and_compare(
+            args.executable, args.assets, args.bench_dir, args.threshold, args.update_baseline,
+            build_config(args.build_dir, args.build_type),
+            warmup=args.warmup, repetitions=args.repetitions, min_time_ms=args.min_time_ms,
+            name_filter=args.name_filter)
+        print("\n".join(format_comparison(rows)))
+        if baseline_written:
+            print(f"Baseline written: {os.path.join(args.bench_dir, BASELINE_FILE)}")
+        sys.exit(1 if any(row[4] == "regression" for row in rows) else 0)
+
+    filters = {field: getattr(args, field) for field in CONFIG_FIELDS}
+    rows = load_results(args.results, **filters)
+    if args.command == "trend":
+        print("\n".join(trend_table(rows, args.benchmark, args.limit)))
+        sys.exit(0)
+
+    try:
+        base_sha, head_sha = resolve_ref(args.base), resolve_ref(args.head)
+    except ValueError as e:
+        print(e)
+        sys.exit(2)
+    entries = regression_report(rows, base_sha, head_sha, args.threshold)
+    if not entries:
+        print(f"No stored results for both {args.base} and {args.head}")
+        sys.exit(2)
+    print("\n".join(format_report(entries)))
+    sys.exit(1 if any(entry["status"] == "regression" for entry in entries) else 0)
@@ -0,0 +1,201 @@
+"""
+Memory-mapped columnar emoji database.
+
+write_emoji_db() compiles emoji-test.txt into a compact binary file holding
+fixed-width code point arrays, offset tables, the UTF-8 blob, a string pool and
+group/subgroup range tables. EmojiDatabase maps the file read-only with mmap and
+serves every column as a memoryview, so pre-forked workers share one page-cache
+copy and opening the database requires no parsing.
+
+File layout (little-endian):
+    header      magic (8s), format version (u32), section count (u32)
+    directory   per section: tag (4s), item size (u32), offset (u64), length (u64)
+    sections    8-byte aligned raw arrays
+
+Usage:
+    python emojidb.py [emoji-test.txt] [emoji.db]
+"""
+import os
+import sys
+import mmap
+import random
+import struct
+from array import array
+
+import emojiassets
+from emojiindex import EmojiIndex
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+EMOJI_DB_FILE = os.path.join("build", "assetgen", "emoji.db")
+
+DB_MAGIC = b"EMOJIDB\0"
+DB_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<4sIQQ")
+_ALIGNMENT = 8
+
+# Section tag -> (array typecode, attribute exposed by EmojiDatabase)
+SECTIONS = {
+    b"CPTS": ("I", "code_points"),
+    b"CPOF": ("I", "code_point_offsets"),
+    b"UTF8": ("B", "utf8"),
+    b"U8OF": ("I", "utf8_offsets"),
+    b"STRB": ("B", "string_blob"),
+    b"STOF": ("I", "string_offsets"),
+    b"GRID": ("B", "group_ids"),
+    b"SGID": ("H", "subgroup_ids"),
+    b"VRID": ("I", "version_ids"),
+    b"DSID": ("I", "description_ids"),
+    b"STID": ("B", "status_ids"),
+    b"GRNG": ("I", "group_range_table"),
+    b"SRNG": ("I", "subgroup_range_table"),
+}
+
+
+def _little_endian(values):
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def build_emoji_db(source=emojiassets.EMOJI_TEST_FILE):
+    """Compile emoji-test.txt into the binary database content (bytes)"""
+    tables = emojiassets.compile_emoji_tables(emojiassets.parse_emoji_test(source))
+
+    string_blob = bytearray()
+    string_offsets = [0]
+    for value in tables["strings"]:
+        string_blob += value.encode("utf-8")
+        string_offsets.append(len(string_blob))
+
+    columns = {
+        b"CPTS": tables["code_points"],
+        b"CPOF": tables["code_point_offsets"],
+        b"UTF8": tables["utf8_blob"],
+        b"U8OF": tables["utf8_offsets"],
+        b"STRB": string_blob,
+        b"STOF": string_offsets,
+        b"GRID": tables["group_ids"],
+        b"SGID": tables["subgroup_ids"],
+        b"VRID": tables["version_ids"],
+        b"DSID": tables["description_ids"],
+        b"STID": tables["status_ids"],
+        b"GRNG": [value for entry in tables["groups"] for value in entry],
+        b"SRNG": [value for entry in tables["subgroups"] for value in entry],
+    }
+
+    payloads = []
+    offset = _HEADER.size + _SECTION.size * len(columns)
+    directory = bytearray()
+    for tag, values in columns.items():
+        data = _little_endian(array(SECTIONS[tag][0], values))
+        offset += -offset % _ALIGNMENT
+        directory += _SECTION.pack(tag, data.itemsize, offset, len(data) * data.itemsize)
+        payloads.append((offset, data.tobytes()))
+        offset += len(payloads[-1][1])
+
+    out = bytearray(_HEADER.pack(DB_MAGIC, DB_FORMAT_VERSION, len(columns)) + directory)
+    for section_offset, data in payloads:
+        out += b"\0" * (section_offset - len(out))
+        out += data
+    return bytes(out)
+
+
+def write_emoji_db(source=emojiassets.EMOJI_TEST_FILE, output=EMOJI_DB_FILE):
+    """Write the database file (atomically, only when its bytes change)"""
+    return emojiassets.write_if_changed(output, build_emoji_db(source))
+
+
+class _StringPool:
+    """Lazily decoded view of the database string pool"""
+    __slots__ = ("_offsets", "_blob")
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+
+class EmojiDatabase(EmojiIndex):
+    """
+    Read-only emoji database backed by a shared memory mapping.
+
+    Supports the full EmojiIndex query API; columns are memoryviews into the
+    mapped file, so nothing is copied per process.
+    """
+
+    __slots__ = ("path", "string_blob", "string_offsets", "group_range_table",
+                 "subgroup_range_table", "_mmap")
+
+    def __init__(self, path=EMOJI_DB_FILE, seed=None):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+
+        magic, version, count = _HEADER.unpack_from(view, 0)
+        if magic != DB_MAGIC or version != DB_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an emoji database of format version {DB_FORMAT_VERSION}")
+
+        for i in range(count):
+            tag, itemsize, offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            if tag not in SECTIONS:
+                continue
+            typecode, attribute = SECTIONS[tag]
+            column = view[offset:offset + length]
+            if sys.byteorder == "big" and itemsize > 1:
+                column = _little_endian(array(typecode, column.tobytes()))
+            else:
+                column = column.cast(typecode)
+            setattr(self, attribute, column)
+
+        self.strings = _StringPool(self.string_offsets, self.string_blob)
+        self.groups, self.group_ranges = self._ranges(self.group_range_table)
+        self.subgroups, self.subgroup_ranges = self._ranges(self.subgroup_range_table)
+        self._random = random.Random(seed)
+        self._reset_caches()
+
+    def _ranges(self, table):
+        names = []
+        ranges = {}
+        for i in range(0, len(table), 3):
+            name = self.strings[table[i]]
+            names.append(name)
+            ranges[name] = (table[i + 1], table[i + 2])
+        return names, ranges
+
+    def __getstate__(self):
+        raise TypeError("EmojiDatabase is backed by a memory mapping; share the file, not the object")
+
+    def close(self):
+        """Release the memory mapping (all columns become invalid)"""
+        for attribute in [a for _, a in SECTIONS.values()] + ["utf8"]:
+            value = getattr(self, attribute, None)
+            if isinstance(value, memoryview):
+                value.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # views still referenced by callers; the mapping goes away with them
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else emojiassets.EMOJI_TEST_FILE
+    output = sys.argv[2] if len(sys.argv) > 2 else EMOJI_DB_FILE
+    written = write_emoji_db(source, output)
+    print(f"{'Generated' if written else 'Unchanged'}: {output}")
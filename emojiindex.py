@@ -0,0 +1,339 @@
+"""
+Emoji index for Python services.
+
+Provides the same queries as the C++ EmojiesLib (group/subgroup listings, counts,
+indexed access and random picks) on top of the column tables compiled by
+emojiassets.py. Groups and subgroups are contiguous in emoji-test.txt, so every
+group/subgroup maps to an index range and count, index and random-pick queries
+are O(1).
+
+Status and version columns are kept as compact ids; view() returns filtered views
+(fully_qualified_only, max_version) backed by precomputed bitmaps, whose group
+queries cost the same as the unfiltered ones.
+
+The parsed index is cached as a pickle next to the asset file and reused as long
+as the asset is unchanged, so loading it takes milliseconds.
+"""
+import os
+import pickle
+import random
+from array import array
+
+import emojiassets
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+# Bump when the pickled layout changes
+INDEX_FORMAT_VERSION = 1
+INDEX_CACHE_SUFFIX = ".index.pickle"
+
+# Groups used by get_random_emoji() - same selection as EmojiesLib::getRandomEmoji()
+RANDOM_EMOJI_GROUPS = (
+    "Smileys & Emotion",
+    "Animals & Nature",
+    "Food & Drink",
+    "Activities",
+    "Travel & Places",
+    "Objects",
+)
+
+
+class EmojiIndex:
+    """Array-backed emoji table with precomputed group/subgroup index ranges"""
+
+    __slots__ = ("utf8", "utf8_offsets", "code_points", "code_point_offsets",
+                 "group_ids", "subgroup_ids", "version_ids", "description_ids", "status_ids",
+                 "strings", "groups", "subgroups", "group_ranges", "subgroup_ranges",
+                 "_random", "_bitmaps", "_views")
+
+    def __init__(self, tables, seed=None):
+        """Build the index from emojiassets.compile_emoji_tables() output"""
+        self.utf8 = bytes(tables["utf8_blob"])
+        self.utf8_offsets = array("I", tables["utf8_offsets"])
+        self.code_points = array("I", tables["code_points"])
+        self.code_point_offsets = array("I", tables["code_point_offsets"])
+        self.group_ids = array("B", tables["group_ids"])
+        self.subgroup_ids = array("H", tables["subgroup_ids"])
+        self.version_ids = array("I", tables["version_ids"])
+        self.description_ids = array("I", tables["description_ids"])
+        self.status_ids = array("B", tables["status_ids"])
+        self.strings = list(tables["strings"])
+        self.groups = [self.strings[name] for name, _, _ in tables["groups"]]
+        self.subgroups = [self.strings[name] for name, _, _ in tables["subgroups"]]
+        self.group_ranges = {self.strings[name]: (first, last) for name, first, last in tables["groups"]}
+        self.subgroup_ranges = {self.strings[name]: (first, last) for name, first, last in tables["subgroups"]}
+        self._random = random.Random(seed)
+        self._reset_caches()
+
+    def _reset_caches(self):
+        self._bitmaps = None
+        self._views = {}
+
+    # ------------------------------------------------------------------------
+    # Construction and caching
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_asset(cls, path=emojiassets.EMOJI_TEST_FILE, cache=True, seed=None):
+        """Load the index for an emoji-test.txt file, using the pickle cache when valid"""
+        cache_path = path + INDEX_CACHE_SUFFIX
+        stat = os.stat(path)
+        key = (INDEX_FORMAT_VERSION, stat.st_size, stat.st_mtime_ns)
+        if cache:
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_key, state = pickle.load(f)
+                if cached_key == key:
+                    index = cls.__new__(cls)
+                    index.__setstate__(state)
+                    index._random = random.Random(seed)
+                    return index
+            except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+                pass
+
+        index = cls(emojiassets.compile_emoji_tables(emojiassets.parse_emoji_test(path)), seed)
+        if cache:
+            try:
+                data = pickle.dumps((key, index.__getstate__()), protocol=pickle.HIGHEST_PROTOCOL)
+                emojiassets.write_if_changed(cache_path, data)
+            except OSError:
+                pass  # read-only asset directory - the index still works, just uncached
+        return index
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith("_")}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._random = random.Random()
+        self._reset_caches()
+
+    def seed(self, seed):
+        """Reseed the random generator used by the get_random_* queries"""
+        self._random.seed(seed)
+
+    # ------------------------------------------------------------------------
+    # Per-emoji access
+    # ------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.group_ids)
+
+    def emoji(self, index):
+        """UTF-8 string of the emoji at a global index"""
+        return str(self.utf8[self.utf8_offsets[index]:self.utf8_offsets[index + 1]], "utf-8")
+
+    def emoji_code_points(self, index):
+        return tuple(self.code_points[self.code_point_offsets[index]:self.code_point_offsets[index + 1]])
+
+    def record(self, index):
+        """Full emojiassets.EmojiRecord of the emoji at a global index"""
+        return emojiassets.EmojiRecord(
+            self.emoji_code_points(index),
+            emojiassets.STATUSES[self.status_ids[index]],
+            self.groups[self.group_ids[index]],
+            self.subgroups[self.subgroup_ids[index]],
+            self.strings[self.version_ids[index]],
+            self.strings[self.description_ids[index]],
+        )
+
+    def status(self, index):
+        return emojiassets.STATUSES[self.status_ids[index]]
+
+    def version_number(self, index):
+        """Unicode emoji version of the emoji as an int, see version_number()"""
+        return self._filter_bitmaps()["versions"][self.version_ids[index]]
+
+    def _slice(self, first, last):
+        return str(self.utf8[self.utf8_offsets[first]:self.utf8_offsets[last]], "utf-8")
+
+    # ------------------------------------------------------------------------
+    # EmojiesLib compatible queries
+    # ------------------------------------------------------------------------
+
+    def get_emoji_groups_names(self):
+        return list(self.groups)
+
+    def get_emoji_subgroups_names(self):
+        return list(self.subgroups)
+
+    def get_size_of_group_items(self, group):
+        first, last = self.group_ranges.get(group, (0, 0))
+        return last - first
+
+    def get_size_of_subgroup_items(self, subgroup):
+        first, last = self.subgroup_ranges.get(subgroup, (0, 0))
+        return last - first
+
+    def get_emojies_from_group(self, group):
+        """All emojis of a group concatenated into one string (single slice of the blob)"""
+        return self._slice(*self.group_ranges.get(group, (0, 0)))
+
+    def get_emojies_from_subgroup(self, subgroup):
+        return self._slice(*self.subgroup_ranges.get(subgroup, (0, 0)))
+
+    def get_emoji_string_by_index_from_group(self, group, index):
+        first, last = self.group_ranges.get(group, (0, 0))
+        return self.emoji(first + index) if 0 <= index < last - first else ""
+
+    def get_emoji_string_by_index_from_subgroup(self, subgroup, index):
+        first, last = self.subgroup_ranges.get(subgroup, (0, 0))
+        return self.emoji(first + index) if 0 <= index < last - first else ""
+
+    def get_random_emoji_from_group(self, group):
+        first, last = self.group_ranges.get(group, (0, 0))
+        return self.emoji(self._random.randrange(first, last)) if last > first else ""
+
+    def get_random_emoji_from_subgroup(self, subgroup):
+        first, last = self.subgroup_ranges.get(subgroup, (0, 0))
+        return self.emoji(self._random.randrange(first, last)) if last > first else ""
+
+    def get_random_emoji(self):
+        return self.get_random_emoji_from_group(self._random.choice(RANDOM_EMOJI_GROUPS))
+
+    # ------------------------------------------------------------------------
+    # Filtered views
+    # ------------------------------------------------------------------------
+
+    def _filter_bitmaps(self):
+        """Bitmaps (int bitsets over global indices) per status and per version id"""
+        if self._bitmaps is None:
+            statuses = [0] * len(emojiassets.STATUSES)
+            by_version = {}
+            for i, (status_id, version_id) in enumerate(zip(self.status_ids, self.version_ids)):
+                statuses[status_id] |= 1 << i
+                by_version[version_id] = by_version.get(version_id, 0) | 1 << i
+            self._bitmaps = {
+                "statuses": statuses,
+                "by_version": by_version,
+                "versions": {v: version_number(self.strings[v]) for v in by_version},
+            }
+        return self._bitmaps
+
+    def filter_bitmap(self, statuses=None, max_version=None):
+        """Bitset of the emojis with one of statuses and version <= max_version"""
+        bitmaps = self._filter_bitmaps()
+        if statuses is None:
+            mask = (1 << len(self)) - 1
+        else:
+            mask = 0
+            for status in statuses:
+                mask |= bitmaps["statuses"][emojiassets.STATUSES.index(status)]
+        if max_version is not None:
+            limit = version_number(max_version)
+            allowed = 0
+            for version_id, bits in bitmaps["by_version"].items():
+                if bitmaps["versions"][version_id] <= limit:
+                    allowed |= bits
+            mask &= allowed
+        return mask
+
+    def view(self, fully_qualified_only=False, max_version=None, statuses=None):
+        """
+        Filtered view with the EmojiesLib query API (cached per filter).
+
+        fully_qualified_only drops component, minimally-qualified and unqualified
+        entries (the duplicates of each emoji); statuses selects explicitly;
+        max_version (e.g. 13.0 or "E13.0") drops emojis newer than the fonts support.
+        """
+        if fully_qualified_only:
+            statuses = ("fully-qualified",)
+        key = (tuple(statuses) if statuses is not None else None,
+               None if max_version is None else version_number(max_version))
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = EmojiView(self, self.filter_bitmap(statuses, max_version))
+        return view
+
+
+def version_number(version):
+    """'E13.1', '13.1' or 13.1 -> 1301 (major * 100 + minor), comparable as int"""
+    major, _, minor = str(version).lstrip("E").partition(".")
+    return int(major) * 100 + int(minor or 0)
+
+
+class EmojiView:
+    """
+    Subset of an EmojiIndex selected by a bitmap.
+
+    Per group/subgroup index lists and concatenated strings are precomputed,
+    so every query is a dictionary lookup plus O(1) work, as on the index.
+    """
+
+    __slots__ = ("index", "bitmap", "count", "_groups", "_subgroups")
+
+    def __init__(self, index, bitmap):
+        self.index = index
+        self.bitmap = bitmap
+        self.count = bin(bitmap).count("1")
+        self._groups = self._select(index.group_ranges)
+        self._subgroups = self._select(index.subgroup_ranges)
+
+    def _select(self, ranges):
+        """name -> (member indices, concatenated emoji string)"""
+        selected = {}
+        for name, (first, last) in ranges.items():
+            bits = (self.bitmap >> first) & ((1 << (last - first)) - 1)
+            members = array("I", (first + i for i in range(last - first) if bits >> i & 1))
+            selected[name] = (members, "".join(self.index.emoji(i) for i in members))
+        return selected
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, index):
+        return bool(self.bitmap >> index & 1)
+
+    def _pick(self, members, index):
+        return self.index.emoji(members[index]) if 0 <= index < len(members) else ""
+
+    def _random_pick(self, members):
+        return self.index.emoji(self.index._random.choice(members)) if members else ""
+
+    def get_emoji_groups_names(self):
+        return [name for name in self.index.groups if self._groups[name][0]]
+
+    def get_emoji_subgroups_names(self):
+        return [name for name in self.index.subgroups if self._subgroups[name][0]]
+
+    def get_size_of_group_items(self, group):
+        return len(self._groups.get(group, _EMPTY)[0])
+
+    def get_size_of_subgroup_items(self, subgroup):
+        return len(self._subgroups.get(subgroup, _EMPTY)[0])
+
+    def get_emojies_from_group(self, group):
+        return self._groups.get(group, _EMPTY)[1]
+
+    def get_emojies_from_subgroup(self, subgroup):
+        return self._subgroups.get(subgroup, _EMPTY)[1]
+
+    def get_emoji_string_by_index_from_group(self, group, index):
+        return self._pick(self._groups.get(group, _EMPTY)[0], index)
+
+    def get_emoji_string_by_index_from_subgroup(self, subgroup, index):
+        return self._pick(self._subgroups.get(subgroup, _EMPTY)[0], index)
+
+    def get_random_emoji_from_group(self, group):
+        return self._random_pick(self._groups.get(group, _EMPTY)[0])
+
+    def get_random_emoji_from_subgroup(self, subgroup):
+        return self._random_pick(self._subgroups.get(subgroup, _EMPTY)[0])
+
+    def get_random_emoji(self):
+        return self.get_random_emoji_from_group(self.index._random.choice(RANDOM_EMOJI_GROUPS))
+
+
+_EMPTY = ((), "")
+
+_default_index = None
+
+
+def default_index():
+    """Shared EmojiIndex of the workspace asset file (loaded once per process)"""
+    global _default_index
+    if _default_index is None:
+        asset = os.path.join(os.path.dirname(os.path.abspath(__file__)), emojiassets.EMOJI_TEST_FILE)
+        _default_index = EmojiIndex.from_asset(asset)
+    return _default_index
@@ -0,0 +1,117 @@
+"""
+Reverse emoji lookup and emoji tokenizer.
+
+EmojiLookup maps an emoji back to its global index (and so to its record with
+group, subgroup, status and description), keyed by code point tuple, by string
+or by UTF-8 bytes. scan() finds the emojis in arbitrary text with a
+longest-match walk over a trie of all sequences (ZWJ sequences, keycaps, flags
+and skin tone variants included); with emoji sequences at most ~10 code points
+long this is linear in the text length.
+
+Usage:
+    python emojilookup.py <text>
+"""
+import sys
+
+import emojiindex
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+# Trie node key marking the end of a sequence (never a single character)
+_END = ""
+
+
+class EmojiSpan:
+    """Emoji found in text: text[start:end] is the emoji at global index"""
+    __slots__ = ("start", "end", "index")
+
+    def __init__(self, start, end, index):
+        self.start = start
+        self.end = end
+        self.index = index
+
+    def __repr__(self):
+        return f"EmojiSpan({self.start}, {self.end}, {self.index})"
+
+
+class EmojiLookup:
+    """Hash maps and longest-match trie over every sequence of an emoji index"""
+
+    def __init__(self, index=None):
+        self.index = index if index is not None else emojiindex.default_index()
+        self.by_string = {}
+        self.by_code_points = {}
+        self._trie = {}
+        for i in range(len(self.index)):
+            emoji = self.index.emoji(i)
+            self.by_string[emoji] = i
+            self.by_code_points[self.index.emoji_code_points(i)] = i
+            node = self._trie
+            for char in emoji:
+                node = node.setdefault(char, {})
+            node[_END] = i
+
+    # ------------------------------------------------------------------------
+    # Exact lookups
+    # ------------------------------------------------------------------------
+
+    def lookup(self, emoji):
+        """Global index of an emoji string, None if it is not an emoji"""
+        return self.by_string.get(emoji)
+
+    def lookup_code_points(self, code_points):
+        return self.by_code_points.get(tuple(code_points))
+
+    def lookup_utf8(self, data):
+        try:
+            return self.by_string.get(str(data, "utf-8"))
+        except UnicodeDecodeError:
+            return None
+
+    def record(self, emoji):
+        """emojiassets.EmojiRecord of an emoji string, None if unknown"""
+        i = self.by_string.get(emoji)
+        return None if i is None else self.index.record(i)
+
+    # ------------------------------------------------------------------------
+    # Tokenizer
+    # ------------------------------------------------------------------------
+
+    def scan(self, text):
+        """Yield an EmojiSpan for every emoji in text (leftmost, longest match)"""
+        root = self._trie
+        position = 0
+        length = len(text)
+        while position < length:
+            node = root.get(text[position])
+            if node is None:
+                position += 1
+                continue
+            match_end = -1
+            match_index = None
+            cursor = position
+            while node is not None:
+                cursor += 1
+                found = node.get(_END)
+                if found is not None:
+                    match_end = cursor
+                    match_index = found
+                node = node.get(text[cursor]) if cursor < length else None
+            if match_index is None:
+                position += 1
+                continue
+            yield EmojiSpan(position, match_end, match_index)
+            position = match_end
+
+    def annotate(self, text):
+        """[(start, end, EmojiRecord)] of the emojis in text"""
+        return [(span.start, span.end, self.index.record(span.index)) for span in self.scan(text)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python emojilookup.py <text>")
+        sys.exit(1)
+    for start, end, record in EmojiLookup().annotate(" ".join(sys.argv[1:])):
+        print(f"{start:>5}:{end:<5} {record.utf8.decode('utf-8')}  {record.group} / "
+              f"{record.subgroup} / {record.description} ({record.status}, {record.version})")
@@ -0,0 +1,142 @@
+"""
+Weighted random emoji sampling with Walker alias tables.
+
+An alias table turns any discrete distribution into O(1) draws: one uniform
+index plus one biased coin flip. EmojiSampler precomputes tables for the common
+distributions over an EmojiIndex/EmojiDatabase:
+
+    uniform over emoji   every emoji equally likely
+    uniform over group   every group equally likely, then uniform inside it
+    custom weights       per emoji weights or per group/subgroup weights
+
+Draws are reproducible with a seed. sample(n) returns n draws in one call and is
+vectorized with NumPy when it is installed.
+"""
+import random
+from array import array
+
+import emojiassets
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+
+class AliasTable:
+    """Walker/Vose alias table of a discrete distribution over range(len(weights))"""
+
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights):
+        weights = [float(w) for w in weights]
+        count = len(weights)
+        total = sum(weights)
+        if count == 0 or total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("Alias table needs non-negative weights with a positive sum")
+
+        scaled = [w * count / total for w in weights]
+        self.probability = array("d", [1.0] * count)
+        self.alias = array("I", range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large[-1]
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(large.pop())
+        # Leftovers are 1.0 up to rounding error
+        for i in small + large:
+            self.probability[i] = 1.0
+
+    def __len__(self):
+        return len(self.probability)
+
+    def draw(self, rng):
+        """One sample using a random.Random"""
+        i = rng.randrange(len(self.probability))
+        return i if rng.random() < self.probability[i] else self.alias[i]
+
+    def draw_many(self, count, rng, np_rng=None):
+        """count samples; uses np_rng (numpy.random.Generator) when given"""
+        if np_rng is not None:
+            np = emojiassets.np
+            slots = np_rng.integers(0, len(self.probability), size=count)
+            coins = np_rng.random(count)
+            probability = np.frombuffer(self.probability, dtype=np.float64)
+            alias = np.frombuffer(self.alias, dtype=np.uint32)
+            return np.where(coins < probability[slots], slots, alias[slots])
+        return [self.draw(rng) for _ in range(count)]
+
+
+def range_weights(size, ranges, weights):
+    """
+    Per emoji weights from per range weights.
+
+    ranges maps a name to (first, last) as EmojiIndex.group_ranges does; the
+    weight of a range is spread evenly over its emojis. Missing names get 0.
+    """
+    result = [0.0] * size
+    for name, weight in weights.items():
+        first, last = ranges[name]
+        for i in range(first, last):
+            result[i] = weight / (last - first)
+    return result
+
+
+class EmojiSampler:
+    """Precomputed alias tables over an emoji index"""
+
+    def __init__(self, index, seed=None):
+        self.index = index
+        self._tables = {}
+        self.seed(seed)
+
+    def seed(self, seed):
+        """Reseed both the Python and (if available) the NumPy generator"""
+        self._rng = random.Random(seed)
+        self._np_rng = emojiassets.np.random.default_rng(seed) if emojiassets.NUMPY_AVAILABLE else None
+
+    def table(self, name, weights=None):
+        """
+        Alias table registered under name, built on first use.
+
+        Built-in names are 'emoji' and 'group'; any other name needs weights
+        (one per emoji) the first time it is requested.
+        """
+        table = self._tables.get(name)
+        if table is None:
+            if weights is None:
+                if name == "emoji":
+                    weights = [1.0] * len(self.index)
+                elif name == "group":
+                    weights = range_weights(len(self.index), self.index.group_ranges,
+                                            dict.fromkeys(self.index.groups, 1.0))
+                else:
+                    raise KeyError(f"No weights given for alias table '{name}'")
+            elif len(weights) != len(self.index):
+                raise ValueError(f"Expected {len(self.index)} weights, got {len(weights)}")
+            table = self._tables[name] = AliasTable(weights)
+        return table
+
+    def add_group_weights(self, name, groups=None, subgroups=None):
+        """Register a custom table from {group: weight} and/or {subgroup: weight}"""
+        weights = [0.0] * len(self.index)
+        for ranges, named in ((self.index.group_ranges, groups), (self.index.subgroup_ranges, subgroups)):
+            for i, weight in enumerate(range_weights(len(self.index), ranges, named or {})):
+                weights[i] += weight
+        self._tables.pop(name, None)
+        return self.table(name, weights)
+
+    def sample_one(self, name="emoji"):
+        """One emoji index drawn from the named distribution"""
+        return self.table(name).draw(self._rng)
+
+    def sample(self, count, name="emoji"):
+        """count emoji indices (numpy array with NumPy, list otherwise)"""
+        return self.table(name).draw_many(count, self._rng, self._np_rng)
+
+    def sample_emojis(self, count, name="emoji"):
+        """count emoji strings drawn from the named distribution"""
+        emoji = self.index.emoji
+        return [emoji(int(i)) for i in self.sample(count, name)]
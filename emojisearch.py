@@ -0,0 +1,212 @@
+"""
+Emoji search index.
+
+Finds emojis by their emoji-test.txt description ("thumbs up", "thum", "tumbs")
+using three precomputed structures:
+
+    inverted index  token -> sorted emoji indices
+    prefix array    sorted token vocabulary, bisected for autocomplete
+    trigram index   trigram -> token ids, for typo-tolerant lookup
+
+build_search_index() runs at build time (registered in emojiassets.ASSET_GENERATORS)
+and EmojiSearch loads the result lazily on the first query, rebuilding it when the
+asset's content hash no longer matches the one stored in the pickle. Emoji indices
+are the global indices used by EmojiIndex/EmojiDatabase.
+
+Usage:
+    python emojisearch.py <query>...
+"""
+import os
+import re
+import sys
+import pickle
+from array import array
+from bisect import bisect_left
+
+import emojiassets
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+SEARCH_INDEX_FILE = os.path.join("build", "assetgen", "emoji-search.pickle")
+
+# Bump when the pickled layout changes
+SEARCH_FORMAT_VERSION = 2
+
+# Minimum Dice similarity of trigram sets for a fuzzy token match
+FUZZY_THRESHOLD = 0.5
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Case-folded word tokens of a description or query"""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def trigrams(token):
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_index(source=emojiassets.EMOJI_TEST_FILE):
+    """Compile the search structures for emoji-test.txt into pickle bytes"""
+    postings = {}
+    token_counts = array("B")
+    for i, record in enumerate(emojiassets.parse_emoji_test(source)):
+        tokens = tokenize(record.description)
+        token_counts.append(min(len(tokens), 255))
+        for token in tokens:
+            entries = postings.setdefault(token, array("I"))
+            if not entries or entries[-1] != i:
+                entries.append(i)
+
+    vocabulary = sorted(postings)
+    trigram_index = {}
+    for token_id, token in enumerate(vocabulary):
+        for trigram in sorted(trigrams(token)):  # deterministic output bytes
+            trigram_index.setdefault(trigram, array("I")).append(token_id)
+
+    data = {
+        "version": SEARCH_FORMAT_VERSION,
+        # Content hash of the asset the index was built from - a stale pickle is rebuilt
+        "source_sha256": emojiassets.file_sha256(source),
+        "tokens": vocabulary,
+        "postings": [postings[token] for token in vocabulary],
+        "trigrams": trigram_index,
+        "token_counts": token_counts,
+    }
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class EmojiSearch:
+    """Lazily loaded description search over the emoji table"""
+
+    def __init__(self, path=SEARCH_INDEX_FILE, source=emojiassets.EMOJI_TEST_FILE):
+        self.path = path
+        self.source = source
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            source_sha256 = emojiassets.file_sha256(self.source)
+            try:
+                with open(self.path, "rb") as f:
+                    data = pickle.load(f)
+                if data.get("version") != SEARCH_FORMAT_VERSION:
+                    raise ValueError(f"{self.path}: unsupported search index format")
+                if source_sha256 is not None and data.get("source_sha256") != source_sha256:
+                    raise ValueError(f"{self.path}: built from a different {self.source}")
+            except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+                # Not generated yet, stale format or stale asset - rebuild and refresh the cache
+                content = build_search_index(self.source)
+                data = pickle.loads(content)
+                try:
+                    emojiassets.write_if_changed(self.path, content)
+                except OSError:
+                    pass  # read-only build directory - search still works, just uncached
+            self._data = data
+        return self._data
+
+    # ------------------------------------------------------------------------
+    # Token level lookups
+    # ------------------------------------------------------------------------
+
+    def _token_id(self, token):
+        tokens = self._load()["tokens"]
+        i = bisect_left(tokens, token)
+        return i if i < len(tokens) and tokens[i] == token else None
+
+    def _prefix_ids(self, prefix):
+        tokens = self._load()["tokens"]
+        first = bisect_left(tokens, prefix)
+        last = bisect_left(tokens, prefix + "\U0010ffff", first)
+        return range(first, last)
+
+    def complete(self, prefix, limit=10):
+        """Vocabulary tokens starting with prefix, most frequent first"""
+        data = self._load()
+        ids = self._prefix_ids(prefix.casefold())
+        ranked = sorted(ids, key=lambda i: (-len(data["postings"][i]), data["tokens"][i]))
+        return [data["tokens"][i] for i in ranked[:limit]]
+
+    def fuzzy_tokens(self, token, threshold=FUZZY_THRESHOLD, limit=5):
+        """Vocabulary tokens similar to token (Dice coefficient of trigram sets)"""
+        data = self._load()
+        query = trigrams(token.casefold())
+        shared = {}
+        for trigram in query:
+            for token_id in data["trigrams"].get(trigram, ()):
+                shared[token_id] = shared.get(token_id, 0) + 1
+        scored = []
+        for token_id, count in shared.items():
+            candidate = data["tokens"][token_id]
+            score = 2.0 * count / (len(query) + len(candidate))
+            if score >= threshold:
+                scored.append((-score, candidate, token_id))
+        scored.sort()
+        return [token_id for _, _, token_id in scored[:limit]]
+
+    # ------------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------------
+
+    def _matches(self, token, prefix, fuzzy):
+        postings = self._load()["postings"]
+        token_id = self._token_id(token)
+        ids = [] if token_id is None else [token_id]
+        if prefix:
+            ids = self._prefix_ids(token)
+        if not ids and fuzzy:
+            ids = self.fuzzy_tokens(token)
+        matches = set()
+        for token_id in ids:
+            matches.update(postings[token_id])
+        return matches
+
+    def search(self, query, limit=20, prefix=True, fuzzy=True):
+        """
+        Emoji indices whose description matches every query token.
+
+        The last token also matches as a prefix (autocomplete); tokens without
+        an exact match fall back to trigram lookup. Shorter descriptions rank
+        first, so "thumbs up" returns 👍 before 👍🏻.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        result = None
+        for position, token in enumerate(tokens):
+            matches = self._matches(token, prefix and position == len(tokens) - 1, fuzzy)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        token_counts = self._load()["token_counts"]
+        return sorted(result, key=lambda i: (token_counts[i], i))[:limit]
+
+    def search_emojis(self, query, limit=20, index=None):
+        """Emoji strings for search(); index defaults to emojiindex.default_index()"""
+        if index is None:
+            import emojiindex
+            index = emojiindex.default_index()
+        return [index.emoji(i) for i in self.search(query, limit)]
+
+
+_default_search = None
+
+
+def default_search():
+    """Shared EmojiSearch of the workspace (loaded on its first query)"""
+    global _default_search
+    if _default_search is None:
+        workspace = os.path.dirname(os.path.abspath(__file__))
+        _default_search = EmojiSearch(os.path.join(workspace, SEARCH_INDEX_FILE),
+                                      os.path.join(workspace, emojiassets.EMOJI_TEST_FILE))
+    return _default_search
+
+
+if __name__ == "__main__":
+    query = " ".join(sys.argv[1:])
+    if not query:
+        print("Usage: python emojisearch.py <query>...")
+        sys.exit(1)
+    print(" ".join(default_search().search_emojis(query)))
@@ -0,0 +1,441 @@
+"""
+Parallel gcov coverage aggregator.
+
+Replaces the per-report gcovr runs of the coverage tasks: every .gcda file of a
+build tree is processed by `gcov --json-format --stdout` in parallel (one
+process per translation unit, run in the object directory - the controller
+never chdirs), the per-TU results are cached keyed on the .gcda/.gcno mtimes,
+and the line/branch/function counts are merged into one model per source file
+(headers are instrumented in every TU including them). HTML, Cobertura XML and
+the console summary are all rendered from that single model.
+
+    build/<...>/coverage.html            index, one coverage.<n>.html per source file
+    build/<...>/coverage.xml             Cobertura XML (CI)
+    build/<...>/coverage-cache.json      per-TU gcov results
+
+Usage:
+    python gcovreport.py <build dir> [--root <source dir>] [--html] [--xml] [-j N]
+"""
+import os
+import re
+import sys
+import json
+import html
+import subprocess
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+HTML_FILE = "coverage.html"
+XML_FILE = "coverage.xml"
+CACHE_FILE = "coverage-cache.json"
+CACHE_FORMAT_VERSION = 2
+
+# Same exclusions as the gcovr targets in cmake/tmplt-coverage.cmake
+EXCLUDE_PATTERNS = (r".*/tests/.*", r".*/test/.*", r".*/external/.*", r".*/third_party/.*", r".*/build/.*")
+
+
+def _add_counts(merged, counts):
+    """Add branch counts element by element, appending the ones merged has no slot for"""
+    for i, count in enumerate(counts):
+        if i < len(merged):
+            merged[i] += count
+        else:
+            merged.append(count)
+
+
+class FileCoverage:
+    """Merged coverage of one source file"""
+    __slots__ = ("path", "lines", "branches", "functions")
+
+    def __init__(self, path):
+        self.path = path
+        self.lines = {}         # line number -> execution count
+        self.branches = {}      # line number -> [branch counts]
+        self.functions = {}     # (start line, name) -> execution count
+
+    def merge(self, data):
+        for number, count in data["lines"].items():
+            number = int(number)
+            self.lines[number] = self.lines.get(number, 0) + count
+        for number, counts in data["branches"].items():
+            _add_counts(self.branches.setdefault(int(number), []), counts)
+        for line, name, count in data["functions"]:
+            key = (line, name)
+            self.functions[key] = self.functions.get(key, 0) + count
+
+    def line_totals(self):
+        return sum(1 for count in self.lines.values() if count), len(self.lines)
+
+    def branch_totals(self):
+        counts = [count for branch in self.branches.values() for count in branch]
+        return sum(1 for count in counts if count), len(counts)
+
+    def function_totals(self):
+        return sum(1 for count in self.functions.values() if count), len(self.functions)
+
+    def missing_ranges(self):
+        """'12-14,20' style list of lines never executed"""
+        ranges = []
+        for number in sorted(n for n, count in self.lines.items() if not count):
+            if ranges and number == ranges[-1][1] + 1:
+                ranges[-1][1] = number
+            else:
+                ranges.append([number, number])
+        return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in ranges)
+
+
+class CoverageModel:
+    """Source root + {relative path: FileCoverage}; timestamp is the newest .gcda mtime"""
+
+    def __init__(self, root, timestamp=0):
+        self.root = root
+        self.timestamp = timestamp
+        self.files = {}
+
+    def file(self, path):
+        coverage = self.files.get(path)
+        if coverage is None:
+            coverage = self.files[path] = FileCoverage(path)
+        return coverage
+
+    def totals(self):
+        """((covered, total) lines, branches, functions)"""
+        sums = [[0, 0], [0, 0], [0, 0]]
+        for coverage in self.files.values():
+            for acc, (covered, total) in zip(sums, (coverage.line_totals(), coverage.branch_totals(),
+                                                    coverage.function_totals())):
+                acc[0] += covered
+                acc[1] += total
+        return tuple(tuple(acc) for acc in sums)
+
+
+def percent(covered, total):
+    return 100.0 * covered / total if total else 100.0
+
+
+# ----------------------------------------------------------------------------
+# Collection
+# ----------------------------------------------------------------------------
+
+def find_gcda(build_dir):
+    found = []
+    for dirpath, _, filenames in os.walk(build_dir):
+        found.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(".gcda"))
+    return sorted(found)
+
+
+def _stamp(gcda):
+    gcno = gcda[:-len(".gcda")] + ".gcno"
+    stat = os.stat(gcda)
+    gcno_mtime = os.stat(gcno).st_mtime_ns if os.path.exists(gcno) else 0
+    return [stat.st_mtime_ns, stat.st_size, gcno_mtime]
+
+
+def run_gcov(gcda, gcov="gcov"):
+    """
+    Run gcov on one .gcda in its object directory.
+
+    Returns:
+        dict: {absolute source path: {"lines", "branches", "functions"}}
+    """
+    object_dir = os.path.dirname(gcda)
+    result = subprocess.run([gcov, "--json-format", "--stdout", "--branch-probabilities", "--object-directory",
+                             object_dir, gcda], cwd=object_dir, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"gcov failed for {gcda}: {result.stderr.strip()}")
+
+    files = {}
+    for document in result.stdout.splitlines():
+        if not document.strip():
+            continue
+        report = json.loads(document)
+        cwd = report.get("current_working_directory", object_dir)
+        for entry in report.get("files", []):
+            path = os.path.normpath(os.path.join(cwd, entry["file"]))
+            data = files.setdefault(path, {"lines": {}, "branches": {}, "functions": []})
+            for line in entry.get("lines", []):
+                number = str(line["line_number"])
+                data["lines"][number] = data["lines"].get(number, 0) + line["count"]
+                branches = [branch["count"] for branch in line.get("branches", []) if not branch.get("throw")]
+                if branches:
+                    # A line reported more than once (e.g. per template instance) accumulates
+                    _add_counts(data["branches"].setdefault(number, []), branches)
+            data["functions"].extend([function["start_line"], function.get("demangled_name", function["name"]),
+                                      function["execution_count"]] for function in entry.get("functions", []))
+    return files
+
+
+def _gcov_or_error(gcda, gcov):
+    try:
+        return run_gcov(gcda, gcov), None
+    except (RuntimeError, OSError, ValueError) as e:
+        return None, str(e)
+
+
+def collect(build_dir, jobs=None, gcov="gcov", use_cache=True):
+    """
+    gcov results of every TU of a build tree, from the cache when the .gcda is unchanged.
+    A TU gcov fails on (e.g. a .gcda left over from an older build) is reported and
+    skipped; it is not cached, so it is retried on the next run.
+
+    Returns:
+        tuple: ([per-TU result dicts], number of TUs processed by gcov, [(gcda, error)],
+                newest .gcda mtime in seconds)
+    """
+    cache_path = os.path.join(build_dir, CACHE_FILE)
+    cache = {}
+    if use_cache:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") != CACHE_FORMAT_VERSION:
+                cache = {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+    entries = cache.get("entries", {})
+
+    stale = []
+    fresh = {}
+    newest = 0
+    for gcda in find_gcda(build_dir):
+        stamp = _stamp(gcda)
+        newest = max(newest, stamp[0])
+        entry = entries.get(gcda)
+        if entry is not None and entry["stamp"] == stamp:
+            fresh[gcda] = entry
+        else:
+            stale.append((gcda, stamp))
+
+    errors = []
+    if stale:
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            for (gcda, stamp), (files, error) in zip(stale, pool.map(lambda item: _gcov_or_error(item[0], gcov),
+                                                                     stale)):
+                if error is None:
+                    fresh[gcda] = {"stamp": stamp, "files": files}
+                else:
+                    errors.append((gcda, error))
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_FORMAT_VERSION, "entries": fresh}, f)
+    return [fresh[gcda]["files"] for gcda in sorted(fresh)], len(stale), errors, newest // 1_000_000_000
+
+
+def aggregate(results, root, build_dir, excludes=EXCLUDE_PATTERNS, timestamp=0):
+    """Merge per-TU results into a CoverageModel of the sources under root"""
+    root = os.path.realpath(root)
+    build_dir = os.path.realpath(build_dir)
+    patterns = [re.compile(pattern) for pattern in excludes]
+    model = CoverageModel(root, timestamp)
+    for files in results:
+        for path, data in files.items():
+            real = os.path.realpath(path)
+            if not real.startswith(root + os.sep) or real.startswith(build_dir + os.sep):
+                continue
+            relative = os.path.relpath(real, root).replace(os.sep, "/")
+            if any(pattern.match("/" + relative) for pattern in patterns):
+                continue
+            model.file(relative).merge(data)
+    return model
+
+
+# ----------------------------------------------------------------------------
+# Reports
+# ----------------------------------------------------------------------------
+
+def summary_lines(model):
+    lines = [f"{'File':<50}{'Lines':>8}{'Exec':>8}{'Cover':>8}{'Branch':>8}{'Func':>8}  Missing"]
+    for path in sorted(model.files):
+        coverage = model.files[path]
+        covered, total = coverage.line_totals()
+        name = path if len(path) <= 48 else "..." + path[-45:]
+        lines.append(f"{name:<50}{total:>8}{covered:>8}{percent(covered, total):>7.1f}%"
+                     f"{percent(*coverage.branch_totals()):>7.1f}%{percent(*coverage.function_totals()):>7.1f}%"
+                     f"  {coverage.missing_ranges()}")
+    (covered, total), branches, functions = model.totals()
+    lines.append(f"{'TOTAL':<50}{total:>8}{covered:>8}{percent(covered, total):>7.1f}%"
+                 f"{percent(*branches):>7.1f}%{percent(*functions):>7.1f}%")
+    return lines
+
+
+def cobertura_xml(model):
+    (lines_covered, lines_valid), (branches_covered, branches_valid), _ = model.totals()
+    root = ET.Element("coverage", {
+        "line-rate": f"{percent(lines_covered, lines_valid) / 100:.4f}",
+        "branch-rate": f"{percent(branches_covered, branches_valid) / 100:.4f}",
+        "lines-covered": str(lines_covered), "lines-valid": str(lines_valid),
+        "branches-covered": str(branches_covered), "branches-valid": str(branches_valid),
+        "complexity": "0", "timestamp": str(model.timestamp), "version": "gcovreport"})
+    ET.SubElement(ET.SubElement(root, "sources"), "source").text = model.root
+    packages = ET.SubElement(root, "packages")
+
+    by_package = {}
+    for path in sorted(model.files):
+        by_package.setdefault(os.path.dirname(path) or ".", []).append(model.files[path])
+    for name, files in sorted(by_package.items()):
+        package_lines = [0, 0]
+        package_branches = [0, 0]
+        package = ET.SubElement(packages, "package", {"name": name.replace("/", "."), "complexity": "0"})
+        classes = ET.SubElement(package, "classes")
+        for coverage in files:
+            covered, total = coverage.line_totals()
+            b_covered, b_total = coverage.branch_totals()
+            package_lines[0] += covered
+            package_lines[1] += total
+            package_branches[0] += b_covered
+            package_branches[1] += b_total
+            cls = ET.SubElement(classes, "class", {
+                "name": os.path.basename(coverage.path).replace(".", "_"), "filename": coverage.path,
+                "line-rate": f"{percent(covered, total) / 100:.4f}",
+                "branch-rate": f"{percent(b_covered, b_total) / 100:.4f}", "complexity": "0"})
+            ET.SubElement(cls, "methods")
+            lines = ET.SubElement(cls, "lines")
+            for number in sorted(coverage.lines):
+                attributes = {"number": str(number), "hits": str(coverage.lines[number]), "branch": "false"}
+                branches = coverage.branches.get(number)
+                if branches:
+                    taken = sum(1 for count in branches if count)
+                    attributes["branch"] = "true"
+                    attributes["condition-coverage"] = (f"{percent(taken, len(branches)):.0f}% "
+                                                        f"({taken}/{len(branches)})")
+                ET.SubElement(lines, "line", attributes)
+        package.set("line-rate", f"{percent(*package_lines) / 100:.4f}")
+        package.set("branch-rate", f"{percent(*package_branches) / 100:.4f}")
+
+    ET.indent(root)
+    return '<?xml version="1.0" ?>\n' + ET.tostring(root, encoding="unicode") + "\n"
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title><style>
+body {{ font-family: sans-serif; margin: 1.5em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 2px 10px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+pre {{ margin: 0; }}
+.src td {{ text-align: left; font-family: monospace; white-space: pre; padding: 0 8px; }}
+.src td.n, .src td.c {{ text-align: right; color: #666; }}
+.hit {{ background: #dfd; }} .miss {{ background: #fdd; }} .part {{ background: #ffd; }}
+.low {{ color: #c00; }} .mid {{ color: #b80; }} .high {{ color: #080; }}
+</style></head><body>
+"""
+
+
+def _rate_class(value):
+    return "high" if value >= 90 else "mid" if value >= 75 else "low"
+
+
+def _page_name(i):
+    return f"coverage.{i}.html"
+
+
+def html_pages(model):
+    """{file name: html} - index plus one detail page per source file"""
+    pages = {}
+    rows = []
+    (covered, total), branches, functions = model.totals()
+    for i, path in enumerate(sorted(model.files)):
+        coverage = model.files[path]
+        line_rate = percent(*coverage.line_totals())
+        rows.append(f"<tr><td><a href=\"{_page_name(i)}\">{html.escape(path)}</a></td>"
+                    f"<td class=\"{_rate_class(line_rate)}\">{line_rate:.1f}%</td>"
+                    f"<td>{coverage.line_totals()[0]} / {coverage.line_totals()[1]}</td>"
+                    f"<td>{percent(*coverage.branch_totals()):.1f}%</td>"
+                    f"<td>{percent(*coverage.function_totals()):.1f}%</td></tr>")
+        pages[_page_name(i)] = _html_source_page(model, coverage)
+    line_rate = percent(covered, total)
+    pages[HTML_FILE] = (_HTML_HEAD.format(title="Coverage") +
+                        f"<h1>Coverage</h1><p>{html.escape(model.root)}</p>"
+                        f"<p>Lines: <b class=\"{_rate_class(line_rate)}\">{line_rate:.1f}%</b> ({covered} / {total})"
+                        f" &middot; Branches: {percent(*branches):.1f}% &middot; Functions: {percent(*functions):.1f}%</p>"
+                        "<table><tr><th>File</th><th>Lines</th><th></th><th>Branches</th><th>Functions</th></tr>"
+                        + "\n".join(rows) + "</table></body></html>\n")
+    return pages
+
+
+def _html_source_page(model, coverage):
+    try:
+        with open(os.path.join(model.root, coverage.path), "r", encoding="utf-8", errors="replace") as f:
+            source = f.read().splitlines()
+    except OSError:
+        source = []
+    rows = []
+    for number, text in enumerate(source, 1):
+        count = coverage.lines.get(number)
+        css = ""
+        if count is not None:
+            css = "miss" if not count else "hit"
+            branches = coverage.branches.get(number)
+            if count and branches and not all(branches):
+                css = "part"
+        rows.append(f"<tr class=\"{css}\"><td class=\"n\">{number}</td>"
+                    f"<td class=\"c\">{'' if count is None else count}</td><td>{html.escape(text)}</td></tr>")
+    covered, total = coverage.line_totals()
+    return (_HTML_HEAD.format(title=html.escape(coverage.path)) +
+            f"<p><a href=\"{HTML_FILE}\">&larr; index</a></p><h2>{html.escape(coverage.path)}</h2>"
+            f"<p>Lines: {percent(covered, total):.1f}% ({covered} / {total})</p>"
+            "<table class=\"src\">" + "\n".join(rows) + "</table></body></html>\n")
+
+
+def _write_if_changed(path, content):
+    """Skip unchanged outputs so an incremental run rewrites only what changed"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+def generate(build_dir, root, html_report=False, xml_report=False, jobs=None):
+    """
+    Collect, aggregate and render the requested reports in one pass.
+
+    Returns:
+        tuple: (CoverageModel, number of TUs processed by gcov, number of TUs in total,
+                [(gcda, error)] of the TUs that were skipped)
+    """
+    results, processed, errors, timestamp = collect(build_dir, jobs)
+    model = aggregate(results, root, build_dir, timestamp=timestamp)
+    if html_report:
+        for name, content in html_pages(model).items():
+            _write_if_changed(os.path.join(build_dir, name), content)
+    if xml_report:
+        _write_if_changed(os.path.join(build_dir, XML_FILE), cobertura_xml(model))
+    return model, processed, len(results) + len(errors), errors
+
+
+def reset(build_dir):
+    """Delete the .gcda counters (and the cache built from them)"""
+    removed = 0
+    for gcda in find_gcda(build_dir):
+        os.remove(gcda)
+        removed += 1
+    cache = os.path.join(build_dir, CACHE_FILE)
+    if os.path.exists(cache):
+        os.remove(cache)
+    return removed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aggregate gcov coverage of a build tree")
+    parser.add_argument("build_dir")
+    parser.add_argument("--root", default=os.getcwd(), help="source root (default: current directory)")
+    parser.add_argument("--html", action="store_true")
+    parser.add_argument("--xml", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int)
+    args = parser.parse_args()
+
+    model, processed, total, errors = generate(args.build_dir, args.root, args.html, args.xml, args.jobs)
+    for gcda, error in errors:
+        print(f"Skipped {gcda}: {error}", file=sys.stderr)
+    print("\n".join(summary_lines(model)))
+    print(f"({processed} of {total} translation units processed by gcov, the rest from cache)")
+    sys.exit(0)
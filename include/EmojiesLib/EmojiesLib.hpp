@@ -31,7 +31,9 @@ namespace dotname {
 
   public:
     EmojiesLib ();
-    EmojiesLib (const std::filesystem::path& assetsPath);
+    // The emoji map is built from the precompiled tables; parseEmojiTestFile = true
+    // parses <assetsPath>/emoji-test.txt at runtime instead (e.g. a newer Unicode release)
+    EmojiesLib (const std::filesystem::path& assetsPath, bool parseEmojiTestFile = false);
     ~EmojiesLib ();
     std::string& getEmojiStringCharByCodePoint (char32_t* emojiCodePoints, size_t length);
     char8_t& getEmojiChar8_tCharByCodePoint (char32_t* emojiCodePoints, size_t length);
@@ -75,6 +77,7 @@ namespace dotname {
 
     void constructEmojiPropertiesMap (std::map<int, EmojiPropertiesStructure>& epm,
                                       std::istream& file);
+    void constructEmojiPropertiesMapFromTables (std::map<int, EmojiPropertiesStructure>& epm);
     char8_t* encodeUtf8 (char32_t emojiCodePoint, char8_t* buffer8);
     char8_t* encodeUtf8Sequence (const char32_t* emojiCodePoints, size_t length, char8_t* buffer8);
   };
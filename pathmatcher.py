@@ -0,0 +1,189 @@
+"""
+Path matching shared by the tree walkers (formatters, linters, upgrader, public sync).
+
+Patterns are gitignore-style globs on relative posix paths:
+
+    **/*.cpp        ** spans directories, * ? and [...] stay within one path component
+    src/            a directory (as include: everything below it)
+    build/          as exclude: a directory called build at any level
+    *.tmp           as exclude: a file or directory with a matching name at any level
+    doc/html/       as exclude: a / before the end anchors it at the root
+    /build/         as exclude: a leading / anchors it at the root too
+    **/doc/html/    as exclude: a leading **/ matches at any level again
+    [!._]*.py       a character class, [!...] negated; it never matches /
+
+All includes are compiled into one anchored regular expression and all
+excludes into one regular expression searched at path component boundaries,
+so a path is tested with two regex calls however many patterns there are.
+walk() uses os.scandir and prunes a directory as soon as it is excluded or no
+include can select anything below it - a large build/ tree is never entered.
+
+Usage:
+    python pathmatcher.py ROOT [INCLUDE ...] [!EXCLUDE ...]
+"""
+import os
+import re
+import sys
+import time
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+
+def _class_regex(pattern, i):
+    """(regex, end index) of the [...] class starting at pattern[i], (None, i) if unterminated"""
+    j = i + 1
+    if j < len(pattern) and pattern[j] in "!^":
+        j += 1
+    if j < len(pattern) and pattern[j] == "]":
+        j += 1
+    end = pattern.find("]", j)
+    if end < 0:
+        return None, i
+    negated = pattern[i + 1] in "!^"
+    body = pattern[i + 2 if negated else i + 1:end]
+    body = "".join("\\" + c if c in "\\[]^" else c for c in body.replace("/", ""))
+    if negated:
+        return "[^/" + body + "]", end + 1
+    return ("[" + body + "]" if body else "(?!)"), end + 1
+
+
+def glob_regex(pattern):
+    """Glob -> regex body: ** spans directories, * ? and [...] stay within one"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "[":
+            regex, end = _class_regex(pattern, i)
+            if regex is not None:
+                out.append(regex)
+                i = end
+                continue
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def _descend_rule(pattern):
+    """
+    (literal directory prefix, open) of an include pattern: matches can only lie
+    in the prefix directory itself, or anywhere below it when open.
+    """
+    parts = pattern.rstrip("/").split("/")
+    directories = parts if pattern.endswith("/") else parts[:-1]
+    literal = []
+    for part in directories:
+        if any(c in part for c in "*?["):
+            return "/".join(literal), True
+        literal.append(part)
+    return "/".join(literal), pattern.endswith("/") or "**" in parts[-1]
+
+
+def _exclude_regex(pattern):
+    """Exclude pattern -> regex searched from a component boundary ('name/' only matches directories)"""
+    body = pattern.lstrip("/")
+    anchored = pattern.startswith("/") or ("/" in body.rstrip("/") and not body.startswith("**/"))
+    if body.startswith("**/"):
+        body = body[3:]
+    directory_only = body.endswith("/")
+    regex = glob_regex(body.rstrip("/")) + ("/" if directory_only else "(?:/|$)")
+    return ("^" if anchored else "(?:^|/)") + regex
+
+
+class PathMatcher:
+    """
+    Compiled include/exclude patterns. includes=None selects every file that
+    is not excluded.
+    """
+
+    def __init__(self, includes=None, excludes=()):
+        self.includes = None if includes is None else list(includes)
+        self.excludes = list(excludes)
+        self._include = None
+        self._descend = None
+        if self.includes is not None:
+            include_parts = []
+            self._descend = []
+            for pattern in self.includes:
+                pattern = pattern.lstrip("/")
+                include_parts.append(glob_regex(pattern) + (".*" if pattern.endswith("/") else ""))
+                self._descend.append(_descend_rule(pattern))
+            self._include = re.compile("^(?:" + "|".join(include_parts) + ")$") if include_parts else None
+        exclude_parts = [_exclude_regex(pattern) for pattern in self.excludes]
+        self._exclude = re.compile("|".join(f"(?:{part})" for part in exclude_parts)) if exclude_parts else None
+
+    def excluded(self, path):
+        """True for a path that is excluded itself or lies in an excluded directory"""
+        return bool(self._exclude and self._exclude.search(path))
+
+    def matches(self, path):
+        """True for a file (relative posix path) that is selected"""
+        if self._descend is not None and not (self._include and self._include.match(path)):
+            return False
+        return not self.excluded(path)
+
+    def descend(self, directory):
+        """True if files below a directory (relative posix path) can be selected"""
+        if self.excluded(directory + "/"):
+            return False
+        if self._descend is None:
+            return True
+        for prefix, open_below in self._descend:
+            if prefix == directory or prefix.startswith(directory + "/"):
+                return True
+            if open_below and (not prefix or directory.startswith(prefix + "/")):
+                return True
+        return False
+
+    def walk(self, root, skip=()):
+        """Yield (relative posix path, os.DirEntry) of the selected files below root"""
+        stack = [("", root)]
+        while stack:
+            relative_dir, directory = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name, reverse=True)
+            except OSError:
+                continue
+            for entry in entries:
+                relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if relative not in skip and self.descend(relative):
+                        stack.append((relative, entry.path))
+                elif entry.is_file() and self.matches(relative):
+                    yield relative, entry
+
+    def scan(self, root, skip=()):
+        """{relative path: os.stat_result} of the selected files below root"""
+        return {relative: entry.stat() for relative, entry in self.walk(root, skip)}
+
+    def files(self, root, skip=()):
+        """Full paths of the selected files below root, sorted"""
+        return sorted(entry.path for _, entry in self.walk(root, skip))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python pathmatcher.py ROOT [INCLUDE ...] [!EXCLUDE ...]")
+        sys.exit(1)
+    patterns = sys.argv[2:]
+    includes = [p for p in patterns if not p.startswith("!")]
+    matcher = PathMatcher(includes or None, [p[1:] for p in patterns if p.startswith("!")])
+    start = time.perf_counter()
+    selected = matcher.files(sys.argv[1])
+    elapsed = time.perf_counter() - start
+    for path in selected:
+        print(path)
+    print(f"{len(selected)} files ({elapsed * 1000:.1f} ms)", file=sys.stderr)
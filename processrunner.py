@@ -0,0 +1,514 @@
+"""
+asyncio process runner for the controller.
+
+Runs one or many commands concurrently (bounded by max_concurrency), drains
+stdout and stderr of every child at the same time (no pipe deadlocks) and
+writes them line by line with a per-command prefix. Every command can have a
+timeout; on timeout or cancellation (Ctrl+C, fail_fast) the child's whole
+process group (for passthrough commands, which stay in the controller's group
+for the terminal: the child and all its descendants) is terminated, then
+killed after a grace period.
+
+Commands given as a string are only run through /bin/bash when they use shell
+features (&&, pipes, redirections, variables, globs, `source`, ...); otherwise
+they are split and executed directly. On Windows a string always goes to
+cmd.exe unchanged, as it did with subprocess(shell=True).
+
+On POSIX the children are reaped with os.wait4(), so every ProcessResult has
+the exit status plus the resource usage of the child: wall time, user/system
+CPU time and max RSS. Linux carries the high-water mark across exec, so max
+RSS never reads below the footprint of the forking controller (~20 MB).
+
+Usage:
+    python processrunner.py [-j N] [--timeout S] "<command>" ["<command>" ...]
+"""
+import os
+import re
+import sys
+import time
+import shlex
+import signal
+import asyncio
+import platform
+import subprocess
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+IS_WINDOWS = platform.system().lower() == "windows"
+DEFAULT_SHELL = "C:\\Windows\\System32\\cmd.exe" if IS_WINDOWS else "/bin/bash"
+KILL_GRACE = 5.0            # seconds between SIGTERM and SIGKILL
+READ_CHUNK_SIZE = 64 * 1024
+TAIL_LINES = 50             # last output lines kept in ProcessResult.tail
+PREFIX_COLORS = ("\033[0;36m", "\033[0;35m", "\033[0;33m", "\033[0;32m", "\033[1;34m", "\033[0;34m")
+STDERR_COLOR = "\033[0;31m"
+NC = "\033[0m"
+
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`*?\[\]{}~!\n]" + (r"|%" if IS_WINDOWS else ""))
+_SHELL_BUILTINS = {"source", ".", "cd", "export", "set", "unset", "alias", "call", "exit"}
+
+
+_hooks = []
+
+
+def add_hook(hook):
+    """
+    Observe every command: hook(command) is called when a command starts and may
+    return a callable that receives the ProcessResult when it has finished.
+    """
+    _hooks.append(hook)
+
+
+class Command:
+    """
+    A command to run.
+
+    cmd         str or argument list
+    name        output prefix (default: first word of the command)
+    shell       None = only when needed, True = DEFAULT_SHELL, or a shell executable
+    timeout     seconds, None = no limit
+    passthrough child inherits the console (no prefixing or capture; tools keep tty colors)
+    """
+    __slots__ = ("cmd", "name", "cwd", "env", "shell", "timeout", "passthrough")
+
+    def __init__(self, cmd, name=None, cwd=None, env=None, shell=None, timeout=None, passthrough=False):
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.shell = shell
+        self.timeout = timeout
+        self.passthrough = passthrough
+        if name is None:
+            words = cmd.split() if isinstance(cmd, str) else [str(arg) for arg in cmd]
+            name = os.path.basename(words[0]) if words else "process"
+        self.name = name
+
+    def display(self):
+        return self.cmd if isinstance(self.cmd, str) else " ".join(shlex.quote(str(arg)) for arg in self.cmd)
+
+
+class ProcessResult:
+    __slots__ = ("name", "cmd", "returncode", "duration", "user_time", "system_time", "max_rss_kb",
+                 "timed_out", "cancelled", "tail")
+
+    def __init__(self, name, cmd):
+        self.name = name
+        self.cmd = cmd
+        self.returncode = None
+        self.duration = 0.0
+        self.user_time = None       # seconds (POSIX only)
+        self.system_time = None
+        self.max_rss_kb = None
+        self.timed_out = False
+        self.cancelled = False
+        self.tail = []
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out and not self.cancelled
+
+    def status(self):
+        if self.cancelled:
+            return "cancelled"
+        if self.timed_out:
+            return "timeout"
+        return "ok" if self.returncode == 0 else f"exit {self.returncode}"
+
+
+def needs_shell(cmd):
+    """True if a command string uses shell syntax or a shell builtin"""
+    words = cmd.split()
+    return bool(_SHELL_SYNTAX.search(cmd)) or (bool(words) and words[0] in _SHELL_BUILTINS)
+
+
+def popen_arguments(command):
+    """(args, extra Popen keyword arguments) for a Command"""
+    cmd = command.cmd
+    shell = command.shell
+    if isinstance(cmd, str) and shell is None:
+        shell = needs_shell(cmd)
+    if shell:
+        executable = DEFAULT_SHELL if shell is True else shell
+        if IS_WINDOWS:
+            return cmd if isinstance(cmd, str) else subprocess.list2cmdline(cmd), {"shell": True}
+        return [executable, "-c", cmd if isinstance(cmd, str) else shlex.join(map(str, cmd))], {}
+    if isinstance(cmd, str):
+        if IS_WINDOWS:
+            # Windows parses the command line itself - hand the string over unchanged
+            return cmd, {"shell": True}
+        return shlex.split(cmd), {}
+    return [str(arg) for arg in cmd], {}
+
+
+class OutputMux:
+    """Writes prefixed lines of many children to one stream"""
+
+    def __init__(self, stream=None, prefix=True, colors=True):
+        self.stream = stream if stream is not None else sys.stdout
+        self.prefix = prefix
+        self.colors = colors
+        self._width = 0
+        self._palette = {}
+
+    def register(self, name):
+        self._width = max(self._width, len(name))
+        self._palette.setdefault(name, PREFIX_COLORS[len(self._palette) % len(PREFIX_COLORS)])
+
+    def write(self, name, line, is_stderr=False):
+        if not self.prefix:
+            text = line
+        elif self.colors:
+            text = f"{self._palette.get(name, '')}[{name:<{self._width}}]{NC} " + \
+                   (f"{STDERR_COLOR}{line}{NC}" if is_stderr else line)
+        else:
+            text = f"[{name:<{self._width}}] {line}"
+        self.stream.write(text + "\n")
+        self.stream.flush()
+
+
+# ----------------------------------------------------------------------------
+# Child handling
+# ----------------------------------------------------------------------------
+
+async def _pump(pipe, name, mux, tail, is_stderr):
+    """Read a child pipe to EOF, emitting complete lines"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=READ_CHUNK_SIZE, loop=loop)
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader, loop=loop), pipe)
+    pending = b""
+    try:
+        while True:
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                _emit(line, name, mux, tail, is_stderr)
+        if pending:
+            _emit(pending, name, mux, tail, is_stderr)
+    finally:
+        transport.close()
+
+
+def _emit(raw, name, mux, tail, is_stderr):
+    line = raw.rstrip(b"\r").decode("utf-8", errors="replace")
+    tail.append(line)
+    if len(tail) > TAIL_LINES:
+        del tail[0]
+    mux.write(name, line, is_stderr)
+
+
+async def _wait4(pid):
+    """Reap a child with os.wait4 without blocking the loop -> (status, rusage)"""
+    loop = asyncio.get_running_loop()
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pidfd = None
+    if pidfd is not None:
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        _, status, rusage = os.wait4(pid, 0)
+        return status, rusage
+    delay = 0.001
+    while True:
+        reaped, status, rusage = os.wait4(pid, os.WNOHANG)
+        if reaped:
+            return status, rusage
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+def _descendants(pid):
+    """pids of all descendants of pid (from /proc, or `ps` where there is none)"""
+    parents = {}
+    if os.path.isdir("/proc/self"):
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The command name may contain spaces and parentheses - ppid follows the last ')'
+            parents[int(entry)] = int(stat[stat.rindex(b")") + 2:].split()[1])
+    else:
+        try:
+            output = subprocess.run(["ps", "-A", "-o", "pid=", "-o", "ppid="], capture_output=True,
+                                    text=True).stdout
+        except OSError:
+            output = ""
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) == 2:
+                parents[int(fields[0])] = int(fields[1])
+    children = {}
+    for child, parent in parents.items():
+        children.setdefault(parent, []).append(child)
+    found = []
+    stack = [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _signal_group(process, sig, group, tree=None):
+    """
+    Signal the child's process group (own session). A passthrough child shares
+    the controller's group, so it and its descendants are signalled one by one;
+    tree collects their pids, so descendants orphaned by the first signal are
+    still reached by the next one.
+    """
+    if group:
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+        return
+    tree = tree if tree is not None else set()
+    tree.update(_descendants(process.pid))
+    for pid in [process.pid, *tree]:
+        try:
+            os.kill(pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+async def _run_posix(command, process, result, mux):
+    streams = []
+    if not command.passthrough:
+        streams = [asyncio.ensure_future(_pump(process.stdout, command.name, mux, result.tail, False)),
+                   asyncio.ensure_future(_pump(process.stderr, command.name, mux, result.tail, True))]
+    group = not command.passthrough
+    tree = set()
+    reaper = asyncio.ensure_future(_wait4(process.pid))
+    try:
+        try:
+            await asyncio.wait_for(asyncio.shield(reaper), command.timeout)
+        except asyncio.TimeoutError:
+            result.timed_out = True
+            _signal_group(process, signal.SIGTERM, group, tree)
+            try:
+                await asyncio.wait_for(asyncio.shield(reaper), KILL_GRACE)
+            except asyncio.TimeoutError:
+                pass
+            # Descendants that ignored SIGTERM or outlived the child (bash -c "make ...")
+            _signal_group(process, signal.SIGKILL, group, tree)
+    except asyncio.CancelledError:
+        result.cancelled = True
+        _signal_group(process, signal.SIGTERM, group, tree)
+        try:
+            await asyncio.wait_for(asyncio.shield(reaper), KILL_GRACE)
+        except asyncio.TimeoutError:
+            pass
+        _signal_group(process, signal.SIGKILL, group, tree)
+        raise
+    finally:
+        status, rusage = await reaper
+        # Reaped here - keep Popen from waiting on the pid again
+        process.returncode = os.waitstatus_to_exitcode(status)
+        result.returncode = process.returncode
+        result.user_time = rusage.ru_utime
+        result.system_time = rusage.ru_stime
+        # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+        result.max_rss_kb = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+        if streams:
+            # Grandchildren may still hold the pipes open; do not wait for them forever
+            await asyncio.wait(streams, timeout=KILL_GRACE)
+            for stream in streams:
+                stream.cancel()
+
+
+async def _run_fallback(command, args, kwargs, result, mux):
+    """Windows: asyncio subprocesses (no rusage)"""
+    pipe = None if command.passthrough else asyncio.subprocess.PIPE
+    if kwargs.get("shell"):
+        process = await asyncio.create_subprocess_shell(args, stdout=pipe, stderr=pipe, cwd=command.cwd,
+                                                        env=command.env)
+    else:
+        process = await asyncio.create_subprocess_exec(*args, stdout=pipe, stderr=pipe, cwd=command.cwd,
+                                                       env=command.env)
+
+    async def drain(stream, is_stderr):
+        while True:
+            line = await stream.readline()
+            if not line:
+                break
+            _emit(line.rstrip(b"\n"), command.name, mux, result.tail, is_stderr)
+
+    streams = [] if command.passthrough else [drain(process.stdout, False), drain(process.stderr, True)]
+    try:
+        await asyncio.wait_for(asyncio.gather(process.wait(), *streams), command.timeout)
+    except asyncio.TimeoutError:
+        result.timed_out = True
+        process.kill()
+    except asyncio.CancelledError:
+        result.cancelled = True
+        process.kill()
+        raise
+    finally:
+        result.returncode = await process.wait()
+
+
+async def run_command(command, mux=None, result=None):
+    """Run one Command to completion -> ProcessResult (filled in place when given)"""
+    if isinstance(command, (str, list, tuple)):
+        command = Command(command)
+    mux = mux if mux is not None else OutputMux(prefix=False)
+    mux.register(command.name)
+    if result is None:
+        result = ProcessResult(command.name, command.display())
+    args, kwargs = popen_arguments(command)
+    finishers = [finish for finish in (hook(command) for hook in _hooks) if finish is not None]
+    start = time.monotonic()
+    try:
+        if IS_WINDOWS:
+            await _run_fallback(command, args, kwargs, result, mux)
+        else:
+            pipe = None if command.passthrough else subprocess.PIPE
+            try:
+                process = subprocess.Popen(args, stdin=subprocess.DEVNULL if not command.passthrough else None,
+                                           stdout=pipe, stderr=pipe, cwd=command.cwd, env=command.env,
+                                           start_new_session=not command.passthrough, **kwargs)
+            except OSError as e:
+                result.returncode = 127
+                result.tail.append(str(e))
+                mux.write(command.name, str(e), True)
+                return result
+            await _run_posix(command, process, result, mux)
+    finally:
+        result.duration = time.monotonic() - start
+        for finish in finishers:
+            finish(result)
+    return result
+
+
+class _TokenPool:
+    """
+    Job slots from a make jobserver (cpubudget.Jobserver): the first command runs
+    on the implicit slot of this process, every further one on a token from the pool.
+    """
+
+    def __init__(self, jobserver):
+        self.jobserver = jobserver
+        self.implicit_free = True
+        self._lock = asyncio.Lock()
+        self._wake = None
+
+    async def acquire(self):
+        # One waiter at a time - a descriptor has a single reader callback
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                if self.implicit_free:
+                    self.implicit_free = False
+                    return None
+                token = self.jobserver.try_acquire()
+                if token is not None:
+                    return token
+                wake = self._wake = loop.create_future()
+                loop.add_reader(self.jobserver.fileno(), lambda: wake.done() or wake.set_result(None))
+                try:
+                    await wake
+                finally:
+                    loop.remove_reader(self.jobserver.fileno())
+                    self._wake = None
+
+    def release(self, token):
+        if token is not None:
+            self.jobserver.release(token)
+            return
+        self.implicit_free = True
+        if self._wake is not None and not self._wake.done():
+            self._wake.set_result(None)
+
+
+async def run_commands(commands, max_concurrency=None, fail_fast=False, mux=None, jobserver=None):
+    """
+    Run Commands concurrently (at most max_concurrency at a time). With a
+    jobserver (cpubudget.Jobserver) every command also holds one job slot of
+    its pool, so nested parallelism shares one budget.
+
+    With fail_fast the remaining commands are cancelled after the first failure.
+    Returns the ProcessResults in the order of commands (None for never started ones).
+    Cancelled commands keep their partial result (cancelled=True).
+    """
+    if isinstance(commands, (str, Command)):
+        commands = [commands]
+    commands = [c if isinstance(c, Command) else Command(c) for c in commands]
+    mux = mux if mux is not None else OutputMux(prefix=len(commands) > 1)
+    for command in commands:
+        mux.register(command.name)
+    semaphore = asyncio.Semaphore(max_concurrency or len(commands) or 1)
+    pool = _TokenPool(jobserver) if jobserver is not None else None
+    results = [None] * len(commands)
+
+    async def guarded(i, command):
+        async with semaphore:
+            token = await pool.acquire() if pool else None
+            try:
+                results[i] = ProcessResult(command.name, command.display())
+                await run_command(command, mux, results[i])
+            finally:
+                if pool:
+                    pool.release(token)
+            if fail_fast and not results[i].ok:
+                raise RuntimeError(command.name)
+
+    tasks = [asyncio.ensure_future(guarded(i, command)) for i, command in enumerate(commands)]
+    try:
+        if fail_fast:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        else:
+            await asyncio.wait(tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+def run(commands, max_concurrency=None, fail_fast=False, mux=None, jobserver=None):
+    """Blocking entry point: run_commands() in a fresh event loop"""
+    return asyncio.run(run_commands(commands, max_concurrency, fail_fast, mux, jobserver))
+
+
+def run_one(command):
+    return asyncio.run(run_command(command))
+
+
+def summary_lines(results):
+    lines = [f"{'Command':<24}{'Status':<12}{'Wall':>9}{'User':>9}{'Sys':>9}{'Max RSS':>12}"]
+    for result in results:
+        if result is None:
+            continue
+        cpu = [f"{value:>8.2f}s" if value is not None else f"{'-':>9}" for value in (result.user_time,
+                                                                                 result.system_time)]
+        rss = f"{result.max_rss_kb / 1024:>9.1f} MB" if result.max_rss_kb is not None else f"{'-':>12}"
+        lines.append(f"{result.name[:23]:<24}{result.status():<12}{result.duration:>8.2f}s{cpu[0]}{cpu[1]}{rss}")
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run commands concurrently with prefixed output")
+    parser.add_argument("commands", nargs="+")
+    parser.add_argument("-j", "--jobs", type=int)
+    parser.add_argument("--timeout", type=float)
+    parser.add_argument("--fail-fast", action="store_true")
+    args = parser.parse_args()
+
+    results = run([Command(cmd, name=f"{i + 1}:{cmd.split()[0]}", timeout=args.timeout)
+                   for i, cmd in enumerate(args.commands)], args.jobs, args.fail_fast)
+    print("\n".join(summary_lines(results)))
+    sys.exit(0 if all(r is not None and r.ok for r in results) else 1)
@@ -0,0 +1,11437 @@
+// Generated by emojiassets.py from emoji-test.txt - DO NOT EDIT
+// MIT License
+// Copyright (c) 2024-2025 Tomáš Mark
+
+#ifndef __EMOJITABLES_HPP
+#define __EMOJITABLES_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <string_view>
+
+namespace dotname {
+
+  namespace EmojiTables {
+
+    struct Range {
+      std::uint32_t name;  // index into strings[]
+      std::uint32_t first; // first emoji index
+      std::uint32_t last;  // one past the last emoji index
+    };
+
+    inline constexpr std::size_t emojiCount = 5226;
+    inline constexpr std::size_t groupCount = 10;
+    inline constexpr std::size_t subGroupCount = 100;
+
+    inline constexpr std::string_view statuses[] = {
+      "component", "fully-qualified", "minimally-qualified", "unqualified"
+    };
+
+    // Interned group, subgroup, Unicode version and description strings
+    inline constexpr std::string_view strings[] = {
+      "Smileys & Emotion",
+      "People & Body",
+      "Component",
+      "Animals & Nature",
+      "Food & Drink",
+      "Travel & Places",
+      "Activities",
+      "Objects",
+      "Symbols",
+      "Flags",
+      "face-smiling",
+      "face-affection",
+      "face-tongue",
+      "face-hand",
+      "face-neutral-skeptical",
+      "face-sleepy",
+      "face-unwell",
+      "face-hat",
+      "face-glasses",
+      "face-concerned",
+      "face-negative",
+      "face-costume",
+      "cat-face",
+      "monkey-face",
+      "heart",
+      "emotion",
+      "hand-fingers-open",
+      "hand-fingers-partial",
+      "hand-single-finger",
+      "hand-fingers-closed",
+      "hands",
+      "hand-prop",
+      "body-parts",
+      "person",
+      "person-gesture",
+      "person-role",
+      "person-fantasy",
+      "person-activity",
+      "person-sport",
+      "person-resting",
+      "family",
+      "person-symbol",
+      "skin-tone",
+      "hair-style",
+      "animal-mammal",
+      "animal-bird",
+      "animal-amphibian",
+      "animal-reptile",
+      "animal-marine",
+      "animal-bug",
+      "plant-flower",
+      "plant-other",
+      "food-fruit",
+      "food-vegetable",
+      "food-prepared",
+      "food-asian",
+      "food-sweet",
+      "drink",
+      "dishware",
+      "place-map",
+      "place-geographic",
+      "place-building",
+      "place-religious",
+      "place-other",
+      "transport-ground",
+      "transport-water",
+      "transport-air",
+      "hotel",
+      "time",
+      "sky & weather",
+      "event",
+      "award-medal",
+      "sport",
+      "game",
+      "arts & crafts",
+      "clothing",
+      "sound",
+      "music",
+      "musical-instrument",
+      "phone",
+      "computer",
+      "light & video",
+      "book-paper",
+      "money",
+      "mail",
+      "writing",
+      "office",
+      "lock",
+      "tool",
+      "science",
+      "medical",
+      "household",
+      "other-object",
+      "transport-sign",
+      "warning",
+      "arrow",
+      "religion",
+      "zodiac",
+      "av-symbol",
+      "gender",
+      "math",
+      "punctuation",
+      "currency",
+      "other-symbol",
+      "keycap",
+      "alphanum",
+      "geometric",
+      "flag",
+      "country-flag",
+      "subdivision-flag",
+      "E1.0",
+      "grinning face",
+      "E0.6",
+      "grinning face with big eyes",
+      "grinning face with smiling eyes",
+      "beaming face with smiling eyes",
+      "grinning squinting face",
+      "grinning face with sweat",
+      "E3.0",
+      "rolling on the floor laughing",
+      "face with tears of joy",
+      "slightly smiling face",
+      "upside-down face",
+      "E14.0",
+      "melting face",
+      "winking face",
+      "smiling face with smiling eyes",
+      "smiling face with halo",
+      "E11.0",
+      "smiling face with hearts",
+      "smiling face with heart-eyes",
+      "E5.0",
+      "star-struck",
+      "face blowing a kiss",
+      "kissing face",
+      "smiling face",
+      "kissing face with closed eyes",
+      "kissing face with smiling eyes",
+      "E13.0",
+      "smiling face with tear",
+      "face savoring food",
+      "face with tongue",
+      "winking face with tongue",
+      "zany face",
+      "squinting face with tongue",
+      "money-mouth face",
+      "smiling face with open hands",
+      "face with hand over mouth",
+      "face with open eyes and hand over mouth",
+      "face with peeking eye",
+      "shushing face",
+      "thinking face",
+      "saluting face",
+      "zipper-mouth face",
+      "face with raised eyebrow",
+      "E0.7",
+      "neutral face",
+      "expressionless face",
+      "face without mouth",
+      "dotted line face",
+      "E13.1",
+      "face in clouds",
+      "smirking face",
+      "unamused face",
+      "face with rolling eyes",
+      "grimacing face",
+      "face exhaling",
+      "lying face",
+      "E15.0",
+      "shaking face",
+      "E15.1",
+      "head shaking horizontally",
+      "head shaking vertically",
+      "relieved face",
+      "pensive face",
+      "sleepy face",
+      "drooling face",
+      "sleeping face",
+      "E16.0",
+      "face with bags under eyes",
+      "face with medical mask",
+      "face with thermometer",
+      "face with head-bandage",
+      "nauseated face",
+      "face vomiting",
+      "sneezing face",
+      "hot face",
+      "cold face",
+      "woozy face",
+      "face with crossed-out eyes",
+      "face with spiral eyes",
+      "exploding head",
+      "cowboy hat face",
+      "partying face",
+      "disguised face",
+      "smiling face with sunglasses",
+      "nerd face",
+      "face with monocle",
+      "confused face",
+      "face with diagonal mouth",
+      "worried face",
+      "slightly frowning face",
+      "frowning face",
+      "face with open mouth",
+      "hushed face",
+      "astonished face",
+      "flushed face",
+      "E17.0",
+      "distorted face",
+      "pleading face",
+      "face holding back tears",
+      "frowning face with open mouth",
+      "anguished face",
+      "fearful face",
+      "anxious face with sweat",
+      "sad but relieved face",
+      "crying face",
+      "loudly crying face",
+      "face screaming in fear",
+      "confounded face",
+      "persevering face",
+      "disappointed face",
+      "downcast face with sweat",
+      "weary face",
+      "tired face",
+      "E12.0",
+      "yawning face",
+      "face with steam from nose",
+      "enraged face",
+      "angry face",
+      "face with symbols on mouth",
+      "smiling face with horns",
+      "angry face with horns",
+      "skull",
+      "skull and crossbones",
+      "pile of poo",
+      "clown face",
+      "ogre",
+      "goblin",
+      "ghost",
+      "alien",
+      "alien monster",
+      "robot",
+      "grinning cat",
+      "grinning cat with smiling eyes",
+      "cat with tears of joy",
+      "smiling cat with heart-eyes",
+      "cat with wry smile",
+      "kissing cat",
+      "weary cat",
+      "crying cat",
+      "pouting cat",
+      "see-no-evil monkey",
+      "hear-no-evil monkey",
+      "speak-no-evil monkey",
+      "love letter",
+      "heart with arrow",
+      "heart with ribbon",
+      "sparkling heart",
+      "growing heart",
+      "beating heart",
+      "revolving hearts",
+      "two hearts",
+      "heart decoration",
+      "heart exclamation",
+      "broken heart",
+      "heart on fire",
+      "mending heart",
+      "red heart",
+      "pink heart",
+      "orange heart",
+      "yellow heart",
+      "green heart",
+      "blue heart",
+      "light blue heart",
+      "purple heart",
+      "brown heart",
+      "black heart",
+      "grey heart",
+      "white heart",
+      "kiss mark",
+      "hundred points",
+      "anger symbol",
+      "fight cloud",
+      "collision",
+      "dizzy",
+      "sweat droplets",
+      "dashing away",
+      "hole",
+      "speech balloon",
+      "E2.0",
+      "eye in speech bubble",
+      "left speech bubble",
+      "right anger bubble",
+      "thought balloon",
+      "ZZZ",
+      "waving hand",
+      "waving hand: light skin tone",
+      "waving hand: medium-light skin tone",
+      "waving hand: medium skin tone",
+      "waving hand: medium-dark skin tone",
+      "waving hand: dark skin tone",
+      "raised back of hand",
+      "raised back of hand: light skin tone",
+      "raised back of hand: medium-light skin tone",
+      "raised back of hand: medium skin tone",
+      "raised back of hand: medium-dark skin tone",
+      "raised back of hand: dark skin tone",
+      "hand with fingers splayed",
+      "hand with fingers splayed: light skin tone",
+      "hand with fingers splayed: medium-light skin tone",
+      "hand with fingers splayed: medium skin tone",
+      "hand with fingers splayed: medium-dark skin tone",
+      "hand with fingers splayed: dark skin tone",
+      "raised hand",
+      "raised hand: light skin tone",
+      "raised hand: medium-light skin tone",
+      "raised hand: medium skin tone",
+      "raised hand: medium-dark skin tone",
+      "raised hand: dark skin tone",
+      "vulcan salute",
+      "vulcan salute: light skin tone",
+      "vulcan salute: medium-light skin tone",
+      "vulcan salute: medium skin tone",
+      "vulcan salute: medium-dark skin tone",
+      "vulcan salute: dark skin tone",
+      "rightwards hand",
+      "rightwards hand: light skin tone",
+      "rightwards hand: medium-light skin tone",
+      "rightwards hand: medium skin tone",
+      "rightwards hand: medium-dark skin tone",
+      "rightwards hand: dark skin tone",
+      "leftwards hand",
+      "leftwards hand: light skin tone",
+      "leftwards hand: medium-light skin tone",
+      "leftwards hand: medium skin tone",
+      "leftwards hand: medium-dark skin tone",
+      "leftwards hand: dark skin tone",
+      "palm down hand",
+      "palm down hand: light skin tone",
+      "palm down hand: medium-light skin tone",
+      "palm down hand: medium skin tone",
+      "palm down hand: medium-dark skin tone",
+      "palm down hand: dark skin tone",
+      "palm up hand",
+      "palm up hand: light skin tone",
+      "palm up hand: medium-light skin tone",
+      "palm up hand: medium skin tone",
+      "palm up hand: medium-dark skin tone",
+      "palm up hand: dark skin tone",
+      "leftwards pushing hand",
+      "leftwards pushing hand: light skin tone",
+      "leftwards pushing hand: medium-light skin tone",
+      "leftwards pushing hand: medium skin tone",
+      "leftwards pushing hand: medium-dark skin tone",
+      "leftwards pushing hand: dark skin tone",
+      "rightwards pushing hand",
+      "rightwards pushing hand: light skin tone",
+      "rightwards pushing hand: medium-light skin tone",
+      "rightwards pushing hand: medium skin tone",
+      "rightwards pushing hand: medium-dark skin tone",
+      "rightwards pushing hand: dark skin tone",
+      "OK hand",
+      "OK hand: light skin tone",
+      "OK hand: medium-light skin tone",
+      "OK hand: medium skin tone",
+      "OK hand: medium-dark skin tone",
+      "OK hand: dark skin tone",
+      "pinched fingers",
+      "pinched fingers: light skin tone",
+      "pinched fingers: medium-light skin tone",
+      "pinched fingers: medium skin tone",
+      "pinched fingers: medium-dark skin tone",
+      "pinched fingers: dark skin tone",
+      "pinching hand",
+      "pinching hand: light skin tone",
+      "pinching hand: medium-light skin tone",
+      "pinching hand: medium skin tone",
+      "pinching hand: medium-dark skin tone",
+      "pinching hand: dark skin tone",
+      "victory hand",
+      "victory hand: light skin tone",
+      "victory hand: medium-light skin tone",
+      "victory hand: medium skin tone",
+      "victory hand: medium-dark skin tone",
+      "victory hand: dark skin tone",
+      "crossed fingers",
+      "crossed fingers: light skin tone",
+      "crossed fingers: medium-light skin tone",
+      "crossed fingers: medium skin tone",
+      "crossed fingers: medium-dark skin tone",
+      "crossed fingers: dark skin tone",
+      "hand with index finger and thumb crossed",
+      "hand with index finger and thumb crossed: light skin tone",
+      "hand with index finger and thumb crossed: medium-light skin tone",
+      "hand with index finger and thumb crossed: medium skin tone",
+      "hand with index finger and thumb crossed: medium-dark skin tone",
+      "hand with index finger and thumb crossed: dark skin tone",
+      "love-you gesture",
+      "love-you gesture: light skin tone",
+      "love-you gesture: medium-light skin tone",
+      "love-you gesture: medium skin tone",
+      "love-you gesture: medium-dark skin tone",
+      "love-you gesture: dark skin tone",
+      "sign of the horns",
+      "sign of the horns: light skin tone",
+      "sign of the horns: medium-light skin tone",
+      "sign of the horns: medium skin tone",
+      "sign of the horns: medium-dark skin tone",
+      "sign of the horns: dark skin tone",
+      "call me hand",
+      "call me hand: light skin tone",
+      "call me hand: medium-light skin tone",
+      "call me hand: medium skin tone",
+      "call me hand: medium-dark skin tone",
+      "call me hand: dark skin tone",
+      "backhand index pointing left",
+      "backhand index pointing left: light skin tone",
+      "backhand index pointing left: medium-light skin tone",
+      "backhand index pointing left: medium skin tone",
+      "backhand index pointing left: medium-dark skin tone",
+      "backhand index pointing left: dark skin tone",
+      "backhand index pointing right",
+      "backhand index pointing right: light skin tone",
+      "backhand index pointing right: medium-light skin tone",
+      "backhand index pointing right: medium skin tone",
+      "backhand index pointing right: medium-dark skin tone",
+      "backhand index pointing right: dark skin tone",
+      "backhand index pointing up",
+      "backhand index pointing up: light skin tone",
+      "backhand index pointing up: medium-light skin tone",
+      "backhand index pointing up: medium skin tone",
+      "backhand index pointing up: medium-dark skin tone",
+      "backhand index pointing up: dark skin tone",
+      "middle finger",
+      "middle finger: light skin tone",
+      "middle finger: medium-light skin tone",
+      "middle finger: medium skin tone",
+      "middle finger: medium-dark skin tone",
+      "middle finger: dark skin tone",
+      "backhand index pointing down",
+      "backhand index pointing down: light skin tone",
+      "backhand index pointing down: medium-light skin tone",
+      "backhand index pointing down: medium skin tone",
+      "backhand index pointing down: medium-dark skin tone",
+      "backhand index pointing down: dark skin tone",
+      "index pointing up",
+      "index pointing up: light skin tone",
+      "index pointing up: medium-light skin tone",
+      "index pointing up: medium skin tone",
+      "index pointing up: medium-dark skin tone",
+      "index pointing up: dark skin tone",
+      "index pointing at the viewer",
+      "index pointing at the viewer: light skin tone",
+      "index pointing at the viewer: medium-light skin tone",
+      "index pointing at the viewer: medium skin tone",
+      "index pointing at the viewer: medium-dark skin tone",
+      "index pointing at the viewer: dark skin tone",
+      "thumbs up",
+      "thumbs up: light skin tone",
+      "thumbs up: medium-light skin tone",
+      "thumbs up: medium skin tone",
+      "thumbs up: medium-dark skin tone",
+      "thumbs up: dark skin tone",
+      "thumbs down",
+      "thumbs down: light skin tone",
+      "thumbs down: medium-light skin tone",
+      "thumbs down: medium skin tone",
+      "thumbs down: medium-dark skin tone",
+      "thumbs down: dark skin tone",
+      "raised fist",
+      "raised fist: light skin tone",
+      "raised fist: medium-light skin tone",
+      "raised fist: medium skin tone",
+      "raised fist: medium-dark skin tone",
+      "raised fist: dark skin tone",
+      "oncoming fist",
+      "oncoming fist: light skin tone",
+      "oncoming fist: medium-light skin tone",
+      "oncoming fist: medium skin tone",
+      "oncoming fist: medium-dark skin tone",
+      "oncoming fist: dark skin tone",
+      "left-facing fist",
+      "left-facing fist: light skin tone",
+      "left-facing fist: medium-light skin tone",
+      "left-facing fist: medium skin tone",
+      "left-facing fist: medium-dark skin tone",
+      "left-facing fist: dark skin tone",
+      "right-facing fist",
+      "right-facing fist: light skin tone",
+      "right-facing fist: medium-light skin tone",
+      "right-facing fist: medium skin tone",
+      "right-facing fist: medium-dark skin tone",
+      "right-facing fist: dark skin tone",
+      "clapping hands",
+      "clapping hands: light skin tone",
+      "clapping hands: medium-light skin tone",
+      "clapping hands: medium skin tone",
+      "clapping hands: medium-dark skin tone",
+      "clapping hands: dark skin tone",
+      "raising hands",
+      "raising hands: light skin tone",
+      "raising hands: medium-light skin tone",
+      "raising hands: medium skin tone",
+      "raising hands: medium-dark skin tone",
+      "raising hands: dark skin tone",
+      "heart hands",
+      "heart hands: light skin tone",
+      "heart hands: medium-light skin tone",
+      "heart hands: medium skin tone",
+      "heart hands: medium-dark skin tone",
+      "heart hands: dark skin tone",
+      "open hands",
+      "open hands: light skin tone",
+      "open hands: medium-light skin tone",
+      "open hands: medium skin tone",
+      "open hands: medium-dark skin tone",
+      "open hands: dark skin tone",
+      "palms up together",
+      "palms up together: light skin tone",
+      "palms up together: medium-light skin tone",
+      "palms up together: medium skin tone",
+      "palms up together: medium-dark skin tone",
+      "palms up together: dark skin tone",
+      "handshake",
+      "handshake: light skin tone",
+      "handshake: medium-light skin tone",
+      "handshake: medium skin tone",
+      "handshake: medium-dark skin tone",
+      "handshake: dark skin tone",
+      "handshake: light skin tone, medium-light skin tone",
+      "handshake: light skin tone, medium skin tone",
+      "handshake: light skin tone, medium-dark skin tone",
+      "handshake: light skin tone, dark skin tone",
+      "handshake: medium-light skin tone, light skin tone",
+      "handshake: medium-light skin tone, medium skin tone",
+      "handshake: medium-light skin tone, medium-dark skin tone",
+      "handshake: medium-light skin tone, dark skin tone",
+      "handshake: medium skin tone, light skin tone",
+      "handshake: medium skin tone, medium-light skin tone",
+      "handshake: medium skin tone, medium-dark skin tone",
+      "handshake: medium skin tone, dark skin tone",
+      "handshake: medium-dark skin tone, light skin tone",
+      "handshake: medium-dark skin tone, medium-light skin tone",
+      "handshake: medium-dark skin tone, medium skin tone",
+      "handshake: medium-dark skin tone, dark skin tone",
+      "handshake: dark skin tone, light skin tone",
+      "handshake: dark skin tone, medium-light skin tone",
+      "handshake: dark skin tone, medium skin tone",
+      "handshake: dark skin tone, medium-dark skin tone",
+      "folded hands",
+      "folded hands: light skin tone",
+      "folded hands: medium-light skin tone",
+      "folded hands: medium skin tone",
+      "folded hands: medium-dark skin tone",
+      "folded hands: dark skin tone",
+      "writing hand",
+      "writing hand: light skin tone",
+      "writing hand: medium-light skin tone",
+      "writing hand: medium skin tone",
+      "writing hand: medium-dark skin tone",
+      "writing hand: dark skin tone",
+      "nail polish",
+      "nail polish: light skin tone",
+      "nail polish: medium-light skin tone",
+      "nail polish: medium skin tone",
+      "nail polish: medium-dark skin tone",
+      "nail polish: dark skin tone",
+      "selfie",
+      "selfie: light skin tone",
+      "selfie: medium-light skin tone",
+      "selfie: medium skin tone",
+      "selfie: medium-dark skin tone",
+      "selfie: dark skin tone",
+      "flexed biceps",
+      "flexed biceps: light skin tone",
+      "flexed biceps: medium-light skin tone",
+      "flexed biceps: medium skin tone",
+      "flexed biceps: medium-dark skin tone",
+      "flexed biceps: dark skin tone",
+      "mechanical arm",
+      "mechanical leg",
+      "leg",
+      "leg: light skin tone",
+      "leg: medium-light skin tone",
+      "leg: medium skin tone",
+      "leg: medium-dark skin tone",
+      "leg: dark skin tone",
+      "foot",
+      "foot: light skin tone",
+      "foot: medium-light skin tone",
+      "foot: medium skin tone",
+      "foot: medium-dark skin tone",
+      "foot: dark skin tone",
+      "ear",
+      "ear: light skin tone",
+      "ear: medium-light skin tone",
+      "ear: medium skin tone",
+      "ear: medium-dark skin tone",
+      "ear: dark skin tone",
+      "ear with hearing aid",
+      "ear with hearing aid: light skin tone",
+      "ear with hearing aid: medium-light skin tone",
+      "ear with hearing aid: medium skin tone",
+      "ear with hearing aid: medium-dark skin tone",
+      "ear with hearing aid: dark skin tone",
+      "nose",
+      "nose: light skin tone",
+      "nose: medium-light skin tone",
+      "nose: medium skin tone",
+      "nose: medium-dark skin tone",
+      "nose: dark skin tone",
+      "brain",
+      "anatomical heart",
+      "lungs",
+      "tooth",
+      "bone",
+      "eyes",
+      "eye",
+      "tongue",
+      "mouth",
+      "biting lip",
+      "baby",
+      "baby: light skin tone",
+      "baby: medium-light skin tone",
+      "baby: medium skin tone",
+      "baby: medium-dark skin tone",
+      "baby: dark skin tone",
+      "child",
+      "child: light skin tone",
+      "child: medium-light skin tone",
+      "child: medium skin tone",
+      "child: medium-dark skin tone",
+      "child: dark skin tone",
+      "boy",
+      "boy: light skin tone",
+      "boy: medium-light skin tone",
+      "boy: medium skin tone",
+      "boy: medium-dark skin tone",
+      "boy: dark skin tone",
+      "girl",
+      "girl: light skin tone",
+      "girl: medium-light skin tone",
+      "girl: medium skin tone",
+      "girl: medium-dark skin tone",
+      "girl: dark skin tone",
+      "person: light skin tone",
+      "person: medium-light skin tone",
+      "person: medium skin tone",
+      "person: medium-dark skin tone",
+      "person: dark skin tone",
+      "person: blond hair",
+      "person: light skin tone, blond hair",
+      "person: medium-light skin tone, blond hair",
+      "person: medium skin tone, blond hair",
+      "person: medium-dark skin tone, blond hair",
+      "person: dark skin tone, blond hair",
+      "man",
+      "man: light skin tone",
+      "man: medium-light skin tone",
+      "man: medium skin tone",
+      "man: medium-dark skin tone",
+      "man: dark skin tone",
+      "person: beard",
+      "person: light skin tone, beard",
+      "person: medium-light skin tone, beard",
+      "person: medium skin tone, beard",
+      "person: medium-dark skin tone, beard",
+      "person: dark skin tone, beard",
+      "man: beard",
+      "man: light skin tone, beard",
+      "man: medium-light skin tone, beard",
+      "man: medium skin tone, beard",
+      "man: medium-dark skin tone, beard",
+      "man: dark skin tone, beard",
+      "woman: beard",
+      "woman: light skin tone, beard",
+      "woman: medium-light skin tone, beard",
+      "woman: medium skin tone, beard",
+      "woman: medium-dark skin tone, beard",
+      "woman: dark skin tone, beard",
+      "man: red hair",
+      "man: light skin tone, red hair",
+      "man: medium-light skin tone, red hair",
+      "man: medium skin tone, red hair",
+      "man: medium-dark skin tone, red hair",
+      "man: dark skin tone, red hair",
+      "man: curly hair",
+      "man: light skin tone, curly hair",
+      "man: medium-light skin tone, curly hair",
+      "man: medium skin tone, curly hair",
+      "man: medium-dark skin tone, curly hair",
+      "man: dark skin tone, curly hair",
+      "man: white hair",
+      "man: light skin tone, white hair",
+      "man: medium-light skin tone, white hair",
+      "man: medium skin tone, white hair",
+      "man: medium-dark skin tone, white hair",
+      "man: dark skin tone, white hair",
+      "man: bald",
+      "man: light skin tone, bald",
+      "man: medium-light skin tone, bald",
+      "man: medium skin tone, bald",
+      "man: medium-dark skin tone, bald",
+      "man: dark skin tone, bald",
+      "woman",
+      "woman: light skin tone",
+      "woman: medium-light skin tone",
+      "woman: medium skin tone",
+      "woman: medium-dark skin tone",
+      "woman: dark skin tone",
+      "woman: red hair",
+      "woman: light skin tone, red hair",
+      "woman: medium-light skin tone, red hair",
+      "woman: medium skin tone, red hair",
+      "woman: medium-dark skin tone, red hair",
+      "woman: dark skin tone, red hair",
+      "E12.1",
+      "person: red hair",
+      "person: light skin tone, red hair",
+      "person: medium-light skin tone, red hair",
+      "person: medium skin tone, red hair",
+      "person: medium-dark skin tone, red hair",
+      "person: dark skin tone, red hair",
+      "woman: curly hair",
+      "woman: light skin tone, curly hair",
+      "woman: medium-light skin tone, curly hair",
+      "woman: medium skin tone, curly hair",
+      "woman: medium-dark skin tone, curly hair",
+      "woman: dark skin tone, curly hair",
+      "person: curly hair",
+      "person: light skin tone, curly hair",
+      "person: medium-light skin tone, curly hair",
+      "person: medium skin tone, curly hair",
+      "person: medium-dark skin tone, curly hair",
+      "person: dark skin tone, curly hair",
+      "woman: white hair",
+      "woman: light skin tone, white hair",
+      "woman: medium-light skin tone, white hair",
+      "woman: medium skin tone, white hair",
+      "woman: medium-dark skin tone, white hair",
+      "woman: dark skin tone, white hair",
+      "person: white hair",
+      "person: light skin tone, white hair",
+      "person: medium-light skin tone, white hair",
+      "person: medium skin tone, white hair",
+      "person: medium-dark skin tone, white hair",
+      "person: dark skin tone, white hair",
+      "woman: bald",
+      "woman: light skin tone, bald",
+      "woman: medium-light skin tone, bald",
+      "woman: medium skin tone, bald",
+      "woman: medium-dark skin tone, bald",
+      "woman: dark skin tone, bald",
+      "person: bald",
+      "person: light skin tone, bald",
+      "person: medium-light skin tone, bald",
+      "person: medium skin tone, bald",
+      "person: medium-dark skin tone, bald",
+      "person: dark skin tone, bald",
+      "E4.0",
+      "woman: blond hair",
+      "woman: light skin tone, blond hair",
+      "woman: medium-light skin tone, blond hair",
+      "woman: medium skin tone, blond hair",
+      "woman: medium-dark skin tone, blond hair",
+      "woman: dark skin tone, blond hair",
+      "man: blond hair",
+      "man: light skin tone, blond hair",
+      "man: medium-light skin tone, blond hair",
+      "man: medium skin tone, blond hair",
+      "man: medium-dark skin tone, blond hair",
+      "man: dark skin tone, blond hair",
+      "older person",
+      "older person: light skin tone",
+      "older person: medium-light skin tone",
+      "older person: medium skin tone",
+      "older person: medium-dark skin tone",
+      "older person: dark skin tone",
+      "old man",
+      "old man: light skin tone",
+      "old man: medium-light skin tone",
+      "old man: medium skin tone",
+      "old man: medium-dark skin tone",
+      "old man: dark skin tone",
+      "old woman",
+      "old woman: light skin tone",
+      "old woman: medium-light skin tone",
+      "old woman: medium skin tone",
+      "old woman: medium-dark skin tone",
+      "old woman: dark skin tone",
+      "person frowning",
+      "person frowning: light skin tone",
+      "person frowning: medium-light skin tone",
+      "person frowning: medium skin tone",
+      "person frowning: medium-dark skin tone",
+      "person frowning: dark skin tone",
+      "man frowning",
+      "man frowning: light skin tone",
+      "man frowning: medium-light skin tone",
+      "man frowning: medium skin tone",
+      "man frowning: medium-dark skin tone",
+      "man frowning: dark skin tone",
+      "woman frowning",
+      "woman frowning: light skin tone",
+      "woman frowning: medium-light skin tone",
+      "woman frowning: medium skin tone",
+      "woman frowning: medium-dark skin tone",
+      "woman frowning: dark skin tone",
+      "person pouting",
+      "person pouting: light skin tone",
+      "person pouting: medium-light skin tone",
+      "person pouting: medium skin tone",
+      "person pouting: medium-dark skin tone",
+      "person pouting: dark skin tone",
+      "man pouting",
+      "man pouting: light skin tone",
+      "man pouting: medium-light skin tone",
+      "man pouting: medium skin tone",
+      "man pouting: medium-dark skin tone",
+      "man pouting: dark skin tone",
+      "woman pouting",
+      "woman pouting: light skin tone",
+      "woman pouting: medium-light skin tone",
+      "woman pouting: medium skin tone",
+      "woman pouting: medium-dark skin tone",
+      "woman pouting: dark skin tone",
+      "person gesturing NO",
+      "person gesturing NO: light skin tone",
+      "person gesturing NO: medium-light skin tone",
+      "person gesturing NO: medium skin tone",
+      "person gesturing NO: medium-dark skin tone",
+      "person gesturing NO: dark skin tone",
+      "man gesturing NO",
+      "man gesturing NO: light skin tone",
+      "man gesturing NO: medium-light skin tone",
+      "man gesturing NO: medium skin tone",
+      "man gesturing NO: medium-dark skin tone",
+      "man gesturing NO: dark skin tone",
+      "woman gesturing NO",
+      "woman gesturing NO: light skin tone",
+      "woman gesturing NO: medium-light skin tone",
+      "woman gesturing NO: medium skin tone",
+      "woman gesturing NO: medium-dark skin tone",
+      "woman gesturing NO: dark skin tone",
+      "person gesturing OK",
+      "person gesturing OK: light skin tone",
+      "person gesturing OK: medium-light skin tone",
+      "person gesturing OK: medium skin tone",
+      "person gesturing OK: medium-dark skin tone",
+      "person gesturing OK: dark skin tone",
+      "man gesturing OK",
+      "man gesturing OK: light skin tone",
+      "man gesturing OK: medium-light skin tone",
+      "man gesturing OK: medium skin tone",
+      "man gesturing OK: medium-dark skin tone",
+      "man gesturing OK: dark skin tone",
+      "woman gesturing OK",
+      "woman gesturing OK: light skin tone",
+      "woman gesturing OK: medium-light skin tone",
+      "woman gesturing OK: medium skin tone",
+      "woman gesturing OK: medium-dark skin tone",
+      "woman gesturing OK: dark skin tone",
+      "person tipping hand",
+      "person tipping hand: light skin tone",
+      "person tipping hand: medium-light skin tone",
+      "person tipping hand: medium skin tone",
+      "person tipping hand: medium-dark skin tone",
+      "person tipping hand: dark skin tone",
+      "man tipping hand",
+      "man tipping hand: light skin tone",
+      "man tipping hand: medium-light skin tone",
+      "man tipping hand: medium skin tone",
+      "man tipping hand: medium-dark skin tone",
+      "man tipping hand: dark skin tone",
+      "woman tipping hand",
+      "woman tipping hand: light skin tone",
+      "woman tipping hand: medium-light skin tone",
+      "woman tipping hand: medium skin tone",
+      "woman tipping hand: medium-dark skin tone",
+      "woman tipping hand: dark skin tone",
+      "person raising hand",
+      "person raising hand: light skin tone",
+      "person raising hand: medium-light skin tone",
+      "person raising hand: medium skin tone",
+      "person raising hand: medium-dark skin tone",
+      "person raising hand: dark skin tone",
+      "man raising hand",
+      "man raising hand: light skin tone",
+      "man raising hand: medium-light skin tone",
+      "man raising hand: medium skin tone",
+      "man raising hand: medium-dark skin tone",
+      "man raising hand: dark skin tone",
+      "woman raising hand",
+      "woman raising hand: light skin tone",
+      "woman raising hand: medium-light skin tone",
+      "woman raising hand: medium skin tone",
+      "woman raising hand: medium-dark skin tone",
+      "woman raising hand: dark skin tone",
+      "deaf person",
+      "deaf person: light skin tone",
+      "deaf person: medium-light skin tone",
+      "deaf person: medium skin tone",
+      "deaf person: medium-dark skin tone",
+      "deaf person: dark skin tone",
+      "deaf man",
+      "deaf man: light skin tone",
+      "deaf man: medium-light skin tone",
+      "deaf man: medium skin tone",
+      "deaf man: medium-dark skin tone",
+      "deaf man: dark skin tone",
+      "deaf woman",
+      "deaf woman: light skin tone",
+      "deaf woman: medium-light skin tone",
+      "deaf woman: medium skin tone",
+      "deaf woman: medium-dark skin tone",
+      "deaf woman: dark skin tone",
+      "person bowing",
+      "person bowing: light skin tone",
+      "person bowing: medium-light skin tone",
+      "person bowing: medium skin tone",
+      "person bowing: medium-dark skin tone",
+      "person bowing: dark skin tone",
+      "man bowing",
+      "man bowing: light skin tone",
+      "man bowing: medium-light skin tone",
+      "man bowing: medium skin tone",
+      "man bowing: medium-dark skin tone",
+      "man bowing: dark skin tone",
+      "woman bowing",
+      "woman bowing: light skin tone",
+      "woman bowing: medium-light skin tone",
+      "woman bowing: medium skin tone",
+      "woman bowing: medium-dark skin tone",
+      "woman bowing: dark skin tone",
+      "person facepalming",
+      "person facepalming: light skin tone",
+      "person facepalming: medium-light skin tone",
+      "person facepalming: medium skin tone",
+      "person facepalming: medium-dark skin tone",
+      "person facepalming: dark skin tone",
+      "man facepalming",
+      "man facepalming: light skin tone",
+      "man facepalming: medium-light skin tone",
+      "man facepalming: medium skin tone",
+      "man facepalming: medium-dark skin tone",
+      "man facepalming: dark skin tone",
+      "woman facepalming",
+      "woman facepalming: light skin tone",
+      "woman facepalming: medium-light skin tone",
+      "woman facepalming: medium skin tone",
+      "woman facepalming: medium-dark skin tone",
+      "woman facepalming: dark skin tone",
+      "person shrugging",
+      "person shrugging: light skin tone",
+      "person shrugging: medium-light skin tone",
+      "person shrugging: medium skin tone",
+      "person shrugging: medium-dark skin tone",
+      "person shrugging: dark skin tone",
+      "man shrugging",
+      "man shrugging: light skin tone",
+      "man shrugging: medium-light skin tone",
+      "man shrugging: medium skin tone",
+      "man shrugging: medium-dark skin tone",
+      "man shrugging: dark skin tone",
+      "woman shrugging",
+      "woman shrugging: light skin tone",
+      "woman shrugging: medium-light skin tone",
+      "woman shrugging: medium skin tone",
+      "woman shrugging: medium-dark skin tone",
+      "woman shrugging: dark skin tone",
+      "health worker",
+      "health worker: light skin tone",
+      "health worker: medium-light skin tone",
+      "health worker: medium skin tone",
+      "health worker: medium-dark skin tone",
+      "health worker: dark skin tone",
+      "man health worker",
+      "man health worker: light skin tone",
+      "man health worker: medium-light skin tone",
+      "man health worker: medium skin tone",
+      "man health worker: medium-dark skin tone",
+      "man health worker: dark skin tone",
+      "woman health worker",
+      "woman health worker: light skin tone",
+      "woman health worker: medium-light skin tone",
+      "woman health worker: medium skin tone",
+      "woman health worker: medium-dark skin tone",
+      "woman health worker: dark skin tone",
+      "student",
+      "student: light skin tone",
+      "student: medium-light skin tone",
+      "student: medium skin tone",
+      "student: medium-dark skin tone",
+      "student: dark skin tone",
+      "man student",
+      "man student: light skin tone",
+      "man student: medium-light skin tone",
+      "man student: medium skin tone",
+      "man student: medium-dark skin tone",
+      "man student: dark skin tone",
+      "woman student",
+      "woman student: light skin tone",
+      "woman student: medium-light skin tone",
+      "woman student: medium skin tone",
+      "woman student: medium-dark skin tone",
+      "woman student: dark skin tone",
+      "teacher",
+      "teacher: light skin tone",
+      "teacher: medium-light skin tone",
+      "teacher: medium skin tone",
+      "teacher: medium-dark skin tone",
+      "teacher: dark skin tone",
+      "man teacher",
+      "man teacher: light skin tone",
+      "man teacher: medium-light skin tone",
+      "man teacher: medium skin tone",
+      "man teacher: medium-dark skin tone",
+      "man teacher: dark skin tone",
+      "woman teacher",
+      "woman teacher: light skin tone",
+      "woman teacher: medium-light skin tone",
+      "woman teacher: medium skin tone",
+      "woman teacher: medium-dark skin tone",
+      "woman teacher: dark skin tone",
+      "judge",
+      "judge: light skin tone",
+      "judge: medium-light skin tone",
+      "judge: medium skin tone",
+      "judge: medium-dark skin tone",
+      "judge: dark skin tone",
+      "man judge",
+      "man judge: light skin tone",
+      "man judge: medium-light skin tone",
+      "man judge: medium skin tone",
+      "man judge: medium-dark skin tone",
+      "man judge: dark skin tone",
+      "woman judge",
+      "woman judge: light skin tone",
+      "woman judge: medium-light skin tone",
+      "woman judge: medium skin tone",
+      "woman judge: medium-dark skin tone",
+      "woman judge: dark skin tone",
+      "farmer",
+      "farmer: light skin tone",
+      "farmer: medium-light skin tone",
+      "farmer: medium skin tone",
+      "farmer: medium-dark skin tone",
+      "farmer: dark skin tone",
+      "man farmer",
+      "man farmer: light skin tone",
+      "man farmer: medium-light skin tone",
+      "man farmer: medium skin tone",
+      "man farmer: medium-dark skin tone",
+      "man farmer: dark skin tone",
+      "woman farmer",
+      "woman farmer: light skin tone",
+      "woman farmer: medium-light skin tone",
+      "woman farmer: medium skin tone",
+      "woman farmer: medium-dark skin tone",
+      "woman farmer: dark skin tone",
+      "cook",
+      "cook: light skin tone",
+      "cook: medium-light skin tone",
+      "cook: medium skin tone",
+      "cook: medium-dark skin tone",
+      "cook: dark skin tone",
+      "man cook",
+      "man cook: light skin tone",
+      "man cook: medium-light skin tone",
+      "man cook: medium skin tone",
+      "man cook: medium-dark skin tone",
+      "man cook: dark skin tone",
+      "woman cook",
+      "woman cook: light skin tone",
+      "woman cook: medium-light skin tone",
+      "woman cook: medium skin tone",
+      "woman cook: medium-dark skin tone",
+      "woman cook: dark skin tone",
+      "mechanic",
+      "mechanic: light skin tone",
+      "mechanic: medium-light skin tone",
+      "mechanic: medium skin tone",
+      "mechanic: medium-dark skin tone",
+      "mechanic: dark skin tone",
+      "man mechanic",
+      "man mechanic: light skin tone",
+      "man mechanic: medium-light skin tone",
+      "man mechanic: medium skin tone",
+      "man mechanic: medium-dark skin tone",
+      "man mechanic: dark skin tone",
+      "woman mechanic",
+      "woman mechanic: light skin tone",
+      "woman mechanic: medium-light skin tone",
+      "woman mechanic: medium skin tone",
+      "woman mechanic: medium-dark skin tone",
+      "woman mechanic: dark skin tone",
+      "factory worker",
+      "factory worker: light skin tone",
+      "factory worker: medium-light skin tone",
+      "factory worker: medium skin tone",
+      "factory worker: medium-dark skin tone",
+      "factory worker: dark skin tone",
+      "man factory worker",
+      "man factory worker: light skin tone",
+      "man factory worker: medium-light skin tone",
+      "man factory worker: medium skin tone",
+      "man factory worker: medium-dark skin tone",
+      "man factory worker: dark skin tone",
+      "woman factory worker",
+      "woman factory worker: light skin tone",
+      "woman factory worker: medium-light skin tone",
+      "woman factory worker: medium skin tone",
+      "woman factory worker: medium-dark skin tone",
+      "woman factory worker: dark skin tone",
+      "office worker",
+      "office worker: light skin tone",
+      "office worker: medium-light skin tone",
+      "office worker: medium skin tone",
+      "office worker: medium-dark skin tone",
+      "office worker: dark skin tone",
+      "man office worker",
+      "man office worker: light skin tone",
+      "man office worker: medium-light skin tone",
+      "man office worker: medium skin tone",
+      "man office worker: medium-dark skin tone",
+      "man office worker: dark skin tone",
+      "woman office worker",
+      "woman office worker: light skin tone",
+      "woman office worker: medium-light skin tone",
+      "woman office worker: medium skin tone",
+      "woman office worker: medium-dark skin tone",
+      "woman office worker: dark skin tone",
+      "scientist",
+      "scientist: light skin tone",
+      "scientist: medium-light skin tone",
+      "scientist: medium skin tone",
+      "scientist: medium-dark skin tone",
+      "scientist: dark skin tone",
+      "man scientist",
+      "man scientist: light skin tone",
+      "man scientist: medium-light skin tone",
+      "man scientist: medium skin tone",
+      "man scientist: medium-dark skin tone",
+      "man scientist: dark skin tone",
+      "woman scientist",
+      "woman scientist: light skin tone",
+      "woman scientist: medium-light skin tone",
+      "woman scientist: medium skin tone",
+      "woman scientist: medium-dark skin tone",
+      "woman scientist: dark skin tone",
+      "technologist",
+      "technologist: light skin tone",
+      "technologist: medium-light skin tone",
+      "technologist: medium skin tone",
+      "technologist: medium-dark skin tone",
+      "technologist: dark skin tone",
+      "man technologist",
+      "man technologist: light skin tone",
+      "man technologist: medium-light skin tone",
+      "man technologist: medium skin tone",
+      "man technologist: medium-dark skin tone",
+      "man technologist: dark skin tone",
+      "woman technologist",
+      "woman technologist: light skin tone",
+      "woman technologist: medium-light skin tone",
+      "woman technologist: medium skin tone",
+      "woman technologist: medium-dark skin tone",
+      "woman technologist: dark skin tone",
+      "singer",
+      "singer: light skin tone",
+      "singer: medium-light skin tone",
+      "singer: medium skin tone",
+      "singer: medium-dark skin tone",
+      "singer: dark skin tone",
+      "man singer",
+      "man singer: light skin tone",
+      "man singer: medium-light skin tone",
+      "man singer: medium skin tone",
+      "man singer: medium-dark skin tone",
+      "man singer: dark skin tone",
+      "woman singer",
+      "woman singer: light skin tone",
+      "woman singer: medium-light skin tone",
+      "woman singer: medium skin tone",
+      "woman singer: medium-dark skin tone",
+      "woman singer: dark skin tone",
+      "artist",
+      "artist: light skin tone",
+      "artist: medium-light skin tone",
+      "artist: medium skin tone",
+      "artist: medium-dark skin tone",
+      "artist: dark skin tone",
+      "man artist",
+      "man artist: light skin tone",
+      "man artist: medium-light skin tone",
+      "man artist: medium skin tone",
+      "man artist: medium-dark skin tone",
+      "man artist: dark skin tone",
+      "woman artist",
+      "woman artist: light skin tone",
+      "woman artist: medium-light skin tone",
+      "woman artist: medium skin tone",
+      "woman artist: medium-dark skin tone",
+      "woman artist: dark skin tone",
+      "pilot",
+      "pilot: light skin tone",
+      "pilot: medium-light skin tone",
+      "pilot: medium skin tone",
+      "pilot: medium-dark skin tone",
+      "pilot: dark skin tone",
+      "man pilot",
+      "man pilot: light skin tone",
+      "man pilot: medium-light skin tone",
+      "man pilot: medium skin tone",
+      "man pilot: medium-dark skin tone",
+      "man pilot: dark skin tone",
+      "woman pilot",
+      "woman pilot: light skin tone",
+      "woman pilot: medium-light skin tone",
+      "woman pilot: medium skin tone",
+      "woman pilot: medium-dark skin tone",
+      "woman pilot: dark skin tone",
+      "astronaut",
+      "astronaut: light skin tone",
+      "astronaut: medium-light skin tone",
+      "astronaut: medium skin tone",
+      "astronaut: medium-dark skin tone",
+      "astronaut: dark skin tone",
+      "man astronaut",
+      "man astronaut: light skin tone",
+      "man astronaut: medium-light skin tone",
+      "man astronaut: medium skin tone",
+      "man astronaut: medium-dark skin tone",
+      "man astronaut: dark skin tone",
+      "woman astronaut",
+      "woman astronaut: light skin tone",
+      "woman astronaut: medium-light skin tone",
+      "woman astronaut: medium skin tone",
+      "woman astronaut: medium-dark skin tone",
+      "woman astronaut: dark skin tone",
+      "firefighter",
+      "firefighter: light skin tone",
+      "firefighter: medium-light skin tone",
+      "firefighter: medium skin tone",
+      "firefighter: medium-dark skin tone",
+      "firefighter: dark skin tone",
+      "man firefighter",
+      "man firefighter: light skin tone",
+      "man firefighter: medium-light skin tone",
+      "man firefighter: medium skin tone",
+      "man firefighter: medium-dark skin tone",
+      "man firefighter: dark skin tone",
+      "woman firefighter",
+      "woman firefighter: light skin tone",
+      "woman firefighter: medium-light skin tone",
+      "woman firefighter: medium skin tone",
+      "woman firefighter: medium-dark skin tone",
+      "woman firefighter: dark skin tone",
+      "police officer",
+      "police officer: light skin tone",
+      "police officer: medium-light skin tone",
+      "police officer: medium skin tone",
+      "police officer: medium-dark skin tone",
+      "police officer: dark skin tone",
+      "man police officer",
+      "man police officer: light skin tone",
+      "man police officer: medium-light skin tone",
+      "man police officer: medium skin tone",
+      "man police officer: medium-dark skin tone",
+      "man police officer: dark skin tone",
+      "woman police officer",
+      "woman police officer: light skin tone",
+      "woman police officer: medium-light skin tone",
+      "woman police officer: medium skin tone",
+      "woman police officer: medium-dark skin tone",
+      "woman police officer: dark skin tone",
+      "detective",
+      "detective: light skin tone",
+      "detective: medium-light skin tone",
+      "detective: medium skin tone",
+      "detective: medium-dark skin tone",
+      "detective: dark skin tone",
+      "man detective",
+      "man detective: light skin tone",
+      "man detective: medium-light skin tone",
+      "man detective: medium skin tone",
+      "man detective: medium-dark skin tone",
+      "man detective: dark skin tone",
+      "woman detective",
+      "woman detective: light skin tone",
+      "woman detective: medium-light skin tone",
+      "woman detective: medium skin tone",
+      "woman detective: medium-dark skin tone",
+      "woman detective: dark skin tone",
+      "guard",
+      "guard: light skin tone",
+      "guard: medium-light skin tone",
+      "guard: medium skin tone",
+      "guard: medium-dark skin tone",
+      "guard: dark skin tone",
+      "man guard",
+      "man guard: light skin tone",
+      "man guard: medium-light skin tone",
+      "man guard: medium skin tone",
+      "man guard: medium-dark skin tone",
+      "man guard: dark skin tone",
+      "woman guard",
+      "woman guard: light skin tone",
+      "woman guard: medium-light skin tone",
+      "woman guard: medium skin tone",
+      "woman guard: medium-dark skin tone",
+      "woman guard: dark skin tone",
+      "ninja",
+      "ninja: light skin tone",
+      "ninja: medium-light skin tone",
+      "ninja: medium skin tone",
+      "ninja: medium-dark skin tone",
+      "ninja: dark skin tone",
+      "construction worker",
+      "construction worker: light skin tone",
+      "construction worker: medium-light skin tone",
+      "construction worker: medium skin tone",
+      "construction worker: medium-dark skin tone",
+      "construction worker: dark skin tone",
+      "man construction worker",
+      "man construction worker: light skin tone",
+      "man construction worker: medium-light skin tone",
+      "man construction worker: medium skin tone",
+      "man construction worker: medium-dark skin tone",
+      "man construction worker: dark skin tone",
+      "woman construction worker",
+      "woman construction worker: light skin tone",
+      "woman construction worker: medium-light skin tone",
+      "woman construction worker: medium skin tone",
+      "woman construction worker: medium-dark skin tone",
+      "woman construction worker: dark skin tone",
+      "person with crown",
+      "person with crown: light skin tone",
+      "person with crown: medium-light skin tone",
+      "person with crown: medium skin tone",
+      "person with crown: medium-dark skin tone",
+      "person with crown: dark skin tone",
+      "prince",
+      "prince: light skin tone",
+      "prince: medium-light skin tone",
+      "prince: medium skin tone",
+      "prince: medium-dark skin tone",
+      "prince: dark skin tone",
+      "princess",
+      "princess: light skin tone",
+      "princess: medium-light skin tone",
+      "princess: medium skin tone",
+      "princess: medium-dark skin tone",
+      "princess: dark skin tone",
+      "person wearing turban",
+      "person wearing turban: light skin tone",
+      "person wearing turban: medium-light skin tone",
+      "person wearing turban: medium skin tone",
+      "person wearing turban: medium-dark skin tone",
+      "person wearing turban: dark skin tone",
+      "man wearing turban",
+      "man wearing turban: light skin tone",
+      "man wearing turban: medium-light skin tone",
+      "man wearing turban: medium skin tone",
+      "man wearing turban: medium-dark skin tone",
+      "man wearing turban: dark skin tone",
+      "woman wearing turban",
+      "woman wearing turban: light skin tone",
+      "woman wearing turban: medium-light skin tone",
+      "woman wearing turban: medium skin tone",
+      "woman wearing turban: medium-dark skin tone",
+      "woman wearing turban: dark skin tone",
+      "person with skullcap",
+      "person with skullcap: light skin tone",
+      "person with skullcap: medium-light skin tone",
+      "person with skullcap: medium skin tone",
+      "person with skullcap: medium-dark skin tone",
+      "person with skullcap: dark skin tone",
+      "woman with headscarf",
+      "woman with headscarf: light skin tone",
+      "woman with headscarf: medium-light skin tone",
+      "woman with headscarf: medium skin tone",
+      "woman with headscarf: medium-dark skin tone",
+      "woman with headscarf: dark skin tone",
+      "person in tuxedo",
+      "person in tuxedo: light skin tone",
+      "person in tuxedo: medium-light skin tone",
+      "person in tuxedo: medium skin tone",
+      "person in tuxedo: medium-dark skin tone",
+      "person in tuxedo: dark skin tone",
+      "man in tuxedo",
+      "man in tuxedo: light skin tone",
+      "man in tuxedo: medium-light skin tone",
+      "man in tuxedo: medium skin tone",
+      "man in tuxedo: medium-dark skin tone",
+      "man in tuxedo: dark skin tone",
+      "woman in tuxedo",
+      "woman in tuxedo: light skin tone",
+      "woman in tuxedo: medium-light skin tone",
+      "woman in tuxedo: medium skin tone",
+      "woman in tuxedo: medium-dark skin tone",
+      "woman in tuxedo: dark skin tone",
+      "person with veil",
+      "person with veil: light skin tone",
+      "person with veil: medium-light skin tone",
+      "person with veil: medium skin tone",
+      "person with veil: medium-dark skin tone",
+      "person with veil: dark skin tone",
+      "man with veil",
+      "man with veil: light skin tone",
+      "man with veil: medium-light skin tone",
+      "man with veil: medium skin tone",
+      "man with veil: medium-dark skin tone",
+      "man with veil: dark skin tone",
+      "woman with veil",
+      "woman with veil: light skin tone",
+      "woman with veil: medium-light skin tone",
+      "woman with veil: medium skin tone",
+      "woman with veil: medium-dark skin tone",
+      "woman with veil: dark skin tone",
+      "pregnant woman",
+      "pregnant woman: light skin tone",
+      "pregnant woman: medium-light skin tone",
+      "pregnant woman: medium skin tone",
+      "pregnant woman: medium-dark skin tone",
+      "pregnant woman: dark skin tone",
+      "pregnant man",
+      "pregnant man: light skin tone",
+      "pregnant man: medium-light skin tone",
+      "pregnant man: medium skin tone",
+      "pregnant man: medium-dark skin tone",
+      "pregnant man: dark skin tone",
+      "pregnant person",
+      "pregnant person: light skin tone",
+      "pregnant person: medium-light skin tone",
+      "pregnant person: medium skin tone",
+      "pregnant person: medium-dark skin tone",
+      "pregnant person: dark skin tone",
+      "breast-feeding",
+      "breast-feeding: light skin tone",
+      "breast-feeding: medium-light skin tone",
+      "breast-feeding: medium skin tone",
+      "breast-feeding: medium-dark skin tone",
+      "breast-feeding: dark skin tone",
+      "woman feeding baby",
+      "woman feeding baby: light skin tone",
+      "woman feeding baby: medium-light skin tone",
+      "woman feeding baby: medium skin tone",
+      "woman feeding baby: medium-dark skin tone",
+      "woman feeding baby: dark skin tone",
+      "man feeding baby",
+      "man feeding baby: light skin tone",
+      "man feeding baby: medium-light skin tone",
+      "man feeding baby: medium skin tone",
+      "man feeding baby: medium-dark skin tone",
+      "man feeding baby: dark skin tone",
+      "person feeding baby",
+      "person feeding baby: light skin tone",
+      "person feeding baby: medium-light skin tone",
+      "person feeding baby: medium skin tone",
+      "person feeding baby: medium-dark skin tone",
+      "person feeding baby: dark skin tone",
+      "baby angel",
+      "baby angel: light skin tone",
+      "baby angel: medium-light skin tone",
+      "baby angel: medium skin tone",
+      "baby angel: medium-dark skin tone",
+      "baby angel: dark skin tone",
+      "Santa Claus",
+      "Santa Claus: light skin tone",
+      "Santa Claus: medium-light skin tone",
+      "Santa Claus: medium skin tone",
+      "Santa Claus: medium-dark skin tone",
+      "Santa Claus: dark skin tone",
+      "Mrs. Claus",
+      "Mrs. Claus: light skin tone",
+      "Mrs. Claus: medium-light skin tone",
+      "Mrs. Claus: medium skin tone",
+      "Mrs. Claus: medium-dark skin tone",
+      "Mrs. Claus: dark skin tone",
+      "Mx Claus",
+      "Mx Claus: light skin tone",
+      "Mx Claus: medium-light skin tone",
+      "Mx Claus: medium skin tone",
+      "Mx Claus: medium-dark skin tone",
+      "Mx Claus: dark skin tone",
+      "superhero",
+      "superhero: light skin tone",
+      "superhero: medium-light skin tone",
+      "superhero: medium skin tone",
+      "superhero: medium-dark skin tone",
+      "superhero: dark skin tone",
+      "man superhero",
+      "man superhero: light skin tone",
+      "man superhero: medium-light skin tone",
+      "man superhero: medium skin tone",
+      "man superhero: medium-dark skin tone",
+      "man superhero: dark skin tone",
+      "woman superhero",
+      "woman superhero: light skin tone",
+      "woman superhero: medium-light skin tone",
+      "woman superhero: medium skin tone",
+      "woman superhero: medium-dark skin tone",
+      "woman superhero: dark skin tone",
+      "supervillain",
+      "supervillain: light skin tone",
+      "supervillain: medium-light skin tone",
+      "supervillain: medium skin tone",
+      "supervillain: medium-dark skin tone",
+      "supervillain: dark skin tone",
+      "man supervillain",
+      "man supervillain: light skin tone",
+      "man supervillain: medium-light skin tone",
+      "man supervillain: medium skin tone",
+      "man supervillain: medium-dark skin tone",
+      "man supervillain: dark skin tone",
+      "woman supervillain",
+      "woman supervillain: light skin tone",
+      "woman supervillain: medium-light skin tone",
+      "woman supervillain: medium skin tone",
+      "woman supervillain: medium-dark skin tone",
+      "woman supervillain: dark skin tone",
+      "mage",
+      "mage: light skin tone",
+      "mage: medium-light skin tone",
+      "mage: medium skin tone",
+      "mage: medium-dark skin tone",
+      "mage: dark skin tone",
+      "man mage",
+      "man mage: light skin tone",
+      "man mage: medium-light skin tone",
+      "man mage: medium skin tone",
+      "man mage: medium-dark skin tone",
+      "man mage: dark skin tone",
+      "woman mage",
+      "woman mage: light skin tone",
+      "woman mage: medium-light skin tone",
+      "woman mage: medium skin tone",
+      "woman mage: medium-dark skin tone",
+      "woman mage: dark skin tone",
+      "fairy",
+      "fairy: light skin tone",
+      "fairy: medium-light skin tone",
+      "fairy: medium skin tone",
+      "fairy: medium-dark skin tone",
+      "fairy: dark skin tone",
+      "man fairy",
+      "man fairy: light skin tone",
+      "man fairy: medium-light skin tone",
+      "man fairy: medium skin tone",
+      "man fairy: medium-dark skin tone",
+      "man fairy: dark skin tone",
+      "woman fairy",
+      "woman fairy: light skin tone",
+      "woman fairy: medium-light skin tone",
+      "woman fairy: medium skin tone",
+      "woman fairy: medium-dark skin tone",
+      "woman fairy: dark skin tone",
+      "vampire",
+      "vampire: light skin tone",
+      "vampire: medium-light skin tone",
+      "vampire: medium skin tone",
+      "vampire: medium-dark skin tone",
+      "vampire: dark skin tone",
+      "man vampire",
+      "man vampire: light skin tone",
+      "man vampire: medium-light skin tone",
+      "man vampire: medium skin tone",
+      "man vampire: medium-dark skin tone",
+      "man vampire: dark skin tone",
+      "woman vampire",
+      "woman vampire: light skin tone",
+      "woman vampire: medium-light skin tone",
+      "woman vampire: medium skin tone",
+      "woman vampire: medium-dark skin tone",
+      "woman vampire: dark skin tone",
+      "merperson",
+      "merperson: light skin tone",
+      "merperson: medium-light skin tone",
+      "merperson: medium skin tone",
+      "merperson: medium-dark skin tone",
+      "merperson: dark skin tone",
+      "merman",
+      "merman: light skin tone",
+      "merman: medium-light skin tone",
+      "merman: medium skin tone",
+      "merman: medium-dark skin tone",
+      "merman: dark skin tone",
+      "mermaid",
+      "mermaid: light skin tone",
+      "mermaid: medium-light skin tone",
+      "mermaid: medium skin tone",
+      "mermaid: medium-dark skin tone",
+      "mermaid: dark skin tone",
+      "elf",
+      "elf: light skin tone",
+      "elf: medium-light skin tone",
+      "elf: medium skin tone",
+      "elf: medium-dark skin tone",
+      "elf: dark skin tone",
+      "man elf",
+      "man elf: light skin tone",
+      "man elf: medium-light skin tone",
+      "man elf: medium skin tone",
+      "man elf: medium-dark skin tone",
+      "man elf: dark skin tone",
+      "woman elf",
+      "woman elf: light skin tone",
+      "woman elf: medium-light skin tone",
+      "woman elf: medium skin tone",
+      "woman elf: medium-dark skin tone",
+      "woman elf: dark skin tone",
+      "genie",
+      "man genie",
+      "woman genie",
+      "zombie",
+      "man zombie",
+      "woman zombie",
+      "troll",
+      "hairy creature",
+      "person getting massage",
+      "person getting massage: light skin tone",
+      "person getting massage: medium-light skin tone",
+      "person getting massage: medium skin tone",
+      "person getting massage: medium-dark skin tone",
+      "person getting massage: dark skin tone",
+      "man getting massage",
+      "man getting massage: light skin tone",
+      "man getting massage: medium-light skin tone",
+      "man getting massage: medium skin tone",
+      "man getting massage: medium-dark skin tone",
+      "man getting massage: dark skin tone",
+      "woman getting massage",
+      "woman getting massage: light skin tone",
+      "woman getting massage: medium-light skin tone",
+      "woman getting massage: medium skin tone",
+      "woman getting massage: medium-dark skin tone",
+      "woman getting massage: dark skin tone",
+      "person getting haircut",
+      "person getting haircut: light skin tone",
+      "person getting haircut: medium-light skin tone",
+      "person getting haircut: medium skin tone",
+      "person getting haircut: medium-dark skin tone",
+      "person getting haircut: dark skin tone",
+      "man getting haircut",
+      "man getting haircut: light skin tone",
+      "man getting haircut: medium-light skin tone",
+      "man getting haircut: medium skin tone",
+      "man getting haircut: medium-dark skin tone",
+      "man getting haircut: dark skin tone",
+      "woman getting haircut",
+      "woman getting haircut: light skin tone",
+      "woman getting haircut: medium-light skin tone",
+      "woman getting haircut: medium skin tone",
+      "woman getting haircut: medium-dark skin tone",
+      "woman getting haircut: dark skin tone",
+      "person walking",
+      "person walking: light skin tone",
+      "person walking: medium-light skin tone",
+      "person walking: medium skin tone",
+      "person walking: medium-dark skin tone",
+      "person walking: dark skin tone",
+      "man walking",
+      "man walking: light skin tone",
+      "man walking: medium-light skin tone",
+      "man walking: medium skin tone",
+      "man walking: medium-dark skin tone",
+      "man walking: dark skin tone",
+      "woman walking",
+      "woman walking: light skin tone",
+      "woman walking: medium-light skin tone",
+      "woman walking: medium skin tone",
+      "woman walking: medium-dark skin tone",
+      "woman walking: dark skin tone",
+      "person walking facing right",
+      "person walking facing right: light skin tone",
+      "person walking facing right: medium-light skin tone",
+      "person walking facing right: medium skin tone",
+      "person walking facing right: medium-dark skin tone",
+      "person walking facing right: dark skin tone",
+      "woman walking facing right",
+      "woman walking facing right: light skin tone",
+      "woman walking facing right: medium-light skin tone",
+      "woman walking facing right: medium skin tone",
+      "woman walking facing right: medium-dark skin tone",
+      "woman walking facing right: dark skin tone",
+      "man walking facing right",
+      "man walking facing right: light skin tone",
+      "man walking facing right: medium-light skin tone",
+      "man walking facing right: medium skin tone",
+      "man walking facing right: medium-dark skin tone",
+      "man walking facing right: dark skin tone",
+      "person standing",
+      "person standing: light skin tone",
+      "person standing: medium-light skin tone",
+      "person standing: medium skin tone",
+      "person standing: medium-dark skin tone",
+      "person standing: dark skin tone",
+      "man standing",
+      "man standing: light skin tone",
+      "man standing: medium-light skin tone",
+      "man standing: medium skin tone",
+      "man standing: medium-dark skin tone",
+      "man standing: dark skin tone",
+      "woman standing",
+      "woman standing: light skin tone",
+      "woman standing: medium-light skin tone",
+      "woman standing: medium skin tone",
+      "woman standing: medium-dark skin tone",
+      "woman standing: dark skin tone",
+      "person kneeling",
+      "person kneeling: light skin tone",
+      "person kneeling: medium-light skin tone",
+      "person kneeling: medium skin tone",
+      "person kneeling: medium-dark skin tone",
+      "person kneeling: dark skin tone",
+      "man kneeling",
+      "man kneeling: light skin tone",
+      "man kneeling: medium-light skin tone",
+      "man kneeling: medium skin tone",
+      "man kneeling: medium-dark skin tone",
+      "man kneeling: dark skin tone",
+      "woman kneeling",
+      "woman kneeling: light skin tone",
+      "woman kneeling: medium-light skin tone",
+      "woman kneeling: medium skin tone",
+      "woman kneeling: medium-dark skin tone",
+      "woman kneeling: dark skin tone",
+      "person kneeling facing right",
+      "person kneeling facing right: light skin tone",
+      "person kneeling facing right: medium-light skin tone",
+      "person kneeling facing right: medium skin tone",
+      "person kneeling facing right: medium-dark skin tone",
+      "person kneeling facing right: dark skin tone",
+      "woman kneeling facing right",
+      "woman kneeling facing right: light skin tone",
+      "woman kneeling facing right: medium-light skin tone",
+      "woman kneeling facing right: medium skin tone",
+      "woman kneeling facing right: medium-dark skin tone",
+      "woman kneeling facing right: dark skin tone",
+      "man kneeling facing right",
+      "man kneeling facing right: light skin tone",
+      "man kneeling facing right: medium-light skin tone",
+      "man kneeling facing right: medium skin tone",
+      "man kneeling facing right: medium-dark skin tone",
+      "man kneeling facing right: dark skin tone",
+      "person with white cane",
+      "person with white cane: light skin tone",
+      "person with white cane: medium-light skin tone",
+      "person with white cane: medium skin tone",
+      "person with white cane: medium-dark skin tone",
+      "person with white cane: dark skin tone",
+      "person with white cane facing right",
+      "person with white cane facing right: light skin tone",
+      "person with white cane facing right: medium-light skin tone",
+      "person with white cane facing right: medium skin tone",
+      "person with white cane facing right: medium-dark skin tone",
+      "person with white cane facing right: dark skin tone",
+      "man with white cane",
+      "man with white cane: light skin tone",
+      "man with white cane: medium-light skin tone",
+      "man with white cane: medium skin tone",
+      "man with white cane: medium-dark skin tone",
+      "man with white cane: dark skin tone",
+      "man with white cane facing right",
+      "man with white cane facing right: light skin tone",
+      "man with white cane facing right: medium-light skin tone",
+      "man with white cane facing right: medium skin tone",
+      "man with white cane facing right: medium-dark skin tone",
+      "man with white cane facing right: dark skin tone",
+      "woman with white cane",
+      "woman with white cane: light skin tone",
+      "woman with white cane: medium-light skin tone",
+      "woman with white cane: medium skin tone",
+      "woman with white cane: medium-dark skin tone",
+      "woman with white cane: dark skin tone",
+      "woman with white cane facing right",
+      "woman with white cane facing right: light skin tone",
+      "woman with white cane facing right: medium-light skin tone",
+      "woman with white cane facing right: medium skin tone",
+      "woman with white cane facing right: medium-dark skin tone",
+      "woman with white cane facing right: dark skin tone",
+      "person in motorized wheelchair",
+      "person in motorized wheelchair: light skin tone",
+      "person in motorized wheelchair: medium-light skin tone",
+      "person in motorized wheelchair: medium skin tone",
+      "person in motorized wheelchair: medium-dark skin tone",
+      "person in motorized wheelchair: dark skin tone",
+      "person in motorized wheelchair facing right",
+      "person in motorized wheelchair facing right: light skin tone",
+      "person in motorized wheelchair facing right: medium-light skin tone",
+      "person in motorized wheelchair facing right: medium skin tone",
+      "person in motorized wheelchair facing right: medium-dark skin tone",
+      "person in motorized wheelchair facing right: dark skin tone",
+      "man in motorized wheelchair",
+      "man in motorized wheelchair: light skin tone",
+      "man in motorized wheelchair: medium-light skin tone",
+      "man in motorized wheelchair: medium skin tone",
+      "man in motorized wheelchair: medium-dark skin tone",
+      "man in motorized wheelchair: dark skin tone",
+      "man in motorized wheelchair facing right",
+      "man in motorized wheelchair facing right: light skin tone",
+      "man in motorized wheelchair facing right: medium-light skin tone",
+      "man in motorized wheelchair facing right: medium skin tone",
+      "man in motorized wheelchair facing right: medium-dark skin tone",
+      "man in motorized wheelchair facing right: dark skin tone",
+      "woman in motorized wheelchair",
+      "woman in motorized wheelchair: light skin tone",
+      "woman in motorized wheelchair: medium-light skin tone",
+      "woman in motorized wheelchair: medium skin tone",
+      "woman in motorized wheelchair: medium-dark skin tone",
+      "woman in motorized wheelchair: dark skin tone",
+      "woman in motorized wheelchair facing right",
+      "woman in motorized wheelchair facing right: light skin tone",
+      "woman in motorized wheelchair facing right: medium-light skin tone",
+      "woman in motorized wheelchair facing right: medium skin tone",
+      "woman in motorized wheelchair facing right: medium-dark skin tone",
+      "woman in motorized wheelchair facing right: dark skin tone",
+      "person in manual wheelchair",
+      "person in manual wheelchair: light skin tone",
+      "person in manual wheelchair: medium-light skin tone",
+      "person in manual wheelchair: medium skin tone",
+      "person in manual wheelchair: medium-dark skin tone",
+      "person in manual wheelchair: dark skin tone",
+      "person in manual wheelchair facing right",
+      "person in manual wheelchair facing right: light skin tone",
+      "person in manual wheelchair facing right: medium-light skin tone",
+      "person in manual wheelchair facing right: medium skin tone",
+      "person in manual wheelchair facing right: medium-dark skin tone",
+      "person in manual wheelchair facing right: dark skin tone",
+      "man in manual wheelchair",
+      "man in manual wheelchair: light skin tone",
+      "man in manual wheelchair: medium-light skin tone",
+      "man in manual wheelchair: medium skin tone",
+      "man in manual wheelchair: medium-dark skin tone",
+      "man in manual wheelchair: dark skin tone",
+      "man in manual wheelchair facing right",
+      "man in manual wheelchair facing right: light skin tone",
+      "man in manual wheelchair facing right: medium-light skin tone",
+      "man in manual wheelchair facing right: medium skin tone",
+      "man in manual wheelchair facing right: medium-dark skin tone",
+      "man in manual wheelchair facing right: dark skin tone",
+      "woman in manual wheelchair",
+      "woman in manual wheelchair: light skin tone",
+      "woman in manual wheelchair: medium-light skin tone",
+      "woman in manual wheelchair: medium skin tone",
+      "woman in manual wheelchair: medium-dark skin tone",
+      "woman in manual wheelchair: dark skin tone",
+      "woman in manual wheelchair facing right",
+      "woman in manual wheelchair facing right: light skin tone",
+      "woman in manual wheelchair facing right: medium-light skin tone",
+      "woman in manual wheelchair facing right: medium skin tone",
+      "woman in manual wheelchair facing right: medium-dark skin tone",
+      "woman in manual wheelchair facing right: dark skin tone",
+      "person running",
+      "person running: light skin tone",
+      "person running: medium-light skin tone",
+      "person running: medium skin tone",
+      "person running: medium-dark skin tone",
+      "person running: dark skin tone",
+      "man running",
+      "man running: light skin tone",
+      "man running: medium-light skin tone",
+      "man running: medium skin tone",
+      "man running: medium-dark skin tone",
+      "man running: dark skin tone",
+      "woman running",
+      "woman running: light skin tone",
+      "woman running: medium-light skin tone",
+      "woman running: medium skin tone",
+      "woman running: medium-dark skin tone",
+      "woman running: dark skin tone",
+      "person running facing right",
+      "person running facing right: light skin tone",
+      "person running facing right: medium-light skin tone",
+      "person running facing right: medium skin tone",
+      "person running facing right: medium-dark skin tone",
+      "person running facing right: dark skin tone",
+      "woman running facing right",
+      "woman running facing right: light skin tone",
+      "woman running facing right: medium-light skin tone",
+      "woman running facing right: medium skin tone",
+      "woman running facing right: medium-dark skin tone",
+      "woman running facing right: dark skin tone",
+      "man running facing right",
+      "man running facing right: light skin tone",
+      "man running facing right: medium-light skin tone",
+      "man running facing right: medium skin tone",
+      "man running facing right: medium-dark skin tone",
+      "man running facing right: dark skin tone",
+      "ballet dancer",
+      "ballet dancer: light skin tone",
+      "ballet dancer: medium-light skin tone",
+      "ballet dancer: medium skin tone",
+      "ballet dancer: medium-dark skin tone",
+      "ballet dancer: dark skin tone",
+      "woman dancing",
+      "woman dancing: light skin tone",
+      "woman dancing: medium-light skin tone",
+      "woman dancing: medium skin tone",
+      "woman dancing: medium-dark skin tone",
+      "woman dancing: dark skin tone",
+      "man dancing",
+      "man dancing: light skin tone",
+      "man dancing: medium-light skin tone",
+      "man dancing: medium skin tone",
+      "man dancing: medium-dark skin tone",
+      "man dancing: dark skin tone",
+      "person in suit levitating",
+      "person in suit levitating: light skin tone",
+      "person in suit levitating: medium-light skin tone",
+      "person in suit levitating: medium skin tone",
+      "person in suit levitating: medium-dark skin tone",
+      "person in suit levitating: dark skin tone",
+      "people with bunny ears",
+      "people with bunny ears: light skin tone",
+      "people with bunny ears: medium-light skin tone",
+      "people with bunny ears: medium skin tone",
+      "people with bunny ears: medium-dark skin tone",
+      "people with bunny ears: dark skin tone",
+      "men with bunny ears",
+      "men with bunny ears: light skin tone",
+      "men with bunny ears: medium-light skin tone",
+      "men with bunny ears: medium skin tone",
+      "men with bunny ears: medium-dark skin tone",
+      "men with bunny ears: dark skin tone",
+      "women with bunny ears",
+      "women with bunny ears: light skin tone",
+      "women with bunny ears: medium-light skin tone",
+      "women with bunny ears: medium skin tone",
+      "women with bunny ears: medium-dark skin tone",
+      "women with bunny ears: dark skin tone",
+      "people with bunny ears: light skin tone, medium-light skin tone",
+      "people with bunny ears: light skin tone, medium skin tone",
+      "people with bunny ears: light skin tone, medium-dark skin tone",
+      "people with bunny ears: light skin tone, dark skin tone",
+      "people with bunny ears: medium-light skin tone, light skin tone",
+      "people with bunny ears: medium-light skin tone, medium skin tone",
+      "people with bunny ears: medium-light skin tone, medium-dark skin tone",
+      "people with bunny ears: medium-light skin tone, dark skin tone",
+      "people with bunny ears: medium skin tone, light skin tone",
+      "people with bunny ears: medium skin tone, medium-light skin tone",
+      "people with bunny ears: medium skin tone, medium-dark skin tone",
+      "people with bunny ears: medium skin tone, dark skin tone",
+      "people with bunny ears: medium-dark skin tone, light skin tone",
+      "people with bunny ears: medium-dark skin tone, medium-light skin tone",
+      "people with bunny ears: medium-dark skin tone, medium skin tone",
+      "people with bunny ears: medium-dark skin tone, dark skin tone",
+      "people with bunny ears: dark skin tone, light skin tone",
+      "people with bunny ears: dark skin tone, medium-light skin tone",
+      "people with bunny ears: dark skin tone, medium skin tone",
+      "people with bunny ears: dark skin tone, medium-dark skin tone",
+      "men with bunny ears: light skin tone, medium-light skin tone",
+      "men with bunny ears: light skin tone, medium skin tone",
+      "men with bunny ears: light skin tone, medium-dark skin tone",
+      "men with bunny ears: light skin tone, dark skin tone",
+      "men with bunny ears: medium-light skin tone, light skin tone",
+      "men with bunny ears: medium-light skin tone, medium skin tone",
+      "men with bunny ears: medium-light skin tone, medium-dark skin tone",
+      "men with bunny ears: medium-light skin tone, dark skin tone",
+      "men with bunny ears: medium skin tone, light skin tone",
+      "men with bunny ears: medium skin tone, medium-light skin tone",
+      "men with bunny ears: medium skin tone, medium-dark skin tone",
+      "men with bunny ears: medium skin tone, dark skin tone",
+      "men with bunny ears: medium-dark skin tone, light skin tone",
+      "men with bunny ears: medium-dark skin tone, medium-light skin tone",
+      "men with bunny ears: medium-dark skin tone, medium skin tone",
+      "men with bunny ears: medium-dark skin tone, dark skin tone",
+      "men with bunny ears: dark skin tone, light skin tone",
+      "men with bunny ears: dark skin tone, medium-light skin tone",
+      "men with bunny ears: dark skin tone, medium skin tone",
+      "men with bunny ears: dark skin tone, medium-dark skin tone",
+      "women with bunny ears: light skin tone, medium-light skin tone",
+      "women with bunny ears: light skin tone, medium skin tone",
+      "women with bunny ears: light skin tone, medium-dark skin tone",
+      "women with bunny ears: light skin tone, dark skin tone",
+      "women with bunny ears: medium-light skin tone, light skin tone",
+      "women with bunny ears: medium-light skin tone, medium skin tone",
+      "women with bunny ears: medium-light skin tone, medium-dark skin tone",
+      "women with bunny ears: medium-light skin tone, dark skin tone",
+      "women with bunny ears: medium skin tone, light skin tone",
+      "women with bunny ears: medium skin tone, medium-light skin tone",
+      "women with bunny ears: medium skin tone, medium-dark skin tone",
+      "women with bunny ears: medium skin tone, dark skin tone",
+      "women with bunny ears: medium-dark skin tone, light skin tone",
+      "women with bunny ears: medium-dark skin tone, medium-light skin tone",
+      "women with bunny ears: medium-dark skin tone, medium skin tone",
+      "women with bunny ears: medium-dark skin tone, dark skin tone",
+      "women with bunny ears: dark skin tone, light skin tone",
+      "women with bunny ears: dark skin tone, medium-light skin tone",
+      "women with bunny ears: dark skin tone, medium skin tone",
+      "women with bunny ears: dark skin tone, medium-dark skin tone",
+      "person in steamy room",
+      "person in steamy room: light skin tone",
+      "person in steamy room: medium-light skin tone",
+      "person in steamy room: medium skin tone",
+      "person in steamy room: medium-dark skin tone",
+      "person in steamy room: dark skin tone",
+      "man in steamy room",
+      "man in steamy room: light skin tone",
+      "man in steamy room: medium-light skin tone",
+      "man in steamy room: medium skin tone",
+      "man in steamy room: medium-dark skin tone",
+      "man in steamy room: dark skin tone",
+      "woman in steamy room",
+      "woman in steamy room: light skin tone",
+      "woman in steamy room: medium-light skin tone",
+      "woman in steamy room: medium skin tone",
+      "woman in steamy room: medium-dark skin tone",
+      "woman in steamy room: dark skin tone",
+      "person climbing",
+      "person climbing: light skin tone",
+      "person climbing: medium-light skin tone",
+      "person climbing: medium skin tone",
+      "person climbing: medium-dark skin tone",
+      "person climbing: dark skin tone",
+      "man climbing",
+      "man climbing: light skin tone",
+      "man climbing: medium-light skin tone",
+      "man climbing: medium skin tone",
+      "man climbing: medium-dark skin tone",
+      "man climbing: dark skin tone",
+      "woman climbing",
+      "woman climbing: light skin tone",
+      "woman climbing: medium-light skin tone",
+      "woman climbing: medium skin tone",
+      "woman climbing: medium-dark skin tone",
+      "woman climbing: dark skin tone",
+      "person fencing",
+      "horse racing",
+      "horse racing: light skin tone",
+      "horse racing: medium-light skin tone",
+      "horse racing: medium skin tone",
+      "horse racing: medium-dark skin tone",
+      "horse racing: dark skin tone",
+      "skier",
+      "snowboarder",
+      "snowboarder: light skin tone",
+      "snowboarder: medium-light skin tone",
+      "snowboarder: medium skin tone",
+      "snowboarder: medium-dark skin tone",
+      "snowboarder: dark skin tone",
+      "person golfing",
+      "person golfing: light skin tone",
+      "person golfing: medium-light skin tone",
+      "person golfing: medium skin tone",
+      "person golfing: medium-dark skin tone",
+      "person golfing: dark skin tone",
+      "man golfing",
+      "man golfing: light skin tone",
+      "man golfing: medium-light skin tone",
+      "man golfing: medium skin tone",
+      "man golfing: medium-dark skin tone",
+      "man golfing: dark skin tone",
+      "woman golfing",
+      "woman golfing: light skin tone",
+      "woman golfing: medium-light skin tone",
+      "woman golfing: medium skin tone",
+      "woman golfing: medium-dark skin tone",
+      "woman golfing: dark skin tone",
+      "person surfing",
+      "person surfing: light skin tone",
+      "person surfing: medium-light skin tone",
+      "person surfing: medium skin tone",
+      "person surfing: medium-dark skin tone",
+      "person surfing: dark skin tone",
+      "man surfing",
+      "man surfing: light skin tone",
+      "man surfing: medium-light skin tone",
+      "man surfing: medium skin tone",
+      "man surfing: medium-dark skin tone",
+      "man surfing: dark skin tone",
+      "woman surfing",
+      "woman surfing: light skin tone",
+      "woman surfing: medium-light skin tone",
+      "woman surfing: medium skin tone",
+      "woman surfing: medium-dark skin tone",
+      "woman surfing: dark skin tone",
+      "person rowing boat",
+      "person rowing boat: light skin tone",
+      "person rowing boat: medium-light skin tone",
+      "person rowing boat: medium skin tone",
+      "person rowing boat: medium-dark skin tone",
+      "person rowing boat: dark skin tone",
+      "man rowing boat",
+      "man rowing boat: light skin tone",
+      "man rowing boat: medium-light skin tone",
+      "man rowing boat: medium skin tone",
+      "man rowing boat: medium-dark skin tone",
+      "man rowing boat: dark skin tone",
+      "woman rowing boat",
+      "woman rowing boat: light skin tone",
+      "woman rowing boat: medium-light skin tone",
+      "woman rowing boat: medium skin tone",
+      "woman rowing boat: medium-dark skin tone",
+      "woman rowing boat: dark skin tone",
+      "person swimming",
+      "person swimming: light skin tone",
+      "person swimming: medium-light skin tone",
+      "person swimming: medium skin tone",
+      "person swimming: medium-dark skin tone",
+      "person swimming: dark skin tone",
+      "man swimming",
+      "man swimming: light skin tone",
+      "man swimming: medium-light skin tone",
+      "man swimming: medium skin tone",
+      "man swimming: medium-dark skin tone",
+      "man swimming: dark skin tone",
+      "woman swimming",
+      "woman swimming: light skin tone",
+      "woman swimming: medium-light skin tone",
+      "woman swimming: medium skin tone",
+      "woman swimming: medium-dark skin tone",
+      "woman swimming: dark skin tone",
+      "person bouncing ball",
+      "person bouncing ball: light skin tone",
+      "person bouncing ball: medium-light skin tone",
+      "person bouncing ball: medium skin tone",
+      "person bouncing ball: medium-dark skin tone",
+      "person bouncing ball: dark skin tone",
+      "man bouncing ball",
+      "man bouncing ball: light skin tone",
+      "man bouncing ball: medium-light skin tone",
+      "man bouncing ball: medium skin tone",
+      "man bouncing ball: medium-dark skin tone",
+      "man bouncing ball: dark skin tone",
+      "woman bouncing ball",
+      "woman bouncing ball: light skin tone",
+      "woman bouncing ball: medium-light skin tone",
+      "woman bouncing ball: medium skin tone",
+      "woman bouncing ball: medium-dark skin tone",
+      "woman bouncing ball: dark skin tone",
+      "person lifting weights",
+      "person lifting weights: light skin tone",
+      "person lifting weights: medium-light skin tone",
+      "person lifting weights: medium skin tone",
+      "person lifting weights: medium-dark skin tone",
+      "person lifting weights: dark skin tone",
+      "man lifting weights",
+      "man lifting weights: light skin tone",
+      "man lifting weights: medium-light skin tone",
+      "man lifting weights: medium skin tone",
+      "man lifting weights: medium-dark skin tone",
+      "man lifting weights: dark skin tone",
+      "woman lifting weights",
+      "woman lifting weights: light skin tone",
+      "woman lifting weights: medium-light skin tone",
+      "woman lifting weights: medium skin tone",
+      "woman lifting weights: medium-dark skin tone",
+      "woman lifting weights: dark skin tone",
+      "person biking",
+      "person biking: light skin tone",
+      "person biking: medium-light skin tone",
+      "person biking: medium skin tone",
+      "person biking: medium-dark skin tone",
+      "person biking: dark skin tone",
+      "man biking",
+      "man biking: light skin tone",
+      "man biking: medium-light skin tone",
+      "man biking: medium skin tone",
+      "man biking: medium-dark skin tone",
+      "man biking: dark skin tone",
+      "woman biking",
+      "woman biking: light skin tone",
+      "woman biking: medium-light skin tone",
+      "woman biking: medium skin tone",
+      "woman biking: medium-dark skin tone",
+      "woman biking: dark skin tone",
+      "person mountain biking",
+      "person mountain biking: light skin tone",
+      "person mountain biking: medium-light skin tone",
+      "person mountain biking: medium skin tone",
+      "person mountain biking: medium-dark skin tone",
+      "person mountain biking: dark skin tone",
+      "man mountain biking",
+      "man mountain biking: light skin tone",
+      "man mountain biking: medium-light skin tone",
+      "man mountain biking: medium skin tone",
+      "man mountain biking: medium-dark skin tone",
+      "man mountain biking: dark skin tone",
+      "woman mountain biking",
+      "woman mountain biking: light skin tone",
+      "woman mountain biking: medium-light skin tone",
+      "woman mountain biking: medium skin tone",
+      "woman mountain biking: medium-dark skin tone",
+      "woman mountain biking: dark skin tone",
+      "person cartwheeling",
+      "person cartwheeling: light skin tone",
+      "person cartwheeling: medium-light skin tone",
+      "person cartwheeling: medium skin tone",
+      "person cartwheeling: medium-dark skin tone",
+      "person cartwheeling: dark skin tone",
+      "man cartwheeling",
+      "man cartwheeling: light skin tone",
+      "man cartwheeling: medium-light skin tone",
+      "man cartwheeling: medium skin tone",
+      "man cartwheeling: medium-dark skin tone",
+      "man cartwheeling: dark skin tone",
+      "woman cartwheeling",
+      "woman cartwheeling: light skin tone",
+      "woman cartwheeling: medium-light skin tone",
+      "woman cartwheeling: medium skin tone",
+      "woman cartwheeling: medium-dark skin tone",
+      "woman cartwheeling: dark skin tone",
+      "people wrestling",
+      "people wrestling: light skin tone",
+      "people wrestling: medium-light skin tone",
+      "people wrestling: medium skin tone",
+      "people wrestling: medium-dark skin tone",
+      "people wrestling: dark skin tone",
+      "men wrestling",
+      "men wrestling: light skin tone",
+      "men wrestling: medium-light skin tone",
+      "men wrestling: medium skin tone",
+      "men wrestling: medium-dark skin tone",
+      "men wrestling: dark skin tone",
+      "women wrestling",
+      "women wrestling: light skin tone",
+      "women wrestling: medium-light skin tone",
+      "women wrestling: medium skin tone",
+      "women wrestling: medium-dark skin tone",
+      "women wrestling: dark skin tone",
+      "people wrestling: light skin tone, medium-light skin tone",
+      "people wrestling: light skin tone, medium skin tone",
+      "people wrestling: light skin tone, medium-dark skin tone",
+      "people wrestling: light skin tone, dark skin tone",
+      "people wrestling: medium-light skin tone, light skin tone",
+      "people wrestling: medium-light skin tone, medium skin tone",
+      "people wrestling: medium-light skin tone, medium-dark skin tone",
+      "people wrestling: medium-light skin tone, dark skin tone",
+      "people wrestling: medium skin tone, light skin tone",
+      "people wrestling: medium skin tone, medium-light skin tone",
+      "people wrestling: medium skin tone, medium-dark skin tone",
+      "people wrestling: medium skin tone, dark skin tone",
+      "people wrestling: medium-dark skin tone, light skin tone",
+      "people wrestling: medium-dark skin tone, medium-light skin tone",
+      "people wrestling: medium-dark skin tone, medium skin tone",
+      "people wrestling: medium-dark skin tone, dark skin tone",
+      "people wrestling: dark skin tone, light skin tone",
+      "people wrestling: dark skin tone, medium-light skin tone",
+      "people wrestling: dark skin tone, medium skin tone",
+      "people wrestling: dark skin tone, medium-dark skin tone",
+      "men wrestling: light skin tone, medium-light skin tone",
+      "men wrestling: light skin tone, medium skin tone",
+      "men wrestling: light skin tone, medium-dark skin tone",
+      "men wrestling: light skin tone, dark skin tone",
+      "men wrestling: medium-light skin tone, light skin tone",
+      "men wrestling: medium-light skin tone, medium skin tone",
+      "men wrestling: medium-light skin tone, medium-dark skin tone",
+      "men wrestling: medium-light skin tone, dark skin tone",
+      "men wrestling: medium skin tone, light skin tone",
+      "men wrestling: medium skin tone, medium-light skin tone",
+      "men wrestling: medium skin tone, medium-dark skin tone",
+      "men wrestling: medium skin tone, dark skin tone",
+      "men wrestling: medium-dark skin tone, light skin tone",
+      "men wrestling: medium-dark skin tone, medium-light skin tone",
+      "men wrestling: medium-dark skin tone, medium skin tone",
+      "men wrestling: medium-dark skin tone, dark skin tone",
+      "men wrestling: dark skin tone, light skin tone",
+      "men wrestling: dark skin tone, medium-light skin tone",
+      "men wrestling: dark skin tone, medium skin tone",
+      "men wrestling: dark skin tone, medium-dark skin tone",
+      "women wrestling: light skin tone, medium-light skin tone",
+      "women wrestling: light skin tone, medium skin tone",
+      "women wrestling: light skin tone, medium-dark skin tone",
+      "women wrestling: light skin tone, dark skin tone",
+      "women wrestling: medium-light skin tone, light skin tone",
+      "women wrestling: medium-light skin tone, medium skin tone",
+      "women wrestling: medium-light skin tone, medium-dark skin tone",
+      "women wrestling: medium-light skin tone, dark skin tone",
+      "women wrestling: medium skin tone, light skin tone",
+      "women wrestling: medium skin tone, medium-light skin tone",
+      "women wrestling: medium skin tone, medium-dark skin tone",
+      "women wrestling: medium skin tone, dark skin tone",
+      "women wrestling: medium-dark skin tone, light skin tone",
+      "women wrestling: medium-dark skin tone, medium-light skin tone",
+      "women wrestling: medium-dark skin tone, medium skin tone",
+      "women wrestling: medium-dark skin tone, dark skin tone",
+      "women wrestling: dark skin tone, light skin tone",
+      "women wrestling: dark skin tone, medium-light skin tone",
+      "women wrestling: dark skin tone, medium skin tone",
+      "women wrestling: dark skin tone, medium-dark skin tone",
+      "person playing water polo",
+      "person playing water polo: light skin tone",
+      "person playing water polo: medium-light skin tone",
+      "person playing water polo: medium skin tone",
+      "person playing water polo: medium-dark skin tone",
+      "person playing water polo: dark skin tone",
+      "man playing water polo",
+      "man playing water polo: light skin tone",
+      "man playing water polo: medium-light skin tone",
+      "man playing water polo: medium skin tone",
+      "man playing water polo: medium-dark skin tone",
+      "man playing water polo: dark skin tone",
+      "woman playing water polo",
+      "woman playing water polo: light skin tone",
+      "woman playing water polo: medium-light skin tone",
+      "woman playing water polo: medium skin tone",
+      "woman playing water polo: medium-dark skin tone",
+      "woman playing water polo: dark skin tone",
+      "person playing handball",
+      "person playing handball: light skin tone",
+      "person playing handball: medium-light skin tone",
+      "person playing handball: medium skin tone",
+      "person playing handball: medium-dark skin tone",
+      "person playing handball: dark skin tone",
+      "man playing handball",
+      "man playing handball: light skin tone",
+      "man playing handball: medium-light skin tone",
+      "man playing handball: medium skin tone",
+      "man playing handball: medium-dark skin tone",
+      "man playing handball: dark skin tone",
+      "woman playing handball",
+      "woman playing handball: light skin tone",
+      "woman playing handball: medium-light skin tone",
+      "woman playing handball: medium skin tone",
+      "woman playing handball: medium-dark skin tone",
+      "woman playing handball: dark skin tone",
+      "person juggling",
+      "person juggling: light skin tone",
+      "person juggling: medium-light skin tone",
+      "person juggling: medium skin tone",
+      "person juggling: medium-dark skin tone",
+      "person juggling: dark skin tone",
+      "man juggling",
+      "man juggling: light skin tone",
+      "man juggling: medium-light skin tone",
+      "man juggling: medium skin tone",
+      "man juggling: medium-dark skin tone",
+      "man juggling: dark skin tone",
+      "woman juggling",
+      "woman juggling: light skin tone",
+      "woman juggling: medium-light skin tone",
+      "woman juggling: medium skin tone",
+      "woman juggling: medium-dark skin tone",
+      "woman juggling: dark skin tone",
+      "person in lotus position",
+      "person in lotus position: light skin tone",
+      "person in lotus position: medium-light skin tone",
+      "person in lotus position: medium skin tone",
+      "person in lotus position: medium-dark skin tone",
+      "person in lotus position: dark skin tone",
+      "man in lotus position",
+      "man in lotus position: light skin tone",
+      "man in lotus position: medium-light skin tone",
+      "man in lotus position: medium skin tone",
+      "man in lotus position: medium-dark skin tone",
+      "man in lotus position: dark skin tone",
+      "woman in lotus position",
+      "woman in lotus position: light skin tone",
+      "woman in lotus position: medium-light skin tone",
+      "woman in lotus position: medium skin tone",
+      "woman in lotus position: medium-dark skin tone",
+      "woman in lotus position: dark skin tone",
+      "person taking bath",
+      "person taking bath: light skin tone",
+      "person taking bath: medium-light skin tone",
+      "person taking bath: medium skin tone",
+      "person taking bath: medium-dark skin tone",
+      "person taking bath: dark skin tone",
+      "person in bed",
+      "person in bed: light skin tone",
+      "person in bed: medium-light skin tone",
+      "person in bed: medium skin tone",
+      "person in bed: medium-dark skin tone",
+      "person in bed: dark skin tone",
+      "people holding hands",
+      "people holding hands: light skin tone",
+      "people holding hands: light skin tone, medium-light skin tone",
+      "people holding hands: light skin tone, medium skin tone",
+      "people holding hands: light skin tone, medium-dark skin tone",
+      "people holding hands: light skin tone, dark skin tone",
+      "people holding hands: medium-light skin tone, light skin tone",
+      "people holding hands: medium-light skin tone",
+      "people holding hands: medium-light skin tone, medium skin tone",
+      "people holding hands: medium-light skin tone, medium-dark skin tone",
+      "people holding hands: medium-light skin tone, dark skin tone",
+      "people holding hands: medium skin tone, light skin tone",
+      "people holding hands: medium skin tone, medium-light skin tone",
+      "people holding hands: medium skin tone",
+      "people holding hands: medium skin tone, medium-dark skin tone",
+      "people holding hands: medium skin tone, dark skin tone",
+      "people holding hands: medium-dark skin tone, light skin tone",
+      "people holding hands: medium-dark skin tone, medium-light skin tone",
+      "people holding hands: medium-dark skin tone, medium skin tone",
+      "people holding hands: medium-dark skin tone",
+      "people holding hands: medium-dark skin tone, dark skin tone",
+      "people holding hands: dark skin tone, light skin tone",
+      "people holding hands: dark skin tone, medium-light skin tone",
+      "people holding hands: dark skin tone, medium skin tone",
+      "people holding hands: dark skin tone, medium-dark skin tone",
+      "people holding hands: dark skin tone",
+      "women holding hands",
+      "women holding hands: light skin tone",
+      "women holding hands: light skin tone, medium-light skin tone",
+      "women holding hands: light skin tone, medium skin tone",
+      "women holding hands: light skin tone, medium-dark skin tone",
+      "women holding hands: light skin tone, dark skin tone",
+      "women holding hands: medium-light skin tone, light skin tone",
+      "women holding hands: medium-light skin tone",
+      "women holding hands: medium-light skin tone, medium skin tone",
+      "women holding hands: medium-light skin tone, medium-dark skin tone",
+      "women holding hands: medium-light skin tone, dark skin tone",
+      "women holding hands: medium skin tone, light skin tone",
+      "women holding hands: medium skin tone, medium-light skin tone",
+      "women holding hands: medium skin tone",
+      "women holding hands: medium skin tone, medium-dark skin tone",
+      "women holding hands: medium skin tone, dark skin tone",
+      "women holding hands: medium-dark skin tone, light skin tone",
+      "women holding hands: medium-dark skin tone, medium-light skin tone",
+      "women holding hands: medium-dark skin tone, medium skin tone",
+      "women holding hands: medium-dark skin tone",
+      "women holding hands: medium-dark skin tone, dark skin tone",
+      "women holding hands: dark skin tone, light skin tone",
+      "women holding hands: dark skin tone, medium-light skin tone",
+      "women holding hands: dark skin tone, medium skin tone",
+      "women holding hands: dark skin tone, medium-dark skin tone",
+      "women holding hands: dark skin tone",
+      "woman and man holding hands",
+      "woman and man holding hands: light skin tone",
+      "woman and man holding hands: light skin tone, medium-light skin tone",
+      "woman and man holding hands: light skin tone, medium skin tone",
+      "woman and man holding hands: light skin tone, medium-dark skin tone",
+      "woman and man holding hands: light skin tone, dark skin tone",
+      "woman and man holding hands: medium-light skin tone, light skin tone",
+      "woman and man holding hands: medium-light skin tone",
+      "woman and man holding hands: medium-light skin tone, medium skin tone",
+      "woman and man holding hands: medium-light skin tone, medium-dark skin tone",
+      "woman and man holding hands: medium-light skin tone, dark skin tone",
+      "woman and man holding hands: medium skin tone, light skin tone",
+      "woman and man holding hands: medium skin tone, medium-light skin tone",
+      "woman and man holding hands: medium skin tone",
+      "woman and man holding hands: medium skin tone, medium-dark skin tone",
+      "woman and man holding hands: medium skin tone, dark skin tone",
+      "woman and man holding hands: medium-dark skin tone, light skin tone",
+      "woman and man holding hands: medium-dark skin tone, medium-light skin tone",
+      "woman and man holding hands: medium-dark skin tone, medium skin tone",
+      "woman and man holding hands: medium-dark skin tone",
+      "woman and man holding hands: medium-dark skin tone, dark skin tone",
+      "woman and man holding hands: dark skin tone, light skin tone",
+      "woman and man holding hands: dark skin tone, medium-light skin tone",
+      "woman and man holding hands: dark skin tone, medium skin tone",
+      "woman and man holding hands: dark skin tone, medium-dark skin tone",
+      "woman and man holding hands: dark skin tone",
+      "men holding hands",
+      "men holding hands: light skin tone",
+      "men holding hands: light skin tone, medium-light skin tone",
+      "men holding hands: light skin tone, medium skin tone",
+      "men holding hands: light skin tone, medium-dark skin tone",
+      "men holding hands: light skin tone, dark skin tone",
+      "men holding hands: medium-light skin tone, light skin tone",
+      "men holding hands: medium-light skin tone",
+      "men holding hands: medium-light skin tone, medium skin tone",
+      "men holding hands: medium-light skin tone, medium-dark skin tone",
+      "men holding hands: medium-light skin tone, dark skin tone",
+      "men holding hands: medium skin tone, light skin tone",
+      "men holding hands: medium skin tone, medium-light skin tone",
+      "men holding hands: medium skin tone",
+      "men holding hands: medium skin tone, medium-dark skin tone",
+      "men holding hands: medium skin tone, dark skin tone",
+      "men holding hands: medium-dark skin tone, light skin tone",
+      "men holding hands: medium-dark skin tone, medium-light skin tone",
+      "men holding hands: medium-dark skin tone, medium skin tone",
+      "men holding hands: medium-dark skin tone",
+      "men holding hands: medium-dark skin tone, dark skin tone",
+      "men holding hands: dark skin tone, light skin tone",
+      "men holding hands: dark skin tone, medium-light skin tone",
+      "men holding hands: dark skin tone, medium skin tone",
+      "men holding hands: dark skin tone, medium-dark skin tone",
+      "men holding hands: dark skin tone",
+      "kiss",
+      "kiss: light skin tone",
+      "kiss: medium-light skin tone",
+      "kiss: medium skin tone",
+      "kiss: medium-dark skin tone",
+      "kiss: dark skin tone",
+      "kiss: person, person, light skin tone, medium-light skin tone",
+      "kiss: person, person, light skin tone, medium skin tone",
+      "kiss: person, person, light skin tone, medium-dark skin tone",
+      "kiss: person, person, light skin tone, dark skin tone",
+      "kiss: person, person, medium-light skin tone, light skin tone",
+      "kiss: person, person, medium-light skin tone, medium skin tone",
+      "kiss: person, person, medium-light skin tone, medium-dark skin tone",
+      "kiss: person, person, medium-light skin tone, dark skin tone",
+      "kiss: person, person, medium skin tone, light skin tone",
+      "kiss: person, person, medium skin tone, medium-light skin tone",
+      "kiss: person, person, medium skin tone, medium-dark skin tone",
+      "kiss: person, person, medium skin tone, dark skin tone",
+      "kiss: person, person, medium-dark skin tone, light skin tone",
+      "kiss: person, person, medium-dark skin tone, medium-light skin tone",
+      "kiss: person, person, medium-dark skin tone, medium skin tone",
+      "kiss: person, person, medium-dark skin tone, dark skin tone",
+      "kiss: person, person, dark skin tone, light skin tone",
+      "kiss: person, person, dark skin tone, medium-light skin tone",
+      "kiss: person, person, dark skin tone, medium skin tone",
+      "kiss: person, person, dark skin tone, medium-dark skin tone",
+      "kiss: woman, man",
+      "kiss: woman, man, light skin tone",
+      "kiss: woman, man, light skin tone, medium-light skin tone",
+      "kiss: woman, man, light skin tone, medium skin tone",
+      "kiss: woman, man, light skin tone, medium-dark skin tone",
+      "kiss: woman, man, light skin tone, dark skin tone",
+      "kiss: woman, man, medium-light skin tone, light skin tone",
+      "kiss: woman, man, medium-light skin tone",
+      "kiss: woman, man, medium-light skin tone, medium skin tone",
+      "kiss: woman, man, medium-light skin tone, medium-dark skin tone",
+      "kiss: woman, man, medium-light skin tone, dark skin tone",
+      "kiss: woman, man, medium skin tone, light skin tone",
+      "kiss: woman, man, medium skin tone, medium-light skin tone",
+      "kiss: woman, man, medium skin tone",
+      "kiss: woman, man, medium skin tone, medium-dark skin tone",
+      "kiss: woman, man, medium skin tone, dark skin tone",
+      "kiss: woman, man, medium-dark skin tone, light skin tone",
+      "kiss: woman, man, medium-dark skin tone, medium-light skin tone",
+      "kiss: woman, man, medium-dark skin tone, medium skin tone",
+      "kiss: woman, man, medium-dark skin tone",
+      "kiss: woman, man, medium-dark skin tone, dark skin tone",
+      "kiss: woman, man, dark skin tone, light skin tone",
+      "kiss: woman, man, dark skin tone, medium-light skin tone",
+      "kiss: woman, man, dark skin tone, medium skin tone",
+      "kiss: woman, man, dark skin tone, medium-dark skin tone",
+      "kiss: woman, man, dark skin tone",
+      "kiss: man, man",
+      "kiss: man, man, light skin tone",
+      "kiss: man, man, light skin tone, medium-light skin tone",
+      "kiss: man, man, light skin tone, medium skin tone",
+      "kiss: man, man, light skin tone, medium-dark skin tone",
+      "kiss: man, man, light skin tone, dark skin tone",
+      "kiss: man, man, medium-light skin tone, light skin tone",
+      "kiss: man, man, medium-light skin tone",
+      "kiss: man, man, medium-light skin tone, medium skin tone",
+      "kiss: man, man, medium-light skin tone, medium-dark skin tone",
+      "kiss: man, man, medium-light skin tone, dark skin tone",
+      "kiss: man, man, medium skin tone, light skin tone",
+      "kiss: man, man, medium skin tone, medium-light skin tone",
+      "kiss: man, man, medium skin tone",
+      "kiss: man, man, medium skin tone, medium-dark skin tone",
+      "kiss: man, man, medium skin tone, dark skin tone",
+      "kiss: man, man, medium-dark skin tone, light skin tone",
+      "kiss: man, man, medium-dark skin tone, medium-light skin tone",
+      "kiss: man, man, medium-dark skin tone, medium skin tone",
+      "kiss: man, man, medium-dark skin tone",
+      "kiss: man, man, medium-dark skin tone, dark skin tone",
+      "kiss: man, man, dark skin tone, light skin tone",
+      "kiss: man, man, dark skin tone, medium-light skin tone",
+      "kiss: man, man, dark skin tone, medium skin tone",
+      "kiss: man, man, dark skin tone, medium-dark skin tone",
+      "kiss: man, man, dark skin tone",
+      "kiss: woman, woman",
+      "kiss: woman, woman, light skin tone",
+      "kiss: woman, woman, light skin tone, medium-light skin tone",
+      "kiss: woman, woman, light skin tone, medium skin tone",
+      "kiss: woman, woman, light skin tone, medium-dark skin tone",
+      "kiss: woman, woman, light skin tone, dark skin tone",
+      "kiss: woman, woman, medium-light skin tone, light skin tone",
+      "kiss: woman, woman, medium-light skin tone",
+      "kiss: woman, woman, medium-light skin tone, medium skin tone",
+      "kiss: woman, woman, medium-light skin tone, medium-dark skin tone",
+      "kiss: woman, woman, medium-light skin tone, dark skin tone",
+      "kiss: woman, woman, medium skin tone, light skin tone",
+      "kiss: woman, woman, medium skin tone, medium-light skin tone",
+      "kiss: woman, woman, medium skin tone",
+      "kiss: woman, woman, medium skin tone, medium-dark skin tone",
+      "kiss: woman, woman, medium skin tone, dark skin tone",
+      "kiss: woman, woman, medium-dark skin tone, light skin tone",
+      "kiss: woman, woman, medium-dark skin tone, medium-light skin tone",
+      "kiss: woman, woman, medium-dark skin tone, medium skin tone",
+      "kiss: woman, woman, medium-dark skin tone",
+      "kiss: woman, woman, medium-dark skin tone, dark skin tone",
+      "kiss: woman, woman, dark skin tone, light skin tone",
+      "kiss: woman, woman, dark skin tone, medium-light skin tone",
+      "kiss: woman, woman, dark skin tone, medium skin tone",
+      "kiss: woman, woman, dark skin tone, medium-dark skin tone",
+      "kiss: woman, woman, dark skin tone",
+      "couple with heart",
+      "couple with heart: light skin tone",
+      "couple with heart: medium-light skin tone",
+      "couple with heart: medium skin tone",
+      "couple with heart: medium-dark skin tone",
+      "couple with heart: dark skin tone",
+      "couple with heart: person, person, light skin tone, medium-light skin tone",
+      "couple with heart: person, person, light skin tone, medium skin tone",
+      "couple with heart: person, person, light skin tone, medium-dark skin tone",
+      "couple with heart: person, person, light skin tone, dark skin tone",
+      "couple with heart: person, person, medium-light skin tone, light skin tone",
+      "couple with heart: person, person, medium-light skin tone, medium skin tone",
+      "couple with heart: person, person, medium-light skin tone, medium-dark skin tone",
+      "couple with heart: person, person, medium-light skin tone, dark skin tone",
+      "couple with heart: person, person, medium skin tone, light skin tone",
+      "couple with heart: person, person, medium skin tone, medium-light skin tone",
+      "couple with heart: person, person, medium skin tone, medium-dark skin tone",
+      "couple with heart: person, person, medium skin tone, dark skin tone",
+      "couple with heart: person, person, medium-dark skin tone, light skin tone",
+      "couple with heart: person, person, medium-dark skin tone, medium-light skin tone",
+      "couple with heart: person, person, medium-dark skin tone, medium skin tone",
+      "couple with heart: person, person, medium-dark skin tone, dark skin tone",
+      "couple with heart: person, person, dark skin tone, light skin tone",
+      "couple with heart: person, person, dark skin tone, medium-light skin tone",
+      "couple with heart: person, person, dark skin tone, medium skin tone",
+      "couple with heart: person, person, dark skin tone, medium-dark skin tone",
+      "couple with heart: woman, man",
+      "couple with heart: woman, man, light skin tone",
+      "couple with heart: woman, man, light skin tone, medium-light skin tone",
+      "couple with heart: woman, man, light skin tone, medium skin tone",
+      "couple with heart: woman, man, light skin tone, medium-dark skin tone",
+      "couple with heart: woman, man, light skin tone, dark skin tone",
+      "couple with heart: woman, man, medium-light skin tone, light skin tone",
+      "couple with heart: woman, man, medium-light skin tone",
+      "couple with heart: woman, man, medium-light skin tone, medium skin tone",
+      "couple with heart: woman, man, medium-light skin tone, medium-dark skin tone",
+      "couple with heart: woman, man, medium-light skin tone, dark skin tone",
+      "couple with heart: woman, man, medium skin tone, light skin tone",
+      "couple with heart: woman, man, medium skin tone, medium-light skin tone",
+      "couple with heart: woman, man, medium skin tone",
+      "couple with heart: woman, man, medium skin tone, medium-dark skin tone",
+      "couple with heart: woman, man, medium skin tone, dark skin tone",
+      "couple with heart: woman, man, medium-dark skin tone, light skin tone",
+      "couple with heart: woman, man, medium-dark skin tone, medium-light skin tone",
+      "couple with heart: woman, man, medium-dark skin tone, medium skin tone",
+      "couple with heart: woman, man, medium-dark skin tone",
+      "couple with heart: woman, man, medium-dark skin tone, dark skin tone",
+      "couple with heart: woman, man, dark skin tone, light skin tone",
+      "couple with heart: woman, man, dark skin tone, medium-light skin tone",
+      "couple with heart: woman, man, dark skin tone, medium skin tone",
+      "couple with heart: woman, man, dark skin tone, medium-dark skin tone",
+      "couple with heart: woman, man, dark skin tone",
+      "couple with heart: man, man",
+      "couple with heart: man, man, light skin tone",
+      "couple with heart: man, man, light skin tone, medium-light skin tone",
+      "couple with heart: man, man, light skin tone, medium skin tone",
+      "couple with heart: man, man, light skin tone, medium-dark skin tone",
+      "couple with heart: man, man, light skin tone, dark skin tone",
+      "couple with heart: man, man, medium-light skin tone, light skin tone",
+      "couple with heart: man, man, medium-light skin tone",
+      "couple with heart: man, man, medium-light skin tone, medium skin tone",
+      "couple with heart: man, man, medium-light skin tone, medium-dark skin tone",
+      "couple with heart: man, man, medium-light skin tone, dark skin tone",
+      "couple with heart: man, man, medium skin tone, light skin tone",
+      "couple with heart: man, man, medium skin tone, medium-light skin tone",
+      "couple with heart: man, man, medium skin tone",
+      "couple with heart: man, man, medium skin tone, medium-dark skin tone",
+      "couple with heart: man, man, medium skin tone, dark skin tone",
+      "couple with heart: man, man, medium-dark skin tone, light skin tone",
+      "couple with heart: man, man, medium-dark skin tone, medium-light skin tone",
+      "couple with heart: man, man, medium-dark skin tone, medium skin tone",
+      "couple with heart: man, man, medium-dark skin tone",
+      "couple with heart: man, man, medium-dark skin tone, dark skin tone",
+      "couple with heart: man, man, dark skin tone, light skin tone",
+      "couple with heart: man, man, dark skin tone, medium-light skin tone",
+      "couple with heart: man, man, dark skin tone, medium skin tone",
+      "couple with heart: man, man, dark skin tone, medium-dark skin tone",
+      "couple with heart: man, man, dark skin tone",
+      "couple with heart: woman, woman",
+      "couple with heart: woman, woman, light skin tone",
+      "couple with heart: woman, woman, light skin tone, medium-light skin tone",
+      "couple with heart: woman, woman, light skin tone, medium skin tone",
+      "couple with heart: woman, woman, light skin tone, medium-dark skin tone",
+      "couple with heart: woman, woman, light skin tone, dark skin tone",
+      "couple with heart: woman, woman, medium-light skin tone, light skin tone",
+      "couple with heart: woman, woman, medium-light skin tone",
+      "couple with heart: woman, woman, medium-light skin tone, medium skin tone",
+      "couple with heart: woman, woman, medium-light skin tone, medium-dark skin tone",
+      "couple with heart: woman, woman, medium-light skin tone, dark skin tone",
+      "couple with heart: woman, woman, medium skin tone, light skin tone",
+      "couple with heart: woman, woman, medium skin tone, medium-light skin tone",
+      "couple with heart: woman, woman, medium skin tone",
+      "couple with heart: woman, woman, medium skin tone, medium-dark skin tone",
+      "couple with heart: woman, woman, medium skin tone, dark skin tone",
+      "couple with heart: woman, woman, medium-dark skin tone, light skin tone",
+      "couple with heart: woman, woman, medium-dark skin tone, medium-light skin tone",
+      "couple with heart: woman, woman, medium-dark skin tone, medium skin tone",
+      "couple with heart: woman, woman, medium-dark skin tone",
+      "couple with heart: woman, woman, medium-dark skin tone, dark skin tone",
+      "couple with heart: woman, woman, dark skin tone, light skin tone",
+      "couple with heart: woman, woman, dark skin tone, medium-light skin tone",
+      "couple with heart: woman, woman, dark skin tone, medium skin tone",
+      "couple with heart: woman, woman, dark skin tone, medium-dark skin tone",
+      "couple with heart: woman, woman, dark skin tone",
+      "family: man, woman, boy",
+      "family: man, woman, girl",
+      "family: man, woman, girl, boy",
+      "family: man, woman, boy, boy",
+      "family: man, woman, girl, girl",
+      "family: man, man, boy",
+      "family: man, man, girl",
+      "family: man, man, girl, boy",
+      "family: man, man, boy, boy",
+      "family: man, man, girl, girl",
+      "family: woman, woman, boy",
+      "family: woman, woman, girl",
+      "family: woman, woman, girl, boy",
+      "family: woman, woman, boy, boy",
+      "family: woman, woman, girl, girl",
+      "family: man, boy",
+      "family: man, boy, boy",
+      "family: man, girl",
+      "family: man, girl, boy",
+      "family: man, girl, girl",
+      "family: woman, boy",
+      "family: woman, boy, boy",
+      "family: woman, girl",
+      "family: woman, girl, boy",
+      "family: woman, girl, girl",
+      "speaking head",
+      "bust in silhouette",
+      "busts in silhouette",
+      "people hugging",
+      "family: adult, adult, child",
+      "family: adult, adult, child, child",
+      "family: adult, child",
+      "family: adult, child, child",
+      "footprints",
+      "fingerprint",
+      "light skin tone",
+      "medium-light skin tone",
+      "medium skin tone",
+      "medium-dark skin tone",
+      "dark skin tone",
+      "red hair",
+      "curly hair",
+      "white hair",
+      "bald",
+      "monkey face",
+      "monkey",
+      "gorilla",
+      "orangutan",
+      "dog face",
+      "dog",
+      "guide dog",
+      "service dog",
+      "poodle",
+      "wolf",
+      "fox",
+      "raccoon",
+      "cat face",
+      "cat",
+      "black cat",
+      "lion",
+      "tiger face",
+      "tiger",
+      "leopard",
+      "horse face",
+      "moose",
+      "donkey",
+      "horse",
+      "unicorn",
+      "zebra",
+      "deer",
+      "bison",
+      "cow face",
+      "ox",
+      "water buffalo",
+      "cow",
+      "pig face",
+      "pig",
+      "boar",
+      "pig nose",
+      "ram",
+      "ewe",
+      "goat",
+      "camel",
+      "two-hump camel",
+      "llama",
+      "giraffe",
+      "elephant",
+      "mammoth",
+      "rhinoceros",
+      "hippopotamus",
+      "mouse face",
+      "mouse",
+      "rat",
+      "hamster",
+      "rabbit face",
+      "rabbit",
+      "chipmunk",
+      "beaver",
+      "hedgehog",
+      "bat",
+      "bear",
+      "polar bear",
+      "koala",
+      "panda",
+      "sloth",
+      "otter",
+      "skunk",
+      "kangaroo",
+      "badger",
+      "paw prints",
+      "turkey",
+      "chicken",
+      "rooster",
+      "hatching chick",
+      "baby chick",
+      "front-facing baby chick",
+      "bird",
+      "penguin",
+      "dove",
+      "eagle",
+      "duck",
+      "swan",
+      "owl",
+      "dodo",
+      "feather",
+      "flamingo",
+      "peacock",
+      "parrot",
+      "wing",
+      "black bird",
+      "goose",
+      "phoenix",
+      "frog",
+      "crocodile",
+      "turtle",
+      "lizard",
+      "snake",
+      "dragon face",
+      "dragon",
+      "sauropod",
+      "T-Rex",
+      "spouting whale",
+      "whale",
+      "dolphin",
+      "orca",
+      "seal",
+      "fish",
+      "tropical fish",
+      "blowfish",
+      "shark",
+      "octopus",
+      "spiral shell",
+      "coral",
+      "jellyfish",
+      "crab",
+      "lobster",
+      "shrimp",
+      "squid",
+      "oyster",
+      "snail",
+      "butterfly",
+      "bug",
+      "ant",
+      "honeybee",
+      "beetle",
+      "lady beetle",
+      "cricket",
+      "cockroach",
+      "spider",
+      "spider web",
+      "scorpion",
+      "mosquito",
+      "fly",
+      "worm",
+      "microbe",
+      "bouquet",
+      "cherry blossom",
+      "white flower",
+      "lotus",
+      "rosette",
+      "rose",
+      "wilted flower",
+      "hibiscus",
+      "sunflower",
+      "blossom",
+      "tulip",
+      "hyacinth",
+      "seedling",
+      "potted plant",
+      "evergreen tree",
+      "deciduous tree",
+      "palm tree",
+      "cactus",
+      "sheaf of rice",
+      "herb",
+      "shamrock",
+      "four leaf clover",
+      "maple leaf",
+      "fallen leaf",
+      "leaf fluttering in wind",
+      "empty nest",
+      "nest with eggs",
+      "mushroom",
+      "leafless tree",
+      "grapes",
+      "melon",
+      "watermelon",
+      "tangerine",
+      "lemon",
+      "lime",
+      "banana",
+      "pineapple",
+      "mango",
+      "red apple",
+      "apple core",
+      "green apple",
+      "pear",
+      "peach",
+      "cherries",
+      "strawberry",
+      "blueberries",
+      "kiwi fruit",
+      "tomato",
+      "olive",
+      "coconut",
+      "avocado",
+      "eggplant",
+      "potato",
+      "carrot",
+      "ear of corn",
+      "hot pepper",
+      "bell pepper",
+      "cucumber",
+      "leafy green",
+      "broccoli",
+      "garlic",
+      "onion",
+      "peanuts",
+      "beans",
+      "chestnut",
+      "ginger root",
+      "pea pod",
+      "brown mushroom",
+      "root vegetable",
+      "bread",
+      "croissant",
+      "baguette bread",
+      "flatbread",
+      "pretzel",
+      "bagel",
+      "pancakes",
+      "waffle",
+      "cheese wedge",
+      "meat on bone",
+      "poultry leg",
+      "cut of meat",
+      "bacon",
+      "hamburger",
+      "french fries",
+      "pizza",
+      "hot dog",
+      "sandwich",
+      "taco",
+      "burrito",
+      "tamale",
+      "stuffed flatbread",
+      "falafel",
+      "egg",
+      "cooking",
+      "shallow pan of food",
+      "pot of food",
+      "fondue",
+      "bowl with spoon",
+      "green salad",
+      "popcorn",
+      "butter",
+      "salt",
+      "canned food",
+      "bento box",
+      "rice cracker",
+      "rice ball",
+      "cooked rice",
+      "curry rice",
+      "steaming bowl",
+      "spaghetti",
+      "roasted sweet potato",
+      "oden",
+      "sushi",
+      "fried shrimp",
+      "fish cake with swirl",
+      "moon cake",
+      "dango",
+      "dumpling",
+      "fortune cookie",
+      "takeout box",
+      "soft ice cream",
+      "shaved ice",
+      "ice cream",
+      "doughnut",
+      "cookie",
+      "birthday cake",
+      "shortcake",
+      "cupcake",
+      "pie",
+      "chocolate bar",
+      "candy",
+      "lollipop",
+      "custard",
+      "honey pot",
+      "baby bottle",
+      "glass of milk",
+      "hot beverage",
+      "teapot",
+      "teacup without handle",
+      "sake",
+      "bottle with popping cork",
+      "wine glass",
+      "cocktail glass",
+      "tropical drink",
+      "beer mug",
+      "clinking beer mugs",
+      "clinking glasses",
+      "tumbler glass",
+      "pouring liquid",
+      "cup with straw",
+      "bubble tea",
+      "beverage box",
+      "mate",
+      "ice",
+      "chopsticks",
+      "fork and knife with plate",
+      "fork and knife",
+      "spoon",
+      "kitchen knife",
+      "jar",
+      "amphora",
+      "globe showing Europe-Africa",
+      "globe showing Americas",
+      "globe showing Asia-Australia",
+      "globe with meridians",
+      "world map",
+      "map of Japan",
+      "compass",
+      "snow-capped mountain",
+      "mountain",
+      "landslide",
+      "volcano",
+      "mount fuji",
+      "camping",
+      "beach with umbrella",
+      "desert",
+      "desert island",
+      "national park",
+      "stadium",
+      "classical building",
+      "building construction",
+      "brick",
+      "rock",
+      "wood",
+      "hut",
+      "houses",
+      "derelict house",
+      "house",
+      "house with garden",
+      "office building",
+      "Japanese post office",
+      "post office",
+      "hospital",
+      "bank",
+      "love hotel",
+      "convenience store",
+      "school",
+      "department store",
+      "factory",
+      "Japanese castle",
+      "castle",
+      "wedding",
+      "Tokyo tower",
+      "Statue of Liberty",
+      "church",
+      "mosque",
+      "hindu temple",
+      "synagogue",
+      "shinto shrine",
+      "kaaba",
+      "fountain",
+      "tent",
+      "foggy",
+      "night with stars",
+      "cityscape",
+      "sunrise over mountains",
+      "sunrise",
+      "cityscape at dusk",
+      "sunset",
+      "bridge at night",
+      "hot springs",
+      "carousel horse",
+      "playground slide",
+      "ferris wheel",
+      "roller coaster",
+      "barber pole",
+      "circus tent",
+      "locomotive",
+      "railway car",
+      "high-speed train",
+      "bullet train",
+      "train",
+      "metro",
+      "light rail",
+      "station",
+      "tram",
+      "monorail",
+      "mountain railway",
+      "tram car",
+      "bus",
+      "oncoming bus",
+      "trolleybus",
+      "minibus",
+      "ambulance",
+      "fire engine",
+      "police car",
+      "oncoming police car",
+      "taxi",
+      "oncoming taxi",
+      "automobile",
+      "oncoming automobile",
+      "sport utility vehicle",
+      "pickup truck",
+      "delivery truck",
+      "articulated lorry",
+      "tractor",
+      "racing car",
+      "motorcycle",
+      "motor scooter",
+      "manual wheelchair",
+      "motorized wheelchair",
+      "auto rickshaw",
+      "bicycle",
+      "kick scooter",
+      "skateboard",
+      "roller skate",
+      "bus stop",
+      "motorway",
+      "railway track",
+      "oil drum",
+      "fuel pump",
+      "wheel",
+      "police car light",
+      "horizontal traffic light",
+      "vertical traffic light",
+      "stop sign",
+      "construction",
+      "anchor",
+      "ring buoy",
+      "sailboat",
+      "canoe",
+      "speedboat",
+      "passenger ship",
+      "ferry",
+      "motor boat",
+      "ship",
+      "airplane",
+      "small airplane",
+      "airplane departure",
+      "airplane arrival",
+      "parachute",
+      "seat",
+      "helicopter",
+      "suspension railway",
+      "mountain cableway",
+      "aerial tramway",
+      "satellite",
+      "rocket",
+      "flying saucer",
+      "bellhop bell",
+      "luggage",
+      "hourglass done",
+      "hourglass not done",
+      "watch",
+      "alarm clock",
+      "stopwatch",
+      "timer clock",
+      "mantelpiece clock",
+      "twelve o\342\200\231clock",
+      "twelve-thirty",
+      "one o\342\200\231clock",
+      "one-thirty",
+      "two o\342\200\231clock",
+      "two-thirty",
+      "three o\342\200\231clock",
+      "three-thirty",
+      "four o\342\200\231clock",
+      "four-thirty",
+      "five o\342\200\231clock",
+      "five-thirty",
+      "six o\342\200\231clock",
+      "six-thirty",
+      "seven o\342\200\231clock",
+      "seven-thirty",
+      "eight o\342\200\231clock",
+      "eight-thirty",
+      "nine o\342\200\231clock",
+      "nine-thirty",
+      "ten o\342\200\231clock",
+      "ten-thirty",
+      "eleven o\342\200\231clock",
+      "eleven-thirty",
+      "new moon",
+      "waxing crescent moon",
+      "first quarter moon",
+      "waxing gibbous moon",
+      "full moon",
+      "waning gibbous moon",
+      "last quarter moon",
+      "waning crescent moon",
+      "crescent moon",
+      "new moon face",
+      "first quarter moon face",
+      "last quarter moon face",
+      "thermometer",
+      "sun",
+      "full moon face",
+      "sun with face",
+      "ringed planet",
+      "star",
+      "glowing star",
+      "shooting star",
+      "milky way",
+      "cloud",
+      "sun behind cloud",
+      "cloud with lightning and rain",
+      "sun behind small cloud",
+      "sun behind large cloud",
+      "sun behind rain cloud",
+      "cloud with rain",
+      "cloud with snow",
+      "cloud with lightning",
+      "tornado",
+      "fog",
+      "wind face",
+      "cyclone",
+      "rainbow",
+      "closed umbrella",
+      "umbrella",
+      "umbrella with rain drops",
+      "umbrella on ground",
+      "high voltage",
+      "snowflake",
+      "snowman",
+      "snowman without snow",
+      "comet",
+      "fire",
+      "droplet",
+      "water wave",
+      "jack-o-lantern",
+      "Christmas tree",
+      "fireworks",
+      "sparkler",
+      "firecracker",
+      "sparkles",
+      "balloon",
+      "party popper",
+      "confetti ball",
+      "tanabata tree",
+      "pine decoration",
+      "Japanese dolls",
+      "carp streamer",
+      "wind chime",
+      "moon viewing ceremony",
+      "red envelope",
+      "ribbon",
+      "wrapped gift",
+      "reminder ribbon",
+      "admission tickets",
+      "ticket",
+      "military medal",
+      "trophy",
+      "sports medal",
+      "1st place medal",
+      "2nd place medal",
+      "3rd place medal",
+      "soccer ball",
+      "baseball",
+      "softball",
+      "basketball",
+      "volleyball",
+      "american football",
+      "rugby football",
+      "tennis",
+      "flying disc",
+      "bowling",
+      "cricket game",
+      "field hockey",
+      "ice hockey",
+      "lacrosse",
+      "ping pong",
+      "badminton",
+      "boxing glove",
+      "martial arts uniform",
+      "goal net",
+      "flag in hole",
+      "ice skate",
+      "fishing pole",
+      "diving mask",
+      "running shirt",
+      "skis",
+      "sled",
+      "curling stone",
+      "bullseye",
+      "yo-yo",
+      "kite",
+      "water pistol",
+      "pool 8 ball",
+      "crystal ball",
+      "magic wand",
+      "video game",
+      "joystick",
+      "slot machine",
+      "game die",
+      "puzzle piece",
+      "teddy bear",
+      "pi\303\261ata",
+      "mirror ball",
+      "nesting dolls",
+      "spade suit",
+      "heart suit",
+      "diamond suit",
+      "club suit",
+      "chess pawn",
+      "joker",
+      "mahjong red dragon",
+      "flower playing cards",
+      "performing arts",
+      "framed picture",
+      "artist palette",
+      "thread",
+      "sewing needle",
+      "yarn",
+      "knot",
+      "glasses",
+      "sunglasses",
+      "goggles",
+      "lab coat",
+      "safety vest",
+      "necktie",
+      "t-shirt",
+      "jeans",
+      "scarf",
+      "gloves",
+      "coat",
+      "socks",
+      "dress",
+      "kimono",
+      "sari",
+      "one-piece swimsuit",
+      "briefs",
+      "shorts",
+      "bikini",
+      "woman\342\200\231s clothes",
+      "folding hand fan",
+      "purse",
+      "handbag",
+      "clutch bag",
+      "shopping bags",
+      "backpack",
+      "thong sandal",
+      "man\342\200\231s shoe",
+      "running shoe",
+      "hiking boot",
+      "flat shoe",
+      "high-heeled shoe",
+      "woman\342\200\231s sandal",
+      "ballet shoes",
+      "woman\342\200\231s boot",
+      "hair pick",
+      "crown",
+      "woman\342\200\231s hat",
+      "top hat",
+      "graduation cap",
+      "billed cap",
+      "military helmet",
+      "rescue worker\342\200\231s helmet",
+      "prayer beads",
+      "lipstick",
+      "ring",
+      "gem stone",
+      "muted speaker",
+      "speaker low volume",
+      "speaker medium volume",
+      "speaker high volume",
+      "loudspeaker",
+      "megaphone",
+      "postal horn",
+      "bell",
+      "bell with slash",
+      "musical score",
+      "musical note",
+      "musical notes",
+      "studio microphone",
+      "level slider",
+      "control knobs",
+      "microphone",
+      "headphone",
+      "radio",
+      "saxophone",
+      "trumpet",
+      "trombone",
+      "accordion",
+      "guitar",
+      "musical keyboard",
+      "violin",
+      "banjo",
+      "drum",
+      "long drum",
+      "maracas",
+      "flute",
+      "harp",
+      "mobile phone",
+      "mobile phone with arrow",
+      "telephone",
+      "telephone receiver",
+      "pager",
+      "fax machine",
+      "battery",
+      "low battery",
+      "electric plug",
+      "laptop",
+      "desktop computer",
+      "printer",
+      "keyboard",
+      "computer mouse",
+      "trackball",
+      "computer disk",
+      "floppy disk",
+      "optical disk",
+      "dvd",
+      "abacus",
+      "movie camera",
+      "film frames",
+      "film projector",
+      "clapper board",
+      "television",
+      "camera",
+      "camera with flash",
+      "video camera",
+      "videocassette",
+      "magnifying glass tilted left",
+      "magnifying glass tilted right",
+      "candle",
+      "light bulb",
+      "flashlight",
+      "red paper lantern",
+      "diya lamp",
+      "notebook with decorative cover",
+      "closed book",
+      "open book",
+      "green book",
+      "blue book",
+      "orange book",
+      "books",
+      "notebook",
+      "ledger",
+      "page with curl",
+      "scroll",
+      "page facing up",
+      "newspaper",
+      "rolled-up newspaper",
+      "bookmark tabs",
+      "bookmark",
+      "label",
+      "coin",
+      "money bag",
+      "treasure chest",
+      "yen banknote",
+      "dollar banknote",
+      "euro banknote",
+      "pound banknote",
+      "money with wings",
+      "credit card",
+      "receipt",
+      "chart increasing with yen",
+      "envelope",
+      "e-mail",
+      "incoming envelope",
+      "envelope with arrow",
+      "outbox tray",
+      "inbox tray",
+      "package",
+      "closed mailbox with raised flag",
+      "closed mailbox with lowered flag",
+      "open mailbox with raised flag",
+      "open mailbox with lowered flag",
+      "postbox",
+      "ballot box with ballot",
+      "pencil",
+      "black nib",
+      "fountain pen",
+      "pen",
+      "paintbrush",
+      "crayon",
+      "memo",
+      "briefcase",
+      "file folder",
+      "open file folder",
+      "card index dividers",
+      "calendar",
+      "tear-off calendar",
+      "spiral notepad",
+      "spiral calendar",
+      "card index",
+      "chart increasing",
+      "chart decreasing",
+      "bar chart",
+      "clipboard",
+      "pushpin",
+      "round pushpin",
+      "paperclip",
+      "linked paperclips",
+      "straight ruler",
+      "triangular ruler",
+      "scissors",
+      "card file box",
+      "file cabinet",
+      "wastebasket",
+      "locked",
+      "unlocked",
+      "locked with pen",
+      "locked with key",
+      "key",
+      "old key",
+      "hammer",
+      "axe",
+      "pick",
+      "hammer and pick",
+      "hammer and wrench",
+      "dagger",
+      "crossed swords",
+      "bomb",
+      "boomerang",
+      "bow and arrow",
+      "shield",
+      "carpentry saw",
+      "wrench",
+      "screwdriver",
+      "nut and bolt",
+      "gear",
+      "clamp",
+      "balance scale",
+      "white cane",
+      "link",
+      "broken chain",
+      "chains",
+      "hook",
+      "toolbox",
+      "magnet",
+      "ladder",
+      "shovel",
+      "alembic",
+      "test tube",
+      "petri dish",
+      "dna",
+      "microscope",
+      "telescope",
+      "satellite antenna",
+      "syringe",
+      "drop of blood",
+      "pill",
+      "adhesive bandage",
+      "crutch",
+      "stethoscope",
+      "x-ray",
+      "door",
+      "elevator",
+      "mirror",
+      "window",
+      "bed",
+      "couch and lamp",
+      "chair",
+      "toilet",
+      "plunger",
+      "shower",
+      "bathtub",
+      "mouse trap",
+      "razor",
+      "lotion bottle",
+      "safety pin",
+      "broom",
+      "basket",
+      "roll of paper",
+      "bucket",
+      "soap",
+      "bubbles",
+      "toothbrush",
+      "sponge",
+      "fire extinguisher",
+      "shopping cart",
+      "cigarette",
+      "coffin",
+      "headstone",
+      "funeral urn",
+      "nazar amulet",
+      "hamsa",
+      "moai",
+      "placard",
+      "identification card",
+      "ATM sign",
+      "litter in bin sign",
+      "potable water",
+      "wheelchair symbol",
+      "men\342\200\231s room",
+      "women\342\200\231s room",
+      "restroom",
+      "baby symbol",
+      "water closet",
+      "passport control",
+      "customs",
+      "baggage claim",
+      "left luggage",
+      "children crossing",
+      "no entry",
+      "prohibited",
+      "no bicycles",
+      "no smoking",
+      "no littering",
+      "non-potable water",
+      "no pedestrians",
+      "no mobile phones",
+      "no one under eighteen",
+      "radioactive",
+      "biohazard",
+      "up arrow",
+      "up-right arrow",
+      "right arrow",
+      "down-right arrow",
+      "down arrow",
+      "down-left arrow",
+      "left arrow",
+      "up-left arrow",
+      "up-down arrow",
+      "left-right arrow",
+      "right arrow curving left",
+      "left arrow curving right",
+      "right arrow curving up",
+      "right arrow curving down",
+      "clockwise vertical arrows",
+      "counterclockwise arrows button",
+      "BACK arrow",
+      "END arrow",
+      "ON! arrow",
+      "SOON arrow",
+      "TOP arrow",
+      "place of worship",
+      "atom symbol",
+      "om",
+      "star of David",
+      "wheel of dharma",
+      "yin yang",
+      "latin cross",
+      "orthodox cross",
+      "star and crescent",
+      "peace symbol",
+      "menorah",
+      "dotted six-pointed star",
+      "khanda",
+      "Aries",
+      "Taurus",
+      "Gemini",
+      "Cancer",
+      "Leo",
+      "Virgo",
+      "Libra",
+      "Scorpio",
+      "Sagittarius",
+      "Capricorn",
+      "Aquarius",
+      "Pisces",
+      "Ophiuchus",
+      "shuffle tracks button",
+      "repeat button",
+      "repeat single button",
+      "play button",
+      "fast-forward button",
+      "next track button",
+      "play or pause button",
+      "reverse button",
+      "fast reverse button",
+      "last track button",
+      "upwards button",
+      "fast up button",
+      "downwards button",
+      "fast down button",
+      "pause button",
+      "stop button",
+      "record button",
+      "eject button",
+      "cinema",
+      "dim button",
+      "bright button",
+      "antenna bars",
+      "wireless",
+      "vibration mode",
+      "mobile phone off",
+      "female sign",
+      "male sign",
+      "transgender symbol",
+      "multiply",
+      "plus",
+      "minus",
+      "divide",
+      "heavy equals sign",
+      "infinity",
+      "double exclamation mark",
+      "exclamation question mark",
+      "red question mark",
+      "white question mark",
+      "white exclamation mark",
+      "red exclamation mark",
+      "wavy dash",
+      "currency exchange",
+      "heavy dollar sign",
+      "medical symbol",
+      "recycling symbol",
+      "fleur-de-lis",
+      "trident emblem",
+      "name badge",
+      "Japanese symbol for beginner",
+      "hollow red circle",
+      "check mark button",
+      "check box with check",
+      "check mark",
+      "cross mark",
+      "cross mark button",
+      "curly loop",
+      "double curly loop",
+      "part alternation mark",
+      "eight-spoked asterisk",
+      "eight-pointed star",
+      "sparkle",
+      "copyright",
+      "registered",
+      "trade mark",
+      "splatter",
+      "keycap: #",
+      "keycap: *",
+      "keycap: 0",
+      "keycap: 1",
+      "keycap: 2",
+      "keycap: 3",
+      "keycap: 4",
+      "keycap: 5",
+      "keycap: 6",
+      "keycap: 7",
+      "keycap: 8",
+      "keycap: 9",
+      "keycap: 10",
+      "input latin uppercase",
+      "input latin lowercase",
+      "input numbers",
+      "input symbols",
+      "input latin letters",
+      "A button (blood type)",
+      "AB button (blood type)",
+      "B button (blood type)",
+      "CL button",
+      "COOL button",
+      "FREE button",
+      "information",
+      "ID button",
+      "circled M",
+      "NEW button",
+      "NG button",
+      "O button (blood type)",
+      "OK button",
+      "P button",
+      "SOS button",
+      "UP! button",
+      "VS button",
+      "Japanese \342\200\234here\342\200\235 button",
+      "Japanese \342\200\234service charge\342\200\235 button",
+      "Japanese \342\200\234monthly amount\342\200\235 button",
+      "Japanese \342\200\234not free of charge\342\200\235 button",
+      "Japanese \342\200\234reserved\342\200\235 button",
+      "Japanese \342\200\234bargain\342\200\235 button",
+      "Japanese \342\200\234discount\342\200\235 button",
+      "Japanese \342\200\234free of charge\342\200\235 button",
+      "Japanese \342\200\234prohibited\342\200\235 button",
+      "Japanese \342\200\234acceptable\342\200\235 button",
+      "Japanese \342\200\234application\342\200\235 button",
+      "Japanese \342\200\234passing grade\342\200\235 button",
+      "Japanese \342\200\234vacancy\342\200\235 button",
+      "Japanese \342\200\234congratulations\342\200\235 button",
+      "Japanese \342\200\234secret\342\200\235 button",
+      "Japanese \342\200\234open for business\342\200\235 button",
+      "Japanese \342\200\234no vacancy\342\200\235 button",
+      "red circle",
+      "orange circle",
+      "yellow circle",
+      "green circle",
+      "blue circle",
+      "purple circle",
+      "brown circle",
+      "black circle",
+      "white circle",
+      "red square",
+      "orange square",
+      "yellow square",
+      "green square",
+      "blue square",
+      "purple square",
+      "brown square",
+      "black large square",
+      "white large square",
+      "black medium square",
+      "white medium square",
+      "black medium-small square",
+      "white medium-small square",
+      "black small square",
+      "white small square",
+      "large orange diamond",
+      "large blue diamond",
+      "small orange diamond",
+      "small blue diamond",
+      "red triangle pointed up",
+      "red triangle pointed down",
+      "diamond with a dot",
+      "radio button",
+      "white square button",
+      "black square button",
+      "chequered flag",
+      "triangular flag",
+      "crossed flags",
+      "black flag",
+      "white flag",
+      "rainbow flag",
+      "transgender flag",
+      "pirate flag",
+      "flag: Ascension Island",
+      "flag: Andorra",
+      "flag: United Arab Emirates",
+      "flag: Afghanistan",
+      "flag: Antigua & Barbuda",
+      "flag: Anguilla",
+      "flag: Albania",
+      "flag: Armenia",
+      "flag: Angola",
+      "flag: Antarctica",
+      "flag: Argentina",
+      "flag: American Samoa",
+      "flag: Austria",
+      "flag: Australia",
+      "flag: Aruba",
+      "flag: \303\205land Islands",
+      "flag: Azerbaijan",
+      "flag: Bosnia & Herzegovina",
+      "flag: Barbados",
+      "flag: Bangladesh",
+      "flag: Belgium",
+      "flag: Burkina Faso",
+      "flag: Bulgaria",
+      "flag: Bahrain",
+      "flag: Burundi",
+      "flag: Benin",
+      "flag: St. Barth\303\251lemy",
+      "flag: Bermuda",
+      "flag: Brunei",
+      "flag: Bolivia",
+      "flag: Caribbean Netherlands",
+      "flag: Brazil",
+      "flag: Bahamas",
+      "flag: Bhutan",
+      "flag: Bouvet Island",
+      "flag: Botswana",
+      "flag: Belarus",
+      "flag: Belize",
+      "flag: Canada",
+      "flag: Cocos (Keeling) Islands",
+      "flag: Congo - Kinshasa",
+      "flag: Central African Republic",
+      "flag: Congo - Brazzaville",
+      "flag: Switzerland",
+      "flag: C\303\264te d\342\200\231Ivoire",
+      "flag: Cook Islands",
+      "flag: Chile",
+      "flag: Cameroon",
+      "flag: China",
+      "flag: Colombia",
+      "flag: Clipperton Island",
+      "flag: Sark",
+      "flag: Costa Rica",
+      "flag: Cuba",
+      "flag: Cape Verde",
+      "flag: Cura\303\247ao",
+      "flag: Christmas Island",
+      "flag: Cyprus",
+      "flag: Czechia",
+      "flag: Germany",
+      "flag: Diego Garcia",
+      "flag: Djibouti",
+      "flag: Denmark",
+      "flag: Dominica",
+      "flag: Dominican Republic",
+      "flag: Algeria",
+      "flag: Ceuta & Melilla",
+      "flag: Ecuador",
+      "flag: Estonia",
+      "flag: Egypt",
+      "flag: Western Sahara",
+      "flag: Eritrea",
+      "flag: Spain",
+      "flag: Ethiopia",
+      "flag: European Union",
+      "flag: Finland",
+      "flag: Fiji",
+      "flag: Falkland Islands",
+      "flag: Micronesia",
+      "flag: Faroe Islands",
+      "flag: France",
+      "flag: Gabon",
+      "flag: United Kingdom",
+      "flag: Grenada",
+      "flag: Georgia",
+      "flag: French Guiana",
+      "flag: Guernsey",
+      "flag: Ghana",
+      "flag: Gibraltar",
+      "flag: Greenland",
+      "flag: Gambia",
+      "flag: Guinea",
+      "flag: Guadeloupe",
+      "flag: Equatorial Guinea",
+      "flag: Greece",
+      "flag: South Georgia & South Sandwich Islands",
+      "flag: Guatemala",
+      "flag: Guam",
+      "flag: Guinea-Bissau",
+      "flag: Guyana",
+      "flag: Hong Kong SAR China",
+      "flag: Heard & McDonald Islands",
+      "flag: Honduras",
+      "flag: Croatia",
+      "flag: Haiti",
+      "flag: Hungary",
+      "flag: Canary Islands",
+      "flag: Indonesia",
+      "flag: Ireland",
+      "flag: Israel",
+      "flag: Isle of Man",
+      "flag: India",
+      "flag: British Indian Ocean Territory",
+      "flag: Iraq",
+      "flag: Iran",
+      "flag: Iceland",
+      "flag: Italy",
+      "flag: Jersey",
+      "flag: Jamaica",
+      "flag: Jordan",
+      "flag: Japan",
+      "flag: Kenya",
+      "flag: Kyrgyzstan",
+      "flag: Cambodia",
+      "flag: Kiribati",
+      "flag: Comoros",
+      "flag: St. Kitts & Nevis",
+      "flag: North Korea",
+      "flag: South Korea",
+      "flag: Kuwait",
+      "flag: Cayman Islands",
+      "flag: Kazakhstan",
+      "flag: Laos",
+      "flag: Lebanon",
+      "flag: St. Lucia",
+      "flag: Liechtenstein",
+      "flag: Sri Lanka",
+      "flag: Liberia",
+      "flag: Lesotho",
+      "flag: Lithuania",
+      "flag: Luxembourg",
+      "flag: Latvia",
+      "flag: Libya",
+      "flag: Morocco",
+      "flag: Monaco",
+      "flag: Moldova",
+      "flag: Montenegro",
+      "flag: St. Martin",
+      "flag: Madagascar",
+      "flag: Marshall Islands",
+      "flag: North Macedonia",
+      "flag: Mali",
+      "flag: Myanmar (Burma)",
+      "flag: Mongolia",
+      "flag: Macao SAR China",
+      "flag: Northern Mariana Islands",
+      "flag: Martinique",
+      "flag: Mauritania",
+      "flag: Montserrat",
+      "flag: Malta",
+      "flag: Mauritius",
+      "flag: Maldives",
+      "flag: Malawi",
+      "flag: Mexico",
+      "flag: Malaysia",
+      "flag: Mozambique",
+      "flag: Namibia",
+      "flag: New Caledonia",
+      "flag: Niger",
+      "flag: Norfolk Island",
+      "flag: Nigeria",
+      "flag: Nicaragua",
+      "flag: Netherlands",
+      "flag: Norway",
+      "flag: Nepal",
+      "flag: Nauru",
+      "flag: Niue",
+      "flag: New Zealand",
+      "flag: Oman",
+      "flag: Panama",
+      "flag: Peru",
+      "flag: French Polynesia",
+      "flag: Papua New Guinea",
+      "flag: Philippines",
+      "flag: Pakistan",
+      "flag: Poland",
+      "flag: St. Pierre & Miquelon",
+      "flag: Pitcairn Islands",
+      "flag: Puerto Rico",
+      "flag: Palestinian Territories",
+      "flag: Portugal",
+      "flag: Palau",
+      "flag: Paraguay",
+      "flag: Qatar",
+      "flag: R\303\251union",
+      "flag: Romania",
+      "flag: Serbia",
+      "flag: Russia",
+      "flag: Rwanda",
+      "flag: Saudi Arabia",
+      "flag: Solomon Islands",
+      "flag: Seychelles",
+      "flag: Sudan",
+      "flag: Sweden",
+      "flag: Singapore",
+      "flag: St. Helena",
+      "flag: Slovenia",
+      "flag: Svalbard & Jan Mayen",
+      "flag: Slovakia",
+      "flag: Sierra Leone",
+      "flag: San Marino",
+      "flag: Senegal",
+      "flag: Somalia",
+      "flag: Suriname",
+      "flag: South Sudan",
+      "flag: S\303\243o Tom\303\251 & Pr\303\255ncipe",
+      "flag: El Salvador",
+      "flag: Sint Maarten",
+      "flag: Syria",
+      "flag: Eswatini",
+      "flag: Tristan da Cunha",
+      "flag: Turks & Caicos Islands",
+      "flag: Chad",
+      "flag: French Southern Territories",
+      "flag: Togo",
+      "flag: Thailand",
+      "flag: Tajikistan",
+      "flag: Tokelau",
+      "flag: Timor-Leste",
+      "flag: Turkmenistan",
+      "flag: Tunisia",
+      "flag: Tonga",
+      "flag: T\303\274rkiye",
+      "flag: Trinidad & Tobago",
+      "flag: Tuvalu",
+      "flag: Taiwan",
+      "flag: Tanzania",
+      "flag: Ukraine",
+      "flag: Uganda",
+      "flag: U.S. Outlying Islands",
+      "flag: United Nations",
+      "flag: United States",
+      "flag: Uruguay",
+      "flag: Uzbekistan",
+      "flag: Vatican City",
+      "flag: St. Vincent & Grenadines",
+      "flag: Venezuela",
+      "flag: British Virgin Islands",
+      "flag: U.S. Virgin Islands",
+      "flag: Vietnam",
+      "flag: Vanuatu",
+      "flag: Wallis & Futuna",
+      "flag: Samoa",
+      "flag: Kosovo",
+      "flag: Yemen",
+      "flag: Mayotte",
+      "flag: South Africa",
+      "flag: Zambia",
+      "flag: Zimbabwe",
+      "flag: England",
+      "flag: Scotland",
+      "flag: Wales",
+    };
+
+    // Groups and subgroups with their contiguous emoji index ranges
+    inline constexpr Range groups[] = {
+      { 0, 0, 187 },
+      { 1, 187, 3655 },
+      { 2, 3655, 3664 },
+      { 3, 3664, 3831 },
+      { 4, 3831, 3965 },
+      { 5, 3965, 4233 },
+      { 6, 4233, 4329 },
+      { 7, 4329, 4645 },
+      { 8, 4645, 4950 },
+      { 9, 4950, 5226 },
+    };
+
+    inline constexpr Range subGroups[] = {
+      { 10, 0, 14 },
+      { 11, 14, 24 },
+      { 12, 24, 30 },
+      { 13, 30, 37 },
+      { 14, 37, 56 },
+      { 15, 56, 62 },
+      { 16, 62, 74 },
+      { 17, 74, 77 },
+      { 18, 77, 80 },
+      { 19, 80, 108 },
+      { 20, 108, 117 },
+      { 21, 117, 125 },
+      { 22, 125, 134 },
+      { 23, 134, 137 },
+      { 24, 137, 166 },
+      { 25, 166, 187 },
+      { 26, 187, 254 },
+      { 27, 254, 309 },
+      { 28, 309, 352 },
+      { 29, 352, 388 },
+      { 30, 388, 450 },
+      { 31, 450, 469 },
+      { 32, 469, 518 },
+      { 33, 518, 710 },
+      { 34, 710, 1010 },
+      { 35, 1010, 1645 },
+      { 36, 1645, 1891 },
+      { 37, 1891, 2588 },
+      { 38, 2588, 3068 },
+      { 39, 3068, 3110 },
+      { 40, 3110, 3643 },
+      { 41, 3643, 3655 },
+      { 42, 3655, 3660 },
+      { 43, 3660, 3664 },
+      { 44, 3664, 3732 },
+      { 45, 3732, 3755 },
+      { 46, 3755, 3756 },
+      { 47, 3756, 3764 },
+      { 48, 3764, 3782 },
+      { 49, 3782, 3800 },
+      { 50, 3800, 3813 },
+      { 51, 3813, 3831 },
+      { 52, 3831, 3852 },
+      { 53, 3852, 3872 },
+      { 54, 3872, 3906 },
+      { 55, 3906, 3923 },
+      { 56, 3923, 3937 },
+      { 57, 3937, 3957 },
+      { 58, 3957, 3965 },
+      { 59, 3965, 3973 },
+      { 60, 3973, 3990 },
+      { 61, 3990, 4022 },
+      { 62, 4022, 4029 },
+      { 63, 4029, 4048 },
+      { 64, 4048, 4103 },
+      { 65, 4103, 4115 },
+      { 66, 4115, 4131 },
+      { 67, 4131, 4134 },
+      { 68, 4134, 4168 },
+      { 69, 4168, 4233 },
+      { 70, 4233, 4256 },
+      { 71, 4256, 4263 },
+      { 72, 4263, 4291 },
+      { 73, 4291, 4321 },
+      { 74, 4321, 4329 },
+      { 75, 4329, 4379 },
+      { 76, 4379, 4388 },
+      { 77, 4388, 4400 },
+      { 78, 4400, 4413 },
+      { 79, 4413, 4420 },
+      { 80, 4420, 4439 },
+      { 81, 4439, 4458 },
+      { 82, 4458, 4477 },
+      { 83, 4477, 4488 },
+      { 84, 4488, 4503 },
+      { 85, 4503, 4516 },
+      { 86, 4516, 4547 },
+      { 87, 4547, 4554 },
+      { 88, 4554, 4592 },
+      { 89, 4592, 4600 },
+      { 90, 4600, 4607 },
+      { 91, 4607, 4634 },
+      { 92, 4634, 4645 },
+      { 93, 4645, 4658 },
+      { 94, 4658, 4674 },
+      { 95, 4674, 4709 },
+      { 96, 4709, 4731 },
+      { 97, 4731, 4744 },
+      { 98, 4744, 4778 },
+      { 99, 4778, 4784 },
+      { 100, 4784, 4792 },
+      { 101, 4792, 4802 },
+      { 102, 4802, 4804 },
+      { 103, 4804, 4838 },
+      { 104, 4838, 4863 },
+      { 105, 4863, 4912 },
+      { 106, 4912, 4950 },
+      { 107, 4950, 4964 },
+      { 108, 4964, 5223 },
+      { 109, 5223, 5226 },
+    };
+
+    // Emoji i is utf8Blob[utf8Offsets[i] .. utf8Offsets[i + 1])
+    inline constexpr unsigned char utf8Blob[] = {
+      240, 159, 152, 128, 240, 159, 152, 131, 240, 159, 152, 132, 240, 159, 152, 129, 240, 159,
+      152, 134, 240, 159, 152, 133, 240, 159, 164, 163, 240, 159, 152, 130, 240, 159, 153, 130,
+      240, 159, 153, 131, 240, 159, 171, 160, 240, 159, 152, 137, 240, 159, 152, 138, 240, 159,
+      152, 135, 240, 159, 165, 176, 240, 159, 152, 141, 240, 159, 164, 169, 240, 159, 152, 152,
+      240, 159, 152, 151, 226, 152, 186, 239, 184, 143, 226, 152, 186, 240, 159, 152, 154, 240,
+      159, 152, 153, 240, 159, 165, 178, 240, 159, 152, 139, 240, 159, 152, 155, 240, 159, 152,
+      156, 240, 159, 164, 170, 240, 159, 152, 157, 240, 159, 164, 145, 240, 159, 164, 151, 240,
+      159, 164, 173, 240, 159, 171, 162, 240, 159, 171, 163, 240, 159, 164, 171, 240, 159, 164,
+      148, 240, 159, 171, 161, 240, 159, 164, 144, 240, 159, 164, 168, 240, 159, 152, 144, 240,
+      159, 152, 145, 240, 159, 152, 182, 240, 159, 171, 165, 240, 159, 152, 182, 226, 128, 141,
+      240, 159, 140, 171, 239, 184, 143, 240, 159, 152, 182, 226, 128, 141, 240, 159, 140, 171,
+      240, 159, 152, 143, 240, 159, 152, 146, 240, 159, 153, 132, 240, 159, 152, 172, 240, 159,
+      152, 174, 226, 128, 141, 240, 159, 146, 168, 240, 159, 164, 165, 240, 159, 171, 168, 240,
+      159, 153, 130, 226, 128, 141, 226, 134, 148, 239, 184, 143, 240, 159, 153, 130, 226, 128,
+      141, 226, 134, 148, 240, 159, 153, 130, 226, 128, 141, 226, 134, 149, 239, 184, 143, 240,
+      159, 153, 130, 226, 128, 141, 226, 134, 149, 240, 159, 152, 140, 240, 159, 152, 148, 240,
+      159, 152, 170, 240, 159, 164, 164, 240, 159, 152, 180, 240, 159, 171, 169, 240, 159, 152,
+      183, 240, 159, 164, 146, 240, 159, 164, 149, 240, 159, 164, 162, 240, 159, 164, 174, 240,
+      159, 164, 167, 240, 159, 165, 181, 240, 159, 165, 182, 240, 159, 165, 180, 240, 159, 152,
+      181, 240, 159, 152, 181, 226, 128, 141, 240, 159, 146, 171, 240, 159, 164, 175, 240, 159,
+      164, 160, 240, 159, 165, 179, 240, 159, 165, 184, 240, 159, 152, 142, 240, 159, 164, 147,
+      240, 159, 167, 144, 240, 159, 152, 149, 240, 159, 171, 164, 240, 159, 152, 159, 240, 159,
+      153, 129, 226, 152, 185, 239, 184, 143, 226, 152, 185, 240, 159, 152, 174, 240, 159, 152,
+      175, 240, 159, 152, 178, 240, 159, 152, 179, 240, 159, 171, 170, 240, 159, 165, 186, 240,
+      159, 165, 185, 240, 159, 152, 166, 240, 159, 152, 167, 240, 159, 152, 168, 240, 159, 152,
+      176, 240, 159, 152, 165, 240, 159, 152, 162, 240, 159, 152, 173, 240, 159, 152, 177, 240,
+      159, 152, 150, 240, 159, 152, 163, 240, 159, 152, 158, 240, 159, 152, 147, 240, 159, 152,
+      169, 240, 159, 152, 171, 240, 159, 165, 177, 240, 159, 152, 164, 240, 159, 152, 161, 240,
+      159, 152, 160, 240, 159, 164, 172, 240, 159, 152, 136, 240, 159, 145, 191, 240, 159, 146,
+      128, 226, 152, 160, 239, 184, 143, 226, 152, 160, 240, 159, 146, 169, 240, 159, 164, 161,
+      240, 159, 145, 185, 240, 159, 145, 186, 240, 159, 145, 187, 240, 159, 145, 189, 240, 159,
+      145, 190, 240, 159, 164, 150, 240, 159, 152, 186, 240, 159, 152, 184, 240, 159, 152, 185,
+      240, 159, 152, 187, 240, 159, 152, 188, 240, 159, 152, 189, 240, 159, 153, 128, 240, 159,
+      152, 191, 240, 159, 152, 190, 240, 159, 153, 136, 240, 159, 153, 137, 240, 159, 153, 138,
+      240, 159, 146, 140, 240, 159, 146, 152, 240, 159, 146, 157, 240, 159, 146, 150, 240, 159,
+      146, 151, 240, 159, 146, 147, 240, 159, 146, 158, 240, 159, 146, 149, 240, 159, 146, 159,
+      226, 157, 163, 239, 184, 143, 226, 157, 163, 240, 159, 146, 148, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 148, 165, 226, 157, 164, 226, 128, 141, 240, 159, 148, 165,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 169, 185, 226, 157, 164, 226, 128,
+      141, 240, 159, 169, 185, 226, 157, 164, 239, 184, 143, 226, 157, 164, 240, 159, 169, 183,
+      240, 159, 167, 161, 240, 159, 146, 155, 240, 159, 146, 154, 240, 159, 146, 153, 240, 159,
+      169, 181, 240, 159, 146, 156, 240, 159, 164, 142, 240, 159, 150, 164, 240, 159, 169, 182,
+      240, 159, 164, 141, 240, 159, 146, 139, 240, 159, 146, 175, 240, 159, 146, 162, 240, 159,
+      171, 175, 240, 159, 146, 165, 240, 159, 146, 171, 240, 159, 146, 166, 240, 159, 146, 168,
+      240, 159, 149, 179, 239, 184, 143, 240, 159, 149, 179, 240, 159, 146, 172, 240, 159, 145,
+      129, 239, 184, 143, 226, 128, 141, 240, 159, 151, 168, 239, 184, 143, 240, 159, 145, 129,
+      226, 128, 141, 240, 159, 151, 168, 239, 184, 143, 240, 159, 145, 129, 239, 184, 143, 226,
+      128, 141, 240, 159, 151, 168, 240, 159, 145, 129, 226, 128, 141, 240, 159, 151, 168, 240,
+      159, 151, 168, 239, 184, 143, 240, 159, 151, 168, 240, 159, 151, 175, 239, 184, 143, 240,
+      159, 151, 175, 240, 159, 146, 173, 240, 159, 146, 164, 240, 159, 145, 139, 240, 159, 145,
+      139, 240, 159, 143, 187, 240, 159, 145, 139, 240, 159, 143, 188, 240, 159, 145, 139, 240,
+      159, 143, 189, 240, 159, 145, 139, 240, 159, 143, 190, 240, 159, 145, 139, 240, 159, 143,
+      191, 240, 159, 164, 154, 240, 159, 164, 154, 240, 159, 143, 187, 240, 159, 164, 154, 240,
+      159, 143, 188, 240, 159, 164, 154, 240, 159, 143, 189, 240, 159, 164, 154, 240, 159, 143,
+      190, 240, 159, 164, 154, 240, 159, 143, 191, 240, 159, 150, 144, 239, 184, 143, 240, 159,
+      150, 144, 240, 159, 150, 144, 240, 159, 143, 187, 240, 159, 150, 144, 240, 159, 143, 188,
+      240, 159, 150, 144, 240, 159, 143, 189, 240, 159, 150, 144, 240, 159, 143, 190, 240, 159,
+      150, 144, 240, 159, 143, 191, 226, 156, 139, 226, 156, 139, 240, 159, 143, 187, 226, 156,
+      139, 240, 159, 143, 188, 226, 156, 139, 240, 159, 143, 189, 226, 156, 139, 240, 159, 143,
+      190, 226, 156, 139, 240, 159, 143, 191, 240, 159, 150, 150, 240, 159, 150, 150, 240, 159,
+      143, 187, 240, 159, 150, 150, 240, 159, 143, 188, 240, 159, 150, 150, 240, 159, 143, 189,
+      240, 159, 150, 150, 240, 159, 143, 190, 240, 159, 150, 150, 240, 159, 143, 191, 240, 159,
+      171, 177, 240, 159, 171, 177, 240, 159, 143, 187, 240, 159, 171, 177, 240, 159, 143, 188,
+      240, 159, 171, 177, 240, 159, 143, 189, 240, 159, 171, 177, 240, 159, 143, 190, 240, 159,
+      171, 177, 240, 159, 143, 191, 240, 159, 171, 178, 240, 159, 171, 178, 240, 159, 143, 187,
+      240, 159, 171, 178, 240, 159, 143, 188, 240, 159, 171, 178, 240, 159, 143, 189, 240, 159,
+      171, 178, 240, 159, 143, 190, 240, 159, 171, 178, 240, 159, 143, 191, 240, 159, 171, 179,
+      240, 159, 171, 179, 240, 159, 143, 187, 240, 159, 171, 179, 240, 159, 143, 188, 240, 159,
+      171, 179, 240, 159, 143, 189, 240, 159, 171, 179, 240, 159, 143, 190, 240, 159, 171, 179,
+      240, 159, 143, 191, 240, 159, 171, 180, 240, 159, 171, 180, 240, 159, 143, 187, 240, 159,
+      171, 180, 240, 159, 143, 188, 240, 159, 171, 180, 240, 159, 143, 189, 240, 159, 171, 180,
+      240, 159, 143, 190, 240, 159, 171, 180, 240, 159, 143, 191, 240, 159, 171, 183, 240, 159,
+      171, 183, 240, 159, 143, 187, 240, 159, 171, 183, 240, 159, 143, 188, 240, 159, 171, 183,
+      240, 159, 143, 189, 240, 159, 171, 183, 240, 159, 143, 190, 240, 159, 171, 183, 240, 159,
+      143, 191, 240, 159, 171, 184, 240, 159, 171, 184, 240, 159, 143, 187, 240, 159, 171, 184,
+      240, 159, 143, 188, 240, 159, 171, 184, 240, 159, 143, 189, 240, 159, 171, 184, 240, 159,
+      143, 190, 240, 159, 171, 184, 240, 159, 143, 191, 240, 159, 145, 140, 240, 159, 145, 140,
+      240, 159, 143, 187, 240, 159, 145, 140, 240, 159, 143, 188, 240, 159, 145, 140, 240, 159,
+      143, 189, 240, 159, 145, 140, 240, 159, 143, 190, 240, 159, 145, 140, 240, 159, 143, 191,
+      240, 159, 164, 140, 240, 159, 164, 140, 240, 159, 143, 187, 240, 159, 164, 140, 240, 159,
+      143, 188, 240, 159, 164, 140, 240, 159, 143, 189, 240, 159, 164, 140, 240, 159, 143, 190,
+      240, 159, 164, 140, 240, 159, 143, 191, 240, 159, 164, 143, 240, 159, 164, 143, 240, 159,
+      143, 187, 240, 159, 164, 143, 240, 159, 143, 188, 240, 159, 164, 143, 240, 159, 143, 189,
+      240, 159, 164, 143, 240, 159, 143, 190, 240, 159, 164, 143, 240, 159, 143, 191, 226, 156,
+      140, 239, 184, 143, 226, 156, 140, 226, 156, 140, 240, 159, 143, 187, 226, 156, 140, 240,
+      159, 143, 188, 226, 156, 140, 240, 159, 143, 189, 226, 156, 140, 240, 159, 143, 190, 226,
+      156, 140, 240, 159, 143, 191, 240, 159, 164, 158, 240, 159, 164, 158, 240, 159, 143, 187,
+      240, 159, 164, 158, 240, 159, 143, 188, 240, 159, 164, 158, 240, 159, 143, 189, 240, 159,
+      164, 158, 240, 159, 143, 190, 240, 159, 164, 158, 240, 159, 143, 191, 240, 159, 171, 176,
+      240, 159, 171, 176, 240, 159, 143, 187, 240, 159, 171, 176, 240, 159, 143, 188, 240, 159,
+      171, 176, 240, 159, 143, 189, 240, 159, 171, 176, 240, 159, 143, 190, 240, 159, 171, 176,
+      240, 159, 143, 191, 240, 159, 164, 159, 240, 159, 164, 159, 240, 159, 143, 187, 240, 159,
+      164, 159, 240, 159, 143, 188, 240, 159, 164, 159, 240, 159, 143, 189, 240, 159, 164, 159,
+      240, 159, 143, 190, 240, 159, 164, 159, 240, 159, 143, 191, 240, 159, 164, 152, 240, 159,
+      164, 152, 240, 159, 143, 187, 240, 159, 164, 152, 240, 159, 143, 188, 240, 159, 164, 152,
+      240, 159, 143, 189, 240, 159, 164, 152, 240, 159, 143, 190, 240, 159, 164, 152, 240, 159,
+      143, 191, 240, 159, 164, 153, 240, 159, 164, 153, 240, 159, 143, 187, 240, 159, 164, 153,
+      240, 159, 143, 188, 240, 159, 164, 153, 240, 159, 143, 189, 240, 159, 164, 153, 240, 159,
+      143, 190, 240, 159, 164, 153, 240, 159, 143, 191, 240, 159, 145, 136, 240, 159, 145, 136,
+      240, 159, 143, 187, 240, 159, 145, 136, 240, 159, 143, 188, 240, 159, 145, 136, 240, 159,
+      143, 189, 240, 159, 145, 136, 240, 159, 143, 190, 240, 159, 145, 136, 240, 159, 143, 191,
+      240, 159, 145, 137, 240, 159, 145, 137, 240, 159, 143, 187, 240, 159, 145, 137, 240, 159,
+      143, 188, 240, 159, 145, 137, 240, 159, 143, 189, 240, 159, 145, 137, 240, 159, 143, 190,
+      240, 159, 145, 137, 240, 159, 143, 191, 240, 159, 145, 134, 240, 159, 145, 134, 240, 159,
+      143, 187, 240, 159, 145, 134, 240, 159, 143, 188, 240, 159, 145, 134, 240, 159, 143, 189,
+      240, 159, 145, 134, 240, 159, 143, 190, 240, 159, 145, 134, 240, 159, 143, 191, 240, 159,
+      150, 149, 240, 159, 150, 149, 240, 159, 143, 187, 240, 159, 150, 149, 240, 159, 143, 188,
+      240, 159, 150, 149, 240, 159, 143, 189, 240, 159, 150, 149, 240, 159, 143, 190, 240, 159,
+      150, 149, 240, 159, 143, 191, 240, 159, 145, 135, 240, 159, 145, 135, 240, 159, 143, 187,
+      240, 159, 145, 135, 240, 159, 143, 188, 240, 159, 145, 135, 240, 159, 143, 189, 240, 159,
+      145, 135, 240, 159, 143, 190, 240, 159, 145, 135, 240, 159, 143, 191, 226, 152, 157, 239,
+      184, 143, 226, 152, 157, 226, 152, 157, 240, 159, 143, 187, 226, 152, 157, 240, 159, 143,
+      188, 226, 152, 157, 240, 159, 143, 189, 226, 152, 157, 240, 159, 143, 190, 226, 152, 157,
+      240, 159, 143, 191, 240, 159, 171, 181, 240, 159, 171, 181, 240, 159, 143, 187, 240, 159,
+      171, 181, 240, 159, 143, 188, 240, 159, 171, 181, 240, 159, 143, 189, 240, 159, 171, 181,
+      240, 159, 143, 190, 240, 159, 171, 181, 240, 159, 143, 191, 240, 159, 145, 141, 240, 159,
+      145, 141, 240, 159, 143, 187, 240, 159, 145, 141, 240, 159, 143, 188, 240, 159, 145, 141,
+      240, 159, 143, 189, 240, 159, 145, 141, 240, 159, 143, 190, 240, 159, 145, 141, 240, 159,
+      143, 191, 240, 159, 145, 142, 240, 159, 145, 142, 240, 159, 143, 187, 240, 159, 145, 142,
+      240, 159, 143, 188, 240, 159, 145, 142, 240, 159, 143, 189, 240, 159, 145, 142, 240, 159,
+      143, 190, 240, 159, 145, 142, 240, 159, 143, 191, 226, 156, 138, 226, 156, 138, 240, 159,
+      143, 187, 226, 156, 138, 240, 159, 143, 188, 226, 156, 138, 240, 159, 143, 189, 226, 156,
+      138, 240, 159, 143, 190, 226, 156, 138, 240, 159, 143, 191, 240, 159, 145, 138, 240, 159,
+      145, 138, 240, 159, 143, 187, 240, 159, 145, 138, 240, 159, 143, 188, 240, 159, 145, 138,
+      240, 159, 143, 189, 240, 159, 145, 138, 240, 159, 143, 190, 240, 159, 145, 138, 240, 159,
+      143, 191, 240, 159, 164, 155, 240, 159, 164, 155, 240, 159, 143, 187, 240, 159, 164, 155,
+      240, 159, 143, 188, 240, 159, 164, 155, 240, 159, 143, 189, 240, 159, 164, 155, 240, 159,
+      143, 190, 240, 159, 164, 155, 240, 159, 143, 191, 240, 159, 164, 156, 240, 159, 164, 156,
+      240, 159, 143, 187, 240, 159, 164, 156, 240, 159, 143, 188, 240, 159, 164, 156, 240, 159,
+      143, 189, 240, 159, 164, 156, 240, 159, 143, 190, 240, 159, 164, 156, 240, 159, 143, 191,
+      240, 159, 145, 143, 240, 159, 145, 143, 240, 159, 143, 187, 240, 159, 145, 143, 240, 159,
+      143, 188, 240, 159, 145, 143, 240, 159, 143, 189, 240, 159, 145, 143, 240, 159, 143, 190,
+      240, 159, 145, 143, 240, 159, 143, 191, 240, 159, 153, 140, 240, 159, 153, 140, 240, 159,
+      143, 187, 240, 159, 153, 140, 240, 159, 143, 188, 240, 159, 153, 140, 240, 159, 143, 189,
+      240, 159, 153, 140, 240, 159, 143, 190, 240, 159, 153, 140, 240, 159, 143, 191, 240, 159,
+      171, 182, 240, 159, 171, 182, 240, 159, 143, 187, 240, 159, 171, 182, 240, 159, 143, 188,
+      240, 159, 171, 182, 240, 159, 143, 189, 240, 159, 171, 182, 240, 159, 143, 190, 240, 159,
+      171, 182, 240, 159, 143, 191, 240, 159, 145, 144, 240, 159, 145, 144, 240, 159, 143, 187,
+      240, 159, 145, 144, 240, 159, 143, 188, 240, 159, 145, 144, 240, 159, 143, 189, 240, 159,
+      145, 144, 240, 159, 143, 190, 240, 159, 145, 144, 240, 159, 143, 191, 240, 159, 164, 178,
+      240, 159, 164, 178, 240, 159, 143, 187, 240, 159, 164, 178, 240, 159, 143, 188, 240, 159,
+      164, 178, 240, 159, 143, 189, 240, 159, 164, 178, 240, 159, 143, 190, 240, 159, 164, 178,
+      240, 159, 143, 191, 240, 159, 164, 157, 240, 159, 164, 157, 240, 159, 143, 187, 240, 159,
+      164, 157, 240, 159, 143, 188, 240, 159, 164, 157, 240, 159, 143, 189, 240, 159, 164, 157,
+      240, 159, 143, 190, 240, 159, 164, 157, 240, 159, 143, 191, 240, 159, 171, 177, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 188, 240, 159, 171, 177, 240,
+      159, 143, 187, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 189, 240, 159, 171, 177,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 190, 240, 159, 171,
+      177, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 191, 240, 159,
+      171, 177, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 187, 240,
+      159, 171, 177, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 189,
+      240, 159, 171, 177, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143,
+      190, 240, 159, 171, 177, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 178, 240, 159,
+      143, 191, 240, 159, 171, 177, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 178, 240,
+      159, 143, 187, 240, 159, 171, 177, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 178,
+      240, 159, 143, 188, 240, 159, 171, 177, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171,
+      178, 240, 159, 143, 190, 240, 159, 171, 177, 240, 159, 143, 189, 226, 128, 141, 240, 159,
+      171, 178, 240, 159, 143, 191, 240, 159, 171, 177, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 171, 178, 240, 159, 143, 187, 240, 159, 171, 177, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 171, 178, 240, 159, 143, 188, 240, 159, 171, 177, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 171, 178, 240, 159, 143, 189, 240, 159, 171, 177, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 171, 178, 240, 159, 143, 191, 240, 159, 171, 177, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 187, 240, 159, 171, 177, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 188, 240, 159, 171, 177, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 189, 240, 159, 171, 177, 240,
+      159, 143, 191, 226, 128, 141, 240, 159, 171, 178, 240, 159, 143, 190, 240, 159, 153, 143,
+      240, 159, 153, 143, 240, 159, 143, 187, 240, 159, 153, 143, 240, 159, 143, 188, 240, 159,
+      153, 143, 240, 159, 143, 189, 240, 159, 153, 143, 240, 159, 143, 190, 240, 159, 153, 143,
+      240, 159, 143, 191, 226, 156, 141, 239, 184, 143, 226, 156, 141, 226, 156, 141, 240, 159,
+      143, 187, 226, 156, 141, 240, 159, 143, 188, 226, 156, 141, 240, 159, 143, 189, 226, 156,
+      141, 240, 159, 143, 190, 226, 156, 141, 240, 159, 143, 191, 240, 159, 146, 133, 240, 159,
+      146, 133, 240, 159, 143, 187, 240, 159, 146, 133, 240, 159, 143, 188, 240, 159, 146, 133,
+      240, 159, 143, 189, 240, 159, 146, 133, 240, 159, 143, 190, 240, 159, 146, 133, 240, 159,
+      143, 191, 240, 159, 164, 179, 240, 159, 164, 179, 240, 159, 143, 187, 240, 159, 164, 179,
+      240, 159, 143, 188, 240, 159, 164, 179, 240, 159, 143, 189, 240, 159, 164, 179, 240, 159,
+      143, 190, 240, 159, 164, 179, 240, 159, 143, 191, 240, 159, 146, 170, 240, 159, 146, 170,
+      240, 159, 143, 187, 240, 159, 146, 170, 240, 159, 143, 188, 240, 159, 146, 170, 240, 159,
+      143, 189, 240, 159, 146, 170, 240, 159, 143, 190, 240, 159, 146, 170, 240, 159, 143, 191,
+      240, 159, 166, 190, 240, 159, 166, 191, 240, 159, 166, 181, 240, 159, 166, 181, 240, 159,
+      143, 187, 240, 159, 166, 181, 240, 159, 143, 188, 240, 159, 166, 181, 240, 159, 143, 189,
+      240, 159, 166, 181, 240, 159, 143, 190, 240, 159, 166, 181, 240, 159, 143, 191, 240, 159,
+      166, 182, 240, 159, 166, 182, 240, 159, 143, 187, 240, 159, 166, 182, 240, 159, 143, 188,
+      240, 159, 166, 182, 240, 159, 143, 189, 240, 159, 166, 182, 240, 159, 143, 190, 240, 159,
+      166, 182, 240, 159, 143, 191, 240, 159, 145, 130, 240, 159, 145, 130, 240, 159, 143, 187,
+      240, 159, 145, 130, 240, 159, 143, 188, 240, 159, 145, 130, 240, 159, 143, 189, 240, 159,
+      145, 130, 240, 159, 143, 190, 240, 159, 145, 130, 240, 159, 143, 191, 240, 159, 166, 187,
+      240, 159, 166, 187, 240, 159, 143, 187, 240, 159, 166, 187, 240, 159, 143, 188, 240, 159,
+      166, 187, 240, 159, 143, 189, 240, 159, 166, 187, 240, 159, 143, 190, 240, 159, 166, 187,
+      240, 159, 143, 191, 240, 159, 145, 131, 240, 159, 145, 131, 240, 159, 143, 187, 240, 159,
+      145, 131, 240, 159, 143, 188, 240, 159, 145, 131, 240, 159, 143, 189, 240, 159, 145, 131,
+      240, 159, 143, 190, 240, 159, 145, 131, 240, 159, 143, 191, 240, 159, 167, 160, 240, 159,
+      171, 128, 240, 159, 171, 129, 240, 159, 166, 183, 240, 159, 166, 180, 240, 159, 145, 128,
+      240, 159, 145, 129, 239, 184, 143, 240, 159, 145, 129, 240, 159, 145, 133, 240, 159, 145,
+      132, 240, 159, 171, 166, 240, 159, 145, 182, 240, 159, 145, 182, 240, 159, 143, 187, 240,
+      159, 145, 182, 240, 159, 143, 188, 240, 159, 145, 182, 240, 159, 143, 189, 240, 159, 145,
+      182, 240, 159, 143, 190, 240, 159, 145, 182, 240, 159, 143, 191, 240, 159, 167, 146, 240,
+      159, 167, 146, 240, 159, 143, 187, 240, 159, 167, 146, 240, 159, 143, 188, 240, 159, 167,
+      146, 240, 159, 143, 189, 240, 159, 167, 146, 240, 159, 143, 190, 240, 159, 167, 146, 240,
+      159, 143, 191, 240, 159, 145, 166, 240, 159, 145, 166, 240, 159, 143, 187, 240, 159, 145,
+      166, 240, 159, 143, 188, 240, 159, 145, 166, 240, 159, 143, 189, 240, 159, 145, 166, 240,
+      159, 143, 190, 240, 159, 145, 166, 240, 159, 143, 191, 240, 159, 145, 167, 240, 159, 145,
+      167, 240, 159, 143, 187, 240, 159, 145, 167, 240, 159, 143, 188, 240, 159, 145, 167, 240,
+      159, 143, 189, 240, 159, 145, 167, 240, 159, 143, 190, 240, 159, 145, 167, 240, 159, 143,
+      191, 240, 159, 167, 145, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240,
+      159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143,
+      190, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 145, 177, 240, 159, 145, 177, 240,
+      159, 143, 187, 240, 159, 145, 177, 240, 159, 143, 188, 240, 159, 145, 177, 240, 159, 143,
+      189, 240, 159, 145, 177, 240, 159, 143, 190, 240, 159, 145, 177, 240, 159, 143, 191, 240,
+      159, 145, 168, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143,
+      188, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 190, 240,
+      159, 145, 168, 240, 159, 143, 191, 240, 159, 167, 148, 240, 159, 167, 148, 240, 159, 143,
+      187, 240, 159, 167, 148, 240, 159, 143, 188, 240, 159, 167, 148, 240, 159, 143, 189, 240,
+      159, 167, 148, 240, 159, 143, 190, 240, 159, 167, 148, 240, 159, 143, 191, 240, 159, 167,
+      148, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 148, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 148, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 167, 148, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 167,
+      148, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 148,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 167, 148, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 148, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 130, 240, 159, 167, 148, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 167, 148, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130,
+      240, 159, 167, 148, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 167, 148, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 167, 148, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 148, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 148, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 167, 148, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 167, 148, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 148, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167, 148, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 148, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 240, 159, 167, 148, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 167, 148, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159,
+      167, 148, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167,
+      148, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 145, 168, 226, 128, 141,
+      240, 159, 166, 176, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166,
+      176, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 176, 240, 159,
+      145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 168, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 168, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 168, 226, 128, 141, 240, 159, 166, 177,
+      240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 177, 240, 159, 145,
+      168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 177, 240, 159, 145, 168, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 166, 177, 240, 159, 145, 168, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 166, 177, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 166, 177, 240, 159, 145, 168, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 166, 179, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      166, 179, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 179, 240,
+      159, 145, 168, 226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 168, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 166, 178, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166,
+      178, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 178, 240, 159,
+      145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 169, 240,
+      159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240,
+      159, 143, 191, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 169, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 166, 176, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      166, 176, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 176, 240,
+      159, 167, 145, 226, 128, 141, 240, 159, 166, 176, 240, 159, 167, 145, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 166, 176, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 166, 176, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166,
+      176, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 176, 240, 159,
+      167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 176, 240, 159, 145, 169, 226,
+      128, 141, 240, 159, 166, 177, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 166, 177, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 177,
+      240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 177, 240, 159, 145,
+      169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 177, 240, 159, 145, 169, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 166, 177, 240, 159, 167, 145, 226, 128, 141, 240, 159,
+      166, 177, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 177, 240,
+      159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 177, 240, 159, 167, 145,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 177, 240, 159, 167, 145, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 166, 177, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 166, 177, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 179, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 166, 179, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 166, 179, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166,
+      179, 240, 159, 167, 145, 226, 128, 141, 240, 159, 166, 179, 240, 159, 167, 145, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 166, 179, 240, 159, 167, 145, 240, 159, 143, 188, 226,
+      128, 141, 240, 159, 166, 179, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 166, 179, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 179,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 179, 240, 159, 145,
+      169, 226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 166, 178, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159,
+      166, 178, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 178, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 178, 240, 159, 167, 145, 226, 128, 141,
+      240, 159, 166, 178, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166,
+      178, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 178, 240, 159,
+      167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 178, 240, 159, 167, 145, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 166, 178, 240, 159, 167, 145, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 166, 178, 240, 159, 145, 177, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 145, 177, 226, 128, 141, 226, 153, 128, 240, 159, 145, 177, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 240, 159, 145, 177, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 240, 159, 145, 177, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 145, 177, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 145,
+      177, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 177,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 145, 177, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 240, 159, 145, 177, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 145, 177, 226, 128, 141, 226, 153, 130, 240, 159, 145, 177, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 240, 159, 145, 177, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      240, 159, 145, 177, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 145, 177, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 145, 177, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 177, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 145, 177, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 177, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 147, 240, 159, 167, 147, 240, 159, 143, 187, 240, 159, 167,
+      147, 240, 159, 143, 188, 240, 159, 167, 147, 240, 159, 143, 189, 240, 159, 167, 147, 240,
+      159, 143, 190, 240, 159, 167, 147, 240, 159, 143, 191, 240, 159, 145, 180, 240, 159, 145,
+      180, 240, 159, 143, 187, 240, 159, 145, 180, 240, 159, 143, 188, 240, 159, 145, 180, 240,
+      159, 143, 189, 240, 159, 145, 180, 240, 159, 143, 190, 240, 159, 145, 180, 240, 159, 143,
+      191, 240, 159, 145, 181, 240, 159, 145, 181, 240, 159, 143, 187, 240, 159, 145, 181, 240,
+      159, 143, 188, 240, 159, 145, 181, 240, 159, 143, 189, 240, 159, 145, 181, 240, 159, 143,
+      190, 240, 159, 145, 181, 240, 159, 143, 191, 240, 159, 153, 141, 240, 159, 153, 141, 240,
+      159, 143, 187, 240, 159, 153, 141, 240, 159, 143, 188, 240, 159, 153, 141, 240, 159, 143,
+      189, 240, 159, 153, 141, 240, 159, 143, 190, 240, 159, 153, 141, 240, 159, 143, 191, 240,
+      159, 153, 141, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 141, 226, 128,
+      141, 226, 153, 130, 240, 159, 153, 141, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 153, 141, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240,
+      159, 153, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      153, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 153, 141, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 141, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 130, 240, 159, 153, 141, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 153, 141, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 130, 240, 159, 153, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 153, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 153,
+      141, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 141, 226, 128, 141, 226,
+      153, 128, 240, 159, 153, 141, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 153, 141, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 153,
+      141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 141,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 153, 141, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 141, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 128, 240, 159, 153, 141, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 153, 141, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      240, 159, 153, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 153, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 153, 142, 240,
+      159, 153, 142, 240, 159, 143, 187, 240, 159, 153, 142, 240, 159, 143, 188, 240, 159, 153,
+      142, 240, 159, 143, 189, 240, 159, 153, 142, 240, 159, 143, 190, 240, 159, 153, 142, 240,
+      159, 143, 191, 240, 159, 153, 142, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      153, 142, 226, 128, 141, 226, 153, 130, 240, 159, 153, 142, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 240, 159, 153, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 153, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159,
+      153, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153,
+      142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 153, 142, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 240, 159, 153, 142, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 240, 159, 153, 142, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 142,
+      226, 128, 141, 226, 153, 128, 240, 159, 153, 142, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 240, 159, 153, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 153, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 153, 142,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 142, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 153, 142, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 240, 159, 153, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 153, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240,
+      159, 153, 133, 240, 159, 153, 133, 240, 159, 143, 187, 240, 159, 153, 133, 240, 159, 143,
+      188, 240, 159, 153, 133, 240, 159, 143, 189, 240, 159, 153, 133, 240, 159, 143, 190, 240,
+      159, 153, 133, 240, 159, 143, 191, 240, 159, 153, 133, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 153, 133, 226, 128, 141, 226, 153, 130, 240, 159, 153, 133, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 130, 240, 159, 153, 133, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 240, 159, 153, 133, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 153, 133, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 153,
+      133, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 133,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 153, 133, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 130, 240, 159, 153, 133, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 153, 133, 226, 128, 141, 226, 153, 128, 240, 159, 153, 133, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 128, 240, 159, 153, 133, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128,
+      240, 159, 153, 133, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 153, 133, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 153, 133, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 133, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 153, 133, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 133, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 128, 240, 159, 153, 134, 240, 159, 153, 134, 240, 159, 143, 187, 240, 159, 153,
+      134, 240, 159, 143, 188, 240, 159, 153, 134, 240, 159, 143, 189, 240, 159, 153, 134, 240,
+      159, 143, 190, 240, 159, 153, 134, 240, 159, 143, 191, 240, 159, 153, 134, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 153, 134, 226, 128, 141, 226, 153, 130, 240, 159,
+      153, 134, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153,
+      134, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 153, 134, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 134, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 130, 240, 159, 153, 134, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 153, 134, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      130, 240, 159, 153, 134, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 153, 134, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 153, 134,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 134, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 153, 134, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 153, 134, 226, 128, 141, 226, 153, 128, 240, 159, 153, 134,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 134, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 153, 134, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 134, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 240, 159, 153, 134, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 153, 134, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240,
+      159, 153, 134, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      153, 134, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 153, 134, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 134, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 128, 240, 159, 146, 129, 240, 159, 146, 129, 240, 159, 143,
+      187, 240, 159, 146, 129, 240, 159, 143, 188, 240, 159, 146, 129, 240, 159, 143, 189, 240,
+      159, 146, 129, 240, 159, 143, 190, 240, 159, 146, 129, 240, 159, 143, 191, 240, 159, 146,
+      129, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 129, 226, 128, 141, 226,
+      153, 130, 240, 159, 146, 129, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 146, 129, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 146,
+      129, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 129,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 146, 129, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 129, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 130, 240, 159, 146, 129, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 146, 129, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130,
+      240, 159, 146, 129, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 146, 129, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 146, 129, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 129, 226, 128, 141, 226, 153, 128,
+      240, 159, 146, 129, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 146, 129, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 146, 129, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 129, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 146, 129, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 129, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 240, 159, 146, 129, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 146, 129, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159,
+      146, 129, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146,
+      129, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 153, 139, 240, 159, 153,
+      139, 240, 159, 143, 187, 240, 159, 153, 139, 240, 159, 143, 188, 240, 159, 153, 139, 240,
+      159, 143, 189, 240, 159, 153, 139, 240, 159, 143, 190, 240, 159, 153, 139, 240, 159, 143,
+      191, 240, 159, 153, 139, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 139,
+      226, 128, 141, 226, 153, 130, 240, 159, 153, 139, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 153, 139, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      130, 240, 159, 153, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 153, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 153, 139,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 139, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 153, 139, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 139, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 240, 159, 153, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 153, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240,
+      159, 153, 139, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 139, 226, 128,
+      141, 226, 153, 128, 240, 159, 153, 139, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 153, 139, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240,
+      159, 153, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      153, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 153, 139, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 139, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 128, 240, 159, 153, 139, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 153, 139, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 240, 159, 153, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 153, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167,
+      143, 240, 159, 167, 143, 240, 159, 143, 187, 240, 159, 167, 143, 240, 159, 143, 188, 240,
+      159, 167, 143, 240, 159, 143, 189, 240, 159, 167, 143, 240, 159, 143, 190, 240, 159, 167,
+      143, 240, 159, 143, 191, 240, 159, 167, 143, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 167, 143, 226, 128, 141, 226, 153, 130, 240, 159, 167, 143, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 240, 159, 167, 143, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      240, 159, 167, 143, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 167, 143, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167, 143, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 143, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 143, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 143, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      167, 143, 226, 128, 141, 226, 153, 128, 240, 159, 167, 143, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 240, 159, 167, 143, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 167, 143, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159,
+      167, 143, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167,
+      143, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 143, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 240, 159, 167, 143, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 143, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 240, 159, 153, 135, 240, 159, 153, 135, 240, 159, 143, 187, 240, 159, 153, 135, 240,
+      159, 143, 188, 240, 159, 153, 135, 240, 159, 143, 189, 240, 159, 153, 135, 240, 159, 143,
+      190, 240, 159, 153, 135, 240, 159, 143, 191, 240, 159, 153, 135, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 153, 135, 226, 128, 141, 226, 153, 130, 240, 159, 153, 135,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 135, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 153, 135, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 135, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 240, 159, 153, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 153, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240,
+      159, 153, 135, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      153, 135, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 153, 135, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 153, 135, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 240, 159, 153, 135, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 153, 135, 226, 128, 141, 226, 153, 128, 240, 159, 153, 135, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 135, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 240, 159, 153, 135, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 153, 135, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 240, 159, 153, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 153, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 153,
+      135, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 135,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 153, 135, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 153, 135, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 240, 159, 164, 166, 240, 159, 164, 166, 240, 159, 143, 187, 240,
+      159, 164, 166, 240, 159, 143, 188, 240, 159, 164, 166, 240, 159, 143, 189, 240, 159, 164,
+      166, 240, 159, 143, 190, 240, 159, 164, 166, 240, 159, 143, 191, 240, 159, 164, 166, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 166, 226, 128, 141, 226, 153, 130,
+      240, 159, 164, 166, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 164, 166, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 164, 166, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 166, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 166, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 166, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 130, 240, 159, 164, 166, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 164, 166, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159,
+      164, 166, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164,
+      166, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 164, 166, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 164, 166, 226, 128, 141, 226, 153, 128, 240, 159,
+      164, 166, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164,
+      166, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 164, 166, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 166, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 240, 159, 164, 166, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 164, 166, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 240, 159, 164, 166, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 164, 166, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 164, 166,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 166, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 164, 183, 240, 159, 164, 183, 240,
+      159, 143, 187, 240, 159, 164, 183, 240, 159, 143, 188, 240, 159, 164, 183, 240, 159, 143,
+      189, 240, 159, 164, 183, 240, 159, 143, 190, 240, 159, 164, 183, 240, 159, 143, 191, 240,
+      159, 164, 183, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 183, 226, 128,
+      141, 226, 153, 130, 240, 159, 164, 183, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 164, 183, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240,
+      159, 164, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      164, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 183, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 183, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 130, 240, 159, 164, 183, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 164, 183, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 130, 240, 159, 164, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 164, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 164,
+      183, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 183, 226, 128, 141, 226,
+      153, 128, 240, 159, 164, 183, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 164, 183, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 164,
+      183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 183,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164, 183, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 183, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 128, 240, 159, 164, 183, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 164, 183, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      240, 159, 164, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 164, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167, 145, 226,
+      128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 167, 145, 226, 128, 141, 226, 154, 149,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 154, 149, 240, 159, 167, 145, 240,
+      159, 143, 188, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 167, 145, 240, 159,
+      143, 188, 226, 128, 141, 226, 154, 149, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128,
+      141, 226, 154, 149, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141,
+      226, 154, 149, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 239,
+      184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 240, 159,
+      167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 226, 154, 149, 240, 159, 145, 168, 226, 128, 141,
+      226, 154, 149, 239, 184, 143, 240, 159, 145, 168, 226, 128, 141, 226, 154, 149, 240, 159,
+      145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 226, 154, 149, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 226, 154, 149, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226,
+      154, 149, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 154,
+      149, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 239, 184, 143,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145, 168, 240,
+      159, 143, 191, 226, 128, 141, 226, 154, 149, 240, 159, 145, 169, 226, 128, 141, 226, 154,
+      149, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 226, 154, 149, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145, 169, 240,
+      159, 143, 187, 226, 128, 141, 226, 154, 149, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 154, 149, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 154, 149,
+      239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 154, 149, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 154, 149, 240, 159, 145, 169, 240, 159,
+      143, 191, 226, 128, 141, 226, 154, 149, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 226, 154, 149, 240, 159, 167, 145, 226, 128, 141, 240, 159, 142, 147,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 142, 147, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 142, 147, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 142, 147, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 142, 147, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 142, 147, 240, 159, 145, 168, 226, 128, 141, 240, 159, 142, 147, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 142, 147, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 142, 147, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 142, 147, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      142, 147, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 147, 240,
+      159, 145, 169, 226, 128, 141, 240, 159, 142, 147, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 142, 147, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 142, 147, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 142,
+      147, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 142, 147, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 147, 240, 159, 167, 145, 226,
+      128, 141, 240, 159, 143, 171, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 143, 171, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 143, 171,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 143, 171, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 143, 171, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      143, 171, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 143, 171, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 143, 171, 240, 159, 145, 169, 226, 128, 141, 240, 159, 143, 171, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 143, 171, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 143, 171, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 143,
+      171, 240, 159, 167, 145, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 167, 145,
+      226, 128, 141, 226, 154, 150, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226,
+      154, 150, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 154,
+      150, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 239, 184, 143,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 240, 159, 167, 145,
+      240, 159, 143, 189, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 167, 145, 240,
+      159, 143, 189, 226, 128, 141, 226, 154, 150, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128,
+      141, 226, 154, 150, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150,
+      239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150, 240,
+      159, 145, 168, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 145, 168, 226, 128,
+      141, 226, 154, 150, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 154, 150,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 154, 150, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159,
+      145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 240, 159, 145, 168, 240, 159,
+      143, 189, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143,
+      189, 226, 128, 141, 226, 154, 150, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141,
+      226, 154, 150, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226,
+      154, 150, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150, 239, 184,
+      143, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150, 240, 159, 145,
+      169, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 226,
+      154, 150, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 154, 150, 239, 184,
+      143, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 154, 150, 240, 159, 145,
+      169, 240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 226, 154, 150, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 226, 154, 150, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 226, 154, 150, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 154,
+      150, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 154, 150,
+      240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150, 239, 184, 143, 240,
+      159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 154, 150, 240, 159, 167, 145, 226,
+      128, 141, 240, 159, 140, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 140, 190, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 140, 190,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 140, 190, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 140, 190, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      140, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 140, 190, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 140, 190, 240, 159, 145, 169, 226, 128, 141, 240, 159, 140, 190, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 140, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 140, 190, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 140,
+      190, 240, 159, 167, 145, 226, 128, 141, 240, 159, 141, 179, 240, 159, 167, 145, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 141, 179, 240, 159, 167, 145, 240, 159, 143, 188, 226,
+      128, 141, 240, 159, 141, 179, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 141, 179, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 141, 179,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145,
+      168, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 141, 179, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159,
+      141, 179, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 141, 179, 240,
+      159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145, 169, 226, 128, 141,
+      240, 159, 141, 179, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 141,
+      179, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 141, 179, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 141, 179, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 141, 179, 240, 159, 167, 145, 226, 128, 141, 240, 159, 148, 167,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 148, 167, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 148, 167, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 148, 167, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 148, 167, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 148, 167, 240, 159, 145, 168, 226, 128, 141, 240, 159, 148, 167, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 148, 167, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 148, 167, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 148, 167, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      148, 167, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 148, 167, 240,
+      159, 145, 169, 226, 128, 141, 240, 159, 148, 167, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 148, 167, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 148, 167, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 148,
+      167, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 148, 167, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 148, 167, 240, 159, 167, 145, 226,
+      128, 141, 240, 159, 143, 173, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 143, 173, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 143, 173,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 143, 173, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 143, 173, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      143, 173, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 143, 173, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 143, 173, 240, 159, 145, 169, 226, 128, 141, 240, 159, 143, 173, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 143, 173, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 143, 173, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 143,
+      173, 240, 159, 167, 145, 226, 128, 141, 240, 159, 146, 188, 240, 159, 167, 145, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 146, 188, 240, 159, 167, 145, 240, 159, 143, 188, 226,
+      128, 141, 240, 159, 146, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 146, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 146, 188,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145,
+      168, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 146, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159,
+      146, 188, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 146, 188, 240,
+      159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145, 169, 226, 128, 141,
+      240, 159, 146, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 146,
+      188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 146, 188, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 146, 188, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 146, 188, 240, 159, 167, 145, 226, 128, 141, 240, 159, 148, 172,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 148, 172, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 148, 172, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 148, 172, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 148, 172, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 148, 172, 240, 159, 145, 168, 226, 128, 141, 240, 159, 148, 172, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 148, 172, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 148, 172, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 148, 172, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      148, 172, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 148, 172, 240,
+      159, 145, 169, 226, 128, 141, 240, 159, 148, 172, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 148, 172, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 148, 172, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 148,
+      172, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 148, 172, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 148, 172, 240, 159, 167, 145, 226,
+      128, 141, 240, 159, 146, 187, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 146, 187, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 146, 187,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 146, 187, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 146, 187, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      146, 187, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 146, 187, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 146, 187, 240, 159, 145, 169, 226, 128, 141, 240, 159, 146, 187, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 146, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 146, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 146,
+      187, 240, 159, 167, 145, 226, 128, 141, 240, 159, 142, 164, 240, 159, 167, 145, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 142, 164, 240, 159, 167, 145, 240, 159, 143, 188, 226,
+      128, 141, 240, 159, 142, 164, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 142, 164, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 142, 164,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145,
+      168, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 142, 164, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159,
+      142, 164, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 142, 164, 240,
+      159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145, 169, 226, 128, 141,
+      240, 159, 142, 164, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 142,
+      164, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 142, 164, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 142, 164, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 142, 164, 240, 159, 167, 145, 226, 128, 141, 240, 159, 142, 168,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 142, 168, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 142, 168, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 142, 168, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 142, 168, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 142, 168, 240, 159, 145, 168, 226, 128, 141, 240, 159, 142, 168, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 142, 168, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 142, 168, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 142, 168, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      142, 168, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 168, 240,
+      159, 145, 169, 226, 128, 141, 240, 159, 142, 168, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 142, 168, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 142, 168, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 142,
+      168, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 142, 168, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 142, 168, 240, 159, 167, 145, 226,
+      128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 167, 145, 226, 128, 141, 226, 156, 136,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 156, 136, 240, 159, 167, 145, 240,
+      159, 143, 188, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 167, 145, 240, 159,
+      143, 188, 226, 128, 141, 226, 156, 136, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128,
+      141, 226, 156, 136, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141,
+      226, 156, 136, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 239,
+      184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 240, 159,
+      167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 226, 156, 136, 240, 159, 145, 168, 226, 128, 141,
+      226, 156, 136, 239, 184, 143, 240, 159, 145, 168, 226, 128, 141, 226, 156, 136, 240, 159,
+      145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 226, 156, 136, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 226, 156, 136, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226,
+      156, 136, 239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 156,
+      136, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 239, 184, 143,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145, 168, 240,
+      159, 143, 191, 226, 128, 141, 226, 156, 136, 240, 159, 145, 169, 226, 128, 141, 226, 156,
+      136, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 226, 156, 136, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145, 169, 240,
+      159, 143, 187, 226, 128, 141, 226, 156, 136, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 156, 136, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 156, 136,
+      239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 156, 136, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 156, 136, 240, 159, 145, 169, 240, 159,
+      143, 191, 226, 128, 141, 226, 156, 136, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 226, 156, 136, 240, 159, 167, 145, 226, 128, 141, 240, 159, 154, 128,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 154, 128, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 154, 128, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 154, 128, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 154, 128, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 154, 128, 240, 159, 145, 168, 226, 128, 141, 240, 159, 154, 128, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 154, 128, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 154, 128, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 154, 128, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      154, 128, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 154, 128, 240,
+      159, 145, 169, 226, 128, 141, 240, 159, 154, 128, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 154, 128, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      240, 159, 154, 128, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 154,
+      128, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 154, 128, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 154, 128, 240, 159, 167, 145, 226,
+      128, 141, 240, 159, 154, 146, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 154, 146, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 154, 146,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 154, 146, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 154, 146, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      154, 146, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 154, 146, 240,
+      159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 154, 146, 240, 159, 145, 169, 226, 128, 141, 240, 159, 154, 146, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 154, 146, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 154, 146, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 154,
+      146, 240, 159, 145, 174, 240, 159, 145, 174, 240, 159, 143, 187, 240, 159, 145, 174, 240,
+      159, 143, 188, 240, 159, 145, 174, 240, 159, 143, 189, 240, 159, 145, 174, 240, 159, 143,
+      190, 240, 159, 145, 174, 240, 159, 143, 191, 240, 159, 145, 174, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 145, 174, 226, 128, 141, 226, 153, 130, 240, 159, 145, 174,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 174, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 145, 174, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 174, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 240, 159, 145, 174, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 145, 174, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240,
+      159, 145, 174, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      145, 174, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 145, 174, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 174, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 240, 159, 145, 174, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 145, 174, 226, 128, 141, 226, 153, 128, 240, 159, 145, 174, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 174, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 240, 159, 145, 174, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 145, 174, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 240, 159, 145, 174, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 145, 174, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 145,
+      174, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 174,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 145, 174, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 174, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 240, 159, 149, 181, 239, 184, 143, 240, 159, 149, 181, 240, 159,
+      149, 181, 240, 159, 143, 187, 240, 159, 149, 181, 240, 159, 143, 188, 240, 159, 149, 181,
+      240, 159, 143, 189, 240, 159, 149, 181, 240, 159, 143, 190, 240, 159, 149, 181, 240, 159,
+      143, 191, 240, 159, 149, 181, 239, 184, 143, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 149, 181, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 149, 181, 239,
+      184, 143, 226, 128, 141, 226, 153, 130, 240, 159, 149, 181, 226, 128, 141, 226, 153, 130,
+      240, 159, 149, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 149, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 149, 181, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 149, 181, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 149, 181, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 149, 181, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 130, 240, 159, 149, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 149, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159,
+      149, 181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 149,
+      181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 149, 181, 239, 184, 143,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 149, 181, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 149, 181, 239, 184, 143, 226, 128, 141, 226, 153, 128, 240,
+      159, 149, 181, 226, 128, 141, 226, 153, 128, 240, 159, 149, 181, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 149, 181, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 240, 159, 149, 181, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 149, 181, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240,
+      159, 149, 181, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      149, 181, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 149, 181, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 149, 181, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 128, 240, 159, 149, 181, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 149, 181, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 240, 159, 146, 130, 240, 159, 146, 130, 240, 159, 143, 187, 240, 159, 146, 130,
+      240, 159, 143, 188, 240, 159, 146, 130, 240, 159, 143, 189, 240, 159, 146, 130, 240, 159,
+      143, 190, 240, 159, 146, 130, 240, 159, 143, 191, 240, 159, 146, 130, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 146, 130, 226, 128, 141, 226, 153, 130, 240, 159, 146,
+      130, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 130,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 146, 130, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 130, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 240, 159, 146, 130, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 146, 130, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      240, 159, 146, 130, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 146, 130, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 146, 130, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 130, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 146, 130, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 146, 130, 226, 128, 141, 226, 153, 128, 240, 159, 146, 130, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 130, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 146, 130, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 130, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 240, 159, 146, 130, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 146, 130, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159,
+      146, 130, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146,
+      130, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 146, 130, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 130, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 240, 159, 165, 183, 240, 159, 165, 183, 240, 159, 143, 187,
+      240, 159, 165, 183, 240, 159, 143, 188, 240, 159, 165, 183, 240, 159, 143, 189, 240, 159,
+      165, 183, 240, 159, 143, 190, 240, 159, 165, 183, 240, 159, 143, 191, 240, 159, 145, 183,
+      240, 159, 145, 183, 240, 159, 143, 187, 240, 159, 145, 183, 240, 159, 143, 188, 240, 159,
+      145, 183, 240, 159, 143, 189, 240, 159, 145, 183, 240, 159, 143, 190, 240, 159, 145, 183,
+      240, 159, 143, 191, 240, 159, 145, 183, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 145, 183, 226, 128, 141, 226, 153, 130, 240, 159, 145, 183, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 240, 159, 145, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240,
+      159, 145, 183, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      145, 183, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 145, 183, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 240, 159, 145, 183, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 240, 159, 145, 183, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145,
+      183, 226, 128, 141, 226, 153, 128, 240, 159, 145, 183, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 240, 159, 145, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 145, 183, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 145,
+      183, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 183,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 145, 183, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 240, 159, 145, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 145, 183, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      240, 159, 171, 133, 240, 159, 171, 133, 240, 159, 143, 187, 240, 159, 171, 133, 240, 159,
+      143, 188, 240, 159, 171, 133, 240, 159, 143, 189, 240, 159, 171, 133, 240, 159, 143, 190,
+      240, 159, 171, 133, 240, 159, 143, 191, 240, 159, 164, 180, 240, 159, 164, 180, 240, 159,
+      143, 187, 240, 159, 164, 180, 240, 159, 143, 188, 240, 159, 164, 180, 240, 159, 143, 189,
+      240, 159, 164, 180, 240, 159, 143, 190, 240, 159, 164, 180, 240, 159, 143, 191, 240, 159,
+      145, 184, 240, 159, 145, 184, 240, 159, 143, 187, 240, 159, 145, 184, 240, 159, 143, 188,
+      240, 159, 145, 184, 240, 159, 143, 189, 240, 159, 145, 184, 240, 159, 143, 190, 240, 159,
+      145, 184, 240, 159, 143, 191, 240, 159, 145, 179, 240, 159, 145, 179, 240, 159, 143, 187,
+      240, 159, 145, 179, 240, 159, 143, 188, 240, 159, 145, 179, 240, 159, 143, 189, 240, 159,
+      145, 179, 240, 159, 143, 190, 240, 159, 145, 179, 240, 159, 143, 191, 240, 159, 145, 179,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 179, 226, 128, 141, 226, 153,
+      130, 240, 159, 145, 179, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 145, 179, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 145, 179,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 179, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 145, 179, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 179, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 240, 159, 145, 179, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 145, 179, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240,
+      159, 145, 179, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      145, 179, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 145, 179, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 179, 226, 128, 141, 226, 153, 128, 240,
+      159, 145, 179, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      145, 179, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 145, 179, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 179, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 128, 240, 159, 145, 179, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 145, 179, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 128, 240, 159, 145, 179, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 145, 179, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 145,
+      179, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 179,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 145, 178, 240, 159, 145, 178,
+      240, 159, 143, 187, 240, 159, 145, 178, 240, 159, 143, 188, 240, 159, 145, 178, 240, 159,
+      143, 189, 240, 159, 145, 178, 240, 159, 143, 190, 240, 159, 145, 178, 240, 159, 143, 191,
+      240, 159, 167, 149, 240, 159, 167, 149, 240, 159, 143, 187, 240, 159, 167, 149, 240, 159,
+      143, 188, 240, 159, 167, 149, 240, 159, 143, 189, 240, 159, 167, 149, 240, 159, 143, 190,
+      240, 159, 167, 149, 240, 159, 143, 191, 240, 159, 164, 181, 240, 159, 164, 181, 240, 159,
+      143, 187, 240, 159, 164, 181, 240, 159, 143, 188, 240, 159, 164, 181, 240, 159, 143, 189,
+      240, 159, 164, 181, 240, 159, 143, 190, 240, 159, 164, 181, 240, 159, 143, 191, 240, 159,
+      164, 181, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 181, 226, 128, 141,
+      226, 153, 130, 240, 159, 164, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 164, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159,
+      164, 181, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164,
+      181, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 181, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 181, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 240, 159, 164, 181, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 164, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 240, 159, 164, 181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 164, 181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 164, 181,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 181, 226, 128, 141, 226, 153,
+      128, 240, 159, 164, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 164, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 164, 181,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 181, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164, 181, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 181, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 240, 159, 164, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 164, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240,
+      159, 164, 181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      164, 181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 145, 176, 240, 159,
+      145, 176, 240, 159, 143, 187, 240, 159, 145, 176, 240, 159, 143, 188, 240, 159, 145, 176,
+      240, 159, 143, 189, 240, 159, 145, 176, 240, 159, 143, 190, 240, 159, 145, 176, 240, 159,
+      143, 191, 240, 159, 145, 176, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145,
+      176, 226, 128, 141, 226, 153, 130, 240, 159, 145, 176, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 145, 176, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 240, 159, 145, 176, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 145, 176, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 145,
+      176, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 176,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 145, 176, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 176, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 240, 159, 145, 176, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 145, 176, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      240, 159, 145, 176, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 176, 226,
+      128, 141, 226, 153, 128, 240, 159, 145, 176, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 145, 176, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      240, 159, 145, 176, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 145, 176, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 145, 176, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 176, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 145, 176, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 176, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 240, 159, 145, 176, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 145, 176, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159,
+      164, 176, 240, 159, 164, 176, 240, 159, 143, 187, 240, 159, 164, 176, 240, 159, 143, 188,
+      240, 159, 164, 176, 240, 159, 143, 189, 240, 159, 164, 176, 240, 159, 143, 190, 240, 159,
+      164, 176, 240, 159, 143, 191, 240, 159, 171, 131, 240, 159, 171, 131, 240, 159, 143, 187,
+      240, 159, 171, 131, 240, 159, 143, 188, 240, 159, 171, 131, 240, 159, 143, 189, 240, 159,
+      171, 131, 240, 159, 143, 190, 240, 159, 171, 131, 240, 159, 143, 191, 240, 159, 171, 132,
+      240, 159, 171, 132, 240, 159, 143, 187, 240, 159, 171, 132, 240, 159, 143, 188, 240, 159,
+      171, 132, 240, 159, 143, 189, 240, 159, 171, 132, 240, 159, 143, 190, 240, 159, 171, 132,
+      240, 159, 143, 191, 240, 159, 164, 177, 240, 159, 164, 177, 240, 159, 143, 187, 240, 159,
+      164, 177, 240, 159, 143, 188, 240, 159, 164, 177, 240, 159, 143, 189, 240, 159, 164, 177,
+      240, 159, 143, 190, 240, 159, 164, 177, 240, 159, 143, 191, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 141, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      141, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 141, 188, 240,
+      159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 169,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 168, 226, 128, 141, 240, 159, 141,
+      188, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 141, 188, 240, 159,
+      145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 168, 240,
+      159, 143, 189, 226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 168, 240, 159, 143, 190,
+      226, 128, 141, 240, 159, 141, 188, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141,
+      240, 159, 141, 188, 240, 159, 167, 145, 226, 128, 141, 240, 159, 141, 188, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 141, 188, 240, 159, 167, 145, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 141, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 141, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 141, 188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 141, 188,
+      240, 159, 145, 188, 240, 159, 145, 188, 240, 159, 143, 187, 240, 159, 145, 188, 240, 159,
+      143, 188, 240, 159, 145, 188, 240, 159, 143, 189, 240, 159, 145, 188, 240, 159, 143, 190,
+      240, 159, 145, 188, 240, 159, 143, 191, 240, 159, 142, 133, 240, 159, 142, 133, 240, 159,
+      143, 187, 240, 159, 142, 133, 240, 159, 143, 188, 240, 159, 142, 133, 240, 159, 143, 189,
+      240, 159, 142, 133, 240, 159, 143, 190, 240, 159, 142, 133, 240, 159, 143, 191, 240, 159,
+      164, 182, 240, 159, 164, 182, 240, 159, 143, 187, 240, 159, 164, 182, 240, 159, 143, 188,
+      240, 159, 164, 182, 240, 159, 143, 189, 240, 159, 164, 182, 240, 159, 143, 190, 240, 159,
+      164, 182, 240, 159, 143, 191, 240, 159, 167, 145, 226, 128, 141, 240, 159, 142, 132, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 142, 132, 240, 159, 167, 145,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 142, 132, 240, 159, 167, 145, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 142, 132, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 142, 132, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      142, 132, 240, 159, 166, 184, 240, 159, 166, 184, 240, 159, 143, 187, 240, 159, 166, 184,
+      240, 159, 143, 188, 240, 159, 166, 184, 240, 159, 143, 189, 240, 159, 166, 184, 240, 159,
+      143, 190, 240, 159, 166, 184, 240, 159, 143, 191, 240, 159, 166, 184, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 166, 184, 226, 128, 141, 226, 153, 130, 240, 159, 166,
+      184, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 184,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 166, 184, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 184, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 240, 159, 166, 184, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 166, 184, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      240, 159, 166, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 166, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 166, 184, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 184, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 166, 184, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 166, 184, 226, 128, 141, 226, 153, 128, 240, 159, 166, 184, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 184, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 166, 184, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 184, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 240, 159, 166, 184, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 166, 184, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159,
+      166, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 166,
+      184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 166, 184, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 184, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 240, 159, 166, 185, 240, 159, 166, 185, 240, 159, 143, 187,
+      240, 159, 166, 185, 240, 159, 143, 188, 240, 159, 166, 185, 240, 159, 143, 189, 240, 159,
+      166, 185, 240, 159, 143, 190, 240, 159, 166, 185, 240, 159, 143, 191, 240, 159, 166, 185,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 185, 226, 128, 141, 226, 153,
+      130, 240, 159, 166, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 166, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 166, 185,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 185, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 166, 185, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 166, 185, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 240, 159, 166, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 166, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240,
+      159, 166, 185, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      166, 185, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 166, 185, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 185, 226, 128, 141, 226, 153, 128, 240,
+      159, 166, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      166, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 166, 185, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 185, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 128, 240, 159, 166, 185, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 166, 185, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 128, 240, 159, 166, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 166, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 166,
+      185, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 166, 185,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167, 153, 240, 159, 167, 153,
+      240, 159, 143, 187, 240, 159, 167, 153, 240, 159, 143, 188, 240, 159, 167, 153, 240, 159,
+      143, 189, 240, 159, 167, 153, 240, 159, 143, 190, 240, 159, 167, 153, 240, 159, 143, 191,
+      240, 159, 167, 153, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 153, 226,
+      128, 141, 226, 153, 130, 240, 159, 167, 153, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 167, 153, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      240, 159, 167, 153, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 167, 153, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 167, 153, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 153, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167, 153, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 153, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 153, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 153, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159,
+      167, 153, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 153, 226, 128, 141,
+      226, 153, 128, 240, 159, 167, 153, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 167, 153, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159,
+      167, 153, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167,
+      153, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167, 153, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 153, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 240, 159, 167, 153, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 153, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 153, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 153, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167, 154,
+      240, 159, 167, 154, 240, 159, 143, 187, 240, 159, 167, 154, 240, 159, 143, 188, 240, 159,
+      167, 154, 240, 159, 143, 189, 240, 159, 167, 154, 240, 159, 143, 190, 240, 159, 167, 154,
+      240, 159, 143, 191, 240, 159, 167, 154, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 167, 154, 226, 128, 141, 226, 153, 130, 240, 159, 167, 154, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 240, 159, 167, 154, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240,
+      159, 167, 154, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      167, 154, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167, 154, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 154, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 154, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167,
+      154, 226, 128, 141, 226, 153, 128, 240, 159, 167, 154, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 240, 159, 167, 154, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 167, 154, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167,
+      154, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 154,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 154, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 240, 159, 167, 154, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 167, 154, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 155, 240, 159, 167, 155, 240, 159, 143, 187, 240, 159, 167, 155, 240, 159,
+      143, 188, 240, 159, 167, 155, 240, 159, 143, 189, 240, 159, 167, 155, 240, 159, 143, 190,
+      240, 159, 167, 155, 240, 159, 143, 191, 240, 159, 167, 155, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 167, 155, 226, 128, 141, 226, 153, 130, 240, 159, 167, 155, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 155, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 167, 155, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 155, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 155, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 155, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159,
+      167, 155, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167,
+      155, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 155, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 155, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 240, 159, 167, 155, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 167, 155, 226, 128, 141, 226, 153, 128, 240, 159, 167, 155, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 155, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 240, 159, 167, 155, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 155, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 155, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 155, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 155,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 155, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 167, 155, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 155, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 156, 240, 159, 167, 156, 240, 159, 143, 187, 240, 159,
+      167, 156, 240, 159, 143, 188, 240, 159, 167, 156, 240, 159, 143, 189, 240, 159, 167, 156,
+      240, 159, 143, 190, 240, 159, 167, 156, 240, 159, 143, 191, 240, 159, 167, 156, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 156, 226, 128, 141, 226, 153, 130, 240,
+      159, 167, 156, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      167, 156, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 167, 156, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 156, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 240, 159, 167, 156, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 167, 156, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 156, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 167, 156, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167,
+      156, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 156,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 167, 156, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 156, 226, 128, 141, 226, 153, 128, 240, 159, 167,
+      156, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 156,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 167, 156, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 156, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 128, 240, 159, 167, 156, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 167, 156, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 156, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 167, 156, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 167, 156, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 156, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167, 157, 240, 159, 167, 157, 240, 159,
+      143, 187, 240, 159, 167, 157, 240, 159, 143, 188, 240, 159, 167, 157, 240, 159, 143, 189,
+      240, 159, 167, 157, 240, 159, 143, 190, 240, 159, 167, 157, 240, 159, 143, 191, 240, 159,
+      167, 157, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 157, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 157, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 157, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159,
+      167, 157, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167,
+      157, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 167, 157, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 157, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 240, 159, 167, 157, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 167, 157, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 240, 159, 167, 157, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 167, 157, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 167, 157,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 157, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 157, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 157, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 167, 157,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 157, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167, 157, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 157, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 157, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 167, 157, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240,
+      159, 167, 157, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      167, 157, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 167, 158, 240, 159,
+      167, 158, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 158, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 158, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      167, 158, 226, 128, 141, 226, 153, 128, 240, 159, 167, 159, 240, 159, 167, 159, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 159, 226, 128, 141, 226, 153, 130, 240,
+      159, 167, 159, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 159, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 140, 240, 159, 171, 136, 240, 159, 146, 134, 240, 159,
+      146, 134, 240, 159, 143, 187, 240, 159, 146, 134, 240, 159, 143, 188, 240, 159, 146, 134,
+      240, 159, 143, 189, 240, 159, 146, 134, 240, 159, 143, 190, 240, 159, 146, 134, 240, 159,
+      143, 191, 240, 159, 146, 134, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146,
+      134, 226, 128, 141, 226, 153, 130, 240, 159, 146, 134, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 146, 134, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 240, 159, 146, 134, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 146, 134, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 146,
+      134, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 134,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 146, 134, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 134, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 240, 159, 146, 134, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 146, 134, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      240, 159, 146, 134, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 134, 226,
+      128, 141, 226, 153, 128, 240, 159, 146, 134, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 146, 134, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      240, 159, 146, 134, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 146, 134, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 146, 134, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 134, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 146, 134, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 134, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 240, 159, 146, 134, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 146, 134, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159,
+      146, 135, 240, 159, 146, 135, 240, 159, 143, 187, 240, 159, 146, 135, 240, 159, 143, 188,
+      240, 159, 146, 135, 240, 159, 143, 189, 240, 159, 146, 135, 240, 159, 143, 190, 240, 159,
+      146, 135, 240, 159, 143, 191, 240, 159, 146, 135, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 146, 135, 226, 128, 141, 226, 153, 130, 240, 159, 146, 135, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 240, 159, 146, 135, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      130, 240, 159, 146, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 146, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 146, 135,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 135, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 146, 135, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 130, 240, 159, 146, 135, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 146, 135, 226, 128, 141, 226, 153, 128, 240, 159, 146, 135, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 240, 159, 146, 135, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240,
+      159, 146, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      146, 135, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 146, 135, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 128, 240, 159, 146, 135, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 146, 135, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 240, 159, 154, 182, 240, 159, 154, 182, 240, 159, 143, 187, 240, 159, 154, 182,
+      240, 159, 143, 188, 240, 159, 154, 182, 240, 159, 143, 189, 240, 159, 154, 182, 240, 159,
+      143, 190, 240, 159, 154, 182, 240, 159, 143, 191, 240, 159, 154, 182, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153, 130, 240, 159, 154,
+      182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 182,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 154, 182, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      240, 159, 154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 154, 182, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 182, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 154, 182, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153, 128, 240, 159, 154, 182, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 182, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159,
+      154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154,
+      182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 154, 182, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 240, 159, 154, 182, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 154, 182, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143,
+      187, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 187,
+      226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226, 158,
+      161, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182,
+      240, 159, 143, 190, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240,
+      159, 143, 190, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 191, 226,
+      128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 191, 226, 128,
+      141, 226, 158, 161, 240, 159, 154, 182, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226,
+      128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153, 128,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 226, 128, 141, 226,
+      153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      154, 182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239,
+      184, 143, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 226, 128,
+      141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159,
+      154, 182, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159,
+      154, 182, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161,
+      240, 159, 154, 182, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 154, 182, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 226, 128, 141, 226, 153, 130, 226, 128,
+      141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240,
+      159, 154, 182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128,
+      141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239,
+      184, 143, 240, 159, 154, 182, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 226, 128,
+      141, 226, 158, 161, 239, 184, 143, 240, 159, 154, 182, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 154, 182, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 167, 141,
+      240, 159, 167, 141, 240, 159, 143, 187, 240, 159, 167, 141, 240, 159, 143, 188, 240, 159,
+      167, 141, 240, 159, 143, 189, 240, 159, 167, 141, 240, 159, 143, 190, 240, 159, 167, 141,
+      240, 159, 143, 191, 240, 159, 167, 141, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 167, 141, 226, 128, 141, 226, 153, 130, 240, 159, 167, 141, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 240, 159, 167, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240,
+      159, 167, 141, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      167, 141, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167, 141, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 141, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 141, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167,
+      141, 226, 128, 141, 226, 153, 128, 240, 159, 167, 141, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 240, 159, 167, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 167, 141, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167,
+      141, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 141,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 141, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 240, 159, 167, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 167, 141, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 142, 240, 159, 167, 142, 240, 159, 143, 187, 240, 159, 167, 142, 240, 159,
+      143, 188, 240, 159, 167, 142, 240, 159, 143, 189, 240, 159, 167, 142, 240, 159, 143, 190,
+      240, 159, 167, 142, 240, 159, 143, 191, 240, 159, 167, 142, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 130, 240, 159, 167, 142, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 142, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159,
+      167, 142, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167,
+      142, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 142, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128, 240, 159, 167, 142, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 142,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 142, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 167, 142, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 142, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240,
+      159, 167, 142, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 187, 226,
+      128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128,
+      141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 158, 161, 240,
+      159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159,
+      143, 190, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143,
+      190, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 191, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191, 226, 128, 141, 226,
+      158, 161, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128, 226, 128,
+      141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 226, 128, 141, 226, 153, 128,
+      226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239,
+      184, 143, 240, 159, 167, 142, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 226, 128,
+      141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159,
+      167, 142, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239,
+      184, 143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 167, 142, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128,
+      141, 226, 158, 161, 240, 159, 167, 142, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226,
+      158, 161, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      142, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226,
+      158, 161, 240, 159, 167, 142, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 226, 128,
+      141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240,
+      159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128,
+      141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 142,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      167, 142, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 167, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 167, 142, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 167, 142, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 226, 128,
+      141, 240, 159, 166, 175, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      166, 175, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 175, 240,
+      159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 175, 240, 159, 167, 145,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 175, 240, 159, 167, 145, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 166, 175, 240, 159, 167, 145, 226, 128, 141, 240, 159, 166,
+      175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 226, 128, 141, 240,
+      159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      240, 159, 145, 168, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 168, 240, 159, 143,
+      187, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 166, 175, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159,
+      166, 175, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 175, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 168,
+      226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 175, 240,
+      159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 166, 175, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 166, 175, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      166, 175, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 175, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 175,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 175, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 226, 128,
+      141, 240, 159, 166, 188, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      166, 188, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 188, 240,
+      159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 188, 240, 159, 167, 145,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 188, 240, 159, 167, 145, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 166, 188, 240, 159, 167, 145, 226, 128, 141, 240, 159, 166,
+      188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 226, 128, 141, 240,
+      159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      240, 159, 145, 168, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 168, 240, 159, 143,
+      187, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 166, 188, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159,
+      166, 188, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 188, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 168,
+      226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 188, 240,
+      159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 166, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 166, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      166, 188, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 188, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 188,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 188, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 226, 128,
+      141, 240, 159, 166, 189, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      166, 189, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 189, 240,
+      159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 189, 240, 159, 167, 145,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 189, 240, 159, 167, 145, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 166, 189, 240, 159, 167, 145, 226, 128, 141, 240, 159, 166,
+      189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 226, 128, 141, 240,
+      159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      240, 159, 145, 168, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 168, 240, 159, 143,
+      187, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 166, 189, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159,
+      166, 189, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 189, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 168,
+      226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 168, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 145,
+      168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 189, 240,
+      159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 166, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 166, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      166, 189, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 145, 169, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 166, 189, 226, 128, 141,
+      226, 158, 161, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 166, 189,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 166, 189, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159,
+      143, 131, 240, 159, 143, 187, 240, 159, 143, 131, 240, 159, 143, 188, 240, 159, 143, 131,
+      240, 159, 143, 189, 240, 159, 143, 131, 240, 159, 143, 190, 240, 159, 143, 131, 240, 159,
+      143, 191, 240, 159, 143, 131, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143,
+      131, 226, 128, 141, 226, 153, 130, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 143,
+      131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 131,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 143, 131, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      240, 159, 143, 131, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 131, 226,
+      128, 141, 226, 153, 128, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 143, 131, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 131, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159,
+      143, 131, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 226, 128, 141,
+      226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 158, 161, 239,
+      184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 158, 161, 240, 159,
+      143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143,
+      131, 240, 159, 143, 188, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143,
+      189, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 189,
+      226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226,
+      158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226, 158,
+      161, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143,
+      240, 159, 143, 131, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 143, 131, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226,
+      158, 161, 240, 159, 143, 131, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161,
+      240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226,
+      128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161,
+      240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226,
+      158, 161, 240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143,
+      131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226,
+      158, 161, 240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 226, 128,
+      141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240,
+      159, 143, 131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 128,
+      141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 239, 184,
+      143, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159,
+      143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 226, 128, 141, 226, 158, 161,
+      239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131,
+      226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143,
+      131, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159,
+      143, 131, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158,
+      161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159, 143, 131,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 240, 159,
+      143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141,
+      226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161, 240, 159,
+      143, 131, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161,
+      240, 159, 143, 131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226,
+      128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226, 158, 161,
+      240, 159, 143, 131, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226,
+      158, 161, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143,
+      131, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128, 141, 226,
+      158, 161, 240, 159, 143, 131, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 226, 128,
+      141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240, 159, 143, 131, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 226, 128, 141, 226, 158, 161, 239, 184, 143, 240,
+      159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 128,
+      141, 226, 158, 161, 240, 159, 143, 131, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      226, 128, 141, 226, 158, 161, 240, 159, 167, 145, 226, 128, 141, 240, 159, 169, 176, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 169, 176, 240, 159, 167, 145,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 169, 176, 240, 159, 167, 145, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 169, 176, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 169, 176, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      169, 176, 240, 159, 146, 131, 240, 159, 146, 131, 240, 159, 143, 187, 240, 159, 146, 131,
+      240, 159, 143, 188, 240, 159, 146, 131, 240, 159, 143, 189, 240, 159, 146, 131, 240, 159,
+      143, 190, 240, 159, 146, 131, 240, 159, 143, 191, 240, 159, 149, 186, 240, 159, 149, 186,
+      240, 159, 143, 187, 240, 159, 149, 186, 240, 159, 143, 188, 240, 159, 149, 186, 240, 159,
+      143, 189, 240, 159, 149, 186, 240, 159, 143, 190, 240, 159, 149, 186, 240, 159, 143, 191,
+      240, 159, 149, 180, 239, 184, 143, 240, 159, 149, 180, 240, 159, 149, 180, 240, 159, 143,
+      187, 240, 159, 149, 180, 240, 159, 143, 188, 240, 159, 149, 180, 240, 159, 143, 189, 240,
+      159, 149, 180, 240, 159, 143, 190, 240, 159, 149, 180, 240, 159, 143, 191, 240, 159, 145,
+      175, 240, 159, 145, 175, 240, 159, 143, 187, 240, 159, 145, 175, 240, 159, 143, 188, 240,
+      159, 145, 175, 240, 159, 143, 189, 240, 159, 145, 175, 240, 159, 143, 190, 240, 159, 145,
+      175, 240, 159, 143, 191, 240, 159, 145, 175, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 145, 175, 226, 128, 141, 226, 153, 130, 240, 159, 145, 175, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 240, 159, 145, 175, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      240, 159, 145, 175, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 145, 175, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 145, 175, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 175, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 145, 175, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 240, 159, 145, 175, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      145, 175, 226, 128, 141, 226, 153, 128, 240, 159, 145, 175, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 240, 159, 145, 175, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 145, 175, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159,
+      145, 175, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145,
+      175, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 145, 175, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 240, 159, 145, 175, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 145, 175, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 187, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167,
+      145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143,
+      189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      187, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240,
+      159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167,
+      145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143,
+      191, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240,
+      159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240,
+      159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      190, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 189, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240,
+      159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145,
+      168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240,
+      159, 143, 190, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      191, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145,
+      169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240,
+      159, 143, 187, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      187, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240,
+      159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145,
+      169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240,
+      159, 143, 189, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 144, 176,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143,
+      190, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 144, 176, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226,
+      128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240,
+      159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141,
+      240, 159, 144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 144, 176, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159,
+      144, 176, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 167, 150, 240,
+      159, 167, 150, 240, 159, 143, 187, 240, 159, 167, 150, 240, 159, 143, 188, 240, 159, 167,
+      150, 240, 159, 143, 189, 240, 159, 167, 150, 240, 159, 143, 190, 240, 159, 167, 150, 240,
+      159, 143, 191, 240, 159, 167, 150, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      167, 150, 226, 128, 141, 226, 153, 130, 240, 159, 167, 150, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 240, 159, 167, 150, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 150, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159,
+      167, 150, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167,
+      150, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167, 150, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 240, 159, 167, 150, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 240, 159, 167, 150, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 150,
+      226, 128, 141, 226, 153, 128, 240, 159, 167, 150, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 240, 159, 167, 150, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 150, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 167, 150,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 150, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 150, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 150, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 167, 150, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240,
+      159, 167, 151, 240, 159, 167, 151, 240, 159, 143, 187, 240, 159, 167, 151, 240, 159, 143,
+      188, 240, 159, 167, 151, 240, 159, 143, 189, 240, 159, 167, 151, 240, 159, 143, 190, 240,
+      159, 167, 151, 240, 159, 143, 191, 240, 159, 167, 151, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 167, 151, 226, 128, 141, 226, 153, 130, 240, 159, 167, 151, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 130, 240, 159, 167, 151, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 151, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 167, 151, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 167,
+      151, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 151,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167, 151, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 130, 240, 159, 167, 151, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 167, 151, 226, 128, 141, 226, 153, 128, 240, 159, 167, 151, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 128, 240, 159, 167, 151, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 151, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 167, 151, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 167, 151, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 151, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 167, 151, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 151, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 128, 240, 159, 164, 186, 240, 159, 143, 135, 240, 159, 143, 135, 240, 159, 143,
+      187, 240, 159, 143, 135, 240, 159, 143, 188, 240, 159, 143, 135, 240, 159, 143, 189, 240,
+      159, 143, 135, 240, 159, 143, 190, 240, 159, 143, 135, 240, 159, 143, 191, 226, 155, 183,
+      239, 184, 143, 226, 155, 183, 240, 159, 143, 130, 240, 159, 143, 130, 240, 159, 143, 187,
+      240, 159, 143, 130, 240, 159, 143, 188, 240, 159, 143, 130, 240, 159, 143, 189, 240, 159,
+      143, 130, 240, 159, 143, 190, 240, 159, 143, 130, 240, 159, 143, 191, 240, 159, 143, 140,
+      239, 184, 143, 240, 159, 143, 140, 240, 159, 143, 140, 240, 159, 143, 187, 240, 159, 143,
+      140, 240, 159, 143, 188, 240, 159, 143, 140, 240, 159, 143, 189, 240, 159, 143, 140, 240,
+      159, 143, 190, 240, 159, 143, 140, 240, 159, 143, 191, 240, 159, 143, 140, 239, 184, 143,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 140, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 143, 140, 239, 184, 143, 226, 128, 141, 226, 153, 130, 240,
+      159, 143, 140, 226, 128, 141, 226, 153, 130, 240, 159, 143, 140, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 140, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 240, 159, 143, 140, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 143, 140, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240,
+      159, 143, 140, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      143, 140, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 143, 140, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 140, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 240, 159, 143, 140, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 143, 140, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 240, 159, 143, 140, 239, 184, 143, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 143, 140, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 140, 239,
+      184, 143, 226, 128, 141, 226, 153, 128, 240, 159, 143, 140, 226, 128, 141, 226, 153, 128,
+      240, 159, 143, 140, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 143, 140, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 143, 140, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 140, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 143, 140, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 140, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 128, 240, 159, 143, 140, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 143, 140, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159,
+      143, 140, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143,
+      140, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 143, 132, 240, 159, 143,
+      132, 240, 159, 143, 187, 240, 159, 143, 132, 240, 159, 143, 188, 240, 159, 143, 132, 240,
+      159, 143, 189, 240, 159, 143, 132, 240, 159, 143, 190, 240, 159, 143, 132, 240, 159, 143,
+      191, 240, 159, 143, 132, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 132,
+      226, 128, 141, 226, 153, 130, 240, 159, 143, 132, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 143, 132, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      130, 240, 159, 143, 132, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 143, 132, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 143, 132,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 132, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 143, 132, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 132, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 240, 159, 143, 132, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 143, 132, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240,
+      159, 143, 132, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 132, 226, 128,
+      141, 226, 153, 128, 240, 159, 143, 132, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 143, 132, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240,
+      159, 143, 132, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      143, 132, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 143, 132, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 132, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 128, 240, 159, 143, 132, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 143, 132, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 240, 159, 143, 132, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 143, 132, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 154,
+      163, 240, 159, 154, 163, 240, 159, 143, 187, 240, 159, 154, 163, 240, 159, 143, 188, 240,
+      159, 154, 163, 240, 159, 143, 189, 240, 159, 154, 163, 240, 159, 143, 190, 240, 159, 154,
+      163, 240, 159, 143, 191, 240, 159, 154, 163, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 154, 163, 226, 128, 141, 226, 153, 130, 240, 159, 154, 163, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 240, 159, 154, 163, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      240, 159, 154, 163, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 154, 163, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 154, 163, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 163, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 154, 163, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 240, 159, 154, 163, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      154, 163, 226, 128, 141, 226, 153, 128, 240, 159, 154, 163, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 240, 159, 154, 163, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 154, 163, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159,
+      154, 163, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154,
+      163, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 154, 163, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 240, 159, 154, 163, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 154, 163, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 240, 159, 143, 138, 240, 159, 143, 138, 240, 159, 143, 187, 240, 159, 143, 138, 240,
+      159, 143, 188, 240, 159, 143, 138, 240, 159, 143, 189, 240, 159, 143, 138, 240, 159, 143,
+      190, 240, 159, 143, 138, 240, 159, 143, 191, 240, 159, 143, 138, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 143, 138, 226, 128, 141, 226, 153, 130, 240, 159, 143, 138,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 138, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 143, 138, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 138, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 240, 159, 143, 138, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 143, 138, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240,
+      159, 143, 138, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      143, 138, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 143, 138, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 138, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 240, 159, 143, 138, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 143, 138, 226, 128, 141, 226, 153, 128, 240, 159, 143, 138, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 138, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 240, 159, 143, 138, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 143, 138, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 240, 159, 143, 138, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 143, 138, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 143,
+      138, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 138,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 143, 138, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 138, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 226, 155, 185, 239, 184, 143, 226, 155, 185, 226, 155, 185, 240,
+      159, 143, 187, 226, 155, 185, 240, 159, 143, 188, 226, 155, 185, 240, 159, 143, 189, 226,
+      155, 185, 240, 159, 143, 190, 226, 155, 185, 240, 159, 143, 191, 226, 155, 185, 239, 184,
+      143, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 155, 185, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 226, 155, 185, 239, 184, 143, 226, 128, 141, 226, 153, 130, 226, 155,
+      185, 226, 128, 141, 226, 153, 130, 226, 155, 185, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 226, 155, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      226, 155, 185, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 155,
+      185, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 226, 155, 185, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 155, 185, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 130, 226, 155, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 226, 155, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 226, 155, 185,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 226, 155, 185, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 130, 226, 155, 185, 239, 184, 143, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 226, 155, 185, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226,
+      155, 185, 239, 184, 143, 226, 128, 141, 226, 153, 128, 226, 155, 185, 226, 128, 141, 226,
+      153, 128, 226, 155, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      226, 155, 185, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 226, 155, 185, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 155, 185, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 226, 155, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 226, 155, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 226,
+      155, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 226, 155, 185,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 226, 155, 185, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 226, 155, 185, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 128, 240, 159, 143, 139, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 139,
+      240, 159, 143, 187, 240, 159, 143, 139, 240, 159, 143, 188, 240, 159, 143, 139, 240, 159,
+      143, 189, 240, 159, 143, 139, 240, 159, 143, 190, 240, 159, 143, 139, 240, 159, 143, 191,
+      240, 159, 143, 139, 239, 184, 143, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      143, 139, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 139, 239, 184, 143,
+      226, 128, 141, 226, 153, 130, 240, 159, 143, 139, 226, 128, 141, 226, 153, 130, 240, 159,
+      143, 139, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143,
+      139, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 143, 139, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 130, 240, 159, 143, 139, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      130, 240, 159, 143, 139, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 143, 139, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 143, 139,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 143, 139, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 143, 139, 239, 184, 143, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 139, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 143, 139, 239, 184, 143, 226, 128, 141, 226, 153, 128, 240, 159, 143,
+      139, 226, 128, 141, 226, 153, 128, 240, 159, 143, 139, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 240, 159, 143, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 143, 139, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 143,
+      139, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 139,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 143, 139, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 240, 159, 143, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 143, 139, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      240, 159, 154, 180, 240, 159, 154, 180, 240, 159, 143, 187, 240, 159, 154, 180, 240, 159,
+      143, 188, 240, 159, 154, 180, 240, 159, 143, 189, 240, 159, 154, 180, 240, 159, 143, 190,
+      240, 159, 154, 180, 240, 159, 143, 191, 240, 159, 154, 180, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 154, 180, 226, 128, 141, 226, 153, 130, 240, 159, 154, 180, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 180, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 154, 180, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 180, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 240, 159, 154, 180, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 154, 180, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159,
+      154, 180, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154,
+      180, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 154, 180, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 180, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 240, 159, 154, 180, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 154, 180, 226, 128, 141, 226, 153, 128, 240, 159, 154, 180, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 180, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 240, 159, 154, 180, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 154, 180, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 240, 159, 154, 180, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 154, 180, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 154, 180,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 180, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 154, 180, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 180, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 240, 159, 154, 181, 240, 159, 154, 181, 240, 159, 143, 187, 240, 159,
+      154, 181, 240, 159, 143, 188, 240, 159, 154, 181, 240, 159, 143, 189, 240, 159, 154, 181,
+      240, 159, 143, 190, 240, 159, 154, 181, 240, 159, 143, 191, 240, 159, 154, 181, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 181, 226, 128, 141, 226, 153, 130, 240,
+      159, 154, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      154, 181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 154, 181, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 181, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 240, 159, 154, 181, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 154, 181, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 240, 159, 154, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 154, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 154,
+      181, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 154, 181,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 154, 181, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 154, 181, 226, 128, 141, 226, 153, 128, 240, 159, 154,
+      181, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 181,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 154, 181, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 181, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 128, 240, 159, 154, 181, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 154, 181, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      240, 159, 154, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 154, 181, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 154, 181, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 154, 181, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 164, 184, 240, 159, 164, 184, 240, 159,
+      143, 187, 240, 159, 164, 184, 240, 159, 143, 188, 240, 159, 164, 184, 240, 159, 143, 189,
+      240, 159, 164, 184, 240, 159, 143, 190, 240, 159, 164, 184, 240, 159, 143, 191, 240, 159,
+      164, 184, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 184, 226, 128, 141,
+      226, 153, 130, 240, 159, 164, 184, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 164, 184, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159,
+      164, 184, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164,
+      184, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 184, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 184, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 130, 240, 159, 164, 184, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 130, 239, 184, 143, 240, 159, 164, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      130, 240, 159, 164, 184, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143,
+      240, 159, 164, 184, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 164, 184,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 184, 226, 128, 141, 226, 153,
+      128, 240, 159, 164, 184, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 164, 184, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 164, 184,
+      240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 184, 240,
+      159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164, 184, 240, 159, 143, 189, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 184, 240, 159, 143, 189, 226, 128,
+      141, 226, 153, 128, 240, 159, 164, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128,
+      239, 184, 143, 240, 159, 164, 184, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240,
+      159, 164, 184, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159,
+      164, 184, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 164, 188, 240, 159,
+      164, 188, 240, 159, 143, 187, 240, 159, 164, 188, 240, 159, 143, 188, 240, 159, 164, 188,
+      240, 159, 143, 189, 240, 159, 164, 188, 240, 159, 143, 190, 240, 159, 164, 188, 240, 159,
+      143, 191, 240, 159, 164, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164,
+      188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 188, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 164, 188, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 130, 240, 159, 164, 188, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 164, 188, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164,
+      188, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 188,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 164, 188, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 188, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 130, 240, 159, 164, 188, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 164, 188, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130,
+      240, 159, 164, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 188, 226,
+      128, 141, 226, 153, 128, 240, 159, 164, 188, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 164, 188, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128,
+      240, 159, 164, 188, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 164, 188, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164, 188, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 188, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 164, 188, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 188, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 128, 240, 159, 164, 188, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 164, 188, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159,
+      167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 187, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 188,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159,
+      167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 190,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159,
+      167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187,
+      240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159,
+      145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 191, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 190,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159,
+      145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190,
+      240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159,
+      145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 188, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171,
+      175, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 171, 175, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 171, 175, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 164, 189, 240, 159, 164, 189,
+      240, 159, 143, 187, 240, 159, 164, 189, 240, 159, 143, 188, 240, 159, 164, 189, 240, 159,
+      143, 189, 240, 159, 164, 189, 240, 159, 143, 190, 240, 159, 164, 189, 240, 159, 143, 191,
+      240, 159, 164, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 189, 226,
+      128, 141, 226, 153, 130, 240, 159, 164, 189, 240, 159, 143, 187, 226, 128, 141, 226, 153,
+      130, 239, 184, 143, 240, 159, 164, 189, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130,
+      240, 159, 164, 189, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 164, 189, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240, 159, 164, 189, 240,
+      159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 189, 240, 159,
+      143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 164, 189, 240, 159, 143, 190, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 189, 240, 159, 143, 190, 226, 128, 141,
+      226, 153, 130, 240, 159, 164, 189, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 164, 189, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159,
+      164, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 189, 226, 128, 141,
+      226, 153, 128, 240, 159, 164, 189, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239,
+      184, 143, 240, 159, 164, 189, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159,
+      164, 189, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164,
+      189, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164, 189, 240, 159, 143,
+      189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 189, 240, 159, 143, 189,
+      226, 128, 141, 226, 153, 128, 240, 159, 164, 189, 240, 159, 143, 190, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 164, 189, 240, 159, 143, 190, 226, 128, 141, 226, 153,
+      128, 240, 159, 164, 189, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 164, 189, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 164, 190,
+      240, 159, 164, 190, 240, 159, 143, 187, 240, 159, 164, 190, 240, 159, 143, 188, 240, 159,
+      164, 190, 240, 159, 143, 189, 240, 159, 164, 190, 240, 159, 143, 190, 240, 159, 164, 190,
+      240, 159, 143, 191, 240, 159, 164, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240,
+      159, 164, 190, 226, 128, 141, 226, 153, 130, 240, 159, 164, 190, 240, 159, 143, 187, 226,
+      128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 187, 226, 128,
+      141, 226, 153, 130, 240, 159, 164, 190, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 188, 226, 128, 141, 226, 153, 130, 240,
+      159, 164, 190, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      164, 190, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159, 164, 190, 240, 159,
+      143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143,
+      190, 226, 128, 141, 226, 153, 130, 240, 159, 164, 190, 240, 159, 143, 191, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 191, 226, 128, 141, 226,
+      153, 130, 240, 159, 164, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164,
+      190, 226, 128, 141, 226, 153, 128, 240, 159, 164, 190, 240, 159, 143, 187, 226, 128, 141,
+      226, 153, 128, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 187, 226, 128, 141, 226,
+      153, 128, 240, 159, 164, 190, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 164, 190, 240, 159, 143, 188, 226, 128, 141, 226, 153, 128, 240, 159, 164,
+      190, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 190,
+      240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 164, 190, 240, 159, 143, 190,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 190, 226,
+      128, 141, 226, 153, 128, 240, 159, 164, 190, 240, 159, 143, 191, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 164, 190, 240, 159, 143, 191, 226, 128, 141, 226, 153, 128,
+      240, 159, 164, 185, 240, 159, 164, 185, 240, 159, 143, 187, 240, 159, 164, 185, 240, 159,
+      143, 188, 240, 159, 164, 185, 240, 159, 143, 189, 240, 159, 164, 185, 240, 159, 143, 190,
+      240, 159, 164, 185, 240, 159, 143, 191, 240, 159, 164, 185, 226, 128, 141, 226, 153, 130,
+      239, 184, 143, 240, 159, 164, 185, 226, 128, 141, 226, 153, 130, 240, 159, 164, 185, 240,
+      159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 185, 240, 159,
+      143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 164, 185, 240, 159, 143, 188, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 185, 240, 159, 143, 188, 226, 128, 141,
+      226, 153, 130, 240, 159, 164, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 239,
+      184, 143, 240, 159, 164, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153, 130, 240, 159,
+      164, 185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164,
+      185, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 164, 185, 240, 159, 143,
+      191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 164, 185, 240, 159, 143, 191,
+      226, 128, 141, 226, 153, 130, 240, 159, 164, 185, 226, 128, 141, 226, 153, 128, 239, 184,
+      143, 240, 159, 164, 185, 226, 128, 141, 226, 153, 128, 240, 159, 164, 185, 240, 159, 143,
+      187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 185, 240, 159, 143, 187,
+      226, 128, 141, 226, 153, 128, 240, 159, 164, 185, 240, 159, 143, 188, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 164, 185, 240, 159, 143, 188, 226, 128, 141, 226, 153,
+      128, 240, 159, 164, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 239, 184, 143,
+      240, 159, 164, 185, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128, 240, 159, 164, 185,
+      240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 185, 240,
+      159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 164, 185, 240, 159, 143, 191, 226,
+      128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 164, 185, 240, 159, 143, 191, 226, 128,
+      141, 226, 153, 128, 240, 159, 167, 152, 240, 159, 167, 152, 240, 159, 143, 187, 240, 159,
+      167, 152, 240, 159, 143, 188, 240, 159, 167, 152, 240, 159, 143, 189, 240, 159, 167, 152,
+      240, 159, 143, 190, 240, 159, 167, 152, 240, 159, 143, 191, 240, 159, 167, 152, 226, 128,
+      141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 152, 226, 128, 141, 226, 153, 130, 240,
+      159, 167, 152, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159,
+      167, 152, 240, 159, 143, 187, 226, 128, 141, 226, 153, 130, 240, 159, 167, 152, 240, 159,
+      143, 188, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 152, 240, 159, 143,
+      188, 226, 128, 141, 226, 153, 130, 240, 159, 167, 152, 240, 159, 143, 189, 226, 128, 141,
+      226, 153, 130, 239, 184, 143, 240, 159, 167, 152, 240, 159, 143, 189, 226, 128, 141, 226,
+      153, 130, 240, 159, 167, 152, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 239, 184,
+      143, 240, 159, 167, 152, 240, 159, 143, 190, 226, 128, 141, 226, 153, 130, 240, 159, 167,
+      152, 240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 239, 184, 143, 240, 159, 167, 152,
+      240, 159, 143, 191, 226, 128, 141, 226, 153, 130, 240, 159, 167, 152, 226, 128, 141, 226,
+      153, 128, 239, 184, 143, 240, 159, 167, 152, 226, 128, 141, 226, 153, 128, 240, 159, 167,
+      152, 240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 152,
+      240, 159, 143, 187, 226, 128, 141, 226, 153, 128, 240, 159, 167, 152, 240, 159, 143, 188,
+      226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 152, 240, 159, 143, 188, 226,
+      128, 141, 226, 153, 128, 240, 159, 167, 152, 240, 159, 143, 189, 226, 128, 141, 226, 153,
+      128, 239, 184, 143, 240, 159, 167, 152, 240, 159, 143, 189, 226, 128, 141, 226, 153, 128,
+      240, 159, 167, 152, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240,
+      159, 167, 152, 240, 159, 143, 190, 226, 128, 141, 226, 153, 128, 240, 159, 167, 152, 240,
+      159, 143, 191, 226, 128, 141, 226, 153, 128, 239, 184, 143, 240, 159, 167, 152, 240, 159,
+      143, 191, 226, 128, 141, 226, 153, 128, 240, 159, 155, 128, 240, 159, 155, 128, 240, 159,
+      143, 187, 240, 159, 155, 128, 240, 159, 143, 188, 240, 159, 155, 128, 240, 159, 143, 189,
+      240, 159, 155, 128, 240, 159, 143, 190, 240, 159, 155, 128, 240, 159, 143, 191, 240, 159,
+      155, 140, 240, 159, 155, 140, 240, 159, 143, 187, 240, 159, 155, 140, 240, 159, 143, 188,
+      240, 159, 155, 140, 240, 159, 143, 189, 240, 159, 155, 140, 240, 159, 143, 190, 240, 159,
+      155, 140, 240, 159, 143, 191, 240, 159, 167, 145, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 188,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187,
+      240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159,
+      167, 145, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 189, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191,
+      240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159,
+      167, 145, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 145, 173, 240, 159, 145, 173, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189,
+      240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159,
+      145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 187, 240, 159, 145, 173, 240, 159, 143, 188, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188,
+      240, 159, 145, 173, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 173, 240, 159,
+      143, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187,
+      240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 190, 240, 159, 145, 173, 240, 159, 143, 191, 240, 159, 145, 171,
+      240, 159, 145, 171, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 171, 240, 159,
+      143, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 188, 240, 159, 145, 171, 240, 159, 143, 189, 240, 159, 145, 169,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189,
+      240, 159, 145, 171, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159,
+      145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 171, 240, 159,
+      143, 191, 240, 159, 145, 172, 240, 159, 145, 172, 240, 159, 143, 187, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159,
+      143, 187, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187,
+      240, 159, 145, 172, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159,
+      145, 168, 240, 159, 143, 188, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 240,
+      159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168,
+      240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 172, 240, 159,
+      143, 189, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 189,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128,
+      141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159,
+      145, 168, 240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 189, 240, 159, 145, 172, 240, 159, 143, 190, 240, 159, 145, 168,
+      240, 159, 143, 190, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164,
+      157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159,
+      143, 191, 226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 188, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 240, 159, 164, 157, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 191,
+      226, 128, 141, 240, 159, 164, 157, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190,
+      240, 159, 145, 172, 240, 159, 143, 191, 240, 159, 146, 143, 240, 159, 146, 143, 240, 159,
+      143, 187, 240, 159, 146, 143, 240, 159, 143, 188, 240, 159, 146, 143, 240, 159, 143, 189,
+      240, 159, 146, 143, 240, 159, 143, 190, 240, 159, 146, 143, 240, 159, 143, 191, 240, 159,
+      167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143,
+      187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 187,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240,
+      159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 188, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240,
+      159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159,
+      167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159,
+      143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143,
+      189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      190, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167,
+      145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145,
+      240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 190,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 190, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188,
+      240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240,
+      159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159,
+      167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167,
+      145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143,
+      191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 191,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 190, 240, 159, 145, 169, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 145,
+      169, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143,
+      187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191,
+      240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240,
+      159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159,
+      145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169,
+      240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145,
+      169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189,
+      240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240,
+      159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 191, 240, 159, 145, 168, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 145, 168, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187,
+      240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168,
+      240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240,
+      159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 187, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240,
+      159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159,
+      145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      189, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145,
+      168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 188, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187,
+      240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240,
+      159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240,
+      159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159,
+      143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 191, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159,
+      145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145,
+      168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 190,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      189, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168,
+      240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159,
+      145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159,
+      143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143,
+      191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 191, 240, 159, 145, 169, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 145, 169, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159,
+      143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143,
+      187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145,
+      169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240,
+      159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240,
+      159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159,
+      145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      190, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191,
+      240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169,
+      240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146,
+      139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145,
+      169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 146, 139, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191,
+      240, 159, 146, 145, 240, 159, 146, 145, 240, 159, 143, 187, 240, 159, 146, 145, 240, 159,
+      143, 188, 240, 159, 146, 145, 240, 159, 143, 189, 240, 159, 146, 145, 240, 159, 143, 190,
+      240, 159, 146, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188,
+      240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240,
+      159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159,
+      167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 187, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167,
+      145, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240,
+      159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 189, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      190, 240, 159, 167, 145, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143,
+      188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191,
+      240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 189,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240,
+      159, 167, 145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 189, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159,
+      167, 145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240, 159, 167,
+      145, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145,
+      240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167,
+      145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145,
+      240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143,
+      190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240,
+      159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 167, 145, 240, 159, 143, 191, 240, 159, 167, 145, 240, 159, 143, 191,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159,
+      143, 187, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 167, 145, 240, 159, 143, 187, 240, 159, 167, 145, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143,
+      188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 167, 145, 240, 159, 143, 188, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 189,
+      240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 167, 145, 240, 159, 143, 189, 240, 159, 167, 145, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 167, 145, 240, 159, 143, 190, 240,
+      159, 167, 145, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      167, 145, 240, 159, 143, 190, 240, 159, 145, 169, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 145, 169, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240,
+      159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159,
+      145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145,
+      169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169,
+      240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240,
+      159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      187, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143,
+      188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240,
+      159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 188, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159,
+      145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145,
+      169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169,
+      240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240,
+      159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159,
+      143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 190,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189,
+      240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240,
+      159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145,
+      169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 169,
+      240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 169, 240,
+      159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      190, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191,
+      240, 159, 145, 168, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 145, 168, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143,
+      187, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187,
+      240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 187,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240,
+      159, 145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 187, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159,
+      145, 168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145,
+      168, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 187, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240,
+      159, 143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159,
+      143, 188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143,
+      188, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 188,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 191, 240, 159, 145, 168, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 189, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      187, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188,
+      240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240,
+      159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159,
+      145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 189, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145,
+      168, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168,
+      240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168,
+      240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240,
+      159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159,
+      143, 188, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143,
+      189, 240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143,
+      190, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190,
+      240, 159, 145, 168, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 190,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240,
+      159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159, 145, 168, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 187, 240, 159,
+      145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 188, 240, 159, 145,
+      168, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 189, 240, 159, 145, 168,
+      240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 190, 240, 159, 145, 168, 240,
+      159, 143, 191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145,
+      168, 240, 159, 143, 191, 240, 159, 145, 168, 240, 159, 143, 191, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 145, 168, 240, 159, 143, 191, 240, 159, 145, 169, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 145, 169,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 145, 169, 240,
+      159, 143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159,
+      143, 187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143,
+      187, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 187,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 187, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      191, 240, 159, 145, 169, 240, 159, 143, 187, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187,
+      240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240,
+      159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226,
+      157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159,
+      145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157,
+      164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145,
+      169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 188, 226, 128, 141, 226, 157, 164,
+      239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169,
+      240, 159, 143, 188, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239,
+      184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240,
+      159, 143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 187, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184,
+      143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159,
+      143, 189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      188, 240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143,
+      189, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189,
+      240, 159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 189,
+      226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240,
+      159, 145, 169, 240, 159, 143, 189, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 189, 226,
+      128, 141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159,
+      145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128,
+      141, 226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145,
+      169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141,
+      226, 157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169,
+      240, 159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226,
+      157, 164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240,
+      159, 143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145,
+      169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157,
+      164, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159,
+      143, 190, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169,
+      240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143, 190, 226, 128, 141, 226, 157, 164,
+      226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240, 159, 145, 169, 240, 159, 143,
+      191, 226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240,
+      159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226,
+      128, 141, 240, 159, 145, 169, 240, 159, 143, 187, 240, 159, 145, 169, 240, 159, 143, 191,
+      226, 128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159,
+      143, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128,
+      141, 240, 159, 145, 169, 240, 159, 143, 188, 240, 159, 145, 169, 240, 159, 143, 191, 226,
+      128, 141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143,
+      189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141,
+      240, 159, 145, 169, 240, 159, 143, 189, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128,
+      141, 226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 190,
+      240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240,
+      159, 145, 169, 240, 159, 143, 190, 240, 159, 145, 169, 240, 159, 143, 191, 226, 128, 141,
+      226, 157, 164, 239, 184, 143, 226, 128, 141, 240, 159, 145, 169, 240, 159, 143, 191, 240,
+      159, 145, 169, 240, 159, 143, 191, 226, 128, 141, 226, 157, 164, 226, 128, 141, 240, 159,
+      145, 169, 240, 159, 143, 191, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 169, 226,
+      128, 141, 240, 159, 145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 169, 226,
+      128, 141, 240, 159, 145, 167, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 169, 226,
+      128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 168, 226,
+      128, 141, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 166, 226, 128, 141, 240, 159,
+      145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 169, 226, 128, 141, 240, 159,
+      145, 167, 226, 128, 141, 240, 159, 145, 167, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 145, 167, 240, 159, 145, 168, 226, 128, 141, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145, 166, 240, 159,
+      145, 168, 226, 128, 141, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 166, 226, 128,
+      141, 240, 159, 145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 168, 226, 128,
+      141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145, 167, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 167, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145,
+      166, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145,
+      166, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145,
+      169, 226, 128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145, 167, 240, 159, 145,
+      168, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145,
+      166, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145,
+      167, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145,
+      166, 240, 159, 145, 168, 226, 128, 141, 240, 159, 145, 167, 226, 128, 141, 240, 159, 145,
+      167, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 145, 166, 226, 128, 141, 240, 159, 145, 166, 240, 159, 145, 169, 226, 128,
+      141, 240, 159, 145, 167, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 167, 226, 128,
+      141, 240, 159, 145, 166, 240, 159, 145, 169, 226, 128, 141, 240, 159, 145, 167, 226, 128,
+      141, 240, 159, 145, 167, 240, 159, 151, 163, 239, 184, 143, 240, 159, 151, 163, 240, 159,
+      145, 164, 240, 159, 145, 165, 240, 159, 171, 130, 240, 159, 145, 170, 240, 159, 167, 145,
+      226, 128, 141, 240, 159, 167, 145, 226, 128, 141, 240, 159, 167, 146, 240, 159, 167, 145,
+      226, 128, 141, 240, 159, 167, 145, 226, 128, 141, 240, 159, 167, 146, 226, 128, 141, 240,
+      159, 167, 146, 240, 159, 167, 145, 226, 128, 141, 240, 159, 167, 146, 240, 159, 167, 145,
+      226, 128, 141, 240, 159, 167, 146, 226, 128, 141, 240, 159, 167, 146, 240, 159, 145, 163,
+      240, 159, 171, 134, 240, 159, 143, 187, 240, 159, 143, 188, 240, 159, 143, 189, 240, 159,
+      143, 190, 240, 159, 143, 191, 240, 159, 166, 176, 240, 159, 166, 177, 240, 159, 166, 179,
+      240, 159, 166, 178, 240, 159, 144, 181, 240, 159, 144, 146, 240, 159, 166, 141, 240, 159,
+      166, 167, 240, 159, 144, 182, 240, 159, 144, 149, 240, 159, 166, 174, 240, 159, 144, 149,
+      226, 128, 141, 240, 159, 166, 186, 240, 159, 144, 169, 240, 159, 144, 186, 240, 159, 166,
+      138, 240, 159, 166, 157, 240, 159, 144, 177, 240, 159, 144, 136, 240, 159, 144, 136, 226,
+      128, 141, 226, 172, 155, 240, 159, 166, 129, 240, 159, 144, 175, 240, 159, 144, 133, 240,
+      159, 144, 134, 240, 159, 144, 180, 240, 159, 171, 142, 240, 159, 171, 143, 240, 159, 144,
+      142, 240, 159, 166, 132, 240, 159, 166, 147, 240, 159, 166, 140, 240, 159, 166, 172, 240,
+      159, 144, 174, 240, 159, 144, 130, 240, 159, 144, 131, 240, 159, 144, 132, 240, 159, 144,
+      183, 240, 159, 144, 150, 240, 159, 144, 151, 240, 159, 144, 189, 240, 159, 144, 143, 240,
+      159, 144, 145, 240, 159, 144, 144, 240, 159, 144, 170, 240, 159, 144, 171, 240, 159, 166,
+      153, 240, 159, 166, 146, 240, 159, 144, 152, 240, 159, 166, 163, 240, 159, 166, 143, 240,
+      159, 166, 155, 240, 159, 144, 173, 240, 159, 144, 129, 240, 159, 144, 128, 240, 159, 144,
+      185, 240, 159, 144, 176, 240, 159, 144, 135, 240, 159, 144, 191, 239, 184, 143, 240, 159,
+      144, 191, 240, 159, 166, 171, 240, 159, 166, 148, 240, 159, 166, 135, 240, 159, 144, 187,
+      240, 159, 144, 187, 226, 128, 141, 226, 157, 132, 239, 184, 143, 240, 159, 144, 187, 226,
+      128, 141, 226, 157, 132, 240, 159, 144, 168, 240, 159, 144, 188, 240, 159, 166, 165, 240,
+      159, 166, 166, 240, 159, 166, 168, 240, 159, 166, 152, 240, 159, 166, 161, 240, 159, 144,
+      190, 240, 159, 166, 131, 240, 159, 144, 148, 240, 159, 144, 147, 240, 159, 144, 163, 240,
+      159, 144, 164, 240, 159, 144, 165, 240, 159, 144, 166, 240, 159, 144, 167, 240, 159, 149,
+      138, 239, 184, 143, 240, 159, 149, 138, 240, 159, 166, 133, 240, 159, 166, 134, 240, 159,
+      166, 162, 240, 159, 166, 137, 240, 159, 166, 164, 240, 159, 170, 182, 240, 159, 166, 169,
+      240, 159, 166, 154, 240, 159, 166, 156, 240, 159, 170, 189, 240, 159, 144, 166, 226, 128,
+      141, 226, 172, 155, 240, 159, 170, 191, 240, 159, 144, 166, 226, 128, 141, 240, 159, 148,
+      165, 240, 159, 144, 184, 240, 159, 144, 138, 240, 159, 144, 162, 240, 159, 166, 142, 240,
+      159, 144, 141, 240, 159, 144, 178, 240, 159, 144, 137, 240, 159, 166, 149, 240, 159, 166,
+      150, 240, 159, 144, 179, 240, 159, 144, 139, 240, 159, 144, 172, 240, 159, 171, 141, 240,
+      159, 166, 173, 240, 159, 144, 159, 240, 159, 144, 160, 240, 159, 144, 161, 240, 159, 166,
+      136, 240, 159, 144, 153, 240, 159, 144, 154, 240, 159, 170, 184, 240, 159, 170, 188, 240,
+      159, 166, 128, 240, 159, 166, 158, 240, 159, 166, 144, 240, 159, 166, 145, 240, 159, 166,
+      170, 240, 159, 144, 140, 240, 159, 166, 139, 240, 159, 144, 155, 240, 159, 144, 156, 240,
+      159, 144, 157, 240, 159, 170, 178, 240, 159, 144, 158, 240, 159, 166, 151, 240, 159, 170,
+      179, 240, 159, 149, 183, 239, 184, 143, 240, 159, 149, 183, 240, 159, 149, 184, 239, 184,
+      143, 240, 159, 149, 184, 240, 159, 166, 130, 240, 159, 166, 159, 240, 159, 170, 176, 240,
+      159, 170, 177, 240, 159, 166, 160, 240, 159, 146, 144, 240, 159, 140, 184, 240, 159, 146,
+      174, 240, 159, 170, 183, 240, 159, 143, 181, 239, 184, 143, 240, 159, 143, 181, 240, 159,
+      140, 185, 240, 159, 165, 128, 240, 159, 140, 186, 240, 159, 140, 187, 240, 159, 140, 188,
+      240, 159, 140, 183, 240, 159, 170, 187, 240, 159, 140, 177, 240, 159, 170, 180, 240, 159,
+      140, 178, 240, 159, 140, 179, 240, 159, 140, 180, 240, 159, 140, 181, 240, 159, 140, 190,
+      240, 159, 140, 191, 226, 152, 152, 239, 184, 143, 226, 152, 152, 240, 159, 141, 128, 240,
+      159, 141, 129, 240, 159, 141, 130, 240, 159, 141, 131, 240, 159, 170, 185, 240, 159, 170,
+      186, 240, 159, 141, 132, 240, 159, 170, 190, 240, 159, 141, 135, 240, 159, 141, 136, 240,
+      159, 141, 137, 240, 159, 141, 138, 240, 159, 141, 139, 240, 159, 141, 139, 226, 128, 141,
+      240, 159, 159, 169, 240, 159, 141, 140, 240, 159, 141, 141, 240, 159, 165, 173, 240, 159,
+      141, 142, 240, 159, 171, 157, 240, 159, 141, 143, 240, 159, 141, 144, 240, 159, 141, 145,
+      240, 159, 141, 146, 240, 159, 141, 147, 240, 159, 171, 144, 240, 159, 165, 157, 240, 159,
+      141, 133, 240, 159, 171, 146, 240, 159, 165, 165, 240, 159, 165, 145, 240, 159, 141, 134,
+      240, 159, 165, 148, 240, 159, 165, 149, 240, 159, 140, 189, 240, 159, 140, 182, 239, 184,
+      143, 240, 159, 140, 182, 240, 159, 171, 145, 240, 159, 165, 146, 240, 159, 165, 172, 240,
+      159, 165, 166, 240, 159, 167, 132, 240, 159, 167, 133, 240, 159, 165, 156, 240, 159, 171,
+      152, 240, 159, 140, 176, 240, 159, 171, 154, 240, 159, 171, 155, 240, 159, 141, 132, 226,
+      128, 141, 240, 159, 159, 171, 240, 159, 171, 156, 240, 159, 141, 158, 240, 159, 165, 144,
+      240, 159, 165, 150, 240, 159, 171, 147, 240, 159, 165, 168, 240, 159, 165, 175, 240, 159,
+      165, 158, 240, 159, 167, 135, 240, 159, 167, 128, 240, 159, 141, 150, 240, 159, 141, 151,
+      240, 159, 165, 169, 240, 159, 165, 147, 240, 159, 141, 148, 240, 159, 141, 159, 240, 159,
+      141, 149, 240, 159, 140, 173, 240, 159, 165, 170, 240, 159, 140, 174, 240, 159, 140, 175,
+      240, 159, 171, 148, 240, 159, 165, 153, 240, 159, 167, 134, 240, 159, 165, 154, 240, 159,
+      141, 179, 240, 159, 165, 152, 240, 159, 141, 178, 240, 159, 171, 149, 240, 159, 165, 163,
+      240, 159, 165, 151, 240, 159, 141, 191, 240, 159, 167, 136, 240, 159, 167, 130, 240, 159,
+      165, 171, 240, 159, 141, 177, 240, 159, 141, 152, 240, 159, 141, 153, 240, 159, 141, 154,
+      240, 159, 141, 155, 240, 159, 141, 156, 240, 159, 141, 157, 240, 159, 141, 160, 240, 159,
+      141, 162, 240, 159, 141, 163, 240, 159, 141, 164, 240, 159, 141, 165, 240, 159, 165, 174,
+      240, 159, 141, 161, 240, 159, 165, 159, 240, 159, 165, 160, 240, 159, 165, 161, 240, 159,
+      141, 166, 240, 159, 141, 167, 240, 159, 141, 168, 240, 159, 141, 169, 240, 159, 141, 170,
+      240, 159, 142, 130, 240, 159, 141, 176, 240, 159, 167, 129, 240, 159, 165, 167, 240, 159,
+      141, 171, 240, 159, 141, 172, 240, 159, 141, 173, 240, 159, 141, 174, 240, 159, 141, 175,
+      240, 159, 141, 188, 240, 159, 165, 155, 226, 152, 149, 240, 159, 171, 150, 240, 159, 141,
+      181, 240, 159, 141, 182, 240, 159, 141, 190, 240, 159, 141, 183, 240, 159, 141, 184, 240,
+      159, 141, 185, 240, 159, 141, 186, 240, 159, 141, 187, 240, 159, 165, 130, 240, 159, 165,
+      131, 240, 159, 171, 151, 240, 159, 165, 164, 240, 159, 167, 139, 240, 159, 167, 131, 240,
+      159, 167, 137, 240, 159, 167, 138, 240, 159, 165, 162, 240, 159, 141, 189, 239, 184, 143,
+      240, 159, 141, 189, 240, 159, 141, 180, 240, 159, 165, 132, 240, 159, 148, 170, 240, 159,
+      171, 153, 240, 159, 143, 186, 240, 159, 140, 141, 240, 159, 140, 142, 240, 159, 140, 143,
+      240, 159, 140, 144, 240, 159, 151, 186, 239, 184, 143, 240, 159, 151, 186, 240, 159, 151,
+      190, 240, 159, 167, 173, 240, 159, 143, 148, 239, 184, 143, 240, 159, 143, 148, 226, 155,
+      176, 239, 184, 143, 226, 155, 176, 240, 159, 155, 152, 240, 159, 140, 139, 240, 159, 151,
+      187, 240, 159, 143, 149, 239, 184, 143, 240, 159, 143, 149, 240, 159, 143, 150, 239, 184,
+      143, 240, 159, 143, 150, 240, 159, 143, 156, 239, 184, 143, 240, 159, 143, 156, 240, 159,
+      143, 157, 239, 184, 143, 240, 159, 143, 157, 240, 159, 143, 158, 239, 184, 143, 240, 159,
+      143, 158, 240, 159, 143, 159, 239, 184, 143, 240, 159, 143, 159, 240, 159, 143, 155, 239,
+      184, 143, 240, 159, 143, 155, 240, 159, 143, 151, 239, 184, 143, 240, 159, 143, 151, 240,
+      159, 167, 177, 240, 159, 170, 168, 240, 159, 170, 181, 240, 159, 155, 150, 240, 159, 143,
+      152, 239, 184, 143, 240, 159, 143, 152, 240, 159, 143, 154, 239, 184, 143, 240, 159, 143,
+      154, 240, 159, 143, 160, 240, 159, 143, 161, 240, 159, 143, 162, 240, 159, 143, 163, 240,
+      159, 143, 164, 240, 159, 143, 165, 240, 159, 143, 166, 240, 159, 143, 168, 240, 159, 143,
+      169, 240, 159, 143, 170, 240, 159, 143, 171, 240, 159, 143, 172, 240, 159, 143, 173, 240,
+      159, 143, 175, 240, 159, 143, 176, 240, 159, 146, 146, 240, 159, 151, 188, 240, 159, 151,
+      189, 226, 155, 170, 240, 159, 149, 140, 240, 159, 155, 149, 240, 159, 149, 141, 226, 155,
+      169, 239, 184, 143, 226, 155, 169, 240, 159, 149, 139, 226, 155, 178, 226, 155, 186, 240,
+      159, 140, 129, 240, 159, 140, 131, 240, 159, 143, 153, 239, 184, 143, 240, 159, 143, 153,
+      240, 159, 140, 132, 240, 159, 140, 133, 240, 159, 140, 134, 240, 159, 140, 135, 240, 159,
+      140, 137, 226, 153, 168, 239, 184, 143, 226, 153, 168, 240, 159, 142, 160, 240, 159, 155,
+      157, 240, 159, 142, 161, 240, 159, 142, 162, 240, 159, 146, 136, 240, 159, 142, 170, 240,
+      159, 154, 130, 240, 159, 154, 131, 240, 159, 154, 132, 240, 159, 154, 133, 240, 159, 154,
+      134, 240, 159, 154, 135, 240, 159, 154, 136, 240, 159, 154, 137, 240, 159, 154, 138, 240,
+      159, 154, 157, 240, 159, 154, 158, 240, 159, 154, 139, 240, 159, 154, 140, 240, 159, 154,
+      141, 240, 159, 154, 142, 240, 159, 154, 144, 240, 159, 154, 145, 240, 159, 154, 146, 240,
+      159, 154, 147, 240, 159, 154, 148, 240, 159, 154, 149, 240, 159, 154, 150, 240, 159, 154,
+      151, 240, 159, 154, 152, 240, 159, 154, 153, 240, 159, 155, 187, 240, 159, 154, 154, 240,
+      159, 154, 155, 240, 159, 154, 156, 240, 159, 143, 142, 239, 184, 143, 240, 159, 143, 142,
+      240, 159, 143, 141, 239, 184, 143, 240, 159, 143, 141, 240, 159, 155, 181, 240, 159, 166,
+      189, 240, 159, 166, 188, 240, 159, 155, 186, 240, 159, 154, 178, 240, 159, 155, 180, 240,
+      159, 155, 185, 240, 159, 155, 188, 240, 159, 154, 143, 240, 159, 155, 163, 239, 184, 143,
+      240, 159, 155, 163, 240, 159, 155, 164, 239, 184, 143, 240, 159, 155, 164, 240, 159, 155,
+      162, 239, 184, 143, 240, 159, 155, 162, 226, 155, 189, 240, 159, 155, 158, 240, 159, 154,
+      168, 240, 159, 154, 165, 240, 159, 154, 166, 240, 159, 155, 145, 240, 159, 154, 167, 226,
+      154, 147, 240, 159, 155, 159, 226, 155, 181, 240, 159, 155, 182, 240, 159, 154, 164, 240,
+      159, 155, 179, 239, 184, 143, 240, 159, 155, 179, 226, 155, 180, 239, 184, 143, 226, 155,
+      180, 240, 159, 155, 165, 239, 184, 143, 240, 159, 155, 165, 240, 159, 154, 162, 226, 156,
+      136, 239, 184, 143, 226, 156, 136, 240, 159, 155, 169, 239, 184, 143, 240, 159, 155, 169,
+      240, 159, 155, 171, 240, 159, 155, 172, 240, 159, 170, 130, 240, 159, 146, 186, 240, 159,
+      154, 129, 240, 159, 154, 159, 240, 159, 154, 160, 240, 159, 154, 161, 240, 159, 155, 176,
+      239, 184, 143, 240, 159, 155, 176, 240, 159, 154, 128, 240, 159, 155, 184, 240, 159, 155,
+      142, 239, 184, 143, 240, 159, 155, 142, 240, 159, 167, 179, 226, 140, 155, 226, 143, 179,
+      226, 140, 154, 226, 143, 176, 226, 143, 177, 239, 184, 143, 226, 143, 177, 226, 143, 178,
+      239, 184, 143, 226, 143, 178, 240, 159, 149, 176, 239, 184, 143, 240, 159, 149, 176, 240,
+      159, 149, 155, 240, 159, 149, 167, 240, 159, 149, 144, 240, 159, 149, 156, 240, 159, 149,
+      145, 240, 159, 149, 157, 240, 159, 149, 146, 240, 159, 149, 158, 240, 159, 149, 147, 240,
+      159, 149, 159, 240, 159, 149, 148, 240, 159, 149, 160, 240, 159, 149, 149, 240, 159, 149,
+      161, 240, 159, 149, 150, 240, 159, 149, 162, 240, 159, 149, 151, 240, 159, 149, 163, 240,
+      159, 149, 152, 240, 159, 149, 164, 240, 159, 149, 153, 240, 159, 149, 165, 240, 159, 149,
+      154, 240, 159, 149, 166, 240, 159, 140, 145, 240, 159, 140, 146, 240, 159, 140, 147, 240,
+      159, 140, 148, 240, 159, 140, 149, 240, 159, 140, 150, 240, 159, 140, 151, 240, 159, 140,
+      152, 240, 159, 140, 153, 240, 159, 140, 154, 240, 159, 140, 155, 240, 159, 140, 156, 240,
+      159, 140, 161, 239, 184, 143, 240, 159, 140, 161, 226, 152, 128, 239, 184, 143, 226, 152,
+      128, 240, 159, 140, 157, 240, 159, 140, 158, 240, 159, 170, 144, 226, 173, 144, 240, 159,
+      140, 159, 240, 159, 140, 160, 240, 159, 140, 140, 226, 152, 129, 239, 184, 143, 226, 152,
+      129, 226, 155, 133, 226, 155, 136, 239, 184, 143, 226, 155, 136, 240, 159, 140, 164, 239,
+      184, 143, 240, 159, 140, 164, 240, 159, 140, 165, 239, 184, 143, 240, 159, 140, 165, 240,
+      159, 140, 166, 239, 184, 143, 240, 159, 140, 166, 240, 159, 140, 167, 239, 184, 143, 240,
+      159, 140, 167, 240, 159, 140, 168, 239, 184, 143, 240, 159, 140, 168, 240, 159, 140, 169,
+      239, 184, 143, 240, 159, 140, 169, 240, 159, 140, 170, 239, 184, 143, 240, 159, 140, 170,
+      240, 159, 140, 171, 239, 184, 143, 240, 159, 140, 171, 240, 159, 140, 172, 239, 184, 143,
+      240, 159, 140, 172, 240, 159, 140, 128, 240, 159, 140, 136, 240, 159, 140, 130, 226, 152,
+      130, 239, 184, 143, 226, 152, 130, 226, 152, 148, 226, 155, 177, 239, 184, 143, 226, 155,
+      177, 226, 154, 161, 226, 157, 132, 239, 184, 143, 226, 157, 132, 226, 152, 131, 239, 184,
+      143, 226, 152, 131, 226, 155, 132, 226, 152, 132, 239, 184, 143, 226, 152, 132, 240, 159,
+      148, 165, 240, 159, 146, 167, 240, 159, 140, 138, 240, 159, 142, 131, 240, 159, 142, 132,
+      240, 159, 142, 134, 240, 159, 142, 135, 240, 159, 167, 168, 226, 156, 168, 240, 159, 142,
+      136, 240, 159, 142, 137, 240, 159, 142, 138, 240, 159, 142, 139, 240, 159, 142, 141, 240,
+      159, 142, 142, 240, 159, 142, 143, 240, 159, 142, 144, 240, 159, 142, 145, 240, 159, 167,
+      167, 240, 159, 142, 128, 240, 159, 142, 129, 240, 159, 142, 151, 239, 184, 143, 240, 159,
+      142, 151, 240, 159, 142, 159, 239, 184, 143, 240, 159, 142, 159, 240, 159, 142, 171, 240,
+      159, 142, 150, 239, 184, 143, 240, 159, 142, 150, 240, 159, 143, 134, 240, 159, 143, 133,
+      240, 159, 165, 135, 240, 159, 165, 136, 240, 159, 165, 137, 226, 154, 189, 226, 154, 190,
+      240, 159, 165, 142, 240, 159, 143, 128, 240, 159, 143, 144, 240, 159, 143, 136, 240, 159,
+      143, 137, 240, 159, 142, 190, 240, 159, 165, 143, 240, 159, 142, 179, 240, 159, 143, 143,
+      240, 159, 143, 145, 240, 159, 143, 146, 240, 159, 165, 141, 240, 159, 143, 147, 240, 159,
+      143, 184, 240, 159, 165, 138, 240, 159, 165, 139, 240, 159, 165, 133, 226, 155, 179, 226,
+      155, 184, 239, 184, 143, 226, 155, 184, 240, 159, 142, 163, 240, 159, 164, 191, 240, 159,
+      142, 189, 240, 159, 142, 191, 240, 159, 155, 183, 240, 159, 165, 140, 240, 159, 142, 175,
+      240, 159, 170, 128, 240, 159, 170, 129, 240, 159, 148, 171, 240, 159, 142, 177, 240, 159,
+      148, 174, 240, 159, 170, 132, 240, 159, 142, 174, 240, 159, 149, 185, 239, 184, 143, 240,
+      159, 149, 185, 240, 159, 142, 176, 240, 159, 142, 178, 240, 159, 167, 169, 240, 159, 167,
+      184, 240, 159, 170, 133, 240, 159, 170, 169, 240, 159, 170, 134, 226, 153, 160, 239, 184,
+      143, 226, 153, 160, 226, 153, 165, 239, 184, 143, 226, 153, 165, 226, 153, 166, 239, 184,
+      143, 226, 153, 166, 226, 153, 163, 239, 184, 143, 226, 153, 163, 226, 153, 159, 239, 184,
+      143, 226, 153, 159, 240, 159, 131, 143, 240, 159, 128, 132, 240, 159, 142, 180, 240, 159,
+      142, 173, 240, 159, 150, 188, 239, 184, 143, 240, 159, 150, 188, 240, 159, 142, 168, 240,
+      159, 167, 181, 240, 159, 170, 161, 240, 159, 167, 182, 240, 159, 170, 162, 240, 159, 145,
+      147, 240, 159, 149, 182, 239, 184, 143, 240, 159, 149, 182, 240, 159, 165, 189, 240, 159,
+      165, 188, 240, 159, 166, 186, 240, 159, 145, 148, 240, 159, 145, 149, 240, 159, 145, 150,
+      240, 159, 167, 163, 240, 159, 167, 164, 240, 159, 167, 165, 240, 159, 167, 166, 240, 159,
+      145, 151, 240, 159, 145, 152, 240, 159, 165, 187, 240, 159, 169, 177, 240, 159, 169, 178,
+      240, 159, 169, 179, 240, 159, 145, 153, 240, 159, 145, 154, 240, 159, 170, 173, 240, 159,
+      145, 155, 240, 159, 145, 156, 240, 159, 145, 157, 240, 159, 155, 141, 239, 184, 143, 240,
+      159, 155, 141, 240, 159, 142, 146, 240, 159, 169, 180, 240, 159, 145, 158, 240, 159, 145,
+      159, 240, 159, 165, 190, 240, 159, 165, 191, 240, 159, 145, 160, 240, 159, 145, 161, 240,
+      159, 169, 176, 240, 159, 145, 162, 240, 159, 170, 174, 240, 159, 145, 145, 240, 159, 145,
+      146, 240, 159, 142, 169, 240, 159, 142, 147, 240, 159, 167, 162, 240, 159, 170, 150, 226,
+      155, 145, 239, 184, 143, 226, 155, 145, 240, 159, 147, 191, 240, 159, 146, 132, 240, 159,
+      146, 141, 240, 159, 146, 142, 240, 159, 148, 135, 240, 159, 148, 136, 240, 159, 148, 137,
+      240, 159, 148, 138, 240, 159, 147, 162, 240, 159, 147, 163, 240, 159, 147, 175, 240, 159,
+      148, 148, 240, 159, 148, 149, 240, 159, 142, 188, 240, 159, 142, 181, 240, 159, 142, 182,
+      240, 159, 142, 153, 239, 184, 143, 240, 159, 142, 153, 240, 159, 142, 154, 239, 184, 143,
+      240, 159, 142, 154, 240, 159, 142, 155, 239, 184, 143, 240, 159, 142, 155, 240, 159, 142,
+      164, 240, 159, 142, 167, 240, 159, 147, 187, 240, 159, 142, 183, 240, 159, 142, 186, 240,
+      159, 170, 138, 240, 159, 170, 151, 240, 159, 142, 184, 240, 159, 142, 185, 240, 159, 142,
+      187, 240, 159, 170, 149, 240, 159, 165, 129, 240, 159, 170, 152, 240, 159, 170, 135, 240,
+      159, 170, 136, 240, 159, 170, 137, 240, 159, 147, 177, 240, 159, 147, 178, 226, 152, 142,
+      239, 184, 143, 226, 152, 142, 240, 159, 147, 158, 240, 159, 147, 159, 240, 159, 147, 160,
+      240, 159, 148, 139, 240, 159, 170, 171, 240, 159, 148, 140, 240, 159, 146, 187, 240, 159,
+      150, 165, 239, 184, 143, 240, 159, 150, 165, 240, 159, 150, 168, 239, 184, 143, 240, 159,
+      150, 168, 226, 140, 168, 239, 184, 143, 226, 140, 168, 240, 159, 150, 177, 239, 184, 143,
+      240, 159, 150, 177, 240, 159, 150, 178, 239, 184, 143, 240, 159, 150, 178, 240, 159, 146,
+      189, 240, 159, 146, 190, 240, 159, 146, 191, 240, 159, 147, 128, 240, 159, 167, 174, 240,
+      159, 142, 165, 240, 159, 142, 158, 239, 184, 143, 240, 159, 142, 158, 240, 159, 147, 189,
+      239, 184, 143, 240, 159, 147, 189, 240, 159, 142, 172, 240, 159, 147, 186, 240, 159, 147,
+      183, 240, 159, 147, 184, 240, 159, 147, 185, 240, 159, 147, 188, 240, 159, 148, 141, 240,
+      159, 148, 142, 240, 159, 149, 175, 239, 184, 143, 240, 159, 149, 175, 240, 159, 146, 161,
+      240, 159, 148, 166, 240, 159, 143, 174, 240, 159, 170, 148, 240, 159, 147, 148, 240, 159,
+      147, 149, 240, 159, 147, 150, 240, 159, 147, 151, 240, 159, 147, 152, 240, 159, 147, 153,
+      240, 159, 147, 154, 240, 159, 147, 147, 240, 159, 147, 146, 240, 159, 147, 131, 240, 159,
+      147, 156, 240, 159, 147, 132, 240, 159, 147, 176, 240, 159, 151, 158, 239, 184, 143, 240,
+      159, 151, 158, 240, 159, 147, 145, 240, 159, 148, 150, 240, 159, 143, 183, 239, 184, 143,
+      240, 159, 143, 183, 240, 159, 170, 153, 240, 159, 146, 176, 240, 159, 170, 142, 240, 159,
+      146, 180, 240, 159, 146, 181, 240, 159, 146, 182, 240, 159, 146, 183, 240, 159, 146, 184,
+      240, 159, 146, 179, 240, 159, 167, 190, 240, 159, 146, 185, 226, 156, 137, 239, 184, 143,
+      226, 156, 137, 240, 159, 147, 167, 240, 159, 147, 168, 240, 159, 147, 169, 240, 159, 147,
+      164, 240, 159, 147, 165, 240, 159, 147, 166, 240, 159, 147, 171, 240, 159, 147, 170, 240,
+      159, 147, 172, 240, 159, 147, 173, 240, 159, 147, 174, 240, 159, 151, 179, 239, 184, 143,
+      240, 159, 151, 179, 226, 156, 143, 239, 184, 143, 226, 156, 143, 226, 156, 146, 239, 184,
+      143, 226, 156, 146, 240, 159, 150, 139, 239, 184, 143, 240, 159, 150, 139, 240, 159, 150,
+      138, 239, 184, 143, 240, 159, 150, 138, 240, 159, 150, 140, 239, 184, 143, 240, 159, 150,
+      140, 240, 159, 150, 141, 239, 184, 143, 240, 159, 150, 141, 240, 159, 147, 157, 240, 159,
+      146, 188, 240, 159, 147, 129, 240, 159, 147, 130, 240, 159, 151, 130, 239, 184, 143, 240,
+      159, 151, 130, 240, 159, 147, 133, 240, 159, 147, 134, 240, 159, 151, 146, 239, 184, 143,
+      240, 159, 151, 146, 240, 159, 151, 147, 239, 184, 143, 240, 159, 151, 147, 240, 159, 147,
+      135, 240, 159, 147, 136, 240, 159, 147, 137, 240, 159, 147, 138, 240, 159, 147, 139, 240,
+      159, 147, 140, 240, 159, 147, 141, 240, 159, 147, 142, 240, 159, 150, 135, 239, 184, 143,
+      240, 159, 150, 135, 240, 159, 147, 143, 240, 159, 147, 144, 226, 156, 130, 239, 184, 143,
+      226, 156, 130, 240, 159, 151, 131, 239, 184, 143, 240, 159, 151, 131, 240, 159, 151, 132,
+      239, 184, 143, 240, 159, 151, 132, 240, 159, 151, 145, 239, 184, 143, 240, 159, 151, 145,
+      240, 159, 148, 146, 240, 159, 148, 147, 240, 159, 148, 143, 240, 159, 148, 144, 240, 159,
+      148, 145, 240, 159, 151, 157, 239, 184, 143, 240, 159, 151, 157, 240, 159, 148, 168, 240,
+      159, 170, 147, 226, 155, 143, 239, 184, 143, 226, 155, 143, 226, 154, 146, 239, 184, 143,
+      226, 154, 146, 240, 159, 155, 160, 239, 184, 143, 240, 159, 155, 160, 240, 159, 151, 161,
+      239, 184, 143, 240, 159, 151, 161, 226, 154, 148, 239, 184, 143, 226, 154, 148, 240, 159,
+      146, 163, 240, 159, 170, 131, 240, 159, 143, 185, 240, 159, 155, 161, 239, 184, 143, 240,
+      159, 155, 161, 240, 159, 170, 154, 240, 159, 148, 167, 240, 159, 170, 155, 240, 159, 148,
+      169, 226, 154, 153, 239, 184, 143, 226, 154, 153, 240, 159, 151, 156, 239, 184, 143, 240,
+      159, 151, 156, 226, 154, 150, 239, 184, 143, 226, 154, 150, 240, 159, 166, 175, 240, 159,
+      148, 151, 226, 155, 147, 239, 184, 143, 226, 128, 141, 240, 159, 146, 165, 226, 155, 147,
+      226, 128, 141, 240, 159, 146, 165, 226, 155, 147, 239, 184, 143, 226, 155, 147, 240, 159,
+      170, 157, 240, 159, 167, 176, 240, 159, 167, 178, 240, 159, 170, 156, 240, 159, 170, 143,
+      226, 154, 151, 239, 184, 143, 226, 154, 151, 240, 159, 167, 170, 240, 159, 167, 171, 240,
+      159, 167, 172, 240, 159, 148, 172, 240, 159, 148, 173, 240, 159, 147, 161, 240, 159, 146,
+      137, 240, 159, 169, 184, 240, 159, 146, 138, 240, 159, 169, 185, 240, 159, 169, 188, 240,
+      159, 169, 186, 240, 159, 169, 187, 240, 159, 154, 170, 240, 159, 155, 151, 240, 159, 170,
+      158, 240, 159, 170, 159, 240, 159, 155, 143, 239, 184, 143, 240, 159, 155, 143, 240, 159,
+      155, 139, 239, 184, 143, 240, 159, 155, 139, 240, 159, 170, 145, 240, 159, 154, 189, 240,
+      159, 170, 160, 240, 159, 154, 191, 240, 159, 155, 129, 240, 159, 170, 164, 240, 159, 170,
+      146, 240, 159, 167, 180, 240, 159, 167, 183, 240, 159, 167, 185, 240, 159, 167, 186, 240,
+      159, 167, 187, 240, 159, 170, 163, 240, 159, 167, 188, 240, 159, 171, 167, 240, 159, 170,
+      165, 240, 159, 167, 189, 240, 159, 167, 175, 240, 159, 155, 146, 240, 159, 154, 172, 226,
+      154, 176, 239, 184, 143, 226, 154, 176, 240, 159, 170, 166, 226, 154, 177, 239, 184, 143,
+      226, 154, 177, 240, 159, 167, 191, 240, 159, 170, 172, 240, 159, 151, 191, 240, 159, 170,
+      167, 240, 159, 170, 170, 240, 159, 143, 167, 240, 159, 154, 174, 240, 159, 154, 176, 226,
+      153, 191, 240, 159, 154, 185, 240, 159, 154, 186, 240, 159, 154, 187, 240, 159, 154, 188,
+      240, 159, 154, 190, 240, 159, 155, 130, 240, 159, 155, 131, 240, 159, 155, 132, 240, 159,
+      155, 133, 226, 154, 160, 239, 184, 143, 226, 154, 160, 240, 159, 154, 184, 226, 155, 148,
+      240, 159, 154, 171, 240, 159, 154, 179, 240, 159, 154, 173, 240, 159, 154, 175, 240, 159,
+      154, 177, 240, 159, 154, 183, 240, 159, 147, 181, 240, 159, 148, 158, 226, 152, 162, 239,
+      184, 143, 226, 152, 162, 226, 152, 163, 239, 184, 143, 226, 152, 163, 226, 172, 134, 239,
+      184, 143, 226, 172, 134, 226, 134, 151, 239, 184, 143, 226, 134, 151, 226, 158, 161, 239,
+      184, 143, 226, 158, 161, 226, 134, 152, 239, 184, 143, 226, 134, 152, 226, 172, 135, 239,
+      184, 143, 226, 172, 135, 226, 134, 153, 239, 184, 143, 226, 134, 153, 226, 172, 133, 239,
+      184, 143, 226, 172, 133, 226, 134, 150, 239, 184, 143, 226, 134, 150, 226, 134, 149, 239,
+      184, 143, 226, 134, 149, 226, 134, 148, 239, 184, 143, 226, 134, 148, 226, 134, 169, 239,
+      184, 143, 226, 134, 169, 226, 134, 170, 239, 184, 143, 226, 134, 170, 226, 164, 180, 239,
+      184, 143, 226, 164, 180, 226, 164, 181, 239, 184, 143, 226, 164, 181, 240, 159, 148, 131,
+      240, 159, 148, 132, 240, 159, 148, 153, 240, 159, 148, 154, 240, 159, 148, 155, 240, 159,
+      148, 156, 240, 159, 148, 157, 240, 159, 155, 144, 226, 154, 155, 239, 184, 143, 226, 154,
+      155, 240, 159, 149, 137, 239, 184, 143, 240, 159, 149, 137, 226, 156, 161, 239, 184, 143,
+      226, 156, 161, 226, 152, 184, 239, 184, 143, 226, 152, 184, 226, 152, 175, 239, 184, 143,
+      226, 152, 175, 226, 156, 157, 239, 184, 143, 226, 156, 157, 226, 152, 166, 239, 184, 143,
+      226, 152, 166, 226, 152, 170, 239, 184, 143, 226, 152, 170, 226, 152, 174, 239, 184, 143,
+      226, 152, 174, 240, 159, 149, 142, 240, 159, 148, 175, 240, 159, 170, 175, 226, 153, 136,
+      226, 153, 137, 226, 153, 138, 226, 153, 139, 226, 153, 140, 226, 153, 141, 226, 153, 142,
+      226, 153, 143, 226, 153, 144, 226, 153, 145, 226, 153, 146, 226, 153, 147, 226, 155, 142,
+      240, 159, 148, 128, 240, 159, 148, 129, 240, 159, 148, 130, 226, 150, 182, 239, 184, 143,
+      226, 150, 182, 226, 143, 169, 226, 143, 173, 239, 184, 143, 226, 143, 173, 226, 143, 175,
+      239, 184, 143, 226, 143, 175, 226, 151, 128, 239, 184, 143, 226, 151, 128, 226, 143, 170,
+      226, 143, 174, 239, 184, 143, 226, 143, 174, 240, 159, 148, 188, 226, 143, 171, 240, 159,
+      148, 189, 226, 143, 172, 226, 143, 184, 239, 184, 143, 226, 143, 184, 226, 143, 185, 239,
+      184, 143, 226, 143, 185, 226, 143, 186, 239, 184, 143, 226, 143, 186, 226, 143, 143, 239,
+      184, 143, 226, 143, 143, 240, 159, 142, 166, 240, 159, 148, 133, 240, 159, 148, 134, 240,
+      159, 147, 182, 240, 159, 155, 156, 240, 159, 147, 179, 240, 159, 147, 180, 226, 153, 128,
+      239, 184, 143, 226, 153, 128, 226, 153, 130, 239, 184, 143, 226, 153, 130, 226, 154, 167,
+      239, 184, 143, 226, 154, 167, 226, 156, 150, 239, 184, 143, 226, 156, 150, 226, 158, 149,
+      226, 158, 150, 226, 158, 151, 240, 159, 159, 176, 226, 153, 190, 239, 184, 143, 226, 153,
+      190, 226, 128, 188, 239, 184, 143, 226, 128, 188, 226, 129, 137, 239, 184, 143, 226, 129,
+      137, 226, 157, 147, 226, 157, 148, 226, 157, 149, 226, 157, 151, 227, 128, 176, 239, 184,
+      143, 227, 128, 176, 240, 159, 146, 177, 240, 159, 146, 178, 226, 154, 149, 239, 184, 143,
+      226, 154, 149, 226, 153, 187, 239, 184, 143, 226, 153, 187, 226, 154, 156, 239, 184, 143,
+      226, 154, 156, 240, 159, 148, 177, 240, 159, 147, 155, 240, 159, 148, 176, 226, 173, 149,
+      226, 156, 133, 226, 152, 145, 239, 184, 143, 226, 152, 145, 226, 156, 148, 239, 184, 143,
+      226, 156, 148, 226, 157, 140, 226, 157, 142, 226, 158, 176, 226, 158, 191, 227, 128, 189,
+      239, 184, 143, 227, 128, 189, 226, 156, 179, 239, 184, 143, 226, 156, 179, 226, 156, 180,
+      239, 184, 143, 226, 156, 180, 226, 157, 135, 239, 184, 143, 226, 157, 135, 194, 169, 239,
+      184, 143, 194, 169, 194, 174, 239, 184, 143, 194, 174, 226, 132, 162, 239, 184, 143, 226,
+      132, 162, 240, 159, 171, 159, 35, 239, 184, 143, 226, 131, 163, 35, 226, 131, 163, 42, 239,
+      184, 143, 226, 131, 163, 42, 226, 131, 163, 48, 239, 184, 143, 226, 131, 163, 48, 226, 131,
+      163, 49, 239, 184, 143, 226, 131, 163, 49, 226, 131, 163, 50, 239, 184, 143, 226, 131, 163,
+      50, 226, 131, 163, 51, 239, 184, 143, 226, 131, 163, 51, 226, 131, 163, 52, 239, 184, 143,
+      226, 131, 163, 52, 226, 131, 163, 53, 239, 184, 143, 226, 131, 163, 53, 226, 131, 163, 54,
+      239, 184, 143, 226, 131, 163, 54, 226, 131, 163, 55, 239, 184, 143, 226, 131, 163, 55, 226,
+      131, 163, 56, 239, 184, 143, 226, 131, 163, 56, 226, 131, 163, 57, 239, 184, 143, 226, 131,
+      163, 57, 226, 131, 163, 240, 159, 148, 159, 240, 159, 148, 160, 240, 159, 148, 161, 240, 159,
+      148, 162, 240, 159, 148, 163, 240, 159, 148, 164, 240, 159, 133, 176, 239, 184, 143, 240,
+      159, 133, 176, 240, 159, 134, 142, 240, 159, 133, 177, 239, 184, 143, 240, 159, 133, 177,
+      240, 159, 134, 145, 240, 159, 134, 146, 240, 159, 134, 147, 226, 132, 185, 239, 184, 143,
+      226, 132, 185, 240, 159, 134, 148, 226, 147, 130, 239, 184, 143, 226, 147, 130, 240, 159,
+      134, 149, 240, 159, 134, 150, 240, 159, 133, 190, 239, 184, 143, 240, 159, 133, 190, 240,
+      159, 134, 151, 240, 159, 133, 191, 239, 184, 143, 240, 159, 133, 191, 240, 159, 134, 152,
+      240, 159, 134, 153, 240, 159, 134, 154, 240, 159, 136, 129, 240, 159, 136, 130, 239, 184,
+      143, 240, 159, 136, 130, 240, 159, 136, 183, 239, 184, 143, 240, 159, 136, 183, 240, 159,
+      136, 182, 240, 159, 136, 175, 240, 159, 137, 144, 240, 159, 136, 185, 240, 159, 136, 154,
+      240, 159, 136, 178, 240, 159, 137, 145, 240, 159, 136, 184, 240, 159, 136, 180, 240, 159,
+      136, 179, 227, 138, 151, 239, 184, 143, 227, 138, 151, 227, 138, 153, 239, 184, 143, 227,
+      138, 153, 240, 159, 136, 186, 240, 159, 136, 181, 240, 159, 148, 180, 240, 159, 159, 160,
+      240, 159, 159, 161, 240, 159, 159, 162, 240, 159, 148, 181, 240, 159, 159, 163, 240, 159,
+      159, 164, 226, 154, 171, 226, 154, 170, 240, 159, 159, 165, 240, 159, 159, 167, 240, 159,
+      159, 168, 240, 159, 159, 169, 240, 159, 159, 166, 240, 159, 159, 170, 240, 159, 159, 171,
+      226, 172, 155, 226, 172, 156, 226, 151, 188, 239, 184, 143, 226, 151, 188, 226, 151, 187,
+      239, 184, 143, 226, 151, 187, 226, 151, 190, 226, 151, 189, 226, 150, 170, 239, 184, 143,
+      226, 150, 170, 226, 150, 171, 239, 184, 143, 226, 150, 171, 240, 159, 148, 182, 240, 159,
+      148, 183, 240, 159, 148, 184, 240, 159, 148, 185, 240, 159, 148, 186, 240, 159, 148, 187,
+      240, 159, 146, 160, 240, 159, 148, 152, 240, 159, 148, 179, 240, 159, 148, 178, 240, 159,
+      143, 129, 240, 159, 154, 169, 240, 159, 142, 140, 240, 159, 143, 180, 240, 159, 143, 179,
+      239, 184, 143, 240, 159, 143, 179, 240, 159, 143, 179, 239, 184, 143, 226, 128, 141, 240,
+      159, 140, 136, 240, 159, 143, 179, 226, 128, 141, 240, 159, 140, 136, 240, 159, 143, 179,
+      239, 184, 143, 226, 128, 141, 226, 154, 167, 239, 184, 143, 240, 159, 143, 179, 226, 128,
+      141, 226, 154, 167, 239, 184, 143, 240, 159, 143, 179, 239, 184, 143, 226, 128, 141, 226,
+      154, 167, 240, 159, 143, 179, 226, 128, 141, 226, 154, 167, 240, 159, 143, 180, 226, 128,
+      141, 226, 152, 160, 239, 184, 143, 240, 159, 143, 180, 226, 128, 141, 226, 152, 160, 240,
+      159, 135, 166, 240, 159, 135, 168, 240, 159, 135, 166, 240, 159, 135, 169, 240, 159, 135,
+      166, 240, 159, 135, 170, 240, 159, 135, 166, 240, 159, 135, 171, 240, 159, 135, 166, 240,
+      159, 135, 172, 240, 159, 135, 166, 240, 159, 135, 174, 240, 159, 135, 166, 240, 159, 135,
+      177, 240, 159, 135, 166, 240, 159, 135, 178, 240, 159, 135, 166, 240, 159, 135, 180, 240,
+      159, 135, 166, 240, 159, 135, 182, 240, 159, 135, 166, 240, 159, 135, 183, 240, 159, 135,
+      166, 240, 159, 135, 184, 240, 159, 135, 166, 240, 159, 135, 185, 240, 159, 135, 166, 240,
+      159, 135, 186, 240, 159, 135, 166, 240, 159, 135, 188, 240, 159, 135, 166, 240, 159, 135,
+      189, 240, 159, 135, 166, 240, 159, 135, 191, 240, 159, 135, 167, 240, 159, 135, 166, 240,
+      159, 135, 167, 240, 159, 135, 167, 240, 159, 135, 167, 240, 159, 135, 169, 240, 159, 135,
+      167, 240, 159, 135, 170, 240, 159, 135, 167, 240, 159, 135, 171, 240, 159, 135, 167, 240,
+      159, 135, 172, 240, 159, 135, 167, 240, 159, 135, 173, 240, 159, 135, 167, 240, 159, 135,
+      174, 240, 159, 135, 167, 240, 159, 135, 175, 240, 159, 135, 167, 240, 159, 135, 177, 240,
+      159, 135, 167, 240, 159, 135, 178, 240, 159, 135, 167, 240, 159, 135, 179, 240, 159, 135,
+      167, 240, 159, 135, 180, 240, 159, 135, 167, 240, 159, 135, 182, 240, 159, 135, 167, 240,
+      159, 135, 183, 240, 159, 135, 167, 240, 159, 135, 184, 240, 159, 135, 167, 240, 159, 135,
+      185, 240, 159, 135, 167, 240, 159, 135, 187, 240, 159, 135, 167, 240, 159, 135, 188, 240,
+      159, 135, 167, 240, 159, 135, 190, 240, 159, 135, 167, 240, 159, 135, 191, 240, 159, 135,
+      168, 240, 159, 135, 166, 240, 159, 135, 168, 240, 159, 135, 168, 240, 159, 135, 168, 240,
+      159, 135, 169, 240, 159, 135, 168, 240, 159, 135, 171, 240, 159, 135, 168, 240, 159, 135,
+      172, 240, 159, 135, 168, 240, 159, 135, 173, 240, 159, 135, 168, 240, 159, 135, 174, 240,
+      159, 135, 168, 240, 159, 135, 176, 240, 159, 135, 168, 240, 159, 135, 177, 240, 159, 135,
+      168, 240, 159, 135, 178, 240, 159, 135, 168, 240, 159, 135, 179, 240, 159, 135, 168, 240,
+      159, 135, 180, 240, 159, 135, 168, 240, 159, 135, 181, 240, 159, 135, 168, 240, 159, 135,
+      182, 240, 159, 135, 168, 240, 159, 135, 183, 240, 159, 135, 168, 240, 159, 135, 186, 240,
+      159, 135, 168, 240, 159, 135, 187, 240, 159, 135, 168, 240, 159, 135, 188, 240, 159, 135,
+      168, 240, 159, 135, 189, 240, 159, 135, 168, 240, 159, 135, 190, 240, 159, 135, 168, 240,
+      159, 135, 191, 240, 159, 135, 169, 240, 159, 135, 170, 240, 159, 135, 169, 240, 159, 135,
+      172, 240, 159, 135, 169, 240, 159, 135, 175, 240, 159, 135, 169, 240, 159, 135, 176, 240,
+      159, 135, 169, 240, 159, 135, 178, 240, 159, 135, 169, 240, 159, 135, 180, 240, 159, 135,
+      169, 240, 159, 135, 191, 240, 159, 135, 170, 240, 159, 135, 166, 240, 159, 135, 170, 240,
+      159, 135, 168, 240, 159, 135, 170, 240, 159, 135, 170, 240, 159, 135, 170, 240, 159, 135,
+      172, 240, 159, 135, 170, 240, 159, 135, 173, 240, 159, 135, 170, 240, 159, 135, 183, 240,
+      159, 135, 170, 240, 159, 135, 184, 240, 159, 135, 170, 240, 159, 135, 185, 240, 159, 135,
+      170, 240, 159, 135, 186, 240, 159, 135, 171, 240, 159, 135, 174, 240, 159, 135, 171, 240,
+      159, 135, 175, 240, 159, 135, 171, 240, 159, 135, 176, 240, 159, 135, 171, 240, 159, 135,
+      178, 240, 159, 135, 171, 240, 159, 135, 180, 240, 159, 135, 171, 240, 159, 135, 183, 240,
+      159, 135, 172, 240, 159, 135, 166, 240, 159, 135, 172, 240, 159, 135, 167, 240, 159, 135,
+      172, 240, 159, 135, 169, 240, 159, 135, 172, 240, 159, 135, 170, 240, 159, 135, 172, 240,
+      159, 135, 171, 240, 159, 135, 172, 240, 159, 135, 172, 240, 159, 135, 172, 240, 159, 135,
+      173, 240, 159, 135, 172, 240, 159, 135, 174, 240, 159, 135, 172, 240, 159, 135, 177, 240,
+      159, 135, 172, 240, 159, 135, 178, 240, 159, 135, 172, 240, 159, 135, 179, 240, 159, 135,
+      172, 240, 159, 135, 181, 240, 159, 135, 172, 240, 159, 135, 182, 240, 159, 135, 172, 240,
+      159, 135, 183, 240, 159, 135, 172, 240, 159, 135, 184, 240, 159, 135, 172, 240, 159, 135,
+      185, 240, 159, 135, 172, 240, 159, 135, 186, 240, 159, 135, 172, 240, 159, 135, 188, 240,
+      159, 135, 172, 240, 159, 135, 190, 240, 159, 135, 173, 240, 159, 135, 176, 240, 159, 135,
+      173, 240, 159, 135, 178, 240, 159, 135, 173, 240, 159, 135, 179, 240, 159, 135, 173, 240,
+      159, 135, 183, 240, 159, 135, 173, 240, 159, 135, 185, 240, 159, 135, 173, 240, 159, 135,
+      186, 240, 159, 135, 174, 240, 159, 135, 168, 240, 159, 135, 174, 240, 159, 135, 169, 240,
+      159, 135, 174, 240, 159, 135, 170, 240, 159, 135, 174, 240, 159, 135, 177, 240, 159, 135,
+      174, 240, 159, 135, 178, 240, 159, 135, 174, 240, 159, 135, 179, 240, 159, 135, 174, 240,
+      159, 135, 180, 240, 159, 135, 174, 240, 159, 135, 182, 240, 159, 135, 174, 240, 159, 135,
+      183, 240, 159, 135, 174, 240, 159, 135, 184, 240, 159, 135, 174, 240, 159, 135, 185, 240,
+      159, 135, 175, 240, 159, 135, 170, 240, 159, 135, 175, 240, 159, 135, 178, 240, 159, 135,
+      175, 240, 159, 135, 180, 240, 159, 135, 175, 240, 159, 135, 181, 240, 159, 135, 176, 240,
+      159, 135, 170, 240, 159, 135, 176, 240, 159, 135, 172, 240, 159, 135, 176, 240, 159, 135,
+      173, 240, 159, 135, 176, 240, 159, 135, 174, 240, 159, 135, 176, 240, 159, 135, 178, 240,
+      159, 135, 176, 240, 159, 135, 179, 240, 159, 135, 176, 240, 159, 135, 181, 240, 159, 135,
+      176, 240, 159, 135, 183, 240, 159, 135, 176, 240, 159, 135, 188, 240, 159, 135, 176, 240,
+      159, 135, 190, 240, 159, 135, 176, 240, 159, 135, 191, 240, 159, 135, 177, 240, 159, 135,
+      166, 240, 159, 135, 177, 240, 159, 135, 167, 240, 159, 135, 177, 240, 159, 135, 168, 240,
+      159, 135, 177, 240, 159, 135, 174, 240, 159, 135, 177, 240, 159, 135, 176, 240, 159, 135,
+      177, 240, 159, 135, 183, 240, 159, 135, 177, 240, 159, 135, 184, 240, 159, 135, 177, 240,
+      159, 135, 185, 240, 159, 135, 177, 240, 159, 135, 186, 240, 159, 135, 177, 240, 159, 135,
+      187, 240, 159, 135, 177, 240, 159, 135, 190, 240, 159, 135, 178, 240, 159, 135, 166, 240,
+      159, 135, 178, 240, 159, 135, 168, 240, 159, 135, 178, 240, 159, 135, 169, 240, 159, 135,
+      178, 240, 159, 135, 170, 240, 159, 135, 178, 240, 159, 135, 171, 240, 159, 135, 178, 240,
+      159, 135, 172, 240, 159, 135, 178, 240, 159, 135, 173, 240, 159, 135, 178, 240, 159, 135,
+      176, 240, 159, 135, 178, 240, 159, 135, 177, 240, 159, 135, 178, 240, 159, 135, 178, 240,
+      159, 135, 178, 240, 159, 135, 179, 240, 159, 135, 178, 240, 159, 135, 180, 240, 159, 135,
+      178, 240, 159, 135, 181, 240, 159, 135, 178, 240, 159, 135, 182, 240, 159, 135, 178, 240,
+      159, 135, 183, 240, 159, 135, 178, 240, 159, 135, 184, 240, 159, 135, 178, 240, 159, 135,
+      185, 240, 159, 135, 178, 240, 159, 135, 186, 240, 159, 135, 178, 240, 159, 135, 187, 240,
+      159, 135, 178, 240, 159, 135, 188, 240, 159, 135, 178, 240, 159, 135, 189, 240, 159, 135,
+      178, 240, 159, 135, 190, 240, 159, 135, 178, 240, 159, 135, 191, 240, 159, 135, 179, 240,
+      159, 135, 166, 240, 159, 135, 179, 240, 159, 135, 168, 240, 159, 135, 179, 240, 159, 135,
+      170, 240, 159, 135, 179, 240, 159, 135, 171, 240, 159, 135, 179, 240, 159, 135, 172, 240,
+      159, 135, 179, 240, 159, 135, 174, 240, 159, 135, 179, 240, 159, 135, 177, 240, 159, 135,
+      179, 240, 159, 135, 180, 240, 159, 135, 179, 240, 159, 135, 181, 240, 159, 135, 179, 240,
+      159, 135, 183, 240, 159, 135, 179, 240, 159, 135, 186, 240, 159, 135, 179, 240, 159, 135,
+      191, 240, 159, 135, 180, 240, 159, 135, 178, 240, 159, 135, 181, 240, 159, 135, 166, 240,
+      159, 135, 181, 240, 159, 135, 170, 240, 159, 135, 181, 240, 159, 135, 171, 240, 159, 135,
+      181, 240, 159, 135, 172, 240, 159, 135, 181, 240, 159, 135, 173, 240, 159, 135, 181, 240,
+      159, 135, 176, 240, 159, 135, 181, 240, 159, 135, 177, 240, 159, 135, 181, 240, 159, 135,
+      178, 240, 159, 135, 181, 240, 159, 135, 179, 240, 159, 135, 181, 240, 159, 135, 183, 240,
+      159, 135, 181, 240, 159, 135, 184, 240, 159, 135, 181, 240, 159, 135, 185, 240, 159, 135,
+      181, 240, 159, 135, 188, 240, 159, 135, 181, 240, 159, 135, 190, 240, 159, 135, 182, 240,
+      159, 135, 166, 240, 159, 135, 183, 240, 159, 135, 170, 240, 159, 135, 183, 240, 159, 135,
+      180, 240, 159, 135, 183, 240, 159, 135, 184, 240, 159, 135, 183, 240, 159, 135, 186, 240,
+      159, 135, 183, 240, 159, 135, 188, 240, 159, 135, 184, 240, 159, 135, 166, 240, 159, 135,
+      184, 240, 159, 135, 167, 240, 159, 135, 184, 240, 159, 135, 168, 240, 159, 135, 184, 240,
+      159, 135, 169, 240, 159, 135, 184, 240, 159, 135, 170, 240, 159, 135, 184, 240, 159, 135,
+      172, 240, 159, 135, 184, 240, 159, 135, 173, 240, 159, 135, 184, 240, 159, 135, 174, 240,
+      159, 135, 184, 240, 159, 135, 175, 240, 159, 135, 184, 240, 159, 135, 176, 240, 159, 135,
+      184, 240, 159, 135, 177, 240, 159, 135, 184, 240, 159, 135, 178, 240, 159, 135, 184, 240,
+      159, 135, 179, 240, 159, 135, 184, 240, 159, 135, 180, 240, 159, 135, 184, 240, 159, 135,
+      183, 240, 159, 135, 184, 240, 159, 135, 184, 240, 159, 135, 184, 240, 159, 135, 185, 240,
+      159, 135, 184, 240, 159, 135, 187, 240, 159, 135, 184, 240, 159, 135, 189, 240, 159, 135,
+      184, 240, 159, 135, 190, 240, 159, 135, 184, 240, 159, 135, 191, 240, 159, 135, 185, 240,
+      159, 135, 166, 240, 159, 135, 185, 240, 159, 135, 168, 240, 159, 135, 185, 240, 159, 135,
+      169, 240, 159, 135, 185, 240, 159, 135, 171, 240, 159, 135, 185, 240, 159, 135, 172, 240,
+      159, 135, 185, 240, 159, 135, 173, 240, 159, 135, 185, 240, 159, 135, 175, 240, 159, 135,
+      185, 240, 159, 135, 176, 240, 159, 135, 185, 240, 159, 135, 177, 240, 159, 135, 185, 240,
+      159, 135, 178, 240, 159, 135, 185, 240, 159, 135, 179, 240, 159, 135, 185, 240, 159, 135,
+      180, 240, 159, 135, 185, 240, 159, 135, 183, 240, 159, 135, 185, 240, 159, 135, 185, 240,
+      159, 135, 185, 240, 159, 135, 187, 240, 159, 135, 185, 240, 159, 135, 188, 240, 159, 135,
+      185, 240, 159, 135, 191, 240, 159, 135, 186, 240, 159, 135, 166, 240, 159, 135, 186, 240,
+      159, 135, 172, 240, 159, 135, 186, 240, 159, 135, 178, 240, 159, 135, 186, 240, 159, 135,
+      179, 240, 159, 135, 186, 240, 159, 135, 184, 240, 159, 135, 186, 240, 159, 135, 190, 240,
+      159, 135, 186, 240, 159, 135, 191, 240, 159, 135, 187, 240, 159, 135, 166, 240, 159, 135,
+      187, 240, 159, 135, 168, 240, 159, 135, 187, 240, 159, 135, 170, 240, 159, 135, 187, 240,
+      159, 135, 172, 240, 159, 135, 187, 240, 159, 135, 174, 240, 159, 135, 187, 240, 159, 135,
+      179, 240, 159, 135, 187, 240, 159, 135, 186, 240, 159, 135, 188, 240, 159, 135, 171, 240,
+      159, 135, 188, 240, 159, 135, 184, 240, 159, 135, 189, 240, 159, 135, 176, 240, 159, 135,
+      190, 240, 159, 135, 170, 240, 159, 135, 190, 240, 159, 135, 185, 240, 159, 135, 191, 240,
+      159, 135, 166, 240, 159, 135, 191, 240, 159, 135, 178, 240, 159, 135, 191, 240, 159, 135,
+      188, 240, 159, 143, 180, 243, 160, 129, 167, 243, 160, 129, 162, 243, 160, 129, 165, 243,
+      160, 129, 174, 243, 160, 129, 167, 243, 160, 129, 191, 240, 159, 143, 180, 243, 160, 129,
+      167, 243, 160, 129, 162, 243, 160, 129, 179, 243, 160, 129, 163, 243, 160, 129, 180, 243,
+      160, 129, 191, 240, 159, 143, 180, 243, 160, 129, 167, 243, 160, 129, 162, 243, 160, 129,
+      183, 243, 160, 129, 172, 243, 160, 129, 179, 243, 160, 129, 191,
+    };
+
+    inline constexpr std::uint32_t utf8Offsets[] = {
+      0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 68, 72, 76, 82, 85, 89, 93,
+      97, 101, 105, 109, 113, 117, 121, 125, 129, 133, 137, 141, 145, 149, 153, 157, 161, 165, 169,
+      173, 187, 198, 202, 206, 210, 214, 225, 229, 233, 246, 256, 269, 279, 283, 287, 291, 295,
+      299, 303, 307, 311, 315, 319, 323, 327, 331, 335, 339, 343, 354, 358, 362, 366, 370, 374,
+      378, 382, 386, 390, 394, 398, 404, 407, 411, 415, 419, 423, 427, 431, 435, 439, 443, 447,
+      451, 455, 459, 463, 467, 471, 475, 479, 483, 487, 491, 495, 499, 503, 507, 511, 515, 519,
+      523, 529, 532, 536, 540, 544, 548, 552, 556, 560, 564, 568, 572, 576, 580, 584, 588, 592,
+      596, 600, 604, 608, 612, 616, 620, 624, 628, 632, 636, 640, 644, 648, 654, 657, 661, 674,
+      684, 697, 707, 713, 716, 720, 724, 728, 732, 736, 740, 744, 748, 752, 756, 760, 764, 768,
+      772, 776, 780, 784, 788, 792, 799, 803, 807, 824, 838, 852, 863, 870, 874, 881, 885, 889,
+      893, 897, 905, 913, 921, 929, 937, 941, 949, 957, 965, 973, 981, 988, 992, 1000, 1008, 1016,
+      1024, 1032, 1035, 1042, 1049, 1056, 1063, 1070, 1074, 1082, 1090, 1098, 1106, 1114, 1118,
+      1126, 1134, 1142, 1150, 1158, 1162, 1170, 1178, 1186, 1194, 1202, 1206, 1214, 1222, 1230,
+      1238, 1246, 1250, 1258, 1266, 1274, 1282, 1290, 1294, 1302, 1310, 1318, 1326, 1334, 1338,
+      1346, 1354, 1362, 1370, 1378, 1382, 1390, 1398, 1406, 1414, 1422, 1426, 1434, 1442, 1450,
+      1458, 1466, 1470, 1478, 1486, 1494, 1502, 1510, 1516, 1519, 1526, 1533, 1540, 1547, 1554,
+      1558, 1566, 1574, 1582, 1590, 1598, 1602, 1610, 1618, 1626, 1634, 1642, 1646, 1654, 1662,
+      1670, 1678, 1686, 1690, 1698, 1706, 1714, 1722, 1730, 1734, 1742, 1750, 1758, 1766, 1774,
+      1778, 1786, 1794, 1802, 1810, 1818, 1822, 1830, 1838, 1846, 1854, 1862, 1866, 1874, 1882,
+      1890, 1898, 1906, 1910, 1918, 1926, 1934, 1942, 1950, 1954, 1962, 1970, 1978, 1986, 1994,
+      2000, 2003, 2010, 2017, 2024, 2031, 2038, 2042, 2050, 2058, 2066, 2074, 2082, 2086, 2094,
+      2102, 2110, 2118, 2126, 2130, 2138, 2146, 2154, 2162, 2170, 2173, 2180, 2187, 2194, 2201,
+      2208, 2212, 2220, 2228, 2236, 2244, 2252, 2256, 2264, 2272, 2280, 2288, 2296, 2300, 2308,
+      2316, 2324, 2332, 2340, 2344, 2352, 2360, 2368, 2376, 2384, 2388, 2396, 2404, 2412, 2420,
+      2428, 2432, 2440, 2448, 2456, 2464, 2472, 2476, 2484, 2492, 2500, 2508, 2516, 2520, 2528,
+      2536, 2544, 2552, 2560, 2564, 2572, 2580, 2588, 2596, 2604, 2623, 2642, 2661, 2680, 2699,
+      2718, 2737, 2756, 2775, 2794, 2813, 2832, 2851, 2870, 2889, 2908, 2927, 2946, 2965, 2984,
+      2988, 2996, 3004, 3012, 3020, 3028, 3034, 3037, 3044, 3051, 3058, 3065, 3072, 3076, 3084,
+      3092, 3100, 3108, 3116, 3120, 3128, 3136, 3144, 3152, 3160, 3164, 3172, 3180, 3188, 3196,
+      3204, 3208, 3212, 3216, 3224, 3232, 3240, 3248, 3256, 3260, 3268, 3276, 3284, 3292, 3300,
+      3304, 3312, 3320, 3328, 3336, 3344, 3348, 3356, 3364, 3372, 3380, 3388, 3392, 3400, 3408,
+      3416, 3424, 3432, 3436, 3440, 3444, 3448, 3452, 3456, 3463, 3467, 3471, 3475, 3479, 3483,
+      3491, 3499, 3507, 3515, 3523, 3527, 3535, 3543, 3551, 3559, 3567, 3571, 3579, 3587, 3595,
+      3603, 3611, 3615, 3623, 3631, 3639, 3647, 3655, 3659, 3667, 3675, 3683, 3691, 3699, 3703,
+      3711, 3719, 3727, 3735, 3743, 3747, 3755, 3763, 3771, 3779, 3787, 3791, 3799, 3807, 3815,
+      3823, 3831, 3844, 3854, 3871, 3885, 3902, 3916, 3933, 3947, 3964, 3978, 3995, 4009, 4022,
+      4032, 4049, 4063, 4080, 4094, 4111, 4125, 4142, 4156, 4173, 4187, 4198, 4213, 4228, 4243,
+      4258, 4273, 4284, 4299, 4314, 4329, 4344, 4359, 4370, 4385, 4400, 4415, 4430, 4445, 4456,
+      4471, 4486, 4501, 4516, 4531, 4535, 4543, 4551, 4559, 4567, 4575, 4586, 4601, 4616, 4631,
+      4646, 4661, 4672, 4687, 4702, 4717, 4732, 4747, 4758, 4773, 4788, 4803, 4818, 4833, 4844,
+      4859, 4874, 4889, 4904, 4919, 4930, 4945, 4960, 4975, 4990, 5005, 5016, 5031, 5046, 5061,
+      5076, 5091, 5102, 5117, 5132, 5147, 5162, 5177, 5188, 5203, 5218, 5233, 5248, 5263, 5276,
+      5286, 5303, 5317, 5334, 5348, 5365, 5379, 5396, 5410, 5427, 5441, 5454, 5464, 5481, 5495,
+      5512, 5526, 5543, 5557, 5574, 5588, 5605, 5619, 5623, 5631, 5639, 5647, 5655, 5663, 5667,
+      5675, 5683, 5691, 5699, 5707, 5711, 5719, 5727, 5735, 5743, 5751, 5755, 5763, 5771, 5779,
+      5787, 5795, 5808, 5818, 5835, 5849, 5866, 5880, 5897, 5911, 5928, 5942, 5959, 5973, 5986,
+      5996, 6013, 6027, 6044, 6058, 6075, 6089, 6106, 6120, 6137, 6151, 6155, 6163, 6171, 6179,
+      6187, 6195, 6208, 6218, 6235, 6249, 6266, 6280, 6297, 6311, 6328, 6342, 6359, 6373, 6386,
+      6396, 6413, 6427, 6444, 6458, 6475, 6489, 6506, 6520, 6537, 6551, 6555, 6563, 6571, 6579,
+      6587, 6595, 6608, 6618, 6635, 6649, 6666, 6680, 6697, 6711, 6728, 6742, 6759, 6773, 6786,
+      6796, 6813, 6827, 6844, 6858, 6875, 6889, 6906, 6920, 6937, 6951, 6955, 6963, 6971, 6979,
+      6987, 6995, 7008, 7018, 7035, 7049, 7066, 7080, 7097, 7111, 7128, 7142, 7159, 7173, 7186,
+      7196, 7213, 7227, 7244, 7258, 7275, 7289, 7306, 7320, 7337, 7351, 7355, 7363, 7371, 7379,
+      7387, 7395, 7408, 7418, 7435, 7449, 7466, 7480, 7497, 7511, 7528, 7542, 7559, 7573, 7586,
+      7596, 7613, 7627, 7644, 7658, 7675, 7689, 7706, 7720, 7737, 7751, 7755, 7763, 7771, 7779,
+      7787, 7795, 7808, 7818, 7835, 7849, 7866, 7880, 7897, 7911, 7928, 7942, 7959, 7973, 7986,
+      7996, 8013, 8027, 8044, 8058, 8075, 8089, 8106, 8120, 8137, 8151, 8155, 8163, 8171, 8179,
+      8187, 8195, 8208, 8218, 8235, 8249, 8266, 8280, 8297, 8311, 8328, 8342, 8359, 8373, 8386,
+      8396, 8413, 8427, 8444, 8458, 8475, 8489, 8506, 8520, 8537, 8551, 8555, 8563, 8571, 8579,
+      8587, 8595, 8608, 8618, 8635, 8649, 8666, 8680, 8697, 8711, 8728, 8742, 8759, 8773, 8786,
+      8796, 8813, 8827, 8844, 8858, 8875, 8889, 8906, 8920, 8937, 8951, 8955, 8963, 8971, 8979,
+      8987, 8995, 9008, 9018, 9035, 9049, 9066, 9080, 9097, 9111, 9128, 9142, 9159, 9173, 9186,
+      9196, 9213, 9227, 9244, 9258, 9275, 9289, 9306, 9320, 9337, 9351, 9355, 9363, 9371, 9379,
+      9387, 9395, 9408, 9418, 9435, 9449, 9466, 9480, 9497, 9511, 9528, 9542, 9559, 9573, 9586,
+      9596, 9613, 9627, 9644, 9658, 9675, 9689, 9706, 9720, 9737, 9751, 9764, 9774, 9791, 9805,
+      9822, 9836, 9853, 9867, 9884, 9898, 9915, 9929, 9942, 9952, 9969, 9983, 10000, 10014, 10031,
+      10045, 10062, 10076, 10093, 10107, 10120, 10130, 10147, 10161, 10178, 10192, 10209, 10223,
+      10240, 10254, 10271, 10285, 10296, 10311, 10326, 10341, 10356, 10371, 10382, 10397, 10412,
+      10427, 10442, 10457, 10468, 10483, 10498, 10513, 10528, 10543, 10554, 10569, 10584, 10599,
+      10614, 10629, 10640, 10655, 10670, 10685, 10700, 10715, 10726, 10741, 10756, 10771, 10786,
+      10801, 10814, 10824, 10841, 10855, 10872, 10886, 10903, 10917, 10934, 10948, 10965, 10979,
+      10992, 11002, 11019, 11033, 11050, 11064, 11081, 11095, 11112, 11126, 11143, 11157, 11170,
+      11180, 11197, 11211, 11228, 11242, 11259, 11273, 11290, 11304, 11321, 11335, 11346, 11361,
+      11376, 11391, 11406, 11421, 11432, 11447, 11462, 11477, 11492, 11507, 11518, 11533, 11548,
+      11563, 11578, 11593, 11604, 11619, 11634, 11649, 11664, 11679, 11690, 11705, 11720, 11735,
+      11750, 11765, 11776, 11791, 11806, 11821, 11836, 11851, 11862, 11877, 11892, 11907, 11922,
+      11937, 11948, 11963, 11978, 11993, 12008, 12023, 12034, 12049, 12064, 12079, 12094, 12109,
+      12120, 12135, 12150, 12165, 12180, 12195, 12206, 12221, 12236, 12251, 12266, 12281, 12292,
+      12307, 12322, 12337, 12352, 12367, 12378, 12393, 12408, 12423, 12438, 12453, 12464, 12479,
+      12494, 12509, 12524, 12539, 12550, 12565, 12580, 12595, 12610, 12625, 12636, 12651, 12666,
+      12681, 12696, 12711, 12722, 12737, 12752, 12767, 12782, 12797, 12808, 12823, 12838, 12853,
+      12868, 12883, 12894, 12909, 12924, 12939, 12954, 12969, 12980, 12995, 13010, 13025, 13040,
+      13055, 13066, 13081, 13096, 13111, 13126, 13141, 13152, 13167, 13182, 13197, 13212, 13227,
+      13238, 13253, 13268, 13283, 13298, 13313, 13324, 13339, 13354, 13369, 13384, 13399, 13410,
+      13425, 13440, 13455, 13470, 13485, 13496, 13511, 13526, 13541, 13556, 13571, 13582, 13597,
+      13612, 13627, 13642, 13657, 13670, 13680, 13697, 13711, 13728, 13742, 13759, 13773, 13790,
+      13804, 13821, 13835, 13848, 13858, 13875, 13889, 13906, 13920, 13937, 13951, 13968, 13982,
+      13999, 14013, 14026, 14036, 14053, 14067, 14084, 14098, 14115, 14129, 14146, 14160, 14177,
+      14191, 14202, 14217, 14232, 14247, 14262, 14277, 14288, 14303, 14318, 14333, 14348, 14363,
+      14374, 14389, 14404, 14419, 14434, 14449, 14460, 14475, 14490, 14505, 14520, 14535, 14546,
+      14561, 14576, 14591, 14606, 14621, 14632, 14647, 14662, 14677, 14692, 14707, 14711, 14719,
+      14727, 14735, 14743, 14751, 14764, 14774, 14791, 14805, 14822, 14836, 14853, 14867, 14884,
+      14898, 14915, 14929, 14942, 14952, 14969, 14983, 15000, 15014, 15031, 15045, 15062, 15076,
+      15093, 15107, 15114, 15118, 15126, 15134, 15142, 15150, 15158, 15174, 15187, 15200, 15210,
+      15227, 15241, 15258, 15272, 15289, 15303, 15320, 15334, 15351, 15365, 15381, 15394, 15407,
+      15417, 15434, 15448, 15465, 15479, 15496, 15510, 15527, 15541, 15558, 15572, 15576, 15584,
+      15592, 15600, 15608, 15616, 15629, 15639, 15656, 15670, 15687, 15701, 15718, 15732, 15749,
+      15763, 15780, 15794, 15807, 15817, 15834, 15848, 15865, 15879, 15896, 15910, 15927, 15941,
+      15958, 15972, 15976, 15984, 15992, 16000, 16008, 16016, 16020, 16028, 16036, 16044, 16052,
+      16060, 16073, 16083, 16100, 16114, 16131, 16145, 16162, 16176, 16193, 16207, 16224, 16238,
+      16251, 16261, 16278, 16292, 16309, 16323, 16340, 16354, 16371, 16385, 16402, 16416, 16420,
+      16428, 16436, 16444, 16452, 16460, 16464, 16472, 16480, 16488, 16496, 16504, 16508, 16516,
+      16524, 16532, 16540, 16548, 16552, 16560, 16568, 16576, 16584, 16592, 16605, 16615, 16632,
+      16646, 16663, 16677, 16694, 16708, 16725, 16739, 16756, 16770, 16783, 16793, 16810, 16824,
+      16841, 16855, 16872, 16886, 16903, 16917, 16934, 16948, 16952, 16960, 16968, 16976, 16984,
+      16992, 16996, 17004, 17012, 17020, 17028, 17036, 17040, 17048, 17056, 17064, 17072, 17080,
+      17093, 17103, 17120, 17134, 17151, 17165, 17182, 17196, 17213, 17227, 17244, 17258, 17271,
+      17281, 17298, 17312, 17329, 17343, 17360, 17374, 17391, 17405, 17422, 17436, 17440, 17448,
+      17456, 17464, 17472, 17480, 17493, 17503, 17520, 17534, 17551, 17565, 17582, 17596, 17613,
+      17627, 17644, 17658, 17671, 17681, 17698, 17712, 17729, 17743, 17760, 17774, 17791, 17805,
+      17822, 17836, 17840, 17848, 17856, 17864, 17872, 17880, 17884, 17892, 17900, 17908, 17916,
+      17924, 17928, 17936, 17944, 17952, 17960, 17968, 17972, 17980, 17988, 17996, 18004, 18012,
+      18023, 18038, 18053, 18068, 18083, 18098, 18109, 18124, 18139, 18154, 18169, 18184, 18195,
+      18210, 18225, 18240, 18255, 18270, 18274, 18282, 18290, 18298, 18306, 18314, 18318, 18326,
+      18334, 18342, 18350, 18358, 18362, 18370, 18378, 18386, 18394, 18402, 18413, 18428, 18443,
+      18458, 18473, 18488, 18492, 18500, 18508, 18516, 18524, 18532, 18545, 18555, 18572, 18586,
+      18603, 18617, 18634, 18648, 18665, 18679, 18696, 18710, 18723, 18733, 18750, 18764, 18781,
+      18795, 18812, 18826, 18843, 18857, 18874, 18888, 18892, 18900, 18908, 18916, 18924, 18932,
+      18945, 18955, 18972, 18986, 19003, 19017, 19034, 19048, 19065, 19079, 19096, 19110, 19123,
+      19133, 19150, 19164, 19181, 19195, 19212, 19226, 19243, 19257, 19274, 19288, 19292, 19300,
+      19308, 19316, 19324, 19332, 19345, 19355, 19372, 19386, 19403, 19417, 19434, 19448, 19465,
+      19479, 19496, 19510, 19523, 19533, 19550, 19564, 19581, 19595, 19612, 19626, 19643, 19657,
+      19674, 19688, 19692, 19700, 19708, 19716, 19724, 19732, 19745, 19755, 19772, 19786, 19803,
+      19817, 19834, 19848, 19865, 19879, 19896, 19910, 19923, 19933, 19950, 19964, 19981, 19995,
+      20012, 20026, 20043, 20057, 20074, 20088, 20092, 20100, 20108, 20116, 20124, 20132, 20145,
+      20155, 20172, 20186, 20203, 20217, 20234, 20248, 20265, 20279, 20296, 20310, 20323, 20333,
+      20350, 20364, 20381, 20395, 20412, 20426, 20443, 20457, 20474, 20488, 20492, 20500, 20508,
+      20516, 20524, 20532, 20545, 20555, 20572, 20586, 20603, 20617, 20634, 20648, 20665, 20679,
+      20696, 20710, 20723, 20733, 20750, 20764, 20781, 20795, 20812, 20826, 20843, 20857, 20874,
+      20888, 20892, 20900, 20908, 20916, 20924, 20932, 20945, 20955, 20972, 20986, 21003, 21017,
+      21034, 21048, 21065, 21079, 21096, 21110, 21123, 21133, 21150, 21164, 21181, 21195, 21212,
+      21226, 21243, 21257, 21274, 21288, 21292, 21305, 21315, 21328, 21338, 21342, 21355, 21365,
+      21378, 21388, 21392, 21396, 21400, 21408, 21416, 21424, 21432, 21440, 21453, 21463, 21480,
+      21494, 21511, 21525, 21542, 21556, 21573, 21587, 21604, 21618, 21631, 21641, 21658, 21672,
+      21689, 21703, 21720, 21734, 21751, 21765, 21782, 21796, 21800, 21808, 21816, 21824, 21832,
+      21840, 21853, 21863, 21880, 21894, 21911, 21925, 21942, 21956, 21973, 21987, 22004, 22018,
+      22031, 22041, 22058, 22072, 22089, 22103, 22120, 22134, 22151, 22165, 22182, 22196, 22200,
+      22208, 22216, 22224, 22232, 22240, 22253, 22263, 22280, 22294, 22311, 22325, 22342, 22356,
+      22373, 22387, 22404, 22418, 22431, 22441, 22458, 22472, 22489, 22503, 22520, 22534, 22551,
+      22565, 22582, 22596, 22609, 22619, 22636, 22650, 22667, 22681, 22698, 22712, 22729, 22743,
+      22760, 22774, 22796, 22815, 22834, 22850, 22876, 22899, 22922, 22942, 22968, 22991, 23014,
+      23034, 23060, 23083, 23106, 23126, 23152, 23175, 23198, 23218, 23244, 23267, 23290, 23310,
+      23332, 23351, 23370, 23386, 23412, 23435, 23458, 23478, 23504, 23527, 23550, 23570, 23596,
+      23619, 23642, 23662, 23688, 23711, 23734, 23754, 23780, 23803, 23826, 23846, 23850, 23858,
+      23866, 23874, 23882, 23890, 23903, 23913, 23930, 23944, 23961, 23975, 23992, 24006, 24023,
+      24037, 24054, 24068, 24081, 24091, 24108, 24122, 24139, 24153, 24170, 24184, 24201, 24215,
+      24232, 24246, 24250, 24258, 24266, 24274, 24282, 24290, 24303, 24313, 24330, 24344, 24361,
+      24375, 24392, 24406, 24423, 24437, 24454, 24468, 24481, 24491, 24508, 24522, 24539, 24553,
+      24570, 24584, 24601, 24615, 24632, 24646, 24659, 24669, 24686, 24700, 24717, 24731, 24748,
+      24762, 24779, 24793, 24810, 24824, 24846, 24865, 24884, 24900, 24926, 24949, 24972, 24992,
+      25018, 25041, 25064, 25084, 25110, 25133, 25156, 25176, 25202, 25225, 25248, 25268, 25294,
+      25317, 25340, 25360, 25382, 25401, 25420, 25436, 25462, 25485, 25508, 25528, 25554, 25577,
+      25600, 25620, 25646, 25669, 25692, 25712, 25738, 25761, 25784, 25804, 25830, 25853, 25876,
+      25896, 25907, 25922, 25937, 25952, 25967, 25982, 26002, 26019, 26043, 26064, 26088, 26109,
+      26133, 26154, 26178, 26199, 26223, 26244, 26255, 26270, 26285, 26300, 26315, 26330, 26350,
+      26367, 26391, 26412, 26436, 26457, 26481, 26502, 26526, 26547, 26571, 26592, 26603, 26618,
+      26633, 26648, 26663, 26678, 26698, 26715, 26739, 26760, 26784, 26805, 26829, 26850, 26874,
+      26895, 26919, 26940, 26951, 26966, 26981, 26996, 27011, 27026, 27046, 27063, 27087, 27108,
+      27132, 27153, 27177, 27198, 27222, 27243, 27267, 27288, 27299, 27314, 27329, 27344, 27359,
+      27374, 27394, 27411, 27435, 27456, 27480, 27501, 27525, 27546, 27570, 27591, 27615, 27636,
+      27647, 27662, 27677, 27692, 27707, 27722, 27742, 27759, 27783, 27804, 27828, 27849, 27873,
+      27894, 27918, 27939, 27963, 27984, 27995, 28010, 28025, 28040, 28055, 28070, 28090, 28107,
+      28131, 28152, 28176, 28197, 28221, 28242, 28266, 28287, 28311, 28332, 28343, 28358, 28373,
+      28388, 28403, 28418, 28438, 28455, 28479, 28500, 28524, 28545, 28569, 28590, 28614, 28635,
+      28659, 28680, 28691, 28706, 28721, 28736, 28751, 28766, 28786, 28803, 28827, 28848, 28872,
+      28893, 28917, 28938, 28962, 28983, 29007, 29028, 29032, 29040, 29048, 29056, 29064, 29072,
+      29085, 29095, 29112, 29126, 29143, 29157, 29174, 29188, 29205, 29219, 29236, 29250, 29263,
+      29273, 29290, 29304, 29321, 29335, 29352, 29366, 29383, 29397, 29414, 29428, 29441, 29451,
+      29468, 29482, 29499, 29513, 29530, 29544, 29561, 29575, 29592, 29606, 29628, 29647, 29666,
+      29682, 29708, 29731, 29754, 29774, 29800, 29823, 29846, 29866, 29892, 29915, 29938, 29958,
+      29984, 30007, 30030, 30050, 30076, 30099, 30122, 30142, 30164, 30183, 30202, 30218, 30244,
+      30267, 30290, 30310, 30336, 30359, 30382, 30402, 30428, 30451, 30474, 30494, 30520, 30543,
+      30566, 30586, 30612, 30635, 30658, 30678, 30689, 30704, 30719, 30734, 30749, 30764, 30768,
+      30776, 30784, 30792, 30800, 30808, 30812, 30820, 30828, 30836, 30844, 30852, 30859, 30863,
+      30871, 30879, 30887, 30895, 30903, 30907, 30915, 30923, 30931, 30939, 30947, 30960, 30970,
+      30987, 31001, 31018, 31032, 31049, 31063, 31080, 31094, 31111, 31125, 31138, 31148, 31165,
+      31179, 31196, 31210, 31227, 31241, 31258, 31272, 31289, 31303, 31329, 31355, 31381, 31407,
+      31433, 31459, 31485, 31511, 31537, 31563, 31589, 31615, 31641, 31667, 31693, 31719, 31745,
+      31771, 31797, 31823, 31849, 31875, 31901, 31927, 31953, 31979, 32005, 32031, 32057, 32083,
+      32109, 32135, 32161, 32187, 32213, 32239, 32265, 32291, 32317, 32343, 32369, 32395, 32421,
+      32447, 32473, 32499, 32525, 32551, 32577, 32603, 32629, 32655, 32681, 32707, 32733, 32759,
+      32785, 32811, 32837, 32863, 32867, 32875, 32883, 32891, 32899, 32907, 32920, 32930, 32947,
+      32961, 32978, 32992, 33009, 33023, 33040, 33054, 33071, 33085, 33098, 33108, 33125, 33139,
+      33156, 33170, 33187, 33201, 33218, 33232, 33249, 33263, 33267, 33275, 33283, 33291, 33299,
+      33307, 33320, 33330, 33347, 33361, 33378, 33392, 33409, 33423, 33440, 33454, 33471, 33485,
+      33498, 33508, 33525, 33539, 33556, 33570, 33587, 33601, 33618, 33632, 33649, 33663, 33667,
+      33671, 33679, 33687, 33695, 33703, 33711, 33717, 33720, 33724, 33732, 33740, 33748, 33756,
+      33764, 33771, 33775, 33783, 33791, 33799, 33807, 33815, 33831, 33844, 33857, 33867, 33884,
+      33898, 33915, 33929, 33946, 33960, 33977, 33991, 34008, 34022, 34038, 34051, 34064, 34074,
+      34091, 34105, 34122, 34136, 34153, 34167, 34184, 34198, 34215, 34229, 34233, 34241, 34249,
+      34257, 34265, 34273, 34286, 34296, 34313, 34327, 34344, 34358, 34375, 34389, 34406, 34420,
+      34437, 34451, 34464, 34474, 34491, 34505, 34522, 34536, 34553, 34567, 34584, 34598, 34615,
+      34629, 34633, 34641, 34649, 34657, 34665, 34673, 34686, 34696, 34713, 34727, 34744, 34758,
+      34775, 34789, 34806, 34820, 34837, 34851, 34864, 34874, 34891, 34905, 34922, 34936, 34953,
+      34967, 34984, 34998, 35015, 35029, 35033, 35041, 35049, 35057, 35065, 35073, 35086, 35096,
+      35113, 35127, 35144, 35158, 35175, 35189, 35206, 35220, 35237, 35251, 35264, 35274, 35291,
+      35305, 35322, 35336, 35353, 35367, 35384, 35398, 35415, 35429, 35435, 35438, 35445, 35452,
+      35459, 35466, 35473, 35488, 35500, 35512, 35521, 35537, 35550, 35566, 35579, 35595, 35608,
+      35624, 35637, 35653, 35666, 35681, 35693, 35705, 35714, 35730, 35743, 35759, 35772, 35788,
+      35801, 35817, 35830, 35846, 35859, 35866, 35870, 35878, 35886, 35894, 35902, 35910, 35926,
+      35939, 35952, 35962, 35979, 35993, 36010, 36024, 36041, 36055, 36072, 36086, 36103, 36117,
+      36133, 36146, 36159, 36169, 36186, 36200, 36217, 36231, 36248, 36262, 36279, 36293, 36310,
+      36324, 36328, 36336, 36344, 36352, 36360, 36368, 36381, 36391, 36408, 36422, 36439, 36453,
+      36470, 36484, 36501, 36515, 36532, 36546, 36559, 36569, 36586, 36600, 36617, 36631, 36648,
+      36662, 36679, 36693, 36710, 36724, 36728, 36736, 36744, 36752, 36760, 36768, 36781, 36791,
+      36808, 36822, 36839, 36853, 36870, 36884, 36901, 36915, 36932, 36946, 36959, 36969, 36986,
+      37000, 37017, 37031, 37048, 37062, 37079, 37093, 37110, 37124, 37128, 37136, 37144, 37152,
+      37160, 37168, 37181, 37191, 37208, 37222, 37239, 37253, 37270, 37284, 37301, 37315, 37332,
+      37346, 37359, 37369, 37386, 37400, 37417, 37431, 37448, 37462, 37479, 37493, 37510, 37524,
+      37528, 37536, 37544, 37552, 37560, 37568, 37581, 37591, 37608, 37622, 37639, 37653, 37670,
+      37684, 37701, 37715, 37732, 37746, 37759, 37769, 37786, 37800, 37817, 37831, 37848, 37862,
+      37879, 37893, 37910, 37924, 37950, 37976, 38002, 38028, 38054, 38080, 38106, 38132, 38158,
+      38184, 38210, 38236, 38262, 38288, 38314, 38340, 38366, 38392, 38418, 38444, 38470, 38496,
+      38522, 38548, 38574, 38600, 38626, 38652, 38678, 38704, 38730, 38756, 38782, 38808, 38834,
+      38860, 38886, 38912, 38938, 38964, 38990, 39016, 39042, 39068, 39094, 39120, 39146, 39172,
+      39198, 39224, 39250, 39276, 39302, 39328, 39354, 39380, 39406, 39432, 39458, 39484, 39488,
+      39496, 39504, 39512, 39520, 39528, 39541, 39551, 39568, 39582, 39599, 39613, 39630, 39644,
+      39661, 39675, 39692, 39706, 39719, 39729, 39746, 39760, 39777, 39791, 39808, 39822, 39839,
+      39853, 39870, 39884, 39888, 39896, 39904, 39912, 39920, 39928, 39941, 39951, 39968, 39982,
+      39999, 40013, 40030, 40044, 40061, 40075, 40092, 40106, 40119, 40129, 40146, 40160, 40177,
+      40191, 40208, 40222, 40239, 40253, 40270, 40284, 40288, 40296, 40304, 40312, 40320, 40328,
+      40341, 40351, 40368, 40382, 40399, 40413, 40430, 40444, 40461, 40475, 40492, 40506, 40519,
+      40529, 40546, 40560, 40577, 40591, 40608, 40622, 40639, 40653, 40670, 40684, 40688, 40696,
+      40704, 40712, 40720, 40728, 40741, 40751, 40768, 40782, 40799, 40813, 40830, 40844, 40861,
+      40875, 40892, 40906, 40919, 40929, 40946, 40960, 40977, 40991, 41008, 41022, 41039, 41053,
+      41070, 41084, 41088, 41096, 41104, 41112, 41120, 41128, 41132, 41140, 41148, 41156, 41164,
+      41172, 41190, 41216, 41242, 41268, 41294, 41320, 41346, 41372, 41398, 41424, 41450, 41476,
+      41502, 41528, 41554, 41580, 41606, 41632, 41658, 41684, 41710, 41736, 41762, 41788, 41814,
+      41840, 41844, 41852, 41878, 41904, 41930, 41956, 41982, 41990, 42016, 42042, 42068, 42094,
+      42120, 42128, 42154, 42180, 42206, 42232, 42258, 42266, 42292, 42318, 42344, 42370, 42396,
+      42404, 42408, 42416, 42442, 42468, 42494, 42520, 42546, 42554, 42580, 42606, 42632, 42658,
+      42684, 42692, 42718, 42744, 42770, 42796, 42822, 42830, 42856, 42882, 42908, 42934, 42960,
+      42968, 42972, 42980, 43006, 43032, 43058, 43084, 43110, 43118, 43144, 43170, 43196, 43222,
+      43248, 43256, 43282, 43308, 43334, 43360, 43386, 43394, 43420, 43446, 43472, 43498, 43524,
+      43532, 43536, 43544, 43552, 43560, 43568, 43576, 43611, 43643, 43678, 43710, 43745, 43777,
+      43812, 43844, 43879, 43911, 43946, 43978, 44013, 44045, 44080, 44112, 44147, 44179, 44214,
+      44246, 44281, 44313, 44348, 44380, 44415, 44447, 44482, 44514, 44549, 44581, 44616, 44648,
+      44683, 44715, 44750, 44782, 44817, 44849, 44884, 44916, 44943, 44967, 45002, 45034, 45069,
+      45101, 45136, 45168, 45203, 45235, 45270, 45302, 45337, 45369, 45404, 45436, 45471, 45503,
+      45538, 45570, 45605, 45637, 45672, 45704, 45739, 45771, 45806, 45838, 45873, 45905, 45940,
+      45972, 46007, 46039, 46074, 46106, 46141, 46173, 46208, 46240, 46275, 46307, 46342, 46374,
+      46409, 46441, 46476, 46508, 46543, 46575, 46610, 46642, 46669, 46693, 46728, 46760, 46795,
+      46827, 46862, 46894, 46929, 46961, 46996, 47028, 47063, 47095, 47130, 47162, 47197, 47229,
+      47264, 47296, 47331, 47363, 47398, 47430, 47465, 47497, 47532, 47564, 47599, 47631, 47666,
+      47698, 47733, 47765, 47800, 47832, 47867, 47899, 47934, 47966, 48001, 48033, 48068, 48100,
+      48135, 48167, 48202, 48234, 48269, 48301, 48336, 48368, 48395, 48419, 48454, 48486, 48521,
+      48553, 48588, 48620, 48655, 48687, 48722, 48754, 48789, 48821, 48856, 48888, 48923, 48955,
+      48990, 49022, 49057, 49089, 49124, 49156, 49191, 49223, 49258, 49290, 49325, 49357, 49392,
+      49424, 49459, 49491, 49526, 49558, 49593, 49625, 49660, 49692, 49727, 49759, 49794, 49826,
+      49861, 49893, 49928, 49960, 49995, 50027, 50062, 50094, 50098, 50106, 50114, 50122, 50130,
+      50138, 50166, 50191, 50219, 50244, 50272, 50297, 50325, 50350, 50378, 50403, 50431, 50456,
+      50484, 50509, 50537, 50562, 50590, 50615, 50643, 50668, 50696, 50721, 50749, 50774, 50802,
+      50827, 50855, 50880, 50908, 50933, 50961, 50986, 51014, 51039, 51067, 51092, 51120, 51145,
+      51173, 51198, 51218, 51235, 51263, 51288, 51316, 51341, 51369, 51394, 51422, 51447, 51475,
+      51500, 51528, 51553, 51581, 51606, 51634, 51659, 51687, 51712, 51740, 51765, 51793, 51818,
+      51846, 51871, 51899, 51924, 51952, 51977, 52005, 52030, 52058, 52083, 52111, 52136, 52164,
+      52189, 52217, 52242, 52270, 52295, 52323, 52348, 52376, 52401, 52429, 52454, 52482, 52507,
+      52535, 52560, 52580, 52597, 52625, 52650, 52678, 52703, 52731, 52756, 52784, 52809, 52837,
+      52862, 52890, 52915, 52943, 52968, 52996, 53021, 53049, 53074, 53102, 53127, 53155, 53180,
+      53208, 53233, 53261, 53286, 53314, 53339, 53367, 53392, 53420, 53445, 53473, 53498, 53526,
+      53551, 53579, 53604, 53632, 53657, 53685, 53710, 53738, 53763, 53791, 53816, 53844, 53869,
+      53897, 53922, 53942, 53959, 53987, 54012, 54040, 54065, 54093, 54118, 54146, 54171, 54199,
+      54224, 54252, 54277, 54305, 54330, 54358, 54383, 54411, 54436, 54464, 54489, 54517, 54542,
+      54570, 54595, 54623, 54648, 54676, 54701, 54729, 54754, 54782, 54807, 54835, 54860, 54888,
+      54913, 54941, 54966, 54994, 55019, 55047, 55072, 55100, 55125, 55153, 55178, 55206, 55231,
+      55259, 55284, 55302, 55320, 55345, 55370, 55395, 55413, 55431, 55456, 55481, 55506, 55524,
+      55542, 55567, 55592, 55617, 55628, 55646, 55657, 55675, 55693, 55704, 55722, 55733, 55751,
+      55769, 55776, 55780, 55784, 55788, 55792, 55796, 55814, 55839, 55850, 55868, 55872, 55876,
+      55880, 55884, 55888, 55892, 55896, 55900, 55904, 55908, 55912, 55916, 55920, 55924, 55928,
+      55932, 55936, 55940, 55951, 55955, 55959, 55963, 55967, 55971, 55975, 55985, 55989, 55993,
+      55997, 56001, 56005, 56009, 56013, 56017, 56021, 56025, 56029, 56033, 56037, 56041, 56045,
+      56049, 56053, 56057, 56061, 56065, 56069, 56073, 56077, 56081, 56085, 56089, 56093, 56097,
+      56101, 56105, 56109, 56113, 56117, 56121, 56125, 56129, 56133, 56140, 56144, 56148, 56152,
+      56156, 56160, 56173, 56183, 56187, 56191, 56195, 56199, 56203, 56207, 56211, 56215, 56219,
+      56223, 56227, 56231, 56235, 56239, 56243, 56247, 56254, 56258, 56262, 56266, 56270, 56274,
+      56278, 56282, 56286, 56290, 56294, 56298, 56308, 56312, 56323, 56327, 56331, 56335, 56339,
+      56343, 56347, 56351, 56355, 56359, 56363, 56367, 56371, 56375, 56379, 56383, 56387, 56391,
+      56395, 56399, 56403, 56407, 56411, 56415, 56419, 56423, 56427, 56431, 56435, 56439, 56443,
+      56447, 56451, 56455, 56459, 56463, 56467, 56474, 56478, 56485, 56489, 56493, 56497, 56501,
+      56505, 56509, 56513, 56517, 56521, 56525, 56532, 56536, 56540, 56544, 56548, 56552, 56556,
+      56560, 56564, 56568, 56572, 56576, 56580, 56584, 56588, 56592, 56596, 56602, 56605, 56609,
+      56613, 56617, 56621, 56625, 56629, 56633, 56637, 56641, 56645, 56649, 56653, 56657, 56668,
+      56672, 56676, 56680, 56684, 56688, 56692, 56696, 56700, 56704, 56708, 56712, 56716, 56720,
+      56724, 56728, 56732, 56736, 56740, 56744, 56748, 56755, 56759, 56763, 56767, 56771, 56775,
+      56779, 56783, 56787, 56791, 56795, 56799, 56803, 56814, 56818, 56822, 56826, 56830, 56834,
+      56838, 56842, 56846, 56850, 56854, 56858, 56862, 56866, 56870, 56874, 56878, 56882, 56886,
+      56890, 56894, 56898, 56902, 56906, 56910, 56914, 56918, 56922, 56926, 56930, 56934, 56938,
+      56942, 56946, 56950, 56954, 56958, 56962, 56966, 56970, 56974, 56978, 56982, 56986, 56990,
+      56994, 56998, 57002, 57006, 57010, 57014, 57018, 57022, 57026, 57030, 57034, 57038, 57042,
+      57046, 57050, 57054, 57058, 57062, 57066, 57070, 57074, 57078, 57082, 57086, 57089, 57093,
+      57097, 57101, 57105, 57109, 57113, 57117, 57121, 57125, 57129, 57133, 57137, 57141, 57145,
+      57149, 57153, 57157, 57161, 57168, 57172, 57176, 57180, 57184, 57188, 57192, 57196, 57200,
+      57204, 57208, 57215, 57219, 57223, 57227, 57234, 57238, 57244, 57247, 57251, 57255, 57259,
+      57266, 57270, 57277, 57281, 57288, 57292, 57299, 57303, 57310, 57314, 57321, 57325, 57332,
+      57336, 57343, 57347, 57351, 57355, 57359, 57363, 57370, 57374, 57381, 57385, 57389, 57393,
+      57397, 57401, 57405, 57409, 57413, 57417, 57421, 57425, 57429, 57433, 57437, 57441, 57445,
+      57449, 57453, 57457, 57460, 57464, 57468, 57472, 57478, 57481, 57485, 57488, 57491, 57495,
+      57499, 57506, 57510, 57514, 57518, 57522, 57526, 57530, 57536, 57539, 57543, 57547, 57551,
+      57555, 57559, 57563, 57567, 57571, 57575, 57579, 57583, 57587, 57591, 57595, 57599, 57603,
+      57607, 57611, 57615, 57619, 57623, 57627, 57631, 57635, 57639, 57643, 57647, 57651, 57655,
+      57659, 57663, 57667, 57671, 57675, 57679, 57686, 57690, 57697, 57701, 57705, 57709, 57713,
+      57717, 57721, 57725, 57729, 57733, 57737, 57744, 57748, 57755, 57759, 57766, 57770, 57773,
+      57777, 57781, 57785, 57789, 57793, 57797, 57800, 57804, 57807, 57811, 57815, 57822, 57826,
+      57832, 57835, 57842, 57846, 57850, 57856, 57859, 57866, 57870, 57874, 57878, 57882, 57886,
+      57890, 57894, 57898, 57902, 57909, 57913, 57917, 57921, 57928, 57932, 57936, 57939, 57942,
+      57945, 57948, 57954, 57957, 57963, 57966, 57973, 57977, 57981, 57985, 57989, 57993, 57997,
+      58001, 58005, 58009, 58013, 58017, 58021, 58025, 58029, 58033, 58037, 58041, 58045, 58049,
+      58053, 58057, 58061, 58065, 58069, 58073, 58077, 58081, 58085, 58089, 58093, 58097, 58101,
+      58105, 58109, 58113, 58117, 58121, 58128, 58132, 58138, 58141, 58145, 58149, 58153, 58156,
+      58160, 58164, 58168, 58174, 58177, 58180, 58186, 58189, 58196, 58200, 58207, 58211, 58218,
+      58222, 58229, 58233, 58240, 58244, 58251, 58255, 58262, 58266, 58273, 58277, 58284, 58288,
+      58292, 58296, 58300, 58306, 58309, 58312, 58318, 58321, 58324, 58330, 58333, 58339, 58342,
+      58345, 58351, 58354, 58358, 58362, 58366, 58370, 58374, 58378, 58382, 58386, 58389, 58393,
+      58397, 58401, 58405, 58409, 58413, 58417, 58421, 58425, 58429, 58433, 58437, 58444, 58448,
+      58455, 58459, 58463, 58470, 58474, 58478, 58482, 58486, 58490, 58494, 58497, 58500, 58504,
+      58508, 58512, 58516, 58520, 58524, 58528, 58532, 58536, 58540, 58544, 58548, 58552, 58556,
+      58560, 58564, 58568, 58571, 58577, 58580, 58584, 58588, 58592, 58596, 58600, 58604, 58608,
+      58612, 58616, 58620, 58624, 58628, 58632, 58636, 58643, 58647, 58651, 58655, 58659, 58663,
+      58667, 58671, 58675, 58681, 58684, 58690, 58693, 58699, 58702, 58708, 58711, 58717, 58720,
+      58724, 58728, 58732, 58736, 58743, 58747, 58751, 58755, 58759, 58763, 58767, 58771, 58778,
+      58782, 58786, 58790, 58794, 58798, 58802, 58806, 58810, 58814, 58818, 58822, 58826, 58830,
+      58834, 58838, 58842, 58846, 58850, 58854, 58858, 58862, 58866, 58870, 58877, 58881, 58885,
+      58889, 58893, 58897, 58901, 58905, 58909, 58913, 58917, 58921, 58925, 58929, 58933, 58937,
+      58941, 58945, 58949, 58955, 58958, 58962, 58966, 58970, 58974, 58978, 58982, 58986, 58990,
+      58994, 58998, 59002, 59006, 59010, 59014, 59018, 59022, 59029, 59033, 59040, 59044, 59051,
+      59055, 59059, 59063, 59067, 59071, 59075, 59079, 59083, 59087, 59091, 59095, 59099, 59103,
+      59107, 59111, 59115, 59119, 59123, 59127, 59133, 59136, 59140, 59144, 59148, 59152, 59156,
+      59160, 59164, 59171, 59175, 59182, 59186, 59192, 59195, 59202, 59206, 59213, 59217, 59221,
+      59225, 59229, 59233, 59237, 59241, 59248, 59252, 59259, 59263, 59267, 59271, 59275, 59279,
+      59283, 59287, 59291, 59295, 59302, 59306, 59310, 59314, 59318, 59322, 59326, 59330, 59334,
+      59338, 59342, 59346, 59350, 59354, 59358, 59362, 59366, 59370, 59374, 59381, 59385, 59389,
+      59393, 59400, 59404, 59408, 59412, 59416, 59420, 59424, 59428, 59432, 59436, 59440, 59444,
+      59448, 59454, 59457, 59461, 59465, 59469, 59473, 59477, 59481, 59485, 59489, 59493, 59497,
+      59501, 59508, 59512, 59518, 59521, 59527, 59530, 59537, 59541, 59548, 59552, 59559, 59563,
+      59570, 59574, 59578, 59582, 59586, 59590, 59597, 59601, 59605, 59609, 59616, 59620, 59627,
+      59631, 59635, 59639, 59643, 59647, 59651, 59655, 59659, 59663, 59670, 59674, 59678, 59682,
+      59688, 59691, 59698, 59702, 59709, 59713, 59720, 59724, 59728, 59732, 59736, 59740, 59744,
+      59751, 59755, 59759, 59763, 59769, 59772, 59778, 59781, 59788, 59792, 59799, 59803, 59809,
+      59812, 59816, 59820, 59824, 59831, 59835, 59839, 59843, 59847, 59851, 59857, 59860, 59867,
+      59871, 59877, 59880, 59884, 59888, 59901, 59911, 59917, 59920, 59924, 59928, 59932, 59936,
+      59940, 59946, 59949, 59953, 59957, 59961, 59965, 59969, 59973, 59977, 59981, 59985, 59989,
+      59993, 59997, 60001, 60005, 60009, 60013, 60017, 60024, 60028, 60035, 60039, 60043, 60047,
+      60051, 60055, 60059, 60063, 60067, 60071, 60075, 60079, 60083, 60087, 60091, 60095, 60099,
+      60103, 60107, 60111, 60115, 60119, 60125, 60128, 60132, 60138, 60141, 60145, 60149, 60153,
+      60157, 60161, 60165, 60169, 60173, 60176, 60180, 60184, 60188, 60192, 60196, 60200, 60204,
+      60208, 60212, 60218, 60221, 60225, 60228, 60232, 60236, 60240, 60244, 60248, 60252, 60256,
+      60260, 60266, 60269, 60275, 60278, 60284, 60287, 60293, 60296, 60302, 60305, 60311, 60314,
+      60320, 60323, 60329, 60332, 60338, 60341, 60347, 60350, 60356, 60359, 60365, 60368, 60374,
+      60377, 60383, 60386, 60392, 60395, 60401, 60404, 60408, 60412, 60416, 60420, 60424, 60428,
+      60432, 60436, 60442, 60445, 60452, 60456, 60462, 60465, 60471, 60474, 60480, 60483, 60489,
+      60492, 60498, 60501, 60507, 60510, 60516, 60519, 60523, 60527, 60531, 60534, 60537, 60540,
+      60543, 60546, 60549, 60552, 60555, 60558, 60561, 60564, 60567, 60570, 60574, 60578, 60582,
+      60588, 60591, 60594, 60600, 60603, 60609, 60612, 60618, 60621, 60624, 60630, 60633, 60637,
+      60640, 60644, 60647, 60653, 60656, 60662, 60665, 60671, 60674, 60680, 60683, 60687, 60691,
+      60695, 60699, 60703, 60707, 60711, 60717, 60720, 60726, 60729, 60735, 60738, 60744, 60747,
+      60750, 60753, 60756, 60760, 60766, 60769, 60775, 60778, 60784, 60787, 60790, 60793, 60796,
+      60799, 60805, 60808, 60812, 60816, 60822, 60825, 60831, 60834, 60840, 60843, 60847, 60851,
+      60855, 60858, 60861, 60867, 60870, 60876, 60879, 60882, 60885, 60888, 60891, 60897, 60900,
+      60906, 60909, 60915, 60918, 60924, 60927, 60932, 60934, 60939, 60941, 60947, 60950, 60954,
+      60961, 60965, 60972, 60976, 60983, 60987, 60994, 60998, 61005, 61009, 61016, 61020, 61027,
+      61031, 61038, 61042, 61049, 61053, 61060, 61064, 61071, 61075, 61082, 61086, 61090, 61094,
+      61098, 61102, 61106, 61110, 61117, 61121, 61125, 61132, 61136, 61140, 61144, 61148, 61154,
+      61157, 61161, 61167, 61170, 61174, 61178, 61185, 61189, 61193, 61200, 61204, 61208, 61212,
+      61216, 61220, 61227, 61231, 61238, 61242, 61246, 61250, 61254, 61258, 61262, 61266, 61270,
+      61274, 61278, 61282, 61288, 61291, 61297, 61300, 61304, 61308, 61312, 61316, 61320, 61324,
+      61328, 61332, 61336, 61339, 61342, 61346, 61350, 61354, 61358, 61362, 61366, 61370, 61373,
+      61376, 61382, 61385, 61391, 61394, 61397, 61400, 61406, 61409, 61415, 61418, 61422, 61426,
+      61430, 61434, 61438, 61442, 61446, 61450, 61454, 61458, 61462, 61466, 61470, 61474, 61481,
+      61485, 61499, 61510, 61526, 61539, 61552, 61562, 61575, 61585, 61593, 61601, 61609, 61617,
+      61625, 61633, 61641, 61649, 61657, 61665, 61673, 61681, 61689, 61697, 61705, 61713, 61721,
+      61729, 61737, 61745, 61753, 61761, 61769, 61777, 61785, 61793, 61801, 61809, 61817, 61825,
+      61833, 61841, 61849, 61857, 61865, 61873, 61881, 61889, 61897, 61905, 61913, 61921, 61929,
+      61937, 61945, 61953, 61961, 61969, 61977, 61985, 61993, 62001, 62009, 62017, 62025, 62033,
+      62041, 62049, 62057, 62065, 62073, 62081, 62089, 62097, 62105, 62113, 62121, 62129, 62137,
+      62145, 62153, 62161, 62169, 62177, 62185, 62193, 62201, 62209, 62217, 62225, 62233, 62241,
+      62249, 62257, 62265, 62273, 62281, 62289, 62297, 62305, 62313, 62321, 62329, 62337, 62345,
+      62353, 62361, 62369, 62377, 62385, 62393, 62401, 62409, 62417, 62425, 62433, 62441, 62449,
+      62457, 62465, 62473, 62481, 62489, 62497, 62505, 62513, 62521, 62529, 62537, 62545, 62553,
+      62561, 62569, 62577, 62585, 62593, 62601, 62609, 62617, 62625, 62633, 62641, 62649, 62657,
+      62665, 62673, 62681, 62689, 62697, 62705, 62713, 62721, 62729, 62737, 62745, 62753, 62761,
+      62769, 62777, 62785, 62793, 62801, 62809, 62817, 62825, 62833, 62841, 62849, 62857, 62865,
+      62873, 62881, 62889, 62897, 62905, 62913, 62921, 62929, 62937, 62945, 62953, 62961, 62969,
+      62977, 62985, 62993, 63001, 63009, 63017, 63025, 63033, 63041, 63049, 63057, 63065, 63073,
+      63081, 63089, 63097, 63105, 63113, 63121, 63129, 63137, 63145, 63153, 63161, 63169, 63177,
+      63185, 63193, 63201, 63209, 63217, 63225, 63233, 63241, 63249, 63257, 63265, 63273, 63281,
+      63289, 63297, 63305, 63313, 63321, 63329, 63337, 63345, 63353, 63361, 63369, 63377, 63385,
+      63393, 63401, 63409, 63417, 63425, 63433, 63441, 63449, 63457, 63465, 63473, 63481, 63489,
+      63497, 63505, 63513, 63521, 63529, 63537, 63545, 63553, 63561, 63569, 63577, 63585, 63593,
+      63601, 63609, 63617, 63625, 63633, 63641, 63649, 63657, 63685, 63713, 63741,
+    };
+
+    // Emoji i is codePoints[codePointOffsets[i] .. codePointOffsets[i + 1])
+    inline constexpr char32_t codePoints[] = {
+      0x1F600, 0x1F603, 0x1F604, 0x1F601, 0x1F606, 0x1F605, 0x1F923, 0x1F602, 0x1F642, 0x1F643,
+      0x1FAE0, 0x1F609, 0x1F60A, 0x1F607, 0x1F970, 0x1F60D, 0x1F929, 0x1F618, 0x1F617, 0x263A,
+      0xFE0F, 0x263A, 0x1F61A, 0x1F619, 0x1F972, 0x1F60B, 0x1F61B, 0x1F61C, 0x1F92A, 0x1F61D,
+      0x1F911, 0x1F917, 0x1F92D, 0x1FAE2, 0x1FAE3, 0x1F92B, 0x1F914, 0x1FAE1, 0x1F910, 0x1F928,
+      0x1F610, 0x1F611, 0x1F636, 0x1FAE5, 0x1F636, 0x200D, 0x1F32B, 0xFE0F, 0x1F636, 0x200D,
+      0x1F32B, 0x1F60F, 0x1F612, 0x1F644, 0x1F62C, 0x1F62E, 0x200D, 0x1F4A8, 0x1F925, 0x1FAE8,
+      0x1F642, 0x200D, 0x2194, 0xFE0F, 0x1F642, 0x200D, 0x2194, 0x1F642, 0x200D, 0x2195, 0xFE0F,
+      0x1F642, 0x200D, 0x2195, 0x1F60C, 0x1F614, 0x1F62A, 0x1F924, 0x1F634, 0x1FAE9, 0x1F637,
+      0x1F912, 0x1F915, 0x1F922, 0x1F92E, 0x1F927, 0x1F975, 0x1F976, 0x1F974, 0x1F635, 0x1F635,
+      0x200D, 0x1F4AB, 0x1F92F, 0x1F920, 0x1F973, 0x1F978, 0x1F60E, 0x1F913, 0x1F9D0, 0x1F615,
+      0x1FAE4, 0x1F61F, 0x1F641, 0x2639, 0xFE0F, 0x2639, 0x1F62E, 0x1F62F, 0x1F632, 0x1F633,
+      0x1FAEA, 0x1F97A, 0x1F979, 0x1F626, 0x1F627, 0x1F628, 0x1F630, 0x1F625, 0x1F622, 0x1F62D,
+      0x1F631, 0x1F616, 0x1F623, 0x1F61E, 0x1F613, 0x1F629, 0x1F62B, 0x1F971, 0x1F624, 0x1F621,
+      0x1F620, 0x1F92C, 0x1F608, 0x1F47F, 0x1F480, 0x2620, 0xFE0F, 0x2620, 0x1F4A9, 0x1F921,
+      0x1F479, 0x1F47A, 0x1F47B, 0x1F47D, 0x1F47E, 0x1F916, 0x1F63A, 0x1F638, 0x1F639, 0x1F63B,
+      0x1F63C, 0x1F63D, 0x1F640, 0x1F63F, 0x1F63E, 0x1F648, 0x1F649, 0x1F64A, 0x1F48C, 0x1F498,
+      0x1F49D, 0x1F496, 0x1F497, 0x1F493, 0x1F49E, 0x1F495, 0x1F49F, 0x2763, 0xFE0F, 0x2763,
+      0x1F494, 0x2764, 0xFE0F, 0x200D, 0x1F525, 0x2764, 0x200D, 0x1F525, 0x2764, 0xFE0F, 0x200D,
+      0x1FA79, 0x2764, 0x200D, 0x1FA79, 0x2764, 0xFE0F, 0x2764, 0x1FA77, 0x1F9E1, 0x1F49B, 0x1F49A,
+      0x1F499, 0x1FA75, 0x1F49C, 0x1F90E, 0x1F5A4, 0x1FA76, 0x1F90D, 0x1F48B, 0x1F4AF, 0x1F4A2,
+      0x1FAEF, 0x1F4A5, 0x1F4AB, 0x1F4A6, 0x1F4A8, 0x1F573, 0xFE0F, 0x1F573, 0x1F4AC, 0x1F441,
+      0xFE0F, 0x200D, 0x1F5E8, 0xFE0F, 0x1F441, 0x200D, 0x1F5E8, 0xFE0F, 0x1F441, 0xFE0F, 0x200D,
+      0x1F5E8, 0x1F441, 0x200D, 0x1F5E8, 0x1F5E8, 0xFE0F, 0x1F5E8, 0x1F5EF, 0xFE0F, 0x1F5EF,
+      0x1F4AD, 0x1F4A4, 0x1F44B, 0x1F44B, 0x1F3FB, 0x1F44B, 0x1F3FC, 0x1F44B, 0x1F3FD, 0x1F44B,
+      0x1F3FE, 0x1F44B, 0x1F3FF, 0x1F91A, 0x1F91A, 0x1F3FB, 0x1F91A, 0x1F3FC, 0x1F91A, 0x1F3FD,
+      0x1F91A, 0x1F3FE, 0x1F91A, 0x1F3FF, 0x1F590, 0xFE0F, 0x1F590, 0x1F590, 0x1F3FB, 0x1F590,
+      0x1F3FC, 0x1F590, 0x1F3FD, 0x1F590, 0x1F3FE, 0x1F590, 0x1F3FF, 0x270B, 0x270B, 0x1F3FB,
+      0x270B, 0x1F3FC, 0x270B, 0x1F3FD, 0x270B, 0x1F3FE, 0x270B, 0x1F3FF, 0x1F596, 0x1F596,
+      0x1F3FB, 0x1F596, 0x1F3FC, 0x1F596, 0x1F3FD, 0x1F596, 0x1F3FE, 0x1F596, 0x1F3FF, 0x1FAF1,
+      0x1FAF1, 0x1F3FB, 0x1FAF1, 0x1F3FC, 0x1FAF1, 0x1F3FD, 0x1FAF1, 0x1F3FE, 0x1FAF1, 0x1F3FF,
+      0x1FAF2, 0x1FAF2, 0x1F3FB, 0x1FAF2, 0x1F3FC, 0x1FAF2, 0x1F3FD, 0x1FAF2, 0x1F3FE, 0x1FAF2,
+      0x1F3FF, 0x1FAF3, 0x1FAF3, 0x1F3FB, 0x1FAF3, 0x1F3FC, 0x1FAF3, 0x1F3FD, 0x1FAF3, 0x1F3FE,
+      0x1FAF3, 0x1F3FF, 0x1FAF4, 0x1FAF4, 0x1F3FB, 0x1FAF4, 0x1F3FC, 0x1FAF4, 0x1F3FD, 0x1FAF4,
+      0x1F3FE, 0x1FAF4, 0x1F3FF, 0x1FAF7, 0x1FAF7, 0x1F3FB, 0x1FAF7, 0x1F3FC, 0x1FAF7, 0x1F3FD,
+      0x1FAF7, 0x1F3FE, 0x1FAF7, 0x1F3FF, 0x1FAF8, 0x1FAF8, 0x1F3FB, 0x1FAF8, 0x1F3FC, 0x1FAF8,
+      0x1F3FD, 0x1FAF8, 0x1F3FE, 0x1FAF8, 0x1F3FF, 0x1F44C, 0x1F44C, 0x1F3FB, 0x1F44C, 0x1F3FC,
+      0x1F44C, 0x1F3FD, 0x1F44C, 0x1F3FE, 0x1F44C, 0x1F3FF, 0x1F90C, 0x1F90C, 0x1F3FB, 0x1F90C,
+      0x1F3FC, 0x1F90C, 0x1F3FD, 0x1F90C, 0x1F3FE, 0x1F90C, 0x1F3FF, 0x1F90F, 0x1F90F, 0x1F3FB,
+      0x1F90F, 0x1F3FC, 0x1F90F, 0x1F3FD, 0x1F90F, 0x1F3FE, 0x1F90F, 0x1F3FF, 0x270C, 0xFE0F,
+      0x270C, 0x270C, 0x1F3FB, 0x270C, 0x1F3FC, 0x270C, 0x1F3FD, 0x270C, 0x1F3FE, 0x270C, 0x1F3FF,
+      0x1F91E, 0x1F91E, 0x1F3FB, 0x1F91E, 0x1F3FC, 0x1F91E, 0x1F3FD, 0x1F91E, 0x1F3FE, 0x1F91E,
+      0x1F3FF, 0x1FAF0, 0x1FAF0, 0x1F3FB, 0x1FAF0, 0x1F3FC, 0x1FAF0, 0x1F3FD, 0x1FAF0, 0x1F3FE,
+      0x1FAF0, 0x1F3FF, 0x1F91F, 0x1F91F, 0x1F3FB, 0x1F91F, 0x1F3FC, 0x1F91F, 0x1F3FD, 0x1F91F,
+      0x1F3FE, 0x1F91F, 0x1F3FF, 0x1F918, 0x1F918, 0x1F3FB, 0x1F918, 0x1F3FC, 0x1F918, 0x1F3FD,
+      0x1F918, 0x1F3FE, 0x1F918, 0x1F3FF, 0x1F919, 0x1F919, 0x1F3FB, 0x1F919, 0x1F3FC, 0x1F919,
+      0x1F3FD, 0x1F919, 0x1F3FE, 0x1F919, 0x1F3FF, 0x1F448, 0x1F448, 0x1F3FB, 0x1F448, 0x1F3FC,
+      0x1F448, 0x1F3FD, 0x1F448, 0x1F3FE, 0x1F448, 0x1F3FF, 0x1F449, 0x1F449, 0x1F3FB, 0x1F449,
+      0x1F3FC, 0x1F449, 0x1F3FD, 0x1F449, 0x1F3FE, 0x1F449, 0x1F3FF, 0x1F446, 0x1F446, 0x1F3FB,
+      0x1F446, 0x1F3FC, 0x1F446, 0x1F3FD, 0x1F446, 0x1F3FE, 0x1F446, 0x1F3FF, 0x1F595, 0x1F595,
+      0x1F3FB, 0x1F595, 0x1F3FC, 0x1F595, 0x1F3FD, 0x1F595, 0x1F3FE, 0x1F595, 0x1F3FF, 0x1F447,
+      0x1F447, 0x1F3FB, 0x1F447, 0x1F3FC, 0x1F447, 0x1F3FD, 0x1F447, 0x1F3FE, 0x1F447, 0x1F3FF,
+      0x261D, 0xFE0F, 0x261D, 0x261D, 0x1F3FB, 0x261D, 0x1F3FC, 0x261D, 0x1F3FD, 0x261D, 0x1F3FE,
+      0x261D, 0x1F3FF, 0x1FAF5, 0x1FAF5, 0x1F3FB, 0x1FAF5, 0x1F3FC, 0x1FAF5, 0x1F3FD, 0x1FAF5,
+      0x1F3FE, 0x1FAF5, 0x1F3FF, 0x1F44D, 0x1F44D, 0x1F3FB, 0x1F44D, 0x1F3FC, 0x1F44D, 0x1F3FD,
+      0x1F44D, 0x1F3FE, 0x1F44D, 0x1F3FF, 0x1F44E, 0x1F44E, 0x1F3FB, 0x1F44E, 0x1F3FC, 0x1F44E,
+      0x1F3FD, 0x1F44E, 0x1F3FE, 0x1F44E, 0x1F3FF, 0x270A, 0x270A, 0x1F3FB, 0x270A, 0x1F3FC,
+      0x270A, 0x1F3FD, 0x270A, 0x1F3FE, 0x270A, 0x1F3FF, 0x1F44A, 0x1F44A, 0x1F3FB, 0x1F44A,
+      0x1F3FC, 0x1F44A, 0x1F3FD, 0x1F44A, 0x1F3FE, 0x1F44A, 0x1F3FF, 0x1F91B, 0x1F91B, 0x1F3FB,
+      0x1F91B, 0x1F3FC, 0x1F91B, 0x1F3FD, 0x1F91B, 0x1F3FE, 0x1F91B, 0x1F3FF, 0x1F91C, 0x1F91C,
+      0x1F3FB, 0x1F91C, 0x1F3FC, 0x1F91C, 0x1F3FD, 0x1F91C, 0x1F3FE, 0x1F91C, 0x1F3FF, 0x1F44F,
+      0x1F44F, 0x1F3FB, 0x1F44F, 0x1F3FC, 0x1F44F, 0x1F3FD, 0x1F44F, 0x1F3FE, 0x1F44F, 0x1F3FF,
+      0x1F64C, 0x1F64C, 0x1F3FB, 0x1F64C, 0x1F3FC, 0x1F64C, 0x1F3FD, 0x1F64C, 0x1F3FE, 0x1F64C,
+      0x1F3FF, 0x1FAF6, 0x1FAF6, 0x1F3FB, 0x1FAF6, 0x1F3FC, 0x1FAF6, 0x1F3FD, 0x1FAF6, 0x1F3FE,
+      0x1FAF6, 0x1F3FF, 0x1F450, 0x1F450, 0x1F3FB, 0x1F450, 0x1F3FC, 0x1F450, 0x1F3FD, 0x1F450,
+      0x1F3FE, 0x1F450, 0x1F3FF, 0x1F932, 0x1F932, 0x1F3FB, 0x1F932, 0x1F3FC, 0x1F932, 0x1F3FD,
+      0x1F932, 0x1F3FE, 0x1F932, 0x1F3FF, 0x1F91D, 0x1F91D, 0x1F3FB, 0x1F91D, 0x1F3FC, 0x1F91D,
+      0x1F3FD, 0x1F91D, 0x1F3FE, 0x1F91D, 0x1F3FF, 0x1FAF1, 0x1F3FB, 0x200D, 0x1FAF2, 0x1F3FC,
+      0x1FAF1, 0x1F3FB, 0x200D, 0x1FAF2, 0x1F3FD, 0x1FAF1, 0x1F3FB, 0x200D, 0x1FAF2, 0x1F3FE,
+      0x1FAF1, 0x1F3FB, 0x200D, 0x1FAF2, 0x1F3FF, 0x1FAF1, 0x1F3FC, 0x200D, 0x1FAF2, 0x1F3FB,
+      0x1FAF1, 0x1F3FC, 0x200D, 0x1FAF2, 0x1F3FD, 0x1FAF1, 0x1F3FC, 0x200D, 0x1FAF2, 0x1F3FE,
+      0x1FAF1, 0x1F3FC, 0x200D, 0x1FAF2, 0x1F3FF, 0x1FAF1, 0x1F3FD, 0x200D, 0x1FAF2, 0x1F3FB,
+      0x1FAF1, 0x1F3FD, 0x200D, 0x1FAF2, 0x1F3FC, 0x1FAF1, 0x1F3FD, 0x200D, 0x1FAF2, 0x1F3FE,
+      0x1FAF1, 0x1F3FD, 0x200D, 0x1FAF2, 0x1F3FF, 0x1FAF1, 0x1F3FE, 0x200D, 0x1FAF2, 0x1F3FB,
+      0x1FAF1, 0x1F3FE, 0x200D, 0x1FAF2, 0x1F3FC, 0x1FAF1, 0x1F3FE, 0x200D, 0x1FAF2, 0x1F3FD,
+      0x1FAF1, 0x1F3FE, 0x200D, 0x1FAF2, 0x1F3FF, 0x1FAF1, 0x1F3FF, 0x200D, 0x1FAF2, 0x1F3FB,
+      0x1FAF1, 0x1F3FF, 0x200D, 0x1FAF2, 0x1F3FC, 0x1FAF1, 0x1F3FF, 0x200D, 0x1FAF2, 0x1F3FD,
+      0x1FAF1, 0x1F3FF, 0x200D, 0x1FAF2, 0x1F3FE, 0x1F64F, 0x1F64F, 0x1F3FB, 0x1F64F, 0x1F3FC,
+      0x1F64F, 0x1F3FD, 0x1F64F, 0x1F3FE, 0x1F64F, 0x1F3FF, 0x270D, 0xFE0F, 0x270D, 0x270D,
+      0x1F3FB, 0x270D, 0x1F3FC, 0x270D, 0x1F3FD, 0x270D, 0x1F3FE, 0x270D, 0x1F3FF, 0x1F485,
+      0x1F485, 0x1F3FB, 0x1F485, 0x1F3FC, 0x1F485, 0x1F3FD, 0x1F485, 0x1F3FE, 0x1F485, 0x1F3FF,
+      0x1F933, 0x1F933, 0x1F3FB, 0x1F933, 0x1F3FC, 0x1F933, 0x1F3FD, 0x1F933, 0x1F3FE, 0x1F933,
+      0x1F3FF, 0x1F4AA, 0x1F4AA, 0x1F3FB, 0x1F4AA, 0x1F3FC, 0x1F4AA, 0x1F3FD, 0x1F4AA, 0x1F3FE,
+      0x1F4AA, 0x1F3FF, 0x1F9BE, 0x1F9BF, 0x1F9B5, 0x1F9B5, 0x1F3FB, 0x1F9B5, 0x1F3FC, 0x1F9B5,
+      0x1F3FD, 0x1F9B5, 0x1F3FE, 0x1F9B5, 0x1F3FF, 0x1F9B6, 0x1F9B6, 0x1F3FB, 0x1F9B6, 0x1F3FC,
+      0x1F9B6, 0x1F3FD, 0x1F9B6, 0x1F3FE, 0x1F9B6, 0x1F3FF, 0x1F442, 0x1F442, 0x1F3FB, 0x1F442,
+      0x1F3FC, 0x1F442, 0x1F3FD, 0x1F442, 0x1F3FE, 0x1F442, 0x1F3FF, 0x1F9BB, 0x1F9BB, 0x1F3FB,
+      0x1F9BB, 0x1F3FC, 0x1F9BB, 0x1F3FD, 0x1F9BB, 0x1F3FE, 0x1F9BB, 0x1F3FF, 0x1F443, 0x1F443,
+      0x1F3FB, 0x1F443, 0x1F3FC, 0x1F443, 0x1F3FD, 0x1F443, 0x1F3FE, 0x1F443, 0x1F3FF, 0x1F9E0,
+      0x1FAC0, 0x1FAC1, 0x1F9B7, 0x1F9B4, 0x1F440, 0x1F441, 0xFE0F, 0x1F441, 0x1F445, 0x1F444,
+      0x1FAE6, 0x1F476, 0x1F476, 0x1F3FB, 0x1F476, 0x1F3FC, 0x1F476, 0x1F3FD, 0x1F476, 0x1F3FE,
+      0x1F476, 0x1F3FF, 0x1F9D2, 0x1F9D2, 0x1F3FB, 0x1F9D2, 0x1F3FC, 0x1F9D2, 0x1F3FD, 0x1F9D2,
+      0x1F3FE, 0x1F9D2, 0x1F3FF, 0x1F466, 0x1F466, 0x1F3FB, 0x1F466, 0x1F3FC, 0x1F466, 0x1F3FD,
+      0x1F466, 0x1F3FE, 0x1F466, 0x1F3FF, 0x1F467, 0x1F467, 0x1F3FB, 0x1F467, 0x1F3FC, 0x1F467,
+      0x1F3FD, 0x1F467, 0x1F3FE, 0x1F467, 0x1F3FF, 0x1F9D1, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FF, 0x1F471, 0x1F471, 0x1F3FB, 0x1F471,
+      0x1F3FC, 0x1F471, 0x1F3FD, 0x1F471, 0x1F3FE, 0x1F471, 0x1F3FF, 0x1F468, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FF, 0x1F9D4, 0x1F9D4,
+      0x1F3FB, 0x1F9D4, 0x1F3FC, 0x1F9D4, 0x1F3FD, 0x1F9D4, 0x1F3FE, 0x1F9D4, 0x1F3FF, 0x1F9D4,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D4, 0x200D, 0x2642, 0x1F9D4, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x1F9D4, 0x1F3FB, 0x200D, 0x2642, 0x1F9D4, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9D4, 0x1F3FC,
+      0x200D, 0x2642, 0x1F9D4, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9D4, 0x1F3FD, 0x200D, 0x2642,
+      0x1F9D4, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9D4, 0x1F3FE, 0x200D, 0x2642, 0x1F9D4, 0x1F3FF,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D4, 0x1F3FF, 0x200D, 0x2642, 0x1F9D4, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D4, 0x200D, 0x2640, 0x1F9D4, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9D4, 0x1F3FB, 0x200D,
+      0x2640, 0x1F9D4, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9D4, 0x1F3FC, 0x200D, 0x2640, 0x1F9D4,
+      0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9D4, 0x1F3FD, 0x200D, 0x2640, 0x1F9D4, 0x1F3FE, 0x200D,
+      0x2640, 0xFE0F, 0x1F9D4, 0x1F3FE, 0x200D, 0x2640, 0x1F9D4, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D4, 0x1F3FF, 0x200D, 0x2640, 0x1F468, 0x200D, 0x1F9B0, 0x1F468, 0x1F3FB, 0x200D,
+      0x1F9B0, 0x1F468, 0x1F3FC, 0x200D, 0x1F9B0, 0x1F468, 0x1F3FD, 0x200D, 0x1F9B0, 0x1F468,
+      0x1F3FE, 0x200D, 0x1F9B0, 0x1F468, 0x1F3FF, 0x200D, 0x1F9B0, 0x1F468, 0x200D, 0x1F9B1,
+      0x1F468, 0x1F3FB, 0x200D, 0x1F9B1, 0x1F468, 0x1F3FC, 0x200D, 0x1F9B1, 0x1F468, 0x1F3FD,
+      0x200D, 0x1F9B1, 0x1F468, 0x1F3FE, 0x200D, 0x1F9B1, 0x1F468, 0x1F3FF, 0x200D, 0x1F9B1,
+      0x1F468, 0x200D, 0x1F9B3, 0x1F468, 0x1F3FB, 0x200D, 0x1F9B3, 0x1F468, 0x1F3FC, 0x200D,
+      0x1F9B3, 0x1F468, 0x1F3FD, 0x200D, 0x1F9B3, 0x1F468, 0x1F3FE, 0x200D, 0x1F9B3, 0x1F468,
+      0x1F3FF, 0x200D, 0x1F9B3, 0x1F468, 0x200D, 0x1F9B2, 0x1F468, 0x1F3FB, 0x200D, 0x1F9B2,
+      0x1F468, 0x1F3FC, 0x200D, 0x1F9B2, 0x1F468, 0x1F3FD, 0x200D, 0x1F9B2, 0x1F468, 0x1F3FE,
+      0x200D, 0x1F9B2, 0x1F468, 0x1F3FF, 0x200D, 0x1F9B2, 0x1F469, 0x1F469, 0x1F3FB, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FF, 0x1F469, 0x200D, 0x1F9B0,
+      0x1F469, 0x1F3FB, 0x200D, 0x1F9B0, 0x1F469, 0x1F3FC, 0x200D, 0x1F9B0, 0x1F469, 0x1F3FD,
+      0x200D, 0x1F9B0, 0x1F469, 0x1F3FE, 0x200D, 0x1F9B0, 0x1F469, 0x1F3FF, 0x200D, 0x1F9B0,
+      0x1F9D1, 0x200D, 0x1F9B0, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9B0, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F9B0, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9B0, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9B0, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x1F9B0, 0x1F469, 0x200D, 0x1F9B1, 0x1F469, 0x1F3FB, 0x200D, 0x1F9B1,
+      0x1F469, 0x1F3FC, 0x200D, 0x1F9B1, 0x1F469, 0x1F3FD, 0x200D, 0x1F9B1, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F9B1, 0x1F469, 0x1F3FF, 0x200D, 0x1F9B1, 0x1F9D1, 0x200D, 0x1F9B1, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F9B1, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9B1, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F9B1, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9B1, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9B1, 0x1F469,
+      0x200D, 0x1F9B3, 0x1F469, 0x1F3FB, 0x200D, 0x1F9B3, 0x1F469, 0x1F3FC, 0x200D, 0x1F9B3,
+      0x1F469, 0x1F3FD, 0x200D, 0x1F9B3, 0x1F469, 0x1F3FE, 0x200D, 0x1F9B3, 0x1F469, 0x1F3FF,
+      0x200D, 0x1F9B3, 0x1F9D1, 0x200D, 0x1F9B3, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9B3, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x1F9B3, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9B3, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1F9B3, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9B3, 0x1F469, 0x200D, 0x1F9B2, 0x1F469, 0x1F3FB,
+      0x200D, 0x1F9B2, 0x1F469, 0x1F3FC, 0x200D, 0x1F9B2, 0x1F469, 0x1F3FD, 0x200D, 0x1F9B2,
+      0x1F469, 0x1F3FE, 0x200D, 0x1F9B2, 0x1F469, 0x1F3FF, 0x200D, 0x1F9B2, 0x1F9D1, 0x200D,
+      0x1F9B2, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9B2, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9B2, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F9B2, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9B2, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x1F9B2, 0x1F471, 0x200D, 0x2640, 0xFE0F, 0x1F471, 0x200D, 0x2640, 0x1F471, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F471, 0x1F3FB, 0x200D, 0x2640, 0x1F471, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F471, 0x1F3FC, 0x200D, 0x2640, 0x1F471, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F471, 0x1F3FD,
+      0x200D, 0x2640, 0x1F471, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F471, 0x1F3FE, 0x200D, 0x2640,
+      0x1F471, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F471, 0x1F3FF, 0x200D, 0x2640, 0x1F471, 0x200D,
+      0x2642, 0xFE0F, 0x1F471, 0x200D, 0x2642, 0x1F471, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F471,
+      0x1F3FB, 0x200D, 0x2642, 0x1F471, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F471, 0x1F3FC, 0x200D,
+      0x2642, 0x1F471, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F471, 0x1F3FD, 0x200D, 0x2642, 0x1F471,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F471, 0x1F3FE, 0x200D, 0x2642, 0x1F471, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F471, 0x1F3FF, 0x200D, 0x2642, 0x1F9D3, 0x1F9D3, 0x1F3FB, 0x1F9D3,
+      0x1F3FC, 0x1F9D3, 0x1F3FD, 0x1F9D3, 0x1F3FE, 0x1F9D3, 0x1F3FF, 0x1F474, 0x1F474, 0x1F3FB,
+      0x1F474, 0x1F3FC, 0x1F474, 0x1F3FD, 0x1F474, 0x1F3FE, 0x1F474, 0x1F3FF, 0x1F475, 0x1F475,
+      0x1F3FB, 0x1F475, 0x1F3FC, 0x1F475, 0x1F3FD, 0x1F475, 0x1F3FE, 0x1F475, 0x1F3FF, 0x1F64D,
+      0x1F64D, 0x1F3FB, 0x1F64D, 0x1F3FC, 0x1F64D, 0x1F3FD, 0x1F64D, 0x1F3FE, 0x1F64D, 0x1F3FF,
+      0x1F64D, 0x200D, 0x2642, 0xFE0F, 0x1F64D, 0x200D, 0x2642, 0x1F64D, 0x1F3FB, 0x200D, 0x2642,
+      0xFE0F, 0x1F64D, 0x1F3FB, 0x200D, 0x2642, 0x1F64D, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F64D,
+      0x1F3FC, 0x200D, 0x2642, 0x1F64D, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F64D, 0x1F3FD, 0x200D,
+      0x2642, 0x1F64D, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F64D, 0x1F3FE, 0x200D, 0x2642, 0x1F64D,
+      0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F64D, 0x1F3FF, 0x200D, 0x2642, 0x1F64D, 0x200D, 0x2640,
+      0xFE0F, 0x1F64D, 0x200D, 0x2640, 0x1F64D, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F64D, 0x1F3FB,
+      0x200D, 0x2640, 0x1F64D, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F64D, 0x1F3FC, 0x200D, 0x2640,
+      0x1F64D, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F64D, 0x1F3FD, 0x200D, 0x2640, 0x1F64D, 0x1F3FE,
+      0x200D, 0x2640, 0xFE0F, 0x1F64D, 0x1F3FE, 0x200D, 0x2640, 0x1F64D, 0x1F3FF, 0x200D, 0x2640,
+      0xFE0F, 0x1F64D, 0x1F3FF, 0x200D, 0x2640, 0x1F64E, 0x1F64E, 0x1F3FB, 0x1F64E, 0x1F3FC,
+      0x1F64E, 0x1F3FD, 0x1F64E, 0x1F3FE, 0x1F64E, 0x1F3FF, 0x1F64E, 0x200D, 0x2642, 0xFE0F,
+      0x1F64E, 0x200D, 0x2642, 0x1F64E, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F64E, 0x1F3FB, 0x200D,
+      0x2642, 0x1F64E, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F64E, 0x1F3FC, 0x200D, 0x2642, 0x1F64E,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F64E, 0x1F3FD, 0x200D, 0x2642, 0x1F64E, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F64E, 0x1F3FE, 0x200D, 0x2642, 0x1F64E, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F64E, 0x1F3FF, 0x200D, 0x2642, 0x1F64E, 0x200D, 0x2640, 0xFE0F, 0x1F64E, 0x200D, 0x2640,
+      0x1F64E, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F64E, 0x1F3FB, 0x200D, 0x2640, 0x1F64E, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x1F64E, 0x1F3FC, 0x200D, 0x2640, 0x1F64E, 0x1F3FD, 0x200D, 0x2640,
+      0xFE0F, 0x1F64E, 0x1F3FD, 0x200D, 0x2640, 0x1F64E, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F64E,
+      0x1F3FE, 0x200D, 0x2640, 0x1F64E, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F64E, 0x1F3FF, 0x200D,
+      0x2640, 0x1F645, 0x1F645, 0x1F3FB, 0x1F645, 0x1F3FC, 0x1F645, 0x1F3FD, 0x1F645, 0x1F3FE,
+      0x1F645, 0x1F3FF, 0x1F645, 0x200D, 0x2642, 0xFE0F, 0x1F645, 0x200D, 0x2642, 0x1F645, 0x1F3FB,
+      0x200D, 0x2642, 0xFE0F, 0x1F645, 0x1F3FB, 0x200D, 0x2642, 0x1F645, 0x1F3FC, 0x200D, 0x2642,
+      0xFE0F, 0x1F645, 0x1F3FC, 0x200D, 0x2642, 0x1F645, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F645,
+      0x1F3FD, 0x200D, 0x2642, 0x1F645, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F645, 0x1F3FE, 0x200D,
+      0x2642, 0x1F645, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F645, 0x1F3FF, 0x200D, 0x2642, 0x1F645,
+      0x200D, 0x2640, 0xFE0F, 0x1F645, 0x200D, 0x2640, 0x1F645, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F645, 0x1F3FB, 0x200D, 0x2640, 0x1F645, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F645, 0x1F3FC,
+      0x200D, 0x2640, 0x1F645, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F645, 0x1F3FD, 0x200D, 0x2640,
+      0x1F645, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F645, 0x1F3FE, 0x200D, 0x2640, 0x1F645, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F645, 0x1F3FF, 0x200D, 0x2640, 0x1F646, 0x1F646, 0x1F3FB, 0x1F646,
+      0x1F3FC, 0x1F646, 0x1F3FD, 0x1F646, 0x1F3FE, 0x1F646, 0x1F3FF, 0x1F646, 0x200D, 0x2642,
+      0xFE0F, 0x1F646, 0x200D, 0x2642, 0x1F646, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F646, 0x1F3FB,
+      0x200D, 0x2642, 0x1F646, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F646, 0x1F3FC, 0x200D, 0x2642,
+      0x1F646, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F646, 0x1F3FD, 0x200D, 0x2642, 0x1F646, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F646, 0x1F3FE, 0x200D, 0x2642, 0x1F646, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F646, 0x1F3FF, 0x200D, 0x2642, 0x1F646, 0x200D, 0x2640, 0xFE0F, 0x1F646, 0x200D,
+      0x2640, 0x1F646, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F646, 0x1F3FB, 0x200D, 0x2640, 0x1F646,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F646, 0x1F3FC, 0x200D, 0x2640, 0x1F646, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F646, 0x1F3FD, 0x200D, 0x2640, 0x1F646, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F646, 0x1F3FE, 0x200D, 0x2640, 0x1F646, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F646, 0x1F3FF,
+      0x200D, 0x2640, 0x1F481, 0x1F481, 0x1F3FB, 0x1F481, 0x1F3FC, 0x1F481, 0x1F3FD, 0x1F481,
+      0x1F3FE, 0x1F481, 0x1F3FF, 0x1F481, 0x200D, 0x2642, 0xFE0F, 0x1F481, 0x200D, 0x2642, 0x1F481,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F481, 0x1F3FB, 0x200D, 0x2642, 0x1F481, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x1F481, 0x1F3FC, 0x200D, 0x2642, 0x1F481, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x1F481, 0x1F3FD, 0x200D, 0x2642, 0x1F481, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F481, 0x1F3FE,
+      0x200D, 0x2642, 0x1F481, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F481, 0x1F3FF, 0x200D, 0x2642,
+      0x1F481, 0x200D, 0x2640, 0xFE0F, 0x1F481, 0x200D, 0x2640, 0x1F481, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x1F481, 0x1F3FB, 0x200D, 0x2640, 0x1F481, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F481,
+      0x1F3FC, 0x200D, 0x2640, 0x1F481, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F481, 0x1F3FD, 0x200D,
+      0x2640, 0x1F481, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F481, 0x1F3FE, 0x200D, 0x2640, 0x1F481,
+      0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F481, 0x1F3FF, 0x200D, 0x2640, 0x1F64B, 0x1F64B, 0x1F3FB,
+      0x1F64B, 0x1F3FC, 0x1F64B, 0x1F3FD, 0x1F64B, 0x1F3FE, 0x1F64B, 0x1F3FF, 0x1F64B, 0x200D,
+      0x2642, 0xFE0F, 0x1F64B, 0x200D, 0x2642, 0x1F64B, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F64B,
+      0x1F3FB, 0x200D, 0x2642, 0x1F64B, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F64B, 0x1F3FC, 0x200D,
+      0x2642, 0x1F64B, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F64B, 0x1F3FD, 0x200D, 0x2642, 0x1F64B,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F64B, 0x1F3FE, 0x200D, 0x2642, 0x1F64B, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F64B, 0x1F3FF, 0x200D, 0x2642, 0x1F64B, 0x200D, 0x2640, 0xFE0F, 0x1F64B,
+      0x200D, 0x2640, 0x1F64B, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F64B, 0x1F3FB, 0x200D, 0x2640,
+      0x1F64B, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F64B, 0x1F3FC, 0x200D, 0x2640, 0x1F64B, 0x1F3FD,
+      0x200D, 0x2640, 0xFE0F, 0x1F64B, 0x1F3FD, 0x200D, 0x2640, 0x1F64B, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x1F64B, 0x1F3FE, 0x200D, 0x2640, 0x1F64B, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F64B,
+      0x1F3FF, 0x200D, 0x2640, 0x1F9CF, 0x1F9CF, 0x1F3FB, 0x1F9CF, 0x1F3FC, 0x1F9CF, 0x1F3FD,
+      0x1F9CF, 0x1F3FE, 0x1F9CF, 0x1F3FF, 0x1F9CF, 0x200D, 0x2642, 0xFE0F, 0x1F9CF, 0x200D, 0x2642,
+      0x1F9CF, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9CF, 0x1F3FB, 0x200D, 0x2642, 0x1F9CF, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F9CF, 0x1F3FC, 0x200D, 0x2642, 0x1F9CF, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F9CF, 0x1F3FD, 0x200D, 0x2642, 0x1F9CF, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9CF,
+      0x1F3FE, 0x200D, 0x2642, 0x1F9CF, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9CF, 0x1F3FF, 0x200D,
+      0x2642, 0x1F9CF, 0x200D, 0x2640, 0xFE0F, 0x1F9CF, 0x200D, 0x2640, 0x1F9CF, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F9CF, 0x1F3FB, 0x200D, 0x2640, 0x1F9CF, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F9CF, 0x1F3FC, 0x200D, 0x2640, 0x1F9CF, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9CF, 0x1F3FD,
+      0x200D, 0x2640, 0x1F9CF, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9CF, 0x1F3FE, 0x200D, 0x2640,
+      0x1F9CF, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9CF, 0x1F3FF, 0x200D, 0x2640, 0x1F647, 0x1F647,
+      0x1F3FB, 0x1F647, 0x1F3FC, 0x1F647, 0x1F3FD, 0x1F647, 0x1F3FE, 0x1F647, 0x1F3FF, 0x1F647,
+      0x200D, 0x2642, 0xFE0F, 0x1F647, 0x200D, 0x2642, 0x1F647, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x1F647, 0x1F3FB, 0x200D, 0x2642, 0x1F647, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F647, 0x1F3FC,
+      0x200D, 0x2642, 0x1F647, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F647, 0x1F3FD, 0x200D, 0x2642,
+      0x1F647, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F647, 0x1F3FE, 0x200D, 0x2642, 0x1F647, 0x1F3FF,
+      0x200D, 0x2642, 0xFE0F, 0x1F647, 0x1F3FF, 0x200D, 0x2642, 0x1F647, 0x200D, 0x2640, 0xFE0F,
+      0x1F647, 0x200D, 0x2640, 0x1F647, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F647, 0x1F3FB, 0x200D,
+      0x2640, 0x1F647, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F647, 0x1F3FC, 0x200D, 0x2640, 0x1F647,
+      0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F647, 0x1F3FD, 0x200D, 0x2640, 0x1F647, 0x1F3FE, 0x200D,
+      0x2640, 0xFE0F, 0x1F647, 0x1F3FE, 0x200D, 0x2640, 0x1F647, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x1F647, 0x1F3FF, 0x200D, 0x2640, 0x1F926, 0x1F926, 0x1F3FB, 0x1F926, 0x1F3FC, 0x1F926,
+      0x1F3FD, 0x1F926, 0x1F3FE, 0x1F926, 0x1F3FF, 0x1F926, 0x200D, 0x2642, 0xFE0F, 0x1F926,
+      0x200D, 0x2642, 0x1F926, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F926, 0x1F3FB, 0x200D, 0x2642,
+      0x1F926, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F926, 0x1F3FC, 0x200D, 0x2642, 0x1F926, 0x1F3FD,
+      0x200D, 0x2642, 0xFE0F, 0x1F926, 0x1F3FD, 0x200D, 0x2642, 0x1F926, 0x1F3FE, 0x200D, 0x2642,
+      0xFE0F, 0x1F926, 0x1F3FE, 0x200D, 0x2642, 0x1F926, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F926,
+      0x1F3FF, 0x200D, 0x2642, 0x1F926, 0x200D, 0x2640, 0xFE0F, 0x1F926, 0x200D, 0x2640, 0x1F926,
+      0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F926, 0x1F3FB, 0x200D, 0x2640, 0x1F926, 0x1F3FC, 0x200D,
+      0x2640, 0xFE0F, 0x1F926, 0x1F3FC, 0x200D, 0x2640, 0x1F926, 0x1F3FD, 0x200D, 0x2640, 0xFE0F,
+      0x1F926, 0x1F3FD, 0x200D, 0x2640, 0x1F926, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F926, 0x1F3FE,
+      0x200D, 0x2640, 0x1F926, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F926, 0x1F3FF, 0x200D, 0x2640,
+      0x1F937, 0x1F937, 0x1F3FB, 0x1F937, 0x1F3FC, 0x1F937, 0x1F3FD, 0x1F937, 0x1F3FE, 0x1F937,
+      0x1F3FF, 0x1F937, 0x200D, 0x2642, 0xFE0F, 0x1F937, 0x200D, 0x2642, 0x1F937, 0x1F3FB, 0x200D,
+      0x2642, 0xFE0F, 0x1F937, 0x1F3FB, 0x200D, 0x2642, 0x1F937, 0x1F3FC, 0x200D, 0x2642, 0xFE0F,
+      0x1F937, 0x1F3FC, 0x200D, 0x2642, 0x1F937, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F937, 0x1F3FD,
+      0x200D, 0x2642, 0x1F937, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F937, 0x1F3FE, 0x200D, 0x2642,
+      0x1F937, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F937, 0x1F3FF, 0x200D, 0x2642, 0x1F937, 0x200D,
+      0x2640, 0xFE0F, 0x1F937, 0x200D, 0x2640, 0x1F937, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F937,
+      0x1F3FB, 0x200D, 0x2640, 0x1F937, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F937, 0x1F3FC, 0x200D,
+      0x2640, 0x1F937, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F937, 0x1F3FD, 0x200D, 0x2640, 0x1F937,
+      0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F937, 0x1F3FE, 0x200D, 0x2640, 0x1F937, 0x1F3FF, 0x200D,
+      0x2640, 0xFE0F, 0x1F937, 0x1F3FF, 0x200D, 0x2640, 0x1F9D1, 0x200D, 0x2695, 0xFE0F, 0x1F9D1,
+      0x200D, 0x2695, 0x1F9D1, 0x1F3FB, 0x200D, 0x2695, 0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D, 0x2695,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x2695, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D, 0x2695, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x2695, 0xFE0F, 0x1F9D1, 0x1F3FD, 0x200D, 0x2695, 0x1F9D1, 0x1F3FE, 0x200D, 0x2695,
+      0xFE0F, 0x1F9D1, 0x1F3FE, 0x200D, 0x2695, 0x1F9D1, 0x1F3FF, 0x200D, 0x2695, 0xFE0F, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x2695, 0x1F468, 0x200D, 0x2695, 0xFE0F, 0x1F468, 0x200D, 0x2695, 0x1F468,
+      0x1F3FB, 0x200D, 0x2695, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D, 0x2695, 0x1F468, 0x1F3FC, 0x200D,
+      0x2695, 0xFE0F, 0x1F468, 0x1F3FC, 0x200D, 0x2695, 0x1F468, 0x1F3FD, 0x200D, 0x2695, 0xFE0F,
+      0x1F468, 0x1F3FD, 0x200D, 0x2695, 0x1F468, 0x1F3FE, 0x200D, 0x2695, 0xFE0F, 0x1F468, 0x1F3FE,
+      0x200D, 0x2695, 0x1F468, 0x1F3FF, 0x200D, 0x2695, 0xFE0F, 0x1F468, 0x1F3FF, 0x200D, 0x2695,
+      0x1F469, 0x200D, 0x2695, 0xFE0F, 0x1F469, 0x200D, 0x2695, 0x1F469, 0x1F3FB, 0x200D, 0x2695,
+      0xFE0F, 0x1F469, 0x1F3FB, 0x200D, 0x2695, 0x1F469, 0x1F3FC, 0x200D, 0x2695, 0xFE0F, 0x1F469,
+      0x1F3FC, 0x200D, 0x2695, 0x1F469, 0x1F3FD, 0x200D, 0x2695, 0xFE0F, 0x1F469, 0x1F3FD, 0x200D,
+      0x2695, 0x1F469, 0x1F3FE, 0x200D, 0x2695, 0xFE0F, 0x1F469, 0x1F3FE, 0x200D, 0x2695, 0x1F469,
+      0x1F3FF, 0x200D, 0x2695, 0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x2695, 0x1F9D1, 0x200D, 0x1F393,
+      0x1F9D1, 0x1F3FB, 0x200D, 0x1F393, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F393, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1F393, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F393, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F393,
+      0x1F468, 0x200D, 0x1F393, 0x1F468, 0x1F3FB, 0x200D, 0x1F393, 0x1F468, 0x1F3FC, 0x200D,
+      0x1F393, 0x1F468, 0x1F3FD, 0x200D, 0x1F393, 0x1F468, 0x1F3FE, 0x200D, 0x1F393, 0x1F468,
+      0x1F3FF, 0x200D, 0x1F393, 0x1F469, 0x200D, 0x1F393, 0x1F469, 0x1F3FB, 0x200D, 0x1F393,
+      0x1F469, 0x1F3FC, 0x200D, 0x1F393, 0x1F469, 0x1F3FD, 0x200D, 0x1F393, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F393, 0x1F469, 0x1F3FF, 0x200D, 0x1F393, 0x1F9D1, 0x200D, 0x1F3EB, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F3EB, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F3EB, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F3EB, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F3EB, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F3EB, 0x1F468,
+      0x200D, 0x1F3EB, 0x1F468, 0x1F3FB, 0x200D, 0x1F3EB, 0x1F468, 0x1F3FC, 0x200D, 0x1F3EB,
+      0x1F468, 0x1F3FD, 0x200D, 0x1F3EB, 0x1F468, 0x1F3FE, 0x200D, 0x1F3EB, 0x1F468, 0x1F3FF,
+      0x200D, 0x1F3EB, 0x1F469, 0x200D, 0x1F3EB, 0x1F469, 0x1F3FB, 0x200D, 0x1F3EB, 0x1F469,
+      0x1F3FC, 0x200D, 0x1F3EB, 0x1F469, 0x1F3FD, 0x200D, 0x1F3EB, 0x1F469, 0x1F3FE, 0x200D,
+      0x1F3EB, 0x1F469, 0x1F3FF, 0x200D, 0x1F3EB, 0x1F9D1, 0x200D, 0x2696, 0xFE0F, 0x1F9D1, 0x200D,
+      0x2696, 0x1F9D1, 0x1F3FB, 0x200D, 0x2696, 0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D, 0x2696, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x2696, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D, 0x2696, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x2696, 0xFE0F, 0x1F9D1, 0x1F3FD, 0x200D, 0x2696, 0x1F9D1, 0x1F3FE, 0x200D, 0x2696, 0xFE0F,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x2696, 0x1F9D1, 0x1F3FF, 0x200D, 0x2696, 0xFE0F, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x2696, 0x1F468, 0x200D, 0x2696, 0xFE0F, 0x1F468, 0x200D, 0x2696, 0x1F468, 0x1F3FB,
+      0x200D, 0x2696, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D, 0x2696, 0x1F468, 0x1F3FC, 0x200D, 0x2696,
+      0xFE0F, 0x1F468, 0x1F3FC, 0x200D, 0x2696, 0x1F468, 0x1F3FD, 0x200D, 0x2696, 0xFE0F, 0x1F468,
+      0x1F3FD, 0x200D, 0x2696, 0x1F468, 0x1F3FE, 0x200D, 0x2696, 0xFE0F, 0x1F468, 0x1F3FE, 0x200D,
+      0x2696, 0x1F468, 0x1F3FF, 0x200D, 0x2696, 0xFE0F, 0x1F468, 0x1F3FF, 0x200D, 0x2696, 0x1F469,
+      0x200D, 0x2696, 0xFE0F, 0x1F469, 0x200D, 0x2696, 0x1F469, 0x1F3FB, 0x200D, 0x2696, 0xFE0F,
+      0x1F469, 0x1F3FB, 0x200D, 0x2696, 0x1F469, 0x1F3FC, 0x200D, 0x2696, 0xFE0F, 0x1F469, 0x1F3FC,
+      0x200D, 0x2696, 0x1F469, 0x1F3FD, 0x200D, 0x2696, 0xFE0F, 0x1F469, 0x1F3FD, 0x200D, 0x2696,
+      0x1F469, 0x1F3FE, 0x200D, 0x2696, 0xFE0F, 0x1F469, 0x1F3FE, 0x200D, 0x2696, 0x1F469, 0x1F3FF,
+      0x200D, 0x2696, 0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x2696, 0x1F9D1, 0x200D, 0x1F33E, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F33E, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F33E, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F33E, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F33E, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F33E, 0x1F468,
+      0x200D, 0x1F33E, 0x1F468, 0x1F3FB, 0x200D, 0x1F33E, 0x1F468, 0x1F3FC, 0x200D, 0x1F33E,
+      0x1F468, 0x1F3FD, 0x200D, 0x1F33E, 0x1F468, 0x1F3FE, 0x200D, 0x1F33E, 0x1F468, 0x1F3FF,
+      0x200D, 0x1F33E, 0x1F469, 0x200D, 0x1F33E, 0x1F469, 0x1F3FB, 0x200D, 0x1F33E, 0x1F469,
+      0x1F3FC, 0x200D, 0x1F33E, 0x1F469, 0x1F3FD, 0x200D, 0x1F33E, 0x1F469, 0x1F3FE, 0x200D,
+      0x1F33E, 0x1F469, 0x1F3FF, 0x200D, 0x1F33E, 0x1F9D1, 0x200D, 0x1F373, 0x1F9D1, 0x1F3FB,
+      0x200D, 0x1F373, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F373, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F373,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x1F373, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F373, 0x1F468, 0x200D,
+      0x1F373, 0x1F468, 0x1F3FB, 0x200D, 0x1F373, 0x1F468, 0x1F3FC, 0x200D, 0x1F373, 0x1F468,
+      0x1F3FD, 0x200D, 0x1F373, 0x1F468, 0x1F3FE, 0x200D, 0x1F373, 0x1F468, 0x1F3FF, 0x200D,
+      0x1F373, 0x1F469, 0x200D, 0x1F373, 0x1F469, 0x1F3FB, 0x200D, 0x1F373, 0x1F469, 0x1F3FC,
+      0x200D, 0x1F373, 0x1F469, 0x1F3FD, 0x200D, 0x1F373, 0x1F469, 0x1F3FE, 0x200D, 0x1F373,
+      0x1F469, 0x1F3FF, 0x200D, 0x1F373, 0x1F9D1, 0x200D, 0x1F527, 0x1F9D1, 0x1F3FB, 0x200D,
+      0x1F527, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F527, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F527, 0x1F9D1,
+      0x1F3FE, 0x200D, 0x1F527, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F527, 0x1F468, 0x200D, 0x1F527,
+      0x1F468, 0x1F3FB, 0x200D, 0x1F527, 0x1F468, 0x1F3FC, 0x200D, 0x1F527, 0x1F468, 0x1F3FD,
+      0x200D, 0x1F527, 0x1F468, 0x1F3FE, 0x200D, 0x1F527, 0x1F468, 0x1F3FF, 0x200D, 0x1F527,
+      0x1F469, 0x200D, 0x1F527, 0x1F469, 0x1F3FB, 0x200D, 0x1F527, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F527, 0x1F469, 0x1F3FD, 0x200D, 0x1F527, 0x1F469, 0x1F3FE, 0x200D, 0x1F527, 0x1F469,
+      0x1F3FF, 0x200D, 0x1F527, 0x1F9D1, 0x200D, 0x1F3ED, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F3ED,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x1F3ED, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F3ED, 0x1F9D1, 0x1F3FE,
+      0x200D, 0x1F3ED, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F3ED, 0x1F468, 0x200D, 0x1F3ED, 0x1F468,
+      0x1F3FB, 0x200D, 0x1F3ED, 0x1F468, 0x1F3FC, 0x200D, 0x1F3ED, 0x1F468, 0x1F3FD, 0x200D,
+      0x1F3ED, 0x1F468, 0x1F3FE, 0x200D, 0x1F3ED, 0x1F468, 0x1F3FF, 0x200D, 0x1F3ED, 0x1F469,
+      0x200D, 0x1F3ED, 0x1F469, 0x1F3FB, 0x200D, 0x1F3ED, 0x1F469, 0x1F3FC, 0x200D, 0x1F3ED,
+      0x1F469, 0x1F3FD, 0x200D, 0x1F3ED, 0x1F469, 0x1F3FE, 0x200D, 0x1F3ED, 0x1F469, 0x1F3FF,
+      0x200D, 0x1F3ED, 0x1F9D1, 0x200D, 0x1F4BC, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F4BC, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x1F4BC, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F4BC, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1F4BC, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F4BC, 0x1F468, 0x200D, 0x1F4BC, 0x1F468, 0x1F3FB,
+      0x200D, 0x1F4BC, 0x1F468, 0x1F3FC, 0x200D, 0x1F4BC, 0x1F468, 0x1F3FD, 0x200D, 0x1F4BC,
+      0x1F468, 0x1F3FE, 0x200D, 0x1F4BC, 0x1F468, 0x1F3FF, 0x200D, 0x1F4BC, 0x1F469, 0x200D,
+      0x1F4BC, 0x1F469, 0x1F3FB, 0x200D, 0x1F4BC, 0x1F469, 0x1F3FC, 0x200D, 0x1F4BC, 0x1F469,
+      0x1F3FD, 0x200D, 0x1F4BC, 0x1F469, 0x1F3FE, 0x200D, 0x1F4BC, 0x1F469, 0x1F3FF, 0x200D,
+      0x1F4BC, 0x1F9D1, 0x200D, 0x1F52C, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F52C, 0x1F9D1, 0x1F3FC,
+      0x200D, 0x1F52C, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F52C, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F52C,
+      0x1F9D1, 0x1F3FF, 0x200D, 0x1F52C, 0x1F468, 0x200D, 0x1F52C, 0x1F468, 0x1F3FB, 0x200D,
+      0x1F52C, 0x1F468, 0x1F3FC, 0x200D, 0x1F52C, 0x1F468, 0x1F3FD, 0x200D, 0x1F52C, 0x1F468,
+      0x1F3FE, 0x200D, 0x1F52C, 0x1F468, 0x1F3FF, 0x200D, 0x1F52C, 0x1F469, 0x200D, 0x1F52C,
+      0x1F469, 0x1F3FB, 0x200D, 0x1F52C, 0x1F469, 0x1F3FC, 0x200D, 0x1F52C, 0x1F469, 0x1F3FD,
+      0x200D, 0x1F52C, 0x1F469, 0x1F3FE, 0x200D, 0x1F52C, 0x1F469, 0x1F3FF, 0x200D, 0x1F52C,
+      0x1F9D1, 0x200D, 0x1F4BB, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F4BB, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F4BB, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F4BB, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F4BB, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x1F4BB, 0x1F468, 0x200D, 0x1F4BB, 0x1F468, 0x1F3FB, 0x200D, 0x1F4BB,
+      0x1F468, 0x1F3FC, 0x200D, 0x1F4BB, 0x1F468, 0x1F3FD, 0x200D, 0x1F4BB, 0x1F468, 0x1F3FE,
+      0x200D, 0x1F4BB, 0x1F468, 0x1F3FF, 0x200D, 0x1F4BB, 0x1F469, 0x200D, 0x1F4BB, 0x1F469,
+      0x1F3FB, 0x200D, 0x1F4BB, 0x1F469, 0x1F3FC, 0x200D, 0x1F4BB, 0x1F469, 0x1F3FD, 0x200D,
+      0x1F4BB, 0x1F469, 0x1F3FE, 0x200D, 0x1F4BB, 0x1F469, 0x1F3FF, 0x200D, 0x1F4BB, 0x1F9D1,
+      0x200D, 0x1F3A4, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F3A4, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F3A4,
+      0x1F9D1, 0x1F3FD, 0x200D, 0x1F3A4, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F3A4, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x1F3A4, 0x1F468, 0x200D, 0x1F3A4, 0x1F468, 0x1F3FB, 0x200D, 0x1F3A4, 0x1F468,
+      0x1F3FC, 0x200D, 0x1F3A4, 0x1F468, 0x1F3FD, 0x200D, 0x1F3A4, 0x1F468, 0x1F3FE, 0x200D,
+      0x1F3A4, 0x1F468, 0x1F3FF, 0x200D, 0x1F3A4, 0x1F469, 0x200D, 0x1F3A4, 0x1F469, 0x1F3FB,
+      0x200D, 0x1F3A4, 0x1F469, 0x1F3FC, 0x200D, 0x1F3A4, 0x1F469, 0x1F3FD, 0x200D, 0x1F3A4,
+      0x1F469, 0x1F3FE, 0x200D, 0x1F3A4, 0x1F469, 0x1F3FF, 0x200D, 0x1F3A4, 0x1F9D1, 0x200D,
+      0x1F3A8, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F3A8, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F3A8, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F3A8, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F3A8, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x1F3A8, 0x1F468, 0x200D, 0x1F3A8, 0x1F468, 0x1F3FB, 0x200D, 0x1F3A8, 0x1F468, 0x1F3FC,
+      0x200D, 0x1F3A8, 0x1F468, 0x1F3FD, 0x200D, 0x1F3A8, 0x1F468, 0x1F3FE, 0x200D, 0x1F3A8,
+      0x1F468, 0x1F3FF, 0x200D, 0x1F3A8, 0x1F469, 0x200D, 0x1F3A8, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F3A8, 0x1F469, 0x1F3FC, 0x200D, 0x1F3A8, 0x1F469, 0x1F3FD, 0x200D, 0x1F3A8, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F3A8, 0x1F469, 0x1F3FF, 0x200D, 0x1F3A8, 0x1F9D1, 0x200D, 0x2708, 0xFE0F,
+      0x1F9D1, 0x200D, 0x2708, 0x1F9D1, 0x1F3FB, 0x200D, 0x2708, 0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D,
+      0x2708, 0x1F9D1, 0x1F3FC, 0x200D, 0x2708, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D, 0x2708, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x2708, 0xFE0F, 0x1F9D1, 0x1F3FD, 0x200D, 0x2708, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x2708, 0xFE0F, 0x1F9D1, 0x1F3FE, 0x200D, 0x2708, 0x1F9D1, 0x1F3FF, 0x200D, 0x2708, 0xFE0F,
+      0x1F9D1, 0x1F3FF, 0x200D, 0x2708, 0x1F468, 0x200D, 0x2708, 0xFE0F, 0x1F468, 0x200D, 0x2708,
+      0x1F468, 0x1F3FB, 0x200D, 0x2708, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D, 0x2708, 0x1F468, 0x1F3FC,
+      0x200D, 0x2708, 0xFE0F, 0x1F468, 0x1F3FC, 0x200D, 0x2708, 0x1F468, 0x1F3FD, 0x200D, 0x2708,
+      0xFE0F, 0x1F468, 0x1F3FD, 0x200D, 0x2708, 0x1F468, 0x1F3FE, 0x200D, 0x2708, 0xFE0F, 0x1F468,
+      0x1F3FE, 0x200D, 0x2708, 0x1F468, 0x1F3FF, 0x200D, 0x2708, 0xFE0F, 0x1F468, 0x1F3FF, 0x200D,
+      0x2708, 0x1F469, 0x200D, 0x2708, 0xFE0F, 0x1F469, 0x200D, 0x2708, 0x1F469, 0x1F3FB, 0x200D,
+      0x2708, 0xFE0F, 0x1F469, 0x1F3FB, 0x200D, 0x2708, 0x1F469, 0x1F3FC, 0x200D, 0x2708, 0xFE0F,
+      0x1F469, 0x1F3FC, 0x200D, 0x2708, 0x1F469, 0x1F3FD, 0x200D, 0x2708, 0xFE0F, 0x1F469, 0x1F3FD,
+      0x200D, 0x2708, 0x1F469, 0x1F3FE, 0x200D, 0x2708, 0xFE0F, 0x1F469, 0x1F3FE, 0x200D, 0x2708,
+      0x1F469, 0x1F3FF, 0x200D, 0x2708, 0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x2708, 0x1F9D1, 0x200D,
+      0x1F680, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F680, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F680, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F680, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F680, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x1F680, 0x1F468, 0x200D, 0x1F680, 0x1F468, 0x1F3FB, 0x200D, 0x1F680, 0x1F468, 0x1F3FC,
+      0x200D, 0x1F680, 0x1F468, 0x1F3FD, 0x200D, 0x1F680, 0x1F468, 0x1F3FE, 0x200D, 0x1F680,
+      0x1F468, 0x1F3FF, 0x200D, 0x1F680, 0x1F469, 0x200D, 0x1F680, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F680, 0x1F469, 0x1F3FC, 0x200D, 0x1F680, 0x1F469, 0x1F3FD, 0x200D, 0x1F680, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F680, 0x1F469, 0x1F3FF, 0x200D, 0x1F680, 0x1F9D1, 0x200D, 0x1F692,
+      0x1F9D1, 0x1F3FB, 0x200D, 0x1F692, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F692, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1F692, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F692, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F692,
+      0x1F468, 0x200D, 0x1F692, 0x1F468, 0x1F3FB, 0x200D, 0x1F692, 0x1F468, 0x1F3FC, 0x200D,
+      0x1F692, 0x1F468, 0x1F3FD, 0x200D, 0x1F692, 0x1F468, 0x1F3FE, 0x200D, 0x1F692, 0x1F468,
+      0x1F3FF, 0x200D, 0x1F692, 0x1F469, 0x200D, 0x1F692, 0x1F469, 0x1F3FB, 0x200D, 0x1F692,
+      0x1F469, 0x1F3FC, 0x200D, 0x1F692, 0x1F469, 0x1F3FD, 0x200D, 0x1F692, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F692, 0x1F469, 0x1F3FF, 0x200D, 0x1F692, 0x1F46E, 0x1F46E, 0x1F3FB, 0x1F46E,
+      0x1F3FC, 0x1F46E, 0x1F3FD, 0x1F46E, 0x1F3FE, 0x1F46E, 0x1F3FF, 0x1F46E, 0x200D, 0x2642,
+      0xFE0F, 0x1F46E, 0x200D, 0x2642, 0x1F46E, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F46E, 0x1F3FB,
+      0x200D, 0x2642, 0x1F46E, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F46E, 0x1F3FC, 0x200D, 0x2642,
+      0x1F46E, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F46E, 0x1F3FD, 0x200D, 0x2642, 0x1F46E, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F46E, 0x1F3FE, 0x200D, 0x2642, 0x1F46E, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F46E, 0x1F3FF, 0x200D, 0x2642, 0x1F46E, 0x200D, 0x2640, 0xFE0F, 0x1F46E, 0x200D,
+      0x2640, 0x1F46E, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F46E, 0x1F3FB, 0x200D, 0x2640, 0x1F46E,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F46E, 0x1F3FC, 0x200D, 0x2640, 0x1F46E, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F46E, 0x1F3FD, 0x200D, 0x2640, 0x1F46E, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F46E, 0x1F3FE, 0x200D, 0x2640, 0x1F46E, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F46E, 0x1F3FF,
+      0x200D, 0x2640, 0x1F575, 0xFE0F, 0x1F575, 0x1F575, 0x1F3FB, 0x1F575, 0x1F3FC, 0x1F575,
+      0x1F3FD, 0x1F575, 0x1F3FE, 0x1F575, 0x1F3FF, 0x1F575, 0xFE0F, 0x200D, 0x2642, 0xFE0F,
+      0x1F575, 0x200D, 0x2642, 0xFE0F, 0x1F575, 0xFE0F, 0x200D, 0x2642, 0x1F575, 0x200D, 0x2642,
+      0x1F575, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F575, 0x1F3FB, 0x200D, 0x2642, 0x1F575, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F575, 0x1F3FC, 0x200D, 0x2642, 0x1F575, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F575, 0x1F3FD, 0x200D, 0x2642, 0x1F575, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F575,
+      0x1F3FE, 0x200D, 0x2642, 0x1F575, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F575, 0x1F3FF, 0x200D,
+      0x2642, 0x1F575, 0xFE0F, 0x200D, 0x2640, 0xFE0F, 0x1F575, 0x200D, 0x2640, 0xFE0F, 0x1F575,
+      0xFE0F, 0x200D, 0x2640, 0x1F575, 0x200D, 0x2640, 0x1F575, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F575, 0x1F3FB, 0x200D, 0x2640, 0x1F575, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F575, 0x1F3FC,
+      0x200D, 0x2640, 0x1F575, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F575, 0x1F3FD, 0x200D, 0x2640,
+      0x1F575, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F575, 0x1F3FE, 0x200D, 0x2640, 0x1F575, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F575, 0x1F3FF, 0x200D, 0x2640, 0x1F482, 0x1F482, 0x1F3FB, 0x1F482,
+      0x1F3FC, 0x1F482, 0x1F3FD, 0x1F482, 0x1F3FE, 0x1F482, 0x1F3FF, 0x1F482, 0x200D, 0x2642,
+      0xFE0F, 0x1F482, 0x200D, 0x2642, 0x1F482, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F482, 0x1F3FB,
+      0x200D, 0x2642, 0x1F482, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F482, 0x1F3FC, 0x200D, 0x2642,
+      0x1F482, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F482, 0x1F3FD, 0x200D, 0x2642, 0x1F482, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F482, 0x1F3FE, 0x200D, 0x2642, 0x1F482, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F482, 0x1F3FF, 0x200D, 0x2642, 0x1F482, 0x200D, 0x2640, 0xFE0F, 0x1F482, 0x200D,
+      0x2640, 0x1F482, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F482, 0x1F3FB, 0x200D, 0x2640, 0x1F482,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F482, 0x1F3FC, 0x200D, 0x2640, 0x1F482, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F482, 0x1F3FD, 0x200D, 0x2640, 0x1F482, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F482, 0x1F3FE, 0x200D, 0x2640, 0x1F482, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F482, 0x1F3FF,
+      0x200D, 0x2640, 0x1F977, 0x1F977, 0x1F3FB, 0x1F977, 0x1F3FC, 0x1F977, 0x1F3FD, 0x1F977,
+      0x1F3FE, 0x1F977, 0x1F3FF, 0x1F477, 0x1F477, 0x1F3FB, 0x1F477, 0x1F3FC, 0x1F477, 0x1F3FD,
+      0x1F477, 0x1F3FE, 0x1F477, 0x1F3FF, 0x1F477, 0x200D, 0x2642, 0xFE0F, 0x1F477, 0x200D, 0x2642,
+      0x1F477, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F477, 0x1F3FB, 0x200D, 0x2642, 0x1F477, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F477, 0x1F3FC, 0x200D, 0x2642, 0x1F477, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F477, 0x1F3FD, 0x200D, 0x2642, 0x1F477, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F477,
+      0x1F3FE, 0x200D, 0x2642, 0x1F477, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F477, 0x1F3FF, 0x200D,
+      0x2642, 0x1F477, 0x200D, 0x2640, 0xFE0F, 0x1F477, 0x200D, 0x2640, 0x1F477, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F477, 0x1F3FB, 0x200D, 0x2640, 0x1F477, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F477, 0x1F3FC, 0x200D, 0x2640, 0x1F477, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F477, 0x1F3FD,
+      0x200D, 0x2640, 0x1F477, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F477, 0x1F3FE, 0x200D, 0x2640,
+      0x1F477, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F477, 0x1F3FF, 0x200D, 0x2640, 0x1FAC5, 0x1FAC5,
+      0x1F3FB, 0x1FAC5, 0x1F3FC, 0x1FAC5, 0x1F3FD, 0x1FAC5, 0x1F3FE, 0x1FAC5, 0x1F3FF, 0x1F934,
+      0x1F934, 0x1F3FB, 0x1F934, 0x1F3FC, 0x1F934, 0x1F3FD, 0x1F934, 0x1F3FE, 0x1F934, 0x1F3FF,
+      0x1F478, 0x1F478, 0x1F3FB, 0x1F478, 0x1F3FC, 0x1F478, 0x1F3FD, 0x1F478, 0x1F3FE, 0x1F478,
+      0x1F3FF, 0x1F473, 0x1F473, 0x1F3FB, 0x1F473, 0x1F3FC, 0x1F473, 0x1F3FD, 0x1F473, 0x1F3FE,
+      0x1F473, 0x1F3FF, 0x1F473, 0x200D, 0x2642, 0xFE0F, 0x1F473, 0x200D, 0x2642, 0x1F473, 0x1F3FB,
+      0x200D, 0x2642, 0xFE0F, 0x1F473, 0x1F3FB, 0x200D, 0x2642, 0x1F473, 0x1F3FC, 0x200D, 0x2642,
+      0xFE0F, 0x1F473, 0x1F3FC, 0x200D, 0x2642, 0x1F473, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F473,
+      0x1F3FD, 0x200D, 0x2642, 0x1F473, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F473, 0x1F3FE, 0x200D,
+      0x2642, 0x1F473, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F473, 0x1F3FF, 0x200D, 0x2642, 0x1F473,
+      0x200D, 0x2640, 0xFE0F, 0x1F473, 0x200D, 0x2640, 0x1F473, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F473, 0x1F3FB, 0x200D, 0x2640, 0x1F473, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F473, 0x1F3FC,
+      0x200D, 0x2640, 0x1F473, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F473, 0x1F3FD, 0x200D, 0x2640,
+      0x1F473, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F473, 0x1F3FE, 0x200D, 0x2640, 0x1F473, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F473, 0x1F3FF, 0x200D, 0x2640, 0x1F472, 0x1F472, 0x1F3FB, 0x1F472,
+      0x1F3FC, 0x1F472, 0x1F3FD, 0x1F472, 0x1F3FE, 0x1F472, 0x1F3FF, 0x1F9D5, 0x1F9D5, 0x1F3FB,
+      0x1F9D5, 0x1F3FC, 0x1F9D5, 0x1F3FD, 0x1F9D5, 0x1F3FE, 0x1F9D5, 0x1F3FF, 0x1F935, 0x1F935,
+      0x1F3FB, 0x1F935, 0x1F3FC, 0x1F935, 0x1F3FD, 0x1F935, 0x1F3FE, 0x1F935, 0x1F3FF, 0x1F935,
+      0x200D, 0x2642, 0xFE0F, 0x1F935, 0x200D, 0x2642, 0x1F935, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x1F935, 0x1F3FB, 0x200D, 0x2642, 0x1F935, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F935, 0x1F3FC,
+      0x200D, 0x2642, 0x1F935, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F935, 0x1F3FD, 0x200D, 0x2642,
+      0x1F935, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F935, 0x1F3FE, 0x200D, 0x2642, 0x1F935, 0x1F3FF,
+      0x200D, 0x2642, 0xFE0F, 0x1F935, 0x1F3FF, 0x200D, 0x2642, 0x1F935, 0x200D, 0x2640, 0xFE0F,
+      0x1F935, 0x200D, 0x2640, 0x1F935, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F935, 0x1F3FB, 0x200D,
+      0x2640, 0x1F935, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F935, 0x1F3FC, 0x200D, 0x2640, 0x1F935,
+      0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F935, 0x1F3FD, 0x200D, 0x2640, 0x1F935, 0x1F3FE, 0x200D,
+      0x2640, 0xFE0F, 0x1F935, 0x1F3FE, 0x200D, 0x2640, 0x1F935, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x1F935, 0x1F3FF, 0x200D, 0x2640, 0x1F470, 0x1F470, 0x1F3FB, 0x1F470, 0x1F3FC, 0x1F470,
+      0x1F3FD, 0x1F470, 0x1F3FE, 0x1F470, 0x1F3FF, 0x1F470, 0x200D, 0x2642, 0xFE0F, 0x1F470,
+      0x200D, 0x2642, 0x1F470, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F470, 0x1F3FB, 0x200D, 0x2642,
+      0x1F470, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F470, 0x1F3FC, 0x200D, 0x2642, 0x1F470, 0x1F3FD,
+      0x200D, 0x2642, 0xFE0F, 0x1F470, 0x1F3FD, 0x200D, 0x2642, 0x1F470, 0x1F3FE, 0x200D, 0x2642,
+      0xFE0F, 0x1F470, 0x1F3FE, 0x200D, 0x2642, 0x1F470, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F470,
+      0x1F3FF, 0x200D, 0x2642, 0x1F470, 0x200D, 0x2640, 0xFE0F, 0x1F470, 0x200D, 0x2640, 0x1F470,
+      0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F470, 0x1F3FB, 0x200D, 0x2640, 0x1F470, 0x1F3FC, 0x200D,
+      0x2640, 0xFE0F, 0x1F470, 0x1F3FC, 0x200D, 0x2640, 0x1F470, 0x1F3FD, 0x200D, 0x2640, 0xFE0F,
+      0x1F470, 0x1F3FD, 0x200D, 0x2640, 0x1F470, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F470, 0x1F3FE,
+      0x200D, 0x2640, 0x1F470, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F470, 0x1F3FF, 0x200D, 0x2640,
+      0x1F930, 0x1F930, 0x1F3FB, 0x1F930, 0x1F3FC, 0x1F930, 0x1F3FD, 0x1F930, 0x1F3FE, 0x1F930,
+      0x1F3FF, 0x1FAC3, 0x1FAC3, 0x1F3FB, 0x1FAC3, 0x1F3FC, 0x1FAC3, 0x1F3FD, 0x1FAC3, 0x1F3FE,
+      0x1FAC3, 0x1F3FF, 0x1FAC4, 0x1FAC4, 0x1F3FB, 0x1FAC4, 0x1F3FC, 0x1FAC4, 0x1F3FD, 0x1FAC4,
+      0x1F3FE, 0x1FAC4, 0x1F3FF, 0x1F931, 0x1F931, 0x1F3FB, 0x1F931, 0x1F3FC, 0x1F931, 0x1F3FD,
+      0x1F931, 0x1F3FE, 0x1F931, 0x1F3FF, 0x1F469, 0x200D, 0x1F37C, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F37C, 0x1F469, 0x1F3FC, 0x200D, 0x1F37C, 0x1F469, 0x1F3FD, 0x200D, 0x1F37C, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F37C, 0x1F469, 0x1F3FF, 0x200D, 0x1F37C, 0x1F468, 0x200D, 0x1F37C,
+      0x1F468, 0x1F3FB, 0x200D, 0x1F37C, 0x1F468, 0x1F3FC, 0x200D, 0x1F37C, 0x1F468, 0x1F3FD,
+      0x200D, 0x1F37C, 0x1F468, 0x1F3FE, 0x200D, 0x1F37C, 0x1F468, 0x1F3FF, 0x200D, 0x1F37C,
+      0x1F9D1, 0x200D, 0x1F37C, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F37C, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F37C, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F37C, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F37C, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x1F37C, 0x1F47C, 0x1F47C, 0x1F3FB, 0x1F47C, 0x1F3FC, 0x1F47C, 0x1F3FD,
+      0x1F47C, 0x1F3FE, 0x1F47C, 0x1F3FF, 0x1F385, 0x1F385, 0x1F3FB, 0x1F385, 0x1F3FC, 0x1F385,
+      0x1F3FD, 0x1F385, 0x1F3FE, 0x1F385, 0x1F3FF, 0x1F936, 0x1F936, 0x1F3FB, 0x1F936, 0x1F3FC,
+      0x1F936, 0x1F3FD, 0x1F936, 0x1F3FE, 0x1F936, 0x1F3FF, 0x1F9D1, 0x200D, 0x1F384, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F384, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F384, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F384, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F384, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F384, 0x1F9B8,
+      0x1F9B8, 0x1F3FB, 0x1F9B8, 0x1F3FC, 0x1F9B8, 0x1F3FD, 0x1F9B8, 0x1F3FE, 0x1F9B8, 0x1F3FF,
+      0x1F9B8, 0x200D, 0x2642, 0xFE0F, 0x1F9B8, 0x200D, 0x2642, 0x1F9B8, 0x1F3FB, 0x200D, 0x2642,
+      0xFE0F, 0x1F9B8, 0x1F3FB, 0x200D, 0x2642, 0x1F9B8, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9B8,
+      0x1F3FC, 0x200D, 0x2642, 0x1F9B8, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9B8, 0x1F3FD, 0x200D,
+      0x2642, 0x1F9B8, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9B8, 0x1F3FE, 0x200D, 0x2642, 0x1F9B8,
+      0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9B8, 0x1F3FF, 0x200D, 0x2642, 0x1F9B8, 0x200D, 0x2640,
+      0xFE0F, 0x1F9B8, 0x200D, 0x2640, 0x1F9B8, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9B8, 0x1F3FB,
+      0x200D, 0x2640, 0x1F9B8, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9B8, 0x1F3FC, 0x200D, 0x2640,
+      0x1F9B8, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9B8, 0x1F3FD, 0x200D, 0x2640, 0x1F9B8, 0x1F3FE,
+      0x200D, 0x2640, 0xFE0F, 0x1F9B8, 0x1F3FE, 0x200D, 0x2640, 0x1F9B8, 0x1F3FF, 0x200D, 0x2640,
+      0xFE0F, 0x1F9B8, 0x1F3FF, 0x200D, 0x2640, 0x1F9B9, 0x1F9B9, 0x1F3FB, 0x1F9B9, 0x1F3FC,
+      0x1F9B9, 0x1F3FD, 0x1F9B9, 0x1F3FE, 0x1F9B9, 0x1F3FF, 0x1F9B9, 0x200D, 0x2642, 0xFE0F,
+      0x1F9B9, 0x200D, 0x2642, 0x1F9B9, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9B9, 0x1F3FB, 0x200D,
+      0x2642, 0x1F9B9, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9B9, 0x1F3FC, 0x200D, 0x2642, 0x1F9B9,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9B9, 0x1F3FD, 0x200D, 0x2642, 0x1F9B9, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F9B9, 0x1F3FE, 0x200D, 0x2642, 0x1F9B9, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F9B9, 0x1F3FF, 0x200D, 0x2642, 0x1F9B9, 0x200D, 0x2640, 0xFE0F, 0x1F9B9, 0x200D, 0x2640,
+      0x1F9B9, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9B9, 0x1F3FB, 0x200D, 0x2640, 0x1F9B9, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x1F9B9, 0x1F3FC, 0x200D, 0x2640, 0x1F9B9, 0x1F3FD, 0x200D, 0x2640,
+      0xFE0F, 0x1F9B9, 0x1F3FD, 0x200D, 0x2640, 0x1F9B9, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9B9,
+      0x1F3FE, 0x200D, 0x2640, 0x1F9B9, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9B9, 0x1F3FF, 0x200D,
+      0x2640, 0x1F9D9, 0x1F9D9, 0x1F3FB, 0x1F9D9, 0x1F3FC, 0x1F9D9, 0x1F3FD, 0x1F9D9, 0x1F3FE,
+      0x1F9D9, 0x1F3FF, 0x1F9D9, 0x200D, 0x2642, 0xFE0F, 0x1F9D9, 0x200D, 0x2642, 0x1F9D9, 0x1F3FB,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D9, 0x1F3FB, 0x200D, 0x2642, 0x1F9D9, 0x1F3FC, 0x200D, 0x2642,
+      0xFE0F, 0x1F9D9, 0x1F3FC, 0x200D, 0x2642, 0x1F9D9, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9D9,
+      0x1F3FD, 0x200D, 0x2642, 0x1F9D9, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9D9, 0x1F3FE, 0x200D,
+      0x2642, 0x1F9D9, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9D9, 0x1F3FF, 0x200D, 0x2642, 0x1F9D9,
+      0x200D, 0x2640, 0xFE0F, 0x1F9D9, 0x200D, 0x2640, 0x1F9D9, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D9, 0x1F3FB, 0x200D, 0x2640, 0x1F9D9, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9D9, 0x1F3FC,
+      0x200D, 0x2640, 0x1F9D9, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9D9, 0x1F3FD, 0x200D, 0x2640,
+      0x1F9D9, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9D9, 0x1F3FE, 0x200D, 0x2640, 0x1F9D9, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F9D9, 0x1F3FF, 0x200D, 0x2640, 0x1F9DA, 0x1F9DA, 0x1F3FB, 0x1F9DA,
+      0x1F3FC, 0x1F9DA, 0x1F3FD, 0x1F9DA, 0x1F3FE, 0x1F9DA, 0x1F3FF, 0x1F9DA, 0x200D, 0x2642,
+      0xFE0F, 0x1F9DA, 0x200D, 0x2642, 0x1F9DA, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9DA, 0x1F3FB,
+      0x200D, 0x2642, 0x1F9DA, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9DA, 0x1F3FC, 0x200D, 0x2642,
+      0x1F9DA, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9DA, 0x1F3FD, 0x200D, 0x2642, 0x1F9DA, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F9DA, 0x1F3FE, 0x200D, 0x2642, 0x1F9DA, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F9DA, 0x1F3FF, 0x200D, 0x2642, 0x1F9DA, 0x200D, 0x2640, 0xFE0F, 0x1F9DA, 0x200D,
+      0x2640, 0x1F9DA, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9DA, 0x1F3FB, 0x200D, 0x2640, 0x1F9DA,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9DA, 0x1F3FC, 0x200D, 0x2640, 0x1F9DA, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F9DA, 0x1F3FD, 0x200D, 0x2640, 0x1F9DA, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F9DA, 0x1F3FE, 0x200D, 0x2640, 0x1F9DA, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9DA, 0x1F3FF,
+      0x200D, 0x2640, 0x1F9DB, 0x1F9DB, 0x1F3FB, 0x1F9DB, 0x1F3FC, 0x1F9DB, 0x1F3FD, 0x1F9DB,
+      0x1F3FE, 0x1F9DB, 0x1F3FF, 0x1F9DB, 0x200D, 0x2642, 0xFE0F, 0x1F9DB, 0x200D, 0x2642, 0x1F9DB,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9DB, 0x1F3FB, 0x200D, 0x2642, 0x1F9DB, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x1F9DB, 0x1F3FC, 0x200D, 0x2642, 0x1F9DB, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x1F9DB, 0x1F3FD, 0x200D, 0x2642, 0x1F9DB, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9DB, 0x1F3FE,
+      0x200D, 0x2642, 0x1F9DB, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9DB, 0x1F3FF, 0x200D, 0x2642,
+      0x1F9DB, 0x200D, 0x2640, 0xFE0F, 0x1F9DB, 0x200D, 0x2640, 0x1F9DB, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x1F9DB, 0x1F3FB, 0x200D, 0x2640, 0x1F9DB, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9DB,
+      0x1F3FC, 0x200D, 0x2640, 0x1F9DB, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9DB, 0x1F3FD, 0x200D,
+      0x2640, 0x1F9DB, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9DB, 0x1F3FE, 0x200D, 0x2640, 0x1F9DB,
+      0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9DB, 0x1F3FF, 0x200D, 0x2640, 0x1F9DC, 0x1F9DC, 0x1F3FB,
+      0x1F9DC, 0x1F3FC, 0x1F9DC, 0x1F3FD, 0x1F9DC, 0x1F3FE, 0x1F9DC, 0x1F3FF, 0x1F9DC, 0x200D,
+      0x2642, 0xFE0F, 0x1F9DC, 0x200D, 0x2642, 0x1F9DC, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9DC,
+      0x1F3FB, 0x200D, 0x2642, 0x1F9DC, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9DC, 0x1F3FC, 0x200D,
+      0x2642, 0x1F9DC, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9DC, 0x1F3FD, 0x200D, 0x2642, 0x1F9DC,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9DC, 0x1F3FE, 0x200D, 0x2642, 0x1F9DC, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F9DC, 0x1F3FF, 0x200D, 0x2642, 0x1F9DC, 0x200D, 0x2640, 0xFE0F, 0x1F9DC,
+      0x200D, 0x2640, 0x1F9DC, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9DC, 0x1F3FB, 0x200D, 0x2640,
+      0x1F9DC, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9DC, 0x1F3FC, 0x200D, 0x2640, 0x1F9DC, 0x1F3FD,
+      0x200D, 0x2640, 0xFE0F, 0x1F9DC, 0x1F3FD, 0x200D, 0x2640, 0x1F9DC, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x1F9DC, 0x1F3FE, 0x200D, 0x2640, 0x1F9DC, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9DC,
+      0x1F3FF, 0x200D, 0x2640, 0x1F9DD, 0x1F9DD, 0x1F3FB, 0x1F9DD, 0x1F3FC, 0x1F9DD, 0x1F3FD,
+      0x1F9DD, 0x1F3FE, 0x1F9DD, 0x1F3FF, 0x1F9DD, 0x200D, 0x2642, 0xFE0F, 0x1F9DD, 0x200D, 0x2642,
+      0x1F9DD, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9DD, 0x1F3FB, 0x200D, 0x2642, 0x1F9DD, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F9DD, 0x1F3FC, 0x200D, 0x2642, 0x1F9DD, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F9DD, 0x1F3FD, 0x200D, 0x2642, 0x1F9DD, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9DD,
+      0x1F3FE, 0x200D, 0x2642, 0x1F9DD, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9DD, 0x1F3FF, 0x200D,
+      0x2642, 0x1F9DD, 0x200D, 0x2640, 0xFE0F, 0x1F9DD, 0x200D, 0x2640, 0x1F9DD, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F9DD, 0x1F3FB, 0x200D, 0x2640, 0x1F9DD, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F9DD, 0x1F3FC, 0x200D, 0x2640, 0x1F9DD, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9DD, 0x1F3FD,
+      0x200D, 0x2640, 0x1F9DD, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9DD, 0x1F3FE, 0x200D, 0x2640,
+      0x1F9DD, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9DD, 0x1F3FF, 0x200D, 0x2640, 0x1F9DE, 0x1F9DE,
+      0x200D, 0x2642, 0xFE0F, 0x1F9DE, 0x200D, 0x2642, 0x1F9DE, 0x200D, 0x2640, 0xFE0F, 0x1F9DE,
+      0x200D, 0x2640, 0x1F9DF, 0x1F9DF, 0x200D, 0x2642, 0xFE0F, 0x1F9DF, 0x200D, 0x2642, 0x1F9DF,
+      0x200D, 0x2640, 0xFE0F, 0x1F9DF, 0x200D, 0x2640, 0x1F9CC, 0x1FAC8, 0x1F486, 0x1F486, 0x1F3FB,
+      0x1F486, 0x1F3FC, 0x1F486, 0x1F3FD, 0x1F486, 0x1F3FE, 0x1F486, 0x1F3FF, 0x1F486, 0x200D,
+      0x2642, 0xFE0F, 0x1F486, 0x200D, 0x2642, 0x1F486, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F486,
+      0x1F3FB, 0x200D, 0x2642, 0x1F486, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F486, 0x1F3FC, 0x200D,
+      0x2642, 0x1F486, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F486, 0x1F3FD, 0x200D, 0x2642, 0x1F486,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F486, 0x1F3FE, 0x200D, 0x2642, 0x1F486, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F486, 0x1F3FF, 0x200D, 0x2642, 0x1F486, 0x200D, 0x2640, 0xFE0F, 0x1F486,
+      0x200D, 0x2640, 0x1F486, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F486, 0x1F3FB, 0x200D, 0x2640,
+      0x1F486, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F486, 0x1F3FC, 0x200D, 0x2640, 0x1F486, 0x1F3FD,
+      0x200D, 0x2640, 0xFE0F, 0x1F486, 0x1F3FD, 0x200D, 0x2640, 0x1F486, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x1F486, 0x1F3FE, 0x200D, 0x2640, 0x1F486, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F486,
+      0x1F3FF, 0x200D, 0x2640, 0x1F487, 0x1F487, 0x1F3FB, 0x1F487, 0x1F3FC, 0x1F487, 0x1F3FD,
+      0x1F487, 0x1F3FE, 0x1F487, 0x1F3FF, 0x1F487, 0x200D, 0x2642, 0xFE0F, 0x1F487, 0x200D, 0x2642,
+      0x1F487, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F487, 0x1F3FB, 0x200D, 0x2642, 0x1F487, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F487, 0x1F3FC, 0x200D, 0x2642, 0x1F487, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F487, 0x1F3FD, 0x200D, 0x2642, 0x1F487, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F487,
+      0x1F3FE, 0x200D, 0x2642, 0x1F487, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F487, 0x1F3FF, 0x200D,
+      0x2642, 0x1F487, 0x200D, 0x2640, 0xFE0F, 0x1F487, 0x200D, 0x2640, 0x1F487, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F487, 0x1F3FB, 0x200D, 0x2640, 0x1F487, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F487, 0x1F3FC, 0x200D, 0x2640, 0x1F487, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F487, 0x1F3FD,
+      0x200D, 0x2640, 0x1F487, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F487, 0x1F3FE, 0x200D, 0x2640,
+      0x1F487, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F487, 0x1F3FF, 0x200D, 0x2640, 0x1F6B6, 0x1F6B6,
+      0x1F3FB, 0x1F6B6, 0x1F3FC, 0x1F6B6, 0x1F3FD, 0x1F6B6, 0x1F3FE, 0x1F6B6, 0x1F3FF, 0x1F6B6,
+      0x200D, 0x2642, 0xFE0F, 0x1F6B6, 0x200D, 0x2642, 0x1F6B6, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x1F6B6, 0x1F3FB, 0x200D, 0x2642, 0x1F6B6, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F6B6, 0x1F3FC,
+      0x200D, 0x2642, 0x1F6B6, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D, 0x2642,
+      0x1F6B6, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2642, 0x1F6B6, 0x1F3FF,
+      0x200D, 0x2642, 0xFE0F, 0x1F6B6, 0x1F3FF, 0x200D, 0x2642, 0x1F6B6, 0x200D, 0x2640, 0xFE0F,
+      0x1F6B6, 0x200D, 0x2640, 0x1F6B6, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F6B6, 0x1F3FB, 0x200D,
+      0x2640, 0x1F6B6, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x2640, 0x1F6B6,
+      0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D, 0x2640, 0x1F6B6, 0x1F3FE, 0x200D,
+      0x2640, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2640, 0x1F6B6, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x1F6B6, 0x1F3FF, 0x200D, 0x2640, 0x1F6B6, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x200D, 0x27A1,
+      0x1F6B6, 0x1F3FB, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FB, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FC,
+      0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FD, 0x200D, 0x27A1,
+      0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FE, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6,
+      0x1F3FE, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FF, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FF, 0x200D,
+      0x27A1, 0x1F6B6, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x200D, 0x2640,
+      0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x200D,
+      0x2640, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F,
+      0x1F6B6, 0x1F3FB, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FB, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x2640, 0x200D,
+      0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FC,
+      0x200D, 0x2640, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1,
+      0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FD, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F6B6,
+      0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2640,
+      0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6,
+      0x1F3FE, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x200D,
+      0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FF, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FF, 0x200D, 0x2640, 0x200D, 0x27A1,
+      0x1F6B6, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x200D, 0x2642, 0x200D,
+      0x27A1, 0xFE0F, 0x1F6B6, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x200D, 0x2642,
+      0x200D, 0x27A1, 0x1F6B6, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6,
+      0x1F3FB, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x200D, 0x27A1, 0x1F6B6, 0x1F3FB, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x2642, 0x200D, 0x27A1,
+      0xFE0F, 0x1F6B6, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FC, 0x200D,
+      0x2642, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F,
+      0x1F6B6, 0x1F3FD, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FD, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2642, 0x200D,
+      0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FE,
+      0x200D, 0x2642, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1,
+      0xFE0F, 0x1F6B6, 0x1F3FF, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F6B6, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F6B6, 0x1F3FF, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F9CD,
+      0x1F9CD, 0x1F3FB, 0x1F9CD, 0x1F3FC, 0x1F9CD, 0x1F3FD, 0x1F9CD, 0x1F3FE, 0x1F9CD, 0x1F3FF,
+      0x1F9CD, 0x200D, 0x2642, 0xFE0F, 0x1F9CD, 0x200D, 0x2642, 0x1F9CD, 0x1F3FB, 0x200D, 0x2642,
+      0xFE0F, 0x1F9CD, 0x1F3FB, 0x200D, 0x2642, 0x1F9CD, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9CD,
+      0x1F3FC, 0x200D, 0x2642, 0x1F9CD, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9CD, 0x1F3FD, 0x200D,
+      0x2642, 0x1F9CD, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9CD, 0x1F3FE, 0x200D, 0x2642, 0x1F9CD,
+      0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9CD, 0x1F3FF, 0x200D, 0x2642, 0x1F9CD, 0x200D, 0x2640,
+      0xFE0F, 0x1F9CD, 0x200D, 0x2640, 0x1F9CD, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9CD, 0x1F3FB,
+      0x200D, 0x2640, 0x1F9CD, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9CD, 0x1F3FC, 0x200D, 0x2640,
+      0x1F9CD, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9CD, 0x1F3FD, 0x200D, 0x2640, 0x1F9CD, 0x1F3FE,
+      0x200D, 0x2640, 0xFE0F, 0x1F9CD, 0x1F3FE, 0x200D, 0x2640, 0x1F9CD, 0x1F3FF, 0x200D, 0x2640,
+      0xFE0F, 0x1F9CD, 0x1F3FF, 0x200D, 0x2640, 0x1F9CE, 0x1F9CE, 0x1F3FB, 0x1F9CE, 0x1F3FC,
+      0x1F9CE, 0x1F3FD, 0x1F9CE, 0x1F3FE, 0x1F9CE, 0x1F3FF, 0x1F9CE, 0x200D, 0x2642, 0xFE0F,
+      0x1F9CE, 0x200D, 0x2642, 0x1F9CE, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D,
+      0x2642, 0x1F9CE, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9CE, 0x1F3FC, 0x200D, 0x2642, 0x1F9CE,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9CE, 0x1F3FD, 0x200D, 0x2642, 0x1F9CE, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F9CE, 0x1F3FE, 0x200D, 0x2642, 0x1F9CE, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F9CE, 0x1F3FF, 0x200D, 0x2642, 0x1F9CE, 0x200D, 0x2640, 0xFE0F, 0x1F9CE, 0x200D, 0x2640,
+      0x1F9CE, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D, 0x2640, 0x1F9CE, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x1F9CE, 0x1F3FC, 0x200D, 0x2640, 0x1F9CE, 0x1F3FD, 0x200D, 0x2640,
+      0xFE0F, 0x1F9CE, 0x1F3FD, 0x200D, 0x2640, 0x1F9CE, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9CE,
+      0x1F3FE, 0x200D, 0x2640, 0x1F9CE, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9CE, 0x1F3FF, 0x200D,
+      0x2640, 0x1F9CE, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FB, 0x200D,
+      0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FC, 0x200D, 0x27A1, 0xFE0F,
+      0x1F9CE, 0x1F3FC, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FD, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FD,
+      0x200D, 0x27A1, 0x1F9CE, 0x1F3FE, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FE, 0x200D, 0x27A1,
+      0x1F9CE, 0x1F3FF, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FF, 0x200D, 0x27A1, 0x1F9CE, 0x200D,
+      0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F,
+      0x1F9CE, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x200D, 0x2640, 0x200D, 0x27A1,
+      0x1F9CE, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D,
+      0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1,
+      0x1F9CE, 0x1F3FB, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FC, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FC, 0x200D, 0x2640, 0x200D,
+      0x27A1, 0x1F9CE, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FD,
+      0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x200D,
+      0x27A1, 0x1F9CE, 0x1F3FD, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FE, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F,
+      0x1F9CE, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FE, 0x200D, 0x2640,
+      0x200D, 0x27A1, 0x1F9CE, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE,
+      0x1F3FF, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x200D, 0x27A1, 0x1F9CE, 0x1F3FF, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F9CE, 0x200D, 0x2642,
+      0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE,
+      0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F9CE,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D, 0x2642,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE,
+      0x1F3FB, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x200D,
+      0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FC, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FC, 0x200D, 0x2642, 0x200D, 0x27A1,
+      0x1F9CE, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FD, 0x200D,
+      0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1,
+      0x1F9CE, 0x1F3FD, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FE, 0x200D, 0x2642, 0xFE0F,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FE, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F9CE, 0x1F3FE, 0x200D, 0x2642, 0x200D,
+      0x27A1, 0x1F9CE, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FF,
+      0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F9CE, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x200D,
+      0x27A1, 0x1F9CE, 0x1F3FF, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F9D1, 0x200D, 0x1F9AF, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F9AF, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9AF, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F9AF, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9AF, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9AF, 0x1F9D1,
+      0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9AF, 0x200D,
+      0x27A1, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F9AF, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9AF, 0x200D, 0x27A1,
+      0xFE0F, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9AF,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F468, 0x200D,
+      0x1F9AF, 0x1F468, 0x1F3FB, 0x200D, 0x1F9AF, 0x1F468, 0x1F3FC, 0x200D, 0x1F9AF, 0x1F468,
+      0x1F3FD, 0x200D, 0x1F9AF, 0x1F468, 0x1F3FE, 0x200D, 0x1F9AF, 0x1F468, 0x1F3FF, 0x200D,
+      0x1F9AF, 0x1F468, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x200D, 0x1F9AF, 0x200D,
+      0x27A1, 0x1F468, 0x1F3FB, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D,
+      0x1F9AF, 0x200D, 0x27A1, 0x1F468, 0x1F3FC, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F468,
+      0x1F3FC, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F468, 0x1F3FD, 0x200D, 0x1F9AF, 0x200D, 0x27A1,
+      0xFE0F, 0x1F468, 0x1F3FD, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F468, 0x1F3FE, 0x200D, 0x1F9AF,
+      0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FE, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F468, 0x1F3FF,
+      0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FF, 0x200D, 0x1F9AF, 0x200D, 0x27A1,
+      0x1F469, 0x200D, 0x1F9AF, 0x1F469, 0x1F3FB, 0x200D, 0x1F9AF, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F9AF, 0x1F469, 0x1F3FD, 0x200D, 0x1F9AF, 0x1F469, 0x1F3FE, 0x200D, 0x1F9AF, 0x1F469,
+      0x1F3FF, 0x200D, 0x1F9AF, 0x1F469, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x200D,
+      0x1F9AF, 0x200D, 0x27A1, 0x1F469, 0x1F3FB, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F469,
+      0x1F3FB, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F469, 0x1F3FC, 0x200D, 0x1F9AF, 0x200D, 0x27A1,
+      0xFE0F, 0x1F469, 0x1F3FC, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F469, 0x1F3FD, 0x200D, 0x1F9AF,
+      0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FD, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FE, 0x200D, 0x1F9AF, 0x200D, 0x27A1,
+      0x1F469, 0x1F3FF, 0x200D, 0x1F9AF, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x1F9AF,
+      0x200D, 0x27A1, 0x1F9D1, 0x200D, 0x1F9BC, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9BC, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x1F9BC, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9BC, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1F9BC, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9BC, 0x1F9D1, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F,
+      0x1F9D1, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9BC, 0x200D, 0x27A1,
+      0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9BC,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9BC, 0x200D, 0x27A1,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9BC,
+      0x200D, 0x27A1, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F468, 0x200D, 0x1F9BC, 0x1F468, 0x1F3FB, 0x200D, 0x1F9BC,
+      0x1F468, 0x1F3FC, 0x200D, 0x1F9BC, 0x1F468, 0x1F3FD, 0x200D, 0x1F9BC, 0x1F468, 0x1F3FE,
+      0x200D, 0x1F9BC, 0x1F468, 0x1F3FF, 0x200D, 0x1F9BC, 0x1F468, 0x200D, 0x1F9BC, 0x200D, 0x27A1,
+      0xFE0F, 0x1F468, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F468, 0x1F3FB, 0x200D, 0x1F9BC, 0x200D,
+      0x27A1, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F468, 0x1F3FC, 0x200D,
+      0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FC, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F468,
+      0x1F3FD, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FD, 0x200D, 0x1F9BC, 0x200D,
+      0x27A1, 0x1F468, 0x1F3FE, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FE, 0x200D,
+      0x1F9BC, 0x200D, 0x27A1, 0x1F468, 0x1F3FF, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F468,
+      0x1F3FF, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F469, 0x200D, 0x1F9BC, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F9BC, 0x1F469, 0x1F3FC, 0x200D, 0x1F9BC, 0x1F469, 0x1F3FD, 0x200D, 0x1F9BC, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F9BC, 0x1F469, 0x1F3FF, 0x200D, 0x1F9BC, 0x1F469, 0x200D, 0x1F9BC,
+      0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FB, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F469,
+      0x1F3FC, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FC, 0x200D, 0x1F9BC, 0x200D,
+      0x27A1, 0x1F469, 0x1F3FD, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FD, 0x200D,
+      0x1F9BC, 0x200D, 0x27A1, 0x1F469, 0x1F3FE, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0xFE0F, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F469, 0x1F3FF, 0x200D, 0x1F9BC, 0x200D, 0x27A1,
+      0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x1F9BC, 0x200D, 0x27A1, 0x1F9D1, 0x200D, 0x1F9BD, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F9BD, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9BD, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x1F9BD, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9BD, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9BD, 0x1F9D1,
+      0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F9BD, 0x200D,
+      0x27A1, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F9BD, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9BD, 0x200D, 0x27A1,
+      0xFE0F, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9BD,
+      0x200D, 0x27A1, 0xFE0F, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F468, 0x200D,
+      0x1F9BD, 0x1F468, 0x1F3FB, 0x200D, 0x1F9BD, 0x1F468, 0x1F3FC, 0x200D, 0x1F9BD, 0x1F468,
+      0x1F3FD, 0x200D, 0x1F9BD, 0x1F468, 0x1F3FE, 0x200D, 0x1F9BD, 0x1F468, 0x1F3FF, 0x200D,
+      0x1F9BD, 0x1F468, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x200D, 0x1F9BD, 0x200D,
+      0x27A1, 0x1F468, 0x1F3FB, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FB, 0x200D,
+      0x1F9BD, 0x200D, 0x27A1, 0x1F468, 0x1F3FC, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F468,
+      0x1F3FC, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F468, 0x1F3FD, 0x200D, 0x1F9BD, 0x200D, 0x27A1,
+      0xFE0F, 0x1F468, 0x1F3FD, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F468, 0x1F3FE, 0x200D, 0x1F9BD,
+      0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FE, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F468, 0x1F3FF,
+      0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F468, 0x1F3FF, 0x200D, 0x1F9BD, 0x200D, 0x27A1,
+      0x1F469, 0x200D, 0x1F9BD, 0x1F469, 0x1F3FB, 0x200D, 0x1F9BD, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F9BD, 0x1F469, 0x1F3FD, 0x200D, 0x1F9BD, 0x1F469, 0x1F3FE, 0x200D, 0x1F9BD, 0x1F469,
+      0x1F3FF, 0x200D, 0x1F9BD, 0x1F469, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x200D,
+      0x1F9BD, 0x200D, 0x27A1, 0x1F469, 0x1F3FB, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F469,
+      0x1F3FB, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F469, 0x1F3FC, 0x200D, 0x1F9BD, 0x200D, 0x27A1,
+      0xFE0F, 0x1F469, 0x1F3FC, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F469, 0x1F3FD, 0x200D, 0x1F9BD,
+      0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FD, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FE, 0x200D, 0x1F9BD, 0x200D, 0x27A1,
+      0x1F469, 0x1F3FF, 0x200D, 0x1F9BD, 0x200D, 0x27A1, 0xFE0F, 0x1F469, 0x1F3FF, 0x200D, 0x1F9BD,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3C3, 0x1F3FB, 0x1F3C3, 0x1F3FC, 0x1F3C3, 0x1F3FD, 0x1F3C3,
+      0x1F3FE, 0x1F3C3, 0x1F3FF, 0x1F3C3, 0x200D, 0x2642, 0xFE0F, 0x1F3C3, 0x200D, 0x2642, 0x1F3C3,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F3C3, 0x1F3FB, 0x200D, 0x2642, 0x1F3C3, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x1F3C3, 0x1F3FC, 0x200D, 0x2642, 0x1F3C3, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x1F3C3, 0x1F3FD, 0x200D, 0x2642, 0x1F3C3, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F3C3, 0x1F3FE,
+      0x200D, 0x2642, 0x1F3C3, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2642,
+      0x1F3C3, 0x200D, 0x2640, 0xFE0F, 0x1F3C3, 0x200D, 0x2640, 0x1F3C3, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x1F3C3, 0x1F3FB, 0x200D, 0x2640, 0x1F3C3, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F3C3,
+      0x1F3FC, 0x200D, 0x2640, 0x1F3C3, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F3C3, 0x1F3FD, 0x200D,
+      0x2640, 0x1F3C3, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F3C3, 0x1F3FE, 0x200D, 0x2640, 0x1F3C3,
+      0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2640, 0x1F3C3, 0x200D, 0x27A1,
+      0xFE0F, 0x1F3C3, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FB, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FB,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3FC, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FC, 0x200D, 0x27A1,
+      0x1F3C3, 0x1F3FD, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FD, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FE,
+      0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FE, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FF, 0x200D, 0x27A1,
+      0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x27A1, 0x1F3C3, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1,
+      0xFE0F, 0x1F3C3, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x200D, 0x2640, 0xFE0F,
+      0x200D, 0x27A1, 0x1F3C3, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FB, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F,
+      0x1F3C3, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FB, 0x200D, 0x2640,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3,
+      0x1F3FC, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3FC, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FD, 0x200D, 0x2640, 0x200D, 0x27A1,
+      0xFE0F, 0x1F3C3, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FD, 0x200D,
+      0x2640, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F,
+      0x1F3C3, 0x1F3FE, 0x200D, 0x2640, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FE, 0x200D, 0x2640, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2640, 0x200D,
+      0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FF,
+      0x200D, 0x2640, 0x200D, 0x27A1, 0x1F3C3, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F,
+      0x1F3C3, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x200D, 0x2642, 0xFE0F, 0x200D,
+      0x27A1, 0x1F3C3, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FB, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FB, 0x200D, 0x2642, 0x200D,
+      0x27A1, 0x1F3C3, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FC,
+      0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x200D,
+      0x27A1, 0x1F3C3, 0x1F3FC, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FD, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F,
+      0x1F3C3, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FD, 0x200D, 0x2642,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3,
+      0x1F3FE, 0x200D, 0x2642, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FE, 0x200D, 0x2642, 0xFE0F,
+      0x200D, 0x27A1, 0x1F3C3, 0x1F3FE, 0x200D, 0x2642, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x200D, 0x27A1, 0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2642, 0x200D, 0x27A1,
+      0xFE0F, 0x1F3C3, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x200D, 0x27A1, 0x1F3C3, 0x1F3FF, 0x200D,
+      0x2642, 0x200D, 0x27A1, 0x1F9D1, 0x200D, 0x1FA70, 0x1F9D1, 0x1F3FB, 0x200D, 0x1FA70, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x1FA70, 0x1F9D1, 0x1F3FD, 0x200D, 0x1FA70, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1FA70, 0x1F9D1, 0x1F3FF, 0x200D, 0x1FA70, 0x1F483, 0x1F483, 0x1F3FB, 0x1F483, 0x1F3FC,
+      0x1F483, 0x1F3FD, 0x1F483, 0x1F3FE, 0x1F483, 0x1F3FF, 0x1F57A, 0x1F57A, 0x1F3FB, 0x1F57A,
+      0x1F3FC, 0x1F57A, 0x1F3FD, 0x1F57A, 0x1F3FE, 0x1F57A, 0x1F3FF, 0x1F574, 0xFE0F, 0x1F574,
+      0x1F574, 0x1F3FB, 0x1F574, 0x1F3FC, 0x1F574, 0x1F3FD, 0x1F574, 0x1F3FE, 0x1F574, 0x1F3FF,
+      0x1F46F, 0x1F46F, 0x1F3FB, 0x1F46F, 0x1F3FC, 0x1F46F, 0x1F3FD, 0x1F46F, 0x1F3FE, 0x1F46F,
+      0x1F3FF, 0x1F46F, 0x200D, 0x2642, 0xFE0F, 0x1F46F, 0x200D, 0x2642, 0x1F46F, 0x1F3FB, 0x200D,
+      0x2642, 0xFE0F, 0x1F46F, 0x1F3FB, 0x200D, 0x2642, 0x1F46F, 0x1F3FC, 0x200D, 0x2642, 0xFE0F,
+      0x1F46F, 0x1F3FC, 0x200D, 0x2642, 0x1F46F, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F46F, 0x1F3FD,
+      0x200D, 0x2642, 0x1F46F, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F46F, 0x1F3FE, 0x200D, 0x2642,
+      0x1F46F, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F46F, 0x1F3FF, 0x200D, 0x2642, 0x1F46F, 0x200D,
+      0x2640, 0xFE0F, 0x1F46F, 0x200D, 0x2640, 0x1F46F, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F46F,
+      0x1F3FB, 0x200D, 0x2640, 0x1F46F, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F46F, 0x1F3FC, 0x200D,
+      0x2640, 0x1F46F, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F46F, 0x1F3FD, 0x200D, 0x2640, 0x1F46F,
+      0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F46F, 0x1F3FE, 0x200D, 0x2640, 0x1F46F, 0x1F3FF, 0x200D,
+      0x2640, 0xFE0F, 0x1F46F, 0x1F3FF, 0x200D, 0x2640, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F430, 0x200D,
+      0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F430,
+      0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FB,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F430, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F430, 0x200D,
+      0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1,
+      0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F430,
+      0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FD,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x1F430, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F9D1,
+      0x1F3FC, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x1F430, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x1F430, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F468, 0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FD, 0x1F468,
+      0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x1F430,
+      0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC, 0x200D,
+      0x1F430, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F468,
+      0x1F3FF, 0x1F468, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FD,
+      0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D, 0x1F430, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x1F430,
+      0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FD,
+      0x1F468, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FF, 0x200D,
+      0x1F430, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F468,
+      0x1F3FC, 0x1F468, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FF,
+      0x200D, 0x1F430, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x1F430, 0x200D,
+      0x1F469, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FD, 0x1F469,
+      0x1F3FB, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x1F430,
+      0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F430, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x1F430, 0x200D, 0x1F469,
+      0x1F3FF, 0x1F469, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FD,
+      0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x1F430, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FF, 0x1F469,
+      0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x1F430,
+      0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FD,
+      0x1F469, 0x1F3FE, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D,
+      0x1F430, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FF,
+      0x200D, 0x1F430, 0x200D, 0x1F469, 0x1F3FE, 0x1F9D6, 0x1F9D6, 0x1F3FB, 0x1F9D6, 0x1F3FC,
+      0x1F9D6, 0x1F3FD, 0x1F9D6, 0x1F3FE, 0x1F9D6, 0x1F3FF, 0x1F9D6, 0x200D, 0x2642, 0xFE0F,
+      0x1F9D6, 0x200D, 0x2642, 0x1F9D6, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F9D6, 0x1F3FB, 0x200D,
+      0x2642, 0x1F9D6, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9D6, 0x1F3FC, 0x200D, 0x2642, 0x1F9D6,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9D6, 0x1F3FD, 0x200D, 0x2642, 0x1F9D6, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F9D6, 0x1F3FE, 0x200D, 0x2642, 0x1F9D6, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F9D6, 0x1F3FF, 0x200D, 0x2642, 0x1F9D6, 0x200D, 0x2640, 0xFE0F, 0x1F9D6, 0x200D, 0x2640,
+      0x1F9D6, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9D6, 0x1F3FB, 0x200D, 0x2640, 0x1F9D6, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x1F9D6, 0x1F3FC, 0x200D, 0x2640, 0x1F9D6, 0x1F3FD, 0x200D, 0x2640,
+      0xFE0F, 0x1F9D6, 0x1F3FD, 0x200D, 0x2640, 0x1F9D6, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9D6,
+      0x1F3FE, 0x200D, 0x2640, 0x1F9D6, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F9D6, 0x1F3FF, 0x200D,
+      0x2640, 0x1F9D7, 0x1F9D7, 0x1F3FB, 0x1F9D7, 0x1F3FC, 0x1F9D7, 0x1F3FD, 0x1F9D7, 0x1F3FE,
+      0x1F9D7, 0x1F3FF, 0x1F9D7, 0x200D, 0x2642, 0xFE0F, 0x1F9D7, 0x200D, 0x2642, 0x1F9D7, 0x1F3FB,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D7, 0x1F3FB, 0x200D, 0x2642, 0x1F9D7, 0x1F3FC, 0x200D, 0x2642,
+      0xFE0F, 0x1F9D7, 0x1F3FC, 0x200D, 0x2642, 0x1F9D7, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9D7,
+      0x1F3FD, 0x200D, 0x2642, 0x1F9D7, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9D7, 0x1F3FE, 0x200D,
+      0x2642, 0x1F9D7, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F9D7, 0x1F3FF, 0x200D, 0x2642, 0x1F9D7,
+      0x200D, 0x2640, 0xFE0F, 0x1F9D7, 0x200D, 0x2640, 0x1F9D7, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D7, 0x1F3FB, 0x200D, 0x2640, 0x1F9D7, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9D7, 0x1F3FC,
+      0x200D, 0x2640, 0x1F9D7, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9D7, 0x1F3FD, 0x200D, 0x2640,
+      0x1F9D7, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F9D7, 0x1F3FE, 0x200D, 0x2640, 0x1F9D7, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F9D7, 0x1F3FF, 0x200D, 0x2640, 0x1F93A, 0x1F3C7, 0x1F3C7, 0x1F3FB,
+      0x1F3C7, 0x1F3FC, 0x1F3C7, 0x1F3FD, 0x1F3C7, 0x1F3FE, 0x1F3C7, 0x1F3FF, 0x26F7, 0xFE0F,
+      0x26F7, 0x1F3C2, 0x1F3C2, 0x1F3FB, 0x1F3C2, 0x1F3FC, 0x1F3C2, 0x1F3FD, 0x1F3C2, 0x1F3FE,
+      0x1F3C2, 0x1F3FF, 0x1F3CC, 0xFE0F, 0x1F3CC, 0x1F3CC, 0x1F3FB, 0x1F3CC, 0x1F3FC, 0x1F3CC,
+      0x1F3FD, 0x1F3CC, 0x1F3FE, 0x1F3CC, 0x1F3FF, 0x1F3CC, 0xFE0F, 0x200D, 0x2642, 0xFE0F,
+      0x1F3CC, 0x200D, 0x2642, 0xFE0F, 0x1F3CC, 0xFE0F, 0x200D, 0x2642, 0x1F3CC, 0x200D, 0x2642,
+      0x1F3CC, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F3CC, 0x1F3FB, 0x200D, 0x2642, 0x1F3CC, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F3CC, 0x1F3FC, 0x200D, 0x2642, 0x1F3CC, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F3CC, 0x1F3FD, 0x200D, 0x2642, 0x1F3CC, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F3CC,
+      0x1F3FE, 0x200D, 0x2642, 0x1F3CC, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F3CC, 0x1F3FF, 0x200D,
+      0x2642, 0x1F3CC, 0xFE0F, 0x200D, 0x2640, 0xFE0F, 0x1F3CC, 0x200D, 0x2640, 0xFE0F, 0x1F3CC,
+      0xFE0F, 0x200D, 0x2640, 0x1F3CC, 0x200D, 0x2640, 0x1F3CC, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F3CC, 0x1F3FB, 0x200D, 0x2640, 0x1F3CC, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F3CC, 0x1F3FC,
+      0x200D, 0x2640, 0x1F3CC, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F3CC, 0x1F3FD, 0x200D, 0x2640,
+      0x1F3CC, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F3CC, 0x1F3FE, 0x200D, 0x2640, 0x1F3CC, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F3CC, 0x1F3FF, 0x200D, 0x2640, 0x1F3C4, 0x1F3C4, 0x1F3FB, 0x1F3C4,
+      0x1F3FC, 0x1F3C4, 0x1F3FD, 0x1F3C4, 0x1F3FE, 0x1F3C4, 0x1F3FF, 0x1F3C4, 0x200D, 0x2642,
+      0xFE0F, 0x1F3C4, 0x200D, 0x2642, 0x1F3C4, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F3C4, 0x1F3FB,
+      0x200D, 0x2642, 0x1F3C4, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F3C4, 0x1F3FC, 0x200D, 0x2642,
+      0x1F3C4, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F3C4, 0x1F3FD, 0x200D, 0x2642, 0x1F3C4, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F3C4, 0x1F3FE, 0x200D, 0x2642, 0x1F3C4, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F3C4, 0x1F3FF, 0x200D, 0x2642, 0x1F3C4, 0x200D, 0x2640, 0xFE0F, 0x1F3C4, 0x200D,
+      0x2640, 0x1F3C4, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F3C4, 0x1F3FB, 0x200D, 0x2640, 0x1F3C4,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F3C4, 0x1F3FC, 0x200D, 0x2640, 0x1F3C4, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F3C4, 0x1F3FD, 0x200D, 0x2640, 0x1F3C4, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F3C4, 0x1F3FE, 0x200D, 0x2640, 0x1F3C4, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F3C4, 0x1F3FF,
+      0x200D, 0x2640, 0x1F6A3, 0x1F6A3, 0x1F3FB, 0x1F6A3, 0x1F3FC, 0x1F6A3, 0x1F3FD, 0x1F6A3,
+      0x1F3FE, 0x1F6A3, 0x1F3FF, 0x1F6A3, 0x200D, 0x2642, 0xFE0F, 0x1F6A3, 0x200D, 0x2642, 0x1F6A3,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F6A3, 0x1F3FB, 0x200D, 0x2642, 0x1F6A3, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x1F6A3, 0x1F3FC, 0x200D, 0x2642, 0x1F6A3, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x1F6A3, 0x1F3FD, 0x200D, 0x2642, 0x1F6A3, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F6A3, 0x1F3FE,
+      0x200D, 0x2642, 0x1F6A3, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F6A3, 0x1F3FF, 0x200D, 0x2642,
+      0x1F6A3, 0x200D, 0x2640, 0xFE0F, 0x1F6A3, 0x200D, 0x2640, 0x1F6A3, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x1F6A3, 0x1F3FB, 0x200D, 0x2640, 0x1F6A3, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F6A3,
+      0x1F3FC, 0x200D, 0x2640, 0x1F6A3, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F6A3, 0x1F3FD, 0x200D,
+      0x2640, 0x1F6A3, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F6A3, 0x1F3FE, 0x200D, 0x2640, 0x1F6A3,
+      0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F6A3, 0x1F3FF, 0x200D, 0x2640, 0x1F3CA, 0x1F3CA, 0x1F3FB,
+      0x1F3CA, 0x1F3FC, 0x1F3CA, 0x1F3FD, 0x1F3CA, 0x1F3FE, 0x1F3CA, 0x1F3FF, 0x1F3CA, 0x200D,
+      0x2642, 0xFE0F, 0x1F3CA, 0x200D, 0x2642, 0x1F3CA, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F3CA,
+      0x1F3FB, 0x200D, 0x2642, 0x1F3CA, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F3CA, 0x1F3FC, 0x200D,
+      0x2642, 0x1F3CA, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F3CA, 0x1F3FD, 0x200D, 0x2642, 0x1F3CA,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F3CA, 0x1F3FE, 0x200D, 0x2642, 0x1F3CA, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F3CA, 0x1F3FF, 0x200D, 0x2642, 0x1F3CA, 0x200D, 0x2640, 0xFE0F, 0x1F3CA,
+      0x200D, 0x2640, 0x1F3CA, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F3CA, 0x1F3FB, 0x200D, 0x2640,
+      0x1F3CA, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F3CA, 0x1F3FC, 0x200D, 0x2640, 0x1F3CA, 0x1F3FD,
+      0x200D, 0x2640, 0xFE0F, 0x1F3CA, 0x1F3FD, 0x200D, 0x2640, 0x1F3CA, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x1F3CA, 0x1F3FE, 0x200D, 0x2640, 0x1F3CA, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F3CA,
+      0x1F3FF, 0x200D, 0x2640, 0x26F9, 0xFE0F, 0x26F9, 0x26F9, 0x1F3FB, 0x26F9, 0x1F3FC, 0x26F9,
+      0x1F3FD, 0x26F9, 0x1F3FE, 0x26F9, 0x1F3FF, 0x26F9, 0xFE0F, 0x200D, 0x2642, 0xFE0F, 0x26F9,
+      0x200D, 0x2642, 0xFE0F, 0x26F9, 0xFE0F, 0x200D, 0x2642, 0x26F9, 0x200D, 0x2642, 0x26F9,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x26F9, 0x1F3FB, 0x200D, 0x2642, 0x26F9, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x26F9, 0x1F3FC, 0x200D, 0x2642, 0x26F9, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x26F9, 0x1F3FD, 0x200D, 0x2642, 0x26F9, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x26F9, 0x1F3FE,
+      0x200D, 0x2642, 0x26F9, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x26F9, 0x1F3FF, 0x200D, 0x2642,
+      0x26F9, 0xFE0F, 0x200D, 0x2640, 0xFE0F, 0x26F9, 0x200D, 0x2640, 0xFE0F, 0x26F9, 0xFE0F,
+      0x200D, 0x2640, 0x26F9, 0x200D, 0x2640, 0x26F9, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x26F9,
+      0x1F3FB, 0x200D, 0x2640, 0x26F9, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x26F9, 0x1F3FC, 0x200D,
+      0x2640, 0x26F9, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x26F9, 0x1F3FD, 0x200D, 0x2640, 0x26F9,
+      0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x26F9, 0x1F3FE, 0x200D, 0x2640, 0x26F9, 0x1F3FF, 0x200D,
+      0x2640, 0xFE0F, 0x26F9, 0x1F3FF, 0x200D, 0x2640, 0x1F3CB, 0xFE0F, 0x1F3CB, 0x1F3CB, 0x1F3FB,
+      0x1F3CB, 0x1F3FC, 0x1F3CB, 0x1F3FD, 0x1F3CB, 0x1F3FE, 0x1F3CB, 0x1F3FF, 0x1F3CB, 0xFE0F,
+      0x200D, 0x2642, 0xFE0F, 0x1F3CB, 0x200D, 0x2642, 0xFE0F, 0x1F3CB, 0xFE0F, 0x200D, 0x2642,
+      0x1F3CB, 0x200D, 0x2642, 0x1F3CB, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F3CB, 0x1F3FB, 0x200D,
+      0x2642, 0x1F3CB, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F3CB, 0x1F3FC, 0x200D, 0x2642, 0x1F3CB,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F3CB, 0x1F3FD, 0x200D, 0x2642, 0x1F3CB, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F3CB, 0x1F3FE, 0x200D, 0x2642, 0x1F3CB, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F3CB, 0x1F3FF, 0x200D, 0x2642, 0x1F3CB, 0xFE0F, 0x200D, 0x2640, 0xFE0F, 0x1F3CB, 0x200D,
+      0x2640, 0xFE0F, 0x1F3CB, 0xFE0F, 0x200D, 0x2640, 0x1F3CB, 0x200D, 0x2640, 0x1F3CB, 0x1F3FB,
+      0x200D, 0x2640, 0xFE0F, 0x1F3CB, 0x1F3FB, 0x200D, 0x2640, 0x1F3CB, 0x1F3FC, 0x200D, 0x2640,
+      0xFE0F, 0x1F3CB, 0x1F3FC, 0x200D, 0x2640, 0x1F3CB, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F3CB,
+      0x1F3FD, 0x200D, 0x2640, 0x1F3CB, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F3CB, 0x1F3FE, 0x200D,
+      0x2640, 0x1F3CB, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F3CB, 0x1F3FF, 0x200D, 0x2640, 0x1F6B4,
+      0x1F6B4, 0x1F3FB, 0x1F6B4, 0x1F3FC, 0x1F6B4, 0x1F3FD, 0x1F6B4, 0x1F3FE, 0x1F6B4, 0x1F3FF,
+      0x1F6B4, 0x200D, 0x2642, 0xFE0F, 0x1F6B4, 0x200D, 0x2642, 0x1F6B4, 0x1F3FB, 0x200D, 0x2642,
+      0xFE0F, 0x1F6B4, 0x1F3FB, 0x200D, 0x2642, 0x1F6B4, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F6B4,
+      0x1F3FC, 0x200D, 0x2642, 0x1F6B4, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F6B4, 0x1F3FD, 0x200D,
+      0x2642, 0x1F6B4, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F6B4, 0x1F3FE, 0x200D, 0x2642, 0x1F6B4,
+      0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F6B4, 0x1F3FF, 0x200D, 0x2642, 0x1F6B4, 0x200D, 0x2640,
+      0xFE0F, 0x1F6B4, 0x200D, 0x2640, 0x1F6B4, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F6B4, 0x1F3FB,
+      0x200D, 0x2640, 0x1F6B4, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F6B4, 0x1F3FC, 0x200D, 0x2640,
+      0x1F6B4, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F6B4, 0x1F3FD, 0x200D, 0x2640, 0x1F6B4, 0x1F3FE,
+      0x200D, 0x2640, 0xFE0F, 0x1F6B4, 0x1F3FE, 0x200D, 0x2640, 0x1F6B4, 0x1F3FF, 0x200D, 0x2640,
+      0xFE0F, 0x1F6B4, 0x1F3FF, 0x200D, 0x2640, 0x1F6B5, 0x1F6B5, 0x1F3FB, 0x1F6B5, 0x1F3FC,
+      0x1F6B5, 0x1F3FD, 0x1F6B5, 0x1F3FE, 0x1F6B5, 0x1F3FF, 0x1F6B5, 0x200D, 0x2642, 0xFE0F,
+      0x1F6B5, 0x200D, 0x2642, 0x1F6B5, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F6B5, 0x1F3FB, 0x200D,
+      0x2642, 0x1F6B5, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F6B5, 0x1F3FC, 0x200D, 0x2642, 0x1F6B5,
+      0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F6B5, 0x1F3FD, 0x200D, 0x2642, 0x1F6B5, 0x1F3FE, 0x200D,
+      0x2642, 0xFE0F, 0x1F6B5, 0x1F3FE, 0x200D, 0x2642, 0x1F6B5, 0x1F3FF, 0x200D, 0x2642, 0xFE0F,
+      0x1F6B5, 0x1F3FF, 0x200D, 0x2642, 0x1F6B5, 0x200D, 0x2640, 0xFE0F, 0x1F6B5, 0x200D, 0x2640,
+      0x1F6B5, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F6B5, 0x1F3FB, 0x200D, 0x2640, 0x1F6B5, 0x1F3FC,
+      0x200D, 0x2640, 0xFE0F, 0x1F6B5, 0x1F3FC, 0x200D, 0x2640, 0x1F6B5, 0x1F3FD, 0x200D, 0x2640,
+      0xFE0F, 0x1F6B5, 0x1F3FD, 0x200D, 0x2640, 0x1F6B5, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F6B5,
+      0x1F3FE, 0x200D, 0x2640, 0x1F6B5, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F6B5, 0x1F3FF, 0x200D,
+      0x2640, 0x1F938, 0x1F938, 0x1F3FB, 0x1F938, 0x1F3FC, 0x1F938, 0x1F3FD, 0x1F938, 0x1F3FE,
+      0x1F938, 0x1F3FF, 0x1F938, 0x200D, 0x2642, 0xFE0F, 0x1F938, 0x200D, 0x2642, 0x1F938, 0x1F3FB,
+      0x200D, 0x2642, 0xFE0F, 0x1F938, 0x1F3FB, 0x200D, 0x2642, 0x1F938, 0x1F3FC, 0x200D, 0x2642,
+      0xFE0F, 0x1F938, 0x1F3FC, 0x200D, 0x2642, 0x1F938, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F938,
+      0x1F3FD, 0x200D, 0x2642, 0x1F938, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F938, 0x1F3FE, 0x200D,
+      0x2642, 0x1F938, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F938, 0x1F3FF, 0x200D, 0x2642, 0x1F938,
+      0x200D, 0x2640, 0xFE0F, 0x1F938, 0x200D, 0x2640, 0x1F938, 0x1F3FB, 0x200D, 0x2640, 0xFE0F,
+      0x1F938, 0x1F3FB, 0x200D, 0x2640, 0x1F938, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F938, 0x1F3FC,
+      0x200D, 0x2640, 0x1F938, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F938, 0x1F3FD, 0x200D, 0x2640,
+      0x1F938, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F938, 0x1F3FE, 0x200D, 0x2640, 0x1F938, 0x1F3FF,
+      0x200D, 0x2640, 0xFE0F, 0x1F938, 0x1F3FF, 0x200D, 0x2640, 0x1F93C, 0x1F93C, 0x1F3FB, 0x1F93C,
+      0x1F3FC, 0x1F93C, 0x1F3FD, 0x1F93C, 0x1F3FE, 0x1F93C, 0x1F3FF, 0x1F93C, 0x200D, 0x2642,
+      0xFE0F, 0x1F93C, 0x200D, 0x2642, 0x1F93C, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F93C, 0x1F3FB,
+      0x200D, 0x2642, 0x1F93C, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F93C, 0x1F3FC, 0x200D, 0x2642,
+      0x1F93C, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F93C, 0x1F3FD, 0x200D, 0x2642, 0x1F93C, 0x1F3FE,
+      0x200D, 0x2642, 0xFE0F, 0x1F93C, 0x1F3FE, 0x200D, 0x2642, 0x1F93C, 0x1F3FF, 0x200D, 0x2642,
+      0xFE0F, 0x1F93C, 0x1F3FF, 0x200D, 0x2642, 0x1F93C, 0x200D, 0x2640, 0xFE0F, 0x1F93C, 0x200D,
+      0x2640, 0x1F93C, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F93C, 0x1F3FB, 0x200D, 0x2640, 0x1F93C,
+      0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F93C, 0x1F3FC, 0x200D, 0x2640, 0x1F93C, 0x1F3FD, 0x200D,
+      0x2640, 0xFE0F, 0x1F93C, 0x1F3FD, 0x200D, 0x2640, 0x1F93C, 0x1F3FE, 0x200D, 0x2640, 0xFE0F,
+      0x1F93C, 0x1F3FE, 0x200D, 0x2640, 0x1F93C, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F93C, 0x1F3FF,
+      0x200D, 0x2640, 0x1F9D1, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D, 0x1FAEF,
+      0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1,
+      0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D,
+      0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FE, 0x200D, 0x1FAEF,
+      0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1,
+      0x1F3FB, 0x1F9D1, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x1FAEF, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D,
+      0x1F9D1, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FC, 0x1F468,
+      0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FB, 0x200D, 0x1FAEF,
+      0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FC, 0x200D,
+      0x1FAEF, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FD,
+      0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FE, 0x1F468,
+      0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FE, 0x200D, 0x1FAEF,
+      0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FC,
+      0x1F468, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FE, 0x200D,
+      0x1FAEF, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F468,
+      0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FF,
+      0x200D, 0x1FAEF, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FC, 0x1F469,
+      0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x1FAEF,
+      0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FC, 0x200D,
+      0x1FAEF, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F469,
+      0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FD,
+      0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D,
+      0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FE, 0x1F469,
+      0x1F3FD, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D, 0x1FAEF,
+      0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FC,
+      0x1F469, 0x1F3FE, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FE, 0x200D,
+      0x1FAEF, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F469,
+      0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FF,
+      0x200D, 0x1FAEF, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FF, 0x200D, 0x1FAEF, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F93D, 0x1F93D, 0x1F3FB, 0x1F93D, 0x1F3FC, 0x1F93D, 0x1F3FD, 0x1F93D,
+      0x1F3FE, 0x1F93D, 0x1F3FF, 0x1F93D, 0x200D, 0x2642, 0xFE0F, 0x1F93D, 0x200D, 0x2642, 0x1F93D,
+      0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F93D, 0x1F3FB, 0x200D, 0x2642, 0x1F93D, 0x1F3FC, 0x200D,
+      0x2642, 0xFE0F, 0x1F93D, 0x1F3FC, 0x200D, 0x2642, 0x1F93D, 0x1F3FD, 0x200D, 0x2642, 0xFE0F,
+      0x1F93D, 0x1F3FD, 0x200D, 0x2642, 0x1F93D, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F93D, 0x1F3FE,
+      0x200D, 0x2642, 0x1F93D, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F93D, 0x1F3FF, 0x200D, 0x2642,
+      0x1F93D, 0x200D, 0x2640, 0xFE0F, 0x1F93D, 0x200D, 0x2640, 0x1F93D, 0x1F3FB, 0x200D, 0x2640,
+      0xFE0F, 0x1F93D, 0x1F3FB, 0x200D, 0x2640, 0x1F93D, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F93D,
+      0x1F3FC, 0x200D, 0x2640, 0x1F93D, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F93D, 0x1F3FD, 0x200D,
+      0x2640, 0x1F93D, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F93D, 0x1F3FE, 0x200D, 0x2640, 0x1F93D,
+      0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F93D, 0x1F3FF, 0x200D, 0x2640, 0x1F93E, 0x1F93E, 0x1F3FB,
+      0x1F93E, 0x1F3FC, 0x1F93E, 0x1F3FD, 0x1F93E, 0x1F3FE, 0x1F93E, 0x1F3FF, 0x1F93E, 0x200D,
+      0x2642, 0xFE0F, 0x1F93E, 0x200D, 0x2642, 0x1F93E, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F93E,
+      0x1F3FB, 0x200D, 0x2642, 0x1F93E, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F93E, 0x1F3FC, 0x200D,
+      0x2642, 0x1F93E, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F93E, 0x1F3FD, 0x200D, 0x2642, 0x1F93E,
+      0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F93E, 0x1F3FE, 0x200D, 0x2642, 0x1F93E, 0x1F3FF, 0x200D,
+      0x2642, 0xFE0F, 0x1F93E, 0x1F3FF, 0x200D, 0x2642, 0x1F93E, 0x200D, 0x2640, 0xFE0F, 0x1F93E,
+      0x200D, 0x2640, 0x1F93E, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F93E, 0x1F3FB, 0x200D, 0x2640,
+      0x1F93E, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F93E, 0x1F3FC, 0x200D, 0x2640, 0x1F93E, 0x1F3FD,
+      0x200D, 0x2640, 0xFE0F, 0x1F93E, 0x1F3FD, 0x200D, 0x2640, 0x1F93E, 0x1F3FE, 0x200D, 0x2640,
+      0xFE0F, 0x1F93E, 0x1F3FE, 0x200D, 0x2640, 0x1F93E, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F93E,
+      0x1F3FF, 0x200D, 0x2640, 0x1F939, 0x1F939, 0x1F3FB, 0x1F939, 0x1F3FC, 0x1F939, 0x1F3FD,
+      0x1F939, 0x1F3FE, 0x1F939, 0x1F3FF, 0x1F939, 0x200D, 0x2642, 0xFE0F, 0x1F939, 0x200D, 0x2642,
+      0x1F939, 0x1F3FB, 0x200D, 0x2642, 0xFE0F, 0x1F939, 0x1F3FB, 0x200D, 0x2642, 0x1F939, 0x1F3FC,
+      0x200D, 0x2642, 0xFE0F, 0x1F939, 0x1F3FC, 0x200D, 0x2642, 0x1F939, 0x1F3FD, 0x200D, 0x2642,
+      0xFE0F, 0x1F939, 0x1F3FD, 0x200D, 0x2642, 0x1F939, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F939,
+      0x1F3FE, 0x200D, 0x2642, 0x1F939, 0x1F3FF, 0x200D, 0x2642, 0xFE0F, 0x1F939, 0x1F3FF, 0x200D,
+      0x2642, 0x1F939, 0x200D, 0x2640, 0xFE0F, 0x1F939, 0x200D, 0x2640, 0x1F939, 0x1F3FB, 0x200D,
+      0x2640, 0xFE0F, 0x1F939, 0x1F3FB, 0x200D, 0x2640, 0x1F939, 0x1F3FC, 0x200D, 0x2640, 0xFE0F,
+      0x1F939, 0x1F3FC, 0x200D, 0x2640, 0x1F939, 0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F939, 0x1F3FD,
+      0x200D, 0x2640, 0x1F939, 0x1F3FE, 0x200D, 0x2640, 0xFE0F, 0x1F939, 0x1F3FE, 0x200D, 0x2640,
+      0x1F939, 0x1F3FF, 0x200D, 0x2640, 0xFE0F, 0x1F939, 0x1F3FF, 0x200D, 0x2640, 0x1F9D8, 0x1F9D8,
+      0x1F3FB, 0x1F9D8, 0x1F3FC, 0x1F9D8, 0x1F3FD, 0x1F9D8, 0x1F3FE, 0x1F9D8, 0x1F3FF, 0x1F9D8,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D8, 0x200D, 0x2642, 0x1F9D8, 0x1F3FB, 0x200D, 0x2642, 0xFE0F,
+      0x1F9D8, 0x1F3FB, 0x200D, 0x2642, 0x1F9D8, 0x1F3FC, 0x200D, 0x2642, 0xFE0F, 0x1F9D8, 0x1F3FC,
+      0x200D, 0x2642, 0x1F9D8, 0x1F3FD, 0x200D, 0x2642, 0xFE0F, 0x1F9D8, 0x1F3FD, 0x200D, 0x2642,
+      0x1F9D8, 0x1F3FE, 0x200D, 0x2642, 0xFE0F, 0x1F9D8, 0x1F3FE, 0x200D, 0x2642, 0x1F9D8, 0x1F3FF,
+      0x200D, 0x2642, 0xFE0F, 0x1F9D8, 0x1F3FF, 0x200D, 0x2642, 0x1F9D8, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D8, 0x200D, 0x2640, 0x1F9D8, 0x1F3FB, 0x200D, 0x2640, 0xFE0F, 0x1F9D8, 0x1F3FB, 0x200D,
+      0x2640, 0x1F9D8, 0x1F3FC, 0x200D, 0x2640, 0xFE0F, 0x1F9D8, 0x1F3FC, 0x200D, 0x2640, 0x1F9D8,
+      0x1F3FD, 0x200D, 0x2640, 0xFE0F, 0x1F9D8, 0x1F3FD, 0x200D, 0x2640, 0x1F9D8, 0x1F3FE, 0x200D,
+      0x2640, 0xFE0F, 0x1F9D8, 0x1F3FE, 0x200D, 0x2640, 0x1F9D8, 0x1F3FF, 0x200D, 0x2640, 0xFE0F,
+      0x1F9D8, 0x1F3FF, 0x200D, 0x2640, 0x1F6C0, 0x1F6C0, 0x1F3FB, 0x1F6C0, 0x1F3FC, 0x1F6C0,
+      0x1F3FD, 0x1F6C0, 0x1F3FE, 0x1F6C0, 0x1F3FF, 0x1F6CC, 0x1F6CC, 0x1F3FB, 0x1F6CC, 0x1F3FC,
+      0x1F6CC, 0x1F3FD, 0x1F6CC, 0x1F3FE, 0x1F6CC, 0x1F3FF, 0x1F9D1, 0x200D, 0x1F91D, 0x200D,
+      0x1F9D1, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FB,
+      0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F91D, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F91D,
+      0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x1F91D, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F91D, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F91D,
+      0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x1F91D, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F91D, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F46D, 0x1F46D, 0x1F3FB, 0x1F469,
+      0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x1F91D,
+      0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FE,
+      0x1F469, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F91D, 0x200D, 0x1F469, 0x1F3FB, 0x1F46D, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D, 0x1F91D,
+      0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FE,
+      0x1F469, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FD, 0x200D,
+      0x1F91D, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F46D, 0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FE,
+      0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D,
+      0x1F91D, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FD, 0x1F46D, 0x1F3FE,
+      0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D,
+      0x1F91D, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FF,
+      0x200D, 0x1F91D, 0x200D, 0x1F469, 0x1F3FE, 0x1F46D, 0x1F3FF, 0x1F46B, 0x1F46B, 0x1F3FB,
+      0x1F469, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D,
+      0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FC,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F46B, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D,
+      0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FD,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F46B, 0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FE,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F46B,
+      0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FF,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F469,
+      0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FE, 0x1F46B, 0x1F3FF, 0x1F46C, 0x1F46C,
+      0x1F3FB, 0x1F468, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FB,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FB, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F46C, 0x1F3FC, 0x1F468, 0x1F3FC,
+      0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FD, 0x200D, 0x1F91D,
+      0x200D, 0x1F468, 0x1F3FC, 0x1F46C, 0x1F3FD, 0x1F468, 0x1F3FD, 0x200D, 0x1F91D, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FD, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x1F91D,
+      0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD,
+      0x1F46C, 0x1F3FE, 0x1F468, 0x1F3FE, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x1F91D,
+      0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FD,
+      0x1F468, 0x1F3FF, 0x200D, 0x1F91D, 0x200D, 0x1F468, 0x1F3FE, 0x1F46C, 0x1F3FF, 0x1F48F,
+      0x1F48F, 0x1F3FB, 0x1F48F, 0x1F3FC, 0x1F48F, 0x1F3FD, 0x1F48F, 0x1F3FE, 0x1F48F, 0x1F3FF,
+      0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1,
+      0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FB, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1,
+      0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1,
+      0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1,
+      0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FE, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1,
+      0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F9D1,
+      0x1F3FE, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F9D1, 0x1F3FE,
+      0x1F469, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F469, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469,
+      0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FB,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F469,
+      0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FC,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F469,
+      0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FD,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469,
+      0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FD,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469,
+      0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FE,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F469,
+      0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FF,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FF, 0x1F468, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F468, 0x200D,
+      0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FB, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FC, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC,
+      0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468,
+      0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FB, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FF, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FB, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F468,
+      0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FC, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FF, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468,
+      0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FD, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FD, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FE, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE,
+      0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468,
+      0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FE, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD,
+      0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468,
+      0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FE, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FE, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468,
+      0x1F3FC, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FC,
+      0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468,
+      0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FF, 0x200D,
+      0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FF, 0x200D, 0x2764,
+      0x200D, 0x1F48B, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D,
+      0x1F48B, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D,
+      0x1F468, 0x1F3FF, 0x1F469, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F469,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F,
+      0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D,
+      0x1F469, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469,
+      0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FB, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FC,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FC, 0x1F469,
+      0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FF, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469,
+      0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469,
+      0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469,
+      0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FE,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B,
+      0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469,
+      0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FD, 0x1F469,
+      0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FF,
+      0x200D, 0x2764, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F48B, 0x200D, 0x1F469, 0x1F3FF, 0x1F491, 0x1F491, 0x1F3FB, 0x1F491, 0x1F3FC, 0x1F491,
+      0x1F3FD, 0x1F491, 0x1F3FE, 0x1F491, 0x1F3FF, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F,
+      0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D,
+      0x2764, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1,
+      0x1F3FE, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FB,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FB,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FD,
+      0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D,
+      0x2764, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1,
+      0x1F3FF, 0x1F9D1, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FD,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FC,
+      0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FE,
+      0x1F9D1, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FD, 0x200D,
+      0x2764, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1,
+      0x1F3FB, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FE,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FD,
+      0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F9D1, 0x1F3FF, 0x1F9D1, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FF,
+      0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FF, 0x200D,
+      0x2764, 0x200D, 0x1F9D1, 0x1F3FB, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1,
+      0x1F3FC, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FC, 0x1F9D1, 0x1F3FF,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F9D1, 0x1F3FD, 0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F9D1, 0x1F3FE,
+      0x1F9D1, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F9D1, 0x1F3FE, 0x1F469, 0x200D, 0x2764, 0xFE0F,
+      0x200D, 0x1F468, 0x1F469, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F469, 0x1F3FB, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FB,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FC,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FD,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FE,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F469, 0x1F3FF,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x200D, 0x2764, 0xFE0F,
+      0x200D, 0x1F468, 0x1F468, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F468, 0x1F3FB, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FB, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FB,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FC, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FC,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FD,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FE,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F468, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F468, 0x1F3FB, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FB,
+      0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FF, 0x200D,
+      0x2764, 0x200D, 0x1F468, 0x1F3FC, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468,
+      0x1F3FD, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FD, 0x1F468, 0x1F3FF,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FE, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F468, 0x1F3FE, 0x1F468, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F468, 0x1F3FF,
+      0x1F468, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F468, 0x1F3FF, 0x1F469, 0x200D, 0x2764, 0xFE0F,
+      0x200D, 0x1F469, 0x1F469, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F469, 0x1F3FB, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D,
+      0x2764, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FB,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FB, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FB, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FC, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D,
+      0x2764, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FC,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FC, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FC, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FD, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D,
+      0x2764, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FD,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FD, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FD, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FE, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D,
+      0x2764, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FE,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FE, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FE, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FF, 0x1F469, 0x1F3FF, 0x200D, 0x2764,
+      0xFE0F, 0x200D, 0x1F469, 0x1F3FB, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FB,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D,
+      0x2764, 0x200D, 0x1F469, 0x1F3FC, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469,
+      0x1F3FD, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FD, 0x1F469, 0x1F3FF,
+      0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D,
+      0x1F469, 0x1F3FE, 0x1F469, 0x1F3FF, 0x200D, 0x2764, 0xFE0F, 0x200D, 0x1F469, 0x1F3FF,
+      0x1F469, 0x1F3FF, 0x200D, 0x2764, 0x200D, 0x1F469, 0x1F3FF, 0x1F468, 0x200D, 0x1F469, 0x200D,
+      0x1F466, 0x1F468, 0x200D, 0x1F469, 0x200D, 0x1F467, 0x1F468, 0x200D, 0x1F469, 0x200D,
+      0x1F467, 0x200D, 0x1F466, 0x1F468, 0x200D, 0x1F469, 0x200D, 0x1F466, 0x200D, 0x1F466,
+      0x1F468, 0x200D, 0x1F469, 0x200D, 0x1F467, 0x200D, 0x1F467, 0x1F468, 0x200D, 0x1F468, 0x200D,
+      0x1F466, 0x1F468, 0x200D, 0x1F468, 0x200D, 0x1F467, 0x1F468, 0x200D, 0x1F468, 0x200D,
+      0x1F467, 0x200D, 0x1F466, 0x1F468, 0x200D, 0x1F468, 0x200D, 0x1F466, 0x200D, 0x1F466,
+      0x1F468, 0x200D, 0x1F468, 0x200D, 0x1F467, 0x200D, 0x1F467, 0x1F469, 0x200D, 0x1F469, 0x200D,
+      0x1F466, 0x1F469, 0x200D, 0x1F469, 0x200D, 0x1F467, 0x1F469, 0x200D, 0x1F469, 0x200D,
+      0x1F467, 0x200D, 0x1F466, 0x1F469, 0x200D, 0x1F469, 0x200D, 0x1F466, 0x200D, 0x1F466,
+      0x1F469, 0x200D, 0x1F469, 0x200D, 0x1F467, 0x200D, 0x1F467, 0x1F468, 0x200D, 0x1F466,
+      0x1F468, 0x200D, 0x1F466, 0x200D, 0x1F466, 0x1F468, 0x200D, 0x1F467, 0x1F468, 0x200D,
+      0x1F467, 0x200D, 0x1F466, 0x1F468, 0x200D, 0x1F467, 0x200D, 0x1F467, 0x1F469, 0x200D,
+      0x1F466, 0x1F469, 0x200D, 0x1F466, 0x200D, 0x1F466, 0x1F469, 0x200D, 0x1F467, 0x1F469,
+      0x200D, 0x1F467, 0x200D, 0x1F466, 0x1F469, 0x200D, 0x1F467, 0x200D, 0x1F467, 0x1F5E3, 0xFE0F,
+      0x1F5E3, 0x1F464, 0x1F465, 0x1FAC2, 0x1F46A, 0x1F9D1, 0x200D, 0x1F9D1, 0x200D, 0x1F9D2,
+      0x1F9D1, 0x200D, 0x1F9D1, 0x200D, 0x1F9D2, 0x200D, 0x1F9D2, 0x1F9D1, 0x200D, 0x1F9D2,
+      0x1F9D1, 0x200D, 0x1F9D2, 0x200D, 0x1F9D2, 0x1F463, 0x1FAC6, 0x1F3FB, 0x1F3FC, 0x1F3FD,
+      0x1F3FE, 0x1F3FF, 0x1F9B0, 0x1F9B1, 0x1F9B3, 0x1F9B2, 0x1F435, 0x1F412, 0x1F98D, 0x1F9A7,
+      0x1F436, 0x1F415, 0x1F9AE, 0x1F415, 0x200D, 0x1F9BA, 0x1F429, 0x1F43A, 0x1F98A, 0x1F99D,
+      0x1F431, 0x1F408, 0x1F408, 0x200D, 0x2B1B, 0x1F981, 0x1F42F, 0x1F405, 0x1F406, 0x1F434,
+      0x1FACE, 0x1FACF, 0x1F40E, 0x1F984, 0x1F993, 0x1F98C, 0x1F9AC, 0x1F42E, 0x1F402, 0x1F403,
+      0x1F404, 0x1F437, 0x1F416, 0x1F417, 0x1F43D, 0x1F40F, 0x1F411, 0x1F410, 0x1F42A, 0x1F42B,
+      0x1F999, 0x1F992, 0x1F418, 0x1F9A3, 0x1F98F, 0x1F99B, 0x1F42D, 0x1F401, 0x1F400, 0x1F439,
+      0x1F430, 0x1F407, 0x1F43F, 0xFE0F, 0x1F43F, 0x1F9AB, 0x1F994, 0x1F987, 0x1F43B, 0x1F43B,
+      0x200D, 0x2744, 0xFE0F, 0x1F43B, 0x200D, 0x2744, 0x1F428, 0x1F43C, 0x1F9A5, 0x1F9A6, 0x1F9A8,
+      0x1F998, 0x1F9A1, 0x1F43E, 0x1F983, 0x1F414, 0x1F413, 0x1F423, 0x1F424, 0x1F425, 0x1F426,
+      0x1F427, 0x1F54A, 0xFE0F, 0x1F54A, 0x1F985, 0x1F986, 0x1F9A2, 0x1F989, 0x1F9A4, 0x1FAB6,
+      0x1F9A9, 0x1F99A, 0x1F99C, 0x1FABD, 0x1F426, 0x200D, 0x2B1B, 0x1FABF, 0x1F426, 0x200D,
+      0x1F525, 0x1F438, 0x1F40A, 0x1F422, 0x1F98E, 0x1F40D, 0x1F432, 0x1F409, 0x1F995, 0x1F996,
+      0x1F433, 0x1F40B, 0x1F42C, 0x1FACD, 0x1F9AD, 0x1F41F, 0x1F420, 0x1F421, 0x1F988, 0x1F419,
+      0x1F41A, 0x1FAB8, 0x1FABC, 0x1F980, 0x1F99E, 0x1F990, 0x1F991, 0x1F9AA, 0x1F40C, 0x1F98B,
+      0x1F41B, 0x1F41C, 0x1F41D, 0x1FAB2, 0x1F41E, 0x1F997, 0x1FAB3, 0x1F577, 0xFE0F, 0x1F577,
+      0x1F578, 0xFE0F, 0x1F578, 0x1F982, 0x1F99F, 0x1FAB0, 0x1FAB1, 0x1F9A0, 0x1F490, 0x1F338,
+      0x1F4AE, 0x1FAB7, 0x1F3F5, 0xFE0F, 0x1F3F5, 0x1F339, 0x1F940, 0x1F33A, 0x1F33B, 0x1F33C,
+      0x1F337, 0x1FABB, 0x1F331, 0x1FAB4, 0x1F332, 0x1F333, 0x1F334, 0x1F335, 0x1F33E, 0x1F33F,
+      0x2618, 0xFE0F, 0x2618, 0x1F340, 0x1F341, 0x1F342, 0x1F343, 0x1FAB9, 0x1FABA, 0x1F344,
+      0x1FABE, 0x1F347, 0x1F348, 0x1F349, 0x1F34A, 0x1F34B, 0x1F34B, 0x200D, 0x1F7E9, 0x1F34C,
+      0x1F34D, 0x1F96D, 0x1F34E, 0x1FADD, 0x1F34F, 0x1F350, 0x1F351, 0x1F352, 0x1F353, 0x1FAD0,
+      0x1F95D, 0x1F345, 0x1FAD2, 0x1F965, 0x1F951, 0x1F346, 0x1F954, 0x1F955, 0x1F33D, 0x1F336,
+      0xFE0F, 0x1F336, 0x1FAD1, 0x1F952, 0x1F96C, 0x1F966, 0x1F9C4, 0x1F9C5, 0x1F95C, 0x1FAD8,
+      0x1F330, 0x1FADA, 0x1FADB, 0x1F344, 0x200D, 0x1F7EB, 0x1FADC, 0x1F35E, 0x1F950, 0x1F956,
+      0x1FAD3, 0x1F968, 0x1F96F, 0x1F95E, 0x1F9C7, 0x1F9C0, 0x1F356, 0x1F357, 0x1F969, 0x1F953,
+      0x1F354, 0x1F35F, 0x1F355, 0x1F32D, 0x1F96A, 0x1F32E, 0x1F32F, 0x1FAD4, 0x1F959, 0x1F9C6,
+      0x1F95A, 0x1F373, 0x1F958, 0x1F372, 0x1FAD5, 0x1F963, 0x1F957, 0x1F37F, 0x1F9C8, 0x1F9C2,
+      0x1F96B, 0x1F371, 0x1F358, 0x1F359, 0x1F35A, 0x1F35B, 0x1F35C, 0x1F35D, 0x1F360, 0x1F362,
+      0x1F363, 0x1F364, 0x1F365, 0x1F96E, 0x1F361, 0x1F95F, 0x1F960, 0x1F961, 0x1F366, 0x1F367,
+      0x1F368, 0x1F369, 0x1F36A, 0x1F382, 0x1F370, 0x1F9C1, 0x1F967, 0x1F36B, 0x1F36C, 0x1F36D,
+      0x1F36E, 0x1F36F, 0x1F37C, 0x1F95B, 0x2615, 0x1FAD6, 0x1F375, 0x1F376, 0x1F37E, 0x1F377,
+      0x1F378, 0x1F379, 0x1F37A, 0x1F37B, 0x1F942, 0x1F943, 0x1FAD7, 0x1F964, 0x1F9CB, 0x1F9C3,
+      0x1F9C9, 0x1F9CA, 0x1F962, 0x1F37D, 0xFE0F, 0x1F37D, 0x1F374, 0x1F944, 0x1F52A, 0x1FAD9,
+      0x1F3FA, 0x1F30D, 0x1F30E, 0x1F30F, 0x1F310, 0x1F5FA, 0xFE0F, 0x1F5FA, 0x1F5FE, 0x1F9ED,
+      0x1F3D4, 0xFE0F, 0x1F3D4, 0x26F0, 0xFE0F, 0x26F0, 0x1F6D8, 0x1F30B, 0x1F5FB, 0x1F3D5, 0xFE0F,
+      0x1F3D5, 0x1F3D6, 0xFE0F, 0x1F3D6, 0x1F3DC, 0xFE0F, 0x1F3DC, 0x1F3DD, 0xFE0F, 0x1F3DD,
+      0x1F3DE, 0xFE0F, 0x1F3DE, 0x1F3DF, 0xFE0F, 0x1F3DF, 0x1F3DB, 0xFE0F, 0x1F3DB, 0x1F3D7,
+      0xFE0F, 0x1F3D7, 0x1F9F1, 0x1FAA8, 0x1FAB5, 0x1F6D6, 0x1F3D8, 0xFE0F, 0x1F3D8, 0x1F3DA,
+      0xFE0F, 0x1F3DA, 0x1F3E0, 0x1F3E1, 0x1F3E2, 0x1F3E3, 0x1F3E4, 0x1F3E5, 0x1F3E6, 0x1F3E8,
+      0x1F3E9, 0x1F3EA, 0x1F3EB, 0x1F3EC, 0x1F3ED, 0x1F3EF, 0x1F3F0, 0x1F492, 0x1F5FC, 0x1F5FD,
+      0x26EA, 0x1F54C, 0x1F6D5, 0x1F54D, 0x26E9, 0xFE0F, 0x26E9, 0x1F54B, 0x26F2, 0x26FA, 0x1F301,
+      0x1F303, 0x1F3D9, 0xFE0F, 0x1F3D9, 0x1F304, 0x1F305, 0x1F306, 0x1F307, 0x1F309, 0x2668,
+      0xFE0F, 0x2668, 0x1F3A0, 0x1F6DD, 0x1F3A1, 0x1F3A2, 0x1F488, 0x1F3AA, 0x1F682, 0x1F683,
+      0x1F684, 0x1F685, 0x1F686, 0x1F687, 0x1F688, 0x1F689, 0x1F68A, 0x1F69D, 0x1F69E, 0x1F68B,
+      0x1F68C, 0x1F68D, 0x1F68E, 0x1F690, 0x1F691, 0x1F692, 0x1F693, 0x1F694, 0x1F695, 0x1F696,
+      0x1F697, 0x1F698, 0x1F699, 0x1F6FB, 0x1F69A, 0x1F69B, 0x1F69C, 0x1F3CE, 0xFE0F, 0x1F3CE,
+      0x1F3CD, 0xFE0F, 0x1F3CD, 0x1F6F5, 0x1F9BD, 0x1F9BC, 0x1F6FA, 0x1F6B2, 0x1F6F4, 0x1F6F9,
+      0x1F6FC, 0x1F68F, 0x1F6E3, 0xFE0F, 0x1F6E3, 0x1F6E4, 0xFE0F, 0x1F6E4, 0x1F6E2, 0xFE0F,
+      0x1F6E2, 0x26FD, 0x1F6DE, 0x1F6A8, 0x1F6A5, 0x1F6A6, 0x1F6D1, 0x1F6A7, 0x2693, 0x1F6DF,
+      0x26F5, 0x1F6F6, 0x1F6A4, 0x1F6F3, 0xFE0F, 0x1F6F3, 0x26F4, 0xFE0F, 0x26F4, 0x1F6E5, 0xFE0F,
+      0x1F6E5, 0x1F6A2, 0x2708, 0xFE0F, 0x2708, 0x1F6E9, 0xFE0F, 0x1F6E9, 0x1F6EB, 0x1F6EC,
+      0x1FA82, 0x1F4BA, 0x1F681, 0x1F69F, 0x1F6A0, 0x1F6A1, 0x1F6F0, 0xFE0F, 0x1F6F0, 0x1F680,
+      0x1F6F8, 0x1F6CE, 0xFE0F, 0x1F6CE, 0x1F9F3, 0x231B, 0x23F3, 0x231A, 0x23F0, 0x23F1, 0xFE0F,
+      0x23F1, 0x23F2, 0xFE0F, 0x23F2, 0x1F570, 0xFE0F, 0x1F570, 0x1F55B, 0x1F567, 0x1F550, 0x1F55C,
+      0x1F551, 0x1F55D, 0x1F552, 0x1F55E, 0x1F553, 0x1F55F, 0x1F554, 0x1F560, 0x1F555, 0x1F561,
+      0x1F556, 0x1F562, 0x1F557, 0x1F563, 0x1F558, 0x1F564, 0x1F559, 0x1F565, 0x1F55A, 0x1F566,
+      0x1F311, 0x1F312, 0x1F313, 0x1F314, 0x1F315, 0x1F316, 0x1F317, 0x1F318, 0x1F319, 0x1F31A,
+      0x1F31B, 0x1F31C, 0x1F321, 0xFE0F, 0x1F321, 0x2600, 0xFE0F, 0x2600, 0x1F31D, 0x1F31E,
+      0x1FA90, 0x2B50, 0x1F31F, 0x1F320, 0x1F30C, 0x2601, 0xFE0F, 0x2601, 0x26C5, 0x26C8, 0xFE0F,
+      0x26C8, 0x1F324, 0xFE0F, 0x1F324, 0x1F325, 0xFE0F, 0x1F325, 0x1F326, 0xFE0F, 0x1F326,
+      0x1F327, 0xFE0F, 0x1F327, 0x1F328, 0xFE0F, 0x1F328, 0x1F329, 0xFE0F, 0x1F329, 0x1F32A,
+      0xFE0F, 0x1F32A, 0x1F32B, 0xFE0F, 0x1F32B, 0x1F32C, 0xFE0F, 0x1F32C, 0x1F300, 0x1F308,
+      0x1F302, 0x2602, 0xFE0F, 0x2602, 0x2614, 0x26F1, 0xFE0F, 0x26F1, 0x26A1, 0x2744, 0xFE0F,
+      0x2744, 0x2603, 0xFE0F, 0x2603, 0x26C4, 0x2604, 0xFE0F, 0x2604, 0x1F525, 0x1F4A7, 0x1F30A,
+      0x1F383, 0x1F384, 0x1F386, 0x1F387, 0x1F9E8, 0x2728, 0x1F388, 0x1F389, 0x1F38A, 0x1F38B,
+      0x1F38D, 0x1F38E, 0x1F38F, 0x1F390, 0x1F391, 0x1F9E7, 0x1F380, 0x1F381, 0x1F397, 0xFE0F,
+      0x1F397, 0x1F39F, 0xFE0F, 0x1F39F, 0x1F3AB, 0x1F396, 0xFE0F, 0x1F396, 0x1F3C6, 0x1F3C5,
+      0x1F947, 0x1F948, 0x1F949, 0x26BD, 0x26BE, 0x1F94E, 0x1F3C0, 0x1F3D0, 0x1F3C8, 0x1F3C9,
+      0x1F3BE, 0x1F94F, 0x1F3B3, 0x1F3CF, 0x1F3D1, 0x1F3D2, 0x1F94D, 0x1F3D3, 0x1F3F8, 0x1F94A,
+      0x1F94B, 0x1F945, 0x26F3, 0x26F8, 0xFE0F, 0x26F8, 0x1F3A3, 0x1F93F, 0x1F3BD, 0x1F3BF,
+      0x1F6F7, 0x1F94C, 0x1F3AF, 0x1FA80, 0x1FA81, 0x1F52B, 0x1F3B1, 0x1F52E, 0x1FA84, 0x1F3AE,
+      0x1F579, 0xFE0F, 0x1F579, 0x1F3B0, 0x1F3B2, 0x1F9E9, 0x1F9F8, 0x1FA85, 0x1FAA9, 0x1FA86,
+      0x2660, 0xFE0F, 0x2660, 0x2665, 0xFE0F, 0x2665, 0x2666, 0xFE0F, 0x2666, 0x2663, 0xFE0F,
+      0x2663, 0x265F, 0xFE0F, 0x265F, 0x1F0CF, 0x1F004, 0x1F3B4, 0x1F3AD, 0x1F5BC, 0xFE0F, 0x1F5BC,
+      0x1F3A8, 0x1F9F5, 0x1FAA1, 0x1F9F6, 0x1FAA2, 0x1F453, 0x1F576, 0xFE0F, 0x1F576, 0x1F97D,
+      0x1F97C, 0x1F9BA, 0x1F454, 0x1F455, 0x1F456, 0x1F9E3, 0x1F9E4, 0x1F9E5, 0x1F9E6, 0x1F457,
+      0x1F458, 0x1F97B, 0x1FA71, 0x1FA72, 0x1FA73, 0x1F459, 0x1F45A, 0x1FAAD, 0x1F45B, 0x1F45C,
+      0x1F45D, 0x1F6CD, 0xFE0F, 0x1F6CD, 0x1F392, 0x1FA74, 0x1F45E, 0x1F45F, 0x1F97E, 0x1F97F,
+      0x1F460, 0x1F461, 0x1FA70, 0x1F462, 0x1FAAE, 0x1F451, 0x1F452, 0x1F3A9, 0x1F393, 0x1F9E2,
+      0x1FA96, 0x26D1, 0xFE0F, 0x26D1, 0x1F4FF, 0x1F484, 0x1F48D, 0x1F48E, 0x1F507, 0x1F508,
+      0x1F509, 0x1F50A, 0x1F4E2, 0x1F4E3, 0x1F4EF, 0x1F514, 0x1F515, 0x1F3BC, 0x1F3B5, 0x1F3B6,
+      0x1F399, 0xFE0F, 0x1F399, 0x1F39A, 0xFE0F, 0x1F39A, 0x1F39B, 0xFE0F, 0x1F39B, 0x1F3A4,
+      0x1F3A7, 0x1F4FB, 0x1F3B7, 0x1F3BA, 0x1FA8A, 0x1FA97, 0x1F3B8, 0x1F3B9, 0x1F3BB, 0x1FA95,
+      0x1F941, 0x1FA98, 0x1FA87, 0x1FA88, 0x1FA89, 0x1F4F1, 0x1F4F2, 0x260E, 0xFE0F, 0x260E,
+      0x1F4DE, 0x1F4DF, 0x1F4E0, 0x1F50B, 0x1FAAB, 0x1F50C, 0x1F4BB, 0x1F5A5, 0xFE0F, 0x1F5A5,
+      0x1F5A8, 0xFE0F, 0x1F5A8, 0x2328, 0xFE0F, 0x2328, 0x1F5B1, 0xFE0F, 0x1F5B1, 0x1F5B2, 0xFE0F,
+      0x1F5B2, 0x1F4BD, 0x1F4BE, 0x1F4BF, 0x1F4C0, 0x1F9EE, 0x1F3A5, 0x1F39E, 0xFE0F, 0x1F39E,
+      0x1F4FD, 0xFE0F, 0x1F4FD, 0x1F3AC, 0x1F4FA, 0x1F4F7, 0x1F4F8, 0x1F4F9, 0x1F4FC, 0x1F50D,
+      0x1F50E, 0x1F56F, 0xFE0F, 0x1F56F, 0x1F4A1, 0x1F526, 0x1F3EE, 0x1FA94, 0x1F4D4, 0x1F4D5,
+      0x1F4D6, 0x1F4D7, 0x1F4D8, 0x1F4D9, 0x1F4DA, 0x1F4D3, 0x1F4D2, 0x1F4C3, 0x1F4DC, 0x1F4C4,
+      0x1F4F0, 0x1F5DE, 0xFE0F, 0x1F5DE, 0x1F4D1, 0x1F516, 0x1F3F7, 0xFE0F, 0x1F3F7, 0x1FA99,
+      0x1F4B0, 0x1FA8E, 0x1F4B4, 0x1F4B5, 0x1F4B6, 0x1F4B7, 0x1F4B8, 0x1F4B3, 0x1F9FE, 0x1F4B9,
+      0x2709, 0xFE0F, 0x2709, 0x1F4E7, 0x1F4E8, 0x1F4E9, 0x1F4E4, 0x1F4E5, 0x1F4E6, 0x1F4EB,
+      0x1F4EA, 0x1F4EC, 0x1F4ED, 0x1F4EE, 0x1F5F3, 0xFE0F, 0x1F5F3, 0x270F, 0xFE0F, 0x270F, 0x2712,
+      0xFE0F, 0x2712, 0x1F58B, 0xFE0F, 0x1F58B, 0x1F58A, 0xFE0F, 0x1F58A, 0x1F58C, 0xFE0F, 0x1F58C,
+      0x1F58D, 0xFE0F, 0x1F58D, 0x1F4DD, 0x1F4BC, 0x1F4C1, 0x1F4C2, 0x1F5C2, 0xFE0F, 0x1F5C2,
+      0x1F4C5, 0x1F4C6, 0x1F5D2, 0xFE0F, 0x1F5D2, 0x1F5D3, 0xFE0F, 0x1F5D3, 0x1F4C7, 0x1F4C8,
+      0x1F4C9, 0x1F4CA, 0x1F4CB, 0x1F4CC, 0x1F4CD, 0x1F4CE, 0x1F587, 0xFE0F, 0x1F587, 0x1F4CF,
+      0x1F4D0, 0x2702, 0xFE0F, 0x2702, 0x1F5C3, 0xFE0F, 0x1F5C3, 0x1F5C4, 0xFE0F, 0x1F5C4, 0x1F5D1,
+      0xFE0F, 0x1F5D1, 0x1F512, 0x1F513, 0x1F50F, 0x1F510, 0x1F511, 0x1F5DD, 0xFE0F, 0x1F5DD,
+      0x1F528, 0x1FA93, 0x26CF, 0xFE0F, 0x26CF, 0x2692, 0xFE0F, 0x2692, 0x1F6E0, 0xFE0F, 0x1F6E0,
+      0x1F5E1, 0xFE0F, 0x1F5E1, 0x2694, 0xFE0F, 0x2694, 0x1F4A3, 0x1FA83, 0x1F3F9, 0x1F6E1, 0xFE0F,
+      0x1F6E1, 0x1FA9A, 0x1F527, 0x1FA9B, 0x1F529, 0x2699, 0xFE0F, 0x2699, 0x1F5DC, 0xFE0F,
+      0x1F5DC, 0x2696, 0xFE0F, 0x2696, 0x1F9AF, 0x1F517, 0x26D3, 0xFE0F, 0x200D, 0x1F4A5, 0x26D3,
+      0x200D, 0x1F4A5, 0x26D3, 0xFE0F, 0x26D3, 0x1FA9D, 0x1F9F0, 0x1F9F2, 0x1FA9C, 0x1FA8F, 0x2697,
+      0xFE0F, 0x2697, 0x1F9EA, 0x1F9EB, 0x1F9EC, 0x1F52C, 0x1F52D, 0x1F4E1, 0x1F489, 0x1FA78,
+      0x1F48A, 0x1FA79, 0x1FA7C, 0x1FA7A, 0x1FA7B, 0x1F6AA, 0x1F6D7, 0x1FA9E, 0x1FA9F, 0x1F6CF,
+      0xFE0F, 0x1F6CF, 0x1F6CB, 0xFE0F, 0x1F6CB, 0x1FA91, 0x1F6BD, 0x1FAA0, 0x1F6BF, 0x1F6C1,
+      0x1FAA4, 0x1FA92, 0x1F9F4, 0x1F9F7, 0x1F9F9, 0x1F9FA, 0x1F9FB, 0x1FAA3, 0x1F9FC, 0x1FAE7,
+      0x1FAA5, 0x1F9FD, 0x1F9EF, 0x1F6D2, 0x1F6AC, 0x26B0, 0xFE0F, 0x26B0, 0x1FAA6, 0x26B1, 0xFE0F,
+      0x26B1, 0x1F9FF, 0x1FAAC, 0x1F5FF, 0x1FAA7, 0x1FAAA, 0x1F3E7, 0x1F6AE, 0x1F6B0, 0x267F,
+      0x1F6B9, 0x1F6BA, 0x1F6BB, 0x1F6BC, 0x1F6BE, 0x1F6C2, 0x1F6C3, 0x1F6C4, 0x1F6C5, 0x26A0,
+      0xFE0F, 0x26A0, 0x1F6B8, 0x26D4, 0x1F6AB, 0x1F6B3, 0x1F6AD, 0x1F6AF, 0x1F6B1, 0x1F6B7,
+      0x1F4F5, 0x1F51E, 0x2622, 0xFE0F, 0x2622, 0x2623, 0xFE0F, 0x2623, 0x2B06, 0xFE0F, 0x2B06,
+      0x2197, 0xFE0F, 0x2197, 0x27A1, 0xFE0F, 0x27A1, 0x2198, 0xFE0F, 0x2198, 0x2B07, 0xFE0F,
+      0x2B07, 0x2199, 0xFE0F, 0x2199, 0x2B05, 0xFE0F, 0x2B05, 0x2196, 0xFE0F, 0x2196, 0x2195,
+      0xFE0F, 0x2195, 0x2194, 0xFE0F, 0x2194, 0x21A9, 0xFE0F, 0x21A9, 0x21AA, 0xFE0F, 0x21AA,
+      0x2934, 0xFE0F, 0x2934, 0x2935, 0xFE0F, 0x2935, 0x1F503, 0x1F504, 0x1F519, 0x1F51A, 0x1F51B,
+      0x1F51C, 0x1F51D, 0x1F6D0, 0x269B, 0xFE0F, 0x269B, 0x1F549, 0xFE0F, 0x1F549, 0x2721, 0xFE0F,
+      0x2721, 0x2638, 0xFE0F, 0x2638, 0x262F, 0xFE0F, 0x262F, 0x271D, 0xFE0F, 0x271D, 0x2626,
+      0xFE0F, 0x2626, 0x262A, 0xFE0F, 0x262A, 0x262E, 0xFE0F, 0x262E, 0x1F54E, 0x1F52F, 0x1FAAF,
+      0x2648, 0x2649, 0x264A, 0x264B, 0x264C, 0x264D, 0x264E, 0x264F, 0x2650, 0x2651, 0x2652,
+      0x2653, 0x26CE, 0x1F500, 0x1F501, 0x1F502, 0x25B6, 0xFE0F, 0x25B6, 0x23E9, 0x23ED, 0xFE0F,
+      0x23ED, 0x23EF, 0xFE0F, 0x23EF, 0x25C0, 0xFE0F, 0x25C0, 0x23EA, 0x23EE, 0xFE0F, 0x23EE,
+      0x1F53C, 0x23EB, 0x1F53D, 0x23EC, 0x23F8, 0xFE0F, 0x23F8, 0x23F9, 0xFE0F, 0x23F9, 0x23FA,
+      0xFE0F, 0x23FA, 0x23CF, 0xFE0F, 0x23CF, 0x1F3A6, 0x1F505, 0x1F506, 0x1F4F6, 0x1F6DC, 0x1F4F3,
+      0x1F4F4, 0x2640, 0xFE0F, 0x2640, 0x2642, 0xFE0F, 0x2642, 0x26A7, 0xFE0F, 0x26A7, 0x2716,
+      0xFE0F, 0x2716, 0x2795, 0x2796, 0x2797, 0x1F7F0, 0x267E, 0xFE0F, 0x267E, 0x203C, 0xFE0F,
+      0x203C, 0x2049, 0xFE0F, 0x2049, 0x2753, 0x2754, 0x2755, 0x2757, 0x3030, 0xFE0F, 0x3030,
+      0x1F4B1, 0x1F4B2, 0x2695, 0xFE0F, 0x2695, 0x267B, 0xFE0F, 0x267B, 0x269C, 0xFE0F, 0x269C,
+      0x1F531, 0x1F4DB, 0x1F530, 0x2B55, 0x2705, 0x2611, 0xFE0F, 0x2611, 0x2714, 0xFE0F, 0x2714,
+      0x274C, 0x274E, 0x27B0, 0x27BF, 0x303D, 0xFE0F, 0x303D, 0x2733, 0xFE0F, 0x2733, 0x2734,
+      0xFE0F, 0x2734, 0x2747, 0xFE0F, 0x2747, 0xA9, 0xFE0F, 0xA9, 0xAE, 0xFE0F, 0xAE, 0x2122,
+      0xFE0F, 0x2122, 0x1FADF, 0x23, 0xFE0F, 0x20E3, 0x23, 0x20E3, 0x2A, 0xFE0F, 0x20E3, 0x2A,
+      0x20E3, 0x30, 0xFE0F, 0x20E3, 0x30, 0x20E3, 0x31, 0xFE0F, 0x20E3, 0x31, 0x20E3, 0x32, 0xFE0F,
+      0x20E3, 0x32, 0x20E3, 0x33, 0xFE0F, 0x20E3, 0x33, 0x20E3, 0x34, 0xFE0F, 0x20E3, 0x34, 0x20E3,
+      0x35, 0xFE0F, 0x20E3, 0x35, 0x20E3, 0x36, 0xFE0F, 0x20E3, 0x36, 0x20E3, 0x37, 0xFE0F, 0x20E3,
+      0x37, 0x20E3, 0x38, 0xFE0F, 0x20E3, 0x38, 0x20E3, 0x39, 0xFE0F, 0x20E3, 0x39, 0x20E3,
+      0x1F51F, 0x1F520, 0x1F521, 0x1F522, 0x1F523, 0x1F524, 0x1F170, 0xFE0F, 0x1F170, 0x1F18E,
+      0x1F171, 0xFE0F, 0x1F171, 0x1F191, 0x1F192, 0x1F193, 0x2139, 0xFE0F, 0x2139, 0x1F194, 0x24C2,
+      0xFE0F, 0x24C2, 0x1F195, 0x1F196, 0x1F17E, 0xFE0F, 0x1F17E, 0x1F197, 0x1F17F, 0xFE0F,
+      0x1F17F, 0x1F198, 0x1F199, 0x1F19A, 0x1F201, 0x1F202, 0xFE0F, 0x1F202, 0x1F237, 0xFE0F,
+      0x1F237, 0x1F236, 0x1F22F, 0x1F250, 0x1F239, 0x1F21A, 0x1F232, 0x1F251, 0x1F238, 0x1F234,
+      0x1F233, 0x3297, 0xFE0F, 0x3297, 0x3299, 0xFE0F, 0x3299, 0x1F23A, 0x1F235, 0x1F534, 0x1F7E0,
+      0x1F7E1, 0x1F7E2, 0x1F535, 0x1F7E3, 0x1F7E4, 0x26AB, 0x26AA, 0x1F7E5, 0x1F7E7, 0x1F7E8,
+      0x1F7E9, 0x1F7E6, 0x1F7EA, 0x1F7EB, 0x2B1B, 0x2B1C, 0x25FC, 0xFE0F, 0x25FC, 0x25FB, 0xFE0F,
+      0x25FB, 0x25FE, 0x25FD, 0x25AA, 0xFE0F, 0x25AA, 0x25AB, 0xFE0F, 0x25AB, 0x1F536, 0x1F537,
+      0x1F538, 0x1F539, 0x1F53A, 0x1F53B, 0x1F4A0, 0x1F518, 0x1F533, 0x1F532, 0x1F3C1, 0x1F6A9,
+      0x1F38C, 0x1F3F4, 0x1F3F3, 0xFE0F, 0x1F3F3, 0x1F3F3, 0xFE0F, 0x200D, 0x1F308, 0x1F3F3,
+      0x200D, 0x1F308, 0x1F3F3, 0xFE0F, 0x200D, 0x26A7, 0xFE0F, 0x1F3F3, 0x200D, 0x26A7, 0xFE0F,
+      0x1F3F3, 0xFE0F, 0x200D, 0x26A7, 0x1F3F3, 0x200D, 0x26A7, 0x1F3F4, 0x200D, 0x2620, 0xFE0F,
+      0x1F3F4, 0x200D, 0x2620, 0x1F1E6, 0x1F1E8, 0x1F1E6, 0x1F1E9, 0x1F1E6, 0x1F1EA, 0x1F1E6,
+      0x1F1EB, 0x1F1E6, 0x1F1EC, 0x1F1E6, 0x1F1EE, 0x1F1E6, 0x1F1F1, 0x1F1E6, 0x1F1F2, 0x1F1E6,
+      0x1F1F4, 0x1F1E6, 0x1F1F6, 0x1F1E6, 0x1F1F7, 0x1F1E6, 0x1F1F8, 0x1F1E6, 0x1F1F9, 0x1F1E6,
+      0x1F1FA, 0x1F1E6, 0x1F1FC, 0x1F1E6, 0x1F1FD, 0x1F1E6, 0x1F1FF, 0x1F1E7, 0x1F1E6, 0x1F1E7,
+      0x1F1E7, 0x1F1E7, 0x1F1E9, 0x1F1E7, 0x1F1EA, 0x1F1E7, 0x1F1EB, 0x1F1E7, 0x1F1EC, 0x1F1E7,
+      0x1F1ED, 0x1F1E7, 0x1F1EE, 0x1F1E7, 0x1F1EF, 0x1F1E7, 0x1F1F1, 0x1F1E7, 0x1F1F2, 0x1F1E7,
+      0x1F1F3, 0x1F1E7, 0x1F1F4, 0x1F1E7, 0x1F1F6, 0x1F1E7, 0x1F1F7, 0x1F1E7, 0x1F1F8, 0x1F1E7,
+      0x1F1F9, 0x1F1E7, 0x1F1FB, 0x1F1E7, 0x1F1FC, 0x1F1E7, 0x1F1FE, 0x1F1E7, 0x1F1FF, 0x1F1E8,
+      0x1F1E6, 0x1F1E8, 0x1F1E8, 0x1F1E8, 0x1F1E9, 0x1F1E8, 0x1F1EB, 0x1F1E8, 0x1F1EC, 0x1F1E8,
+      0x1F1ED, 0x1F1E8, 0x1F1EE, 0x1F1E8, 0x1F1F0, 0x1F1E8, 0x1F1F1, 0x1F1E8, 0x1F1F2, 0x1F1E8,
+      0x1F1F3, 0x1F1E8, 0x1F1F4, 0x1F1E8, 0x1F1F5, 0x1F1E8, 0x1F1F6, 0x1F1E8, 0x1F1F7, 0x1F1E8,
+      0x1F1FA, 0x1F1E8, 0x1F1FB, 0x1F1E8, 0x1F1FC, 0x1F1E8, 0x1F1FD, 0x1F1E8, 0x1F1FE, 0x1F1E8,
+      0x1F1FF, 0x1F1E9, 0x1F1EA, 0x1F1E9, 0x1F1EC, 0x1F1E9, 0x1F1EF, 0x1F1E9, 0x1F1F0, 0x1F1E9,
+      0x1F1F2, 0x1F1E9, 0x1F1F4, 0x1F1E9, 0x1F1FF, 0x1F1EA, 0x1F1E6, 0x1F1EA, 0x1F1E8, 0x1F1EA,
+      0x1F1EA, 0x1F1EA, 0x1F1EC, 0x1F1EA, 0x1F1ED, 0x1F1EA, 0x1F1F7, 0x1F1EA, 0x1F1F8, 0x1F1EA,
+      0x1F1F9, 0x1F1EA, 0x1F1FA, 0x1F1EB, 0x1F1EE, 0x1F1EB, 0x1F1EF, 0x1F1EB, 0x1F1F0, 0x1F1EB,
+      0x1F1F2, 0x1F1EB, 0x1F1F4, 0x1F1EB, 0x1F1F7, 0x1F1EC, 0x1F1E6, 0x1F1EC, 0x1F1E7, 0x1F1EC,
+      0x1F1E9, 0x1F1EC, 0x1F1EA, 0x1F1EC, 0x1F1EB, 0x1F1EC, 0x1F1EC, 0x1F1EC, 0x1F1ED, 0x1F1EC,
+      0x1F1EE, 0x1F1EC, 0x1F1F1, 0x1F1EC, 0x1F1F2, 0x1F1EC, 0x1F1F3, 0x1F1EC, 0x1F1F5, 0x1F1EC,
+      0x1F1F6, 0x1F1EC, 0x1F1F7, 0x1F1EC, 0x1F1F8, 0x1F1EC, 0x1F1F9, 0x1F1EC, 0x1F1FA, 0x1F1EC,
+      0x1F1FC, 0x1F1EC, 0x1F1FE, 0x1F1ED, 0x1F1F0, 0x1F1ED, 0x1F1F2, 0x1F1ED, 0x1F1F3, 0x1F1ED,
+      0x1F1F7, 0x1F1ED, 0x1F1F9, 0x1F1ED, 0x1F1FA, 0x1F1EE, 0x1F1E8, 0x1F1EE, 0x1F1E9, 0x1F1EE,
+      0x1F1EA, 0x1F1EE, 0x1F1F1, 0x1F1EE, 0x1F1F2, 0x1F1EE, 0x1F1F3, 0x1F1EE, 0x1F1F4, 0x1F1EE,
+      0x1F1F6, 0x1F1EE, 0x1F1F7, 0x1F1EE, 0x1F1F8, 0x1F1EE, 0x1F1F9, 0x1F1EF, 0x1F1EA, 0x1F1EF,
+      0x1F1F2, 0x1F1EF, 0x1F1F4, 0x1F1EF, 0x1F1F5, 0x1F1F0, 0x1F1EA, 0x1F1F0, 0x1F1EC, 0x1F1F0,
+      0x1F1ED, 0x1F1F0, 0x1F1EE, 0x1F1F0, 0x1F1F2, 0x1F1F0, 0x1F1F3, 0x1F1F0, 0x1F1F5, 0x1F1F0,
+      0x1F1F7, 0x1F1F0, 0x1F1FC, 0x1F1F0, 0x1F1FE, 0x1F1F0, 0x1F1FF, 0x1F1F1, 0x1F1E6, 0x1F1F1,
+      0x1F1E7, 0x1F1F1, 0x1F1E8, 0x1F1F1, 0x1F1EE, 0x1F1F1, 0x1F1F0, 0x1F1F1, 0x1F1F7, 0x1F1F1,
+      0x1F1F8, 0x1F1F1, 0x1F1F9, 0x1F1F1, 0x1F1FA, 0x1F1F1, 0x1F1FB, 0x1F1F1, 0x1F1FE, 0x1F1F2,
+      0x1F1E6, 0x1F1F2, 0x1F1E8, 0x1F1F2, 0x1F1E9, 0x1F1F2, 0x1F1EA, 0x1F1F2, 0x1F1EB, 0x1F1F2,
+      0x1F1EC, 0x1F1F2, 0x1F1ED, 0x1F1F2, 0x1F1F0, 0x1F1F2, 0x1F1F1, 0x1F1F2, 0x1F1F2, 0x1F1F2,
+      0x1F1F3, 0x1F1F2, 0x1F1F4, 0x1F1F2, 0x1F1F5, 0x1F1F2, 0x1F1F6, 0x1F1F2, 0x1F1F7, 0x1F1F2,
+      0x1F1F8, 0x1F1F2, 0x1F1F9, 0x1F1F2, 0x1F1FA, 0x1F1F2, 0x1F1FB, 0x1F1F2, 0x1F1FC, 0x1F1F2,
+      0x1F1FD, 0x1F1F2, 0x1F1FE, 0x1F1F2, 0x1F1FF, 0x1F1F3, 0x1F1E6, 0x1F1F3, 0x1F1E8, 0x1F1F3,
+      0x1F1EA, 0x1F1F3, 0x1F1EB, 0x1F1F3, 0x1F1EC, 0x1F1F3, 0x1F1EE, 0x1F1F3, 0x1F1F1, 0x1F1F3,
+      0x1F1F4, 0x1F1F3, 0x1F1F5, 0x1F1F3, 0x1F1F7, 0x1F1F3, 0x1F1FA, 0x1F1F3, 0x1F1FF, 0x1F1F4,
+      0x1F1F2, 0x1F1F5, 0x1F1E6, 0x1F1F5, 0x1F1EA, 0x1F1F5, 0x1F1EB, 0x1F1F5, 0x1F1EC, 0x1F1F5,
+      0x1F1ED, 0x1F1F5, 0x1F1F0, 0x1F1F5, 0x1F1F1, 0x1F1F5, 0x1F1F2, 0x1F1F5, 0x1F1F3, 0x1F1F5,
+      0x1F1F7, 0x1F1F5, 0x1F1F8, 0x1F1F5, 0x1F1F9, 0x1F1F5, 0x1F1FC, 0x1F1F5, 0x1F1FE, 0x1F1F6,
+      0x1F1E6, 0x1F1F7, 0x1F1EA, 0x1F1F7, 0x1F1F4, 0x1F1F7, 0x1F1F8, 0x1F1F7, 0x1F1FA, 0x1F1F7,
+      0x1F1FC, 0x1F1F8, 0x1F1E6, 0x1F1F8, 0x1F1E7, 0x1F1F8, 0x1F1E8, 0x1F1F8, 0x1F1E9, 0x1F1F8,
+      0x1F1EA, 0x1F1F8, 0x1F1EC, 0x1F1F8, 0x1F1ED, 0x1F1F8, 0x1F1EE, 0x1F1F8, 0x1F1EF, 0x1F1F8,
+      0x1F1F0, 0x1F1F8, 0x1F1F1, 0x1F1F8, 0x1F1F2, 0x1F1F8, 0x1F1F3, 0x1F1F8, 0x1F1F4, 0x1F1F8,
+      0x1F1F7, 0x1F1F8, 0x1F1F8, 0x1F1F8, 0x1F1F9, 0x1F1F8, 0x1F1FB, 0x1F1F8, 0x1F1FD, 0x1F1F8,
+      0x1F1FE, 0x1F1F8, 0x1F1FF, 0x1F1F9, 0x1F1E6, 0x1F1F9, 0x1F1E8, 0x1F1F9, 0x1F1E9, 0x1F1F9,
+      0x1F1EB, 0x1F1F9, 0x1F1EC, 0x1F1F9, 0x1F1ED, 0x1F1F9, 0x1F1EF, 0x1F1F9, 0x1F1F0, 0x1F1F9,
+      0x1F1F1, 0x1F1F9, 0x1F1F2, 0x1F1F9, 0x1F1F3, 0x1F1F9, 0x1F1F4, 0x1F1F9, 0x1F1F7, 0x1F1F9,
+      0x1F1F9, 0x1F1F9, 0x1F1FB, 0x1F1F9, 0x1F1FC, 0x1F1F9, 0x1F1FF, 0x1F1FA, 0x1F1E6, 0x1F1FA,
+      0x1F1EC, 0x1F1FA, 0x1F1F2, 0x1F1FA, 0x1F1F3, 0x1F1FA, 0x1F1F8, 0x1F1FA, 0x1F1FE, 0x1F1FA,
+      0x1F1FF, 0x1F1FB, 0x1F1E6, 0x1F1FB, 0x1F1E8, 0x1F1FB, 0x1F1EA, 0x1F1FB, 0x1F1EC, 0x1F1FB,
+      0x1F1EE, 0x1F1FB, 0x1F1F3, 0x1F1FB, 0x1F1FA, 0x1F1FC, 0x1F1EB, 0x1F1FC, 0x1F1F8, 0x1F1FD,
+      0x1F1F0, 0x1F1FE, 0x1F1EA, 0x1F1FE, 0x1F1F9, 0x1F1FF, 0x1F1E6, 0x1F1FF, 0x1F1F2, 0x1F1FF,
+      0x1F1FC, 0x1F3F4, 0xE0067, 0xE0062, 0xE0065, 0xE006E, 0xE0067, 0xE007F, 0x1F3F4, 0xE0067,
+      0xE0062, 0xE0073, 0xE0063, 0xE0074, 0xE007F, 0x1F3F4, 0xE0067, 0xE0062, 0xE0077, 0xE006C,
+      0xE0073, 0xE007F,
+    };
+
+    inline constexpr std::uint32_t codePointOffsets[] = {
+      0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26,
+      27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 48, 51, 52, 53, 54,
+      55, 58, 59, 60, 64, 67, 71, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89,
+      90, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 106, 107, 108, 109, 110, 111, 112,
+      113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130,
+      131, 132, 133, 134, 135, 136, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149,
+      150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167,
+      168, 170, 171, 172, 176, 179, 183, 186, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197,
+      198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 210, 211, 212, 217, 221, 225, 228,
+      230, 231, 233, 234, 235, 236, 237, 239, 241, 243, 245, 247, 248, 250, 252, 254, 256, 258,
+      260, 261, 263, 265, 267, 269, 271, 272, 274, 276, 278, 280, 282, 283, 285, 287, 289, 291,
+      293, 294, 296, 298, 300, 302, 304, 305, 307, 309, 311, 313, 315, 316, 318, 320, 322, 324,
+      326, 327, 329, 331, 333, 335, 337, 338, 340, 342, 344, 346, 348, 349, 351, 353, 355, 357,
+      359, 360, 362, 364, 366, 368, 370, 371, 373, 375, 377, 379, 381, 382, 384, 386, 388, 390,
+      392, 394, 395, 397, 399, 401, 403, 405, 406, 408, 410, 412, 414, 416, 417, 419, 421, 423,
+      425, 427, 428, 430, 432, 434, 436, 438, 439, 441, 443, 445, 447, 449, 450, 452, 454, 456,
+      458, 460, 461, 463, 465, 467, 469, 471, 472, 474, 476, 478, 480, 482, 483, 485, 487, 489,
+      491, 493, 494, 496, 498, 500, 502, 504, 505, 507, 509, 511, 513, 515, 517, 518, 520, 522,
+      524, 526, 528, 529, 531, 533, 535, 537, 539, 540, 542, 544, 546, 548, 550, 551, 553, 555,
+      557, 559, 561, 562, 564, 566, 568, 570, 572, 573, 575, 577, 579, 581, 583, 584, 586, 588,
+      590, 592, 594, 595, 597, 599, 601, 603, 605, 606, 608, 610, 612, 614, 616, 617, 619, 621,
+      623, 625, 627, 628, 630, 632, 634, 636, 638, 639, 641, 643, 645, 647, 649, 650, 652, 654,
+      656, 658, 660, 661, 663, 665, 667, 669, 671, 676, 681, 686, 691, 696, 701, 706, 711, 716,
+      721, 726, 731, 736, 741, 746, 751, 756, 761, 766, 771, 772, 774, 776, 778, 780, 782, 784,
+      785, 787, 789, 791, 793, 795, 796, 798, 800, 802, 804, 806, 807, 809, 811, 813, 815, 817,
+      818, 820, 822, 824, 826, 828, 829, 830, 831, 833, 835, 837, 839, 841, 842, 844, 846, 848,
+      850, 852, 853, 855, 857, 859, 861, 863, 864, 866, 868, 870, 872, 874, 875, 877, 879, 881,
+      883, 885, 886, 887, 888, 889, 890, 891, 893, 894, 895, 896, 897, 898, 900, 902, 904, 906,
+      908, 909, 911, 913, 915, 917, 919, 920, 922, 924, 926, 928, 930, 931, 933, 935, 937, 939,
+      941, 942, 944, 946, 948, 950, 952, 953, 955, 957, 959, 961, 963, 964, 966, 968, 970, 972,
+      974, 975, 977, 979, 981, 983, 985, 989, 992, 997, 1001, 1006, 1010, 1015, 1019, 1024, 1028,
+      1033, 1037, 1041, 1044, 1049, 1053, 1058, 1062, 1067, 1071, 1076, 1080, 1085, 1089, 1092,
+      1096, 1100, 1104, 1108, 1112, 1115, 1119, 1123, 1127, 1131, 1135, 1138, 1142, 1146, 1150,
+      1154, 1158, 1161, 1165, 1169, 1173, 1177, 1181, 1182, 1184, 1186, 1188, 1190, 1192, 1195,
+      1199, 1203, 1207, 1211, 1215, 1218, 1222, 1226, 1230, 1234, 1238, 1241, 1245, 1249, 1253,
+      1257, 1261, 1264, 1268, 1272, 1276, 1280, 1284, 1287, 1291, 1295, 1299, 1303, 1307, 1310,
+      1314, 1318, 1322, 1326, 1330, 1333, 1337, 1341, 1345, 1349, 1353, 1356, 1360, 1364, 1368,
+      1372, 1376, 1380, 1383, 1388, 1392, 1397, 1401, 1406, 1410, 1415, 1419, 1424, 1428, 1432,
+      1435, 1440, 1444, 1449, 1453, 1458, 1462, 1467, 1471, 1476, 1480, 1481, 1483, 1485, 1487,
+      1489, 1491, 1492, 1494, 1496, 1498, 1500, 1502, 1503, 1505, 1507, 1509, 1511, 1513, 1514,
+      1516, 1518, 1520, 1522, 1524, 1528, 1531, 1536, 1540, 1545, 1549, 1554, 1558, 1563, 1567,
+      1572, 1576, 1580, 1583, 1588, 1592, 1597, 1601, 1606, 1610, 1615, 1619, 1624, 1628, 1629,
+      1631, 1633, 1635, 1637, 1639, 1643, 1646, 1651, 1655, 1660, 1664, 1669, 1673, 1678, 1682,
+      1687, 1691, 1695, 1698, 1703, 1707, 1712, 1716, 1721, 1725, 1730, 1734, 1739, 1743, 1744,
+      1746, 1748, 1750, 1752, 1754, 1758, 1761, 1766, 1770, 1775, 1779, 1784, 1788, 1793, 1797,
+      1802, 1806, 1810, 1813, 1818, 1822, 1827, 1831, 1836, 1840, 1845, 1849, 1854, 1858, 1859,
+      1861, 1863, 1865, 1867, 1869, 1873, 1876, 1881, 1885, 1890, 1894, 1899, 1903, 1908, 1912,
+      1917, 1921, 1925, 1928, 1933, 1937, 1942, 1946, 1951, 1955, 1960, 1964, 1969, 1973, 1974,
+      1976, 1978, 1980, 1982, 1984, 1988, 1991, 1996, 2000, 2005, 2009, 2014, 2018, 2023, 2027,
+      2032, 2036, 2040, 2043, 2048, 2052, 2057, 2061, 2066, 2070, 2075, 2079, 2084, 2088, 2089,
+      2091, 2093, 2095, 2097, 2099, 2103, 2106, 2111, 2115, 2120, 2124, 2129, 2133, 2138, 2142,
+      2147, 2151, 2155, 2158, 2163, 2167, 2172, 2176, 2181, 2185, 2190, 2194, 2199, 2203, 2204,
+      2206, 2208, 2210, 2212, 2214, 2218, 2221, 2226, 2230, 2235, 2239, 2244, 2248, 2253, 2257,
+      2262, 2266, 2270, 2273, 2278, 2282, 2287, 2291, 2296, 2300, 2305, 2309, 2314, 2318, 2319,
+      2321, 2323, 2325, 2327, 2329, 2333, 2336, 2341, 2345, 2350, 2354, 2359, 2363, 2368, 2372,
+      2377, 2381, 2385, 2388, 2393, 2397, 2402, 2406, 2411, 2415, 2420, 2424, 2429, 2433, 2434,
+      2436, 2438, 2440, 2442, 2444, 2448, 2451, 2456, 2460, 2465, 2469, 2474, 2478, 2483, 2487,
+      2492, 2496, 2500, 2503, 2508, 2512, 2517, 2521, 2526, 2530, 2535, 2539, 2544, 2548, 2549,
+      2551, 2553, 2555, 2557, 2559, 2563, 2566, 2571, 2575, 2580, 2584, 2589, 2593, 2598, 2602,
+      2607, 2611, 2615, 2618, 2623, 2627, 2632, 2636, 2641, 2645, 2650, 2654, 2659, 2663, 2667,
+      2670, 2675, 2679, 2684, 2688, 2693, 2697, 2702, 2706, 2711, 2715, 2719, 2722, 2727, 2731,
+      2736, 2740, 2745, 2749, 2754, 2758, 2763, 2767, 2771, 2774, 2779, 2783, 2788, 2792, 2797,
+      2801, 2806, 2810, 2815, 2819, 2822, 2826, 2830, 2834, 2838, 2842, 2845, 2849, 2853, 2857,
+      2861, 2865, 2868, 2872, 2876, 2880, 2884, 2888, 2891, 2895, 2899, 2903, 2907, 2911, 2914,
+      2918, 2922, 2926, 2930, 2934, 2937, 2941, 2945, 2949, 2953, 2957, 2961, 2964, 2969, 2973,
+      2978, 2982, 2987, 2991, 2996, 3000, 3005, 3009, 3013, 3016, 3021, 3025, 3030, 3034, 3039,
+      3043, 3048, 3052, 3057, 3061, 3065, 3068, 3073, 3077, 3082, 3086, 3091, 3095, 3100, 3104,
+      3109, 3113, 3116, 3120, 3124, 3128, 3132, 3136, 3139, 3143, 3147, 3151, 3155, 3159, 3162,
+      3166, 3170, 3174, 3178, 3182, 3185, 3189, 3193, 3197, 3201, 3205, 3208, 3212, 3216, 3220,
+      3224, 3228, 3231, 3235, 3239, 3243, 3247, 3251, 3254, 3258, 3262, 3266, 3270, 3274, 3277,
+      3281, 3285, 3289, 3293, 3297, 3300, 3304, 3308, 3312, 3316, 3320, 3323, 3327, 3331, 3335,
+      3339, 3343, 3346, 3350, 3354, 3358, 3362, 3366, 3369, 3373, 3377, 3381, 3385, 3389, 3392,
+      3396, 3400, 3404, 3408, 3412, 3415, 3419, 3423, 3427, 3431, 3435, 3438, 3442, 3446, 3450,
+      3454, 3458, 3461, 3465, 3469, 3473, 3477, 3481, 3484, 3488, 3492, 3496, 3500, 3504, 3507,
+      3511, 3515, 3519, 3523, 3527, 3530, 3534, 3538, 3542, 3546, 3550, 3553, 3557, 3561, 3565,
+      3569, 3573, 3576, 3580, 3584, 3588, 3592, 3596, 3599, 3603, 3607, 3611, 3615, 3619, 3622,
+      3626, 3630, 3634, 3638, 3642, 3645, 3649, 3653, 3657, 3661, 3665, 3668, 3672, 3676, 3680,
+      3684, 3688, 3691, 3695, 3699, 3703, 3707, 3711, 3714, 3718, 3722, 3726, 3730, 3734, 3738,
+      3741, 3746, 3750, 3755, 3759, 3764, 3768, 3773, 3777, 3782, 3786, 3790, 3793, 3798, 3802,
+      3807, 3811, 3816, 3820, 3825, 3829, 3834, 3838, 3842, 3845, 3850, 3854, 3859, 3863, 3868,
+      3872, 3877, 3881, 3886, 3890, 3893, 3897, 3901, 3905, 3909, 3913, 3916, 3920, 3924, 3928,
+      3932, 3936, 3939, 3943, 3947, 3951, 3955, 3959, 3962, 3966, 3970, 3974, 3978, 3982, 3985,
+      3989, 3993, 3997, 4001, 4005, 4008, 4012, 4016, 4020, 4024, 4028, 4029, 4031, 4033, 4035,
+      4037, 4039, 4043, 4046, 4051, 4055, 4060, 4064, 4069, 4073, 4078, 4082, 4087, 4091, 4095,
+      4098, 4103, 4107, 4112, 4116, 4121, 4125, 4130, 4134, 4139, 4143, 4145, 4146, 4148, 4150,
+      4152, 4154, 4156, 4161, 4165, 4169, 4172, 4177, 4181, 4186, 4190, 4195, 4199, 4204, 4208,
+      4213, 4217, 4222, 4226, 4230, 4233, 4238, 4242, 4247, 4251, 4256, 4260, 4265, 4269, 4274,
+      4278, 4279, 4281, 4283, 4285, 4287, 4289, 4293, 4296, 4301, 4305, 4310, 4314, 4319, 4323,
+      4328, 4332, 4337, 4341, 4345, 4348, 4353, 4357, 4362, 4366, 4371, 4375, 4380, 4384, 4389,
+      4393, 4394, 4396, 4398, 4400, 4402, 4404, 4405, 4407, 4409, 4411, 4413, 4415, 4419, 4422,
+      4427, 4431, 4436, 4440, 4445, 4449, 4454, 4458, 4463, 4467, 4471, 4474, 4479, 4483, 4488,
+      4492, 4497, 4501, 4506, 4510, 4515, 4519, 4520, 4522, 4524, 4526, 4528, 4530, 4531, 4533,
+      4535, 4537, 4539, 4541, 4542, 4544, 4546, 4548, 4550, 4552, 4553, 4555, 4557, 4559, 4561,
+      4563, 4567, 4570, 4575, 4579, 4584, 4588, 4593, 4597, 4602, 4606, 4611, 4615, 4619, 4622,
+      4627, 4631, 4636, 4640, 4645, 4649, 4654, 4658, 4663, 4667, 4668, 4670, 4672, 4674, 4676,
+      4678, 4679, 4681, 4683, 4685, 4687, 4689, 4690, 4692, 4694, 4696, 4698, 4700, 4704, 4707,
+      4712, 4716, 4721, 4725, 4730, 4734, 4739, 4743, 4748, 4752, 4756, 4759, 4764, 4768, 4773,
+      4777, 4782, 4786, 4791, 4795, 4800, 4804, 4805, 4807, 4809, 4811, 4813, 4815, 4819, 4822,
+      4827, 4831, 4836, 4840, 4845, 4849, 4854, 4858, 4863, 4867, 4871, 4874, 4879, 4883, 4888,
+      4892, 4897, 4901, 4906, 4910, 4915, 4919, 4920, 4922, 4924, 4926, 4928, 4930, 4931, 4933,
+      4935, 4937, 4939, 4941, 4942, 4944, 4946, 4948, 4950, 4952, 4953, 4955, 4957, 4959, 4961,
+      4963, 4966, 4970, 4974, 4978, 4982, 4986, 4989, 4993, 4997, 5001, 5005, 5009, 5012, 5016,
+      5020, 5024, 5028, 5032, 5033, 5035, 5037, 5039, 5041, 5043, 5044, 5046, 5048, 5050, 5052,
+      5054, 5055, 5057, 5059, 5061, 5063, 5065, 5068, 5072, 5076, 5080, 5084, 5088, 5089, 5091,
+      5093, 5095, 5097, 5099, 5103, 5106, 5111, 5115, 5120, 5124, 5129, 5133, 5138, 5142, 5147,
+      5151, 5155, 5158, 5163, 5167, 5172, 5176, 5181, 5185, 5190, 5194, 5199, 5203, 5204, 5206,
+      5208, 5210, 5212, 5214, 5218, 5221, 5226, 5230, 5235, 5239, 5244, 5248, 5253, 5257, 5262,
+      5266, 5270, 5273, 5278, 5282, 5287, 5291, 5296, 5300, 5305, 5309, 5314, 5318, 5319, 5321,
+      5323, 5325, 5327, 5329, 5333, 5336, 5341, 5345, 5350, 5354, 5359, 5363, 5368, 5372, 5377,
+      5381, 5385, 5388, 5393, 5397, 5402, 5406, 5411, 5415, 5420, 5424, 5429, 5433, 5434, 5436,
+      5438, 5440, 5442, 5444, 5448, 5451, 5456, 5460, 5465, 5469, 5474, 5478, 5483, 5487, 5492,
+      5496, 5500, 5503, 5508, 5512, 5517, 5521, 5526, 5530, 5535, 5539, 5544, 5548, 5549, 5551,
+      5553, 5555, 5557, 5559, 5563, 5566, 5571, 5575, 5580, 5584, 5589, 5593, 5598, 5602, 5607,
+      5611, 5615, 5618, 5623, 5627, 5632, 5636, 5641, 5645, 5650, 5654, 5659, 5663, 5664, 5666,
+      5668, 5670, 5672, 5674, 5678, 5681, 5686, 5690, 5695, 5699, 5704, 5708, 5713, 5717, 5722,
+      5726, 5730, 5733, 5738, 5742, 5747, 5751, 5756, 5760, 5765, 5769, 5774, 5778, 5779, 5781,
+      5783, 5785, 5787, 5789, 5793, 5796, 5801, 5805, 5810, 5814, 5819, 5823, 5828, 5832, 5837,
+      5841, 5845, 5848, 5853, 5857, 5862, 5866, 5871, 5875, 5880, 5884, 5889, 5893, 5894, 5898,
+      5901, 5905, 5908, 5909, 5913, 5916, 5920, 5923, 5924, 5925, 5926, 5928, 5930, 5932, 5934,
+      5936, 5940, 5943, 5948, 5952, 5957, 5961, 5966, 5970, 5975, 5979, 5984, 5988, 5992, 5995,
+      6000, 6004, 6009, 6013, 6018, 6022, 6027, 6031, 6036, 6040, 6041, 6043, 6045, 6047, 6049,
+      6051, 6055, 6058, 6063, 6067, 6072, 6076, 6081, 6085, 6090, 6094, 6099, 6103, 6107, 6110,
+      6115, 6119, 6124, 6128, 6133, 6137, 6142, 6146, 6151, 6155, 6156, 6158, 6160, 6162, 6164,
+      6166, 6170, 6173, 6178, 6182, 6187, 6191, 6196, 6200, 6205, 6209, 6214, 6218, 6222, 6225,
+      6230, 6234, 6239, 6243, 6248, 6252, 6257, 6261, 6266, 6270, 6274, 6277, 6282, 6286, 6291,
+      6295, 6300, 6304, 6309, 6313, 6318, 6322, 6329, 6335, 6341, 6346, 6354, 6361, 6368, 6374,
+      6382, 6389, 6396, 6402, 6410, 6417, 6424, 6430, 6438, 6445, 6452, 6458, 6466, 6473, 6480,
+      6486, 6493, 6499, 6505, 6510, 6518, 6525, 6532, 6538, 6546, 6553, 6560, 6566, 6574, 6581,
+      6588, 6594, 6602, 6609, 6616, 6622, 6630, 6637, 6644, 6650, 6651, 6653, 6655, 6657, 6659,
+      6661, 6665, 6668, 6673, 6677, 6682, 6686, 6691, 6695, 6700, 6704, 6709, 6713, 6717, 6720,
+      6725, 6729, 6734, 6738, 6743, 6747, 6752, 6756, 6761, 6765, 6766, 6768, 6770, 6772, 6774,
+      6776, 6780, 6783, 6788, 6792, 6797, 6801, 6806, 6810, 6815, 6819, 6824, 6828, 6832, 6835,
+      6840, 6844, 6849, 6853, 6858, 6862, 6867, 6871, 6876, 6880, 6884, 6887, 6892, 6896, 6901,
+      6905, 6910, 6914, 6919, 6923, 6928, 6932, 6939, 6945, 6951, 6956, 6964, 6971, 6978, 6984,
+      6992, 6999, 7006, 7012, 7020, 7027, 7034, 7040, 7048, 7055, 7062, 7068, 7076, 7083, 7090,
+      7096, 7103, 7109, 7115, 7120, 7128, 7135, 7142, 7148, 7156, 7163, 7170, 7176, 7184, 7191,
+      7198, 7204, 7212, 7219, 7226, 7232, 7240, 7247, 7254, 7260, 7263, 7267, 7271, 7275, 7279,
+      7283, 7289, 7294, 7301, 7307, 7314, 7320, 7327, 7333, 7340, 7346, 7353, 7359, 7362, 7366,
+      7370, 7374, 7378, 7382, 7388, 7393, 7400, 7406, 7413, 7419, 7426, 7432, 7439, 7445, 7452,
+      7458, 7461, 7465, 7469, 7473, 7477, 7481, 7487, 7492, 7499, 7505, 7512, 7518, 7525, 7531,
+      7538, 7544, 7551, 7557, 7560, 7564, 7568, 7572, 7576, 7580, 7586, 7591, 7598, 7604, 7611,
+      7617, 7624, 7630, 7637, 7643, 7650, 7656, 7659, 7663, 7667, 7671, 7675, 7679, 7685, 7690,
+      7697, 7703, 7710, 7716, 7723, 7729, 7736, 7742, 7749, 7755, 7758, 7762, 7766, 7770, 7774,
+      7778, 7784, 7789, 7796, 7802, 7809, 7815, 7822, 7828, 7835, 7841, 7848, 7854, 7857, 7861,
+      7865, 7869, 7873, 7877, 7883, 7888, 7895, 7901, 7908, 7914, 7921, 7927, 7934, 7940, 7947,
+      7953, 7956, 7960, 7964, 7968, 7972, 7976, 7982, 7987, 7994, 8000, 8007, 8013, 8020, 8026,
+      8033, 8039, 8046, 8052, 8055, 8059, 8063, 8067, 8071, 8075, 8081, 8086, 8093, 8099, 8106,
+      8112, 8119, 8125, 8132, 8138, 8145, 8151, 8152, 8154, 8156, 8158, 8160, 8162, 8166, 8169,
+      8174, 8178, 8183, 8187, 8192, 8196, 8201, 8205, 8210, 8214, 8218, 8221, 8226, 8230, 8235,
+      8239, 8244, 8248, 8253, 8257, 8262, 8266, 8270, 8273, 8278, 8282, 8287, 8291, 8296, 8300,
+      8305, 8309, 8314, 8318, 8325, 8331, 8337, 8342, 8350, 8357, 8364, 8370, 8378, 8385, 8392,
+      8398, 8406, 8413, 8420, 8426, 8434, 8441, 8448, 8454, 8462, 8469, 8476, 8482, 8489, 8495,
+      8501, 8506, 8514, 8521, 8528, 8534, 8542, 8549, 8556, 8562, 8570, 8577, 8584, 8590, 8598,
+      8605, 8612, 8618, 8626, 8633, 8640, 8646, 8649, 8653, 8657, 8661, 8665, 8669, 8670, 8672,
+      8674, 8676, 8678, 8680, 8681, 8683, 8685, 8687, 8689, 8691, 8693, 8694, 8696, 8698, 8700,
+      8702, 8704, 8705, 8707, 8709, 8711, 8713, 8715, 8719, 8722, 8727, 8731, 8736, 8740, 8745,
+      8749, 8754, 8758, 8763, 8767, 8771, 8774, 8779, 8783, 8788, 8792, 8797, 8801, 8806, 8810,
+      8815, 8819, 8826, 8833, 8840, 8847, 8854, 8861, 8868, 8875, 8882, 8889, 8896, 8903, 8910,
+      8917, 8924, 8931, 8938, 8945, 8952, 8959, 8966, 8973, 8980, 8987, 8994, 9001, 9008, 9015,
+      9022, 9029, 9036, 9043, 9050, 9057, 9064, 9071, 9078, 9085, 9092, 9099, 9106, 9113, 9120,
+      9127, 9134, 9141, 9148, 9155, 9162, 9169, 9176, 9183, 9190, 9197, 9204, 9211, 9218, 9225,
+      9232, 9239, 9240, 9242, 9244, 9246, 9248, 9250, 9254, 9257, 9262, 9266, 9271, 9275, 9280,
+      9284, 9289, 9293, 9298, 9302, 9306, 9309, 9314, 9318, 9323, 9327, 9332, 9336, 9341, 9345,
+      9350, 9354, 9355, 9357, 9359, 9361, 9363, 9365, 9369, 9372, 9377, 9381, 9386, 9390, 9395,
+      9399, 9404, 9408, 9413, 9417, 9421, 9424, 9429, 9433, 9438, 9442, 9447, 9451, 9456, 9460,
+      9465, 9469, 9470, 9471, 9473, 9475, 9477, 9479, 9481, 9483, 9484, 9485, 9487, 9489, 9491,
+      9493, 9495, 9497, 9498, 9500, 9502, 9504, 9506, 9508, 9513, 9517, 9521, 9524, 9529, 9533,
+      9538, 9542, 9547, 9551, 9556, 9560, 9565, 9569, 9574, 9578, 9582, 9585, 9590, 9594, 9599,
+      9603, 9608, 9612, 9617, 9621, 9626, 9630, 9631, 9633, 9635, 9637, 9639, 9641, 9645, 9648,
+      9653, 9657, 9662, 9666, 9671, 9675, 9680, 9684, 9689, 9693, 9697, 9700, 9705, 9709, 9714,
+      9718, 9723, 9727, 9732, 9736, 9741, 9745, 9746, 9748, 9750, 9752, 9754, 9756, 9760, 9763,
+      9768, 9772, 9777, 9781, 9786, 9790, 9795, 9799, 9804, 9808, 9812, 9815, 9820, 9824, 9829,
+      9833, 9838, 9842, 9847, 9851, 9856, 9860, 9861, 9863, 9865, 9867, 9869, 9871, 9875, 9878,
+      9883, 9887, 9892, 9896, 9901, 9905, 9910, 9914, 9919, 9923, 9927, 9930, 9935, 9939, 9944,
+      9948, 9953, 9957, 9962, 9966, 9971, 9975, 9977, 9978, 9980, 9982, 9984, 9986, 9988, 9993,
+      9997, 10001, 10004, 10009, 10013, 10018, 10022, 10027, 10031, 10036, 10040, 10045, 10049,
+      10054, 10058, 10062, 10065, 10070, 10074, 10079, 10083, 10088, 10092, 10097, 10101, 10106,
+      10110, 10112, 10113, 10115, 10117, 10119, 10121, 10123, 10128, 10132, 10136, 10139, 10144,
+      10148, 10153, 10157, 10162, 10166, 10171, 10175, 10180, 10184, 10189, 10193, 10197, 10200,
+      10205, 10209, 10214, 10218, 10223, 10227, 10232, 10236, 10241, 10245, 10246, 10248, 10250,
+      10252, 10254, 10256, 10260, 10263, 10268, 10272, 10277, 10281, 10286, 10290, 10295, 10299,
+      10304, 10308, 10312, 10315, 10320, 10324, 10329, 10333, 10338, 10342, 10347, 10351, 10356,
+      10360, 10361, 10363, 10365, 10367, 10369, 10371, 10375, 10378, 10383, 10387, 10392, 10396,
+      10401, 10405, 10410, 10414, 10419, 10423, 10427, 10430, 10435, 10439, 10444, 10448, 10453,
+      10457, 10462, 10466, 10471, 10475, 10476, 10478, 10480, 10482, 10484, 10486, 10490, 10493,
+      10498, 10502, 10507, 10511, 10516, 10520, 10525, 10529, 10534, 10538, 10542, 10545, 10550,
+      10554, 10559, 10563, 10568, 10572, 10577, 10581, 10586, 10590, 10591, 10593, 10595, 10597,
+      10599, 10601, 10605, 10608, 10613, 10617, 10622, 10626, 10631, 10635, 10640, 10644, 10649,
+      10653, 10657, 10660, 10665, 10669, 10674, 10678, 10683, 10687, 10692, 10696, 10701, 10705,
+      10712, 10719, 10726, 10733, 10740, 10747, 10754, 10761, 10768, 10775, 10782, 10789, 10796,
+      10803, 10810, 10817, 10824, 10831, 10838, 10845, 10852, 10859, 10866, 10873, 10880, 10887,
+      10894, 10901, 10908, 10915, 10922, 10929, 10936, 10943, 10950, 10957, 10964, 10971, 10978,
+      10985, 10992, 10999, 11006, 11013, 11020, 11027, 11034, 11041, 11048, 11055, 11062, 11069,
+      11076, 11083, 11090, 11097, 11104, 11111, 11118, 11125, 11126, 11128, 11130, 11132, 11134,
+      11136, 11140, 11143, 11148, 11152, 11157, 11161, 11166, 11170, 11175, 11179, 11184, 11188,
+      11192, 11195, 11200, 11204, 11209, 11213, 11218, 11222, 11227, 11231, 11236, 11240, 11241,
+      11243, 11245, 11247, 11249, 11251, 11255, 11258, 11263, 11267, 11272, 11276, 11281, 11285,
+      11290, 11294, 11299, 11303, 11307, 11310, 11315, 11319, 11324, 11328, 11333, 11337, 11342,
+      11346, 11351, 11355, 11356, 11358, 11360, 11362, 11364, 11366, 11370, 11373, 11378, 11382,
+      11387, 11391, 11396, 11400, 11405, 11409, 11414, 11418, 11422, 11425, 11430, 11434, 11439,
+      11443, 11448, 11452, 11457, 11461, 11466, 11470, 11471, 11473, 11475, 11477, 11479, 11481,
+      11485, 11488, 11493, 11497, 11502, 11506, 11511, 11515, 11520, 11524, 11529, 11533, 11537,
+      11540, 11545, 11549, 11554, 11558, 11563, 11567, 11572, 11576, 11581, 11585, 11586, 11588,
+      11590, 11592, 11594, 11596, 11597, 11599, 11601, 11603, 11605, 11607, 11612, 11619, 11626,
+      11633, 11640, 11647, 11654, 11661, 11668, 11675, 11682, 11689, 11696, 11703, 11710, 11717,
+      11724, 11731, 11738, 11745, 11752, 11759, 11766, 11773, 11780, 11787, 11788, 11790, 11797,
+      11804, 11811, 11818, 11825, 11827, 11834, 11841, 11848, 11855, 11862, 11864, 11871, 11878,
+      11885, 11892, 11899, 11901, 11908, 11915, 11922, 11929, 11936, 11938, 11939, 11941, 11948,
+      11955, 11962, 11969, 11976, 11978, 11985, 11992, 11999, 12006, 12013, 12015, 12022, 12029,
+      12036, 12043, 12050, 12052, 12059, 12066, 12073, 12080, 12087, 12089, 12090, 12092, 12099,
+      12106, 12113, 12120, 12127, 12129, 12136, 12143, 12150, 12157, 12164, 12166, 12173, 12180,
+      12187, 12194, 12201, 12203, 12210, 12217, 12224, 12231, 12238, 12240, 12241, 12243, 12245,
+      12247, 12249, 12251, 12261, 12270, 12280, 12289, 12299, 12308, 12318, 12327, 12337, 12346,
+      12356, 12365, 12375, 12384, 12394, 12403, 12413, 12422, 12432, 12441, 12451, 12460, 12470,
+      12479, 12489, 12498, 12508, 12517, 12527, 12536, 12546, 12555, 12565, 12574, 12584, 12593,
+      12603, 12612, 12622, 12631, 12639, 12646, 12656, 12665, 12675, 12684, 12694, 12703, 12713,
+      12722, 12732, 12741, 12751, 12760, 12770, 12779, 12789, 12798, 12808, 12817, 12827, 12836,
+      12846, 12855, 12865, 12874, 12884, 12893, 12903, 12912, 12922, 12931, 12941, 12950, 12960,
+      12969, 12979, 12988, 12998, 13007, 13017, 13026, 13036, 13045, 13055, 13064, 13074, 13083,
+      13093, 13102, 13112, 13121, 13129, 13136, 13146, 13155, 13165, 13174, 13184, 13193, 13203,
+      13212, 13222, 13231, 13241, 13250, 13260, 13269, 13279, 13288, 13298, 13307, 13317, 13326,
+      13336, 13345, 13355, 13364, 13374, 13383, 13393, 13402, 13412, 13421, 13431, 13440, 13450,
+      13459, 13469, 13478, 13488, 13497, 13507, 13516, 13526, 13535, 13545, 13554, 13564, 13573,
+      13583, 13592, 13602, 13611, 13619, 13626, 13636, 13645, 13655, 13664, 13674, 13683, 13693,
+      13702, 13712, 13721, 13731, 13740, 13750, 13759, 13769, 13778, 13788, 13797, 13807, 13816,
+      13826, 13835, 13845, 13854, 13864, 13873, 13883, 13892, 13902, 13911, 13921, 13930, 13940,
+      13949, 13959, 13968, 13978, 13987, 13997, 14006, 14016, 14025, 14035, 14044, 14054, 14063,
+      14073, 14082, 14092, 14101, 14102, 14104, 14106, 14108, 14110, 14112, 14120, 14127, 14135,
+      14142, 14150, 14157, 14165, 14172, 14180, 14187, 14195, 14202, 14210, 14217, 14225, 14232,
+      14240, 14247, 14255, 14262, 14270, 14277, 14285, 14292, 14300, 14307, 14315, 14322, 14330,
+      14337, 14345, 14352, 14360, 14367, 14375, 14382, 14390, 14397, 14405, 14412, 14418, 14423,
+      14431, 14438, 14446, 14453, 14461, 14468, 14476, 14483, 14491, 14498, 14506, 14513, 14521,
+      14528, 14536, 14543, 14551, 14558, 14566, 14573, 14581, 14588, 14596, 14603, 14611, 14618,
+      14626, 14633, 14641, 14648, 14656, 14663, 14671, 14678, 14686, 14693, 14701, 14708, 14716,
+      14723, 14731, 14738, 14746, 14753, 14761, 14768, 14776, 14783, 14791, 14798, 14804, 14809,
+      14817, 14824, 14832, 14839, 14847, 14854, 14862, 14869, 14877, 14884, 14892, 14899, 14907,
+      14914, 14922, 14929, 14937, 14944, 14952, 14959, 14967, 14974, 14982, 14989, 14997, 15004,
+      15012, 15019, 15027, 15034, 15042, 15049, 15057, 15064, 15072, 15079, 15087, 15094, 15102,
+      15109, 15117, 15124, 15132, 15139, 15147, 15154, 15162, 15169, 15177, 15184, 15190, 15195,
+      15203, 15210, 15218, 15225, 15233, 15240, 15248, 15255, 15263, 15270, 15278, 15285, 15293,
+      15300, 15308, 15315, 15323, 15330, 15338, 15345, 15353, 15360, 15368, 15375, 15383, 15390,
+      15398, 15405, 15413, 15420, 15428, 15435, 15443, 15450, 15458, 15465, 15473, 15480, 15488,
+      15495, 15503, 15510, 15518, 15525, 15533, 15540, 15548, 15555, 15563, 15570, 15575, 15580,
+      15587, 15594, 15601, 15606, 15611, 15618, 15625, 15632, 15637, 15642, 15649, 15656, 15663,
+      15666, 15671, 15674, 15679, 15684, 15687, 15692, 15695, 15700, 15705, 15707, 15708, 15709,
+      15710, 15711, 15712, 15717, 15724, 15727, 15732, 15733, 15734, 15735, 15736, 15737, 15738,
+      15739, 15740, 15741, 15742, 15743, 15744, 15745, 15746, 15747, 15748, 15749, 15750, 15753,
+      15754, 15755, 15756, 15757, 15758, 15759, 15762, 15763, 15764, 15765, 15766, 15767, 15768,
+      15769, 15770, 15771, 15772, 15773, 15774, 15775, 15776, 15777, 15778, 15779, 15780, 15781,
+      15782, 15783, 15784, 15785, 15786, 15787, 15788, 15789, 15790, 15791, 15792, 15793, 15794,
+      15795, 15796, 15797, 15798, 15799, 15801, 15802, 15803, 15804, 15805, 15806, 15810, 15813,
+      15814, 15815, 15816, 15817, 15818, 15819, 15820, 15821, 15822, 15823, 15824, 15825, 15826,
+      15827, 15828, 15829, 15831, 15832, 15833, 15834, 15835, 15836, 15837, 15838, 15839, 15840,
+      15841, 15842, 15845, 15846, 15849, 15850, 15851, 15852, 15853, 15854, 15855, 15856, 15857,
+      15858, 15859, 15860, 15861, 15862, 15863, 15864, 15865, 15866, 15867, 15868, 15869, 15870,
+      15871, 15872, 15873, 15874, 15875, 15876, 15877, 15878, 15879, 15880, 15881, 15882, 15883,
+      15884, 15885, 15887, 15888, 15890, 15891, 15892, 15893, 15894, 15895, 15896, 15897, 15898,
+      15899, 15900, 15902, 15903, 15904, 15905, 15906, 15907, 15908, 15909, 15910, 15911, 15912,
+      15913, 15914, 15915, 15916, 15917, 15918, 15920, 15921, 15922, 15923, 15924, 15925, 15926,
+      15927, 15928, 15929, 15930, 15931, 15932, 15933, 15934, 15937, 15938, 15939, 15940, 15941,
+      15942, 15943, 15944, 15945, 15946, 15947, 15948, 15949, 15950, 15951, 15952, 15953, 15954,
+      15955, 15956, 15957, 15959, 15960, 15961, 15962, 15963, 15964, 15965, 15966, 15967, 15968,
+      15969, 15970, 15971, 15974, 15975, 15976, 15977, 15978, 15979, 15980, 15981, 15982, 15983,
+      15984, 15985, 15986, 15987, 15988, 15989, 15990, 15991, 15992, 15993, 15994, 15995, 15996,
+      15997, 15998, 15999, 16000, 16001, 16002, 16003, 16004, 16005, 16006, 16007, 16008, 16009,
+      16010, 16011, 16012, 16013, 16014, 16015, 16016, 16017, 16018, 16019, 16020, 16021, 16022,
+      16023, 16024, 16025, 16026, 16027, 16028, 16029, 16030, 16031, 16032, 16033, 16034, 16035,
+      16036, 16037, 16038, 16039, 16040, 16041, 16042, 16043, 16044, 16045, 16046, 16047, 16048,
+      16049, 16050, 16051, 16052, 16053, 16054, 16055, 16056, 16057, 16058, 16059, 16060, 16061,
+      16063, 16064, 16065, 16066, 16067, 16068, 16069, 16070, 16071, 16072, 16073, 16075, 16076,
+      16077, 16078, 16080, 16081, 16083, 16084, 16085, 16086, 16087, 16089, 16090, 16092, 16093,
+      16095, 16096, 16098, 16099, 16101, 16102, 16104, 16105, 16107, 16108, 16110, 16111, 16112,
+      16113, 16114, 16115, 16117, 16118, 16120, 16121, 16122, 16123, 16124, 16125, 16126, 16127,
+      16128, 16129, 16130, 16131, 16132, 16133, 16134, 16135, 16136, 16137, 16138, 16139, 16140,
+      16141, 16142, 16143, 16145, 16146, 16147, 16148, 16149, 16150, 16151, 16153, 16154, 16155,
+      16156, 16157, 16158, 16159, 16161, 16162, 16163, 16164, 16165, 16166, 16167, 16168, 16169,
+      16170, 16171, 16172, 16173, 16174, 16175, 16176, 16177, 16178, 16179, 16180, 16181, 16182,
+      16183, 16184, 16185, 16186, 16187, 16188, 16189, 16190, 16191, 16192, 16193, 16194, 16195,
+      16196, 16197, 16199, 16200, 16202, 16203, 16204, 16205, 16206, 16207, 16208, 16209, 16210,
+      16211, 16212, 16214, 16215, 16217, 16218, 16220, 16221, 16222, 16223, 16224, 16225, 16226,
+      16227, 16228, 16229, 16230, 16231, 16232, 16233, 16235, 16236, 16238, 16239, 16241, 16242,
+      16243, 16245, 16246, 16248, 16249, 16250, 16251, 16252, 16253, 16254, 16255, 16256, 16257,
+      16259, 16260, 16261, 16262, 16264, 16265, 16266, 16267, 16268, 16269, 16270, 16272, 16273,
+      16275, 16276, 16278, 16279, 16280, 16281, 16282, 16283, 16284, 16285, 16286, 16287, 16288,
+      16289, 16290, 16291, 16292, 16293, 16294, 16295, 16296, 16297, 16298, 16299, 16300, 16301,
+      16302, 16303, 16304, 16305, 16306, 16307, 16308, 16309, 16310, 16311, 16312, 16313, 16314,
+      16315, 16317, 16318, 16320, 16321, 16322, 16323, 16324, 16325, 16326, 16327, 16328, 16330,
+      16331, 16332, 16334, 16335, 16337, 16338, 16340, 16341, 16343, 16344, 16346, 16347, 16349,
+      16350, 16352, 16353, 16355, 16356, 16358, 16359, 16361, 16362, 16363, 16364, 16365, 16367,
+      16368, 16369, 16371, 16372, 16373, 16375, 16376, 16378, 16379, 16380, 16382, 16383, 16384,
+      16385, 16386, 16387, 16388, 16389, 16390, 16391, 16392, 16393, 16394, 16395, 16396, 16397,
+      16398, 16399, 16400, 16401, 16402, 16403, 16404, 16406, 16407, 16409, 16410, 16411, 16413,
+      16414, 16415, 16416, 16417, 16418, 16419, 16420, 16421, 16422, 16423, 16424, 16425, 16426,
+      16427, 16428, 16429, 16430, 16431, 16432, 16433, 16434, 16435, 16436, 16437, 16438, 16439,
+      16441, 16442, 16443, 16444, 16445, 16446, 16447, 16448, 16449, 16450, 16451, 16452, 16453,
+      16454, 16455, 16456, 16458, 16459, 16460, 16461, 16462, 16463, 16464, 16465, 16466, 16468,
+      16469, 16471, 16472, 16474, 16475, 16477, 16478, 16480, 16481, 16482, 16483, 16484, 16485,
+      16487, 16488, 16489, 16490, 16491, 16492, 16493, 16494, 16496, 16497, 16498, 16499, 16500,
+      16501, 16502, 16503, 16504, 16505, 16506, 16507, 16508, 16509, 16510, 16511, 16512, 16513,
+      16514, 16515, 16516, 16517, 16518, 16519, 16521, 16522, 16523, 16524, 16525, 16526, 16527,
+      16528, 16529, 16530, 16531, 16532, 16533, 16534, 16535, 16536, 16537, 16538, 16539, 16541,
+      16542, 16543, 16544, 16545, 16546, 16547, 16548, 16549, 16550, 16551, 16552, 16553, 16554,
+      16555, 16556, 16557, 16558, 16560, 16561, 16563, 16564, 16566, 16567, 16568, 16569, 16570,
+      16571, 16572, 16573, 16574, 16575, 16576, 16577, 16578, 16579, 16580, 16581, 16582, 16583,
+      16584, 16585, 16587, 16588, 16589, 16590, 16591, 16592, 16593, 16594, 16595, 16597, 16598,
+      16600, 16601, 16603, 16604, 16606, 16607, 16609, 16610, 16611, 16612, 16613, 16614, 16615,
+      16616, 16618, 16619, 16621, 16622, 16623, 16624, 16625, 16626, 16627, 16628, 16629, 16630,
+      16632, 16633, 16634, 16635, 16636, 16637, 16638, 16639, 16640, 16641, 16642, 16643, 16644,
+      16645, 16646, 16647, 16648, 16649, 16650, 16652, 16653, 16654, 16655, 16657, 16658, 16659,
+      16660, 16661, 16662, 16663, 16664, 16665, 16666, 16667, 16668, 16669, 16671, 16672, 16673,
+      16674, 16675, 16676, 16677, 16678, 16679, 16680, 16681, 16682, 16683, 16685, 16686, 16688,
+      16689, 16691, 16692, 16694, 16695, 16697, 16698, 16700, 16701, 16703, 16704, 16705, 16706,
+      16707, 16708, 16710, 16711, 16712, 16713, 16715, 16716, 16718, 16719, 16720, 16721, 16722,
+      16723, 16724, 16725, 16726, 16727, 16729, 16730, 16731, 16732, 16734, 16735, 16737, 16738,
+      16740, 16741, 16743, 16744, 16745, 16746, 16747, 16748, 16749, 16751, 16752, 16753, 16754,
+      16756, 16757, 16759, 16760, 16762, 16763, 16765, 16766, 16768, 16769, 16770, 16771, 16772,
+      16774, 16775, 16776, 16777, 16778, 16779, 16781, 16782, 16784, 16785, 16787, 16788, 16789,
+      16790, 16794, 16797, 16799, 16800, 16801, 16802, 16803, 16804, 16805, 16807, 16808, 16809,
+      16810, 16811, 16812, 16813, 16814, 16815, 16816, 16817, 16818, 16819, 16820, 16821, 16822,
+      16823, 16824, 16825, 16827, 16828, 16830, 16831, 16832, 16833, 16834, 16835, 16836, 16837,
+      16838, 16839, 16840, 16841, 16842, 16843, 16844, 16845, 16846, 16847, 16848, 16849, 16850,
+      16851, 16853, 16854, 16855, 16857, 16858, 16859, 16860, 16861, 16862, 16863, 16864, 16865,
+      16866, 16867, 16868, 16869, 16870, 16871, 16872, 16873, 16874, 16875, 16876, 16878, 16879,
+      16880, 16881, 16882, 16883, 16884, 16885, 16886, 16887, 16888, 16889, 16891, 16892, 16894,
+      16895, 16897, 16898, 16900, 16901, 16903, 16904, 16906, 16907, 16909, 16910, 16912, 16913,
+      16915, 16916, 16918, 16919, 16921, 16922, 16924, 16925, 16927, 16928, 16930, 16931, 16933,
+      16934, 16936, 16937, 16938, 16939, 16940, 16941, 16942, 16943, 16944, 16945, 16947, 16948,
+      16950, 16951, 16953, 16954, 16956, 16957, 16959, 16960, 16962, 16963, 16965, 16966, 16968,
+      16969, 16971, 16972, 16973, 16974, 16975, 16976, 16977, 16978, 16979, 16980, 16981, 16982,
+      16983, 16984, 16985, 16986, 16987, 16988, 16989, 16990, 16991, 16993, 16994, 16995, 16997,
+      16998, 17000, 17001, 17003, 17004, 17005, 17007, 17008, 17009, 17010, 17011, 17012, 17014,
+      17015, 17017, 17018, 17020, 17021, 17023, 17024, 17025, 17026, 17027, 17028, 17029, 17030,
+      17031, 17033, 17034, 17036, 17037, 17039, 17040, 17042, 17043, 17044, 17045, 17046, 17047,
+      17049, 17050, 17052, 17053, 17055, 17056, 17057, 17058, 17059, 17060, 17062, 17063, 17064,
+      17065, 17067, 17068, 17070, 17071, 17073, 17074, 17075, 17076, 17077, 17078, 17079, 17081,
+      17082, 17084, 17085, 17086, 17087, 17088, 17089, 17091, 17092, 17094, 17095, 17097, 17098,
+      17100, 17101, 17103, 17104, 17106, 17107, 17109, 17110, 17111, 17114, 17116, 17119, 17121,
+      17124, 17126, 17129, 17131, 17134, 17136, 17139, 17141, 17144, 17146, 17149, 17151, 17154,
+      17156, 17159, 17161, 17164, 17166, 17169, 17171, 17172, 17173, 17174, 17175, 17176, 17177,
+      17179, 17180, 17181, 17183, 17184, 17185, 17186, 17187, 17189, 17190, 17191, 17193, 17194,
+      17195, 17196, 17198, 17199, 17200, 17202, 17203, 17204, 17205, 17206, 17207, 17209, 17210,
+      17212, 17213, 17214, 17215, 17216, 17217, 17218, 17219, 17220, 17221, 17222, 17223, 17225,
+      17226, 17228, 17229, 17230, 17231, 17232, 17233, 17234, 17235, 17236, 17237, 17238, 17239,
+      17240, 17241, 17242, 17243, 17244, 17245, 17246, 17247, 17248, 17249, 17251, 17252, 17254,
+      17255, 17256, 17257, 17259, 17260, 17262, 17263, 17264, 17265, 17266, 17267, 17268, 17269,
+      17270, 17271, 17272, 17273, 17274, 17275, 17276, 17277, 17279, 17280, 17284, 17287, 17292,
+      17296, 17300, 17303, 17307, 17310, 17312, 17314, 17316, 17318, 17320, 17322, 17324, 17326,
+      17328, 17330, 17332, 17334, 17336, 17338, 17340, 17342, 17344, 17346, 17348, 17350, 17352,
+      17354, 17356, 17358, 17360, 17362, 17364, 17366, 17368, 17370, 17372, 17374, 17376, 17378,
+      17380, 17382, 17384, 17386, 17388, 17390, 17392, 17394, 17396, 17398, 17400, 17402, 17404,
+      17406, 17408, 17410, 17412, 17414, 17416, 17418, 17420, 17422, 17424, 17426, 17428, 17430,
+      17432, 17434, 17436, 17438, 17440, 17442, 17444, 17446, 17448, 17450, 17452, 17454, 17456,
+      17458, 17460, 17462, 17464, 17466, 17468, 17470, 17472, 17474, 17476, 17478, 17480, 17482,
+      17484, 17486, 17488, 17490, 17492, 17494, 17496, 17498, 17500, 17502, 17504, 17506, 17508,
+      17510, 17512, 17514, 17516, 17518, 17520, 17522, 17524, 17526, 17528, 17530, 17532, 17534,
+      17536, 17538, 17540, 17542, 17544, 17546, 17548, 17550, 17552, 17554, 17556, 17558, 17560,
+      17562, 17564, 17566, 17568, 17570, 17572, 17574, 17576, 17578, 17580, 17582, 17584, 17586,
+      17588, 17590, 17592, 17594, 17596, 17598, 17600, 17602, 17604, 17606, 17608, 17610, 17612,
+      17614, 17616, 17618, 17620, 17622, 17624, 17626, 17628, 17630, 17632, 17634, 17636, 17638,
+      17640, 17642, 17644, 17646, 17648, 17650, 17652, 17654, 17656, 17658, 17660, 17662, 17664,
+      17666, 17668, 17670, 17672, 17674, 17676, 17678, 17680, 17682, 17684, 17686, 17688, 17690,
+      17692, 17694, 17696, 17698, 17700, 17702, 17704, 17706, 17708, 17710, 17712, 17714, 17716,
+      17718, 17720, 17722, 17724, 17726, 17728, 17730, 17732, 17734, 17736, 17738, 17740, 17742,
+      17744, 17746, 17748, 17750, 17752, 17754, 17756, 17758, 17760, 17762, 17764, 17766, 17768,
+      17770, 17772, 17774, 17776, 17778, 17780, 17782, 17784, 17786, 17788, 17790, 17792, 17794,
+      17796, 17798, 17800, 17802, 17804, 17806, 17808, 17810, 17812, 17814, 17816, 17818, 17820,
+      17822, 17824, 17826, 17828, 17835, 17842, 17849,
+    };
+
+    // Per-emoji columns: groups[] / subGroups[] / strings[] / statuses[] indices
+    inline constexpr std::uint8_t groupIds[] = {
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+      0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2,
+      2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+      3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+      4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+      4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+      4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+      4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+      5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+      6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+      6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+      6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+      7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+      8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+    };
+
+    inline constexpr std::uint16_t subGroupIds[] = {
+      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3,
+      3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5,
+      6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 7, 7, 8, 8, 8, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+      9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10, 10, 10, 10, 10, 11, 11, 11,
+      11, 11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 12, 12, 12, 13, 13, 13, 14, 14, 14, 14, 14, 14,
+      14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+      15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 16, 16,
+      16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+      16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+      16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 17, 17, 17, 17,
+      17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17,
+      17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17, 17,
+      17, 17, 17, 17, 17, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18,
+      18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18, 18,
+      18, 18, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19,
+      19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 20, 20,
+      20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,
+      20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,
+      20, 20, 20, 20, 20, 20, 20, 20, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,
+      21, 21, 21, 21, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+      22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+      22, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23,
+      23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24,
+      24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25,
+      25, 25, 25, 25, 25, 25, 25, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+      27, 27, 27, 27, 27, 27, 27, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28,
+      28, 28, 28, 28, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29,
+      29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29, 29,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30,
+      30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 31, 32, 32, 32, 32, 32, 33, 33,
+      33, 33, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+      34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+      34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+      34, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35, 35,
+      35, 36, 37, 37, 37, 37, 37, 37, 37, 37, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+      38, 38, 38, 38, 38, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39, 39,
+      40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 41, 41, 41, 41, 41,
+      41, 41, 41, 41, 41, 41, 41, 41, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+      42, 42, 42, 42, 42, 42, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+      43, 43, 43, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44,
+      44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 44, 45, 45, 45, 45, 45, 45, 45, 45, 45,
+      45, 45, 45, 45, 45, 45, 45, 45, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 46, 47,
+      47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 48, 48, 48, 48,
+      48, 48, 48, 48, 49, 49, 49, 49, 49, 49, 49, 49, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 50,
+      50, 50, 50, 50, 50, 50, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51,
+      51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 52, 52, 52, 52, 52, 52, 52, 53,
+      53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 53, 54, 54, 54, 54, 54,
+      54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,
+      54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,
+      54, 54, 54, 54, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 55, 56, 56, 56, 56, 56, 56, 56,
+      56, 56, 56, 56, 56, 56, 56, 56, 56, 57, 57, 57, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58,
+      58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58, 58,
+      59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59,
+      59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59,
+      59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 59, 60, 60, 60, 60,
+      60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 61, 61, 61, 61,
+      61, 61, 61, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62,
+      62, 62, 62, 62, 62, 62, 62, 62, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63,
+      63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 63, 64, 64, 64, 64, 64, 64, 64, 64,
+      65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65,
+      65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65,
+      65, 65, 65, 65, 66, 66, 66, 66, 66, 66, 66, 66, 66, 67, 67, 67, 67, 67, 67, 67, 67, 67, 67,
+      67, 67, 68, 68, 68, 68, 68, 68, 68, 68, 68, 68, 68, 68, 68, 69, 69, 69, 69, 69, 69, 69, 70,
+      70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 70, 71, 71, 71, 71, 71,
+      71, 71, 71, 71, 71, 71, 71, 71, 71, 71, 71, 71, 71, 71, 72, 72, 72, 72, 72, 72, 72, 72, 72,
+      72, 72, 72, 72, 72, 72, 72, 72, 72, 72, 73, 73, 73, 73, 73, 73, 73, 73, 73, 73, 73, 74, 74,
+      74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 74, 75, 75, 75, 75, 75, 75, 75, 75, 75, 75,
+      75, 75, 75, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76,
+      76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 77, 77, 77, 77, 77, 77, 77, 78, 78, 78, 78, 78,
+      78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 78,
+      78, 78, 78, 78, 78, 78, 78, 78, 78, 78, 79, 79, 79, 79, 79, 79, 79, 79, 80, 80, 80, 80, 80,
+      80, 80, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+      81, 81, 81, 81, 81, 81, 82, 82, 82, 82, 82, 82, 82, 82, 82, 82, 82, 83, 83, 83, 83, 83, 83,
+      83, 83, 83, 83, 83, 83, 83, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84, 84,
+      85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85,
+      85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 86, 86, 86, 86, 86, 86, 86, 86, 86, 86, 86,
+      86, 86, 86, 86, 86, 86, 86, 86, 86, 86, 86, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87, 87,
+      87, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88,
+      88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 88, 89, 89, 89, 89, 89, 89, 90, 90, 90, 90, 90,
+      90, 90, 90, 91, 91, 91, 91, 91, 91, 91, 91, 91, 91, 92, 92, 93, 93, 93, 93, 93, 93, 93, 93,
+      93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93, 93,
+      93, 93, 93, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94,
+      94, 94, 94, 94, 94, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95,
+      95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95, 95,
+      95, 95, 95, 95, 95, 95, 95, 95, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96,
+      96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96, 96,
+      97, 97, 97, 97, 97, 97, 97, 97, 97, 97, 97, 97, 97, 97, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98,
+      98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 98, 99, 99, 99,
+    };
+
+    inline constexpr std::uint32_t versionIds[] = {
+      110, 112, 112, 112, 112, 112, 118, 112, 110, 110, 123, 112, 112, 110, 128, 112, 131, 112,
+      110, 112, 112, 112, 110, 138, 112, 110, 112, 131, 112, 110, 110, 131, 123, 123, 131, 110,
+      123, 110, 131, 155, 110, 110, 123, 160, 160, 112, 112, 110, 110, 160, 118, 168, 170, 170,
+      170, 170, 112, 112, 112, 118, 110, 178, 112, 110, 110, 118, 131, 118, 128, 128, 128, 112,
+      160, 131, 118, 128, 138, 110, 110, 131, 110, 123, 110, 110, 155, 155, 110, 110, 112, 112,
+      207, 128, 123, 110, 110, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 225,
+      112, 112, 112, 131, 110, 112, 112, 110, 110, 112, 118, 112, 112, 112, 112, 112, 110, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 110, 110, 112, 160, 160, 160, 160, 112, 112, 168, 131, 112, 112, 112, 168, 112,
+      225, 118, 168, 225, 112, 112, 112, 207, 112, 112, 112, 112, 155, 155, 112, 290, 290, 290,
+      290, 290, 290, 155, 155, 110, 112, 112, 110, 110, 110, 110, 110, 118, 118, 118, 118, 118,
+      118, 155, 155, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 110, 110, 110, 110,
+      110, 110, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+      123, 123, 123, 123, 123, 123, 123, 123, 168, 168, 168, 168, 168, 168, 168, 168, 168, 168,
+      168, 168, 112, 110, 110, 110, 110, 110, 138, 138, 138, 138, 138, 138, 225, 225, 225, 225,
+      225, 225, 112, 112, 110, 110, 110, 110, 110, 118, 118, 118, 118, 118, 118, 123, 123, 123,
+      123, 123, 123, 131, 131, 131, 131, 131, 131, 110, 110, 110, 110, 110, 110, 118, 118, 118,
+      118, 118, 118, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 112, 110, 110,
+      110, 110, 110, 110, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 112, 112, 110,
+      110, 110, 110, 110, 123, 123, 123, 123, 123, 123, 112, 110, 110, 110, 110, 110, 112, 110,
+      110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 118, 118,
+      118, 118, 118, 118, 118, 118, 118, 118, 118, 118, 112, 110, 110, 110, 110, 110, 112, 110,
+      110, 110, 110, 110, 123, 123, 123, 123, 123, 123, 112, 110, 110, 110, 110, 110, 131, 131,
+      131, 131, 131, 131, 118, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+      123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 112, 110, 110, 110, 110, 110,
+      155, 155, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 118, 118, 118, 118, 118,
+      118, 112, 110, 110, 110, 110, 110, 225, 225, 128, 128, 128, 128, 128, 128, 128, 128, 128,
+      128, 128, 128, 112, 110, 110, 110, 110, 110, 225, 225, 225, 225, 225, 225, 112, 110, 110,
+      110, 110, 110, 131, 138, 138, 128, 128, 112, 155, 155, 112, 112, 123, 112, 110, 110, 110,
+      110, 110, 131, 131, 131, 131, 131, 131, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110,
+      110, 110, 131, 131, 131, 131, 131, 131, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110,
+      110, 110, 131, 131, 131, 131, 131, 131, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 128, 128, 128, 128,
+      128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128,
+      128, 128, 112, 110, 110, 110, 110, 110, 128, 128, 128, 128, 128, 128, 717, 717, 717, 717,
+      717, 717, 128, 128, 128, 128, 128, 128, 717, 717, 717, 717, 717, 717, 128, 128, 128, 128,
+      128, 128, 717, 717, 717, 717, 717, 717, 128, 128, 128, 128, 128, 128, 717, 717, 717, 717,
+      717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 131, 131, 131, 131, 131, 131, 112, 110, 110, 110,
+      110, 110, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110,
+      110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110,
+      110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 118, 118, 118, 118,
+      118, 118, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 118, 118, 118, 118, 118, 118, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 717, 717, 717, 717, 717, 717, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 155, 155, 290, 290,
+      290, 290, 290, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110, 110,
+      110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 138, 138, 138, 138, 138, 138, 112, 110, 110, 110, 110,
+      110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 123, 123, 123, 123, 123, 123, 118, 118, 118, 118, 118,
+      118, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 112, 110, 110, 110, 110, 110, 131, 131, 131, 131, 131, 131, 118, 118, 118, 118, 118,
+      118, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138,
+      138, 138, 138, 138, 138, 138, 138, 112, 110, 110, 110, 110, 110, 138, 138, 138, 138, 138,
+      138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138,
+      138, 118, 118, 118, 118, 118, 118, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+      123, 131, 131, 131, 131, 131, 131, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138, 138,
+      138, 138, 138, 138, 138, 138, 138, 112, 110, 110, 110, 110, 110, 112, 110, 110, 110, 110,
+      110, 118, 118, 118, 118, 118, 118, 138, 138, 138, 138, 138, 138, 128, 128, 128, 128, 128,
+      128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128,
+      128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128,
+      128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128, 128,
+      128, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 123,
+      207, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110, 110,
+      110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 717, 717, 717, 717, 717, 717, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 717, 717, 717, 717, 717, 717, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 717, 717, 717, 717, 717, 717, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 225, 225, 225, 225, 225, 225, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 112, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170, 170,
+      170, 207, 207, 207, 207, 207, 207, 112, 110, 110, 110, 110, 110, 118, 118, 118, 118, 118,
+      118, 155, 155, 760, 760, 760, 760, 760, 112, 207, 207, 207, 207, 207, 760, 760, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 760, 760, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 118, 110, 110, 110,
+      110, 110, 110, 155, 155, 112, 110, 110, 110, 110, 110, 155, 155, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110, 110, 110, 110, 110, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 110, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 112, 110,
+      110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 155, 155, 290, 290, 290, 290, 290, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 155, 155, 290, 290, 290, 290, 290, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 110, 110, 110, 110, 110, 110, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 110, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 118, 118, 118, 118,
+      118, 118, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 118, 118, 118, 118, 118, 118, 760, 760, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 760, 760, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207, 207,
+      207, 207, 207, 207, 207, 207, 207, 207, 118, 118, 118, 118, 118, 118, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 118, 118, 118, 118, 118, 118, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 118, 118, 118, 118,
+      118, 118, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 760, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131, 131,
+      131, 131, 112, 110, 110, 110, 110, 110, 110, 760, 760, 760, 760, 760, 225, 225, 717, 717,
+      717, 717, 225, 225, 717, 717, 717, 225, 225, 225, 717, 717, 225, 225, 225, 225, 717, 225,
+      225, 225, 225, 225, 110, 225, 717, 717, 717, 717, 225, 225, 717, 717, 717, 225, 225, 225,
+      717, 717, 225, 225, 225, 225, 717, 225, 225, 225, 225, 225, 112, 225, 225, 225, 225, 225,
+      225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225, 225,
+      225, 225, 110, 225, 717, 717, 717, 717, 225, 225, 717, 717, 717, 225, 225, 225, 717, 717,
+      225, 225, 225, 225, 717, 225, 225, 225, 225, 225, 112, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 290, 290, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      290, 290, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 290, 290,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 112, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 290, 290, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 290, 290, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 290, 290, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160, 160,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 760, 760, 760,
+      760, 760, 760, 760, 760, 760, 760, 155, 155, 112, 110, 138, 112, 170, 170, 170, 170, 112,
+      178, 110, 110, 110, 110, 110, 128, 128, 128, 128, 112, 112, 118, 225, 112, 155, 225, 225,
+      112, 112, 118, 128, 112, 155, 138, 110, 112, 110, 110, 112, 168, 168, 112, 110, 131, 118,
+      138, 112, 110, 110, 110, 112, 110, 112, 112, 110, 112, 110, 110, 112, 128, 131, 112, 138,
+      118, 128, 112, 110, 110, 112, 112, 110, 155, 155, 138, 131, 118, 112, 138, 138, 112, 112,
+      225, 225, 225, 128, 128, 112, 110, 112, 110, 112, 112, 112, 112, 112, 155, 155, 118, 118,
+      128, 118, 138, 138, 225, 128, 128, 168, 168, 168, 170, 112, 110, 112, 118, 112, 112, 110,
+      131, 131, 112, 110, 112, 207, 138, 112, 112, 112, 118, 112, 112, 123, 168, 110, 128, 118,
+      118, 225, 112, 118, 112, 112, 112, 138, 112, 131, 138, 155, 155, 155, 155, 110, 128, 138,
+      138, 128, 112, 112, 112, 123, 155, 155, 112, 118, 112, 112, 112, 112, 168, 112, 138, 110,
+      110, 112, 112, 112, 112, 110, 110, 112, 112, 112, 112, 123, 123, 112, 178, 112, 112, 112,
+      112, 110, 170, 112, 112, 128, 112, 207, 112, 110, 112, 112, 112, 138, 118, 112, 138, 131,
+      118, 112, 118, 118, 112, 155, 155, 138, 118, 128, 131, 225, 225, 118, 123, 112, 168, 168,
+      170, 178, 112, 118, 118, 138, 131, 128, 118, 225, 110, 112, 112, 131, 118, 112, 112, 112,
+      110, 131, 110, 110, 138, 118, 225, 118, 112, 118, 112, 138, 131, 118, 110, 225, 128, 131,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 128, 112, 131, 131, 131, 112,
+      112, 112, 112, 112, 112, 112, 128, 131, 112, 112, 112, 112, 112, 110, 118, 112, 138, 112,
+      112, 110, 112, 112, 112, 112, 112, 118, 118, 123, 131, 138, 225, 225, 225, 131, 155, 155,
+      112, 118, 112, 123, 110, 155, 155, 112, 110, 155, 155, 112, 128, 155, 155, 155, 155, 207,
+      112, 112, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155,
+      128, 138, 138, 138, 155, 155, 155, 155, 112, 112, 112, 112, 110, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 110, 225, 110, 155, 155, 110, 112, 112, 112,
+      112, 155, 155, 112, 112, 112, 112, 112, 112, 112, 112, 123, 112, 112, 112, 112, 110, 112,
+      112, 112, 110, 112, 110, 112, 110, 110, 110, 110, 112, 155, 110, 110, 112, 112, 112, 155,
+      112, 110, 112, 155, 112, 138, 112, 110, 110, 155, 155, 155, 155, 118, 225, 225, 225, 112,
+      118, 128, 138, 112, 155, 155, 155, 155, 155, 155, 112, 123, 112, 112, 110, 118, 112, 112,
+      123, 112, 118, 112, 155, 155, 155, 155, 155, 155, 112, 112, 112, 155, 155, 110, 110, 225,
+      112, 110, 110, 110, 110, 155, 155, 112, 131, 155, 155, 128, 112, 112, 112, 112, 110, 110,
+      110, 110, 155, 155, 112, 155, 112, 155, 112, 155, 112, 155, 112, 155, 112, 155, 112, 155,
+      112, 155, 112, 155, 112, 155, 112, 155, 112, 155, 112, 110, 112, 112, 112, 110, 110, 110,
+      112, 110, 112, 155, 155, 155, 112, 112, 110, 110, 225, 112, 112, 112, 112, 112, 112, 112,
+      155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155,
+      155, 155, 112, 112, 112, 155, 155, 112, 155, 155, 112, 112, 112, 155, 155, 112, 110, 110,
+      112, 112, 112, 112, 112, 112, 112, 128, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      128, 112, 112, 155, 155, 155, 155, 112, 155, 155, 112, 110, 118, 118, 118, 112, 112, 128,
+      112, 110, 112, 110, 112, 128, 112, 110, 110, 110, 128, 110, 110, 118, 118, 118, 112, 155,
+      155, 112, 225, 112, 112, 131, 131, 112, 225, 225, 112, 112, 112, 138, 112, 155, 155, 112,
+      112, 128, 128, 138, 123, 138, 112, 112, 112, 112, 112, 112, 112, 112, 128, 128, 112, 112,
+      112, 112, 155, 155, 112, 128, 138, 128, 138, 112, 155, 155, 128, 128, 225, 112, 112, 112,
+      131, 131, 131, 131, 112, 112, 225, 225, 225, 225, 112, 112, 168, 112, 112, 112, 155, 155,
+      112, 138, 112, 112, 128, 128, 112, 112, 225, 112, 168, 112, 112, 112, 112, 131, 138, 155,
+      155, 110, 112, 112, 112, 110, 155, 110, 112, 112, 112, 110, 112, 110, 112, 112, 112, 155,
+      155, 155, 155, 155, 155, 112, 112, 112, 112, 112, 207, 138, 112, 112, 112, 225, 118, 138,
+      168, 168, 178, 112, 112, 112, 112, 112, 112, 112, 112, 123, 112, 112, 155, 155, 155, 155,
+      110, 110, 155, 155, 155, 155, 112, 112, 112, 112, 128, 112, 155, 155, 155, 155, 112, 112,
+      112, 110, 112, 112, 112, 112, 155, 155, 112, 112, 112, 225, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 155, 155, 112, 112, 155, 155, 138, 112, 207, 112, 112,
+      110, 110, 112, 112, 128, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 155, 155,
+      112, 155, 155, 112, 112, 112, 112, 155, 155, 155, 155, 155, 155, 155, 155, 112, 112, 112,
+      112, 155, 155, 112, 112, 155, 155, 155, 155, 112, 112, 112, 112, 112, 112, 112, 112, 155,
+      155, 112, 112, 112, 112, 155, 155, 155, 155, 155, 155, 112, 112, 112, 112, 112, 155, 155,
+      112, 225, 155, 155, 110, 110, 155, 155, 155, 155, 110, 110, 112, 138, 110, 155, 155, 138,
+      112, 138, 112, 110, 110, 155, 155, 110, 110, 225, 112, 170, 170, 155, 155, 138, 128, 128,
+      138, 178, 110, 110, 128, 128, 128, 110, 110, 112, 112, 225, 112, 225, 123, 225, 123, 112,
+      138, 138, 138, 155, 155, 155, 155, 225, 112, 138, 110, 110, 138, 225, 128, 128, 128, 128,
+      128, 138, 128, 123, 138, 128, 128, 118, 112, 110, 110, 138, 110, 110, 128, 123, 112, 138,
+      123, 112, 110, 110, 112, 112, 112, 112, 112, 112, 110, 110, 110, 110, 112, 112, 110, 112,
+      112, 110, 112, 110, 110, 110, 110, 112, 110, 110, 110, 110, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 110, 112, 112, 112, 112, 112, 110, 110, 110, 155, 155, 155, 155,
+      155, 155, 155, 155, 155, 155, 110, 110, 155, 155, 110, 110, 110, 112, 168, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 110, 110, 110, 112, 112, 112, 155, 155,
+      110, 110, 112, 112, 112, 155, 155, 112, 112, 112, 112, 155, 155, 155, 155, 155, 155, 110,
+      110, 112, 110, 110, 112, 168, 112, 112, 760, 760, 760, 760, 138, 138, 112, 112, 112, 112,
+      112, 123, 128, 128, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 760, 760,
+      112, 112, 110, 110, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 110, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 178, 112, 112, 290, 290,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 225,
+      225, 225, 112, 225, 225, 112, 112, 225, 225, 225, 225, 225, 225, 225, 112, 112, 112, 112,
+      112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112,
+      112, 112, 112, 110, 155, 155, 760, 760, 138, 138, 138, 138, 128, 128, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 112, 290, 290, 178, 290, 290, 290, 290, 290, 290,
+      290, 112, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 112, 290, 290, 290,
+      290, 290, 290, 290, 112, 290, 112, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 112, 290, 290, 290, 112, 290, 290, 290, 290, 290, 290, 290, 112, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 112, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 760, 112, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290, 290,
+      290, 290, 290, 131, 131, 131,
+    };
+
+    inline constexpr std::uint32_t descriptionIds[] = {
+      111, 113, 114, 115, 116, 117, 119, 120, 121, 122, 124, 125, 126, 127, 129, 130, 132, 133,
+      134, 135, 135, 136, 137, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151,
+      152, 153, 154, 156, 157, 158, 159, 161, 161, 162, 163, 164, 165, 166, 167, 169, 171, 171,
+      172, 172, 173, 174, 175, 176, 177, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189,
+      190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 202, 203, 204, 205, 206,
+      208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 226,
+      227, 228, 229, 230, 231, 232, 233, 234, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243,
+      244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261,
+      262, 263, 264, 264, 265, 266, 266, 267, 267, 268, 268, 269, 270, 271, 272, 273, 274, 275,
+      276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 288, 289, 291, 291, 291,
+      291, 292, 292, 293, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306,
+      307, 308, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323,
+      324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341,
+      342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359,
+      360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377,
+      378, 379, 380, 380, 381, 382, 383, 384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394,
+      395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412,
+      413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428, 429, 430,
+      431, 432, 433, 434, 435, 436, 437, 438, 439, 440, 441, 442, 443, 444, 445, 446, 446, 447,
+      448, 449, 450, 451, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 465,
+      466, 467, 468, 469, 470, 471, 472, 473, 474, 475, 476, 477, 478, 479, 480, 481, 482, 483,
+      484, 485, 486, 487, 488, 489, 490, 491, 492, 493, 494, 495, 496, 497, 498, 499, 500, 501,
+      502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517, 518, 519,
+      520, 521, 522, 523, 524, 525, 526, 527, 528, 529, 530, 531, 532, 533, 534, 535, 536, 537,
+      538, 539, 540, 541, 542, 543, 544, 545, 546, 547, 548, 549, 550, 551, 552, 553, 554, 555,
+      556, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 572,
+      573, 574, 575, 576, 577, 578, 579, 580, 581, 582, 583, 584, 585, 586, 587, 588, 589, 590,
+      591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608,
+      609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 618, 619, 620, 621, 622, 623, 624, 625,
+      626, 627, 628, 629, 630, 631, 632, 633, 634, 635, 636, 637, 638, 639, 640, 641, 642, 643,
+      644, 645, 33, 646, 647, 648, 649, 650, 651, 652, 653, 654, 655, 656, 657, 658, 659, 660, 661,
+      662, 663, 664, 665, 666, 667, 668, 669, 669, 670, 670, 671, 671, 672, 672, 673, 673, 674,
+      674, 675, 675, 676, 676, 677, 677, 678, 678, 679, 679, 680, 680, 681, 682, 683, 684, 685,
+      686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703,
+      704, 705, 706, 707, 708, 709, 710, 711, 712, 713, 714, 715, 716, 718, 719, 720, 721, 722,
+      723, 724, 725, 726, 727, 728, 729, 730, 731, 732, 733, 734, 735, 736, 737, 738, 739, 740,
+      741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758,
+      759, 761, 761, 762, 762, 763, 763, 764, 764, 765, 765, 766, 766, 767, 767, 768, 768, 769,
+      769, 770, 770, 771, 771, 772, 772, 773, 774, 775, 776, 777, 778, 779, 780, 781, 782, 783,
+      784, 785, 786, 787, 788, 789, 790, 791, 792, 793, 794, 795, 796, 797, 797, 798, 798, 799,
+      799, 800, 800, 801, 801, 802, 802, 803, 803, 804, 804, 805, 805, 806, 806, 807, 807, 808,
+      808, 809, 810, 811, 812, 813, 814, 815, 815, 816, 816, 817, 817, 818, 818, 819, 819, 820,
+      820, 821, 821, 822, 822, 823, 823, 824, 824, 825, 825, 826, 826, 827, 828, 829, 830, 831,
+      832, 833, 833, 834, 834, 835, 835, 836, 836, 837, 837, 838, 838, 839, 839, 840, 840, 841,
+      841, 842, 842, 843, 843, 844, 844, 845, 846, 847, 848, 849, 850, 851, 851, 852, 852, 853,
+      853, 854, 854, 855, 855, 856, 856, 857, 857, 858, 858, 859, 859, 860, 860, 861, 861, 862,
+      862, 863, 864, 865, 866, 867, 868, 869, 869, 870, 870, 871, 871, 872, 872, 873, 873, 874,
+      874, 875, 875, 876, 876, 877, 877, 878, 878, 879, 879, 880, 880, 881, 882, 883, 884, 885,
+      886, 887, 887, 888, 888, 889, 889, 890, 890, 891, 891, 892, 892, 893, 893, 894, 894, 895,
+      895, 896, 896, 897, 897, 898, 898, 899, 900, 901, 902, 903, 904, 905, 905, 906, 906, 907,
+      907, 908, 908, 909, 909, 910, 910, 911, 911, 912, 912, 913, 913, 914, 914, 915, 915, 916,
+      916, 917, 918, 919, 920, 921, 922, 923, 923, 924, 924, 925, 925, 926, 926, 927, 927, 928,
+      928, 929, 929, 930, 930, 931, 931, 932, 932, 933, 933, 934, 934, 935, 936, 937, 938, 939,
+      940, 941, 941, 942, 942, 943, 943, 944, 944, 945, 945, 946, 946, 947, 947, 948, 948, 949,
+      949, 950, 950, 951, 951, 952, 952, 953, 954, 955, 956, 957, 958, 959, 959, 960, 960, 961,
+      961, 962, 962, 963, 963, 964, 964, 965, 965, 966, 966, 967, 967, 968, 968, 969, 969, 970,
+      970, 971, 971, 972, 972, 973, 973, 974, 974, 975, 975, 976, 976, 977, 977, 978, 978, 979,
+      979, 980, 980, 981, 981, 982, 982, 983, 983, 984, 984, 985, 985, 986, 986, 987, 987, 988,
+      988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1000, 1001, 1002, 1003, 1004,
+      1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019,
+      1020, 1021, 1022, 1023, 1024, 1025, 1025, 1026, 1026, 1027, 1027, 1028, 1028, 1029, 1029,
+      1030, 1030, 1031, 1031, 1032, 1032, 1033, 1033, 1034, 1034, 1035, 1035, 1036, 1036, 1037,
+      1037, 1038, 1038, 1039, 1039, 1040, 1040, 1041, 1041, 1042, 1042, 1043, 1044, 1045, 1046,
+      1047, 1048, 1049, 1050, 1051, 1052, 1053, 1054, 1055, 1056, 1057, 1058, 1059, 1060, 1061,
+      1062, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071, 1072, 1073, 1074, 1075, 1076,
+      1077, 1078, 1079, 1080, 1081, 1082, 1083, 1084, 1085, 1086, 1087, 1088, 1089, 1090, 1091,
+      1092, 1093, 1094, 1095, 1096, 1097, 1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106,
+      1107, 1108, 1109, 1110, 1111, 1112, 1113, 1114, 1115, 1116, 1117, 1118, 1119, 1120, 1121,
+      1122, 1123, 1124, 1125, 1126, 1127, 1128, 1129, 1130, 1131, 1132, 1133, 1134, 1135, 1136,
+      1137, 1138, 1139, 1140, 1141, 1142, 1143, 1144, 1145, 1146, 1147, 1148, 1149, 1150, 1151,
+      1152, 1153, 1154, 1155, 1156, 1157, 1158, 1159, 1160, 1161, 1162, 1163, 1164, 1165, 1166,
+      1167, 1168, 1169, 1170, 1171, 1172, 1173, 1174, 1175, 1176, 1177, 1178, 1179, 1180, 1181,
+      1182, 1183, 1184, 1185, 1186, 1187, 1188, 1189, 1190, 1191, 1192, 1193, 1194, 1195, 1196,
+      1197, 1198, 1199, 1200, 1201, 1202, 1203, 1204, 1205, 1205, 1206, 1206, 1207, 1207, 1208,
+      1208, 1209, 1209, 1210, 1210, 1211, 1211, 1212, 1212, 1213, 1213, 1214, 1214, 1215, 1215,
+      1216, 1216, 1217, 1217, 1218, 1218, 1219, 1219, 1220, 1220, 1221, 1221, 1222, 1222, 1223,
+      1224, 1225, 1226, 1227, 1228, 1229, 1230, 1231, 1232, 1233, 1234, 1235, 1236, 1237, 1238,
+      1239, 1240, 1241, 1242, 1243, 1244, 1245, 1246, 1247, 1248, 1249, 1250, 1251, 1252, 1253,
+      1254, 1255, 1256, 1257, 1258, 1259, 1260, 1261, 1262, 1263, 1264, 1265, 1265, 1266, 1266,
+      1267, 1267, 1268, 1268, 1269, 1269, 1270, 1270, 1271, 1271, 1272, 1272, 1273, 1273, 1274,
+      1274, 1275, 1275, 1276, 1276, 1277, 1277, 1278, 1279, 1280, 1281, 1282, 1283, 1283, 1283,
+      1283, 1284, 1284, 1285, 1285, 1286, 1286, 1287, 1287, 1288, 1288, 1289, 1289, 1289, 1289,
+      1290, 1290, 1291, 1291, 1292, 1292, 1293, 1293, 1294, 1294, 1295, 1296, 1297, 1298, 1299,
+      1300, 1301, 1301, 1302, 1302, 1303, 1303, 1304, 1304, 1305, 1305, 1306, 1306, 1307, 1307,
+      1308, 1308, 1309, 1309, 1310, 1310, 1311, 1311, 1312, 1312, 1313, 1314, 1315, 1316, 1317,
+      1318, 1319, 1320, 1321, 1322, 1323, 1324, 1325, 1325, 1326, 1326, 1327, 1327, 1328, 1328,
+      1329, 1329, 1330, 1330, 1331, 1331, 1332, 1332, 1333, 1333, 1334, 1334, 1335, 1335, 1336,
+      1336, 1337, 1338, 1339, 1340, 1341, 1342, 1343, 1344, 1345, 1346, 1347, 1348, 1349, 1350,
+      1351, 1352, 1353, 1354, 1355, 1356, 1357, 1358, 1359, 1360, 1361, 1361, 1362, 1362, 1363,
+      1363, 1364, 1364, 1365, 1365, 1366, 1366, 1367, 1367, 1368, 1368, 1369, 1369, 1370, 1370,
+      1371, 1371, 1372, 1372, 1373, 1374, 1375, 1376, 1377, 1378, 1379, 1380, 1381, 1382, 1383,
+      1384, 1385, 1386, 1387, 1388, 1389, 1390, 1391, 1391, 1392, 1392, 1393, 1393, 1394, 1394,
+      1395, 1395, 1396, 1396, 1397, 1397, 1398, 1398, 1399, 1399, 1400, 1400, 1401, 1401, 1402,
+      1402, 1403, 1404, 1405, 1406, 1407, 1408, 1409, 1409, 1410, 1410, 1411, 1411, 1412, 1412,
+      1413, 1413, 1414, 1414, 1415, 1415, 1416, 1416, 1417, 1417, 1418, 1418, 1419, 1419, 1420,
+      1420, 1421, 1422, 1423, 1424, 1425, 1426, 1427, 1428, 1429, 1430, 1431, 1432, 1433, 1434,
+      1435, 1436, 1437, 1438, 1439, 1440, 1441, 1442, 1443, 1444, 1445, 1446, 1447, 1448, 1449,
+      1450, 1451, 1452, 1453, 1454, 1455, 1456, 1457, 1458, 1459, 1460, 1461, 1462, 1463, 1464,
+      1465, 1466, 1467, 1468, 1469, 1470, 1471, 1472, 1473, 1474, 1475, 1476, 1477, 1478, 1479,
+      1480, 1481, 1482, 1483, 1484, 1485, 1486, 1487, 1488, 1489, 1490, 1491, 1492, 1493, 1493,
+      1494, 1494, 1495, 1495, 1496, 1496, 1497, 1497, 1498, 1498, 1499, 1499, 1500, 1500, 1501,
+      1501, 1502, 1502, 1503, 1503, 1504, 1504, 1505, 1506, 1507, 1508, 1509, 1510, 1511, 1511,
+      1512, 1512, 1513, 1513, 1514, 1514, 1515, 1515, 1516, 1516, 1517, 1517, 1518, 1518, 1519,
+      1519, 1520, 1520, 1521, 1521, 1522, 1522, 1523, 1524, 1525, 1526, 1527, 1528, 1529, 1529,
+      1530, 1530, 1531, 1531, 1532, 1532, 1533, 1533, 1534, 1534, 1535, 1535, 1536, 1536, 1537,
+      1537, 1538, 1538, 1539, 1539, 1540, 1540, 1541, 1542, 1543, 1544, 1545, 1546, 1547, 1547,
+      1548, 1548, 1549, 1549, 1550, 1550, 1551, 1551, 1552, 1552, 1553, 1553, 1554, 1554, 1555,
+      1555, 1556, 1556, 1557, 1557, 1558, 1558, 1559, 1560, 1561, 1562, 1563, 1564, 1565, 1565,
+      1566, 1566, 1567, 1567, 1568, 1568, 1569, 1569, 1570, 1570, 1571, 1571, 1572, 1572, 1573,
+      1573, 1574, 1574, 1575, 1575, 1576, 1576, 1577, 1578, 1579, 1580, 1581, 1582, 1583, 1583,
+      1584, 1584, 1585, 1585, 1586, 1586, 1587, 1587, 1588, 1588, 1589, 1589, 1590, 1590, 1591,
+      1591, 1592, 1592, 1593, 1593, 1594, 1594, 1595, 1596, 1597, 1598, 1599, 1600, 1601, 1601,
+      1602, 1602, 1603, 1603, 1604, 1604, 1605, 1605, 1606, 1606, 1607, 1607, 1608, 1608, 1609,
+      1609, 1610, 1610, 1611, 1611, 1612, 1612, 1613, 1614, 1614, 1615, 1615, 1616, 1617, 1617,
+      1618, 1618, 1619, 1620, 1621, 1622, 1623, 1624, 1625, 1626, 1627, 1627, 1628, 1628, 1629,
+      1629, 1630, 1630, 1631, 1631, 1632, 1632, 1633, 1633, 1634, 1634, 1635, 1635, 1636, 1636,
+      1637, 1637, 1638, 1638, 1639, 1640, 1641, 1642, 1643, 1644, 1645, 1645, 1646, 1646, 1647,
+      1647, 1648, 1648, 1649, 1649, 1650, 1650, 1651, 1651, 1652, 1652, 1653, 1653, 1654, 1654,
+      1655, 1655, 1656, 1656, 1657, 1658, 1659, 1660, 1661, 1662, 1663, 1663, 1664, 1664, 1665,
+      1665, 1666, 1666, 1667, 1667, 1668, 1668, 1669, 1669, 1670, 1670, 1671, 1671, 1672, 1672,
+      1673, 1673, 1674, 1674, 1675, 1675, 1676, 1676, 1677, 1677, 1678, 1678, 1679, 1679, 1680,
+      1680, 1681, 1681, 1681, 1681, 1682, 1682, 1682, 1682, 1683, 1683, 1683, 1683, 1684, 1684,
+      1684, 1684, 1685, 1685, 1685, 1685, 1686, 1686, 1686, 1686, 1687, 1687, 1687, 1687, 1688,
+      1688, 1688, 1688, 1689, 1689, 1689, 1689, 1690, 1690, 1690, 1690, 1691, 1691, 1691, 1691,
+      1692, 1692, 1692, 1692, 1693, 1694, 1695, 1696, 1697, 1698, 1699, 1699, 1700, 1700, 1701,
+      1701, 1702, 1702, 1703, 1703, 1704, 1704, 1705, 1705, 1706, 1706, 1707, 1707, 1708, 1708,
+      1709, 1709, 1710, 1710, 1711, 1712, 1713, 1714, 1715, 1716, 1717, 1717, 1718, 1718, 1719,
+      1719, 1720, 1720, 1721, 1721, 1722, 1722, 1723, 1723, 1724, 1724, 1725, 1725, 1726, 1726,
+      1727, 1727, 1728, 1728, 1729, 1729, 1730, 1730, 1731, 1731, 1732, 1732, 1733, 1733, 1734,
+      1734, 1735, 1735, 1735, 1735, 1736, 1736, 1736, 1736, 1737, 1737, 1737, 1737, 1738, 1738,
+      1738, 1738, 1739, 1739, 1739, 1739, 1740, 1740, 1740, 1740, 1741, 1741, 1741, 1741, 1742,
+      1742, 1742, 1742, 1743, 1743, 1743, 1743, 1744, 1744, 1744, 1744, 1745, 1745, 1745, 1745,
+      1746, 1746, 1746, 1746, 1747, 1748, 1749, 1750, 1751, 1752, 1753, 1753, 1754, 1754, 1755,
+      1755, 1756, 1756, 1757, 1757, 1758, 1758, 1759, 1760, 1761, 1762, 1763, 1764, 1765, 1765,
+      1766, 1766, 1767, 1767, 1768, 1768, 1769, 1769, 1770, 1770, 1771, 1772, 1773, 1774, 1775,
+      1776, 1777, 1777, 1778, 1778, 1779, 1779, 1780, 1780, 1781, 1781, 1782, 1782, 1783, 1784,
+      1785, 1786, 1787, 1788, 1789, 1789, 1790, 1790, 1791, 1791, 1792, 1792, 1793, 1793, 1794,
+      1794, 1795, 1796, 1797, 1798, 1799, 1800, 1801, 1801, 1802, 1802, 1803, 1803, 1804, 1804,
+      1805, 1805, 1806, 1806, 1807, 1808, 1809, 1810, 1811, 1812, 1813, 1813, 1814, 1814, 1815,
+      1815, 1816, 1816, 1817, 1817, 1818, 1818, 1819, 1820, 1821, 1822, 1823, 1824, 1825, 1825,
+      1826, 1826, 1827, 1827, 1828, 1828, 1829, 1829, 1830, 1830, 1831, 1832, 1833, 1834, 1835,
+      1836, 1837, 1837, 1838, 1838, 1839, 1839, 1840, 1840, 1841, 1841, 1842, 1842, 1843, 1844,
+      1845, 1846, 1847, 1848, 1849, 1849, 1850, 1850, 1851, 1851, 1852, 1852, 1853, 1853, 1854,
+      1854, 1855, 1856, 1857, 1858, 1859, 1860, 1861, 1861, 1862, 1862, 1863, 1863, 1864, 1864,
+      1865, 1865, 1866, 1866, 1867, 1867, 1868, 1868, 1869, 1869, 1870, 1870, 1871, 1871, 1872,
+      1872, 1873, 1873, 1874, 1874, 1875, 1875, 1876, 1876, 1877, 1877, 1878, 1878, 1879, 1879,
+      1879, 1879, 1880, 1880, 1880, 1880, 1881, 1881, 1881, 1881, 1882, 1882, 1882, 1882, 1883,
+      1883, 1883, 1883, 1884, 1884, 1884, 1884, 1885, 1885, 1885, 1885, 1886, 1886, 1886, 1886,
+      1887, 1887, 1887, 1887, 1888, 1888, 1888, 1888, 1889, 1889, 1889, 1889, 1890, 1890, 1890,
+      1890, 1891, 1892, 1893, 1894, 1895, 1896, 1897, 1898, 1899, 1900, 1901, 1902, 1903, 1904,
+      1905, 1906, 1907, 1908, 1909, 1909, 1910, 1911, 1912, 1913, 1914, 1915, 1916, 1917, 1918,
+      1919, 1920, 1921, 1921, 1922, 1922, 1923, 1923, 1924, 1924, 1925, 1925, 1926, 1926, 1927,
+      1927, 1928, 1928, 1929, 1929, 1930, 1930, 1931, 1931, 1932, 1932, 1933, 1934, 1935, 1936,
+      1937, 1938, 1939, 1940, 1941, 1942, 1943, 1944, 1945, 1946, 1947, 1948, 1949, 1950, 1951,
+      1952, 1953, 1954, 1955, 1956, 1957, 1958, 1959, 1960, 1961, 1962, 1963, 1964, 1965, 1966,
+      1967, 1968, 1969, 1970, 1971, 1972, 1973, 1974, 1975, 1976, 1977, 1978, 1979, 1980, 1981,
+      1982, 1983, 1984, 1985, 1986, 1987, 1988, 1989, 1990, 1991, 1992, 1993, 1994, 1995, 1996,
+      1997, 1998, 1999, 1999, 2000, 2000, 2001, 2001, 2002, 2002, 2003, 2003, 2004, 2004, 2005,
+      2005, 2006, 2006, 2007, 2007, 2008, 2008, 2009, 2009, 2010, 2010, 2011, 2012, 2013, 2014,
+      2015, 2016, 2017, 2017, 2018, 2018, 2019, 2019, 2020, 2020, 2021, 2021, 2022, 2022, 2023,
+      2023, 2024, 2024, 2025, 2025, 2026, 2026, 2027, 2027, 2028, 2028, 2029, 2030, 2031, 2032,
+      2033, 2034, 2035, 2036, 2036, 2037, 2038, 2039, 2040, 2041, 2042, 2043, 2043, 2044, 2045,
+      2046, 2047, 2048, 2049, 2049, 2049, 2049, 2050, 2050, 2051, 2051, 2052, 2052, 2053, 2053,
+      2054, 2054, 2055, 2055, 2055, 2055, 2056, 2056, 2057, 2057, 2058, 2058, 2059, 2059, 2060,
+      2060, 2061, 2062, 2063, 2064, 2065, 2066, 2067, 2067, 2068, 2068, 2069, 2069, 2070, 2070,
+      2071, 2071, 2072, 2072, 2073, 2073, 2074, 2074, 2075, 2075, 2076, 2076, 2077, 2077, 2078,
+      2078, 2079, 2080, 2081, 2082, 2083, 2084, 2085, 2085, 2086, 2086, 2087, 2087, 2088, 2088,
+      2089, 2089, 2090, 2090, 2091, 2091, 2092, 2092, 2093, 2093, 2094, 2094, 2095, 2095, 2096,
+      2096, 2097, 2098, 2099, 2100, 2101, 2102, 2103, 2103, 2104, 2104, 2105, 2105, 2106, 2106,
+      2107, 2107, 2108, 2108, 2109, 2109, 2110, 2110, 2111, 2111, 2112, 2112, 2113, 2113, 2114,
+      2114, 2115, 2115, 2116, 2117, 2118, 2119, 2120, 2121, 2121, 2121, 2121, 2122, 2122, 2123,
+      2123, 2124, 2124, 2125, 2125, 2126, 2126, 2127, 2127, 2127, 2127, 2128, 2128, 2129, 2129,
+      2130, 2130, 2131, 2131, 2132, 2132, 2133, 2133, 2134, 2135, 2136, 2137, 2138, 2139, 2139,
+      2139, 2139, 2140, 2140, 2141, 2141, 2142, 2142, 2143, 2143, 2144, 2144, 2145, 2145, 2145,
+      2145, 2146, 2146, 2147, 2147, 2148, 2148, 2149, 2149, 2150, 2150, 2151, 2152, 2153, 2154,
+      2155, 2156, 2157, 2157, 2158, 2158, 2159, 2159, 2160, 2160, 2161, 2161, 2162, 2162, 2163,
+      2163, 2164, 2164, 2165, 2165, 2166, 2166, 2167, 2167, 2168, 2168, 2169, 2170, 2171, 2172,
+      2173, 2174, 2175, 2175, 2176, 2176, 2177, 2177, 2178, 2178, 2179, 2179, 2180, 2180, 2181,
+      2181, 2182, 2182, 2183, 2183, 2184, 2184, 2185, 2185, 2186, 2186, 2187, 2188, 2189, 2190,
+      2191, 2192, 2193, 2193, 2194, 2194, 2195, 2195, 2196, 2196, 2197, 2197, 2198, 2198, 2199,
+      2199, 2200, 2200, 2201, 2201, 2202, 2202, 2203, 2203, 2204, 2204, 2205, 2206, 2207, 2208,
+      2209, 2210, 2211, 2211, 2212, 2212, 2213, 2213, 2214, 2214, 2215, 2215, 2216, 2216, 2217,
+      2217, 2218, 2218, 2219, 2219, 2220, 2220, 2221, 2221, 2222, 2222, 2223, 2224, 2225, 2226,
+      2227, 2228, 2229, 2230, 2231, 2232, 2233, 2234, 2235, 2236, 2237, 2238, 2239, 2240, 2241,
+      2242, 2243, 2244, 2245, 2246, 2247, 2248, 2249, 2250, 2251, 2252, 2253, 2254, 2255, 2256,
+      2257, 2258, 2259, 2260, 2261, 2262, 2263, 2264, 2265, 2266, 2267, 2268, 2269, 2270, 2271,
+      2272, 2273, 2274, 2275, 2276, 2277, 2278, 2279, 2280, 2281, 2282, 2283, 2284, 2285, 2286,
+      2287, 2288, 2289, 2289, 2290, 2290, 2291, 2291, 2292, 2292, 2293, 2293, 2294, 2294, 2295,
+      2295, 2296, 2296, 2297, 2297, 2298, 2298, 2299, 2299, 2300, 2300, 2301, 2302, 2303, 2304,
+      2305, 2306, 2307, 2307, 2308, 2308, 2309, 2309, 2310, 2310, 2311, 2311, 2312, 2312, 2313,
+      2313, 2314, 2314, 2315, 2315, 2316, 2316, 2317, 2317, 2318, 2318, 2319, 2320, 2321, 2322,
+      2323, 2324, 2325, 2325, 2326, 2326, 2327, 2327, 2328, 2328, 2329, 2329, 2330, 2330, 2331,
+      2331, 2332, 2332, 2333, 2333, 2334, 2334, 2335, 2335, 2336, 2336, 2337, 2338, 2339, 2340,
+      2341, 2342, 2343, 2343, 2344, 2344, 2345, 2345, 2346, 2346, 2347, 2347, 2348, 2348, 2349,
+      2349, 2350, 2350, 2351, 2351, 2352, 2352, 2353, 2353, 2354, 2354, 2355, 2356, 2357, 2358,
+      2359, 2360, 2361, 2362, 2363, 2364, 2365, 2366, 2367, 2368, 2369, 2370, 2371, 2372, 2373,
+      2374, 2375, 2376, 2377, 2378, 2379, 2380, 2381, 2382, 2383, 2384, 2385, 2386, 2387, 2388,
+      2389, 2390, 2391, 2392, 2393, 2394, 2395, 2396, 2397, 2398, 2399, 2400, 2401, 2402, 2403,
+      2404, 2405, 2406, 2407, 2408, 2409, 2410, 2411, 2412, 2413, 2414, 2415, 2416, 2417, 2418,
+      2419, 2420, 2421, 2422, 2423, 2424, 2425, 2426, 2427, 2428, 2429, 2430, 2431, 2432, 2433,
+      2434, 2435, 2436, 2437, 2438, 2439, 2440, 2441, 2442, 2443, 2444, 2445, 2446, 2447, 2448,
+      2449, 2450, 2451, 2452, 2453, 2454, 2455, 2456, 2457, 2458, 2459, 2460, 2461, 2462, 2463,
+      2464, 2465, 2466, 2467, 2468, 2469, 2470, 2471, 2472, 2473, 2474, 2475, 2476, 2477, 2477,
+      2478, 2478, 2479, 2479, 2480, 2480, 2481, 2481, 2482, 2482, 2483, 2483, 2484, 2484, 2485,
+      2485, 2486, 2486, 2487, 2487, 2488, 2488, 2489, 2489, 2490, 2490, 2491, 2491, 2492, 2492,
+      2493, 2493, 2494, 2494, 2495, 2495, 2496, 2496, 2497, 2497, 2498, 2498, 2499, 2499, 2500,
+      2500, 2501, 2501, 2502, 2502, 2503, 2503, 2504, 2504, 2505, 2505, 2506, 2506, 2507, 2507,
+      2508, 2508, 2509, 2509, 2510, 2510, 2511, 2511, 2512, 2512, 2513, 2513, 2514, 2514, 2515,
+      2515, 2516, 2516, 2517, 2517, 2518, 2518, 2519, 2519, 2520, 2520, 2521, 2521, 2522, 2522,
+      2523, 2523, 2524, 2524, 2525, 2525, 2526, 2526, 2527, 2527, 2528, 2528, 2529, 2529, 2530,
+      2530, 2531, 2531, 2532, 2532, 2533, 2533, 2534, 2534, 2535, 2535, 2536, 2536, 2537, 2537,
+      2538, 2538, 2539, 2539, 2540, 2540, 2541, 2541, 2542, 2542, 2543, 2543, 2544, 2544, 2545,
+      2545, 2546, 2546, 2547, 2547, 2548, 2548, 2549, 2549, 2550, 2550, 2551, 2551, 2552, 2552,
+      2553, 2553, 2554, 2554, 2555, 2555, 2556, 2556, 2557, 2557, 2558, 2558, 2559, 2559, 2560,
+      2560, 2561, 2561, 2562, 2562, 2563, 2563, 2564, 2564, 2565, 2565, 2566, 2566, 2567, 2567,
+      2568, 2568, 2569, 2569, 2570, 2570, 2571, 2571, 2572, 2572, 2573, 2573, 2574, 2574, 2575,
+      2576, 2577, 2578, 2579, 2580, 2581, 2581, 2582, 2582, 2583, 2583, 2584, 2584, 2585, 2585,
+      2586, 2586, 2587, 2587, 2588, 2588, 2589, 2589, 2590, 2590, 2591, 2591, 2592, 2592, 2593,
+      2593, 2594, 2594, 2595, 2595, 2596, 2596, 2597, 2597, 2598, 2598, 2599, 2599, 2600, 2600,
+      2601, 2601, 2602, 2602, 2603, 2603, 2604, 2604, 2605, 2605, 2606, 2606, 2607, 2607, 2608,
+      2608, 2609, 2609, 2610, 2610, 2611, 2611, 2612, 2612, 2613, 2613, 2614, 2614, 2615, 2615,
+      2616, 2616, 2617, 2617, 2618, 2618, 2619, 2619, 2620, 2620, 2621, 2621, 2622, 2622, 2623,
+      2623, 2624, 2624, 2625, 2625, 2626, 2626, 2627, 2627, 2628, 2628, 2629, 2629, 2630, 2630,
+      2631, 2631, 2632, 2632, 2633, 2633, 2634, 2634, 2635, 2635, 2636, 2636, 2637, 2637, 2638,
+      2638, 2639, 2639, 2640, 2640, 2641, 2641, 2642, 2642, 2643, 2643, 2644, 2644, 2645, 2645,
+      2646, 2646, 2647, 2647, 2648, 2648, 2649, 2649, 2650, 2650, 2651, 2651, 2652, 2652, 2653,
+      2653, 2654, 2654, 2655, 2655, 2656, 2656, 2657, 2657, 2658, 2658, 2659, 2659, 2660, 2660,
+      2661, 2661, 2662, 2662, 2663, 2663, 2664, 2664, 2665, 2665, 2666, 2666, 2667, 2667, 2668,
+      2668, 2669, 2669, 2670, 2670, 2671, 2671, 2672, 2672, 2673, 2673, 2674, 2674, 2675, 2675,
+      2676, 2676, 2677, 2677, 2678, 2678, 2679, 2680, 2681, 2682, 2683, 2684, 2685, 2686, 2687,
+      2688, 2689, 2690, 2691, 2692, 2693, 2694, 2695, 2696, 2697, 2698, 2699, 2700, 2701, 2702,
+      2703, 2704, 2704, 2705, 2706, 2707, 40, 2708, 2709, 2710, 2711, 2712, 2713, 2714, 2715, 2716,
+      2717, 2718, 2719, 2720, 2721, 2722, 2723, 2724, 2725, 2726, 2727, 2728, 2729, 2730, 2731,
+      2732, 2733, 2734, 2735, 2736, 2737, 2738, 2739, 2740, 2741, 2742, 2743, 2744, 2745, 2746,
+      2747, 2748, 2749, 2750, 2751, 2752, 2753, 2754, 2755, 2756, 2757, 2758, 2759, 2760, 2761,
+      2762, 2763, 2764, 2765, 2766, 2767, 2768, 2769, 2770, 2771, 2772, 2773, 2774, 2775, 2775,
+      2776, 2777, 2778, 2779, 2780, 2780, 2781, 2782, 2783, 2784, 2785, 2786, 2787, 2788, 2789,
+      2790, 2791, 2792, 2793, 2794, 2795, 2796, 2797, 2797, 2798, 2799, 2800, 2801, 2802, 2803,
+      2804, 2805, 2806, 2807, 2808, 2809, 2810, 2811, 2812, 2813, 2814, 2815, 2816, 2817, 2818,
+      2819, 2820, 2821, 2822, 2823, 2824, 2825, 2826, 2827, 2828, 2829, 2830, 2831, 2832, 2833,
+      2834, 2835, 2836, 2837, 2838, 2839, 2840, 2841, 2842, 2843, 2844, 2845, 2846, 2847, 2847,
+      2848, 2848, 2849, 2850, 2851, 2852, 2853, 2854, 2855, 2856, 2857, 2858, 2858, 2859, 2860,
+      2861, 2862, 2863, 2864, 2865, 2866, 2867, 2868, 2869, 2870, 2871, 2872, 2873, 2874, 2874,
+      2875, 2876, 2877, 2878, 2879, 2880, 2881, 2882, 2883, 2884, 2885, 2886, 2887, 2888, 2889,
+      2890, 2891, 2892, 2893, 2894, 2895, 2896, 2897, 2898, 2899, 2900, 2901, 2902, 2903, 2904,
+      2905, 2906, 2907, 2908, 2909, 2909, 2910, 2911, 2912, 2913, 2914, 2915, 2916, 2917, 2918,
+      2919, 2920, 2921, 2922, 2923, 2924, 2925, 2926, 2927, 2928, 2929, 2930, 2931, 2932, 2933,
+      2934, 2935, 2936, 2937, 2938, 2939, 2940, 2941, 2942, 2943, 2944, 2945, 2946, 2947, 2948,
+      2949, 2950, 2951, 2952, 2953, 2954, 2955, 2956, 2957, 2958, 2959, 2960, 2961, 2962, 2963,
+      2964, 2965, 2966, 2967, 2968, 2969, 2970, 2971, 2972, 2973, 2974, 2975, 2976, 2977, 2978,
+      2979, 2980, 2981, 2982, 2983, 2984, 2985, 2986, 2987, 2988, 2989, 2990, 2991, 2992, 2993,
+      2994, 2995, 2996, 2997, 2998, 2999, 3000, 3001, 3002, 3003, 3004, 3005, 3006, 3007, 3008,
+      3009, 3009, 3010, 3011, 3012, 3013, 3014, 3015, 3016, 3017, 3018, 3019, 3019, 3020, 3021,
+      3022, 3022, 3023, 3023, 3024, 3025, 3026, 3027, 3027, 3028, 3028, 3029, 3029, 3030, 3030,
+      3031, 3031, 3032, 3032, 3033, 3033, 3034, 3034, 3035, 3036, 3037, 3038, 3039, 3039, 3040,
+      3040, 3041, 3042, 3043, 3044, 3045, 3046, 3047, 67, 3048, 3049, 3050, 3051, 3052, 3053, 3054,
+      3055, 3056, 3057, 3058, 3059, 3060, 3061, 3062, 3062, 3063, 3064, 3065, 3066, 3067, 3068,
+      3068, 3069, 3070, 3071, 3072, 3073, 3074, 3074, 3075, 3076, 3077, 3078, 3079, 3080, 3081,
+      3082, 3083, 3084, 3085, 3086, 3087, 3088, 3089, 3090, 3091, 3092, 3093, 3094, 3095, 3096,
+      3097, 3098, 3099, 3100, 3101, 3102, 3103, 3104, 3105, 3106, 3107, 3108, 3109, 3110, 3110,
+      3111, 3111, 3112, 3113, 3114, 3115, 3116, 3117, 3118, 3119, 3120, 3121, 3121, 3122, 3122,
+      3123, 3123, 3124, 3125, 3126, 3127, 3128, 3129, 3130, 3131, 3132, 3133, 3134, 3135, 3136,
+      3136, 3137, 3137, 3138, 3138, 3139, 3140, 3140, 3141, 3141, 3142, 3143, 3144, 3145, 3146,
+      3147, 3148, 3149, 3150, 3150, 3151, 3152, 3153, 3153, 3154, 3155, 3156, 3157, 3158, 3159,
+      3159, 3160, 3160, 3161, 3161, 3162, 3163, 3164, 3165, 3166, 3167, 3168, 3169, 3170, 3171,
+      3172, 3173, 3174, 3175, 3176, 3177, 3178, 3179, 3180, 3181, 3182, 3183, 3184, 3185, 3186,
+      3187, 3188, 3189, 3190, 3191, 3192, 3193, 3194, 3195, 3196, 3197, 3198, 3198, 3199, 3199,
+      3200, 3201, 3202, 3203, 3204, 3205, 3206, 3207, 3207, 3208, 3209, 3209, 3210, 3210, 3211,
+      3211, 3212, 3212, 3213, 3213, 3214, 3214, 3215, 3215, 3216, 3216, 3217, 3217, 3218, 3218,
+      3219, 3220, 3221, 3222, 3222, 3223, 3224, 3224, 3225, 3226, 3226, 3227, 3227, 3228, 3229,
+      3229, 3230, 3231, 3232, 3233, 3234, 3235, 3236, 3237, 3238, 3239, 3240, 3241, 3242, 3243,
+      3244, 3245, 3246, 3247, 3248, 3249, 3250, 3251, 3251, 3252, 3252, 3253, 3254, 3254, 3255,
+      3256, 3257, 3258, 3259, 3260, 3261, 3262, 3263, 3264, 3265, 3266, 3267, 3268, 3269, 3270,
+      3271, 3272, 3273, 3274, 3275, 3276, 3277, 3278, 3279, 3280, 3280, 3281, 3282, 3283, 3284,
+      3285, 3286, 3287, 3288, 3289, 3290, 3291, 3292, 3293, 3294, 3295, 3295, 3296, 3297, 3298,
+      3299, 3300, 3301, 3302, 3303, 3303, 3304, 3304, 3305, 3305, 3306, 3306, 3307, 3307, 3308,
+      3309, 3310, 3311, 3312, 3312, 3313, 3314, 3315, 3316, 3317, 3318, 3319, 3319, 3320, 3321,
+      3322, 3323, 3324, 3325, 3326, 3327, 3328, 3329, 3330, 3331, 3332, 3333, 3334, 3335, 3336,
+      3337, 3338, 3339, 3340, 3341, 3342, 3342, 3343, 3344, 3345, 3346, 3347, 3348, 3349, 3350,
+      3351, 3352, 3353, 3354, 3355, 3356, 3357, 3358, 3359, 3360, 3360, 3361, 3362, 3363, 3364,
+      3365, 3366, 3367, 3368, 3369, 3370, 3371, 3372, 3373, 3374, 3375, 3376, 3377, 3377, 3378,
+      3378, 3379, 3379, 3380, 3381, 3382, 3383, 3384, 3385, 3386, 3387, 3388, 3389, 3390, 3391,
+      3392, 3393, 3394, 3395, 3396, 3397, 3398, 3398, 3399, 3400, 3401, 3402, 3403, 3404, 3405,
+      3406, 3406, 3407, 3407, 3408, 3408, 3409, 3409, 3410, 3410, 3411, 3412, 3413, 3414, 3415,
+      3416, 3417, 3417, 3418, 3418, 3419, 3420, 3421, 3422, 3423, 3424, 3425, 3426, 3427, 3427,
+      3428, 3429, 3430, 3431, 3432, 3433, 3434, 3435, 3436, 3437, 3438, 3439, 3440, 3441, 3442,
+      3443, 3444, 3445, 3445, 3446, 3447, 3448, 3448, 3449, 3450, 3451, 3452, 3453, 3454, 3455,
+      3456, 3457, 3458, 3459, 3460, 3460, 3461, 3462, 3463, 3464, 3465, 3466, 3467, 3468, 3469,
+      3470, 3471, 3472, 3472, 3473, 3473, 3474, 3474, 3475, 3475, 3476, 3476, 3477, 3477, 3478,
+      3478, 3479, 3480, 3481, 3482, 3483, 3483, 3484, 3485, 3486, 3486, 3487, 3487, 3488, 3489,
+      3490, 3491, 3492, 3493, 3494, 3495, 3496, 3496, 3497, 3498, 3499, 3499, 3500, 3500, 3501,
+      3501, 3502, 3502, 3503, 3504, 3505, 3506, 3507, 3508, 3508, 3509, 3510, 3511, 3511, 3512,
+      3512, 3513, 3513, 3514, 3514, 3515, 3515, 3516, 3517, 3518, 3519, 3519, 3520, 3521, 3522,
+      3523, 3524, 3524, 3525, 3525, 3526, 3526, 3527, 3528, 3529, 3529, 3530, 3530, 3531, 3532,
+      3533, 3534, 3535, 3536, 3536, 3537, 3538, 3539, 3540, 3541, 3542, 3543, 3544, 3545, 3546,
+      3547, 3548, 3549, 3550, 3551, 3552, 3553, 3554, 3554, 3555, 3555, 3556, 3557, 3558, 3559,
+      3560, 3561, 3562, 3563, 3564, 3565, 3566, 3567, 3568, 3569, 3570, 3571, 3572, 3573, 3574,
+      3575, 3576, 3576, 3577, 3578, 3578, 3579, 3580, 3581, 3582, 3583, 3584, 3585, 3586, 3587,
+      3588, 3589, 3590, 3591, 3592, 3593, 3594, 3595, 3596, 94, 94, 3597, 3598, 3599, 3600, 3601,
+      3602, 3603, 3604, 3605, 3606, 3607, 3607, 3608, 3608, 3609, 3609, 3610, 3610, 3611, 3611,
+      3612, 3612, 3613, 3613, 3614, 3614, 3615, 3615, 3616, 3616, 3617, 3617, 3618, 3618, 3619,
+      3619, 3620, 3620, 3621, 3621, 3622, 3622, 3623, 3624, 3625, 3626, 3627, 3628, 3629, 3630,
+      3631, 3631, 3632, 3632, 3633, 3633, 3634, 3634, 3635, 3635, 3636, 3636, 3637, 3637, 3638,
+      3638, 3639, 3639, 3640, 3641, 3642, 3643, 3644, 3645, 3646, 3647, 3648, 3649, 3650, 3651,
+      3652, 3653, 3654, 3655, 3656, 3657, 3658, 3659, 3659, 3660, 3661, 3661, 3662, 3662, 3663,
+      3663, 3664, 3665, 3665, 3666, 3667, 3668, 3669, 3670, 3670, 3671, 3671, 3672, 3672, 3673,
+      3673, 3674, 3675, 3676, 3677, 3678, 3679, 3680, 3681, 3681, 3682, 3682, 3683, 3683, 3684,
+      3684, 3685, 3686, 3687, 3688, 3689, 3689, 3690, 3690, 3691, 3691, 3692, 3693, 3694, 3695,
+      3696, 3696, 3697, 3698, 3699, 3699, 3700, 3700, 3701, 3701, 3702, 3703, 3704, 3705, 3706,
+      3707, 3707, 3708, 3708, 3709, 3710, 3711, 3712, 3713, 3713, 3714, 3714, 3715, 3715, 3716,
+      3716, 3717, 3717, 3718, 3718, 3719, 3719, 3720, 3721, 3721, 3722, 3722, 3723, 3723, 3724,
+      3724, 3725, 3725, 3726, 3726, 3727, 3727, 3728, 3728, 3729, 3729, 3730, 3730, 3731, 3731,
+      3732, 3732, 3733, 3734, 3735, 3736, 3737, 3738, 3739, 3739, 3740, 3741, 3741, 3742, 3743,
+      3744, 3745, 3745, 3746, 3747, 3747, 3748, 3749, 3750, 3750, 3751, 3752, 3752, 3753, 3754,
+      3755, 3756, 3757, 3757, 3758, 3758, 3759, 3760, 3761, 3762, 3763, 3764, 3765, 3766, 3767,
+      3768, 3769, 3769, 3770, 3770, 3771, 3772, 3773, 3774, 3775, 3776, 3777, 3778, 3779, 3780,
+      3781, 3782, 3783, 3784, 3785, 3786, 3787, 3788, 3789, 3790, 3791, 3791, 3792, 3792, 3793,
+      3794, 3795, 3795, 3796, 3796, 3797, 3798, 3799, 3800, 3801, 3802, 3803, 3804, 3805, 3806,
+      3807, 3808, 3809, 3810, 3811, 3811, 3812, 3812, 3813, 3813, 3813, 3813, 3814, 3814, 3815,
+      3816, 3817, 3818, 3819, 3820, 3821, 3822, 3823, 3824, 3825, 3826, 3827, 3828, 3829, 3830,
+      3831, 3832, 3833, 3834, 3835, 3836, 3837, 3838, 3839, 3840, 3841, 3842, 3843, 3844, 3845,
+      3846, 3847, 3848, 3849, 3850, 3851, 3852, 3853, 3854, 3855, 3856, 3857, 3858, 3859, 3860,
+      3861, 3862, 3863, 3864, 3865, 3866, 3867, 3868, 3869, 3870, 3871, 3872, 3873, 3874, 3875,
+      3876, 3877, 3878, 3879, 3880, 3881, 3882, 3883, 3884, 3885, 3886, 3887, 3888, 3889, 3890,
+      3891, 3892, 3893, 3894, 3895, 3896, 3897, 3898, 3899, 3900, 3901, 3902, 3903, 3904, 3905,
+      3906, 3907, 3908, 3909, 3910, 3911, 3912, 3913, 3914, 3915, 3916, 3917, 3918, 3919, 3920,
+      3921, 3922, 3923, 3924, 3925, 3926, 3927, 3928, 3929, 3930, 3931, 3932, 3933, 3934, 3935,
+      3936, 3937, 3938, 3939, 3940, 3941, 3942, 3943, 3944, 3945, 3946, 3947, 3948, 3949, 3950,
+      3951, 3952, 3953, 3954, 3955, 3956, 3957, 3958, 3959, 3960, 3961, 3962, 3963, 3964, 3965,
+      3966, 3967, 3968, 3969, 3970, 3971, 3972, 3973, 3974, 3975, 3976, 3977, 3978, 3979, 3980,
+      3981, 3982, 3983, 3984, 3985, 3986, 3987, 3988, 3989, 3990, 3991, 3992, 3993, 3994, 3995,
+      3996, 3997, 3998, 3999, 4000, 4001, 4002, 4003, 4004, 4005, 4006, 4007, 4008, 4009, 4010,
+      4011, 4012, 4013, 4014, 4015, 4016, 4017, 4018, 4019, 4020, 4021, 4022, 4023, 4024, 4025,
+      4026, 4027, 4028, 4029, 4030, 4031, 4032, 4033, 4034, 4035, 4036, 4037, 4038, 4039, 4040,
+      4041, 4042, 4043, 4044, 4045, 4046, 4047, 4048, 4049, 4050, 4051, 4052, 4053, 4054, 4055,
+      4056, 4057, 4058, 4059, 4060, 4061, 4062, 4063, 4064, 4065, 4066, 4067, 4068, 4069, 4070,
+      4071, 4072, 4073, 4074, 4075, 4076,
+    };
+
+    inline constexpr std::uint8_t statusIds[] = {
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 3, 1, 3, 1, 3,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 3, 2, 3, 1, 3, 1, 3, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1,
+      1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1,
+      1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 1, 1, 1, 1, 1, 1, 3, 2, 3, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1,
+      1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2,
+      2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 1, 1, 1, 1,
+      1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2,
+      2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1,
+      1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1,
+      1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2,
+      2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 2, 2, 2, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1,
+      3, 1, 1, 1, 1, 1, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 3, 1, 1, 1, 1, 1, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 3, 1, 1, 1, 1, 1, 1, 3, 2, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 3, 2, 3, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+      2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2,
+      1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0,
+      0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1,
+      1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 3, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1,
+      1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1,
+      1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3,
+      1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 1, 3, 1, 3, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1,
+      1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1,
+      1, 1, 3, 1, 1, 3, 1, 1, 3, 1, 3, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1,
+      3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1,
+      3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1,
+      3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1,
+      3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 1, 1, 3, 1, 3, 1,
+      1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1,
+      3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3,
+      1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 3, 1, 1, 3, 1, 3, 1, 3, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1,
+      1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1,
+      3, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1,
+      3, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 3, 1, 1, 1, 1, 1,
+      1, 1, 3, 1, 1, 3, 1, 1, 1, 1, 3, 1, 1, 3, 1, 1, 1, 3, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 3, 1, 3, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 3,
+      2, 3, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+      1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    };
+
+  } // namespace EmojiTables
+
+} // namespace dotname
+
+#endif // __EMOJITABLES_HPP
@@ -6,7 +6,7 @@
 #include <Logger/Logger.hpp>
 #include <Utils/Utils.hpp>
 
-#include "UnicodeEmojiTestTxt.hpp"
+#include "EmojiTables.hpp"
 
 #if defined(PLATFORM_WEB)
   #include <emscripten/emscripten.h>
@@ -18,9 +18,12 @@ namespace dotname {
 
   EmojiesLib::EmojiesLib () {
     LOG_D_STREAM << libName_ << " constructed ..." << std::endl;
+    // Precompiled tables (EmojiTables.hpp) - no parsing at construction
+    constructEmojiPropertiesMapFromTables (m_emojiPropertiesMap);
   }
 
-  EmojiesLib::EmojiesLib (const std::filesystem::path& assetsPath) : EmojiesLib () {
+  EmojiesLib::EmojiesLib (const std::filesystem::path& assetsPath, bool parseEmojiTestFile)
+      : EmojiesLib () {
     if (!assetsPath.empty ()) {
       AssetContext::setAssetsPath (assetsPath);
       LOG_D_STREAM << "Assets: " << AssetContext::getAssetsPath () << std::endl;
@@ -29,17 +32,19 @@ namespace dotname {
       LOG_D_STREAM << "path: " << (AssetContext::getAssetsPath () / "DotNameLogoV2.svg")
                    << std::endl;
 
-      std::string emojiTestFileDefinition = AssetContext::getAssetsPath () / "emoji-test.txt";
-      std::ifstream is (emojiTestFileDefinition);
-
-      if (!is) {
-        LOG_E_STREAM << "Emoji asset test file not found. Loading hardcoded definition."
-                     << std::endl;
-        std::istringstream ss (UnicodeEmojiTestTxtContent);
-        constructEmojiPropertiesMap (m_emojiPropertiesMap, static_cast<std::istream&> (ss));
-      } else {
-        LOG_I_STREAM << "Emoji asset test file found." << std::endl;
-        constructEmojiPropertiesMap (m_emojiPropertiesMap, is);
+      if (parseEmojiTestFile) {
+        std::string emojiTestFileDefinition = AssetContext::getAssetsPath () / "emoji-test.txt";
+        std::ifstream is (emojiTestFileDefinition);
+
+        if (!is) {
+          LOG_E_STREAM << "Emoji asset test file not found. Keeping precompiled tables."
+                       << std::endl;
+        } else {
+          LOG_I_STREAM << "Parsing emoji asset test file." << std::endl;
+          m_emojiPropertiesMap.clear ();
+          m_isPopulated = false;
+          constructEmojiPropertiesMap (m_emojiPropertiesMap, is);
+        }
       }
     } else {
       LOG_D_STREAM << "Assets path is empty" << std::endl;
@@ -178,6 +183,23 @@ namespace dotname {
     }
   }
 
+  void EmojiesLib::constructEmojiPropertiesMapFromTables (
+      std::map<int, EmojiPropertiesStructure>& epm) {
+    // Tables are generated at build time by emojiassets.py - nothing to parse here
+    for (std::size_t i = 0; i < EmojiTables::emojiCount; ++i) {
+      EmojiPropertiesStructure eps;
+      eps.m_emojiCodePoints.assign (EmojiTables::codePoints + EmojiTables::codePointOffsets[i],
+                                    EmojiTables::codePoints + EmojiTables::codePointOffsets[i + 1]);
+      eps.m_emojiGroup = EmojiTables::strings[EmojiTables::groups[EmojiTables::groupIds[i]].name];
+      eps.m_emojiSubGroup
+          = EmojiTables::strings[EmojiTables::subGroups[EmojiTables::subGroupIds[i]].name];
+      eps.m_emojiUnicodeVersion = EmojiTables::strings[EmojiTables::versionIds[i]];
+      eps.m_emojiTextDescription = EmojiTables::strings[EmojiTables::descriptionIds[i]];
+      epm.emplace_hint (epm.end (), static_cast<int> (i), std::move (eps));
+    }
+    this->m_isPopulated = EmojiTables::emojiCount > 0;
+  }
+
   std::string& EmojiesLib::getEmojiStringCharByCodePoint (char32_t* emojiCodePoints,
                                                           size_t length) {
     if (m_isPopulated) {
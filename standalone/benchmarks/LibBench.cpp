@@ -0,0 +1,170 @@
+// MIT License
+// Copyright (c) 2024-2025 Tomáš Mark
+
+// Micro benchmarks of the EmojiesLib public API.
+// Driven by emojibench.py ("⏱️ Run Benchmarks" task); results are written as JSON.
+//
+// Usage: LibBench --assets <dir> [--output <file.json>] [--filter <substring>]
+//                 [--warmup <n>] [--repetitions <n>] [--min-time-ms <ms>] [--list]
+
+#include <EmojiesLib/EmojiesLib.hpp>
+#include <Logger/Logger.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <filesystem>
+#include <fstream>
+#include <functional>
+#include <iostream>
+#include <iterator>
+#include <sstream>
+#include <string>
+#include <vector>
+
+namespace {
+
+  struct Benchmark {
+    std::string name;
+    std::function<size_t ()> op; // returns something derived from the result (kept alive)
+  };
+
+  struct Options {
+    std::filesystem::path assets;
+    std::string output;
+    std::string filter;
+    int warmup = 2;
+    int repetitions = 10;
+    double minTimeMs = 50.0;
+    bool list = false;
+  };
+
+  volatile size_t sink = 0;
+
+  double runBatch (const Benchmark& benchmark, uint64_t iterations) {
+    size_t acc = 0;
+    auto start = std::chrono::steady_clock::now ();
+    for (uint64_t i = 0; i < iterations; ++i) {
+      acc += benchmark.op ();
+    }
+    auto end = std::chrono::steady_clock::now ();
+    sink = sink + acc;
+    return std::chrono::duration<double, std::nano> (end - start).count ();
+  }
+
+  // Grow the batch until one repetition takes at least minTimeMs
+  uint64_t calibrate (const Benchmark& benchmark, double minTimeMs) {
+    uint64_t iterations = 1;
+    while (true) {
+      double ns = runBatch (benchmark, iterations);
+      if (ns >= minTimeMs * 1e6 || iterations >= (1ULL << 30)) {
+        return iterations;
+      }
+      double factor = ns > 0 ? (minTimeMs * 1e6 * 1.2) / ns : 10.0;
+      iterations = std::max<uint64_t> (iterations + 1,
+                                       static_cast<uint64_t> (iterations * std::min (factor, 10.0)));
+    }
+  }
+
+  std::string jsonEscape (const std::string& value) {
+    std::string out;
+    for (char c : value) {
+      if (c == '"' || c == '\\') {
+        out += '\\';
+      }
+      out += c;
+    }
+    return out;
+  }
+
+  bool parseArguments (int argc, const char* argv[], Options& options) {
+    for (int i = 1; i < argc; ++i) {
+      std::string arg = argv[i];
+      auto value = [&] () -> std::string {
+        return (i + 1 < argc) ? argv[++i] : "";
+      };
+      if (arg == "--assets") {
+        options.assets = value ();
+      } else if (arg == "--output") {
+        options.output = value ();
+      } else if (arg == "--filter") {
+        options.filter = value ();
+      } else if (arg == "--warmup") {
+        options.warmup = std::stoi (value ());
+      } else if (arg == "--repetitions") {
+        options.repetitions = std::stoi (value ());
+      } else if (arg == "--min-time-ms") {
+        options.minTimeMs = std::stod (value ());
+      } else if (arg == "--list") {
+        options.list = true;
+      } else {
+        std::cerr << "Unknown argument: " << arg << std::endl;
+        return false;
+      }
+    }
+    return true;
+  }
+
+} // namespace
+
+int main (int argc, const char* argv[]) {
+  Options options;
+  if (!parseArguments (argc, argv, options)) {
+    return 2;
+  }
+  // The library logs every construction - keep the console quiet while measuring
+  Logger::getInstance ().setLevel (Logger::Level::LOG_CRITICAL);
+
+  dotname::EmojiesLib lib (options.assets);
+  char32_t family[] = { 0x1F468, 0x200D, 0x1F469, 0x200D, 0x1F467, 0x200D, 0x1F466 };
+
+  std::vector<Benchmark> benchmarks = {
+    { "construct_asset_file",
+      [&] () { return dotname::EmojiesLib (options.assets, true).getSizeOfGroupItems ("Flags"); } },
+    { "construct_embedded_tables",
+      [&] () { return dotname::EmojiesLib (options.assets).getSizeOfGroupItems ("Flags"); } },
+    { "get_emojies_from_group",
+      [&] () { return lib.getEmojiesFromGroup ("Smileys & Emotion").size (); } },
+    { "get_random_emoji_from_subgroup",
+      [&] () { return lib.getRandomEmojiFromSubGroup ("face-smiling").size (); } },
+    { "get_emoji_groups_names", [&] () { return lib.getEmojiGroupsNames ().size (); } },
+    { "encode_code_points",
+      [&] () { return lib.getEmojiStringCharByCodePoint (family, std::size (family)).size (); } },
+  };
+
+  std::ostringstream json;
+  json << "{\n  \"benchmarks\": [";
+  bool first = true;
+  for (const auto& benchmark : benchmarks) {
+    if (!options.filter.empty () && benchmark.name.find (options.filter) == std::string::npos) {
+      continue;
+    }
+    if (options.list) {
+      std::cout << benchmark.name << std::endl;
+      continue;
+    }
+
+    uint64_t iterations = calibrate (benchmark, options.minTimeMs);
+    for (int i = 0; i < options.warmup; ++i) {
+      runBatch (benchmark, iterations);
+    }
+    json << (first ? "\n" : ",\n") << "    {\"name\": \"" << jsonEscape (benchmark.name)
+         << "\", \"iterations\": " << iterations << ", \"samples_ns\": [";
+    for (int i = 0; i < options.repetitions; ++i) {
+      json << (i ? ", " : "") << runBatch (benchmark, iterations) / iterations;
+    }
+    json << "]}";
+    first = false;
+  }
+  json << "\n  ]\n}\n";
+
+  if (options.list) {
+    return 0;
+  }
+  if (options.output.empty ()) {
+    std::cout << json.str ();
+  } else {
+    std::ofstream (options.output) << json.str ();
+  }
+  return 0;
+}
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import SolutionRenamer
+
+# MIT License Copyright (c) 2024-2025 Tomáš Mark
+
+
+class RenameProjectTest(unittest.TestCase):
+    """rename_project() on a minimal project tree in a temporary directory"""
+
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.tree = tempfile.mkdtemp(prefix="renamer-test-")
+        os.chdir(self.tree)
+        os.makedirs("include/EmojiesLib")
+        os.makedirs("src")
+        with open("include/EmojiesLib/EmojiesLib.hpp", "w", encoding="utf-8") as f:
+            f.write("namespace EmojiesLib {}\n")
+        with open("src/EmojiesLib.cpp", "w", encoding="utf-8") as f:
+            f.write("#include <EmojiesLib/EmojiesLib.hpp>\n")
+        with open("CMakeLists.txt", "w", encoding="utf-8") as f:
+            f.write("project(EmojiesLib)\nset(STANDALONE_NAME EmojiesStandalone)\n")
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.tree, ignore_errors=True)
+
+    def _leftovers(self):
+        suffixes = (SolutionRenamer.RenameJournal.BACKUP_SUFFIX, SolutionRenamer.RenameJournal.TEMP_SUFFIX)
+        return [os.path.join(root, name) for root, _, files in os.walk(".") for name in files
+                if name.endswith(suffixes) or name == SolutionRenamer.RenameJournal.JOURNAL_FILE]
+
+    def test_rename_leaves_no_backups(self):
+        SolutionRenamer.rename_project("EmojiesLib", "FooLib", "EmojiesStandalone", "FooStandalone")
+
+        self.assertTrue(os.path.isfile("include/FooLib/FooLib.hpp"))
+        self.assertTrue(os.path.isfile("src/FooLib.cpp"))
+        with open("include/FooLib/FooLib.hpp", "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "namespace FooLib {}\n")
+        self.assertEqual(self._leftovers(), [])
+
+    def test_rollback_after_partial_rename(self):
+        journal = SolutionRenamer.RenameJournal()
+        journal.stage_write("include/EmojiesLib/EmojiesLib.hpp", "namespace FooLib {}\n")
+        journal.stage_rename("include/EmojiesLib", "include/FooLib")
+        journal._save()
+        for operation in journal.operations:
+            if operation["op"] == "write":
+                os.replace(operation["target"], operation["backup"])
+                os.replace(operation["temp"], operation["target"])
+            else:
+                os.rename(operation["src"], operation["dst"])
+
+        self.assertTrue(SolutionRenamer.RenameJournal.recover())
+        with open("include/EmojiesLib/EmojiesLib.hpp", "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "namespace EmojiesLib {}\n")
+        self.assertEqual(self._leftovers(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()